@@ -6,10 +6,12 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from common.auth.controller import router as auth_router
+from common.http_pool import get_http_pool
+from common.identity_cache import get_identity_cache
 from common.middleware import setup_exception_handlers
 from common.realtime import get_publisher, realtime_router
 from common.router import router as common_router
-from common.sqs import SQSConsumer, EventHandlers
+from common.sqs import ConcurrentSQSConsumer, SQSConsumer, EventHandlers
 from config.settings import settings
 from web.router import router as web_router
 from client_app.router import router as client_app_router
@@ -25,12 +27,40 @@ logging.basicConfig(
 )
 
 
+def build_sqs_consumer(queue_url: str) -> SQSConsumer:
+    """Create an SQS consumer in the mode selected by settings."""
+    if settings.sqs_consumer_mode == "concurrent":
+        return ConcurrentSQSConsumer(
+            queue_url=queue_url,
+            aws_region=settings.sqs_region,
+            max_messages=settings.sqs_max_messages,
+            wait_time_seconds=settings.sqs_wait_time_seconds,
+            max_workers=settings.sqs_max_workers,
+            event_concurrency=settings.sqs_event_concurrency,
+            ordering_keys=settings.sqs_ordering_keys,
+            visibility_timeout_seconds=settings.sqs_visibility_timeout_seconds,
+        )
+    return SQSConsumer(
+        queue_url=queue_url,
+        aws_region=settings.sqs_region,
+        max_messages=settings.sqs_max_messages,
+        wait_time_seconds=settings.sqs_wait_time_seconds,
+    )
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan context manager for startup/shutdown events."""
     # Startup
     consumer_tasks = []
 
+    # Start pooled HTTP transport shared by all microservice clients
+    http_pool = get_http_pool()
+    if settings.http_pool_enabled:
+        await http_pool.start()
+    else:
+        logger.info("HTTP connection pooling disabled - using per-request clients")
+
     # Wait for LocalStack queues to be ready (CI environment)
     if settings.test_mode:
         logger.info("Test mode: Waiting 5 seconds for LocalStack queues to initialize...")
@@ -38,18 +68,13 @@ async def lifespan(app: FastAPI):
 
     # Get shared publisher and handlers
     publisher = get_publisher()
-    handlers = EventHandlers(publisher)
+    handlers = EventHandlers(publisher, identity_cache=get_identity_cache())
 
     # Start reports queue consumer
     if settings.sqs_queue_url:
         logger.info(f"Starting SQS reports consumer for {settings.sqs_queue_url}...")
 
-        reports_consumer = SQSConsumer(
-            queue_url=settings.sqs_queue_url,
-            aws_region=settings.sqs_region,
-            max_messages=settings.sqs_max_messages,
-            wait_time_seconds=settings.sqs_wait_time_seconds,
-        )
+        reports_consumer = build_sqs_consumer(settings.sqs_queue_url)
 
         reports_consumer.register_handler("web_report_generated", handlers.handle_web_report_generated)
 
@@ -64,12 +89,7 @@ async def lifespan(app: FastAPI):
     if order_events_queue:
         logger.info(f"Starting SQS order events consumer for {order_events_queue}...")
 
-        order_consumer = SQSConsumer(
-            queue_url=order_events_queue,
-            aws_region=settings.sqs_region,
-            max_messages=settings.sqs_max_messages,
-            wait_time_seconds=settings.sqs_wait_time_seconds,
-        )
+        order_consumer = build_sqs_consumer(order_events_queue)
 
         order_consumer.register_handler("order_created", handlers.handle_order_creation)
 
@@ -79,17 +99,29 @@ async def lifespan(app: FastAPI):
     else:
         logger.info("SQS order events queue URL not configured - skipping order events consumer startup")
 
+    # Start identity events queue consumer (invalidates the identity cache)
+    if settings.sqs_identity_events_queue_url:
+        logger.info(f"Starting SQS identity events consumer for {settings.sqs_identity_events_queue_url}...")
+
+        identity_consumer = build_sqs_consumer(settings.sqs_identity_events_queue_url)
+
+        for event_type in ("seller_created", "seller_updated", "seller_deleted"):
+            identity_consumer.register_handler(event_type, handlers.handle_seller_changed)
+        for event_type in ("client_created", "client_updated", "client_deleted"):
+            identity_consumer.register_handler(event_type, handlers.handle_client_changed)
+
+        task = asyncio.create_task(identity_consumer.start())
+        consumer_tasks.append((identity_consumer, task))
+        app.state.sqs_identity_consumer = identity_consumer
+    else:
+        logger.info("SQS identity events queue URL not configured - skipping identity events consumer startup")
+
     # Start delivery routes queue consumer
     delivery_routes_queue = getattr(settings, 'sqs_delivery_routes_queue_url', None)
     if delivery_routes_queue:
         logger.info(f"Starting SQS delivery routes consumer for {delivery_routes_queue}...")
 
-        delivery_consumer = SQSConsumer(
-            queue_url=delivery_routes_queue,
-            aws_region=settings.sqs_region,
-            max_messages=settings.sqs_max_messages,
-            wait_time_seconds=settings.sqs_wait_time_seconds,
-        )
+        delivery_consumer = build_sqs_consumer(delivery_routes_queue)
 
         delivery_consumer.register_handler("delivery_routes_generated", handlers.handle_delivery_routes_generated)
 
@@ -108,6 +140,11 @@ async def lifespan(app: FastAPI):
         await task
     logger.info("All SQS consumers stopped")
 
+    # Send anything still buffered by the realtime publisher
+    await publisher.close()
+
+    await http_pool.close()
+
 
 app = FastAPI(
     title=settings.app_name,
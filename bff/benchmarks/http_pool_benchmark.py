@@ -0,0 +1,101 @@
+"""
+Benchmark: per-request httpx clients vs. the shared pooled transport.
+
+Starts a minimal keep-alive HTTP/1.1 stub server on localhost and issues the
+same number of GET requests through ``HttpClient`` twice: once without a pool
+(a new ``httpx.AsyncClient`` and TCP connection per call) and once backed by
+``HttpClientPool``.
+
+Usage (from the bff directory):
+    python -m benchmarks.http_pool_benchmark --requests 2000 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List
+
+from common.http_client import HttpClient
+from common.http_pool import HttpClientPool, PoolLimits
+
+RESPONSE_BODY = b'{"status":"ok"}'
+RESPONSE = (
+    b"HTTP/1.1 200 OK\r\n"
+    b"Content-Type: application/json\r\n"
+    b"Content-Length: " + str(len(RESPONSE_BODY)).encode() + b"\r\n"
+    b"\r\n" + RESPONSE_BODY
+)
+
+connections_opened = {"count": 0}
+
+
+async def _handle_connection(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    connections_opened["count"] += 1
+    try:
+        while True:
+            headers = await reader.readuntil(b"\r\n\r\n")
+            if not headers:
+                break
+            writer.write(RESPONSE)
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionResetError):
+        pass
+    finally:
+        writer.close()
+
+
+async def _run(client: HttpClient, total: int, concurrency: int) -> List[float]:
+    latencies: List[float] = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            start = time.perf_counter()
+            await client.get("/health")
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    await asyncio.gather(*(one() for _ in range(total)))
+    return latencies
+
+
+def _report(label: str, latencies: List[float], elapsed: float, connections: int):
+    latencies.sort()
+    p50 = statistics.median(latencies)
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    print(
+        f"{label:<12} {len(latencies) / elapsed:>10.0f} req/s   "
+        f"p50 {p50:>7.2f} ms   p99 {p99:>7.2f} ms   connections {connections}"
+    )
+
+
+async def main(total: int, concurrency: int) -> None:
+    server = await asyncio.start_server(_handle_connection, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    base_url = f"http://127.0.0.1:{port}"
+
+    async with server:
+        connections_opened["count"] = 0
+        per_request = HttpClient(base_url, service_name="stub")
+        start = time.perf_counter()
+        latencies = await _run(per_request, total, concurrency)
+        _report("per-request", latencies, time.perf_counter() - start, connections_opened["count"])
+
+        connections_opened["count"] = 0
+        pool = HttpClientPool({"stub": PoolLimits(max_connections=concurrency)})
+        await pool.start()
+        try:
+            pooled = HttpClient(base_url, service_name="stub", pool=pool)
+            start = time.perf_counter()
+            latencies = await _run(pooled, total, concurrency)
+            _report("pooled", latencies, time.perf_counter() - start, connections_opened["count"])
+        finally:
+            await pool.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency))
@@ -0,0 +1,131 @@
+"""
+Benchmark: per-request JWT validation overhead with and without caching.
+
+Signs access tokens with a locally generated RSA key and validates them with
+``CognitoJWTValidator`` the way ``get_current_user`` does on each request:
+once with the claims cache disabled (full RS256 verification every call)
+and once with it enabled. ``--tokens`` controls how many distinct tokens
+the requests are spread over, e.g. many mobile users each reusing theirs.
+Also reports how many JWKS fetches a cold burst of concurrent requests
+triggers.
+
+Usage (from the bff directory):
+    python -m benchmarks.jwt_validation_benchmark --requests 5000 --tokens 50
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import Dict, List
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import jwk, jwt
+
+from common.auth.jwt_validator import CognitoJWTValidator
+
+CLIENT_ID = "bench-client"
+KID = "bench-key"
+
+
+def _keys() -> tuple:
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_pem = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+    public_pem = private_key.public_key().public_bytes(
+        serialization.Encoding.PEM,
+        serialization.PublicFormat.SubjectPublicKeyInfo,
+    )
+    public_jwk = jwk.construct(public_pem, "RS256").to_dict()
+    public_jwk = {k: v.decode() if isinstance(v, bytes) else v for k, v in public_jwk.items()}
+    public_jwk.update({"kid": KID, "use": "sig"})
+    return private_pem, {"keys": [public_jwk]}
+
+
+def _validator(jwks: Dict, cache_size: int, fetch_latency: float = 0.0) -> CognitoJWTValidator:
+    validator = CognitoJWTValidator(
+        user_pool_id="us-east-1_Bench",
+        region="us-east-1",
+        client_ids=[CLIENT_ID],
+        claims_cache_size=cache_size,
+    )
+
+    async def fetch() -> Dict:
+        validator.jwks_fetches += 1
+        await asyncio.sleep(fetch_latency)
+        return json.loads(json.dumps(jwks))
+
+    validator._fetch_jwks = fetch
+    return validator
+
+
+def _tokens(private_pem: bytes, issuer: str, count: int) -> List[str]:
+    now = int(time.time())
+    return [
+        jwt.encode(
+            {
+                "sub": f"user-{i}",
+                "iss": issuer,
+                "client_id": CLIENT_ID,
+                "token_use": "access",
+                "iat": now,
+                "exp": now + 3600,
+            },
+            private_pem,
+            algorithm="RS256",
+            headers={"kid": KID},
+        )
+        for i in range(count)
+    ]
+
+
+async def _measure(validator: CognitoJWTValidator, tokens: List[str], requests: int) -> List[float]:
+    latencies = []
+    for i in range(requests):
+        start = time.perf_counter()
+        await validator.validate_token(tokens[i % len(tokens)])
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def _report(label: str, latencies: List[float]) -> None:
+    ordered = sorted(latencies)
+    p99 = ordered[int(len(ordered) * 0.99) - 1]
+    total = sum(latencies)
+    print(
+        f"{label:<16} mean {statistics.mean(latencies) * 1e6:>8.1f} us   "
+        f"p99 {p99 * 1e6:>8.1f} us   {len(latencies) / total:>9.0f} validations/s"
+    )
+
+
+async def main(requests: int, token_count: int, burst: int) -> None:
+    private_pem, jwks = _keys()
+    print(f"{requests} validations over {token_count} distinct tokens\n")
+
+    uncached = _validator(jwks, cache_size=0)
+    tokens = _tokens(private_pem, uncached.issuer, token_count)
+    _report("no cache", await _measure(uncached, tokens, requests))
+
+    cached = _validator(jwks, cache_size=10000)
+    _report("claims cache", await _measure(cached, tokens, requests))
+    print(
+        f"{'':<16} hits {cached.claims_cache_hits}, misses {cached.claims_cache_misses}"
+    )
+
+    cold = _validator(jwks, cache_size=10000, fetch_latency=0.05)
+    await asyncio.gather(*(cold.validate_token(tokens[0]) for _ in range(burst)))
+    print(f"\n{burst} concurrent cold requests -> {cold.jwks_fetches} JWKS fetch(es)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--tokens", type=int, default=50)
+    parser.add_argument("--burst", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.tokens, args.burst))
@@ -0,0 +1,145 @@
+"""
+Benchmark: sequential vs. concurrent SQS consumer modes.
+
+Runs ``SQSConsumer`` and ``ConcurrentSQSConsumer`` against an in-memory
+SQS stand-in that adds a fixed latency to every API call, with handlers that
+sleep to simulate an Ably publish or downstream HTTP call. Reports
+messages/second and the number of delete API calls for each mode.
+
+Usage (from the bff directory):
+    python -m benchmarks.sqs_consumer_benchmark --messages 500 --handler-ms 20
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Any, Dict, List
+
+from common.sqs import ConcurrentSQSConsumer, SQSConsumer
+
+
+class LocalSQS:
+    """In-memory SQS stand-in with a fixed per-call latency."""
+
+    def __init__(self, total: int, sellers: int, api_latency: float):
+        self.api_latency = api_latency
+        self.messages: List[Dict[str, Any]] = [
+            {
+                "MessageId": f"msg-{i}",
+                "ReceiptHandle": f"rh-{i}",
+                "Body": json.dumps(
+                    {"event_type": "order_created", "seller_id": f"seller-{i % sellers}"}
+                ),
+            }
+            for i in range(total)
+        ]
+        self.deleted = 0
+        self.delete_calls = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def receive_message(self, QueueUrl, MaxNumberOfMessages, WaitTimeSeconds, **kwargs):
+        await asyncio.sleep(self.api_latency)
+        batch = self.messages[:MaxNumberOfMessages]
+        del self.messages[:MaxNumberOfMessages]
+        return {"Messages": batch}
+
+    async def delete_message(self, QueueUrl, ReceiptHandle):
+        await asyncio.sleep(self.api_latency)
+        self.delete_calls += 1
+        self.deleted += 1
+
+    async def delete_message_batch(self, QueueUrl, Entries):
+        await asyncio.sleep(self.api_latency)
+        self.delete_calls += 1
+        self.deleted += len(Entries)
+        return {"Successful": [{"Id": entry["Id"]} for entry in Entries]}
+
+    async def change_message_visibility(self, QueueUrl, ReceiptHandle, VisibilityTimeout):
+        await asyncio.sleep(self.api_latency)
+
+
+class LocalSession:
+    def __init__(self, sqs: LocalSQS):
+        self.sqs = sqs
+
+    def client(self, service_name, **kwargs):
+        return self.sqs
+
+
+async def _run(consumer: SQSConsumer, sqs: LocalSQS, total: int, handler_seconds: float) -> float:
+    async def handler(event):
+        await asyncio.sleep(handler_seconds)
+
+    consumer.register_handler("order_created", handler)
+    consumer._session = LocalSession(sqs)
+    consumer._running = True
+
+    start = time.perf_counter()
+    task = asyncio.create_task(consumer._poll_messages())
+    while sqs.deleted < total:
+        await asyncio.sleep(0.001)
+    elapsed = time.perf_counter() - start
+
+    consumer._running = False
+    await task
+    return elapsed
+
+
+def _report(label: str, total: int, elapsed: float, sqs: LocalSQS) -> None:
+    print(
+        f"{label:<28} {total / elapsed:>9.0f} msg/s   "
+        f"{elapsed:>7.2f} s   delete calls {sqs.delete_calls}"
+    )
+
+
+async def main(total: int, handler_ms: float, api_ms: float, workers: int, sellers: int) -> None:
+    handler_seconds = handler_ms / 1000
+    api_latency = api_ms / 1000
+    print(
+        f"{total} messages, handler {handler_ms} ms, SQS call {api_ms} ms, "
+        f"{sellers} sellers\n"
+    )
+
+    sqs = LocalSQS(total, sellers, api_latency)
+    consumer = SQSConsumer(queue_url="local", wait_time_seconds=0)
+    _report("sequential", total, await _run(consumer, sqs, total, handler_seconds), sqs)
+
+    sqs = LocalSQS(total, sellers, api_latency)
+    consumer = ConcurrentSQSConsumer(queue_url="local", wait_time_seconds=0, max_workers=workers)
+    _report(
+        f"concurrent ({workers} workers)",
+        total,
+        await _run(consumer, sqs, total, handler_seconds),
+        sqs,
+    )
+
+    sqs = LocalSQS(total, sellers, api_latency)
+    consumer = ConcurrentSQSConsumer(
+        queue_url="local",
+        wait_time_seconds=0,
+        max_workers=workers,
+        ordering_keys={"order_created": "seller_id"},
+    )
+    _report(
+        "concurrent, ordered/seller",
+        total,
+        await _run(consumer, sqs, total, handler_seconds),
+        sqs,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--messages", type=int, default=500)
+    parser.add_argument("--handler-ms", type=float, default=20.0)
+    parser.add_argument("--api-ms", type=float, default=5.0)
+    parser.add_argument("--workers", type=int, default=20)
+    parser.add_argument("--sellers", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.messages, args.handler_ms, args.api_ms, args.workers, args.sellers))
@@ -1,8 +1,10 @@
 """Client adapter implementation for client app."""
 
 import logging
+from typing import Optional
 
 from client_app.ports.client_port import ClientPort
+from common.identity_cache import CLIENT, IdentityCache
 from web.adapters.http_client import HttpClient
 
 logger = logging.getLogger(__name__)
@@ -15,14 +17,16 @@ class ClientAdapter(ClientPort):
     This adapter handles communication with the client microservice.
     """
 
-    def __init__(self, http_client: HttpClient):
+    def __init__(self, http_client: HttpClient, identity_cache: Optional[IdentityCache] = None):
         """
         Initialize the client adapter.
 
         Args:
             http_client: Configured HTTP client for the client service
+            identity_cache: Optional shared cache for lookups by cognito_user_id
         """
         self.client = http_client
+        self.identity_cache = identity_cache
 
     async def get_client_by_cognito_user_id(self, cognito_user_id: str) -> dict | None:
         """
@@ -38,6 +42,16 @@ class ClientAdapter(ClientPort):
             MicroserviceConnectionError: If unable to connect to the client service
             MicroserviceHTTPError: If the client service returns an error
         """
+        if self.identity_cache is not None:
+            return await self.identity_cache.get_or_load(
+                CLIENT,
+                cognito_user_id,
+                lambda: self._fetch_client_by_cognito_user_id(cognito_user_id),
+            )
+        return await self._fetch_client_by_cognito_user_id(cognito_user_id)
+
+    async def _fetch_client_by_cognito_user_id(self, cognito_user_id: str) -> dict | None:
+        """Fetch client by Cognito User ID from the client service."""
         logger.info(f"Getting client by cognito_user_id={cognito_user_id}")
 
         try:
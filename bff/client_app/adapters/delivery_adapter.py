@@ -5,8 +5,9 @@ This adapter implements the DeliveryPort interface using HTTP communication
 with the Delivery microservice.
 """
 
+import asyncio
 import logging
-from typing import Optional
+from typing import Dict, List, Optional
 from uuid import UUID
 
 from client_app.ports.delivery_port import DeliveryPort
@@ -25,14 +26,16 @@ class DeliveryAdapter(DeliveryPort):
     for fetching shipment information.
     """
 
-    def __init__(self, http_client: HttpClient):
+    def __init__(self, http_client: HttpClient, batch_size: int = 100):
         """
         Initialize the delivery adapter.
 
         Args:
             http_client: Configured HTTP client for the delivery service
+            batch_size: Maximum order IDs sent in one batch shipment lookup
         """
         self.client = http_client
+        self.batch_size = batch_size
 
     async def get_shipment_by_order(self, order_id: UUID) -> Optional[ShipmentInfo]:
         """
@@ -61,3 +64,51 @@ class DeliveryAdapter(DeliveryPort):
                 return None
             # Re-raise other HTTP errors
             raise
+
+    async def get_shipments_by_orders(
+        self, order_ids: List[UUID]
+    ) -> Dict[UUID, ShipmentInfo]:
+        """
+        Get shipment information for several orders at once.
+
+        Order IDs are deduplicated and split into chunks of ``batch_size``;
+        the chunks are requested concurrently.
+
+        Args:
+            order_ids: Order UUIDs to look up
+
+        Returns:
+            Mapping of order ID to ShipmentInfo; orders without a shipment are absent
+
+        Raises:
+            MicroserviceConnectionError: If unable to connect to delivery service
+            MicroserviceHTTPError: If delivery service returns an unexpected error
+        """
+        unique_ids = list(dict.fromkeys(order_ids))
+        if not unique_ids:
+            return {}
+
+        chunks = [
+            unique_ids[i:i + self.batch_size]
+            for i in range(0, len(unique_ids), self.batch_size)
+        ]
+        logger.info(
+            f"Fetching shipments for {len(unique_ids)} orders in {len(chunks)} request(s)"
+        )
+        results = await asyncio.gather(*(self._fetch_shipment_chunk(chunk) for chunk in chunks))
+
+        shipments: Dict[UUID, ShipmentInfo] = {}
+        for chunk_result in results:
+            shipments.update(chunk_result)
+        return shipments
+
+    async def _fetch_shipment_chunk(self, order_ids: List[UUID]) -> Dict[UUID, ShipmentInfo]:
+        """Fetch one chunk of order IDs with a single batch request."""
+        response_data = await self.client.get(
+            "/delivery/shipments",
+            params={"order_ids": ",".join(str(order_id) for order_id in order_ids)},
+        )
+        return {
+            UUID(str(item["order_id"])): ShipmentInfo(**item)
+            for item in response_data.get("items", [])
+        }
@@ -6,7 +6,7 @@ with the Order microservice.
 """
 
 import logging
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
 from client_app.ports.order_port import OrderPort
@@ -77,15 +77,20 @@ class OrderAdapter(OrderPort):
         )
 
     async def list_customer_orders(
-        self, customer_id: UUID, limit: int = 10, offset: int = 0
+        self,
+        customer_id: UUID,
+        limit: int = 10,
+        offset: int = 0,
+        cursor: Optional[str] = None,
     ) -> PaginatedOrdersResponse:
         """
-        List orders for a specific customer.
+        List orders for a specific customer, newest first.
 
         Args:
             customer_id: Customer UUID
             limit: Maximum number of orders to return
             offset: Number of orders to skip
+            cursor: next_cursor of the previous page (keyset pagination)
 
         Returns:
             PaginatedOrdersResponse with customer's orders
@@ -94,9 +99,11 @@ class OrderAdapter(OrderPort):
             MicroserviceConnectionError: If unable to connect to order service
             MicroserviceHTTPError: If order service returns an error
         """
-        logger.info(f"Listing orders for customer {customer_id} (limit={limit}, offset={offset})")
+        logger.info(f"Listing orders for customer {customer_id} (limit={limit}, offset={offset}, cursor={cursor})")
 
         params = {"limit": limit, "offset": offset}
+        if cursor:
+            params["cursor"] = cursor
 
         response_data = await self.client.get(
             f"/order/customers/{customer_id}/orders", params=params
@@ -5,7 +5,6 @@ This controller handles order creation for mobile client app users.
 Orders created through this endpoint automatically have metodo_creacion='app_cliente'.
 """
 
-import asyncio
 import logging
 from typing import Dict, List, Optional
 from uuid import UUID
@@ -31,33 +30,34 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
-async def _fetch_shipment_safe(
-    delivery_port: DeliveryPort, order_id: UUID
-) -> Optional[ShipmentInfo]:
+async def _fetch_shipments_safe(
+    delivery_port: DeliveryPort, order_ids: List[UUID]
+) -> Dict[UUID, ShipmentInfo]:
     """
-    Safely fetch shipment information for an order.
+    Safely fetch shipment information for a page of orders.
 
-    Catches any errors and returns None to avoid breaking the order listing.
+    Catches any errors and returns an empty mapping to avoid breaking the
+    order listing.
 
     Args:
         delivery_port: DeliveryPort for fetching shipment info
-        order_id: The order UUID to fetch shipment for
+        order_ids: The order UUIDs to fetch shipments for
 
     Returns:
-        ShipmentInfo if available, None otherwise
+        Mapping of order ID to ShipmentInfo for the orders that have one
     """
     try:
-        return await delivery_port.get_shipment_by_order(order_id)
+        return await delivery_port.get_shipments_by_orders(order_ids)
     except Exception as e:
-        logger.warning(f"Failed to fetch shipment for order {order_id}: {e}")
-        return None
+        logger.warning(f"Failed to fetch shipments for {len(order_ids)} orders: {e}")
+        return {}
 
 
 async def _enrich_orders_with_shipments(
     orders: List[OrderResponse], delivery_port: DeliveryPort
 ) -> List[OrderResponse]:
     """
-    Enrich orders with shipment information fetched in parallel.
+    Enrich orders with shipment information fetched in one batch lookup.
 
     Args:
         orders: List of OrderResponse objects to enrich
@@ -69,14 +69,11 @@ async def _enrich_orders_with_shipments(
     if not orders:
         return orders
 
-    # Fetch all shipments in parallel
-    shipment_tasks = [
-        _fetch_shipment_safe(delivery_port, order.id) for order in orders
-    ]
-    shipments = await asyncio.gather(*shipment_tasks)
+    shipments = await _fetch_shipments_safe(delivery_port, [order.id for order in orders])
 
     # Attach shipments to orders and override fecha_entrega_estimada from shipment
-    for order, shipment in zip(orders, shipments):
+    for order in orders:
+        shipment = shipments.get(order.id)
         order.shipment = shipment
         if shipment and shipment.fecha_entrega_estimada:
             # Shipment is the source of truth for fecha_entrega_estimada
@@ -193,6 +190,7 @@ async def list_my_orders(
     client_port: ClientPort = Depends(get_client_app_client_port),
     delivery_port: DeliveryPort = Depends(get_delivery_port),
     user: Dict = Depends(require_client_user),
+    cursor: Optional[str] = None,
 ):
     """
     List orders for the authenticated client user.
@@ -212,6 +210,7 @@ async def list_my_orders(
         client_port: Client port for service communication
         delivery_port: Delivery port for fetching shipment info
         user: Authenticated client user
+        cursor: next_cursor of the previous page; pages by keyset instead of offset
 
     Returns:
         PaginatedOrdersResponse with user's orders and shipment info
@@ -237,7 +236,7 @@ async def list_my_orders(
 
         # Fetch orders for this client
         paginated_orders = await order_port.list_customer_orders(
-            customer_id=cliente_id, limit=limit, offset=offset
+            customer_id=cliente_id, limit=limit, offset=offset, cursor=cursor
         )
 
         # Enrich orders with shipment information
@@ -6,7 +6,7 @@ without specifying how the communication is implemented.
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Dict, List, Optional
 from uuid import UUID
 
 from client_app.schemas.shipment_schemas import ShipmentInfo
@@ -36,3 +36,23 @@ class DeliveryPort(ABC):
             MicroserviceHTTPError: If delivery service returns an unexpected error
         """
         pass
+
+    @abstractmethod
+    async def get_shipments_by_orders(
+        self, order_ids: List[UUID]
+    ) -> Dict[UUID, ShipmentInfo]:
+        """
+        Get shipment information for several orders at once.
+
+        Args:
+            order_ids: Order UUIDs to look up; large sets are split into
+                several requests by the implementation
+
+        Returns:
+            Mapping of order ID to ShipmentInfo; orders without a shipment are absent
+
+        Raises:
+            MicroserviceConnectionError: If unable to connect to delivery service
+            MicroserviceHTTPError: If delivery service returns an unexpected error
+        """
+        pass
@@ -6,6 +6,7 @@ without specifying how the communication is implemented.
 """
 
 from abc import ABC, abstractmethod
+from typing import Optional
 from uuid import UUID
 
 from client_app.schemas.order_schemas import (
@@ -47,15 +48,20 @@ class OrderPort(ABC):
 
     @abstractmethod
     async def list_customer_orders(
-        self, customer_id: UUID, limit: int = 10, offset: int = 0
+        self,
+        customer_id: UUID,
+        limit: int = 10,
+        offset: int = 0,
+        cursor: Optional[str] = None,
     ) -> PaginatedOrdersResponse:
         """
-        List orders for a specific customer.
+        List orders for a specific customer, newest first.
 
         Args:
             customer_id: The customer UUID
             limit: Maximum number of orders to return
             offset: Number of orders to skip
+            cursor: next_cursor of the previous page (keyset pagination)
 
         Returns:
             PaginatedOrdersResponse with customer's orders
@@ -100,8 +100,9 @@ class PaginatedOrdersResponse(BaseModel):
     """Paginated response for listing orders."""
 
     items: List[OrderResponse]
-    total: int
+    total: Optional[int]  # None on cursor pages or when include_total=false
     page: int
     size: int
     has_next: bool
     has_previous: bool
+    next_cursor: Optional[str] = None  # Pass as ``cursor`` to continue after this page
@@ -7,7 +7,7 @@ This adapter implements the common InventoryPort interface using HTTP communicat
 import logging
 
 from common.http_client import HttpClient
-from common.schemas import PaginatedInventoriesResponse
+from common.schemas import InventorySearchResponse, PaginatedInventoriesResponse
 
 from ..ports.inventory_port import InventoryPort
 
@@ -38,6 +38,7 @@ class InventoryAdapter(InventoryPort):
         name: str | None = None,
         sku: str | None = None,
         category: str | None = None,
+        cursor: str | None = None,
     ) -> PaginatedInventoriesResponse:
         """
         Retrieve a paginated list of inventories with optional filters.
@@ -47,7 +48,7 @@ class InventoryAdapter(InventoryPort):
         """
         logger.info(
             f"Getting inventories: limit={limit}, offset={offset}, "
-            f"name={name}, sku={sku}, category={category}"
+            f"name={name}, sku={sku}, category={category}, cursor={cursor}"
         )
         params = {"limit": limit, "offset": offset}
         if name:
@@ -56,6 +57,8 @@ class InventoryAdapter(InventoryPort):
             params["sku"] = sku
         if category:
             params["category"] = category
+        if cursor:
+            params["cursor"] = cursor
 
         response_data = await self.client.get(
             "/inventory/inventories",
@@ -67,3 +70,20 @@ class InventoryAdapter(InventoryPort):
         logger.debug(f"Successfully validated response with {len(validated_response.items)} items")
 
         return validated_response
+
+    async def search_inventories(self, q: str, limit: int = 10) -> InventorySearchResponse:
+        """
+        Search inventories by product name or SKU.
+
+        The inventory microservice ranks matches by trigram similarity.
+        """
+        logger.info(f"Searching inventories: q={q}, limit={limit}")
+        response_data = await self.client.get(
+            "/inventory/inventories/search",
+            params={"q": q, "limit": limit},
+        )
+
+        validated_response = InventorySearchResponse(**response_data)
+        logger.debug(f"Inventory search returned {len(validated_response.items)} items")
+
+        return validated_response
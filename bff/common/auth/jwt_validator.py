@@ -1,20 +1,41 @@
 """JWT token validation using AWS Cognito public keys."""
 
+import asyncio
+import hashlib
+import logging
 import os
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+from functools import lru_cache
+
 import httpx
 from jose import jwt, JWTError
-from typing import Dict, List, Optional
-from functools import lru_cache
+
+logger = logging.getLogger(__name__)
 
 
 class CognitoJWTValidator:
-    """Validates JWT tokens from AWS Cognito User Pool."""
+    """
+    Validates JWT tokens from AWS Cognito User Pool.
+
+    Verified claims are kept in an LRU keyed by the token's SHA-256, so a
+    token reused across requests is only signature-checked once; entries
+    never outlive the token's ``exp``. The JWKS is refreshed after
+    ``jwks_ttl_seconds`` and once when a token names an unknown ``kid``
+    (key rotation), with concurrent refreshes collapsed into one fetch.
+    """
 
     def __init__(
         self,
         user_pool_id: str,
         region: str,
         client_ids: List[str],
+        claims_cache_size: int = 10000,
+        claims_cache_max_ttl_seconds: float = 300.0,
+        jwks_ttl_seconds: float = 3600.0,
+        jwks_min_refresh_interval_seconds: float = 30.0,
+        clock: Callable[[], float] = time.time,
     ):
         """
         Initialize JWT validator.
@@ -23,10 +44,20 @@ class CognitoJWTValidator:
             user_pool_id: Cognito User Pool ID
             region: AWS region (e.g., 'us-east-1')
             client_ids: List of allowed client IDs (web + mobile)
+            claims_cache_size: Max verified tokens kept (0 disables the cache)
+            claims_cache_max_ttl_seconds: Upper bound on how long claims are reused
+            jwks_ttl_seconds: How long a fetched key set is trusted
+            jwks_min_refresh_interval_seconds: Min gap between unknown-kid refetches
+            clock: Wall-clock source, injectable for tests
         """
         self.user_pool_id = user_pool_id
         self.region = region
         self.client_ids = client_ids
+        self.claims_cache_size = claims_cache_size
+        self.claims_cache_max_ttl_seconds = claims_cache_max_ttl_seconds
+        self.jwks_ttl_seconds = jwks_ttl_seconds
+        self.jwks_min_refresh_interval_seconds = jwks_min_refresh_interval_seconds
+        self._clock = clock
 
         # Use LocalStack endpoint if AWS_ENDPOINT_URL is set, otherwise use real AWS
         aws_endpoint = os.getenv("AWS_ENDPOINT_URL")
@@ -40,26 +71,74 @@ class CognitoJWTValidator:
             self.jwks_url = f"{self.issuer}/.well-known/jwks.json"
 
         self._jwks_cache: Optional[Dict] = None
-
-    async def get_jwks(self) -> Dict:
+        self._jwks_fetched_at: Optional[float] = None
+        self._jwks_lock = asyncio.Lock()
+        self._claims_cache: "OrderedDict[str, Tuple[Dict, float]]" = OrderedDict()
+        self.claims_cache_hits = 0
+        self.claims_cache_misses = 0
+        self.jwks_fetches = 0
+
+    async def get_jwks(self, force_refresh: bool = False) -> Dict:
         """
         Fetch JSON Web Key Set from Cognito.
 
+        Args:
+            force_refresh: Refetch even if the cached set is still within its
+                TTL (used when a token names an unknown ``kid``). Ignored if
+                the set was fetched less than the min refresh interval ago.
+
         Returns:
             JWKS dictionary containing public keys
 
         Note:
-            Results are cached to avoid repeated requests.
-            In production, consider adding TTL-based cache invalidation.
+            Concurrent callers share a single in-flight fetch. If a refresh
+            fails while an older key set is cached, the old set keeps being
+            served until the next attempt.
         """
-        if self._jwks_cache is None:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(self.jwks_url, timeout=10.0)
-                response.raise_for_status()
-                self._jwks_cache = response.json()
+        if not force_refresh and self._jwks_is_fresh():
+            return self._jwks_cache
+
+        seen_fetch = self._jwks_fetched_at
+        async with self._jwks_lock:
+            # Another caller refreshed while we waited for the lock
+            if self._jwks_cache is not None and self._jwks_fetched_at != seen_fetch:
+                return self._jwks_cache
+            if force_refresh and self._jwks_fetched_recently():
+                return self._jwks_cache
+            if not force_refresh and self._jwks_is_fresh():
+                return self._jwks_cache
+
+            try:
+                jwks = await self._fetch_jwks()
+            except Exception as e:
+                if self._jwks_cache is None:
+                    raise
+                logger.warning(f"JWKS refresh failed, keeping cached keys: {e}")
+                return self._jwks_cache
+
+            self._jwks_cache = jwks
+            self._jwks_fetched_at = self._clock()
 
         return self._jwks_cache
 
+    async def _fetch_jwks(self) -> Dict:
+        """Download the key set from the JWKS endpoint."""
+        self.jwks_fetches += 1
+        async with httpx.AsyncClient() as client:
+            response = await client.get(self.jwks_url, timeout=10.0)
+            response.raise_for_status()
+            return response.json()
+
+    def _jwks_is_fresh(self) -> bool:
+        if self._jwks_cache is None or self._jwks_fetched_at is None:
+            return False
+        return self._clock() - self._jwks_fetched_at < self.jwks_ttl_seconds
+
+    def _jwks_fetched_recently(self) -> bool:
+        if self._jwks_cache is None or self._jwks_fetched_at is None:
+            return False
+        return self._clock() - self._jwks_fetched_at < self.jwks_min_refresh_interval_seconds
+
     async def validate_token(self, token: str) -> Dict:
         """
         Validate JWT token and extract claims.
@@ -77,6 +156,11 @@ class CognitoJWTValidator:
         if os.getenv("TEST_MODE") == "true":
             return self._get_mock_claims(token)
 
+        cache_key = hashlib.sha256(token.encode()).hexdigest()
+        cached = self._get_cached_claims(cache_key)
+        if cached is not None:
+            return cached
+
         # Fetch public keys
         jwks = await self.get_jwks()
 
@@ -90,8 +174,12 @@ class CognitoJWTValidator:
         if not kid:
             raise JWTError("Token header missing 'kid' field")
 
-        # Find the matching public key
-        key = next((k for k in jwks["keys"] if k["kid"] == kid), None)
+        # Find the matching public key; an unknown kid may mean the pool
+        # rotated its keys, so refetch the set once before giving up
+        key = self._find_key(jwks, kid)
+        if not key:
+            jwks = await self.get_jwks(force_refresh=True)
+            key = self._find_key(jwks, kid)
         if not key:
             raise JWTError(f"Public key not found for kid: {kid}")
 
@@ -124,8 +212,44 @@ class CognitoJWTValidator:
             elif token_client_id not in self.client_ids:
                 raise JWTError(f"Invalid client_id/audience: {token_client_id}")
 
+        self._cache_claims(cache_key, claims)
         return claims
 
+    @staticmethod
+    def _find_key(jwks: Dict, kid: str) -> Optional[Dict]:
+        return next((k for k in jwks["keys"] if k["kid"] == kid), None)
+
+    def _get_cached_claims(self, cache_key: str) -> Optional[Dict]:
+        """Return a copy of cached claims, dropping the entry once it expires."""
+        entry = self._claims_cache.get(cache_key)
+        if entry is None:
+            self.claims_cache_misses += 1
+            return None
+
+        claims, expires_at = entry
+        if self._clock() >= expires_at:
+            del self._claims_cache[cache_key]
+            self.claims_cache_misses += 1
+            return None
+
+        self._claims_cache.move_to_end(cache_key)
+        self.claims_cache_hits += 1
+        return dict(claims)
+
+    def _cache_claims(self, cache_key: str, claims: Dict) -> None:
+        """Remember verified claims until ``exp`` (capped by the max TTL)."""
+        if self.claims_cache_size <= 0:
+            return
+        exp = claims.get("exp")
+        if not isinstance(exp, (int, float)):
+            return
+
+        expires_at = min(float(exp), self._clock() + self.claims_cache_max_ttl_seconds)
+        self._claims_cache[cache_key] = (dict(claims), expires_at)
+        self._claims_cache.move_to_end(cache_key)
+        while len(self._claims_cache) > self.claims_cache_size:
+            self._claims_cache.popitem(last=False)
+
     def get_user_groups(self, claims: Dict) -> List[str]:
         """
         Extract Cognito user groups from token claims.
@@ -247,8 +371,13 @@ def get_jwt_validator(
     Returns:
         CognitoJWTValidator instance
     """
+    from config.settings import settings
+
     return CognitoJWTValidator(
         user_pool_id=user_pool_id,
         region=region,
         client_ids=list(client_ids),
+        claims_cache_size=settings.jwt_claims_cache_size,
+        claims_cache_max_ttl_seconds=settings.jwt_claims_cache_max_ttl_seconds,
+        jwks_ttl_seconds=settings.jwt_jwks_ttl_seconds,
     )
@@ -11,7 +11,7 @@ from typing import Dict, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from common.auth.dependencies import require_mobile_user
-from common.schemas import PaginatedInventoriesResponse
+from common.schemas import InventorySearchResponse, PaginatedInventoriesResponse
 from dependencies import get_common_inventory_port
 
 from ..ports import InventoryPort
@@ -42,6 +42,7 @@ async def get_inventories(
     category: Optional[str] = Query(None),
     user: Dict = Depends(require_mobile_user),
     inventory: InventoryPort = Depends(get_common_inventory_port),
+    cursor: Optional[str] = None,
 ):
     """
     Retrieve inventories from the inventory microservice with optional filters.
@@ -65,15 +66,17 @@ async def get_inventories(
         category: Optional category filter
         user: Authenticated user (seller or client only)
         inventory: Inventory port for service communication
+        cursor: next_cursor of the previous page; pages by keyset instead of offset
 
     Returns:
         PaginatedInventoriesResponse with:
         - items: List of inventory records with full details
-        - total: Total number of items matching the filter
+        - total: Total number of items matching the filter (null on cursor pages)
         - page: Current page number
         - size: Number of items per page
         - has_next: Whether there are more pages
         - has_previous: Whether there are previous pages
+        - next_cursor: Cursor for the following page, if any
 
     Raises:
         HTTPException: 400 if more than one filter is provided
@@ -100,7 +103,7 @@ async def get_inventories(
 
     logger.info(
         f"Request: GET /inventories: limit={limit}, offset={offset}, "
-        f"name={name}, sku={sku}, category={category}"
+        f"name={name}, sku={sku}, category={category}, cursor={cursor}"
     )
 
     return await inventory.get_inventories(
@@ -109,4 +112,42 @@ async def get_inventories(
         name=name,
         sku=sku,
         category=category,
+        cursor=cursor,
     )
+
+
+@router.get(
+    "/inventories/search",
+    response_model=InventorySearchResponse,
+    responses={
+        200: {"description": "Inventories matching the query, best match first"},
+        401: {"description": "Unauthorized - missing or invalid authentication token"},
+        403: {"description": "Forbidden - web users are not allowed to access this endpoint"},
+    },
+)
+async def search_inventories(
+    q: str = Query(..., min_length=3, max_length=100),
+    limit: int = Query(10, ge=1, le=50),
+    user: Dict = Depends(require_mobile_user),
+    inventory: InventoryPort = Depends(get_common_inventory_port),
+):
+    """
+    Search-as-you-type on product name or SKU.
+
+    **Authentication Required**: Only seller_users and client_users can access this endpoint.
+
+    Matching ignores case and accents ("acetaminofen" finds "Acetaminofén")
+    and tolerates small typos. Results are ranked by similarity.
+
+    Args:
+        q: Text typed by the user (at least 3 characters)
+        limit: Maximum number of results (1-50)
+        user: Authenticated user (seller or client only)
+        inventory: Inventory port for service communication
+
+    Returns:
+        InventorySearchResponse with the best matches first
+    """
+    logger.info(f"Request: GET /inventories/search: q={q}, limit={limit}")
+
+    return await inventory.search_inventories(q=q, limit=limit)
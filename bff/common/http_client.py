@@ -6,7 +6,8 @@ timeouts, and connection management.
 """
 
 import logging
-from typing import Any, Dict, Optional
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
 
 import httpx
 
@@ -16,6 +17,7 @@ from common.exceptions import (
     MicroserviceTimeoutError,
     MicroserviceValidationError,
 )
+from common.http_pool import HttpClientPool
 
 logger = logging.getLogger(__name__)
 
@@ -31,7 +33,13 @@ class HttpClient:
     - Request/response logging
     """
 
-    def __init__(self, base_url: str, timeout: float = 10.0, service_name: str = "unknown"):
+    def __init__(
+        self,
+        base_url: str,
+        timeout: float = 10.0,
+        service_name: str = "unknown",
+        pool: Optional[HttpClientPool] = None,
+    ):
         """
         Initialize the HTTP client.
 
@@ -39,10 +47,26 @@ class HttpClient:
             base_url: Base URL for the microservice
             timeout: Request timeout in seconds
             service_name: Name of the service (for logging and error messages)
+            pool: Shared connection pool; when it is not started, a
+                short-lived client is opened per request instead
         """
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.service_name = service_name
+        self.pool = pool
+
+    @asynccontextmanager
+    async def _client(self) -> AsyncIterator[httpx.AsyncClient]:
+        """Yield the pooled client for this service, or a one-off client."""
+        shared = self.pool.get(self.service_name) if self.pool else None
+
+        if shared is None:
+            async with httpx.AsyncClient(timeout=self.timeout) as client:
+                yield client
+            return
+
+        with self.pool.track(self.service_name):
+            yield shared
 
     async def post(
         self,
@@ -70,7 +94,7 @@ class HttpClient:
         url = f"{self.base_url}/{path.lstrip('/')}"
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._client() as client:
                 logger.debug(f"POST {url}", extra={"service": self.service_name})
 
                 response = await client.post(url, json=json, **kwargs)
@@ -168,7 +192,7 @@ class HttpClient:
         url = f"{self.base_url}/{path.lstrip('/')}"
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._client() as client:
                 logger.debug(
                     f"GET {url}",
                     extra={"service": self.service_name, "params": params},
@@ -242,7 +266,7 @@ class HttpClient:
         url = f"{self.base_url}/{path.lstrip('/')}"
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._client() as client:
                 logger.debug(f"PATCH {url}", extra={"service": self.service_name})
 
                 response = await client.patch(url, json=json, **kwargs)
@@ -345,7 +369,7 @@ class HttpClient:
         url = f"{self.base_url}/{path.lstrip('/')}"
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._client() as client:
                 logger.debug(f"PUT {url}", extra={"service": self.service_name})
 
                 response = await client.put(url, json=json, **kwargs)
@@ -441,7 +465,7 @@ class HttpClient:
         url = f"{self.base_url}/{path.lstrip('/')}"
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._client() as client:
                 logger.debug(f"DELETE {url}", extra={"service": self.service_name})
 
                 response = await client.delete(url, **kwargs)
@@ -0,0 +1,222 @@
+"""
+Shared, long-lived HTTP connection pools for microservice communication.
+
+One ``httpx.AsyncClient`` is kept per downstream service so that requests
+reuse keep-alive connections instead of paying a new TCP/TLS handshake on
+every call. The pool is started in the application lifespan and consumed by
+``HttpClient`` instances created in ``dependencies.py``.
+"""
+
+import logging
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+TransportFactory = Callable[[str, httpx.Limits], httpx.AsyncBaseTransport]
+
+
+@dataclass
+class PoolLimits:
+    """Connection limits for a single service pool."""
+
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+
+    def to_httpx(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+
+@dataclass
+class PoolStats:
+    """Usage counters for a single service pool."""
+
+    requests_total: int = 0
+    errors_total: int = 0
+    in_flight: int = 0
+    peak_in_flight: int = 0
+    total_time_seconds: float = 0.0
+    started_at: float = field(default_factory=time.monotonic)
+
+
+class HttpClientPool:
+    """
+    Registry of pooled ``httpx.AsyncClient`` instances, one per service.
+
+    Until ``start()`` is called (or after ``close()``), ``get()`` returns
+    ``None`` and ``HttpClient`` falls back to short-lived clients.
+    """
+
+    def __init__(
+        self,
+        services: Dict[str, PoolLimits],
+        timeout: float = 10.0,
+        transport_factory: Optional[TransportFactory] = None,
+    ):
+        """
+        Initialize the pool registry.
+
+        Args:
+            services: Mapping of service name to its connection limits
+            timeout: Default request timeout in seconds
+            transport_factory: Optional factory used to build the transport
+                for each service (mainly for tests and benchmarks)
+        """
+        self.services = services
+        self.timeout = timeout
+        self._transport_factory = transport_factory
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._transports: Dict[str, httpx.AsyncBaseTransport] = {}
+        self._stats: Dict[str, PoolStats] = {name: PoolStats() for name in services}
+
+    @property
+    def started(self) -> bool:
+        return bool(self._clients)
+
+    async def start(self) -> None:
+        """Create one pooled client per configured service."""
+        if self.started:
+            return
+
+        for service_name, limits in self.services.items():
+            httpx_limits = limits.to_httpx()
+            if self._transport_factory is not None:
+                transport = self._transport_factory(service_name, httpx_limits)
+            else:
+                transport = httpx.AsyncHTTPTransport(limits=httpx_limits)
+
+            self._transports[service_name] = transport
+            self._clients[service_name] = httpx.AsyncClient(
+                timeout=self.timeout, transport=transport
+            )
+            self._stats[service_name] = PoolStats()
+
+        logger.info(
+            f"HTTP connection pools started for {len(self._clients)} services",
+            extra={"services": list(self._clients)},
+        )
+
+    async def close(self) -> None:
+        """Close every pooled client and release its connections."""
+        clients, self._clients = self._clients, {}
+        self._transports = {}
+
+        for service_name, client in clients.items():
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning(f"Error closing HTTP pool for {service_name}: {e}")
+
+        if clients:
+            logger.info("HTTP connection pools closed")
+
+    def get(self, service_name: str) -> Optional[httpx.AsyncClient]:
+        """Return the pooled client for a service, or None if not available."""
+        return self._clients.get(service_name)
+
+    @contextmanager
+    def track(self, service_name: str) -> Iterator[None]:
+        """Record one request against the service's usage counters."""
+        stats = self._stats.setdefault(service_name, PoolStats())
+        stats.requests_total += 1
+        stats.in_flight += 1
+        stats.peak_in_flight = max(stats.peak_in_flight, stats.in_flight)
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            stats.errors_total += 1
+            raise
+        finally:
+            stats.in_flight -= 1
+            stats.total_time_seconds += time.perf_counter() - start
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Return pool usage metrics per service.
+
+        Connection counts come from the underlying httpcore pool when the
+        default transport is in use.
+        """
+        result: Dict[str, Dict[str, Any]] = {}
+        for service_name, limits in self.services.items():
+            stats = self._stats.get(service_name, PoolStats())
+            avg_ms = (
+                stats.total_time_seconds / stats.requests_total * 1000
+                if stats.requests_total
+                else 0.0
+            )
+            connections = self._connection_counts(service_name)
+            result[service_name] = {
+                "active": service_name in self._clients,
+                "max_connections": limits.max_connections,
+                "max_keepalive_connections": limits.max_keepalive_connections,
+                "keepalive_expiry": limits.keepalive_expiry,
+                "requests_total": stats.requests_total,
+                "errors_total": stats.errors_total,
+                "in_flight": stats.in_flight,
+                "peak_in_flight": stats.peak_in_flight,
+                "avg_request_ms": round(avg_ms, 3),
+                **connections,
+            }
+        return result
+
+    def _connection_counts(self, service_name: str) -> Dict[str, int]:
+        transport = self._transports.get(service_name)
+        pool = getattr(transport, "_pool", None)
+        connections = getattr(pool, "connections", None)
+        if connections is None:
+            return {"connections_open": 0, "connections_idle": 0}
+
+        idle = sum(1 for conn in connections if conn.is_idle())
+        return {"connections_open": len(connections), "connections_idle": idle}
+
+
+_pool_instance: Optional[HttpClientPool] = None
+
+
+def get_http_pool() -> HttpClientPool:
+    """Get singleton HTTP pool instance configured from settings."""
+    global _pool_instance
+
+    if _pool_instance is None:
+        from config.settings import settings
+
+        services = {}
+        for service_name in settings.http_pool_services:
+            overrides = settings.http_pool_service_limits.get(service_name, {})
+            services[service_name] = PoolLimits(
+                max_connections=int(
+                    overrides.get("max_connections", settings.http_pool_max_connections)
+                ),
+                max_keepalive_connections=int(
+                    overrides.get(
+                        "max_keepalive_connections",
+                        settings.http_pool_max_keepalive_connections,
+                    )
+                ),
+                keepalive_expiry=float(
+                    overrides.get(
+                        "keepalive_expiry", settings.http_pool_keepalive_expiry
+                    )
+                ),
+            )
+
+        _pool_instance = HttpClientPool(services, timeout=settings.service_timeout)
+
+    return _pool_instance
+
+
+def reset_http_pool() -> None:
+    """Reset singleton for testing."""
+    global _pool_instance
+    _pool_instance = None
@@ -0,0 +1,175 @@
+"""
+Process-wide cache of identity lookups (Cognito ``sub`` → seller/client record).
+
+Sellers-app and client-app endpoints, and ``/auth/me``, resolve the caller's
+seller or client record before doing any real work. This cache sits in
+front of those lookups so a user's record is fetched once per TTL instead of
+once per request. "Not found" answers are cached too, for a shorter TTL.
+Concurrent misses for the same user share one downstream call, and entries
+are invalidated by seller/client events consumed from SQS.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Record kinds stored in the cache
+SELLER = "seller"
+CLIENT = "client"
+
+CacheKey = Tuple[str, str]
+Loader = Callable[[], Awaitable[Optional[Dict[str, Any]]]]
+
+
+@dataclass
+class IdentityCacheStats:
+    """Hit/miss counters for the identity cache."""
+
+    hits: int = 0
+    negative_hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    load_errors: int = 0
+    invalidations: int = 0
+
+
+class IdentityCache:
+    """
+    TTL + LRU cache of identity records with negative caching and single-flight.
+
+    Records are keyed by ``(kind, sub)``. Loader errors are never cached; they
+    propagate to every caller waiting on that load. If the caller running a
+    load is cancelled, the callers waiting on it load again instead.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 300.0,
+        negative_ttl_seconds: float = 30.0,
+        max_entries: int = 10000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[CacheKey, Tuple[Optional[Dict[str, Any]], float]]" = OrderedDict()
+        self._inflight: Dict[CacheKey, asyncio.Future] = {}
+        self.stats = IdentityCacheStats()
+
+    async def get_or_load(
+        self, kind: str, sub: str, loader: Loader
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Return the cached record for ``sub`` or load it with ``loader``.
+
+        Args:
+            kind: Record kind (``SELLER`` or ``CLIENT``)
+            sub: Cognito user ID
+            loader: Coroutine factory returning the record, or None if not found
+
+        Returns:
+            A copy of the record, or None if the user has no record of this kind
+        """
+        key = (kind, sub)
+        entry = self._entries.get(key)
+        if entry is not None:
+            record, expires_at = entry
+            if self._clock() < expires_at:
+                self._entries.move_to_end(key)
+                if record is None:
+                    self.stats.negative_hits += 1
+                    return None
+                self.stats.hits += 1
+                return dict(record)
+            del self._entries[key]
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.stats.coalesced += 1
+            try:
+                record = await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                # Only the leader was cancelled, not this caller: retry
+                if not inflight.cancelled() or asyncio.current_task().cancelling():
+                    raise
+                return await self.get_or_load(kind, sub, loader)
+            return dict(record) if record is not None else None
+
+        self.stats.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            record = await loader()
+        except BaseException as e:
+            self.stats.load_errors += 1
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+            if isinstance(e, Exception):
+                future.set_exception(e)
+                # Nobody else may be waiting; keep asyncio from logging it as lost
+                future.exception()
+            else:
+                future.cancel()
+            raise
+
+        # Skip storing if the entry was invalidated while the load was running
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+            self._store(key, record)
+        future.set_result(record)
+        return dict(record) if record is not None else None
+
+    def invalidate(self, kind: str, sub: str) -> None:
+        """Drop one record; a load already running for it will not be stored."""
+        self.stats.invalidations += 1
+        self._entries.pop((kind, sub), None)
+        self._inflight.pop((kind, sub), None)
+
+    def clear(self) -> None:
+        """Drop every record."""
+        self._entries.clear()
+        self._inflight.clear()
+
+    def metrics(self) -> Dict[str, Any]:
+        """Return hit/miss counters and the current number of entries."""
+        return {**asdict(self.stats), "entries": len(self._entries)}
+
+    def _store(self, key: CacheKey, record: Optional[Dict[str, Any]]) -> None:
+        ttl = self.ttl_seconds if record is not None else self.negative_ttl_seconds
+        if ttl <= 0 or self.max_entries <= 0:
+            return
+        self._entries[key] = (dict(record) if record is not None else None, self._clock() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+_identity_cache_instance: Optional[IdentityCache] = None
+
+
+def get_identity_cache() -> IdentityCache:
+    """Get singleton identity cache configured from settings."""
+    global _identity_cache_instance
+
+    if _identity_cache_instance is None:
+        from config.settings import settings
+
+        _identity_cache_instance = IdentityCache(
+            ttl_seconds=settings.identity_cache_ttl_seconds,
+            negative_ttl_seconds=settings.identity_cache_negative_ttl_seconds,
+            max_entries=settings.identity_cache_max_entries,
+        )
+
+    return _identity_cache_instance
+
+
+def reset_identity_cache() -> None:
+    """Reset singleton for testing."""
+    global _identity_cache_instance
+    _identity_cache_instance = None
@@ -6,7 +6,7 @@ This defines the contract for inventory read operations accessible to all users.
 
 from abc import ABC, abstractmethod
 
-from common.schemas import PaginatedInventoriesResponse
+from common.schemas import InventorySearchResponse, PaginatedInventoriesResponse
 
 
 class InventoryPort(ABC):
@@ -25,6 +25,7 @@ class InventoryPort(ABC):
         name: str | None = None,
         sku: str | None = None,
         category: str | None = None,
+        cursor: str | None = None,
     ) -> PaginatedInventoriesResponse:
         """
         Retrieve a paginated list of inventories with optional filters.
@@ -35,6 +36,7 @@ class InventoryPort(ABC):
             name: Optional product name filter
             sku: Optional product SKU filter
             category: Optional category filter
+            cursor: next_cursor of the previous page (keyset pagination)
 
         Returns:
             PaginatedInventoriesResponse with validated inventory data
@@ -44,3 +46,21 @@ class InventoryPort(ABC):
             MicroserviceHTTPError: If the inventory service returns an error
         """
         pass
+
+    @abstractmethod
+    async def search_inventories(self, q: str, limit: int = 10) -> InventorySearchResponse:
+        """
+        Search inventories by product name or SKU, ignoring case and accents.
+
+        Args:
+            q: Text typed by the user (at least 3 characters)
+            limit: Maximum number of results
+
+        Returns:
+            InventorySearchResponse with the best matches first
+
+        Raises:
+            MicroserviceConnectionError: If unable to connect to the inventory service
+            MicroserviceHTTPError: If the inventory service returns an error
+        """
+        pass
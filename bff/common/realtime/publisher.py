@@ -1,6 +1,8 @@
 """Generic real-time publisher using Ably."""
 
-from typing import Any, Dict, Optional, TypeVar, Generic
+import asyncio
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional, Set, Tuple, TypeVar, Generic
 from functools import lru_cache
 import logging
 
@@ -8,13 +10,45 @@ logger = logging.getLogger(__name__)
 
 TData = TypeVar('TData', bound=Dict[str, Any])
 
+# (event_name, data) pairs waiting to be sent on one channel
+PendingMessages = List[Tuple[str, Optional[Dict[str, Any]]]]
+
+
+@dataclass
+class PublisherStats:
+    """Counters for messages accepted vs. messages sent to Ably."""
+
+    messages_in: int = 0
+    messages_out: int = 0
+    coalesced: int = 0
+    publish_calls: int = 0
+    failed: int = 0
+
 
 class RealtimePublisher(Generic[TData]):
-    """Real-time publisher using Ably. Generic over event data types."""
+    """
+    Real-time publisher using Ably. Generic over event data types.
+
+    With ``coalesce_window_seconds`` > 0, ``publish()`` buffers messages per
+    channel for that long and sends each channel's buffer with one
+    multi-message Ably publish. Void events (no data) repeated on the same
+    channel within a window collapse into one message.
+    """
 
-    def __init__(self, api_key: str):
+    def __init__(
+        self,
+        api_key: str,
+        coalesce_window_seconds: float = 0.0,
+        max_batch_size: int = 100,
+    ):
         self.api_key = api_key
+        self.coalesce_window_seconds = coalesce_window_seconds
+        self.max_batch_size = max_batch_size
         self._client: Optional[Any] = None
+        self._buffers: Dict[str, PendingMessages] = {}
+        self._pending_void: Dict[str, Set[str]] = {}
+        self._flush_timers: Dict[str, asyncio.Task] = {}
+        self.stats = PublisherStats()
 
         if not api_key:
             logger.warning("Ably API key not provided - publisher will not work")
@@ -45,31 +79,136 @@ class RealtimePublisher(Generic[TData]):
             logger.warning(f"Ably not configured - skipping publish: {channel}:{event_name}")
             return
 
+        self.stats.messages_in += 1
+        if self.coalesce_window_seconds > 0:
+            await self._enqueue(channel, event_name, data)
+            return
+
         try:
             client = self._get_client()
             channel_obj = client.channels.get(channel)
             await channel_obj.publish(event_name, data or {})
+            self.stats.publish_calls += 1
+            self.stats.messages_out += 1
 
             logger.info(
                 f"Published to Ably: {channel}:{event_name}",
                 extra={"channel": channel, "event": event_name, "has_data": data is not None},
             )
         except Exception as e:
+            self.stats.failed += 1
             logger.error(f"Failed to publish to Ably: {channel}:{event_name} - {e}", exc_info=True)
 
     async def publish_batch(
         self,
         messages: list[tuple[str, str, Optional[TData]]],
     ) -> None:
-        """Publish multiple events with generic typed data."""
+        """
+        Publish multiple events with generic typed data.
+
+        Messages are grouped per channel and each group is sent with one
+        multi-message publish; repeated void events on a channel collapse.
+        """
         if not self.api_key:
             logger.warning(f"Ably not configured - skipping batch publish of {len(messages)} messages")
             return
 
         logger.info(f"Publishing batch of {len(messages)} messages to Ably")
 
+        grouped: Dict[str, PendingMessages] = {}
+        void_seen: Dict[str, Set[str]] = {}
         for channel, event_name, data in messages:
-            await self.publish(channel, event_name, data)
+            self.stats.messages_in += 1
+            if data is None:
+                seen = void_seen.setdefault(channel, set())
+                if event_name in seen:
+                    self.stats.coalesced += 1
+                    continue
+                seen.add(event_name)
+            grouped.setdefault(channel, []).append((event_name, data))
+
+        for channel, pending in grouped.items():
+            await self._send(channel, pending)
+
+    async def flush(self) -> None:
+        """Send everything buffered on every channel now."""
+        for channel in list(self._buffers):
+            await self._flush_channel(channel)
+
+    async def close(self) -> None:
+        """Cancel pending flush timers and send whatever is still buffered."""
+        timers = list(self._flush_timers.values())
+        self._flush_timers.clear()
+        for timer in timers:
+            timer.cancel()
+        await self.flush()
+
+    def metrics(self) -> Dict[str, Any]:
+        """Return message counters and the number of buffered messages."""
+        return {
+            **asdict(self.stats),
+            "buffered": sum(len(pending) for pending in self._buffers.values()),
+            "coalesce_window_seconds": self.coalesce_window_seconds,
+        }
+
+    async def _enqueue(self, channel: str, event_name: str, data: Optional[TData]) -> None:
+        """Buffer a message and make sure its channel gets flushed."""
+        if data is None:
+            pending_void = self._pending_void.setdefault(channel, set())
+            if event_name in pending_void:
+                # Same void event already waiting on this channel
+                self.stats.coalesced += 1
+                return
+            pending_void.add(event_name)
+
+        buffer = self._buffers.setdefault(channel, [])
+        buffer.append((event_name, data))
+
+        if len(buffer) >= self.max_batch_size:
+            await self._flush_channel(channel)
+        elif channel not in self._flush_timers:
+            self._flush_timers[channel] = asyncio.create_task(self._flush_later(channel))
+
+    async def _flush_later(self, channel: str) -> None:
+        await asyncio.sleep(self.coalesce_window_seconds)
+        self._flush_timers.pop(channel, None)
+        await self._flush_channel(channel)
+
+    async def _flush_channel(self, channel: str) -> None:
+        """Send one channel's buffer."""
+        timer = self._flush_timers.pop(channel, None)
+        if timer is not None and timer is not asyncio.current_task():
+            timer.cancel()
+        pending = self._buffers.pop(channel, [])
+        self._pending_void.pop(channel, None)
+        if pending:
+            await self._send(channel, pending)
+
+    async def _send(self, channel: str, pending: PendingMessages) -> None:
+        """Send messages to one channel, ``max_batch_size`` per Ably request."""
+        from ably.types.message import Message
+
+        for start in range(0, len(pending), self.max_batch_size):
+            chunk = pending[start:start + self.max_batch_size]
+            try:
+                client = self._get_client()
+                channel_obj = client.channels.get(channel)
+                await channel_obj.publish(
+                    messages=[Message(name=name, data=data or {}) for name, data in chunk]
+                )
+                self.stats.publish_calls += 1
+                self.stats.messages_out += len(chunk)
+
+                logger.info(
+                    f"Published {len(chunk)} messages to Ably: {channel}",
+                    extra={"channel": channel, "messages": len(chunk)},
+                )
+            except Exception as e:
+                self.stats.failed += len(chunk)
+                logger.error(
+                    f"Failed to publish {len(chunk)} messages to Ably: {channel} - {e}",
+                    exc_info=True,
+                )
 
     def health_check(self) -> bool:
         """Check if Ably service is reachable."""
@@ -97,6 +236,8 @@ def get_publisher() -> RealtimePublisher:
 
         _publisher_instance = RealtimePublisher(
             api_key=settings.ably_api_key,
+            coalesce_window_seconds=settings.realtime_coalesce_window_ms / 1000,
+            max_batch_size=settings.realtime_max_batch_size,
         )
         logger.info("Initialized Ably publisher")
 
@@ -1,4 +1,4 @@
-from typing import Dict, List
+from typing import Any, Dict, List
 
 from fastapi import APIRouter
 
@@ -6,6 +6,9 @@ from config import settings
 
 from .controllers import router as inventories_router
 from .health_service import HealthService
+from .http_pool import get_http_pool
+from .identity_cache import get_identity_cache
+from .realtime import get_publisher
 
 router = APIRouter(prefix="/bff", tags=["common"])
 
@@ -35,5 +38,42 @@ async def check_all_services() -> List[Dict[str, str]]:
     return await health_service.check_all_services()
 
 
+@router.get("/metrics/http-pool")
+async def read_http_pool_metrics() -> Dict[str, Dict[str, Any]]:
+    """
+    Connection pool usage metrics for each downstream microservice.
+
+    Returns:
+        Dictionary keyed by service name with request counters, in-flight
+        requests and open/idle connection counts.
+    """
+    return get_http_pool().metrics()
+
+
+@router.get("/metrics/identity-cache")
+async def read_identity_cache_metrics() -> Dict[str, Any]:
+    """
+    Identity cache counters.
+
+    Returns:
+        Hits, negative (not found) hits, misses, coalesced concurrent loads,
+        load errors, invalidations and current entry count.
+    """
+    return get_identity_cache().metrics()
+
+
+@router.get("/metrics/realtime")
+async def read_realtime_metrics() -> Dict[str, Any]:
+    """
+    Realtime publisher counters.
+
+    Returns:
+        Messages accepted (``messages_in``) vs. messages sent to Ably
+        (``messages_out``), coalesced duplicates, Ably publish calls,
+        failures and currently buffered messages.
+    """
+    return get_publisher().metrics()
+
+
 # Include inventories controller
 router.include_router(inventories_router)
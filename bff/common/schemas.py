@@ -73,6 +73,16 @@ class InventoryResponse(BaseModel):
     }
 
 
+class InventorySearchResponse(BaseModel):
+    """
+    Search-as-you-type results, best match first.
+
+    Mirrors the inventory microservice's InventorySearchResponse schema.
+    """
+
+    items: List[InventoryResponse]
+
+
 class PaginatedInventoriesResponse(BaseModel):
     """
     Paginated response for inventory listings.
@@ -81,11 +91,12 @@ class PaginatedInventoriesResponse(BaseModel):
     """
 
     items: List[InventoryResponse]
-    total: int
+    total: Optional[int]  # None on cursor pages or when include_total=false
     page: int
     size: int
     has_next: bool
     has_previous: bool
+    next_cursor: Optional[str] = None  # Pass as ``cursor`` to continue after this page
 
     model_config = {
         "json_schema_extra": {
@@ -1,6 +1,7 @@
 """SQS event consumer and handlers."""
 
+from .concurrent_consumer import ConcurrentSQSConsumer
 from .consumer import SQSConsumer
 from .handlers import EventHandlers
 
-__all__ = ["SQSConsumer", "EventHandlers"]
+__all__ = ["SQSConsumer", "ConcurrentSQSConsumer", "EventHandlers"]
@@ -1,8 +1,9 @@
 """Event handlers for SQS messages."""
 
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
+from common.identity_cache import CLIENT, SELLER, IdentityCache
 from common.realtime.publisher import RealtimePublisher
 
 logger = logging.getLogger(__name__)
@@ -11,8 +12,13 @@ logger = logging.getLogger(__name__)
 class EventHandlers:
     """Handlers for different event types."""
 
-    def __init__(self, publisher: RealtimePublisher):
+    def __init__(
+        self,
+        publisher: RealtimePublisher,
+        identity_cache: Optional[IdentityCache] = None,
+    ):
         self.publisher = publisher
+        self.identity_cache = identity_cache
 
     async def handle_web_report_generated(self, event_data: Dict[str, Any]) -> None:
         """Handle web_report_generated event."""
@@ -82,3 +88,23 @@ class EventHandlers:
             event_name="routes.generated",
             data=None,
         )
+
+    async def handle_seller_changed(self, event_data: Dict[str, Any]) -> None:
+        """Handle seller_created/updated/deleted events by dropping the cached seller."""
+        self._invalidate_identity(SELLER, event_data)
+
+    async def handle_client_changed(self, event_data: Dict[str, Any]) -> None:
+        """Handle client_created/updated/deleted events by dropping the cached client."""
+        self._invalidate_identity(CLIENT, event_data)
+
+    def _invalidate_identity(self, kind: str, event_data: Dict[str, Any]) -> None:
+        if self.identity_cache is None:
+            return
+
+        cognito_user_id = event_data.get("cognito_user_id")
+        if not cognito_user_id:
+            logger.warning(f"{event_data.get('event_type')} missing cognito_user_id")
+            return
+
+        self.identity_cache.invalidate(kind, cognito_user_id)
+        logger.info(f"Invalidated cached {kind} for cognito_user_id={cognito_user_id}")
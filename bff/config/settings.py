@@ -1,3 +1,5 @@
+from typing import Dict, List
+
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -33,6 +35,24 @@ class Settings(BaseSettings):
 
     # Service communication settings
     service_timeout: float = Field(default=10.0)
+    delivery_shipments_batch_size: int = Field(default=100)  # Order IDs per batch shipment lookup
+
+    # Pooled HTTP transport (one keep-alive pool per downstream service)
+    http_pool_enabled: bool = Field(default=True)
+    http_pool_services: List[str] = Field(
+        default=["catalog", "client", "delivery", "inventory", "order", "seller"]
+    )
+    http_pool_max_connections: int = Field(default=100)
+    http_pool_max_keepalive_connections: int = Field(default=20)
+    http_pool_keepalive_expiry: float = Field(default=30.0)
+    # Per-service overrides, e.g. {"order": {"max_connections": 200}}
+    http_pool_service_limits: Dict[str, Dict[str, float]] = Field(default={})
+
+    # Identity cache (Cognito sub -> seller/client record), shared by all apps
+    identity_cache_enabled: bool = Field(default=True)
+    identity_cache_ttl_seconds: float = Field(default=300.0)
+    identity_cache_negative_ttl_seconds: float = Field(default=30.0)  # "Not found" answers
+    identity_cache_max_entries: int = Field(default=10000)
 
     # AWS Cognito Authentication
     aws_cognito_user_pool_id: str = Field(default="")
@@ -41,6 +61,10 @@ class Settings(BaseSettings):
     aws_cognito_region: str = Field(default="us-east-1")
     jwt_issuer_url: str = Field(default="")
     jwt_jwks_url: str = Field(default="")
+    # Verified-token cache (entries never outlive the token's exp)
+    jwt_claims_cache_size: int = Field(default=10000)
+    jwt_claims_cache_max_ttl_seconds: int = Field(default=300)
+    jwt_jwks_ttl_seconds: int = Field(default=3600)  # Refetch signing keys after this
 
     # Real-time messaging (provider-agnostic)
     realtime_provider: str = Field(default="noop")  # "ably", "noop", or future providers
@@ -49,12 +73,22 @@ class Settings(BaseSettings):
     # Ably configuration (loaded from AWS SSM in production)
     ably_api_key: str = Field(default="")  # From SSM: /medisupply/prod/ably/api_key
     ably_environment: str = Field(default="dev")  # dev, staging, prod
+    # Per-channel buffering before a multi-message publish; 0 publishes immediately
+    realtime_coalesce_window_ms: int = Field(default=100)
+    realtime_max_batch_size: int = Field(default=100)  # Messages per Ably publish request
 
     # SQS Event Consumer Configuration
     sqs_queue_url: str = Field(default="")
     sqs_region: str = Field(default="us-east-1")
     sqs_max_messages: int = Field(default=10)
     sqs_wait_time_seconds: int = Field(default=20)
+    sqs_consumer_mode: str = Field(default="concurrent")  # sequential | concurrent
+    sqs_max_workers: int = Field(default=20)
+    # Per-event-type concurrency limits, e.g. {"web_report_generated": 2}
+    sqs_event_concurrency: Dict[str, int] = Field(default={})
+    # Event field that serializes handling per value, e.g. {"order_created": "seller_id"}
+    sqs_ordering_keys: Dict[str, str] = Field(default={})
+    sqs_visibility_timeout_seconds: int = Field(default=30)
 
     # SQS Reports Queue
     sqs_reports_queue_url: str = Field(default="")
@@ -66,6 +100,12 @@ class Settings(BaseSettings):
         description="SQS queue URL for consuming order events (BFF-specific queue)"
     )
 
+    # SQS Identity Events Queue - seller/client changes that invalidate the identity cache
+    sqs_identity_events_queue_url: str = Field(
+        default="",
+        description="SQS queue URL for consuming seller/client change events"
+    )
+
     # SQS Delivery Routes Queue - for delivery route generation notifications
     sqs_delivery_routes_queue_url: str = Field(
         default="",
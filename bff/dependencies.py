@@ -8,6 +8,8 @@ dependencies throughout the application using FastAPI's dependency injection.
 from functools import lru_cache
 
 from common.http_client import HttpClient
+from common.http_pool import get_http_pool
+from common.identity_cache import IdentityCache, get_identity_cache
 from config.settings import settings
 
 # Import ports and adapters directly from their modules to avoid triggering web.__init__.py
@@ -19,7 +21,8 @@ from common.realtime import RealtimePublisher, get_publisher
 
 
 # HTTP Client Factories
-# Using lru_cache to ensure singleton behavior for HTTP clients
+# Using lru_cache to ensure singleton behavior for HTTP clients.
+# All clients share the pooled transport started in the app lifespan.
 
 
 @lru_cache()
@@ -34,6 +37,7 @@ def get_catalog_http_client() -> HttpClient:
         base_url=settings.catalog_url,
         timeout=settings.service_timeout,
         service_name="catalog",
+        pool=get_http_pool(),
     )
 
 
@@ -49,6 +53,7 @@ def get_seller_http_client() -> HttpClient:
         base_url=settings.seller_url,
         timeout=settings.service_timeout,
         service_name="seller",
+        pool=get_http_pool(),
     )
 
 
@@ -64,6 +69,7 @@ def get_inventory_http_client() -> HttpClient:
         base_url=settings.inventory_url,
         timeout=settings.service_timeout,
         service_name="inventory",
+        pool=get_http_pool(),
     )
 
 
@@ -79,6 +85,7 @@ def get_order_http_client() -> HttpClient:
         base_url=settings.order_url,
         timeout=settings.service_timeout,
         service_name="order",
+        pool=get_http_pool(),
     )
 
 
@@ -94,6 +101,7 @@ def get_client_http_client() -> HttpClient:
         base_url=settings.client_url,
         timeout=settings.service_timeout,
         service_name="client",
+        pool=get_http_pool(),
     )
 
 
@@ -109,6 +117,7 @@ def get_delivery_http_client() -> HttpClient:
         base_url=settings.delivery_url,
         timeout=settings.service_timeout,
         service_name="delivery",
+        pool=get_http_pool(),
     )
 
 
@@ -225,7 +234,7 @@ def get_client_app_client_port():
     from client_app.adapters.client_adapter import ClientAdapter
 
     client = get_client_http_client()
-    return ClientAdapter(client)
+    return ClientAdapter(client, identity_cache=get_shared_identity_cache())
 
 
 def get_delivery_port():
@@ -239,7 +248,7 @@ def get_delivery_port():
     from client_app.adapters.delivery_adapter import DeliveryAdapter
 
     client = get_delivery_http_client()
-    return DeliveryAdapter(client)
+    return DeliveryAdapter(client, batch_size=settings.delivery_shipments_batch_size)
 
 
 def get_auth_client_port():
@@ -281,7 +290,7 @@ def get_seller_app_seller_port():
     from sellers_app.adapters.seller_adapter import SellerAdapter
 
     client = get_seller_http_client()
-    return SellerAdapter(client)
+    return SellerAdapter(client, identity_cache=get_shared_identity_cache())
 
 
 def get_visit_port():
@@ -324,6 +333,13 @@ def get_inventory_reports_adapter():
     return InventoryReportsAdapter(client)
 
 
+def get_shared_identity_cache() -> IdentityCache | None:
+    """Identity cache shared by all apps, or None when disabled."""
+    if not settings.identity_cache_enabled:
+        return None
+    return get_identity_cache()
+
+
 def get_realtime_publisher() -> RealtimePublisher:
     """Factory for RealtimePublisher implementation."""
     return get_publisher()
@@ -7,6 +7,7 @@ from sellers_app.ports.client_port import ClientPort
 from sellers_app.schemas.client_schemas import (
     ClientListResponse,
     ClientResponse,
+    ClientSearchResponse,
 )
 from web.adapters.http_client import HttpClient
 
@@ -38,7 +39,8 @@ class ClientAdapter(ClientPort):
         vendedor_asignado_id: UUID | None = None,
         client_name: str | None = None,
         page: int = 1,
-        page_size: int = 50
+        page_size: int = 50,
+        cursor: str | None = None
     ) -> ClientListResponse:
         """
         List clients, optionally filtered by assigned seller.
@@ -46,8 +48,9 @@ class ClientAdapter(ClientPort):
         Args:
             vendedor_asignado_id: Optional seller ID to filter clients
             client_name: Optional institution name filter (partial match)
-            page: Page number (1-indexed)
+            page: Page number (1-indexed), ignored when cursor is given
             page_size: Number of items per page
+            cursor: next_cursor of the previous page (keyset pagination)
 
         Returns:
             List of clients with pagination metadata
@@ -58,7 +61,7 @@ class ClientAdapter(ClientPort):
         """
         logger.info(
             f"Listing clients (sellers app): vendedor_asignado_id={vendedor_asignado_id}, "
-            f"client_name={client_name}, page={page}, page_size={page_size}"
+            f"client_name={client_name}, page={page}, page_size={page_size}, cursor={cursor}"
         )
 
         params = {
@@ -69,6 +72,8 @@ class ClientAdapter(ClientPort):
             params["vendedor_asignado_id"] = str(vendedor_asignado_id)
         if client_name:
             params["client_name"] = client_name
+        if cursor:
+            params["cursor"] = cursor
 
         response_data = await self.client.get("/client/clients", params=params)
 
@@ -82,6 +87,43 @@ class ClientAdapter(ClientPort):
             size=pagination_metadata.get("page_size", page_size),
             has_next=pagination_metadata.get("has_next", False),
             has_previous=pagination_metadata.get("has_previous", False),
+            next_cursor=pagination_metadata.get("next_cursor"),
+        )
+
+    async def search_clients(
+        self,
+        q: str,
+        vendedor_asignado_id: UUID | None = None,
+        limit: int = 10
+    ) -> ClientSearchResponse:
+        """
+        Search clients by institution name, ignoring case and accents.
+
+        Args:
+            q: Text typed by the seller (at least 3 characters)
+            vendedor_asignado_id: Optional seller ID to scope the search
+            limit: Maximum number of results
+
+        Returns:
+            Matching clients, best match first
+
+        Raises:
+            MicroserviceConnectionError: If unable to connect to client service
+            MicroserviceHTTPError: If client service returns an error
+        """
+        logger.info(
+            f"Searching clients (sellers app): q={q}, "
+            f"vendedor_asignado_id={vendedor_asignado_id}, limit={limit}"
+        )
+
+        params = {"q": q, "limit": limit}
+        if vendedor_asignado_id:
+            params["vendedor_asignado_id"] = str(vendedor_asignado_id)
+
+        response_data = await self.client.get("/client/clients/search", params=params)
+
+        return ClientSearchResponse(
+            items=[ClientResponse(**client) for client in response_data.get("clients", [])]
         )
 
     async def get_client_by_id(self, client_id: UUID) -> ClientResponse:
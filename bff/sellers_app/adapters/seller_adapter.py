@@ -1,7 +1,9 @@
 """Seller adapter implementation for sellers app."""
 
 import logging
+from typing import Optional
 
+from common.identity_cache import SELLER, IdentityCache
 from sellers_app.ports.seller_port import SellerPort
 from web.adapters.http_client import HttpClient
 
@@ -15,14 +17,16 @@ class SellerAdapter(SellerPort):
     This adapter handles communication with the seller microservice.
     """
 
-    def __init__(self, http_client: HttpClient):
+    def __init__(self, http_client: HttpClient, identity_cache: Optional[IdentityCache] = None):
         """
         Initialize the seller adapter.
 
         Args:
             http_client: Configured HTTP client for the seller service
+            identity_cache: Optional shared cache for lookups by cognito_user_id
         """
         self.client = http_client
+        self.identity_cache = identity_cache
 
     async def get_seller_by_cognito_user_id(self, cognito_user_id: str) -> dict | None:
         """
@@ -38,6 +42,16 @@ class SellerAdapter(SellerPort):
             MicroserviceConnectionError: If unable to connect to the seller service
             MicroserviceHTTPError: If the seller service returns an error
         """
+        if self.identity_cache is not None:
+            return await self.identity_cache.get_or_load(
+                SELLER,
+                cognito_user_id,
+                lambda: self._fetch_seller_by_cognito_user_id(cognito_user_id),
+            )
+        return await self._fetch_seller_by_cognito_user_id(cognito_user_id)
+
+    async def _fetch_seller_by_cognito_user_id(self, cognito_user_id: str) -> dict | None:
+        """Fetch seller by Cognito User ID from the seller service."""
         logger.info(f"Getting seller by cognito_user_id={cognito_user_id}")
 
         try:
@@ -19,7 +19,7 @@ from common.exceptions import (
 )
 from dependencies import get_seller_client_port
 from sellers_app.ports import ClientPort
-from sellers_app.schemas import ClientListResponse
+from sellers_app.schemas import ClientListResponse, ClientSearchResponse
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -44,6 +44,7 @@ async def list_clients(
     page_size: int = Query(50, ge=1, le=100, description="Number of items per page"),
     client_port: ClientPort = Depends(get_seller_client_port),
     user: Dict = Depends(require_seller_user),
+    cursor: str | None = None,
 ):
     """
     List clients with pagination, optionally filtered by assigned seller.
@@ -57,6 +58,7 @@ async def list_clients(
         page_size: Number of items per page
         client_port: Client port for service communication
         user: Authenticated seller user
+        cursor: next_cursor of the previous page; pages by keyset instead of page number
 
     Returns:
         List of clients with pagination metadata
@@ -70,7 +72,9 @@ async def list_clients(
     )
 
     try:
-        return await client_port.list_clients(vendedor_asignado_id, client_name, page, page_size)
+        return await client_port.list_clients(
+            vendedor_asignado_id, client_name, page, page_size, cursor=cursor
+        )
 
     except MicroserviceConnectionError as e:
         raise HTTPException(
@@ -89,3 +93,67 @@ async def list_clients(
             status_code=500,
             detail=f"Unexpected error listing clients: {str(e)}",
         )
+
+
+@router.get(
+    "/clients/search",
+    response_model=ClientSearchResponse,
+    summary="Search clients by name",
+    description="Search-as-you-type on institution name. Ignores case and accents and tolerates small typos.",
+    responses={
+        200: {"description": "Matching clients, best match first"},
+        401: {"description": "Unauthorized - Invalid or missing token"},
+        403: {"description": "Forbidden - Requires seller_users group"},
+        503: {"description": "Client service unavailable"},
+    },
+)
+async def search_clients(
+    q: str = Query(..., min_length=3, max_length=100, description="Institution name text"),
+    vendedor_asignado_id: UUID | None = Query(None, description="Only this seller's clients and unassigned ones"),
+    limit: int = Query(10, ge=1, le=50, description="Maximum number of results"),
+    client_port: ClientPort = Depends(get_seller_client_port),
+    user: Dict = Depends(require_seller_user),
+):
+    """
+    Search clients by institution name.
+
+    Requires mobile seller authentication (seller_users group).
+
+    Args:
+        q: Text typed by the seller
+        vendedor_asignado_id: Optional seller ID to scope the search
+        limit: Maximum number of results
+        client_port: Client port for service communication
+        user: Authenticated seller user
+
+    Returns:
+        Matching clients, best match first
+
+    Raises:
+        HTTPException: If searching clients fails
+    """
+    logger.info(
+        f"Request: GET /sellers-app/clients/search: q={q}, "
+        f"vendedor_asignado_id={vendedor_asignado_id}, limit={limit}, user={user.get('email')}"
+    )
+
+    try:
+        return await client_port.search_clients(q, vendedor_asignado_id, limit)
+
+    except MicroserviceConnectionError as e:
+        raise HTTPException(
+            status_code=503,
+            detail=f"Client service unavailable: {e.message}",
+        )
+
+    except MicroserviceHTTPError as e:
+        raise HTTPException(
+            status_code=e.status_code,
+            detail=f"Client service error: {e.message}",
+        )
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Unexpected error searching clients: {str(e)}",
+        )
@@ -3,7 +3,11 @@
 from abc import ABC, abstractmethod
 from uuid import UUID
 
-from sellers_app.schemas.client_schemas import ClientListResponse, ClientResponse
+from sellers_app.schemas.client_schemas import (
+    ClientListResponse,
+    ClientResponse,
+    ClientSearchResponse,
+)
 
 
 class ClientPort(ABC):
@@ -23,7 +27,8 @@ class ClientPort(ABC):
         vendedor_asignado_id: UUID | None = None,
         client_name: str | None = None,
         page: int = 1,
-        page_size: int = 50
+        page_size: int = 50,
+        cursor: str | None = None
     ) -> ClientListResponse:
         """
         List clients, optionally filtered by assigned seller.
@@ -31,14 +36,36 @@ class ClientPort(ABC):
         Args:
             vendedor_asignado_id: Optional seller ID to filter clients
             client_name: Optional institution name filter (partial match)
-            page: Page number (1-indexed)
+            page: Page number (1-indexed), ignored when cursor is given
             page_size: Number of items per page
+            cursor: next_cursor of the previous page (keyset pagination)
 
         Returns:
             List of clients with pagination metadata
         """
         pass
 
+    @abstractmethod
+    async def search_clients(
+        self,
+        q: str,
+        vendedor_asignado_id: UUID | None = None,
+        limit: int = 10
+    ) -> ClientSearchResponse:
+        """
+        Search clients by institution name, ignoring case and accents.
+
+        Args:
+            q: Text typed by the seller (at least 3 characters)
+            vendedor_asignado_id: Optional seller ID; limits results to their
+                clients and unassigned ones
+            limit: Maximum number of results
+
+        Returns:
+            Matching clients, best match first
+        """
+        pass
+
     @abstractmethod
     async def get_client_by_id(self, client_id: UUID) -> ClientResponse:
         """
@@ -1,7 +1,7 @@
 """Sellers app schemas."""
 
 from .order_schemas import OrderCreateInput, OrderCreateResponse, OrderItemInput
-from .client_schemas import ClientListResponse, ClientResponse
+from .client_schemas import ClientListResponse, ClientResponse, ClientSearchResponse
 
 __all__ = [
     "OrderCreateInput",
@@ -9,4 +9,5 @@ __all__ = [
     "OrderItemInput",
     "ClientListResponse",
     "ClientResponse",
+    "ClientSearchResponse",
 ]
@@ -1,7 +1,7 @@
 """Client schemas for sellers app."""
 
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, EmailStr, Field
@@ -43,8 +43,14 @@ class ClientResponse(BaseModel):
 class ClientListResponse(BaseModel):
     """Response schema for listing clients."""
     items: List[ClientResponse]
-    total: int
+    total: Optional[int]  # None on cursor pages or when include_total=false
     page: int
     size: int
     has_next: bool
     has_previous: bool
+    next_cursor: Optional[str] = None  # Pass as ``cursor`` to continue after this page
+
+
+class ClientSearchResponse(BaseModel):
+    """Search-as-you-type results, best match first."""
+    items: List[ClientResponse]
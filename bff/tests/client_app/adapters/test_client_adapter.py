@@ -3,6 +3,7 @@ import pytest
 from unittest.mock import AsyncMock
 
 from client_app.adapters.client_adapter import ClientAdapter
+from common.identity_cache import IdentityCache
 
 
 @pytest.mark.asyncio
@@ -49,3 +50,17 @@ async def test_get_client_by_cognito_user_id_error():
 
     with pytest.raises(Exception, match="Connection error"):
         await adapter.get_client_by_cognito_user_id(cognito_user_id)
+
+
+@pytest.mark.asyncio
+async def test_get_client_by_cognito_user_id_uses_identity_cache():
+    """Test repeated lookups for the same user hit the client service once."""
+    mock_http_client = AsyncMock()
+    mock_http_client.get = AsyncMock(return_value={"cliente_id": "123"})
+    adapter = ClientAdapter(mock_http_client, identity_cache=IdentityCache())
+
+    await adapter.get_client_by_cognito_user_id("cognito-123")
+    result = await adapter.get_client_by_cognito_user_id("cognito-123")
+
+    assert result == {"cliente_id": "123"}
+    mock_http_client.get.assert_called_once()
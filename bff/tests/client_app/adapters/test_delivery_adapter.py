@@ -244,3 +244,66 @@ class TestDeliveryAdapterGetShipment:
 
         expected_endpoint = f"/delivery/orders/{order_id}/shipment"
         mock_http_client.get.assert_called_once_with(expected_endpoint)
+
+
+class TestDeliveryAdapterGetShipmentsByOrders:
+    """Tests for DeliveryAdapter.get_shipments_by_orders."""
+
+    def _item(self, order_id, sample_shipment_data):
+        return {**sample_shipment_data, "order_id": str(order_id)}
+
+    @pytest.mark.asyncio
+    async def test_single_request_for_small_page(
+        self, delivery_adapter, mock_http_client, sample_shipment_data
+    ):
+        """Test a page below the batch size is fetched with one request."""
+        order_ids = [uuid4(), uuid4(), uuid4()]
+        mock_http_client.get = AsyncMock(
+            return_value={"items": [self._item(order_ids[0], sample_shipment_data)]}
+        )
+
+        result = await delivery_adapter.get_shipments_by_orders(order_ids)
+
+        mock_http_client.get.assert_called_once_with(
+            "/delivery/shipments",
+            params={"order_ids": ",".join(str(o) for o in order_ids)},
+        )
+        assert list(result) == [order_ids[0]]
+        assert isinstance(result[order_ids[0]], ShipmentInfo)
+
+    @pytest.mark.asyncio
+    async def test_large_id_sets_are_chunked(self, mock_http_client, sample_shipment_data):
+        """Test order IDs beyond the batch size are split into several requests."""
+        adapter = DeliveryAdapter(mock_http_client, batch_size=2)
+        order_ids = [uuid4() for _ in range(5)]
+
+        async def fake_get(path, params):
+            ids = params["order_ids"].split(",")
+            return {"items": [self._item(o, sample_shipment_data) for o in ids]}
+
+        mock_http_client.get = AsyncMock(side_effect=fake_get)
+
+        result = await adapter.get_shipments_by_orders(order_ids + order_ids[:2])
+
+        assert mock_http_client.get.call_count == 3
+        assert set(result) == set(order_ids)
+
+    @pytest.mark.asyncio
+    async def test_empty_ids_skip_request(self, delivery_adapter, mock_http_client):
+        """Test an empty ID list makes no request."""
+        mock_http_client.get = AsyncMock()
+
+        assert await delivery_adapter.get_shipments_by_orders([]) == {}
+        mock_http_client.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_http_error_is_raised(self, delivery_adapter, mock_http_client):
+        """Test HTTP errors propagate to the caller."""
+        mock_http_client.get = AsyncMock(
+            side_effect=MicroserviceHTTPError(
+                service_name="delivery", status_code=500, response_text="error"
+            )
+        )
+
+        with pytest.raises(MicroserviceHTTPError):
+            await delivery_adapter.get_shipments_by_orders([uuid4()])
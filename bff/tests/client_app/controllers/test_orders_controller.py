@@ -270,7 +270,7 @@ class TestListMyOrdersController:
 
         # Verify orders were fetched with cliente_id
         mock_order_port.list_customer_orders.assert_called_once_with(
-            customer_id=cliente_id, limit=10, offset=0
+            customer_id=cliente_id, limit=10, offset=0, cursor=None
         )
 
         assert result == expected_response
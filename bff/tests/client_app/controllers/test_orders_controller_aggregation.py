@@ -9,7 +9,7 @@ from fastapi import HTTPException
 
 from client_app.controllers.orders_controller import (
     _enrich_orders_with_shipments,
-    _fetch_shipment_safe,
+    _fetch_shipments_safe,
     list_my_orders,
 )
 from client_app.ports.client_port import ClientPort
@@ -128,35 +128,26 @@ def paginated_orders_response(sample_order):
     )
 
 
-class TestFetchShipmentSafe:
-    """Tests for _fetch_shipment_safe helper function."""
+class TestFetchShipmentsSafe:
+    """Tests for _fetch_shipments_safe helper function."""
 
     @pytest.mark.asyncio
-    async def test_fetch_shipment_safe_returns_shipment_info(self, mock_delivery_port, sample_shipment):
-        """Test _fetch_shipment_safe returns ShipmentInfo when successful."""
-        order_id = uuid4()
-        mock_delivery_port.get_shipment_by_order = AsyncMock(return_value=sample_shipment)
-
-        result = await _fetch_shipment_safe(mock_delivery_port, order_id)
-
-        assert result == sample_shipment
-        mock_delivery_port.get_shipment_by_order.assert_called_once_with(order_id)
-
-    @pytest.mark.asyncio
-    async def test_fetch_shipment_safe_returns_none_on_not_found(self, mock_delivery_port):
-        """Test _fetch_shipment_safe returns None when shipment not found."""
-        order_id = uuid4()
-        mock_delivery_port.get_shipment_by_order = AsyncMock(return_value=None)
+    async def test_fetch_shipments_safe_returns_mapping(self, mock_delivery_port, sample_shipment):
+        """Test _fetch_shipments_safe returns the port's mapping when successful."""
+        order_ids = [uuid4(), uuid4()]
+        mock_delivery_port.get_shipments_by_orders = AsyncMock(
+            return_value={order_ids[0]: sample_shipment}
+        )
 
-        result = await _fetch_shipment_safe(mock_delivery_port, order_id)
+        result = await _fetch_shipments_safe(mock_delivery_port, order_ids)
 
-        assert result is None
+        assert result == {order_ids[0]: sample_shipment}
+        mock_delivery_port.get_shipments_by_orders.assert_called_once_with(order_ids)
 
     @pytest.mark.asyncio
-    async def test_fetch_shipment_safe_handles_http_error_gracefully(self, mock_delivery_port):
-        """Test _fetch_shipment_safe returns None on HTTP error."""
-        order_id = uuid4()
-        mock_delivery_port.get_shipment_by_order = AsyncMock(
+    async def test_fetch_shipments_safe_handles_http_error_gracefully(self, mock_delivery_port):
+        """Test _fetch_shipments_safe returns an empty mapping on HTTP error."""
+        mock_delivery_port.get_shipments_by_orders = AsyncMock(
             side_effect=MicroserviceHTTPError(
                 service_name="delivery",
                 status_code=500,
@@ -164,36 +155,34 @@ class TestFetchShipmentSafe:
             )
         )
 
-        result = await _fetch_shipment_safe(mock_delivery_port, order_id)
+        result = await _fetch_shipments_safe(mock_delivery_port, [uuid4()])
 
-        assert result is None
+        assert result == {}
 
     @pytest.mark.asyncio
-    async def test_fetch_shipment_safe_handles_connection_error_gracefully(self, mock_delivery_port):
-        """Test _fetch_shipment_safe returns None on connection error."""
-        order_id = uuid4()
-        mock_delivery_port.get_shipment_by_order = AsyncMock(
+    async def test_fetch_shipments_safe_handles_connection_error_gracefully(self, mock_delivery_port):
+        """Test _fetch_shipments_safe returns an empty mapping on connection error."""
+        mock_delivery_port.get_shipments_by_orders = AsyncMock(
             side_effect=MicroserviceConnectionError(
                 service_name="delivery",
                 original_error="Connection refused",
             )
         )
 
-        result = await _fetch_shipment_safe(mock_delivery_port, order_id)
+        result = await _fetch_shipments_safe(mock_delivery_port, [uuid4()])
 
-        assert result is None
+        assert result == {}
 
     @pytest.mark.asyncio
-    async def test_fetch_shipment_safe_handles_generic_exception(self, mock_delivery_port):
-        """Test _fetch_shipment_safe handles any exception gracefully."""
-        order_id = uuid4()
-        mock_delivery_port.get_shipment_by_order = AsyncMock(
+    async def test_fetch_shipments_safe_handles_generic_exception(self, mock_delivery_port):
+        """Test _fetch_shipments_safe handles any exception gracefully."""
+        mock_delivery_port.get_shipments_by_orders = AsyncMock(
             side_effect=Exception("Unexpected error")
         )
 
-        result = await _fetch_shipment_safe(mock_delivery_port, order_id)
+        result = await _fetch_shipments_safe(mock_delivery_port, [uuid4()])
 
-        assert result is None
+        assert result == {}
 
 
 class TestEnrichOrdersWithShipments:
@@ -204,23 +193,24 @@ class TestEnrichOrdersWithShipments:
         self, mock_delivery_port, sample_order, sample_shipment
     ):
         """Test enrich_orders adds shipment info to orders."""
-        mock_delivery_port.get_shipment_by_order = AsyncMock(return_value=sample_shipment)
-
         # Create order with no shipment
         order = sample_order
         order.shipment = None
         orders = [order]
+        mock_delivery_port.get_shipments_by_orders = AsyncMock(
+            return_value={order.id: sample_shipment}
+        )
 
         result = await _enrich_orders_with_shipments(orders, mock_delivery_port)
 
         assert len(result) == 1
         assert result[0].shipment == sample_shipment
-        mock_delivery_port.get_shipment_by_order.assert_called_once_with(order.id)
+        mock_delivery_port.get_shipments_by_orders.assert_called_once_with([order.id])
 
     @pytest.mark.asyncio
     async def test_enrich_orders_without_shipment(self, mock_delivery_port, sample_order):
         """Test enrich_orders sets shipment to None when not found."""
-        mock_delivery_port.get_shipment_by_order = AsyncMock(return_value=None)
+        mock_delivery_port.get_shipments_by_orders = AsyncMock(return_value={})
 
         orders = [sample_order]
 
@@ -230,10 +220,10 @@ class TestEnrichOrdersWithShipments:
         assert result[0].shipment is None
 
     @pytest.mark.asyncio
-    async def test_enrich_orders_parallel_fetching(
+    async def test_enrich_orders_single_batch_call(
         self, mock_delivery_port, sample_order, sample_shipment
     ):
-        """Test multiple orders fetch shipments in parallel."""
+        """Test multiple orders fetch shipments with one batch lookup."""
         # Create 3 independent orders with different IDs
         order_1 = OrderResponse(
             id=uuid4(),
@@ -307,8 +297,8 @@ class TestEnrichOrdersWithShipments:
         orders = [order_1, order_2, order_3]
 
         # Mock delivery port to return shipment for first two, None for third
-        mock_delivery_port.get_shipment_by_order = AsyncMock(
-            side_effect=[sample_shipment, sample_shipment, None]
+        mock_delivery_port.get_shipments_by_orders = AsyncMock(
+            return_value={order_1.id: sample_shipment, order_2.id: sample_shipment}
         )
 
         result = await _enrich_orders_with_shipments(orders, mock_delivery_port)
@@ -317,15 +307,17 @@ class TestEnrichOrdersWithShipments:
         assert result[0].shipment == sample_shipment
         assert result[1].shipment == sample_shipment
         assert result[2].shipment is None
-        # Verify all three orders were fetched
-        assert mock_delivery_port.get_shipment_by_order.call_count == 3
+        # Verify all three orders were fetched in one call
+        mock_delivery_port.get_shipments_by_orders.assert_called_once_with(
+            [order_1.id, order_2.id, order_3.id]
+        )
 
     @pytest.mark.asyncio
     async def test_enrich_orders_shipment_fetch_error_graceful(
         self, mock_delivery_port, sample_order
     ):
         """Test shipment errors don't break order listing."""
-        mock_delivery_port.get_shipment_by_order = AsyncMock(
+        mock_delivery_port.get_shipments_by_orders = AsyncMock(
             side_effect=Exception("Delivery service error")
         )
 
@@ -345,7 +337,7 @@ class TestEnrichOrdersWithShipments:
         result = await _enrich_orders_with_shipments(orders, mock_delivery_port)
 
         assert result == []
-        mock_delivery_port.get_shipment_by_order.assert_not_called()
+        mock_delivery_port.get_shipments_by_orders.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_enrich_orders_maintains_order_sequence(
@@ -402,7 +394,7 @@ class TestEnrichOrdersWithShipments:
 
         original_ids = [order.id for order in orders]
 
-        mock_delivery_port.get_shipment_by_order = AsyncMock(return_value=None)
+        mock_delivery_port.get_shipments_by_orders = AsyncMock(return_value={})
 
         result = await _enrich_orders_with_shipments(orders, mock_delivery_port)
 
@@ -410,10 +402,10 @@ class TestEnrichOrdersWithShipments:
         assert result_ids == original_ids
 
     @pytest.mark.asyncio
-    async def test_enrich_orders_mixed_success_and_failure(
+    async def test_enrich_orders_partial_batch_result(
         self, mock_delivery_port, sample_shipment
     ):
-        """Test enrichment when some shipments fetch succeeds and some fail."""
+        """Test enrichment when the batch lookup only returns some shipments."""
         # Create 3 independent orders
         order_1 = OrderResponse(
             id=uuid4(),
@@ -486,15 +478,15 @@ class TestEnrichOrdersWithShipments:
 
         orders = [order_1, order_2, order_3]
 
-        # Mix of success, failure, and success
-        mock_delivery_port.get_shipment_by_order = AsyncMock(
-            side_effect=[sample_shipment, Exception("Error"), sample_shipment]
+        # Second order has no shipment yet
+        mock_delivery_port.get_shipments_by_orders = AsyncMock(
+            return_value={order_1.id: sample_shipment, order_3.id: sample_shipment}
         )
 
         result = await _enrich_orders_with_shipments(orders, mock_delivery_port)
 
         assert result[0].shipment == sample_shipment
-        assert result[1].shipment is None  # Failed gracefully
+        assert result[1].shipment is None
         assert result[2].shipment == sample_shipment
 
 
@@ -550,8 +542,8 @@ class TestListMyOrdersWithShipments:
             return_value=paginated_response
         )
 
-        mock_delivery_port.get_shipment_by_order = AsyncMock(
-            return_value=sample_shipment
+        mock_delivery_port.get_shipments_by_orders = AsyncMock(
+            return_value={order_id: sample_shipment}
         )
 
         result = await list_my_orders(
@@ -564,7 +556,7 @@ class TestListMyOrdersWithShipments:
         )
 
         assert result.items[0].shipment == sample_shipment
-        mock_delivery_port.get_shipment_by_order.assert_called_once_with(order_id)
+        mock_delivery_port.get_shipments_by_orders.assert_called_once_with([order_id])
 
     @pytest.mark.asyncio
     async def test_list_my_orders_without_shipment(
@@ -613,7 +605,7 @@ class TestListMyOrdersWithShipments:
             return_value=paginated_response
         )
 
-        mock_delivery_port.get_shipment_by_order = AsyncMock(return_value=None)
+        mock_delivery_port.get_shipments_by_orders = AsyncMock(return_value={})
 
         result = await list_my_orders(
             limit=10,
@@ -674,7 +666,7 @@ class TestListMyOrdersWithShipments:
         )
 
         # Delivery service throws error
-        mock_delivery_port.get_shipment_by_order = AsyncMock(
+        mock_delivery_port.get_shipments_by_orders = AsyncMock(
             side_effect=MicroserviceConnectionError(
                 service_name="delivery",
                 original_error="Connection refused",
@@ -767,8 +759,8 @@ class TestListMyOrdersWithShipments:
         )
 
         # Both orders have shipments
-        mock_delivery_port.get_shipment_by_order = AsyncMock(
-            side_effect=[sample_shipment, sample_shipment]
+        mock_delivery_port.get_shipments_by_orders = AsyncMock(
+            return_value={order.id: sample_shipment for order in orders}
         )
 
         result = await list_my_orders(
@@ -783,7 +775,9 @@ class TestListMyOrdersWithShipments:
         assert len(result.items) == 2
         assert result.items[0].shipment == sample_shipment
         assert result.items[1].shipment == sample_shipment
-        assert mock_delivery_port.get_shipment_by_order.call_count == 2
+        mock_delivery_port.get_shipments_by_orders.assert_called_once_with(
+            [order.id for order in orders]
+        )
 
     @pytest.mark.asyncio
     async def test_list_my_orders_enrichment_preserves_order_data(
@@ -833,8 +827,8 @@ class TestListMyOrdersWithShipments:
             return_value=paginated_response
         )
 
-        mock_delivery_port.get_shipment_by_order = AsyncMock(
-            return_value=sample_shipment
+        mock_delivery_port.get_shipments_by_orders = AsyncMock(
+            return_value={original_order_id: sample_shipment}
         )
 
         result = await list_my_orders(
@@ -12,7 +12,7 @@ import pytest
 
 from common.adapters.inventory_adapter import InventoryAdapter
 from common.http_client import HttpClient
-from common.schemas import PaginatedInventoriesResponse, InventoryResponse
+from common.schemas import InventorySearchResponse, PaginatedInventoriesResponse, InventoryResponse
 
 
 @pytest.fixture
@@ -285,3 +285,23 @@ class TestInventoryAdapterGetInventories:
         expected_available = item.total_quantity - item.reserved_quantity
         assert item.available_quantity == expected_available
         assert item.available_quantity == 80
+
+
+class TestInventoryAdapterSearchInventories:
+    """Tests for the search_inventories method."""
+
+    @pytest.mark.asyncio
+    async def test_search_inventories(
+        self, inventory_adapter, mock_http_client, sample_inventory_response
+    ):
+        """Test search_inventories calls the search endpoint and parses the results."""
+        mock_http_client.get = AsyncMock(return_value={"items": [sample_inventory_response]})
+
+        result = await inventory_adapter.search_inventories(q="aspir", limit=5)
+
+        mock_http_client.get.assert_called_once_with(
+            "/inventory/inventories/search",
+            params={"q": "aspir", "limit": 5},
+        )
+        assert isinstance(result, InventorySearchResponse)
+        assert [item.product_name for item in result.items] == ["Aspirin 500mg"]
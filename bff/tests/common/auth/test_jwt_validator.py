@@ -1,5 +1,6 @@
 """Unit tests for CognitoJWTValidator."""
 
+import asyncio
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
@@ -131,6 +132,203 @@ class TestGetJWKS:
                 await jwt_validator.get_jwks()
 
 
+class FakeClock:
+    """Manually advanced wall clock."""
+
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _caching_validator(clock, **kwargs):
+    return CognitoJWTValidator(
+        user_pool_id="us-east-1_TestPool",
+        region="us-east-1",
+        client_ids=["test-client-id-1"],
+        clock=clock,
+        **kwargs,
+    )
+
+
+class TestJWKSRefresh:
+    """Tests for JWKS TTL, unknown-kid refetch and single-flight."""
+
+    @pytest.mark.asyncio
+    async def test_jwks_refetched_after_ttl(self, mock_jwks):
+        """Test the key set is refetched once its TTL has passed."""
+        clock = FakeClock()
+        validator = _caching_validator(clock, jwks_ttl_seconds=60)
+        validator._fetch_jwks = AsyncMock(return_value=mock_jwks)
+
+        await validator.get_jwks()
+        clock.now += 59
+        await validator.get_jwks()
+        clock.now += 2
+        await validator.get_jwks()
+
+        assert validator._fetch_jwks.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_refreshes_share_one_fetch(self, mock_jwks):
+        """Test a cold cache hit by many requests triggers a single fetch."""
+        validator = _caching_validator(FakeClock())
+
+        async def slow_fetch():
+            await asyncio.sleep(0.01)
+            return mock_jwks
+
+        validator._fetch_jwks = AsyncMock(side_effect=slow_fetch)
+
+        results = await asyncio.gather(*(validator.get_jwks() for _ in range(20)))
+
+        assert validator._fetch_jwks.await_count == 1
+        assert all(r is results[0] for r in results)
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_cached_keys(self, mock_jwks):
+        """Test an outage during refresh does not drop known keys."""
+        import httpx
+
+        clock = FakeClock()
+        validator = _caching_validator(clock, jwks_ttl_seconds=60)
+        validator._fetch_jwks = AsyncMock(
+            side_effect=[mock_jwks, httpx.HTTPError("down")]
+        )
+
+        await validator.get_jwks()
+        clock.now += 120
+
+        assert await validator.get_jwks() is mock_jwks
+
+    @pytest.mark.asyncio
+    async def test_unknown_kid_refetches_once_after_rotation(self, mock_jwks):
+        """Test a token signed with a new key validates after one refetch."""
+        rotated = {"keys": mock_jwks["keys"] + [{"kid": "rotated-key", "kty": "RSA"}]}
+        clock = FakeClock()
+        validator = _caching_validator(clock, jwks_min_refresh_interval_seconds=30)
+        validator._fetch_jwks = AsyncMock(side_effect=[mock_jwks, rotated])
+        await validator.get_jwks()
+        clock.now += 31
+
+        with patch("jose.jwt.get_unverified_header") as mock_get_header:
+            with patch("jose.jwt.decode") as mock_decode:
+                mock_get_header.return_value = {"kid": "rotated-key"}
+                mock_decode.return_value = {"sub": "user-1", "exp": clock.now + 3600}
+
+                claims = await validator.validate_token("rotated-token")
+
+        assert claims["sub"] == "user-1"
+        assert validator._fetch_jwks.await_count == 2
+        assert mock_decode.call_args[0][1]["kid"] == "rotated-key"
+
+    @pytest.mark.asyncio
+    async def test_unknown_kid_refetch_is_rate_limited(self, mock_jwks):
+        """Test tokens with bogus kids cannot force a fetch per request."""
+        validator = _caching_validator(FakeClock(), jwks_min_refresh_interval_seconds=30)
+        validator._fetch_jwks = AsyncMock(return_value=mock_jwks)
+
+        with patch("jose.jwt.get_unverified_header") as mock_get_header:
+            mock_get_header.return_value = {"kid": "bogus"}
+            for _ in range(5):
+                with pytest.raises(JWTError, match="Public key not found"):
+                    await validator.validate_token("bogus-token")
+
+        assert validator._fetch_jwks.await_count == 1
+
+
+class TestClaimsCache:
+    """Tests for the verified-claims LRU."""
+
+    @pytest.fixture
+    def validator(self, mock_jwks):
+        clock = FakeClock()
+        validator = _caching_validator(clock, claims_cache_size=2, claims_cache_max_ttl_seconds=300)
+        validator.get_jwks = AsyncMock(return_value=mock_jwks)
+        return validator
+
+    @staticmethod
+    async def _validate(validator, token, claims):
+        with patch("jose.jwt.get_unverified_header") as mock_get_header:
+            with patch("jose.jwt.decode") as mock_decode:
+                mock_get_header.return_value = {"kid": "test-key-id-1"}
+                mock_decode.return_value = claims
+                result = await validator.validate_token(token)
+        return result, mock_decode.call_count
+
+    @pytest.mark.asyncio
+    async def test_reused_token_skips_verification(self, validator):
+        """Test the second validation of a token is served from the cache."""
+        claims = {"sub": "user-1", "exp": validator._clock() + 3600}
+
+        _, first_decodes = await self._validate(validator, "token-a", claims)
+        result, second_decodes = await self._validate(validator, "token-a", claims)
+
+        assert (first_decodes, second_decodes) == (1, 0)
+        assert result == claims
+        assert validator.claims_cache_hits == 1
+
+    @pytest.mark.asyncio
+    async def test_cached_claims_are_copies(self, validator):
+        """Test callers mutating claims do not poison the cache."""
+        claims = {"sub": "user-1", "exp": validator._clock() + 3600}
+        await self._validate(validator, "token-a", claims)
+
+        result, _ = await self._validate(validator, "token-a", claims)
+        result["sub"] = "tampered"
+        again, _ = await self._validate(validator, "token-a", claims)
+
+        assert again["sub"] == "user-1"
+
+    @pytest.mark.asyncio
+    async def test_entry_expires_with_token(self, validator):
+        """Test a cached token is re-verified once its exp has passed."""
+        clock = validator._clock
+        claims = {"sub": "user-1", "exp": clock() + 60}
+        await self._validate(validator, "token-a", claims)
+
+        clock.now += 61
+        _, decodes = await self._validate(validator, "token-a", claims)
+
+        assert decodes == 1
+
+    @pytest.mark.asyncio
+    async def test_entry_lifetime_capped_by_max_ttl(self, validator):
+        """Test long-lived tokens are still re-verified after the max TTL."""
+        clock = validator._clock
+        claims = {"sub": "user-1", "exp": clock() + 86400}
+        await self._validate(validator, "token-a", claims)
+
+        clock.now += 301
+        _, decodes = await self._validate(validator, "token-a", claims)
+
+        assert decodes == 1
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_entry_evicted(self, validator):
+        """Test the cache keeps at most claims_cache_size tokens."""
+        exp = validator._clock() + 3600
+        for token in ("token-a", "token-b", "token-a", "token-c"):
+            await self._validate(validator, token, {"sub": token, "exp": exp})
+
+        _, a_decodes = await self._validate(validator, "token-a", {"sub": "token-a", "exp": exp})
+        _, b_decodes = await self._validate(validator, "token-b", {"sub": "token-b", "exp": exp})
+
+        assert (a_decodes, b_decodes) == (0, 1)
+
+    @pytest.mark.asyncio
+    async def test_rejected_token_is_not_cached(self, validator):
+        """Test tokens that fail the client_id check are verified every time."""
+        claims = {"sub": "user-1", "client_id": "other-client", "exp": validator._clock() + 3600}
+
+        for _ in range(2):
+            with pytest.raises(JWTError):
+                await self._validate(validator, "token-a", claims)
+
+        assert validator._claims_cache == {}
+
+
 class TestValidateToken:
     """Tests for validate_token() method."""
 
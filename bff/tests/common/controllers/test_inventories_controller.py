@@ -9,7 +9,7 @@ from unittest.mock import AsyncMock, Mock
 import pytest
 from fastapi import HTTPException, status
 
-from common.controllers.inventories_controller import get_inventories
+from common.controllers.inventories_controller import get_inventories, search_inventories
 from common.ports.inventory_port import InventoryPort
 
 
@@ -50,6 +50,7 @@ class TestCommonInventoriesController:
             name=None,
             sku=None,
             category=None,
+            cursor=None,
         )
         assert result == expected_response
 
@@ -81,6 +82,7 @@ class TestCommonInventoriesController:
             name="Test Product",
             sku=None,
             category=None,
+            cursor=None,
         )
         assert result == expected_response
 
@@ -112,6 +114,7 @@ class TestCommonInventoriesController:
             name=None,
             sku="PROD-001",
             category=None,
+            cursor=None,
         )
         assert result == expected_response
 
@@ -143,6 +146,7 @@ class TestCommonInventoriesController:
             name=None,
             sku=None,
             category="electronics",
+            cursor=None,
         )
         assert result == expected_response
 
@@ -225,5 +229,21 @@ class TestCommonInventoriesController:
             name=None,
             sku=None,
             category=None,
+            cursor=None,
         )
         assert result == expected_response
+
+
+class TestCommonSearchInventoriesController:
+    """Test search_inventories controller for common/shared endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_search_inventories_calls_port(self, mock_inventory_port):
+        """Test that the query and limit are forwarded to the port."""
+        expected_response = {"items": []}
+        mock_inventory_port.search_inventories = AsyncMock(return_value=expected_response)
+
+        result = await search_inventories(q="acetamin", limit=5, inventory=mock_inventory_port)
+
+        mock_inventory_port.search_inventories.assert_called_once_with(q="acetamin", limit=5)
+        assert result == expected_response
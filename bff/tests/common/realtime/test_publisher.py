@@ -1,5 +1,7 @@
 """Unit tests for RealtimePublisher."""
 
+import asyncio
+
 import pytest
 from unittest.mock import Mock, patch, AsyncMock
 
@@ -138,8 +140,8 @@ class TestRealtimePublisherPublishBatch:
 
     @patch("ably.AblyRest")
     @pytest.mark.asyncio
-    async def test_publish_batch_calls_publish_for_each_message(self, mock_ably_rest):
-        """Test batch iterates and publishes each message."""
+    async def test_publish_batch_publishes_once_per_channel(self, mock_ably_rest):
+        """Test batch sends one multi-message publish per channel."""
         mock_client = Mock()
         mock_channel = Mock()
         mock_channel.publish = AsyncMock()
@@ -154,6 +156,35 @@ class TestRealtimePublisherPublishBatch:
 
         assert mock_channel.publish.call_count == 2
 
+    @patch("ably.AblyRest")
+    @pytest.mark.asyncio
+    async def test_publish_batch_groups_channel_and_collapses_void_events(self, mock_ably_rest):
+        """Test messages for one channel share a request and void duplicates collapse."""
+        mock_client = Mock()
+        mock_channel = Mock()
+        mock_channel.publish = AsyncMock()
+        mock_ably_rest.return_value = mock_client
+        mock_client.channels.get.return_value = mock_channel
+
+        publisher = RealtimePublisher(api_key="test.key:secret")
+        await publisher.publish_batch([
+            ("web:u1", "report.generated", None),
+            ("web:u1", "report.generated", None),
+            ("web:u1", "order.created", {"order_id": "1"}),
+            ("web:u1", "order.created", {"order_id": "2"}),
+        ])
+
+        mock_channel.publish.assert_called_once()
+        sent = mock_channel.publish.call_args.kwargs["messages"]
+        assert [(m.name, m.data) for m in sent] == [
+            ("report.generated", {}),
+            ("order.created", {"order_id": "1"}),
+            ("order.created", {"order_id": "2"}),
+        ]
+        assert publisher.stats.messages_in == 4
+        assert publisher.stats.messages_out == 3
+        assert publisher.stats.coalesced == 1
+
     @pytest.mark.asyncio
     async def test_publish_batch_without_api_key_logs_warning(self, caplog):
         """Test batch publish logs warning when API key is empty."""
@@ -164,6 +195,94 @@ class TestRealtimePublisherPublishBatch:
         assert "Ably not configured - skipping batch publish" in caplog.text
 
 
+class TestRealtimePublisherCoalescing:
+    """Tests for windowed per-channel buffering."""
+
+    @staticmethod
+    def _publisher(mock_ably_rest, **kwargs):
+        mock_client = Mock()
+        channels = {}
+
+        def get_channel(name):
+            if name not in channels:
+                channel = Mock()
+                channel.publish = AsyncMock()
+                channels[name] = channel
+            return channels[name]
+
+        mock_client.channels.get.side_effect = get_channel
+        mock_ably_rest.return_value = mock_client
+        kwargs.setdefault("coalesce_window_seconds", 0.02)
+        return RealtimePublisher(api_key="test.key:secret", **kwargs), channels
+
+    @patch("ably.AblyRest")
+    @pytest.mark.asyncio
+    async def test_messages_are_sent_together_after_window(self, mock_ably_rest):
+        """Test buffered messages go out in one request when the window closes."""
+        publisher, channels = self._publisher(mock_ably_rest)
+
+        for i in range(5):
+            await publisher.publish("mobile:products", "order.created", {"order_id": str(i)})
+
+        assert channels == {}
+        await asyncio.sleep(0.05)
+
+        channels["mobile:products"].publish.assert_called_once()
+        sent = channels["mobile:products"].publish.call_args.kwargs["messages"]
+        assert len(sent) == 5
+        assert publisher.metrics()["messages_out"] == 5
+        assert publisher.metrics()["publish_calls"] == 1
+
+    @patch("ably.AblyRest")
+    @pytest.mark.asyncio
+    async def test_void_events_collapse_per_channel(self, mock_ably_rest):
+        """Test repeated void events within a window become one message per channel."""
+        publisher, channels = self._publisher(mock_ably_rest)
+
+        for _ in range(3):
+            await publisher.publish("web:broadcasts", "routes.generated")
+            await publisher.publish("web:u1", "report.generated")
+        await publisher.publish("web:u2", "report.generated")
+        await asyncio.sleep(0.05)
+
+        for name in ("web:broadcasts", "web:u1", "web:u2"):
+            assert len(channels[name].publish.call_args.kwargs["messages"]) == 1
+        metrics = publisher.metrics()
+        assert metrics["messages_in"] == 7
+        assert metrics["messages_out"] == 3
+        assert metrics["coalesced"] == 4
+
+    @patch("ably.AblyRest")
+    @pytest.mark.asyncio
+    async def test_full_buffer_flushes_immediately(self, mock_ably_rest):
+        """Test reaching max_batch_size sends without waiting for the window."""
+        publisher, channels = self._publisher(
+            mock_ably_rest, coalesce_window_seconds=10, max_batch_size=3
+        )
+
+        for i in range(4):
+            await publisher.publish("mobile:products", "order.created", {"n": i})
+
+        channels["mobile:products"].publish.assert_called_once()
+        assert publisher.metrics()["buffered"] == 1
+        await publisher.close()
+        assert channels["mobile:products"].publish.call_count == 2
+        assert publisher.metrics()["buffered"] == 0
+
+    @patch("ably.AblyRest")
+    @pytest.mark.asyncio
+    async def test_failed_publish_is_counted(self, mock_ably_rest):
+        """Test Ably errors are logged and counted, not raised."""
+        publisher, channels = self._publisher(mock_ably_rest, coalesce_window_seconds=10)
+        await publisher.publish("web:u1", "order.created", {"n": 1})
+        channels["web:u1"] = Mock(publish=AsyncMock(side_effect=Exception("boom")))
+
+        await publisher.close()
+
+        assert publisher.stats.failed == 1
+        assert publisher.stats.messages_out == 0
+
+
 class TestRealtimePublisherHealthCheck:
     """Tests for health_check() method."""
 
@@ -3,6 +3,7 @@
 import pytest
 from unittest.mock import Mock, AsyncMock
 
+from common.identity_cache import CLIENT, SELLER
 from common.sqs.handlers import EventHandlers
 
 
@@ -235,3 +236,42 @@ class TestEventHandlersIntegration:
         # Total: 1 from web_report + 1 from order_creation = 2
         assert publisher.publish.call_count == 2
 
+
+
+class TestIdentityInvalidation:
+    """Tests for seller/client change handlers."""
+
+    @pytest.mark.asyncio
+    async def test_seller_changed_invalidates_cached_seller(self):
+        """Test seller events drop the seller entry for that cognito user."""
+        identity_cache = Mock()
+        handlers = EventHandlers(Mock(), identity_cache=identity_cache)
+
+        await handlers.handle_seller_changed(
+            {"event_type": "seller_updated", "cognito_user_id": "sub-1"}
+        )
+
+        identity_cache.invalidate.assert_called_once_with(SELLER, "sub-1")
+
+    @pytest.mark.asyncio
+    async def test_client_changed_invalidates_cached_client(self):
+        """Test client events drop the client entry for that cognito user."""
+        identity_cache = Mock()
+        handlers = EventHandlers(Mock(), identity_cache=identity_cache)
+
+        await handlers.handle_client_changed(
+            {"event_type": "client_deleted", "cognito_user_id": "sub-2"}
+        )
+
+        identity_cache.invalidate.assert_called_once_with(CLIENT, "sub-2")
+
+    @pytest.mark.asyncio
+    async def test_missing_cognito_user_id_is_ignored(self, caplog):
+        """Test events without cognito_user_id are logged and skipped."""
+        identity_cache = Mock()
+        handlers = EventHandlers(Mock(), identity_cache=identity_cache)
+
+        await handlers.handle_seller_changed({"event_type": "seller_updated"})
+
+        identity_cache.invalidate.assert_not_called()
+        assert "missing cognito_user_id" in caplog.text
@@ -0,0 +1,134 @@
+"""Unit tests for the shared HTTP connection pool."""
+
+import httpx
+import pytest
+
+from common.exceptions import MicroserviceHTTPError
+from common.http_client import HttpClient
+from common.http_pool import HttpClientPool, PoolLimits, get_http_pool, reset_http_pool
+
+
+def _mock_transport_factory(handler):
+    created = {}
+
+    def factory(service_name, limits):
+        created[service_name] = limits
+        return httpx.MockTransport(handler)
+
+    return factory, created
+
+
+@pytest.fixture
+def pool():
+    def handler(request):
+        if request.url.path.endswith("/missing"):
+            return httpx.Response(404, text="Not found")
+        return httpx.Response(200, json={"path": request.url.path})
+
+    factory, _ = _mock_transport_factory(handler)
+    return HttpClientPool(
+        {"catalog": PoolLimits(), "order": PoolLimits(max_connections=5)},
+        transport_factory=factory,
+    )
+
+
+class TestHttpClientPool:
+    @pytest.mark.asyncio
+    async def test_get_returns_none_before_start(self, pool):
+        assert pool.get("catalog") is None
+        assert pool.started is False
+
+    @pytest.mark.asyncio
+    async def test_start_creates_one_client_per_service(self, pool):
+        await pool.start()
+        try:
+            assert pool.started is True
+            assert isinstance(pool.get("catalog"), httpx.AsyncClient)
+            assert pool.get("catalog") is not pool.get("order")
+            assert pool.get("unknown") is None
+        finally:
+            await pool.close()
+
+        assert pool.get("catalog") is None
+
+    @pytest.mark.asyncio
+    async def test_start_passes_per_service_limits(self):
+        factory, created = _mock_transport_factory(lambda r: httpx.Response(200))
+        pool = HttpClientPool(
+            {
+                "catalog": PoolLimits(),
+                "order": PoolLimits(max_connections=5, max_keepalive_connections=2),
+            },
+            transport_factory=factory,
+        )
+
+        await pool.start()
+        await pool.close()
+
+        assert created["order"].max_connections == 5
+        assert created["order"].max_keepalive_connections == 2
+        assert created["catalog"].max_connections == 100
+
+    @pytest.mark.asyncio
+    async def test_http_client_reuses_pooled_client(self, pool):
+        await pool.start()
+        try:
+            client = HttpClient("http://catalog:8000/catalog", service_name="catalog", pool=pool)
+
+            first = await client.get("/products")
+            second = await client.get("/providers")
+
+            assert first == {"path": "/catalog/products"}
+            assert second == {"path": "/catalog/providers"}
+            assert pool.metrics()["catalog"]["requests_total"] == 2
+            assert pool.metrics()["catalog"]["in_flight"] == 0
+        finally:
+            await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_metrics_count_errors(self, pool):
+        await pool.start()
+        try:
+            client = HttpClient("http://order:8000/order", service_name="order", pool=pool)
+
+            with pytest.raises(MicroserviceHTTPError):
+                await client.get("/missing")
+
+            metrics = pool.metrics()["order"]
+            assert metrics["requests_total"] == 1
+            assert metrics["errors_total"] == 1
+            assert metrics["max_connections"] == 5
+            assert metrics["active"] is True
+        finally:
+            await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_default_transport_reports_connection_counts(self):
+        pool = HttpClientPool({"catalog": PoolLimits()})
+        await pool.start()
+        try:
+            metrics = pool.metrics()["catalog"]
+            assert metrics["connections_open"] == 0
+            assert metrics["connections_idle"] == 0
+        finally:
+            await pool.close()
+
+
+class TestGetHttpPool:
+    def test_builds_limits_from_settings(self, monkeypatch):
+        from config.settings import settings
+
+        reset_http_pool()
+        monkeypatch.setattr(settings, "http_pool_services", ["catalog", "order"])
+        monkeypatch.setattr(settings, "http_pool_max_connections", 50)
+        monkeypatch.setattr(
+            settings, "http_pool_service_limits", {"order": {"max_connections": 200}}
+        )
+        try:
+            pool = get_http_pool()
+
+            assert pool is get_http_pool()
+            assert pool.services["catalog"].max_connections == 50
+            assert pool.services["order"].max_connections == 200
+        finally:
+            reset_http_pool()
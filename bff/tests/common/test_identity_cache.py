@@ -0,0 +1,188 @@
+"""Unit tests for the shared identity cache."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from common.identity_cache import (
+    CLIENT,
+    SELLER,
+    IdentityCache,
+    get_identity_cache,
+    reset_identity_cache,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock):
+    return IdentityCache(ttl_seconds=60, negative_ttl_seconds=5, max_entries=2, clock=clock)
+
+
+class TestIdentityCache:
+    @pytest.mark.asyncio
+    async def test_record_loaded_once_within_ttl(self, cache, clock):
+        loader = AsyncMock(return_value={"id": "seller-1"})
+
+        first = await cache.get_or_load(SELLER, "sub-1", loader)
+        clock.now = 59
+        second = await cache.get_or_load(SELLER, "sub-1", loader)
+
+        assert first == second == {"id": "seller-1"}
+        assert loader.await_count == 1
+        assert cache.stats.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_record_reloaded_after_ttl(self, cache, clock):
+        loader = AsyncMock(return_value={"id": "seller-1"})
+
+        await cache.get_or_load(SELLER, "sub-1", loader)
+        clock.now = 61
+        await cache.get_or_load(SELLER, "sub-1", loader)
+
+        assert loader.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_not_found_cached_for_negative_ttl(self, cache, clock):
+        loader = AsyncMock(return_value=None)
+
+        assert await cache.get_or_load(CLIENT, "sub-1", loader) is None
+        clock.now = 4
+        assert await cache.get_or_load(CLIENT, "sub-1", loader) is None
+        clock.now = 6
+        await cache.get_or_load(CLIENT, "sub-1", loader)
+
+        assert loader.await_count == 2
+        assert cache.stats.negative_hits == 1
+
+    @pytest.mark.asyncio
+    async def test_kinds_are_cached_separately(self, cache):
+        await cache.get_or_load(SELLER, "sub-1", AsyncMock(return_value={"kind": "seller"}))
+        result = await cache.get_or_load(CLIENT, "sub-1", AsyncMock(return_value={"kind": "client"}))
+
+        assert result == {"kind": "client"}
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_load(self, cache):
+        calls = 0
+
+        async def loader():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"id": "seller-1"}
+
+        results = await asyncio.gather(
+            *(cache.get_or_load(SELLER, "sub-1", loader) for _ in range(10))
+        )
+
+        assert calls == 1
+        assert all(r == {"id": "seller-1"} for r in results)
+        assert cache.stats.coalesced == 9
+
+    @pytest.mark.asyncio
+    async def test_load_errors_are_shared_but_not_cached(self, cache):
+        async def failing():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("seller service down")
+
+        results = await asyncio.gather(
+            *(cache.get_or_load(SELLER, "sub-1", failing) for _ in range(3)),
+            return_exceptions=True,
+        )
+        recovered = await cache.get_or_load(SELLER, "sub-1", AsyncMock(return_value={"id": "s"}))
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert recovered == {"id": "s"}
+        assert cache.stats.load_errors == 1
+
+    @pytest.mark.asyncio
+    async def test_waiters_retry_when_leader_is_cancelled(self, cache):
+        started = asyncio.Event()
+        calls = 0
+
+        async def loader():
+            nonlocal calls
+            calls += 1
+            started.set()
+            await asyncio.sleep(0.01)
+            return {"id": "seller-1"}
+
+        leader = asyncio.create_task(cache.get_or_load(SELLER, "sub-1", loader))
+        await started.wait()
+        waiters = [
+            asyncio.create_task(cache.get_or_load(SELLER, "sub-1", loader)) for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        results = await asyncio.gather(*waiters)
+
+        assert leader.cancelled()
+        assert all(r == {"id": "seller-1"} for r in results)
+        assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_returned_records_are_copies(self, cache):
+        loader = AsyncMock(return_value={"id": "seller-1"})
+
+        first = await cache.get_or_load(SELLER, "sub-1", loader)
+        first["id"] = "tampered"
+
+        assert await cache.get_or_load(SELLER, "sub-1", loader) == {"id": "seller-1"}
+
+    @pytest.mark.asyncio
+    async def test_invalidate_forces_reload(self, cache):
+        loader = AsyncMock(side_effect=[{"name": "old"}, {"name": "new"}])
+
+        await cache.get_or_load(SELLER, "sub-1", loader)
+        cache.invalidate(SELLER, "sub-1")
+
+        assert await cache.get_or_load(SELLER, "sub-1", loader) == {"name": "new"}
+
+    @pytest.mark.asyncio
+    async def test_invalidate_during_load_discards_result(self, cache):
+        started = asyncio.Event()
+
+        async def slow_loader():
+            started.set()
+            await asyncio.sleep(0.01)
+            return {"name": "stale"}
+
+        task = asyncio.create_task(cache.get_or_load(SELLER, "sub-1", slow_loader))
+        await started.wait()
+        cache.invalidate(SELLER, "sub-1")
+        await task
+
+        assert cache.metrics()["entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_entry_evicted(self, cache):
+        loader = AsyncMock(return_value={"id": "x"})
+        for sub in ("a", "b", "a", "c"):
+            await cache.get_or_load(SELLER, sub, loader)
+
+        await cache.get_or_load(SELLER, "a", loader)
+        await cache.get_or_load(SELLER, "b", loader)
+
+        assert loader.await_count == 4
+
+    def test_singleton(self):
+        reset_identity_cache()
+        try:
+            assert get_identity_cache() is get_identity_cache()
+        finally:
+            reset_identity_cache()
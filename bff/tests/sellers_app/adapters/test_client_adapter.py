@@ -7,7 +7,11 @@ from uuid import uuid4
 import pytest
 
 from sellers_app.adapters.client_adapter import ClientAdapter
-from sellers_app.schemas.client_schemas import ClientListResponse, ClientResponse
+from sellers_app.schemas.client_schemas import (
+    ClientListResponse,
+    ClientResponse,
+    ClientSearchResponse,
+)
 from common.exceptions import MicroserviceConnectionError, MicroserviceHTTPError
 from web.adapters.http_client import HttpClient
 
@@ -192,6 +196,41 @@ class TestClientAdapterListClients:
             await adapter.list_clients(None)
 
 
+class TestClientAdapterSearchClients:
+    """Tests for search_clients method."""
+
+    @pytest.mark.asyncio
+    async def test_search_clients_with_seller_scope(
+        self, mock_http_client, sample_client_response_data
+    ):
+        """Test search_clients calls the search endpoint and flattens the results."""
+        seller_id = uuid4()
+        mock_http_client.get = AsyncMock(return_value={"clients": [sample_client_response_data]})
+
+        adapter = ClientAdapter(mock_http_client)
+        result = await adapter.search_clients("test inst", seller_id, limit=5)
+
+        mock_http_client.get.assert_called_once_with(
+            "/client/clients/search",
+            params={"q": "test inst", "limit": 5, "vendedor_asignado_id": str(seller_id)},
+        )
+        assert isinstance(result, ClientSearchResponse)
+        assert [c.nombre_institucion for c in result.items] == ["Test Institution"]
+
+    @pytest.mark.asyncio
+    async def test_search_clients_without_seller(self, mock_http_client):
+        """Test search_clients omits the seller filter when not given."""
+        mock_http_client.get = AsyncMock(return_value={"clients": []})
+
+        adapter = ClientAdapter(mock_http_client)
+        result = await adapter.search_clients("hospital")
+
+        mock_http_client.get.assert_called_once_with(
+            "/client/clients/search", params={"q": "hospital", "limit": 10}
+        )
+        assert result.items == []
+
+
 class TestClientAdapterGetClientById:
     """Tests for get_client_by_id method."""
 
@@ -2,6 +2,7 @@
 import pytest
 from unittest.mock import AsyncMock
 
+from common.identity_cache import IdentityCache
 from sellers_app.adapters.seller_adapter import SellerAdapter
 from common.exceptions import MicroserviceHTTPError
 
@@ -66,3 +67,29 @@ async def test_get_seller_by_cognito_user_id_other_error():
         await adapter.get_seller_by_cognito_user_id(cognito_user_id)
 
     assert exc_info.value.status_code == 500
+
+
+@pytest.mark.asyncio
+async def test_get_seller_by_cognito_user_id_uses_identity_cache():
+    """Test repeated lookups for the same user hit the seller service once."""
+    mock_http_client = AsyncMock()
+    mock_http_client.get = AsyncMock(return_value={"id": "seller-123"})
+    adapter = SellerAdapter(mock_http_client, identity_cache=IdentityCache())
+
+    first = await adapter.get_seller_by_cognito_user_id("cognito-123")
+    second = await adapter.get_seller_by_cognito_user_id("cognito-123")
+
+    assert first == second == {"id": "seller-123"}
+    mock_http_client.get.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_get_seller_by_cognito_user_id_caches_not_found():
+    """Test a 404 is cached so unknown users don't hit the seller service each time."""
+    mock_http_client = AsyncMock()
+    mock_http_client.get = AsyncMock(side_effect=MicroserviceHTTPError("seller", 404, "Not found"))
+    adapter = SellerAdapter(mock_http_client, identity_cache=IdentityCache())
+
+    assert await adapter.get_seller_by_cognito_user_id("cognito-404") is None
+    assert await adapter.get_seller_by_cognito_user_id("cognito-404") is None
+    mock_http_client.get.assert_called_once()
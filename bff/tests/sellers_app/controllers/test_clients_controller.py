@@ -12,9 +12,13 @@ from uuid import UUID, uuid4
 import pytest
 from fastapi import HTTPException
 
-from sellers_app.controllers.clients_controller import list_clients
+from sellers_app.controllers.clients_controller import list_clients, search_clients
 from sellers_app.ports.client_port import ClientPort
-from sellers_app.schemas.client_schemas import ClientListResponse, ClientResponse
+from sellers_app.schemas.client_schemas import (
+    ClientListResponse,
+    ClientResponse,
+    ClientSearchResponse,
+)
 from common.exceptions import (
     MicroserviceConnectionError,
     MicroserviceHTTPError,
@@ -106,7 +110,7 @@ class TestSellersAppClientsController:
         )
 
         # Verify port was called with pagination parameters (Query objects for page and page_size)
-        mock_client_port.list_clients.assert_called_once_with(None, ANY, ANY, ANY)
+        mock_client_port.list_clients.assert_called_once_with(None, ANY, ANY, ANY, cursor=None)
         assert result == sample_clients_list_response
         assert result.total == 2
         assert len(result.items) == 2
@@ -134,7 +138,7 @@ class TestSellersAppClientsController:
         )
 
         # Verify port was called with seller_id filter and pagination (Query objects for page and page_size)
-        mock_client_port.list_clients.assert_called_once_with(seller_id, ANY, ANY, ANY)
+        mock_client_port.list_clients.assert_called_once_with(seller_id, ANY, ANY, ANY, cursor=None)
         assert result == filtered_response
         assert result.total == 1
         assert len(result.items) == 1
@@ -158,7 +162,7 @@ class TestSellersAppClientsController:
             user=mock_user,
         )
 
-        mock_client_port.list_clients.assert_called_once_with(None, ANY, ANY, ANY)
+        mock_client_port.list_clients.assert_called_once_with(None, ANY, ANY, ANY, cursor=None)
         assert result == empty_response
         assert result.total == 0
         assert len(result.items) == 0
@@ -297,5 +301,49 @@ class TestSellersAppClientsController:
             user=mock_user,
         )
 
-        mock_client_port.list_clients.assert_called_once_with(seller_id, ANY, ANY, ANY)
+        mock_client_port.list_clients.assert_called_once_with(seller_id, ANY, ANY, ANY, cursor=None)
         assert result == sample_clients_list_response
+
+
+class TestSellersAppSearchClientsController:
+    """Test search_clients controller for sellers app."""
+
+    @pytest.mark.asyncio
+    async def test_search_clients_calls_port(
+        self, mock_client_port, sample_client_response, mock_user
+    ):
+        """Test that search_clients forwards the query and seller scope."""
+        seller_id = uuid4()
+        expected = ClientSearchResponse(items=[sample_client_response])
+        mock_client_port.search_clients = AsyncMock(return_value=expected)
+
+        result = await search_clients(
+            q="test inst",
+            vendedor_asignado_id=seller_id,
+            limit=5,
+            client_port=mock_client_port,
+            user=mock_user,
+        )
+
+        mock_client_port.search_clients.assert_called_once_with("test inst", seller_id, 5)
+        assert result == expected
+
+    @pytest.mark.asyncio
+    async def test_search_clients_handles_connection_error(
+        self, mock_client_port, mock_user
+    ):
+        """Test that search_clients maps connection errors to 503."""
+        mock_client_port.search_clients = AsyncMock(
+            side_effect=MicroserviceConnectionError("client", "Connection refused")
+        )
+
+        with pytest.raises(HTTPException) as exc_info:
+            await search_clients(
+                q="test",
+                vendedor_asignado_id=None,
+                limit=10,
+                client_port=mock_client_port,
+                user=mock_user,
+            )
+
+        assert exc_info.value.status_code == 503
@@ -154,6 +154,29 @@ class TestOrderReportsAdapterListReports:
         assert params["report_type"] == "orders_per_seller"
 
 
+    @pytest.mark.asyncio
+    async def test_passes_cursor_and_parses_next_cursor(
+        self, order_reports_adapter, mock_http_client
+    ):
+        """Test that the cursor is forwarded and next_cursor is returned."""
+        mock_http_client.get = AsyncMock(
+            return_value={
+                "items": [],
+                "total": 0,
+                "page": 1,
+                "size": 0,
+                "has_next": True,
+                "has_previous": True,
+                "next_cursor": "next-token",
+            }
+        )
+
+        result = await order_reports_adapter.list_reports(uuid4(), cursor="page-token")
+
+        assert mock_http_client.get.call_args.kwargs["params"]["cursor"] == "page-token"
+        assert result.next_cursor == "next-token"
+
+
 class TestOrderReportsAdapterGetReport:
     """Test get_report calls correct endpoint for Order service."""
 
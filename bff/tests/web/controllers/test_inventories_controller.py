@@ -176,6 +176,7 @@ class TestInventoriesControllerList:
             offset=0,
             sku=None,
             warehouse_id=None,
+            cursor=None,
         )
         assert result == expected_response
 
@@ -205,6 +206,7 @@ class TestInventoriesControllerList:
             offset=0,
             sku="PROD-001",
             warehouse_id=None,
+            cursor=None,
         )
         assert result == expected_response
 
@@ -235,6 +237,7 @@ class TestInventoriesControllerList:
             offset=0,
             sku=None,
             warehouse_id=warehouse_id,
+            cursor=None,
         )
         assert result == expected_response
 
@@ -265,6 +268,7 @@ class TestInventoriesControllerList:
             offset=0,
             sku="PROD-001",
             warehouse_id=warehouse_id,
+            cursor=None,
         )
         assert result == expected_response
 
@@ -294,5 +298,6 @@ class TestInventoriesControllerList:
             offset=40,
             sku=None,
             warehouse_id=None,
+            cursor=None,
         )
         assert result == expected_response
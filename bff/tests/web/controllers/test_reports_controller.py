@@ -440,6 +440,117 @@ class TestListReports:
         assert result.items[0].report_type == "orders_per_seller"
 
 
+    @pytest.mark.asyncio
+    async def test_list_reports_second_page_is_not_empty(
+        self, mock_user, mock_order_adapter, mock_inventory_adapter
+    ):
+        """Test offset pages of the merged listing return the right reports."""
+        order_items = [
+            ReportResponse(
+                id=uuid4(),
+                report_type="orders_per_seller",
+                status="completed",
+                created_at=datetime(2025, 1, day),
+                start_date=datetime(2025, 1, 1),
+                end_date=datetime(2025, 1, 31),
+            )
+            for day in (20, 16, 12)
+        ]
+        inventory_items = [
+            ReportResponse(
+                id=uuid4(),
+                report_type="low_stock",
+                status="completed",
+                created_at=datetime(2025, 1, day),
+                start_date=datetime(2025, 1, 1),
+                end_date=datetime(2025, 1, 31),
+            )
+            for day in (18, 14, 10)
+        ]
+
+        mock_order_adapter.list_reports = AsyncMock(
+            return_value=PaginatedReportsResponse(
+                items=order_items, total=3, page=1, size=3, has_next=False, has_previous=False
+            )
+        )
+        mock_inventory_adapter.list_reports = AsyncMock(
+            return_value=PaginatedReportsResponse(
+                items=inventory_items, total=3, page=1, size=3, has_next=False, has_previous=False
+            )
+        )
+
+        result = await list_reports(
+            limit=2,
+            offset=2,
+            status=None,
+            report_type=None,
+            order_reports=mock_order_adapter,
+            inventory_reports=mock_inventory_adapter,
+            user=mock_user,
+        )
+
+        assert [r.created_at.day for r in result.items] == [16, 14]
+        assert result.total == 6
+        assert result.page == 2
+        assert result.has_next is True
+        assert result.has_previous is True
+        # Services are read from the start; the BFF does the skipping
+        assert mock_order_adapter.list_reports.call_args.kwargs["offset"] == 0
+        assert mock_order_adapter.list_reports.call_args.kwargs["limit"] == 4
+
+    @pytest.mark.asyncio
+    async def test_list_reports_cursor_is_forwarded_to_both_services(
+        self, mock_user, mock_order_adapter, mock_inventory_adapter
+    ):
+        """Test that a merged cursor is passed to both services unchanged."""
+        empty = PaginatedReportsResponse(
+            items=[], total=0, page=1, size=0, has_next=False, has_previous=False
+        )
+        mock_order_adapter.list_reports = AsyncMock(return_value=empty)
+        mock_inventory_adapter.list_reports = AsyncMock(return_value=empty)
+
+        result = await list_reports(
+            limit=10,
+            offset=0,
+            status=None,
+            report_type=None,
+            order_reports=mock_order_adapter,
+            inventory_reports=mock_inventory_adapter,
+            user=mock_user,
+            cursor="page-token",
+        )
+
+        assert result.items == []
+        assert result.next_cursor is None
+        assert mock_order_adapter.list_reports.call_args.kwargs["cursor"] == "page-token"
+        assert mock_inventory_adapter.list_reports.call_args.kwargs["cursor"] == "page-token"
+
+    @pytest.mark.asyncio
+    async def test_list_reports_cursor_ignores_offset(
+        self, mock_user, mock_order_adapter, mock_inventory_adapter
+    ):
+        """Test that an offset sent along with a cursor is not applied."""
+        empty = PaginatedReportsResponse(
+            items=[], total=0, page=1, size=0, has_next=False, has_previous=False
+        )
+        mock_order_adapter.list_reports = AsyncMock(return_value=empty)
+
+        await list_reports(
+            limit=10,
+            offset=20,
+            status=None,
+            report_type="orders_per_seller",
+            order_reports=mock_order_adapter,
+            inventory_reports=mock_inventory_adapter,
+            user=mock_user,
+            cursor="page-token",
+        )
+
+        call_kwargs = mock_order_adapter.list_reports.call_args.kwargs
+        assert call_kwargs["cursor"] == "page-token"
+        assert call_kwargs["offset"] == 0
+
+
 class TestGetReport:
     """Test get_report controller function."""
 
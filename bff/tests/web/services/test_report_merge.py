@@ -0,0 +1,146 @@
+"""Unit tests for the merged report pagination service."""
+
+import base64
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+from uuid import uuid4
+
+import pytest
+
+from web.schemas.report_schemas import PaginatedReportsResponse, ReportResponse
+from web.services.report_merge import encode_report_cursor, merge_report_pages
+
+
+def _report(created_at: datetime, report_type: str) -> ReportResponse:
+    return ReportResponse(
+        id=uuid4(),
+        report_type=report_type,
+        status="completed",
+        created_at=created_at,
+        start_date=datetime(2025, 1, 1),
+        end_date=datetime(2025, 1, 31),
+    )
+
+
+def _decode(cursor: str):
+    raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+    created_at, report_id = raw.split("|")
+    return datetime.fromisoformat(created_at), report_id
+
+
+class FakeReportService:
+    """In-memory listing with the microservices' keyset semantics."""
+
+    def __init__(self, reports: List[ReportResponse]):
+        self.reports = sorted(reports, key=lambda r: (r.created_at, r.id), reverse=True)
+        self.calls: List[tuple] = []
+
+    async def fetch(self, limit: int, cursor: Optional[str]) -> PaginatedReportsResponse:
+        self.calls.append((limit, cursor))
+        rows = self.reports
+        if cursor:
+            created_at, report_id = _decode(cursor)
+            rows = [r for r in rows if (r.created_at, str(r.id)) < (created_at, report_id)]
+        items = rows[:limit]
+        return PaginatedReportsResponse(
+            items=items,
+            total=len(self.reports),
+            page=1,
+            size=len(items),
+            has_next=len(rows) > limit,
+            has_previous=cursor is not None,
+            next_cursor=encode_report_cursor(items[-1]) if len(items) == limit else None,
+        )
+
+
+def _services(order_count: int = 7, inventory_count: int = 5):
+    base = datetime(2025, 2, 1, tzinfo=timezone.utc)
+    order = FakeReportService(
+        [_report(base + timedelta(hours=2 * i), "orders_per_seller") for i in range(order_count)]
+    )
+    inventory = FakeReportService(
+        [_report(base + timedelta(hours=2 * i + 1), "low_stock") for i in range(inventory_count)]
+    )
+    expected = sorted(
+        order.reports + inventory.reports, key=lambda r: r.created_at, reverse=True
+    )
+    return order, inventory, expected
+
+
+class TestMergeReportPages:
+    @pytest.mark.asyncio
+    async def test_offset_pages_match_global_order(self):
+        order, inventory, expected = _services()
+        sources = [("Order", order.fetch), ("Inventory", inventory.fetch)]
+
+        pages = [
+            await merge_report_pages(sources, limit=5, offset=offset) for offset in (0, 5, 10)
+        ]
+
+        assert [r.id for page in pages for r in page.items] == [r.id for r in expected]
+        assert [page.has_next for page in pages] == [True, True, False]
+        assert all(page.total == 12 for page in pages)
+        assert pages[1].page == 2
+
+    @pytest.mark.asyncio
+    async def test_cursor_walk_returns_every_report_once(self):
+        order, inventory, expected = _services()
+        sources = [("Order", order.fetch), ("Inventory", inventory.fetch)]
+
+        seen = []
+        cursor = None
+        while True:
+            page = await merge_report_pages(sources, limit=4, cursor=cursor)
+            seen.extend(page.items)
+            if not page.has_next:
+                break
+            cursor = page.next_cursor
+
+        assert [r.id for r in seen] == [r.id for r in expected]
+
+    @pytest.mark.asyncio
+    async def test_cursor_page_fetches_at_most_limit_per_service(self):
+        order, inventory, _ = _services(order_count=50, inventory_count=50)
+        sources = [("Order", order.fetch), ("Inventory", inventory.fetch)]
+
+        first = await merge_report_pages(sources, limit=10)
+        order.calls.clear()
+        inventory.calls.clear()
+        await merge_report_pages(sources, limit=10, cursor=first.next_cursor)
+
+        assert order.calls == [(10, first.next_cursor)]
+        assert inventory.calls == [(10, first.next_cursor)]
+
+    @pytest.mark.asyncio
+    async def test_source_is_refilled_only_when_merge_needs_it(self):
+        # Every order report is newer than every inventory report
+        base = datetime(2025, 2, 1, tzinfo=timezone.utc)
+        order = FakeReportService(
+            [_report(base + timedelta(days=10, hours=i), "orders_per_seller") for i in range(12)]
+        )
+        inventory = FakeReportService(
+            [_report(base + timedelta(hours=i), "low_stock") for i in range(12)]
+        )
+        sources = [("Order", order.fetch), ("Inventory", inventory.fetch)]
+
+        page = await merge_report_pages(sources, limit=5, offset=5)
+
+        assert all(r.report_type == "orders_per_seller" for r in page.items)
+        assert len(order.calls) == 1
+        assert len(inventory.calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_failing_source_is_skipped(self):
+        order, inventory, _ = _services()
+
+        async def broken(limit, cursor):
+            raise RuntimeError("down")
+
+        page = await merge_report_pages(
+            [("Order", broken), ("Inventory", inventory.fetch)], limit=10
+        )
+
+        assert page.total == 5
+        assert [r.id for r in page.items] == [r.id for r in inventory.reports]
+        assert page.has_next is False
+        assert page.next_cursor is None
@@ -72,13 +72,16 @@ class CatalogAdapter(CatalogPort):
         return BatchProductsResponse(**response_data)
 
     async def get_products(
-        self, limit: int = 10, offset: int = 0
+        self, limit: int = 10, offset: int = 0, cursor: Optional[str] = None
     ) -> PaginatedProductsResponse:
         """Retrieve a paginated list of products."""
-        logger.info(f"Getting products: limit={limit}, offset={offset}")
+        logger.info(f"Getting products: limit={limit}, offset={offset}, cursor={cursor}")
+        params = {"limit": limit, "offset": offset}
+        if cursor:
+            params["cursor"] = cursor
         response_data = await self.client.get(
             "/catalog/products",
-            params={"limit": limit, "offset": offset},
+            params=params,
         )
         return PaginatedProductsResponse(**response_data)
 
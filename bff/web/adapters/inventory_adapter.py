@@ -83,14 +83,17 @@ class InventoryAdapter(InventoryPort):
         offset: int = 0,
         sku: Optional[str] = None,
         warehouse_id: Optional[UUID] = None,
+        cursor: Optional[str] = None,
     ) -> PaginatedInventoriesResponse:
         """Retrieve a paginated list of inventories with optional filters."""
-        logger.info(f"Getting inventories: limit={limit}, offset={offset}, sku={sku}, warehouse_id={warehouse_id}")
+        logger.info(f"Getting inventories: limit={limit}, offset={offset}, sku={sku}, warehouse_id={warehouse_id}, cursor={cursor}")
         params = {"limit": limit, "offset": offset}
         if sku:
             params["sku"] = sku
         if warehouse_id:
             params["warehouse_id"] = str(warehouse_id)
+        if cursor:
+            params["cursor"] = cursor
 
         response_data = await self.client.get(
             "/inventory/inventories",
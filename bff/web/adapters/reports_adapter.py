@@ -54,6 +54,7 @@ class OrderReportsAdapter(ReportsPort):
         offset: int = 0,
         status: Optional[ReportStatus] = None,
         report_type: Optional[ReportType] = None,
+        cursor: Optional[str] = None,
     ) -> PaginatedReportsResponse:
         """List reports from Order microservice."""
         logger.info(f"Listing reports from Order service for user {user_id}")
@@ -64,6 +65,8 @@ class OrderReportsAdapter(ReportsPort):
             params["status"] = status.value
         if report_type:
             params["report_type"] = report_type.value
+        if cursor:
+            params["cursor"] = cursor
 
         response = await self.http_client.get("/order/reports", params=params)
 
@@ -115,6 +118,7 @@ class InventoryReportsAdapter(ReportsPort):
         offset: int = 0,
         status: Optional[ReportStatus] = None,
         report_type: Optional[ReportType] = None,
+        cursor: Optional[str] = None,
     ) -> PaginatedReportsResponse:
         """List reports from Inventory microservice."""
         logger.info(f"Listing reports from Inventory service for user {user_id}")
@@ -125,6 +129,8 @@ class InventoryReportsAdapter(ReportsPort):
             params["status"] = status.value
         if report_type:
             params["report_type"] = report_type.value
+        if cursor:
+            params["cursor"] = cursor
 
         response = await self.http_client.get("/inventory/reports", params=params)
 
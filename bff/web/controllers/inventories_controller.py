@@ -114,6 +114,7 @@ async def get_inventories(
     warehouse_id: Optional[UUID] = Query(None),
     inventory: InventoryPort = Depends(get_inventory_port),
     user: Dict = Depends(require_web_user),
+    cursor: Optional[str] = None,
 ):
     """
     Retrieve inventories from the inventory microservice with optional filters.
@@ -124,14 +125,16 @@ async def get_inventories(
         sku: Optional product SKU filter
         warehouse_id: Optional warehouse ID filter
         inventory: Inventory port for service communication
+        cursor: next_cursor of the previous page; pages by keyset instead of offset
 
     Returns:
         Paginated list of inventories (with denormalized product and warehouse data)
     """
-    logger.info(f"Request: GET /inventories: limit={limit}, offset={offset}, sku={sku}, warehouse_id={warehouse_id}")
+    logger.info(f"Request: GET /inventories: limit={limit}, offset={offset}, sku={sku}, warehouse_id={warehouse_id}, cursor={cursor}")
     return await inventory.get_inventories(
         limit=limit,
         offset=offset,
         sku=sku,
         warehouse_id=warehouse_id,
+        cursor=cursor,
     )
@@ -6,7 +6,7 @@ for communication with the catalog microservice.
 """
 
 import logging
-from typing import Dict
+from typing import Dict, Optional
 
 from fastapi import APIRouter, Depends, File, Query, UploadFile, status
 
@@ -114,6 +114,7 @@ async def get_products(
     offset: int = Query(0, ge=0),
     catalog: CatalogPort = Depends(get_catalog_port),
     user: Dict = Depends(require_web_user),
+    cursor: Optional[str] = None,
 ):
     """
     Retrieve products from the catalog microservice.
@@ -122,9 +123,10 @@ async def get_products(
         limit: Maximum number of products to return (1-100)
         offset: Number of products to skip
         catalog: Catalog port for service communication
+        cursor: next_cursor of the previous page; pages by keyset instead of offset
 
     Returns:
         Paginated list of products
     """
-    logger.info(f"Request: GET /products: limit={limit}, offset={offset}")
-    return await catalog.get_products(limit=limit, offset=offset)
+    logger.info(f"Request: GET /products: limit={limit}, offset={offset}, cursor={cursor}")
+    return await catalog.get_products(limit=limit, offset=offset, cursor=cursor)
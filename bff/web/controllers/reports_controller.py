@@ -1,6 +1,5 @@
 """Reports controller for BFF."""
 
-import asyncio
 import logging
 from typing import Dict, Optional
 from uuid import UUID
@@ -13,6 +12,7 @@ from common.exceptions import MicroserviceError, MicroserviceHTTPError, Resource
 from dependencies import get_inventory_reports_adapter, get_order_reports_adapter
 
 from ..adapters.reports_adapter import InventoryReportsAdapter, OrderReportsAdapter
+from ..ports.reports_port import ReportsPort
 from ..schemas.report_schemas import (
     PaginatedReportsResponse,
     ReportCreateRequest,
@@ -21,6 +21,7 @@ from ..schemas.report_schemas import (
     ReportStatus,
     ReportType,
 )
+from ..services.report_merge import merge_report_pages
 
 logger = logging.getLogger(__name__)
 
@@ -110,20 +111,25 @@ async def list_reports(
     order_reports: OrderReportsAdapter = Depends(get_order_reports_adapter),
     inventory_reports: InventoryReportsAdapter = Depends(get_inventory_reports_adapter),
     user: Dict = Depends(require_web_user),
+    cursor: Optional[str] = None,
 ):
     """
     List all reports for the authenticated user.
 
-    Aggregates reports from Order and Inventory microservices.
+    Aggregates reports from Order and Inventory microservices, newest first.
+    Without a type filter both listings are merged page by page; pass the
+    previous page's ``next_cursor`` as ``cursor`` to continue cheaply
+    instead of using a growing offset.
 
     Args:
         limit: Maximum number of reports to return
-        offset: Number of reports to skip
+        offset: Number of reports to skip (ignored when cursor is given)
         status: Optional status filter
         report_type: Optional report type filter
         order_reports: Order reports adapter (injected)
         inventory_reports: Inventory reports adapter (injected)
         user: Authenticated user (from JWT)
+        cursor: next_cursor of the previous page
 
     Returns:
         PaginatedReportsResponse with list of reports
@@ -131,6 +137,10 @@ async def list_reports(
     user_id = UUID(user["sub"])
     logger.info(f"Listing reports for user {user_id}")
 
+    if cursor:
+        # The cursor marks the position; an offset on top would skip reports
+        offset = 0
+
     try:
         # Parse filters
         status_filter = ReportStatus(status) if status else None
@@ -145,6 +155,7 @@ async def list_reports(
                 offset=offset,
                 status=status_filter,
                 report_type=type_filter,
+                cursor=cursor,
             )
             return response
 
@@ -156,65 +167,30 @@ async def list_reports(
                 offset=offset,
                 status=status_filter,
                 report_type=type_filter,
+                cursor=cursor,
             )
             return response
 
         else:
-            # No type filter - aggregate from both microservices
-            # Query both in parallel
-            order_task = order_reports.list_reports(
-                user_id=user_id,
-                limit=limit,
-                offset=offset,
-                status=status_filter,
-                report_type=None,
-            )
-            inventory_task = inventory_reports.list_reports(
-                user_id=user_id,
+            # No type filter - k-way merge of both microservices' listings
+            def source(adapter: ReportsPort):
+                def fetch(chunk_limit: int, chunk_cursor: Optional[str]):
+                    return adapter.list_reports(
+                        user_id=user_id,
+                        limit=chunk_limit,
+                        offset=0,
+                        status=status_filter,
+                        report_type=None,
+                        cursor=chunk_cursor,
+                    )
+
+                return fetch
+
+            return await merge_report_pages(
+                [("Order", source(order_reports)), ("Inventory", source(inventory_reports))],
                 limit=limit,
                 offset=offset,
-                status=status_filter,
-                report_type=None,
-            )
-
-            order_response, inventory_response = await asyncio.gather(
-                order_task, inventory_task, return_exceptions=True
-            )
-
-            # Handle errors gracefully
-            all_items = []
-            total = 0
-
-            if isinstance(order_response, Exception):
-                logger.error(f"Order service error: {order_response}")
-            else:
-                all_items.extend(order_response.items)
-                total += order_response.total
-
-            if isinstance(inventory_response, Exception):
-                logger.error(f"Inventory service error: {inventory_response}")
-            else:
-                all_items.extend(inventory_response.items)
-                total += inventory_response.total
-
-            # Sort by created_at DESC
-            all_items.sort(key=lambda x: x.created_at, reverse=True)
-
-            # Apply pagination to aggregated results
-            paginated_items = all_items[offset : offset + limit]
-
-            # Calculate pagination
-            page = (offset // limit) + 1 if limit > 0 else 1
-            has_next = (offset + limit) < total
-            has_previous = offset > 0
-
-            return PaginatedReportsResponse(
-                items=paginated_items,
-                total=total,
-                page=page,
-                size=len(paginated_items),
-                has_next=has_next,
-                has_previous=has_previous,
+                cursor=cursor,
             )
 
     except Exception as e:
@@ -86,7 +86,7 @@ class CatalogPort(ABC):
 
     @abstractmethod
     async def get_products(
-        self, limit: int = 10, offset: int = 0
+        self, limit: int = 10, offset: int = 0, cursor: Optional[str] = None
     ) -> PaginatedProductsResponse:
         """
         Retrieve a paginated list of products.
@@ -94,6 +94,7 @@ class CatalogPort(ABC):
         Args:
             limit: Maximum number of products to return
             offset: Number of products to skip
+            cursor: next_cursor of the previous page (keyset pagination)
 
         Returns:
             PaginatedProductsResponse with product data
@@ -98,6 +98,7 @@ class InventoryPort(ABC):
         offset: int = 0,
         sku: Optional[str] = None,
         warehouse_id: Optional[UUID] = None,
+        cursor: Optional[str] = None,
     ) -> PaginatedInventoriesResponse:
         """
         Retrieve a paginated list of inventories with optional filters.
@@ -107,6 +108,7 @@ class InventoryPort(ABC):
             offset: Number of inventories to skip
             sku: Optional product SKU filter
             warehouse_id: Optional warehouse ID filter
+            cursor: next_cursor of the previous page (keyset pagination)
 
         Returns:
             PaginatedInventoriesResponse with inventory data
@@ -41,9 +41,10 @@ class ReportsPort(ABC):
         offset: int = 0,
         status: Optional[ReportStatus] = None,
         report_type: Optional[ReportType] = None,
+        cursor: Optional[str] = None,
     ) -> PaginatedReportsResponse:
         """
-        List reports for a user.
+        List reports for a user, newest first by (created_at, id).
 
         Args:
             user_id: User UUID
@@ -51,6 +52,7 @@ class ReportsPort(ABC):
             offset: Number to skip
             status: Optional status filter
             report_type: Optional type filter
+            cursor: ``next_cursor`` of a previous page to continue after
 
         Returns:
             Paginated reports response
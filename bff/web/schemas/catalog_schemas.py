@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 from pydantic import BaseModel, EmailStr, Field
 
@@ -75,8 +75,9 @@ class PaginatedProvidersResponse(BaseModel):
 
 class PaginatedProductsResponse(BaseModel):
     items: List[ProductResponse]
-    total: int
+    total: Optional[int]  # None on cursor pages or when include_total=false
     page: int
     size: int
     has_next: bool
     has_previous: bool
+    next_cursor: Optional[str] = None  # Pass as ``cursor`` to continue after this page
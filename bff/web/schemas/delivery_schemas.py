@@ -26,6 +26,9 @@ class RouteGenerationResponse(BaseModel):
     fecha_entrega_estimada: date
     num_vehicles: int
     num_pending_shipments: int
+    job_id: Optional[UUID] = None
+    job_status: Optional[str] = None
+    deduplicated: bool = False
 
 
 class RouteStatusUpdateRequest(BaseModel):
@@ -85,11 +85,12 @@ class InventoryResponse(BaseModel):
 
 class PaginatedInventoriesResponse(BaseModel):
     items: List[InventoryResponse]
-    total: int
+    total: Optional[int]  # None on cursor pages or when include_total=false
     page: int
     size: int
     has_next: bool
     has_previous: bool
+    next_cursor: Optional[str] = None  # Pass as ``cursor`` to continue after this page
 
 
 # Report schemas
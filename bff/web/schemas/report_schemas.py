@@ -72,3 +72,4 @@ class PaginatedReportsResponse(BaseModel):
     size: int
     has_next: bool
     has_previous: bool
+    next_cursor: Optional[str] = None  # Pass as ``cursor`` to continue after this page
@@ -1,3 +1,4 @@
 from .csv_parser import CsvParserService
+from .report_merge import encode_report_cursor, merge_report_pages
 
-__all__ = ["CsvParserService"]
+__all__ = ["CsvParserService", "encode_report_cursor", "merge_report_pages"]
@@ -0,0 +1,160 @@
+"""
+Merged pagination over report listings from several microservices.
+
+Order and Inventory each list a user's reports ordered by
+(created_at, id) DESC and accept a keyset cursor for that same key. This
+service runs a streaming k-way merge over those listings: each source is
+read in chunks, only when the merge needs its next report, so a page costs
+about ``limit`` rows per service instead of everything before it.
+
+A merged page's ``next_cursor`` is simply the key of its last report, which
+every source understands, so cursor pages need no per-source state.
+"""
+
+import asyncio
+import base64
+import logging
+from collections import deque
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Deque, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from ..schemas.report_schemas import PaginatedReportsResponse, ReportResponse
+
+logger = logging.getLogger(__name__)
+
+# Fetches one chunk from a source: (limit, cursor) -> page
+ReportPageFetcher = Callable[[int, Optional[str]], Awaitable[PaginatedReportsResponse]]
+
+# Largest page the microservices accept
+MAX_SOURCE_CHUNK = 100
+
+
+def encode_report_cursor(report: ReportResponse) -> str:
+    """Encode a report's listing key in the format the microservices accept."""
+    raw = f"{report.created_at.isoformat()}|{report.id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _sort_key(report: ReportResponse) -> Tuple[datetime, UUID]:
+    created_at = report.created_at
+    if created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=timezone.utc)
+    return created_at, report.id
+
+
+class _ReportSource:
+    """Buffered, lazily refilled reader over one service's report listing."""
+
+    def __init__(self, name: str, fetch: ReportPageFetcher, chunk_size: int):
+        self.name = name
+        self._fetch = fetch
+        self._chunk_size = chunk_size
+        self._buffer: Deque[ReportResponse] = deque()
+        self._next_cursor: Optional[str] = None
+        self._exhausted = False
+        self.total = 0
+        self.fetches = 0
+
+    async def start(self, cursor: Optional[str]) -> None:
+        """Fetch the first chunk; a failing source is logged and treated as empty."""
+        try:
+            page = await self._fetch(self._chunk_size, cursor)
+        except Exception as e:
+            logger.error(f"{self.name} service error listing reports: {e}")
+            self._exhausted = True
+            return
+        self.total = page.total
+        self._accept(page)
+
+    async def head(self) -> Optional[ReportResponse]:
+        """Next report in listing order, fetching another chunk if needed."""
+        if not self._buffer and not self._exhausted:
+            try:
+                self._accept(await self._fetch(self._chunk_size, self._next_cursor))
+            except Exception as e:
+                logger.error(f"{self.name} service error continuing report listing: {e}")
+                self._exhausted = True
+        return self._buffer[0] if self._buffer else None
+
+    def pop(self) -> ReportResponse:
+        return self._buffer.popleft()
+
+    @property
+    def may_have_more(self) -> bool:
+        return bool(self._buffer) or not self._exhausted
+
+    def _accept(self, page: PaginatedReportsResponse) -> None:
+        self.fetches += 1
+        self._buffer.extend(page.items)
+        self._next_cursor = page.next_cursor
+        if not page.next_cursor or len(page.items) < self._chunk_size:
+            self._exhausted = True
+
+
+async def merge_report_pages(
+    sources: Sequence[Tuple[str, ReportPageFetcher]],
+    limit: int,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+) -> PaginatedReportsResponse:
+    """
+    Build one page of the merged report listing.
+
+    Args:
+        sources: (name, fetcher) per microservice
+        limit: Page size
+        offset: Merged reports to skip (ignored when ``cursor`` is given)
+        cursor: ``next_cursor`` of the previous merged page
+
+    Returns:
+        Merged page; ``total`` is the sum of the services' counts
+    """
+    if cursor:
+        offset = 0
+    chunk_size = min(offset + limit, MAX_SOURCE_CHUNK)
+
+    readers = [_ReportSource(name, fetch, chunk_size) for name, fetch in sources]
+    await asyncio.gather(*(reader.start(cursor) for reader in readers))
+
+    items: List[ReportResponse] = []
+    skipped = 0
+    while len(items) < limit:
+        best: Optional[_ReportSource] = None
+        best_key = None
+        for reader in readers:
+            head = await reader.head()
+            if head is None:
+                continue
+            key = _sort_key(head)
+            if best_key is None or key > best_key:
+                best, best_key = reader, key
+        if best is None:
+            break
+
+        report = best.pop()
+        if skipped < offset:
+            skipped += 1
+        else:
+            items.append(report)
+
+    total = sum(reader.total for reader in readers)
+    if cursor:
+        has_next = len(items) == limit and any(reader.may_have_more for reader in readers)
+    else:
+        has_next = offset + len(items) < total
+
+    logger.debug(
+        "Merged report page: "
+        + ", ".join(f"{reader.name}={reader.fetches} fetch(es)" for reader in readers)
+    )
+
+    return PaginatedReportsResponse(
+        items=items,
+        total=total,
+        page=(offset // limit) + 1 if limit > 0 else 1,
+        size=len(items),
+        has_next=has_next,
+        has_previous=offset > 0 or cursor is not None,
+        next_cursor=encode_report_cursor(items[-1]) if has_next and items else None,
+    )
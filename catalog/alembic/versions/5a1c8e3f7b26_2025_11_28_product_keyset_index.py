@@ -0,0 +1,28 @@
+"""2025_11_28_product_keyset_index
+
+Revision ID: 5a1c8e3f7b26
+Revises: bb3e2f8e0d0b
+Create Date: 2025-11-28 09:50:03.447219
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5a1c8e3f7b26'
+down_revision: Union[str, Sequence[str], None] = 'bb3e2f8e0d0b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('idx_products_name_id', 'products', ['name', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_products_name_id', table_name='products')
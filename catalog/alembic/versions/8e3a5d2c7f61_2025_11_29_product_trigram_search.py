@@ -0,0 +1,48 @@
+"""2025_11_29_product_trigram_search
+
+Revision ID: 8e3a5d2c7f61
+Revises: 5a1c8e3f7b26
+Create Date: 2025-11-29 10:18:44.129375
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e3a5d2c7f61'
+down_revision: Union[str, Sequence[str], None] = '5a1c8e3f7b26'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute("CREATE EXTENSION IF NOT EXISTS unaccent")
+    # unaccent() is only STABLE, so index expressions need an IMMUTABLE wrapper
+    # that pins the dictionary
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION f_unaccent(text) RETURNS text
+        LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT
+        AS $$ SELECT public.unaccent('public.unaccent'::regdictionary, $1) $$
+        """
+    )
+    op.execute(
+        "CREATE INDEX idx_products_name_trgm ON products "
+        "USING gin (f_unaccent(lower(name)) gin_trgm_ops)"
+    )
+    op.execute(
+        "CREATE INDEX idx_products_sku_trgm ON products "
+        "USING gin (lower(sku) gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_products_sku_trgm', table_name='products')
+    op.drop_index('idx_products_name_trgm', table_name='products')
+    op.execute("DROP FUNCTION IF EXISTS f_unaccent(text)")
@@ -3,6 +3,7 @@
 No business logic, no validation, no try/catch.
 All exceptions are handled by global exception handlers.
 """
+from typing import Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Query, status
@@ -14,16 +15,19 @@ from src.adapters.input.schemas import (
     NotFoundErrorResponse,
     PaginatedProductsResponse,
     ProductResponse,
+    ProductSearchResponse,
     ValidationErrorResponse,
 )
 from src.application.use_cases.create_products import CreateProductsUseCase
 from src.application.use_cases.get_product import GetProductUseCase
 from src.application.use_cases.list_products import ListProductsUseCase
+from src.application.use_cases.search_products import SearchProductsUseCase
 from src.domain.exceptions import ProductNotFoundException
 from src.infrastructure.dependencies import (
     get_create_products_use_case,
     get_get_product_use_case,
     get_list_products_use_case,
+    get_search_products_use_case,
 )
 
 router = APIRouter(tags=["products"])
@@ -87,6 +91,8 @@ async def create_products(
 async def list_products(
     limit: int = Query(10, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    include_total: bool = Query(True, description="Count all products (first page only)"),
     use_case: ListProductsUseCase = Depends(get_list_products_use_case)
 ):
     """List products - THIN controller.
@@ -96,18 +102,25 @@ async def list_products(
     Args:
         limit: Maximum number of results
         offset: Number to skip
+        cursor: Continue after a previous page by keyset instead of offset
+        include_total: Whether to count all products
         use_case: Injected use case
 
     Returns:
         Paginated products response
     """
     # Delegate to use case
-    products, total = await use_case.execute(limit=limit, offset=offset)
+    products, total, next_cursor = await use_case.execute(
+        limit=limit, offset=offset, cursor=cursor, include_total=include_total
+    )
 
-    # Calculate pagination metadata
+    # Calculate pagination metadata (without a total, has_next comes from the cursor)
     page = (offset // limit) + 1
-    has_next = (offset + limit) < total
-    has_previous = offset > 0
+    if total is not None:
+        has_next = (offset + limit) < total
+    else:
+        has_next = next_cursor is not None
+    has_previous = offset > 0 or cursor is not None
 
     # Map domain entities to DTOs
     return PaginatedProductsResponse(
@@ -120,6 +133,41 @@ async def list_products(
         size=len(products),
         has_next=has_next,
         has_previous=has_previous,
+        next_cursor=next_cursor if has_next else None,
+    )
+
+
+@router.get(
+    "/products/search",
+    response_model=ProductSearchResponse,
+    responses={
+        200: {"description": "Products matching the query, best match first"},
+        422: {"description": "Invalid query parameters", "model": ValidationErrorResponse},
+    },
+)
+async def search_products(
+    q: str = Query(..., min_length=3, max_length=100, description="Product name or SKU text"),
+    limit: int = Query(10, ge=1, le=50),
+    use_case: SearchProductsUseCase = Depends(get_search_products_use_case)
+):
+    """Search-as-you-type on product name or SKU - THIN controller.
+
+    Matching ignores case and accents and tolerates small typos.
+
+    Args:
+        q: Text typed by the user
+        limit: Maximum number of results
+        use_case: Injected use case
+
+    Returns:
+        Matching products, best match first
+    """
+    products = await use_case.execute(query=q, limit=limit)
+    return ProductSearchResponse(
+        items=[
+            ProductResponse.model_validate(product, from_attributes=True)
+            for product in products
+        ]
     )
 
 
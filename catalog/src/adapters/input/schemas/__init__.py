@@ -17,6 +17,7 @@ from .product_schemas import (
     ProductCreate,
     ProductError,
     ProductResponse,
+    ProductSearchResponse,
 )
 
 __all__ = [
@@ -26,6 +27,7 @@ __all__ = [
     "ProductCreate",
     "ProductResponse",
     "PaginatedProductsResponse",
+    "ProductSearchResponse",
     "BatchProductsRequest",
     "BatchProductsResponse",
     "BatchProductsErrorResponse",
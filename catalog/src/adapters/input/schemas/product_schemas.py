@@ -79,8 +79,13 @@ class BatchProductsErrorResponse(BaseModel):
 
 class PaginatedProductsResponse(BaseModel):
     items: List[ProductResponse]
-    total: int
+    total: Optional[int]  # None on cursor pages or when include_total=false
     page: int
     size: int
     has_next: bool
     has_previous: bool
+    next_cursor: Optional[str] = None  # Pass as ``cursor`` to continue after this page
+
+
+class ProductSearchResponse(BaseModel):
+    items: List[ProductResponse]  # Best match first
@@ -2,18 +2,24 @@ import logging
 from typing import List, Optional, Set, Tuple
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import func, literal, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import joinedload
 
 from src.application.ports.product_repository_port import ProductRepositoryPort
 from src.domain.entities.product import Product as DomainProduct
+from src.domain.value_objects import ProductCursor
 from src.infrastructure.database.models import Product as ORMProduct, Provider as ORMProvider
 
 logger = logging.getLogger(__name__)
 
 
+def _search_key(column):
+    """Accent- and case-folded column, as indexed by the pg_trgm GIN index."""
+    return func.f_unaccent(func.lower(column))
+
+
 class ProductRepository(ProductRepositoryPort):
     """Implementation of ProductRepositoryPort for PostgreSQL."""
 
@@ -105,17 +111,36 @@ class ProductRepository(ProductRepositoryPort):
         return set(existing_skus)
 
     async def list_products(
-        self, limit: int = 10, offset: int = 0
-    ) -> Tuple[List[DomainProduct], int]:
-        """List products and return domain entities."""
-        logger.debug(f"DB: Listing products with limit={limit}, offset={offset}")
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        after: Optional[ProductCursor] = None,
+        include_total: bool = True,
+    ) -> Tuple[List[DomainProduct], Optional[int]]:
+        """List products ordered by (name, id) and return domain entities.
+
+        ``after`` seeks past a cursor on that key instead of skipping rows.
+        """
+        logger.debug(f"DB: Listing products with limit={limit}, offset={offset}, after={after}")
         # Get total count
-        count_stmt = select(func.count()).select_from(ORMProduct)
-        count_result = await self.session.execute(count_stmt)
-        total = count_result.scalar()
+        total = None
+        if include_total:
+            count_stmt = select(func.count()).select_from(ORMProduct)
+            count_result = await self.session.execute(count_stmt)
+            total = count_result.scalar()
 
         # Get paginated data with provider join
-        stmt = select(ORMProduct).options(joinedload(ORMProduct.provider)).limit(limit).offset(offset)
+        stmt = select(ORMProduct).options(joinedload(ORMProduct.provider))
+        if after:
+            # The leading range bound lets the index seek; the OR only
+            # breaks ties on name
+            stmt = stmt.where(
+                ORMProduct.name >= after.name,
+                or_(ORMProduct.name > after.name, ORMProduct.id > after.id),
+            )
+        stmt = stmt.order_by(ORMProduct.name, ORMProduct.id).limit(limit)
+        if not after:
+            stmt = stmt.offset(offset)
         result = await self.session.execute(stmt)
         orm_products = result.scalars().all()
 
@@ -125,6 +150,39 @@ class ProductRepository(ProductRepositoryPort):
 
         return domain_products, total
 
+    async def search_products(self, term: str, limit: int = 10) -> List[DomainProduct]:
+        """Trigram search on name and SKU, ranked by similarity.
+
+        Substring matches and close (typo) matches on the name both qualify;
+        the pg_trgm GIN indexes serve both, so no sequential scan is needed.
+        """
+        logger.debug(f"DB: Searching products: term={term}, limit={limit}")
+        name_key = _search_key(ORMProduct.name)
+        sku_key = func.lower(ORMProduct.sku)
+        rank = func.greatest(
+            func.word_similarity(term, name_key), func.similarity(term, sku_key)
+        )
+
+        stmt = (
+            select(ORMProduct)
+            .options(joinedload(ORMProduct.provider))
+            .where(
+                or_(
+                    name_key.contains(term, autoescape=True),
+                    sku_key.contains(term, autoescape=True),
+                    literal(term).op("<%")(name_key),
+                )
+            )
+            .order_by(rank.desc(), ORMProduct.name, ORMProduct.id)
+            .limit(limit)
+        )
+        result = await self.session.execute(stmt)
+        orm_products = result.scalars().all()
+
+        domain_products = [self._to_domain(orm) for orm in orm_products]
+        logger.debug(f"DB: Product search found {len(domain_products)} products")
+        return domain_products
+
     @staticmethod
     def _to_domain(orm_product: ORMProduct) -> DomainProduct:
         """Map ORM model to domain entity."""
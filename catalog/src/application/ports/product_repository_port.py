@@ -4,6 +4,7 @@ from typing import List, Optional, Set, Tuple
 from uuid import UUID
 
 from src.domain.entities.product import Product
+from src.domain.value_objects import ProductCursor
 
 
 class ProductRepositoryPort(ABC):
@@ -66,15 +67,34 @@ class ProductRepositoryPort(ABC):
 
     @abstractmethod
     async def list_products(
-        self, limit: int = 10, offset: int = 0
-    ) -> Tuple[List[Product], int]:
-        """List products with pagination.
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        after: Optional[ProductCursor] = None,
+        include_total: bool = True,
+    ) -> Tuple[List[Product], Optional[int]]:
+        """List products with pagination, ordered by (name, id).
 
         Args:
             limit: Maximum number of products to return
             offset: Number of products to skip
+            after: Only return products past this cursor in listing order
+            include_total: Whether to run the count query
 
         Returns:
-            Tuple of (list of products, total count)
+            Tuple of (list of products, total count or None if not requested)
+        """
+        ...  # pragma: no cover
+
+    @abstractmethod
+    async def search_products(self, term: str, limit: int = 10) -> List[Product]:
+        """Find products whose name or SKU matches a search term.
+
+        Args:
+            term: Lowercase, accent-free search text
+            limit: Maximum number of products to return
+
+        Returns:
+            Matching products, best match first
         """
         ...  # pragma: no cover
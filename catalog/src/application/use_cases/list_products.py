@@ -1,20 +1,44 @@
 import logging
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from src.application.ports.product_repository_port import ProductRepositoryPort
 from src.domain.entities.product import Product
+from src.domain.value_objects import ProductCursor
 
 logger = logging.getLogger(__name__)
 
 
 class ListProductsUseCase:
+    """List products by (name, id).
+
+    A cursor from a previous page continues the listing by keyset instead of
+    offset; the total is only counted for the first page.
+    """
+
     def __init__(self, repository: ProductRepositoryPort):
         self.repository = repository
 
     async def execute(
-        self, limit: int = 10, offset: int = 0
-    ) -> Tuple[List[Product], int]:
-        logger.debug(f"Listing products: limit={limit}, offset={offset}")
-        products, total = await self.repository.list_products(limit=limit, offset=offset)
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+    ) -> Tuple[List[Product], Optional[int], Optional[str]]:
+        logger.debug(f"Listing products: limit={limit}, offset={offset}, cursor={cursor}")
+        after = ProductCursor.decode(cursor) if cursor else None
+        products, total = await self.repository.list_products(
+            limit=limit,
+            offset=offset,
+            after=after,
+            include_total=include_total and after is None,
+        )
+
+        # A full page may have more after it; a short page is the last one
+        next_cursor = None
+        if products and len(products) == limit:
+            last = products[-1]
+            next_cursor = ProductCursor(name=last.name, id=last.id).encode()
+
         logger.info(f"Retrieved {len(products)} products (total={total})")
-        return products, total
+        return products, total, next_cursor
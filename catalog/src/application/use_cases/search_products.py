@@ -0,0 +1,36 @@
+import logging
+import unicodedata
+from typing import List
+
+from src.application.ports.product_repository_port import ProductRepositoryPort
+from src.domain.entities.product import Product
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_search_term(text: str) -> str:
+    """Fold case, accents and whitespace ("  Catéter  Venoso " -> "cateter venoso").
+
+    Mirrors the ``f_unaccent(lower(...))`` expression the name index is built
+    on, so "cateter" finds "Catéter".
+    """
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(stripped.lower().split())
+
+
+class SearchProductsUseCase:
+    """Ranked substring search on product name or SKU."""
+
+    def __init__(self, repository: ProductRepositoryPort):
+        self.repository = repository
+
+    async def execute(self, query: str, limit: int = 10) -> List[Product]:
+        term = normalize_search_term(query)
+        logger.debug(f"Searching products: term={term}, limit={limit}")
+        if not term:
+            return []
+
+        products = await self.repository.search_products(term=term, limit=limit)
+        logger.info(f"Product search returned {len(products)} products")
+        return products
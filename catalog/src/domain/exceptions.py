@@ -106,3 +106,14 @@ class BatchProductCreationException(ValidationException):
             message=f"Product at index {index} failed validation: {error_message}",
             error_code="BATCH_PRODUCT_CREATION_FAILED"
         )
+
+
+class InvalidProductCursorException(ValidationException):
+    """Product listing cursor could not be parsed."""
+
+    def __init__(self, cursor: str):
+        self.cursor = cursor
+        super().__init__(
+            message="Invalid product cursor",
+            error_code="INVALID_PRODUCT_CURSOR"
+        )
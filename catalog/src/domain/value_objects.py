@@ -0,0 +1,39 @@
+"""Value objects for the Catalog domain."""
+
+import base64
+import binascii
+from dataclasses import dataclass
+from uuid import UUID
+
+from src.domain.exceptions import InvalidProductCursorException
+
+
+@dataclass(frozen=True)
+class ProductCursor:
+    """Keyset position in a product listing ordered by (name, id).
+
+    Encoded as an opaque URL-safe token.
+    """
+
+    name: str
+    id: UUID
+
+    def encode(self) -> str:
+        raw = f"{self.name}|{self.id}".encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "ProductCursor":
+        """Parse a token produced by ``encode``.
+
+        The product name may itself contain ``|``; the id never does.
+
+        Raises:
+            InvalidProductCursorException: If the token is malformed
+        """
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            name, product_id = base64.urlsafe_b64decode(padded).decode().rsplit("|", 1)
+            return cls(name=name, id=UUID(product_id))
+        except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+            raise InvalidProductCursorException(token) from e
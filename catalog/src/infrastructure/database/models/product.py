@@ -3,7 +3,7 @@ from datetime import datetime
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DECIMAL, UUID, DateTime, ForeignKey, String, func
+from sqlalchemy import DECIMAL, UUID, DateTime, ForeignKey, Index, String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base
@@ -14,6 +14,11 @@ if TYPE_CHECKING:
 
 class Product(Base):
     __tablename__ = "products"
+    __table_args__ = (
+        Index("idx_products_name_id", "name", "id"),  # Keyset listing
+        # Search also uses pg_trgm GIN indexes on f_unaccent(lower(name)) and
+        # lower(sku); they are Postgres-only, see migration 8e3a5d2c7f61
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
@@ -10,6 +10,7 @@ from src.application.use_cases.create_products import CreateProductsUseCase
 from src.application.use_cases.create_provider import CreateProviderUseCase
 from src.application.use_cases.get_product import GetProductUseCase
 from src.application.use_cases.list_products import ListProductsUseCase
+from src.application.use_cases.search_products import SearchProductsUseCase
 from src.application.use_cases.list_providers import ListProvidersUseCase
 from src.infrastructure.database.config import get_db
 
@@ -102,6 +103,20 @@ def get_list_products_use_case(
     return ListProductsUseCase(repo)
 
 
+def get_search_products_use_case(
+    repo: ProductRepositoryPort = Depends(get_product_repository)
+) -> SearchProductsUseCase:
+    """Get search products use case with injected dependencies.
+
+    Args:
+        repo: Product repository port
+
+    Returns:
+        SearchProductsUseCase instance
+    """
+    return SearchProductsUseCase(repo)
+
+
 def get_get_product_use_case(
     repo: ProductRepositoryPort = Depends(get_product_repository)
 ) -> GetProductUseCase:
@@ -395,3 +395,47 @@ async def test_get_product_success(db_session):
     assert data["provider_id"] == str(provider.id)
     # Verify provider_name is included
     assert data["provider_name"] == "Test Provider"
+
+
+@pytest.mark.asyncio
+async def test_search_products():
+    from datetime import datetime
+    from decimal import Decimal
+    from unittest.mock import AsyncMock
+    from uuid import uuid4
+
+    from fastapi import FastAPI
+
+    from src.adapters.input.controllers.product_controller import router
+    from src.domain.entities.product import Product as DomainProduct
+    from src.infrastructure.dependencies import get_search_products_use_case
+
+    app = FastAPI()
+    app.include_router(router)
+
+    product = DomainProduct(
+        id=uuid4(),
+        provider_id=uuid4(),
+        provider_name="Test Provider",
+        name="Catéter Venoso",
+        category="insumos_quirurgicos",
+        sku="CAT-001",
+        price=Decimal("12.50"),
+        created_at=datetime.now(),
+        updated_at=datetime.now(),
+    )
+    use_case = AsyncMock()
+    use_case.execute.return_value = [product]
+    app.dependency_overrides[get_search_products_use_case] = lambda: use_case
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.get("/products/search", params={"q": "cateter", "limit": 5})
+        too_short = await client.get("/products/search", params={"q": "ca"})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [item["name"] for item in data["items"]] == ["Catéter Venoso"]
+    use_case.execute.assert_called_once_with(query="cateter", limit=5)
+    assert too_short.status_code == 422
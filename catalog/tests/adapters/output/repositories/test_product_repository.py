@@ -97,6 +97,48 @@ async def test_list_products_pagination(db_session):
     assert total == 10
 
 
+@pytest.mark.asyncio
+async def test_list_products_cursor_ignores_offset(db_session):
+    from src.adapters.output.repositories.provider_repository import (
+        ProviderRepository,
+    )
+    from src.domain.value_objects import ProductCursor
+    from src.infrastructure.database.models import Product
+
+    provider_repo = ProviderRepository(db_session)
+    provider = await provider_repo.create(
+        {
+            "name": "Test Provider",
+            "nit": "123456789",
+            "contact_name": "John Doe",
+            "email": "john@test.com",
+            "phone": "+1234567890",
+            "address": "123 Test St",
+            "country": "US",
+        }
+    )
+
+    repo = ProductRepository(db_session)
+    for i in range(6):
+        db_session.add(
+            Product(
+                provider_id=provider.id,
+                name=f"Product {i}",
+                category=ProductCategory.OTHER.value,
+                sku=f"SKU-CURSOR-OFFSET-{i}",
+                price=100.00 + i,
+            )
+        )
+    await db_session.commit()
+
+    first, _ = await repo.list_products(limit=2)
+    after = ProductCursor(name=first[-1].name, id=first[-1].id)
+
+    # The cursor already marks the position; the offset must not skip more
+    products, _ = await repo.list_products(limit=2, offset=2, after=after)
+    assert [p.name for p in products] == ["Product 2", "Product 3"]
+
+
 @pytest.mark.asyncio
 async def test_batch_create_products_success(db_session):
     """Test batch product creation with transaction support."""
@@ -312,3 +354,25 @@ async def test_find_existing_skus_empty_list(db_session):
     existing = await repo.find_existing_skus([])
 
     assert existing == set()
+
+
+@pytest.mark.asyncio
+async def test_search_products_uses_trigram_index_expressions():
+    from unittest.mock import AsyncMock, MagicMock
+
+    from sqlalchemy.dialects.postgresql import asyncpg
+
+    session = AsyncMock()
+    session.execute.return_value = MagicMock()
+    repo = ProductRepository(session)
+
+    await repo.search_products("cateter_", limit=5)
+
+    compiled = session.execute.call_args[0][0].compile(dialect=asyncpg.dialect())
+    sql = str(compiled)
+    assert "f_unaccent(lower(products.name)) LIKE" in sql
+    assert "lower(products.sku) LIKE" in sql
+    assert "<% f_unaccent(lower(products.name))" in sql
+    assert "ORDER BY greatest(word_similarity(" in sql
+    # LIKE wildcards typed by the user are matched literally
+    assert "cateter/_" in compiled.params.values()
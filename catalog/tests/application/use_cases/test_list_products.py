@@ -9,7 +9,7 @@ async def test_list_products_use_case_empty(db_session):
     repo = ProductRepository(db_session)
     use_case = ListProductsUseCase(repo)
 
-    products, total = await use_case.execute()
+    products, total, next_cursor = await use_case.execute()
 
     assert products == []
     assert total == 0
@@ -51,7 +51,7 @@ async def test_list_products_use_case_with_data(db_session):
     repo = ProductRepository(db_session)
     use_case = ListProductsUseCase(repo)
 
-    products, total = await use_case.execute(limit=3, offset=1)
+    products, total, next_cursor = await use_case.execute(limit=3, offset=1)
 
     assert len(products) == 3
     assert total == 5
@@ -94,10 +94,72 @@ async def test_list_products_use_case_default_pagination(db_session):
     repo = ProductRepository(db_session)
     use_case = ListProductsUseCase(repo)
 
-    products, total = await use_case.execute()
+    products, total, next_cursor = await use_case.execute()
 
     assert len(products) == 10  # Default limit
     assert total == 15
     # Verify provider_name is included
     assert all(hasattr(p, "provider_name") for p in products)
     assert products[0].provider_name == "Test Provider"
+
+
+@pytest.mark.asyncio
+async def test_list_products_use_case_cursor_walk(db_session):
+    from src.adapters.output.repositories.provider_repository import (
+        ProviderRepository,
+    )
+    from src.infrastructure.database.models import Product
+
+    provider_repo = ProviderRepository(db_session)
+    provider = await provider_repo.create(
+        {
+            "name": "Test Provider",
+            "nit": "123456789",
+            "contact_name": "John Doe",
+            "email": "john@test.com",
+            "phone": "+1234567890",
+            "address": "123 Test St",
+            "country": "US",
+        }
+    )
+
+    # Repeated names exercise the id tie-breaker
+    for i, name in enumerate(["Gauze", "Aspirin", "Gauze", "Bandage", "Aspirin"]):
+        db_session.add(
+            Product(
+                provider_id=provider.id,
+                name=name,
+                category="test_category",
+                sku=f"SKU-CURSOR-{i}",
+                price=10.00 + i,
+            )
+        )
+    await db_session.commit()
+
+    use_case = ListProductsUseCase(ProductRepository(db_session))
+    everything, _, _ = await use_case.execute(limit=100)
+
+    seen = []
+    cursor = None
+    while True:
+        products, total, cursor = await use_case.execute(limit=2, cursor=cursor)
+        seen.extend(products)
+        # Only the first page is counted
+        assert total == (5 if len(seen) == 2 else None)
+        if cursor is None:
+            break
+
+    assert [p.id for p in seen] == [p.id for p in everything]
+    assert [p.name for p in everything] == [
+        "Aspirin", "Aspirin", "Bandage", "Gauze", "Gauze"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_list_products_use_case_invalid_cursor(db_session):
+    from src.domain.exceptions import InvalidProductCursorException
+
+    use_case = ListProductsUseCase(ProductRepository(db_session))
+
+    with pytest.raises(InvalidProductCursorException):
+        await use_case.execute(cursor="%%%")
@@ -0,0 +1,38 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.application.use_cases.search_products import (
+    SearchProductsUseCase,
+    normalize_search_term,
+)
+
+
+@pytest.mark.parametrize(
+    "text,expected",
+    [
+        ("Catéter Venoso", "cateter venoso"),
+        ("  JERINGA   desechable ", "jeringa desechable"),
+        ("Gasa Estéril Niño", "gasa esteril nino"),
+    ],
+)
+def test_normalize_search_term(text, expected):
+    assert normalize_search_term(text) == expected
+
+
+@pytest.mark.asyncio
+async def test_search_products_passes_normalized_term():
+    repo = AsyncMock()
+    repo.search_products.return_value = []
+
+    await SearchProductsUseCase(repo).execute("CATÉTER", limit=5)
+
+    repo.search_products.assert_called_once_with(term="cateter", limit=5)
+
+
+@pytest.mark.asyncio
+async def test_search_products_blank_query_skips_repository():
+    repo = AsyncMock()
+
+    assert await SearchProductsUseCase(repo).execute("   ") == []
+    repo.search_products.assert_not_called()
@@ -0,0 +1,43 @@
+"""2025_11_29_client_trigram_search
+
+Revision ID: 2d8f6b1e9a43
+Revises: 7c2e5a9d4b18
+Create Date: 2025-11-29 10:15:02.447831
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2d8f6b1e9a43'
+down_revision: Union[str, Sequence[str], None] = '7c2e5a9d4b18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute("CREATE EXTENSION IF NOT EXISTS unaccent")
+    # unaccent() is only STABLE, so index expressions need an IMMUTABLE wrapper
+    # that pins the dictionary
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION f_unaccent(text) RETURNS text
+        LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT
+        AS $$ SELECT public.unaccent('public.unaccent'::regdictionary, $1) $$
+        """
+    )
+    op.execute(
+        "CREATE INDEX idx_clients_nombre_institucion_trgm ON clients "
+        "USING gin (f_unaccent(lower(nombre_institucion)) gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_clients_nombre_institucion_trgm', table_name='clients')
+    op.execute("DROP FUNCTION IF EXISTS f_unaccent(text)")
@@ -0,0 +1,40 @@
+"""2025_11_28_client_keyset_indexes
+
+Revision ID: 7c2e5a9d4b18
+Revises: 4fd349b9ee9f
+Create Date: 2025-11-28 09:47:31.905126
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c2e5a9d4b18'
+down_revision: Union[str, Sequence[str], None] = '4fd349b9ee9f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'idx_clients_nombre_cliente_id',
+        'clients',
+        ['nombre_institucion', 'cliente_id'],
+        unique=False,
+    )
+    op.create_index(
+        'idx_clients_seller_nombre',
+        'clients',
+        ['vendedor_asignado_id', 'nombre_institucion', 'cliente_id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_clients_seller_nombre', table_name='clients')
+    op.drop_index('idx_clients_nombre_cliente_id', table_name='clients')
@@ -11,12 +11,14 @@ from src.adapters.input.schemas import (
     ClientCreate,
     ClientListResponse,
     ClientResponse,
+    ClientSearchResponse,
     PaginationMetadata,
 )
 from src.adapters.output.repositories.client_repository import ClientRepository
 from src.application.use_cases.assign_seller import AssignSellerUseCase
 from src.application.use_cases.create_client import CreateClientUseCase
 from src.application.use_cases.list_clients import ListClientsUseCase
+from src.application.use_cases.search_clients import SearchClientsUseCase
 from src.domain.exceptions import ClientAlreadyAssignedException, ClientNotFoundException
 from src.infrastructure.database.config import get_db
 
@@ -45,6 +47,8 @@ async def list_clients(
     client_name: Optional[str] = Query(None, description="Filter by institution name (partial match)"),
     page: int = Query(1, ge=1, description="Page number (1-indexed)"),
     page_size: int = Query(50, ge=1, le=100, description="Results per page (max 100)"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    include_total: bool = Query(True, description="Count all matches (skipped on cursor pages)"),
     db: AsyncSession = Depends(get_db),
 ):
     """List all clients or filter by assigned seller and/or client name with pagination."""
@@ -55,7 +59,9 @@ async def list_clients(
         vendedor_asignado_id=vendedor_asignado_id,
         client_name=client_name,
         page=page,
-        page_size=page_size
+        page_size=page_size,
+        cursor=cursor,
+        include_total=include_total
     )
 
     return ClientListResponse(
@@ -65,6 +71,28 @@ async def list_clients(
     )
 
 
+@router.get("/clients/search", response_model=ClientSearchResponse)
+async def search_clients(
+    q: str = Query(..., min_length=3, max_length=100, description="Institution name text"),
+    limit: int = Query(10, ge=1, le=50, description="Maximum number of results"),
+    vendedor_asignado_id: Optional[UUID] = Query(
+        None, description="Only this seller's clients and unassigned ones"
+    ),
+    db: AsyncSession = Depends(get_db),
+):
+    """Search-as-you-type on institution name, ignoring case and accents."""
+    repository = ClientRepository(db)
+    use_case = SearchClientsUseCase(repository)
+
+    clients = await use_case.execute(
+        query=q,
+        limit=limit,
+        vendedor_asignado_id=vendedor_asignado_id
+    )
+
+    return ClientSearchResponse(clients=[ClientResponse.from_domain(client) for client in clients])
+
+
 @router.get("/clients/{cliente_id}", response_model=ClientResponse)
 async def get_client_by_id(
     cliente_id: UUID,
@@ -63,18 +63,27 @@ class PaginationMetadata(BaseModel):
 
     current_page: int = Field(..., description="Current page number (1-indexed)")
     page_size: int = Field(..., description="Number of results per page")
-    total_results: int = Field(..., description="Total number of results across all pages")
-    total_pages: int = Field(..., description="Total number of pages")
+    total_results: int | None = Field(
+        ..., description="Total number of results across all pages (null when not counted)"
+    )
+    total_pages: int | None = Field(..., description="Total number of pages (null when not counted)")
     has_next: bool = Field(..., description="Whether there is a next page")
     has_previous: bool = Field(..., description="Whether there is a previous page")
+    next_cursor: str | None = Field(
+        None, description="Pass as cursor to fetch the page after this one"
+    )
 
 
 class ClientListResponse(BaseModel):
     clients: list[ClientResponse]
-    total: int = Field(..., description="Total number of clients (backward compatibility)")
+    total: int | None = Field(..., description="Total number of clients (backward compatibility)")
     pagination: PaginationMetadata = Field(..., description="Pagination metadata")
 
 
+class ClientSearchResponse(BaseModel):
+    clients: list[ClientResponse] = Field(..., description="Matching clients, best match first")
+
+
 class AssignSellerRequest(BaseModel):
     """Request body for assigning a seller to a client."""
     vendedor_asignado_id: UUID = Field(
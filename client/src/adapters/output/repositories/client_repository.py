@@ -2,16 +2,22 @@ import logging
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import func, select, update
+from sqlalchemy import func, literal, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.ports.client_repository_port import ClientRepositoryPort
 from src.domain.entities.client import Client as DomainClient
+from src.domain.value_objects import ClientCursor
 from src.infrastructure.database.models import Client as ORMClient
 
 logger = logging.getLogger(__name__)
 
 
+def _search_key(column):
+    """Accent- and case-folded column, as indexed by the pg_trgm GIN index."""
+    return func.f_unaccent(func.lower(column))
+
+
 class ClientRepository(ClientRepositoryPort):
     """Implementation of ClientRepositoryPort for PostgreSQL."""
 
@@ -97,9 +103,13 @@ class ClientRepository(ClientRepositoryPort):
         vendedor_asignado_id: UUID,
         client_name: Optional[str] = None,
         page: int = 1,
-        page_size: int = 50
+        page_size: int = 50,
+        after: Optional[ClientCursor] = None
     ) -> list[DomainClient]:
-        """List clients assigned to a specific seller with pagination."""
+        """List clients assigned to a specific seller with pagination.
+
+        With ``after`` the page seeks past the cursor instead of skipping rows.
+        """
         logger.debug(
             f"DB: Listing clients for vendedor_asignado_id={vendedor_asignado_id}, "
             f"client_name={client_name}, page={page}, page_size={page_size}"
@@ -114,14 +124,7 @@ class ClientRepository(ClientRepositoryPort):
             if client_name:
                 stmt = stmt.where(ORMClient.nombre_institucion.ilike(f"%{client_name}%"))
 
-            stmt = stmt.order_by(
-                ORMClient.nombre_institucion.asc(),
-                ORMClient.cliente_id.asc()
-            )
-
-            # Apply pagination
-            offset = (page - 1) * page_size
-            stmt = stmt.limit(page_size).offset(offset)
+            stmt = self._paginate(stmt, page, page_size, after)
 
             result = await self.session.execute(stmt)
             orm_clients = result.scalars().all()
@@ -139,9 +142,13 @@ class ClientRepository(ClientRepositoryPort):
         self,
         client_name: Optional[str] = None,
         page: int = 1,
-        page_size: int = 50
+        page_size: int = 50,
+        after: Optional[ClientCursor] = None
     ) -> list[DomainClient]:
-        """List all clients with pagination."""
+        """List all clients with pagination.
+
+        With ``after`` the page seeks past the cursor instead of skipping rows.
+        """
         logger.debug(
             f"DB: Listing all clients, client_name={client_name}, "
             f"page={page}, page_size={page_size}"
@@ -153,14 +160,7 @@ class ClientRepository(ClientRepositoryPort):
             if client_name:
                 stmt = stmt.where(ORMClient.nombre_institucion.ilike(f"%{client_name}%"))
 
-            stmt = stmt.order_by(
-                ORMClient.nombre_institucion.asc(),
-                ORMClient.cliente_id.asc()
-            )
-
-            # Apply pagination
-            offset = (page - 1) * page_size
-            stmt = stmt.limit(page_size).offset(offset)
+            stmt = self._paginate(stmt, page, page_size, after)
 
             result = await self.session.execute(stmt)
             orm_clients = result.scalars().all()
@@ -251,6 +251,52 @@ class ClientRepository(ClientRepositoryPort):
             logger.error(f"DB: Count all clients failed: error={e}")
             raise
 
+    async def search(
+        self,
+        term: str,
+        limit: int = 10,
+        vendedor_asignado_id: Optional[UUID] = None,
+    ) -> list[DomainClient]:
+        """Trigram search on institution name, ranked by similarity.
+
+        Substring matches and close (typo) matches both qualify; the pg_trgm
+        GIN index serves both, so no sequential scan is needed.
+        """
+        logger.debug(
+            f"DB: Searching clients: term={term}, limit={limit}, "
+            f"vendedor_asignado_id={vendedor_asignado_id}"
+        )
+
+        try:
+            name_key = _search_key(ORMClient.nombre_institucion)
+            stmt = select(ORMClient).where(
+                or_(
+                    name_key.contains(term, autoescape=True),
+                    literal(term).op("<%")(name_key),
+                )
+            )
+
+            if vendedor_asignado_id:
+                stmt = stmt.where(
+                    (ORMClient.vendedor_asignado_id == vendedor_asignado_id) |
+                    (ORMClient.vendedor_asignado_id.is_(None))
+                )
+
+            stmt = stmt.order_by(
+                func.word_similarity(term, name_key).desc(),
+                ORMClient.nombre_institucion,
+                ORMClient.cliente_id
+            ).limit(limit)
+
+            result = await self.session.execute(stmt)
+            orm_clients = result.scalars().all()
+
+            logger.debug(f"DB: Client search found {len(orm_clients)} results")
+            return [self._to_domain(client) for client in orm_clients]
+        except Exception as e:
+            logger.error(f"DB: Search clients failed: error={e}")
+            raise
+
     async def update(self, client: DomainClient) -> DomainClient:
         """Update existing client and return domain entity."""
         logger.debug(f"DB: Updating client: cliente_id={client.cliente_id}")
@@ -290,6 +336,29 @@ class ClientRepository(ClientRepositoryPort):
             await self.session.rollback()
             raise
 
+    @staticmethod
+    def _paginate(stmt, page: int, page_size: int, after: Optional[ClientCursor]):
+        """Order by (nombre_institucion, cliente_id) and apply keyset or offset paging."""
+        if after:
+            # The leading range bound lets the index seek; the OR only
+            # breaks ties on nombre_institucion
+            stmt = stmt.where(
+                ORMClient.nombre_institucion >= after.nombre_institucion,
+                or_(
+                    ORMClient.nombre_institucion > after.nombre_institucion,
+                    ORMClient.cliente_id > after.cliente_id
+                )
+            )
+
+        stmt = stmt.order_by(
+            ORMClient.nombre_institucion.asc(),
+            ORMClient.cliente_id.asc()
+        ).limit(page_size)
+
+        if not after:
+            stmt = stmt.offset((page - 1) * page_size)
+        return stmt
+
     @staticmethod
     def _to_domain(orm_client: ORMClient) -> DomainClient:
         """Map ORM model to domain entity."""
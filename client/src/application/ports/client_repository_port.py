@@ -4,6 +4,7 @@ from typing import Optional
 from uuid import UUID
 
 from src.domain.entities.client import Client
+from src.domain.value_objects import ClientCursor
 
 
 class ClientRepositoryPort(ABC):
@@ -62,12 +63,24 @@ class ClientRepositoryPort(ABC):
         ...  # pragma: no cover
 
     @abstractmethod
-    async def list_by_seller(self, vendedor_asignado_id: UUID, client_name: Optional[str] = None) -> list[Client]:
-        """List all clients assigned to a specific seller.
+    async def list_by_seller(
+        self,
+        vendedor_asignado_id: UUID,
+        client_name: Optional[str] = None,
+        page: int = 1,
+        page_size: int = 50,
+        after: Optional[ClientCursor] = None,
+    ) -> list[Client]:
+        """List clients assigned to a specific seller (or unassigned).
+
+        Ordered by (nombre_institucion, cliente_id).
 
         Args:
             vendedor_asignado_id: UUID of the seller
             client_name: Optional filter by institution name (partial match)
+            page: Page number (1-indexed), ignored when ``after`` is given
+            page_size: Number of results per page
+            after: Only return clients past this cursor in listing order
 
         Returns:
             List of client domain entities
@@ -75,17 +88,46 @@ class ClientRepositoryPort(ABC):
         ...  # pragma: no cover
 
     @abstractmethod
-    async def list_all(self, client_name: Optional[str] = None) -> list[Client]:
-        """List all clients.
+    async def list_all(
+        self,
+        client_name: Optional[str] = None,
+        page: int = 1,
+        page_size: int = 50,
+        after: Optional[ClientCursor] = None,
+    ) -> list[Client]:
+        """List all clients, ordered by (nombre_institucion, cliente_id).
 
         Args:
             client_name: Optional filter by institution name (partial match)
+            page: Page number (1-indexed), ignored when ``after`` is given
+            page_size: Number of results per page
+            after: Only return clients past this cursor in listing order
 
         Returns:
             List of all client domain entities
         """
         ...  # pragma: no cover
 
+    @abstractmethod
+    async def search(
+        self,
+        term: str,
+        limit: int = 10,
+        vendedor_asignado_id: Optional[UUID] = None,
+    ) -> list[Client]:
+        """Find clients whose institution name matches a search term.
+
+        Args:
+            term: Lowercase, accent-free search text
+            limit: Maximum number of results
+            vendedor_asignado_id: Optional seller; restricts results to their
+                clients and unassigned ones, as in ``list_by_seller``
+
+        Returns:
+            Matching client domain entities, best match first
+        """
+        ...  # pragma: no cover
+
     @abstractmethod
     async def update(self, client: Client) -> Client:
         """Update an existing client.
@@ -4,6 +4,7 @@ from uuid import UUID
 
 from src.application.ports.client_repository_port import ClientRepositoryPort
 from src.domain.entities.client import Client
+from src.domain.value_objects import ClientCursor
 
 logger = logging.getLogger(__name__)
 
@@ -17,53 +18,83 @@ class ListClientsUseCase:
         vendedor_asignado_id: Optional[UUID] = None,
         client_name: Optional[str] = None,
         page: int = 1,
-        page_size: int = 50
+        page_size: int = 50,
+        cursor: Optional[str] = None,
+        include_total: bool = True
     ) -> tuple[List[Client], dict]:
         """Execute the list clients use case with pagination.
 
+        A cursor from a previous page continues the listing by keyset instead
+        of page number; the count only runs for non-cursor pages.
+
         Args:
             vendedor_asignado_id: Optional seller ID to filter by
             client_name: Optional client institution name filter (partial match)
-            page: Page number (1-indexed)
+            page: Page number (1-indexed), ignored when ``cursor`` is given
             page_size: Number of results per page
+            cursor: next_cursor of the previous page
+            include_total: Whether to count all matching clients
 
         Returns:
             Tuple of (clients list, pagination metadata dict)
+
+        Raises:
+            InvalidClientCursorException: If the cursor is malformed
         """
         logger.info(
             f"Listing clients: vendedor_asignado_id={vendedor_asignado_id}, "
-            f"client_name={client_name}, page={page}, page_size={page_size}"
+            f"client_name={client_name}, page={page}, page_size={page_size}, cursor={cursor}"
         )
 
+        after = ClientCursor.decode(cursor) if cursor else None
+        include_total = include_total and after is None
+        total_results = None
+
         if vendedor_asignado_id:
             # Fetch clients with pagination
             clients = await self.repository.list_by_seller(
                 vendedor_asignado_id=vendedor_asignado_id,
                 client_name=client_name,
                 page=page,
-                page_size=page_size
+                page_size=page_size,
+                after=after
             )
 
             # Get total count for pagination metadata
-            total_results = await self.repository.count_by_seller(
-                vendedor_asignado_id=vendedor_asignado_id,
-                client_name=client_name
-            )
+            if include_total:
+                total_results = await self.repository.count_by_seller(
+                    vendedor_asignado_id=vendedor_asignado_id,
+                    client_name=client_name
+                )
         else:
             # Fetch clients with pagination
             clients = await self.repository.list_all(
                 client_name=client_name,
                 page=page,
-                page_size=page_size
+                page_size=page_size,
+                after=after
             )
 
             # Get total count for pagination metadata
-            total_results = await self.repository.count_all(client_name=client_name)
+            if include_total:
+                total_results = await self.repository.count_all(client_name=client_name)
+
+        # Calculate pagination metadata; without a total a full page may have more
+        if total_results is not None:
+            total_pages = (total_results + page_size - 1) // page_size if total_results > 0 else 0
+            has_next = page * page_size < total_results
+        else:
+            total_pages = None
+            has_next = len(clients) == page_size
+        has_previous = page > 1 or after is not None
 
-        # Calculate pagination metadata
-        total_pages = (total_results + page_size - 1) // page_size if total_results > 0 else 0
-        has_next = page * page_size < total_results
-        has_previous = page > 1
+        next_cursor = None
+        if has_next and clients:
+            last = clients[-1]
+            next_cursor = ClientCursor(
+                nombre_institucion=last.nombre_institucion,
+                cliente_id=last.cliente_id
+            ).encode()
 
         pagination_metadata = {
             "current_page": page,
@@ -72,6 +103,7 @@ class ListClientsUseCase:
             "total_pages": total_pages,
             "has_next": has_next,
             "has_previous": has_previous,
+            "next_cursor": next_cursor,
         }
 
         logger.info(
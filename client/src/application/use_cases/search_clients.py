@@ -0,0 +1,57 @@
+import logging
+import unicodedata
+from typing import List, Optional
+from uuid import UUID
+
+from src.application.ports.client_repository_port import ClientRepositoryPort
+from src.domain.entities.client import Client
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_search_term(text: str) -> str:
+    """Fold case, accents and whitespace ("  Clínica San José " -> "clinica san jose").
+
+    Mirrors the ``f_unaccent(lower(...))`` expression the name index is built
+    on, so "clinica" finds "Clínica".
+    """
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(stripped.lower().split())
+
+
+class SearchClientsUseCase:
+    def __init__(self, repository: ClientRepositoryPort):
+        self.repository = repository
+
+    async def execute(
+        self,
+        query: str,
+        limit: int = 10,
+        vendedor_asignado_id: Optional[UUID] = None
+    ) -> List[Client]:
+        """Search clients by institution name, best match first.
+
+        Args:
+            query: Text typed by the user
+            limit: Maximum number of results
+            vendedor_asignado_id: Optional seller to scope the search to
+
+        Returns:
+            Matching clients; empty when the query has no searchable text
+        """
+        term = normalize_search_term(query)
+        logger.info(
+            f"Searching clients: term={term}, limit={limit}, "
+            f"vendedor_asignado_id={vendedor_asignado_id}"
+        )
+        if not term:
+            return []
+
+        clients = await self.repository.search(
+            term=term,
+            limit=limit,
+            vendedor_asignado_id=vendedor_asignado_id
+        )
+        logger.info(f"Client search returned {len(clients)} results")
+        return clients
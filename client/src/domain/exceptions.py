@@ -70,3 +70,14 @@ class ClientAlreadyAssignedException(BusinessRuleException):
             message=f"Client {cliente_id} is already assigned to seller {vendedor_asignado_id}",
             error_code="CLIENT_ALREADY_ASSIGNED"
         )
+
+
+class InvalidClientCursorException(ValidationException):
+    """Client listing cursor could not be parsed."""
+
+    def __init__(self, cursor: str):
+        self.cursor = cursor
+        super().__init__(
+            message="Invalid client cursor",
+            error_code="INVALID_CLIENT_CURSOR"
+        )
@@ -0,0 +1,39 @@
+"""Value objects for the Client domain."""
+
+import base64
+import binascii
+from dataclasses import dataclass
+from uuid import UUID
+
+from src.domain.exceptions import InvalidClientCursorException
+
+
+@dataclass(frozen=True)
+class ClientCursor:
+    """Keyset position in a client listing ordered by (nombre_institucion, cliente_id).
+
+    Encoded as an opaque URL-safe token.
+    """
+
+    nombre_institucion: str
+    cliente_id: UUID
+
+    def encode(self) -> str:
+        raw = f"{self.nombre_institucion}|{self.cliente_id}".encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "ClientCursor":
+        """Parse a token produced by ``encode``.
+
+        The institution name may itself contain ``|``; the id never does.
+
+        Raises:
+            InvalidClientCursorException: If the token is malformed
+        """
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            name, cliente_id = base64.urlsafe_b64decode(padded).decode().rsplit("|", 1)
+            return cls(nombre_institucion=name, cliente_id=UUID(cliente_id))
+        except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+            raise InvalidClientCursorException(token) from e
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import UUID, DateTime, String, func
+from sqlalchemy import UUID, DateTime, Index, String, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import Base
@@ -9,6 +9,18 @@ from .base import Base
 
 class Client(Base):
     __tablename__ = "clients"
+    __table_args__ = (
+        # Keyset listing by (nombre_institucion, cliente_id), overall and per seller
+        Index("idx_clients_nombre_cliente_id", "nombre_institucion", "cliente_id"),
+        Index(
+            "idx_clients_seller_nombre",
+            "vendedor_asignado_id",
+            "nombre_institucion",
+            "cliente_id",
+        ),
+        # Search also uses a pg_trgm GIN index on f_unaccent(lower(nombre_institucion));
+        # it is Postgres-only, see migration 2d8f6b1e9a43
+    )
 
     cliente_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
@@ -466,3 +466,51 @@ async def test_get_client_by_id_not_found():
         assert response.status_code == 404
         data = response.json()
         assert "detail" in data
+
+
+@pytest.mark.asyncio
+async def test_search_clients():
+    """Test searching clients by institution name."""
+    app = FastAPI()
+    app.include_router(router)
+
+    seller_id = uuid.uuid4()
+    mock_client = Client(
+        cliente_id=uuid.uuid4(),
+        cognito_user_id="cognito-search",
+        email="search@example.com",
+        telefono="+1234567890",
+        nombre_institucion="Clínica San José",
+        tipo_institucion="clinica",
+        nit="900123456",
+        direccion="123 Test St",
+        ciudad="Test City",
+        pais="Test Country",
+        representante="John Doe",
+        vendedor_asignado_id=seller_id,
+        created_at=datetime.now(),
+        updated_at=datetime.now(),
+    )
+
+    with patch(
+        "src.adapters.input.controllers.client_controller.ClientRepository"
+    ) as MockRepository:
+        mock_repo = MockRepository.return_value
+        mock_repo.search = AsyncMock(return_value=[mock_client])
+
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.get(
+                "/clients/search",
+                params={"q": "clinica jose", "vendedor_asignado_id": str(seller_id)},
+            )
+            too_short = await client.get("/clients/search", params={"q": "cl"})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [c["nombre_institucion"] for c in data["clients"]] == ["Clínica San José"]
+        mock_repo.search.assert_called_once_with(
+            term="clinica jose", limit=10, vendedor_asignado_id=seller_id
+        )
+        assert too_short.status_code == 422
@@ -963,3 +963,26 @@ async def test_count_all_exception_path(db_session):
         pass
     finally:
         db_session.execute = original_execute
+
+
+@pytest.mark.asyncio
+async def test_search_uses_trigram_index_expression():
+    """Search must filter on the exact expression the GIN index is built on."""
+    from unittest.mock import AsyncMock, MagicMock
+
+    from sqlalchemy.dialects.postgresql import asyncpg
+
+    session = AsyncMock()
+    session.execute.return_value = MagicMock()
+    repo = ClientRepository(session)
+
+    await repo.search("clinica 100%", limit=5, vendedor_asignado_id=uuid4())
+
+    compiled = session.execute.call_args[0][0].compile(dialect=asyncpg.dialect())
+    sql = str(compiled)
+    assert "f_unaccent(lower(clients.nombre_institucion)) LIKE" in sql
+    assert "<% f_unaccent(lower(clients.nombre_institucion))" in sql
+    assert "clients.vendedor_asignado_id IS NULL" in sql
+    assert "ORDER BY word_similarity(" in sql
+    # LIKE wildcards typed by the user are matched literally
+    assert "clinica 100/%" in compiled.params.values()
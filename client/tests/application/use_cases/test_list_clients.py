@@ -121,3 +121,62 @@ async def test_list_clients_empty(db_session):
     assert pagination_metadata["total_pages"] == 0
     assert pagination_metadata["has_next"] is False
     assert pagination_metadata["has_previous"] is False
+
+
+@pytest.mark.asyncio
+async def test_list_clients_by_seller_cursor_walk(db_session):
+    """Test cursor pages return every client once, name ties included, without counting."""
+    repo = ClientRepository(db_session)
+    use_case = ListClientsUseCase(repo)
+
+    seller_id = uuid4()
+    names = ["Clinica B", "Clinica A", "Clinica B", "Hospital | Norte", "Clinica A"]
+    for i, name in enumerate(names):
+        await repo.create(DomainClient(
+            cliente_id=uuid4(),
+            cognito_user_id=f"cognito-cursor-{i}",
+            email=f"cursor{i}@hospital.com",
+            telefono="+1234567890",
+            nombre_institucion=name,
+            tipo_institucion="hospital",
+            nit=f"99988877{i}",
+            direccion=f"{i} Cursor St",
+            ciudad="Test City",
+            pais="Test Country",
+            representante=f"Rep {i}",
+            # Unassigned clients are listed for every seller
+            vendedor_asignado_id=seller_id if i % 2 else None,
+            created_at=datetime.now(),
+            updated_at=datetime.now()
+        ))
+
+    everything, _ = await use_case.execute(vendedor_asignado_id=seller_id)
+
+    seen = []
+    cursor = None
+    while True:
+        clients, metadata = await use_case.execute(
+            vendedor_asignado_id=seller_id, page_size=2, cursor=cursor
+        )
+        seen.extend(clients)
+        if cursor:
+            assert metadata["total_results"] is None
+            assert metadata["has_previous"] is True
+        if not metadata["has_next"]:
+            assert metadata["next_cursor"] is None
+            break
+        cursor = metadata["next_cursor"]
+
+    assert [c.cliente_id for c in seen] == [c.cliente_id for c in everything]
+    assert [c.nombre_institucion for c in everything] == sorted(names)
+
+
+@pytest.mark.asyncio
+async def test_list_clients_invalid_cursor(db_session):
+    """Test a malformed cursor raises a validation error."""
+    from src.domain.exceptions import InvalidClientCursorException
+
+    use_case = ListClientsUseCase(ClientRepository(db_session))
+
+    with pytest.raises(InvalidClientCursorException):
+        await use_case.execute(cursor="%%%")
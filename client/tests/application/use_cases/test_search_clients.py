@@ -0,0 +1,42 @@
+"""Tests for SearchClientsUseCase."""
+import pytest
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+from src.application.use_cases.search_clients import SearchClientsUseCase, normalize_search_term
+
+
+@pytest.mark.parametrize(
+    "text,expected",
+    [
+        ("Clínica San José", "clinica san jose"),
+        ("  HOSPITAL   Niño Jesús ", "hospital nino jesus"),
+        ("Droguería Ñuñoa", "drogueria nunoa"),
+    ],
+)
+def test_normalize_search_term(text, expected):
+    """Test case, accents and whitespace are folded."""
+    assert normalize_search_term(text) == expected
+
+
+@pytest.mark.asyncio
+async def test_search_passes_normalized_term():
+    """Test the repository receives the folded term and seller scope."""
+    repository = AsyncMock()
+    repository.search.return_value = []
+    seller_id = uuid4()
+
+    await SearchClientsUseCase(repository).execute("CLÍNICA", limit=5, vendedor_asignado_id=seller_id)
+
+    repository.search.assert_called_once_with(
+        term="clinica", limit=5, vendedor_asignado_id=seller_id
+    )
+
+
+@pytest.mark.asyncio
+async def test_search_blank_query_skips_repository():
+    """Test a query with no searchable text returns nothing."""
+    repository = AsyncMock()
+
+    assert await SearchClientsUseCase(repository).execute("   ") == []
+    repository.search.assert_not_called()
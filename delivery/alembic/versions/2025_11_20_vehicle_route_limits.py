@@ -0,0 +1,29 @@
+"""vehicle_route_limits
+
+Revision ID: 002
+Revises: 001
+Create Date: 2025-11-20
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "002"
+down_revision: Union[str, None] = "001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Per-vehicle limits used by capacitated route assignment
+    op.add_column("vehicles", sa.Column("max_stops", sa.Integer(), nullable=True))
+    op.add_column("vehicles", sa.Column("max_route_minutes", sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("vehicles", "max_route_minutes")
+    op.drop_column("vehicles", "max_stops")
@@ -0,0 +1,75 @@
+"""route_generation_jobs
+
+Revision ID: 003
+Revises: 002
+Create Date: 2025-11-21
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "003"
+down_revision: Union[str, None] = "002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "route_generation_jobs",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("fecha_entrega_estimada", sa.Date(), nullable=False),
+        sa.Column("vehicle_ids", postgresql.ARRAY(postgresql.UUID(as_uuid=True)), nullable=False),
+        sa.Column("dedup_key", sa.String(64), nullable=False),
+        sa.Column("status", sa.String(20), nullable=False, server_default="queued"),
+        sa.Column("progress", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("num_shipments", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("num_routes", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("num_assigned_shipments", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("num_unassigned_shipments", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("error_message", sa.Text(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=True,
+        ),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_route_generation_jobs_fecha_entrega_estimada"),
+        "route_generation_jobs",
+        ["fecha_entrega_estimada"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_route_generation_jobs_status"),
+        "route_generation_jobs",
+        ["status"],
+        unique=False,
+    )
+    # At most one queued/running job per date + vehicle set
+    op.create_index(
+        "uq_route_generation_jobs_active_dedup_key",
+        "route_generation_jobs",
+        ["dedup_key"],
+        unique=True,
+        postgresql_where=sa.text("status IN ('queued', 'running')"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("uq_route_generation_jobs_active_dedup_key", table_name="route_generation_jobs")
+    op.drop_index(op.f("ix_route_generation_jobs_status"), table_name="route_generation_jobs")
+    op.drop_index(
+        op.f("ix_route_generation_jobs_fecha_entrega_estimada"),
+        table_name="route_generation_jobs",
+    )
+    op.drop_table("route_generation_jobs")
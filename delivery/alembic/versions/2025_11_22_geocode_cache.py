@@ -0,0 +1,57 @@
+"""geocode_cache
+
+Revision ID: 004
+Revises: 003
+Create Date: 2025-11-22
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "004"
+down_revision: Union[str, None] = "003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "geocode_cache",
+        sa.Column("address_key", sa.String(64), nullable=False),
+        sa.Column("address", sa.Text(), nullable=False),
+        sa.Column("city", sa.String(255), nullable=False),
+        sa.Column("country", sa.String(255), nullable=False),
+        sa.Column("latitude", sa.Numeric(10, 8), nullable=True),
+        sa.Column("longitude", sa.Numeric(11, 8), nullable=True),
+        sa.Column("hit_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("lookup_count", sa.Integer(), nullable=False, server_default="1"),
+        sa.Column(
+            "refreshed_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.Column("last_hit_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=True,
+        ),
+        sa.PrimaryKeyConstraint("address_key"),
+    )
+    op.create_index(
+        op.f("ix_geocode_cache_refreshed_at"),
+        "geocode_cache",
+        ["refreshed_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_geocode_cache_refreshed_at"), table_name="geocode_cache")
+    op.drop_table("geocode_cache")
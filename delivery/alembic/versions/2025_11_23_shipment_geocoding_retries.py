@@ -0,0 +1,41 @@
+"""shipment_geocoding_retries
+
+Revision ID: 005
+Revises: 004
+Create Date: 2025-11-23
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "005"
+down_revision: Union[str, None] = "004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "shipments",
+        sa.Column("geocoding_attempts", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.add_column(
+        "shipments",
+        sa.Column("geocoding_next_attempt_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index(
+        "ix_shipments_geocoding_queue",
+        "shipments",
+        ["geocoding_status", "geocoding_next_attempt_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_shipments_geocoding_queue", table_name="shipments")
+    op.drop_column("shipments", "geocoding_next_attempt_at")
+    op.drop_column("shipments", "geocoding_attempts")
@@ -0,0 +1,34 @@
+"""route_generation_job_leases
+
+Revision ID: 006
+Revises: 005
+Create Date: 2025-11-24
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "006"
+down_revision: Union[str, None] = "005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "route_generation_jobs",
+        sa.Column("lease_expires_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    # Active jobs from before leases have no live worker after the deploy
+    op.execute(
+        "UPDATE route_generation_jobs SET lease_expires_at = now() "
+        "WHERE status IN ('queued', 'running')"
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("route_generation_jobs", "lease_expires_at")
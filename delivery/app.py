@@ -11,18 +11,20 @@ from src.adapters.input.controllers.shipment_controller import (
     router as shipment_router,
 )
 from src.adapters.input.controllers.vehicle_controller import router as vehicle_router
+from src.adapters.input.recent_event_filter import RecentEventFilter
 from src.adapters.input.sqs_consumer import SQSConsumer
-from src.application.use_cases.consume_order_created import ConsumeOrderCreatedUseCase
 from src.infrastructure.api.exception_handlers import register_exception_handlers
 from src.infrastructure.config.logger import setup_logging
 from src.infrastructure.config.settings import settings
-from src.infrastructure.database.config import engine
+from src.infrastructure.database.config import async_session
+from src.infrastructure.executors import shutdown_optimization_executor
 from src.infrastructure.dependencies import (
-    get_shipment_repository,
+    expire_route_generation_jobs,
+    get_consume_order_created_use_case,
     get_processed_event_repository,
-    get_geocoding_service,
+    get_geocoding_worker,
+    close_geocoding_service,
 )
-from sqlalchemy.ext.asyncio import AsyncSession
 
 # Setup logging
 setup_logging()
@@ -30,40 +32,50 @@ setup_logging()
 # Get logger for this module
 logger = logging.getLogger(__name__)
 
-# Global consumer task
+# Global consumer and geocoding worker tasks
 consumer_task = None
+geocoding_task = None
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """FastAPI lifespan context manager for startup/shutdown."""
-    global consumer_task
+    global consumer_task, geocoding_task
+
+    # Route-generation jobs orphaned by a crash or restart would block their dedup key
+    try:
+        await expire_route_generation_jobs()
+    except Exception as e:
+        logger.error(f"Failed to expire stale route generation jobs: {e}")
 
     # Startup: Start SQS consumer
     logger.info("Starting SQS consumer for order_created events...")
 
-    # Create database session factory and use case
-    from sqlalchemy.ext.asyncio import async_sessionmaker
-    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-
-    # Keep session for the entire lifecycle
-    session = session_maker()
-
-    # Create use case with dependencies
-    use_case = ConsumeOrderCreatedUseCase(
-        shipment_repository=get_shipment_repository(session),
-        processed_event_repository=get_processed_event_repository(session),
-        geocoding_service=get_geocoding_service(),
-        session=session,
-    )
-
+    # Geocoding runs in its own worker with per-batch sessions
+    geocoding_worker = get_geocoding_worker()
+    if settings.geocoding_worker_enabled:
+        geocoding_task = asyncio.create_task(geocoding_worker.start())
+        logger.info("✅ Geocoding worker started")
+
+    # Each message gets its own session and use case
+    recent_events = None
+    if settings.sqs_recent_event_ids_size > 0:
+        recent_events = RecentEventFilter(
+            max_size=settings.sqs_recent_event_ids_size,
+            ttl_seconds=settings.sqs_recent_event_ids_ttl_seconds,
+        )
     consumer = SQSConsumer(
         queue_url=settings.sqs_order_events_queue_url,
         region=settings.aws_region,
         access_key_id=settings.aws_access_key_id,
         secret_access_key=settings.aws_secret_access_key,
         endpoint_url=settings.aws_endpoint_url,
-        use_case=use_case,
+        session_factory=async_session,
+        use_case_factory=get_consume_order_created_use_case,
+        processed_event_repository_factory=get_processed_event_repository,
+        recent_events=recent_events,
+        max_concurrency=settings.sqs_consumer_max_concurrency,
+        wait_time_seconds=settings.sqs_consumer_wait_time_seconds,
     )
 
     consumer_task = asyncio.create_task(consumer.start())
@@ -82,9 +94,17 @@ async def lifespan(app: FastAPI):
             pass
     logger.info("✅ SQS consumer stopped")
 
-    # Close session
-    await session.close()
-    logger.info("✅ Database session closed")
+    # Stop geocoding worker after its current batch
+    if geocoding_task:
+        await geocoding_worker.stop()
+        await geocoding_task
+        logger.info("✅ Geocoding worker stopped")
+
+    # Persist buffered geocode cache hit counters
+    await close_geocoding_service()
+
+    # Stop route optimization workers; waiting on running jobs blocks
+    await asyncio.to_thread(shutdown_optimization_executor)
 
 
 app = FastAPI(
@@ -0,0 +1,133 @@
+"""
+Benchmark: route optimization on synthetic daily shipment sets.
+
+Generates geocoded shipments spread over a metropolitan bounding box and
+times each optimization stage. With ``--legacy`` it also times the old
+per-pair ``Coordinates.distance_to`` nearest-neighbor loop for comparison
+(slow for large sizes). The last columns run the optimizer with the
+local-search improvement stage and report total distance before/after.
+
+Usage (from the delivery directory):
+    python -m benchmarks.route_optimizer_benchmark --sizes 500 2000 5000 --vehicles 10
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import List
+from uuid import uuid4
+
+import numpy as np
+
+from src.domain.entities import Shipment, Vehicle
+from src.domain.services.distance_matrix import DistanceMatrix, shipment_coordinates
+from src.domain.services.local_search import LocalSearchImprover
+from src.domain.services.route_optimizer import GreedyRouteOptimizer
+
+# Bogota metropolitan area
+LAT_RANGE = (4.45, 4.85)
+LON_RANGE = (-74.25, -73.95)
+
+
+def make_shipments(n: int, seed: int = 42) -> List[Shipment]:
+    rng = np.random.default_rng(seed)
+    lats = rng.uniform(*LAT_RANGE, n)
+    lons = rng.uniform(*LON_RANGE, n)
+    now = datetime.now()
+    shipments = []
+    for lat, lon in zip(lats, lons):
+        shipment = Shipment(
+            id=uuid4(),
+            order_id=uuid4(),
+            customer_id=uuid4(),
+            direccion_entrega="Calle 1 # 2-3",
+            ciudad_entrega="Bogota",
+            pais_entrega="Colombia",
+            fecha_pedido=now,
+            fecha_entrega_estimada=(now + timedelta(days=1)).date(),
+        )
+        shipment.set_coordinates(Decimal(f"{lat:.6f}"), Decimal(f"{lon:.6f}"))
+        shipments.append(shipment)
+    return shipments
+
+
+def make_vehicles(n: int) -> List[Vehicle]:
+    return [
+        Vehicle(id=uuid4(), placa=f"BEN-{i:03d}", driver_name=f"Driver {i}")
+        for i in range(n)
+    ]
+
+
+def legacy_nearest_neighbor(shipments: List[Shipment]) -> float:
+    """Old per-pair implementation, kept here only as a baseline."""
+    ordered = [shipments[0]]
+    remaining = set(range(1, len(shipments)))
+    while remaining:
+        current = ordered[-1]
+        nearest_idx = min(
+            remaining,
+            key=lambda idx: current.coordinates.distance_to(shipments[idx].coordinates),
+        )
+        ordered.append(shipments[nearest_idx])
+        remaining.remove(nearest_idx)
+    return sum(
+        a.coordinates.distance_to(b.coordinates) for a, b in zip(ordered, ordered[1:])
+    )
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, (time.perf_counter() - start) * 1000
+
+
+async def run(sizes: List[int], num_vehicles: int, legacy: bool, budget: float) -> None:
+    optimizer = GreedyRouteOptimizer()
+    improving = GreedyRouteOptimizer(
+        improver=LocalSearchImprover(), improvement_time_budget_seconds=budget
+    )
+    vehicles = make_vehicles(num_vehicles)
+
+    print(
+        f"{'shipments':>9} {'matrix(1 route)':>16} {'nn(1 route)':>12} "
+        f"{'optimize(' + str(num_vehicles) + ' veh)':>18}"
+        + f" {'local search':>14} {'km before':>10} {'km after':>10}"
+        + (f" {'legacy nn(1 route)':>19}" if legacy else "")
+    )
+    for n in sizes:
+        shipments = make_shipments(n)
+        coords = shipment_coordinates(shipments)
+
+        matrix, matrix_ms = _timed(lambda: DistanceMatrix(coords))
+        _, nn_ms = _timed(matrix.nearest_neighbor_order)
+
+        start = time.perf_counter()
+        await optimizer.optimize_routes(shipments, vehicles)
+        optimize_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        results = await improving.optimize_routes(shipments, vehicles)
+        improve_ms = (time.perf_counter() - start) * 1000
+        before = sum(r.initial_distance_km for r in results)
+        after = sum(r.total_distance_km for r in results)
+
+        line = (
+            f"{n:>9} {matrix_ms:>14.1f}ms {nn_ms:>10.1f}ms {optimize_ms:>16.1f}ms"
+            f" {improve_ms:>12.1f}ms {before:>10} {after:>10}"
+        )
+        if legacy:
+            _, legacy_ms = _timed(lambda: legacy_nearest_neighbor(shipments))
+            line += f" {legacy_ms:>17.1f}ms"
+        print(line)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[500, 2000, 5000])
+    parser.add_argument("--vehicles", type=int, default=10)
+    parser.add_argument("--legacy", action="store_true")
+    parser.add_argument("--budget", type=float, default=2.0, help="local search seconds")
+    args = parser.parse_args()
+    asyncio.run(run(args.sizes, args.vehicles, args.legacy, args.budget))
@@ -9,24 +9,30 @@ from src.adapters.input.schemas.route_schemas import (
     GenerateRoutesRequest,
     GenerateRoutesResponse,
     RouteDetailResponse,
+    RouteGenerationJobResponse,
     RouteListResponse,
     RouteResponse,
     RouteStatusUpdateRequest,
     RouteStatusUpdateResponse,
     ShipmentInRoute,
 )
-from src.application.use_cases.generate_routes import GenerateRoutesUseCase
 from src.application.use_cases.get_route import GetRouteUseCase
+from src.application.use_cases.get_route_generation_job import GetRouteGenerationJobUseCase
 from src.application.use_cases.list_routes import ListRoutesUseCase
+from src.application.use_cases.submit_route_generation_job import (
+    SubmitRouteGenerationJobUseCase,
+)
 from src.application.use_cases.update_route_status import UpdateRouteStatusUseCase
 from src.domain.exceptions import EntityNotFoundError, InvalidStatusTransitionError
 from src.infrastructure.database.config import get_db
 from src.infrastructure.dependencies import (
-    get_generate_routes_use_case,
+    get_get_route_generation_job_use_case,
     get_get_route_use_case,
     get_list_routes_use_case,
     get_shipment_repository,
+    get_submit_route_generation_job_use_case,
     get_update_route_status_use_case,
+    run_route_generation_job,
 )
 
 router = APIRouter(tags=["Routes"])
@@ -37,26 +43,68 @@ async def generate_routes(
     request: GenerateRoutesRequest,
     background_tasks: BackgroundTasks,
     session: AsyncSession = Depends(get_db),
-    use_case: GenerateRoutesUseCase = Depends(get_generate_routes_use_case),
+    use_case: SubmitRouteGenerationJobUseCase = Depends(
+        get_submit_route_generation_job_use_case
+    ),
 ):
-    """Generate optimized routes for a target date."""
+    """
+    Queue route generation for a target date.
+
+    Returns a job handle; poll GET /route-jobs/{job_id} for progress. A
+    request matching a queued or running job returns that job instead of
+    starting another run.
+    """
     # Get count of pending shipments (for response)
     shipment_repo = get_shipment_repository(session)
     shipments = await shipment_repo.find_pending_by_date(request.fecha_entrega_estimada)
     num_pending = len(shipments)
 
-    # Run in background
-    background_tasks.add_task(
-        use_case.execute,
+    job, created = await use_case.execute(
         request.fecha_entrega_estimada,
         request.vehicle_ids,
     )
 
+    # Run in background
+    if created:
+        background_tasks.add_task(run_route_generation_job, job.id)
+
     return GenerateRoutesResponse(
-        message="Route generation started",
+        message="Route generation started" if created else "Route generation already in progress",
         fecha_entrega_estimada=request.fecha_entrega_estimada,
         num_vehicles=len(request.vehicle_ids),
         num_pending_shipments=num_pending,
+        job_id=job.id,
+        job_status=job.status.value,
+        deduplicated=not created,
+    )
+
+
+@router.get("/route-jobs/{job_id}", response_model=RouteGenerationJobResponse)
+async def get_route_generation_job(
+    job_id: UUID,
+    use_case: GetRouteGenerationJobUseCase = Depends(get_get_route_generation_job_use_case),
+):
+    """Get status, progress and counts of a route-generation job."""
+    try:
+        job = await use_case.execute(job_id)
+    except EntityNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+    return RouteGenerationJobResponse(
+        id=job.id,
+        fecha_entrega_estimada=job.fecha_entrega_estimada,
+        vehicle_ids=job.vehicle_ids,
+        status=job.status.value,
+        progress=job.progress,
+        num_shipments=job.num_shipments,
+        num_routes=job.num_routes,
+        num_assigned_shipments=job.num_assigned_shipments,
+        num_unassigned_shipments=job.num_unassigned_shipments,
+        error_message=job.error_message,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+        duration_ms=job.duration_ms,
     )
 
 
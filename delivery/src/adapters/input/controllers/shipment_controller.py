@@ -1,22 +1,78 @@
+from typing import List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.adapters.input.geocoding_worker import GeocodingWorker
 from src.adapters.input.schemas.shipment_schemas import (
+    GeocodingMetricsResponse,
+    ShipmentListResponse,
     ShipmentResponse,
     ShipmentStatusUpdateRequest,
     ShipmentStatusUpdateResponse,
 )
+from src.adapters.output.adapters import CachedGeocodingService
+from src.application.ports import GeocodingPort
 from src.application.use_cases.get_shipment_by_order import GetShipmentByOrderUseCase
+from src.application.use_cases.get_shipments_by_orders import GetShipmentsByOrdersUseCase
 from src.application.use_cases.update_shipment_status import UpdateShipmentStatusUseCase
 from src.domain.exceptions import EntityNotFoundError, InvalidStatusTransitionError
+from src.infrastructure.database.config import get_db
 from src.infrastructure.dependencies import (
+    get_geocoding_service,
+    get_geocoding_worker,
     get_get_shipment_by_order_use_case,
+    get_get_shipments_by_orders_use_case,
+    get_shipment_repository,
     get_update_shipment_status_use_case,
 )
 
 router = APIRouter(tags=["Shipments"])
 
+# Upper bound on order IDs per batch lookup; callers split larger sets
+MAX_ORDER_IDS_PER_REQUEST = 200
+
+
+def _parse_order_ids(raw: List[str]) -> List[UUID]:
+    """Accept repeated and/or comma-separated ``order_ids`` query values."""
+    values = [value.strip() for item in raw for value in item.split(",") if value.strip()]
+    if len(values) > MAX_ORDER_IDS_PER_REQUEST:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {MAX_ORDER_IDS_PER_REQUEST} order_ids per request",
+        )
+    try:
+        return [UUID(value) for value in values]
+    except ValueError:
+        raise HTTPException(status_code=400, detail="order_ids must be valid UUIDs")
+
+
+@router.get("/shipments/geocoding/metrics", response_model=GeocodingMetricsResponse)
+async def get_geocoding_metrics(
+    session: AsyncSession = Depends(get_db),
+    worker: GeocodingWorker = Depends(get_geocoding_worker),
+    geocoding_service: GeocodingPort = Depends(get_geocoding_service),
+):
+    """Geocoding queue depth, worker throughput and cache counters."""
+    queue_depth = await get_shipment_repository(session).count_pending_geocoding()
+    cache = (
+        geocoding_service.metrics()
+        if isinstance(geocoding_service, CachedGeocodingService)
+        else None
+    )
+    return GeocodingMetricsResponse(queue_depth=queue_depth, cache=cache, **worker.metrics())
+
+
+@router.get("/shipments", response_model=ShipmentListResponse)
+async def get_shipments_by_orders(
+    order_ids: List[str] = Query(..., description="Order IDs, repeated or comma-separated"),
+    use_case: GetShipmentsByOrdersUseCase = Depends(get_get_shipments_by_orders_use_case),
+):
+    """Get shipment information for several orders; orders without a shipment are omitted."""
+    results = await use_case.execute(_parse_order_ids(order_ids))
+    return ShipmentListResponse(items=[ShipmentResponse(**result) for result in results])
+
 
 @router.get("/shipments/{order_id}", response_model=ShipmentResponse)
 async def get_shipment(
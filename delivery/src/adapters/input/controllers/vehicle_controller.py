@@ -37,6 +37,8 @@ async def list_vehicles(
                 driver_name=v.driver_name,
                 driver_phone=v.driver_phone,
                 is_active=v.is_active,
+                max_stops=v.max_stops,
+                max_route_minutes=v.max_route_minutes,
             )
             for v in vehicles
         ],
@@ -55,6 +57,8 @@ async def create_vehicle(
             placa=request.placa,
             driver_name=request.driver_name,
             driver_phone=request.driver_phone,
+            max_stops=request.max_stops,
+            max_route_minutes=request.max_route_minutes,
         )
         return VehicleResponse(
             id=vehicle.id,
@@ -62,6 +66,8 @@ async def create_vehicle(
             driver_name=vehicle.driver_name,
             driver_phone=vehicle.driver_phone,
             is_active=vehicle.is_active,
+            max_stops=vehicle.max_stops,
+            max_route_minutes=vehicle.max_route_minutes,
         )
     except ValidationError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -79,6 +85,8 @@ async def update_vehicle(
             vehicle_id=vehicle_id,
             driver_name=request.driver_name,
             driver_phone=request.driver_phone,
+            max_stops=request.max_stops,
+            max_route_minutes=request.max_route_minutes,
         )
         return VehicleResponse(
             id=vehicle.id,
@@ -86,6 +94,8 @@ async def update_vehicle(
             driver_name=vehicle.driver_name,
             driver_phone=vehicle.driver_phone,
             is_active=vehicle.is_active,
+            max_stops=vehicle.max_stops,
+            max_route_minutes=vehicle.max_route_minutes,
         )
     except EntityNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
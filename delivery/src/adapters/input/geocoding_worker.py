@@ -0,0 +1,114 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.use_cases.geocode_pending_shipments import (
+    GeocodePendingShipmentsUseCase,
+    GeocodingBatchResult,
+)
+
+logger = logging.getLogger(__name__)
+
+UseCaseFactory = Callable[[AsyncSession], GeocodePendingShipmentsUseCase]
+
+# Window used to compute shipments/second throughput
+THROUGHPUT_WINDOW_SECONDS = 60.0
+
+
+class GeocodingWorker:
+    """
+    Background worker that geocodes pending shipments in batches.
+
+    Each batch runs on its own session. When a batch comes back empty the
+    worker sleeps until the poll interval elapses or ``wake()`` is called.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        use_case_factory: UseCaseFactory,
+        poll_interval_seconds: float = 5.0,
+        error_backoff_seconds: float = 5.0,
+    ):
+        self._session_factory = session_factory
+        self._use_case_factory = use_case_factory
+        self._poll_interval = poll_interval_seconds
+        self._error_backoff = error_backoff_seconds
+        self._running = False
+        self._wake_event = asyncio.Event()
+        self._recent: Deque[Tuple[float, int]] = deque()
+        self._totals: Dict[str, int] = {
+            "batches": 0,
+            "processed": 0,
+            "succeeded": 0,
+            "failed": 0,
+            "retried": 0,
+            "errors": 0,
+        }
+        self._last_batch_ms = 0
+
+    async def start(self) -> None:
+        """Run batches until stopped."""
+        self._running = True
+        logger.info("Starting geocoding worker")
+
+        while self._running:
+            try:
+                result = await self.run_batch()
+            except Exception as e:
+                self._totals["errors"] += 1
+                logger.error(f"Error running geocoding batch: {e}")
+                await self._sleep(self._error_backoff)
+                continue
+
+            if result.claimed == 0:
+                await self._sleep(self._poll_interval)
+
+    async def stop(self) -> None:
+        """Stop after the current batch."""
+        self._running = False
+        self._wake_event.set()
+        logger.info("Stopping geocoding worker")
+
+    def wake(self) -> None:
+        """Start the next batch now instead of waiting for the poll interval."""
+        self._wake_event.set()
+
+    async def run_batch(self) -> GeocodingBatchResult:
+        """Geocode one batch on a fresh session and record its metrics."""
+        async with self._session_factory() as session:
+            result = await self._use_case_factory(session).execute()
+
+        if result.claimed:
+            self._totals["batches"] += 1
+            self._totals["processed"] += result.claimed
+            self._totals["succeeded"] += result.succeeded
+            self._totals["failed"] += result.failed
+            self._totals["retried"] += result.retried
+            self._last_batch_ms = result.duration_ms
+            self._recent.append((time.monotonic(), result.claimed))
+        return result
+
+    def metrics(self) -> Dict[str, Any]:
+        """Return cumulative counts and recent throughput."""
+        cutoff = time.monotonic() - THROUGHPUT_WINDOW_SECONDS
+        while self._recent and self._recent[0][0] < cutoff:
+            self._recent.popleft()
+        recent = sum(count for _, count in self._recent)
+        return {
+            "running": self._running,
+            **self._totals,
+            "last_batch_ms": self._last_batch_ms,
+            "throughput_per_second": round(recent / THROUGHPUT_WINDOW_SECONDS, 3),
+        }
+
+    async def _sleep(self, seconds: float) -> None:
+        try:
+            await asyncio.wait_for(self._wake_event.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
+        self._wake_event.clear()
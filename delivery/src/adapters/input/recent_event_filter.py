@@ -0,0 +1,50 @@
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+
+class RecentEventFilter:
+    """
+    Bounded, time-limited set of recently handled event IDs.
+
+    SQS/SNS redeliver the same event within seconds fairly often; checking
+    here first acknowledges those duplicates without a database round trip.
+    The processed_events table remains the source of truth.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 10000,
+        ttl_seconds: float = 300.0,
+        clock: Optional[Callable[[], float]] = None,
+    ):
+        self._max_size = max_size
+        self._ttl = ttl_seconds
+        self._clock = clock or time.monotonic
+        self._entries: "OrderedDict[str, float]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def seen(self, event_id: Optional[str]) -> bool:
+        """Return True if the event was added within the TTL."""
+        if not event_id:
+            return False
+
+        expires_at = self._entries.get(event_id)
+        if expires_at is None:
+            return False
+        if expires_at <= self._clock():
+            del self._entries[event_id]
+            return False
+        return True
+
+    def add(self, event_id: Optional[str]) -> None:
+        """Remember an event as handled, evicting the oldest when full."""
+        if not event_id:
+            return
+
+        self._entries[event_id] = self._clock() + self._ttl
+        self._entries.move_to_end(event_id)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
@@ -1,4 +1,4 @@
-from datetime import date
+from datetime import date, datetime
 from typing import List, Optional
 from uuid import UUID
 
@@ -15,6 +15,26 @@ class GenerateRoutesResponse(BaseModel):
     fecha_entrega_estimada: date
     num_vehicles: int
     num_pending_shipments: int
+    job_id: Optional[UUID] = None
+    job_status: Optional[str] = None
+    deduplicated: bool = False
+
+
+class RouteGenerationJobResponse(BaseModel):
+    id: UUID
+    fecha_entrega_estimada: date
+    vehicle_ids: List[UUID]
+    status: str
+    progress: int
+    num_shipments: int
+    num_routes: int
+    num_assigned_shipments: int
+    num_unassigned_shipments: int
+    error_message: Optional[str] = None
+    created_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    duration_ms: Optional[int] = None
 
 
 class ShipmentInRoute(BaseModel):
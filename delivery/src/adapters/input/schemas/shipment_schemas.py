@@ -1,5 +1,5 @@
 from datetime import date
-from typing import Optional
+from typing import Dict, List, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -15,6 +15,10 @@ class ShipmentResponse(BaseModel):
     route_id: Optional[UUID] = None
 
 
+class ShipmentListResponse(BaseModel):
+    items: List[ShipmentResponse]
+
+
 class ShipmentStatusUpdateRequest(BaseModel):
     shipment_status: str = Field(..., pattern="^(in_transit|delivered)$")
 
@@ -24,3 +28,17 @@ class ShipmentStatusUpdateResponse(BaseModel):
     order_id: UUID
     shipment_status: str
     message: str
+
+
+class GeocodingMetricsResponse(BaseModel):
+    queue_depth: int
+    running: bool
+    batches: int
+    processed: int
+    succeeded: int
+    failed: int
+    retried: int
+    errors: int
+    last_batch_ms: int
+    throughput_per_second: float
+    cache: Optional[Dict[str, int]] = None
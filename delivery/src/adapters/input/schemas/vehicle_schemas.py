@@ -2,18 +2,22 @@ from datetime import datetime
 from typing import List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class VehicleCreateRequest(BaseModel):
     placa: str
     driver_name: str
     driver_phone: Optional[str] = None
+    max_stops: Optional[int] = Field(default=None, gt=0)
+    max_route_minutes: Optional[int] = Field(default=None, gt=0)
 
 
 class VehicleUpdateRequest(BaseModel):
     driver_name: Optional[str] = None
     driver_phone: Optional[str] = None
+    max_stops: Optional[int] = Field(default=None, gt=0)
+    max_route_minutes: Optional[int] = Field(default=None, gt=0)
 
 
 class VehicleResponse(BaseModel):
@@ -22,6 +26,8 @@ class VehicleResponse(BaseModel):
     driver_name: str
     driver_phone: Optional[str] = None
     is_active: bool
+    max_stops: Optional[int] = None
+    max_route_minutes: Optional[int] = None
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
@@ -2,18 +2,35 @@ import asyncio
 import json
 import logging
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Callable, Dict, List, Optional, Set
 
 import aioboto3
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.adapters.input.recent_event_filter import RecentEventFilter
+from src.application.ports import ProcessedEventRepositoryPort
 from src.application.use_cases.consume_order_created import ConsumeOrderCreatedUseCase
 from src.domain.exceptions import DuplicateEventError
 
 logger = logging.getLogger(__name__)
 
+UseCaseFactory = Callable[[AsyncSession], ConsumeOrderCreatedUseCase]
+ProcessedEventRepositoryFactory = Callable[[AsyncSession], ProcessedEventRepositoryPort]
+
 
 class SQSConsumer:
-    """SQS consumer for order_created events."""
+    """
+    SQS consumer for order_created events.
+
+    Keeps one SQS client open for its lifetime (it is only recreated after a
+    client error) and handles up to ``max_concurrency`` messages at once.
+    Every message runs in its own short-lived database session, so a failed
+    or slow message never shares a connection or transaction with another.
+
+    Duplicates are dropped before a session is opened where possible: events
+    this process handled recently are skipped from memory, and redelivered
+    messages in a batch are checked against processed_events in one query.
+    """
 
     def __init__(
         self,
@@ -22,14 +39,31 @@ class SQSConsumer:
         access_key_id: str,
         secret_access_key: str,
         endpoint_url: str | None,
-        use_case: ConsumeOrderCreatedUseCase,
+        session_factory: Callable[[], AsyncSession],
+        use_case_factory: UseCaseFactory,
+        processed_event_repository_factory: Optional[ProcessedEventRepositoryFactory] = None,
+        recent_events: Optional[RecentEventFilter] = None,
+        max_concurrency: int = 10,
+        wait_time_seconds: int = 20,
+        error_backoff_seconds: float = 5.0,
+        shutdown_timeout_seconds: float = 30.0,
     ):
         self._queue_url = queue_url
         self._region = region
         self._access_key_id = access_key_id
         self._secret_access_key = secret_access_key
         self._endpoint_url = endpoint_url
-        self._use_case = use_case
+        self._session_factory = session_factory
+        self._use_case_factory = use_case_factory
+        self._processed_event_repository_factory = processed_event_repository_factory
+        self._recent_events = recent_events
+        self._max_concurrency = max_concurrency
+        self._wait_time_seconds = wait_time_seconds
+        self._error_backoff = error_backoff_seconds
+        self._shutdown_timeout = shutdown_timeout_seconds
+        self._aws_session = aioboto3.Session()
+        self._slots = asyncio.Semaphore(max_concurrency)
+        self._tasks: Set[asyncio.Task] = set()
         self._running = False
 
     async def start(self) -> None:
@@ -39,41 +73,132 @@ class SQSConsumer:
 
         while self._running:
             try:
-                await self._poll_messages()
+                async with self._create_client() as sqs:
+                    while self._running:
+                        await self._poll_messages(sqs)
             except Exception as e:
                 logger.error(f"Error polling messages: {e}")
-                await asyncio.sleep(5)
+                await asyncio.sleep(self._error_backoff)
 
     async def stop(self) -> None:
-        """Stop consuming messages."""
+        """Stop consuming messages and wait for in-flight messages to finish."""
         self._running = False
         logger.info("Stopping SQS consumer")
 
-    async def _poll_messages(self) -> None:
-        """Poll for messages from SQS."""
-        session = aioboto3.Session()
+        if self._tasks:
+            _, pending = await asyncio.wait(self._tasks, timeout=self._shutdown_timeout)
+            if pending:
+                logger.warning(
+                    f"{len(pending)} messages still in flight after shutdown timeout; "
+                    "they will be redelivered"
+                )
 
-        async with session.client(
+    def _create_client(self):
+        return self._aws_session.client(
             "sqs",
             region_name=self._region,
             aws_access_key_id=self._access_key_id,
             aws_secret_access_key=self._secret_access_key,
             endpoint_url=self._endpoint_url,
-        ) as sqs:
-            response = await sqs.receive_message(
-                QueueUrl=self._queue_url,
-                MaxNumberOfMessages=10,
-                WaitTimeSeconds=20,
-                MessageAttributeNames=["All"],
+        )
+
+    async def _poll_messages(self, sqs) -> None:
+        """Receive as many messages as there are free slots and dispatch them."""
+        # Wait for at least one free slot before asking SQS for more work
+        await self._slots.acquire()
+        self._slots.release()
+        free_slots = min(10, self._max_concurrency - len(self._tasks))
+
+        response = await sqs.receive_message(
+            QueueUrl=self._queue_url,
+            MaxNumberOfMessages=max(free_slots, 1),
+            WaitTimeSeconds=self._wait_time_seconds,
+            AttributeNames=["ApproximateReceiveCount"],
+            MessageAttributeNames=["All"],
+        )
+
+        messages = await self._drop_duplicates(sqs, response.get("Messages", []))
+        for message in messages:
+            await self._slots.acquire()
+            task = asyncio.create_task(self._run_message(sqs, message))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _drop_duplicates(
+        self, sqs, messages: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Delete messages whose event was already processed and return the rest."""
+        if not messages:
+            return messages
+
+        event_ids = {m["MessageId"]: self._event_id(m) for m in messages}
+        duplicates: Set[str] = set()
+
+        if self._recent_events is not None:
+            duplicates = {
+                message_id
+                for message_id, event_id in event_ids.items()
+                if self._recent_events.seen(event_id)
+            }
+
+        # First deliveries are claimed by the use case itself; only
+        # redeliveries are likely duplicates worth a batched lookup
+        redelivered = [
+            event_ids[m["MessageId"]]
+            for m in messages
+            if event_ids[m["MessageId"]]
+            and m["MessageId"] not in duplicates
+            and int(m.get("Attributes", {}).get("ApproximateReceiveCount", "1")) > 1
+        ]
+        if redelivered and self._processed_event_repository_factory is not None:
+            try:
+                async with self._session_factory() as session:
+                    repository = self._processed_event_repository_factory(session)
+                    unprocessed = set(await repository.filter_unprocessed(redelivered))
+            except Exception as e:
+                logger.warning(f"Batch idempotency check failed, checking per message: {e}")
+                unprocessed = set(redelivered)
+            duplicates |= {
+                message_id
+                for message_id, event_id in event_ids.items()
+                if event_id in redelivered and event_id not in unprocessed
+            }
+
+        if not duplicates:
+            return messages
+
+        logger.info(f"Skipping {len(duplicates)} already processed messages")
+        await asyncio.gather(
+            *(
+                self._delete_message(sqs, m["ReceiptHandle"])
+                for m in messages
+                if m["MessageId"] in duplicates
             )
+        )
+        return [m for m in messages if m["MessageId"] not in duplicates]
+
+    @staticmethod
+    def _event_id(message: Dict[str, Any]) -> Optional[str]:
+        """Extract the event_id of a message, or None if it cannot be parsed."""
+        try:
+            body = json.loads(message["Body"])
+            event = json.loads(body["Message"]) if "Message" in body else body
+            return event.get("event_id")
+        except (ValueError, TypeError, AttributeError, KeyError):
+            return None
 
-            messages = response.get("Messages", [])
-            for message in messages:
-                await self._process_message(sqs, message)
+    async def _run_message(self, sqs, message: Dict[str, Any]) -> None:
+        try:
+            await self._process_message(sqs, message)
+        except Exception as e:
+            logger.error(f"Error deleting message {message.get('MessageId')}: {e}")
+        finally:
+            self._slots.release()
 
     async def _process_message(self, sqs, message: Dict[str, Any]) -> None:
         """Process a single SQS message."""
         receipt_handle = message["ReceiptHandle"]
+        event_id = None
 
         try:
             # Parse SNS wrapper if present
@@ -90,6 +215,8 @@ class SQSConsumer:
                 await self._delete_message(sqs, receipt_handle)
                 return
 
+            event_id = event.get("event_id")
+
             # Log received event data for debugging
             logger.info(f"Received event data: {json.dumps(event, default=str)}")
 
@@ -102,18 +229,20 @@ class SQSConsumer:
             else:
                 fecha_pedido = fecha_pedido_str
 
-            # Execute use case
-            await self._use_case.execute(
-                event_id=event.get("event_id"),
-                order_id=event.get("order_id"),
-                customer_id=event.get("customer_id"),
-                direccion_entrega=event.get("direccion_entrega"),
-                ciudad_entrega=event.get("ciudad_entrega"),
-                pais_entrega=event.get("pais_entrega"),
-                fecha_pedido=fecha_pedido,
-            )
+            # Execute use case in a session owned by this message
+            async with self._session_factory() as session:
+                use_case = self._use_case_factory(session)
+                await use_case.execute(
+                    event_id=event_id,
+                    order_id=event.get("order_id"),
+                    customer_id=event.get("customer_id"),
+                    direccion_entrega=event.get("direccion_entrega"),
+                    ciudad_entrega=event.get("ciudad_entrega"),
+                    pais_entrega=event.get("pais_entrega"),
+                    fecha_pedido=fecha_pedido,
+                )
 
-            logger.info(f"Processed order_created event: {event.get('event_id')}")
+            logger.info(f"Processed order_created event: {event_id}")
 
         except DuplicateEventError:
             # Already processed, just delete
@@ -123,6 +252,9 @@ class SQSConsumer:
             # Don't delete - will retry after visibility timeout
             return
 
+        if self._recent_events is not None:
+            self._recent_events.add(event_id)
+
         # Delete message on success
         await self._delete_message(sqs, receipt_handle)
 
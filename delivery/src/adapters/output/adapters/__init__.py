@@ -1,4 +1,11 @@
+from .cached_geocoding import CachedGeocodingService
 from .nominatim_geocoding import NominatimGeocodingService
+from .process_pool_route_optimizer import ProcessPoolRouteOptimizer
 from .sqs_event_publisher import SQSEventPublisher
 
-__all__ = ["NominatimGeocodingService", "SQSEventPublisher"]
+__all__ = [
+    "CachedGeocodingService",
+    "NominatimGeocodingService",
+    "ProcessPoolRouteOptimizer",
+    "SQSEventPublisher",
+]
@@ -0,0 +1,223 @@
+"""
+Two-level geocoding cache in front of an upstream GeocodingPort.
+
+Lookups are keyed by the normalized (address, city, country). An in-process
+LRU answers repeated addresses without I/O; misses fall through to the
+``geocode_cache`` table and only then to the provider, so the provider's
+rate limit is spent on addresses that have never been seen (or whose entry
+expired). Provider "no match" answers are cached as negative entries with a
+shorter TTL.
+"""
+
+import asyncio
+import logging
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Callable, Dict, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.ports import GeocodeCacheRepositoryPort, GeocodingPort
+from src.domain.entities import GeocodeCacheEntry
+from src.domain.exceptions import AddressNotFoundError, GeocodingError
+
+logger = logging.getLogger(__name__)
+
+SessionFactory = Callable[[], AsyncSession]
+RepositoryFactory = Callable[[AsyncSession], GeocodeCacheRepositoryPort]
+
+
+@dataclass
+class GeocodeCacheStats:
+    """In-process counters for the geocoding cache."""
+
+    memory_hits: int = 0
+    persistent_hits: int = 0
+    misses: int = 0
+    upstream_calls: int = 0
+    upstream_errors: int = 0
+    stale_served: int = 0
+    cache_errors: int = 0
+
+
+class CachedGeocodingService(GeocodingPort):
+    """GeocodingPort decorator backed by an LRU and the geocode_cache table."""
+
+    def __init__(
+        self,
+        upstream: GeocodingPort,
+        session_factory: SessionFactory,
+        repository_factory: RepositoryFactory,
+        memory_size: int = 10000,
+        ttl: timedelta = timedelta(days=90),
+        negative_ttl: timedelta = timedelta(hours=24),
+        hit_flush_threshold: int = 100,
+    ):
+        """
+        Args:
+            upstream: Provider used on cache misses
+            session_factory: Creates the short-lived sessions used for cache
+                reads and writes (independent of the caller's session)
+            repository_factory: Builds a cache repository for a session
+            memory_size: Maximum entries kept in the in-process LRU
+            ttl: Age after which coordinates are refreshed from the provider
+            negative_ttl: Age after which "no match" answers are retried
+            hit_flush_threshold: Buffered hits that trigger a counter flush
+        """
+        self._upstream = upstream
+        self._session_factory = session_factory
+        self._repository_factory = repository_factory
+        self._memory_size = memory_size
+        self._ttl = ttl
+        self._negative_ttl = negative_ttl
+        self._hit_flush_threshold = hit_flush_threshold
+        self._memory: "OrderedDict[str, GeocodeCacheEntry]" = OrderedDict()
+        self._pending_hits: Dict[str, int] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.stats = GeocodeCacheStats()
+
+    async def geocode_address(
+        self,
+        address: str,
+        city: str,
+        country: str,
+    ) -> Tuple[Decimal, Decimal]:
+        """
+        Resolve an address from the cache, falling back to the provider.
+
+        Raises:
+            AddressNotFoundError: If the provider has (or had) no match
+            GeocodingError: If the provider fails and nothing is cached
+        """
+        key = GeocodeCacheEntry.build_key(address, city, country)
+
+        entry = self._memory.get(key)
+        if entry is not None and not self._expired(entry):
+            self._memory.move_to_end(key)
+            self.stats.memory_hits += 1
+            await self._record_hit(key)
+            return self._resolve(entry, address, city, country)
+
+        # Concurrent lookups of the same address share one resolution
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            entry = await asyncio.shield(inflight)
+            return self._resolve(entry, address, city, country)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            entry = await self._load(key, address, city, country)
+            future.set_result(entry)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Nobody may be waiting on the future; mark the error retrieved
+            future.exception()
+            raise
+        finally:
+            del self._inflight[key]
+
+        return self._resolve(entry, address, city, country)
+
+    async def flush_hits(self) -> int:
+        """Write buffered hit counts to the cache table."""
+        hits, self._pending_hits = self._pending_hits, {}
+        if not hits:
+            return 0
+        try:
+            async with self._session_factory() as session:
+                updated = await self._repository_factory(session).increment_hits(hits)
+                await session.commit()
+            return updated
+        except Exception as e:
+            self.stats.cache_errors += 1
+            logger.warning(f"Could not flush geocode cache hit counts: {e}")
+            return 0
+
+    def metrics(self) -> Dict[str, int]:
+        """Return cache counters plus the current LRU size."""
+        return {**asdict(self.stats), "memory_entries": len(self._memory)}
+
+    async def _load(
+        self, key: str, address: str, city: str, country: str
+    ) -> GeocodeCacheEntry:
+        """Resolve a key that is not fresh in memory: table, then provider."""
+        stored = await self._find_stored(key)
+        if stored is not None and not self._expired(stored):
+            self.stats.persistent_hits += 1
+            self._remember(stored)
+            await self._record_hit(key)
+            return stored
+
+        self.stats.misses += 1
+        self.stats.upstream_calls += 1
+        try:
+            coordinates = await self._upstream.geocode_address(address, city, country)
+        except AddressNotFoundError:
+            entry = GeocodeCacheEntry.create(address, city, country, None)
+        except GeocodingError as e:
+            self.stats.upstream_errors += 1
+            if stored is not None and stored.found:
+                # Refresh rule: keep serving expired coordinates while the
+                # provider is unavailable rather than failing the shipment
+                self.stats.stale_served += 1
+                logger.warning(f"Serving stale geocode for key {key[:12]}: {e}")
+                self._remember(stored)
+                return stored
+            raise
+        else:
+            entry = GeocodeCacheEntry.create(address, city, country, coordinates)
+
+        if stored is not None:
+            entry.hit_count = stored.hit_count
+            entry.lookup_count = stored.lookup_count + 1
+        await self._store(entry)
+        self._remember(entry)
+        return entry
+
+    async def _find_stored(self, key: str) -> Optional[GeocodeCacheEntry]:
+        try:
+            async with self._session_factory() as session:
+                return await self._repository_factory(session).find_by_key(key)
+        except Exception as e:
+            self.stats.cache_errors += 1
+            logger.warning(f"Geocode cache lookup failed, using provider: {e}")
+            return None
+
+    async def _store(self, entry: GeocodeCacheEntry) -> None:
+        try:
+            async with self._session_factory() as session:
+                await self._repository_factory(session).upsert(entry)
+                await session.commit()
+        except Exception as e:
+            self.stats.cache_errors += 1
+            logger.warning(f"Could not persist geocode cache entry: {e}")
+
+    async def _record_hit(self, key: str) -> None:
+        self._pending_hits[key] = self._pending_hits.get(key, 0) + 1
+        if sum(self._pending_hits.values()) >= self._hit_flush_threshold:
+            await self.flush_hits()
+
+    def _remember(self, entry: GeocodeCacheEntry) -> None:
+        self._memory[entry.address_key] = entry
+        self._memory.move_to_end(entry.address_key)
+        while len(self._memory) > self._memory_size:
+            self._memory.popitem(last=False)
+
+    def _expired(self, entry: GeocodeCacheEntry) -> bool:
+        return entry.is_expired(self._ttl, self._negative_ttl, datetime.now(timezone.utc))
+
+    @staticmethod
+    def _resolve(
+        entry: GeocodeCacheEntry, address: str, city: str, country: str
+    ) -> Tuple[Decimal, Decimal]:
+        if not entry.found:
+            raise AddressNotFoundError(
+                f"No results for address: {address}, {city}, {country} (cached)"
+            )
+        return entry.coordinates
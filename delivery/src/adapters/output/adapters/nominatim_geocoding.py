@@ -1,12 +1,12 @@
-import asyncio
 import logging
 from decimal import Decimal, InvalidOperation
-from typing import Tuple
+from typing import Optional, Tuple
 
 import httpx
 
 from src.application.ports import GeocodingPort
-from src.domain.exceptions import GeocodingError
+from src.domain.exceptions import AddressNotFoundError, GeocodingError
+from src.infrastructure.rate_limiting import TokenBucket
 
 logger = logging.getLogger(__name__)
 
@@ -14,10 +14,15 @@ logger = logging.getLogger(__name__)
 class NominatimGeocodingService(GeocodingPort):
     """Nominatim geocoding service implementation."""
 
-    def __init__(self, base_url: str, rate_limit_seconds: float = 1.0):
+    def __init__(
+        self,
+        base_url: str,
+        rate_limit_seconds: float = 1.0,
+        rate_limiter: Optional[TokenBucket] = None,
+    ):
         self._base_url = base_url.rstrip("/")
-        self._rate_limit = rate_limit_seconds
-        self._last_request_time = 0.0
+        # Shared by every concurrent call on this instance
+        self._rate_limiter = rate_limiter or TokenBucket.per_interval(rate_limit_seconds)
 
     async def geocode_address(
         self,
@@ -40,11 +45,7 @@ class NominatimGeocodingService(GeocodingPort):
             GeocodingError: If geocoding fails
         """
         # Rate limiting
-        import time
-        current_time = time.time()
-        time_since_last = current_time - self._last_request_time
-        if time_since_last < self._rate_limit:
-            await asyncio.sleep(self._rate_limit - time_since_last)
+        await self._rate_limiter.acquire()
 
         # Build query
         query = f"{address}, {city}, {country}"
@@ -61,7 +62,6 @@ class NominatimGeocodingService(GeocodingPort):
         try:
             async with httpx.AsyncClient() as client:
                 response = await client.get(url, params=params, headers=headers, timeout=10.0)
-                self._last_request_time = time.time()
 
                 if response.status_code != 200:
                     raise GeocodingError(
@@ -70,7 +70,7 @@ class NominatimGeocodingService(GeocodingPort):
 
                 results = response.json()
                 if not results:
-                    raise GeocodingError(f"No results for address: {query}")
+                    raise AddressNotFoundError(f"No results for address: {query}")
 
                 result = results[0]
                 latitude = Decimal(result["lat"])
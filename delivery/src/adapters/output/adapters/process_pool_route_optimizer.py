@@ -0,0 +1,74 @@
+import logging
+from typing import List
+
+import numpy as np
+
+from src.application.ports import (
+    RouteOptimizationPlan,
+    RouteOptimizationPort,
+)
+from src.domain.entities import Shipment, Vehicle
+from src.domain.services.distance_matrix import shipment_coordinates
+from src.domain.services.route_optimizer import (
+    GreedyRouteOptimizer,
+    RouteSolution,
+    VehicleLimits,
+)
+from src.infrastructure.executors import OptimizationExecutor
+
+logger = logging.getLogger(__name__)
+
+
+def _solve(
+    optimizer: GreedyRouteOptimizer,
+    coords: np.ndarray,
+    limits: VehicleLimits,
+) -> RouteSolution:
+    """Worker-process entry point."""
+    return optimizer.solve(coords, limits)
+
+
+class ProcessPoolRouteOptimizer(RouteOptimizationPort):
+    """
+    Runs a GreedyRouteOptimizer in a worker process.
+
+    Only a compact array form crosses the process boundary: an (n, 2)
+    float64 coordinate array and per-vehicle limits go out, index-based
+    routes come back and are mapped onto the original entities here.
+    """
+
+    def __init__(self, optimizer: GreedyRouteOptimizer, executor: OptimizationExecutor):
+        self._optimizer = optimizer
+        self._executor = executor
+
+    async def plan_routes(
+        self,
+        shipments: List[Shipment],
+        vehicles: List[Vehicle],
+    ) -> RouteOptimizationPlan:
+        """Optimize routes in the process pool."""
+        if not shipments:
+            logger.warning("No shipments to optimize")
+            return RouteOptimizationPlan(routes=[])
+
+        if not vehicles:
+            raise ValueError("At least one vehicle is required")
+
+        valid_shipments, unassigned = self._optimizer.split_geocoded(shipments)
+        if not valid_shipments:
+            logger.warning("No shipments with valid coordinates")
+            return RouteOptimizationPlan(routes=[], unassigned=unassigned)
+
+        logger.info(
+            f"Optimizing routes for {len(valid_shipments)} shipments "
+            f"and {len(vehicles)} vehicles in worker process"
+        )
+
+        solution = await self._executor.run(
+            _solve,
+            self._optimizer,
+            shipment_coordinates(valid_shipments),
+            VehicleLimits.from_vehicles(vehicles),
+        )
+
+        return self._optimizer.build_plan(solution, valid_shipments, vehicles, unassigned)
@@ -1,4 +1,6 @@
+from .geocode_cache_repository import SQLAlchemyGeocodeCacheRepository
 from .processed_event_repository import SQLAlchemyProcessedEventRepository
+from .route_generation_job_repository import SQLAlchemyRouteGenerationJobRepository
 from .route_repository import SQLAlchemyRouteRepository
 from .shipment_repository import SQLAlchemyShipmentRepository
 from .vehicle_repository import SQLAlchemyVehicleRepository
@@ -6,6 +8,8 @@ from .vehicle_repository import SQLAlchemyVehicleRepository
 __all__ = [
     "SQLAlchemyVehicleRepository",
     "SQLAlchemyRouteRepository",
+    "SQLAlchemyRouteGenerationJobRepository",
     "SQLAlchemyShipmentRepository",
     "SQLAlchemyProcessedEventRepository",
+    "SQLAlchemyGeocodeCacheRepository",
 ]
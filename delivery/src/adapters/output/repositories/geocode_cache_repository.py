@@ -0,0 +1,84 @@
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+from sqlalchemy import Integer, String, column, select, update, values
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.ports import GeocodeCacheRepositoryPort
+from src.domain.entities import GeocodeCacheEntry
+from src.infrastructure.database.models import GeocodeCacheModel
+
+
+class SQLAlchemyGeocodeCacheRepository(GeocodeCacheRepositoryPort):
+    """SQLAlchemy implementation of the geocoding cache repository."""
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def find_by_key(self, address_key: str) -> Optional[GeocodeCacheEntry]:
+        """Find a cached result by address key."""
+        result = await self._session.execute(
+            select(GeocodeCacheModel).where(GeocodeCacheModel.address_key == address_key)
+        )
+        model = result.scalar_one_or_none()
+        return self._to_entity(model) if model else None
+
+    async def upsert(self, entry: GeocodeCacheEntry) -> None:
+        """Insert or refresh an entry with INSERT ... ON CONFLICT DO UPDATE."""
+        stmt = insert(GeocodeCacheModel).values(
+            address_key=entry.address_key,
+            address=entry.address,
+            city=entry.city,
+            country=entry.country,
+            latitude=entry.latitude,
+            longitude=entry.longitude,
+            hit_count=entry.hit_count,
+            lookup_count=entry.lookup_count,
+            refreshed_at=entry.refreshed_at,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[GeocodeCacheModel.address_key],
+            set_={
+                "latitude": stmt.excluded.latitude,
+                "longitude": stmt.excluded.longitude,
+                "refreshed_at": stmt.excluded.refreshed_at,
+                "lookup_count": GeocodeCacheModel.lookup_count + 1,
+            },
+        )
+        await self._session.execute(stmt)
+
+    async def increment_hits(self, hits: Dict[str, int]) -> int:
+        """Apply all buffered hit counts in one UPDATE ... FROM (VALUES ...)."""
+        if not hits:
+            return 0
+        counts = values(
+            column("address_key", String),
+            column("hits", Integer),
+            name="counts",
+        ).data(list(hits.items()))
+        result = await self._session.execute(
+            update(GeocodeCacheModel)
+            .where(GeocodeCacheModel.address_key == counts.c.address_key)
+            .values(
+                hit_count=GeocodeCacheModel.hit_count + counts.c.hits,
+                last_hit_at=datetime.now(timezone.utc),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
+    def _to_entity(self, model: GeocodeCacheModel) -> GeocodeCacheEntry:
+        """Convert model to entity."""
+        return GeocodeCacheEntry(
+            address_key=model.address_key,
+            address=model.address,
+            city=model.city,
+            country=model.country,
+            latitude=model.latitude,
+            longitude=model.longitude,
+            hit_count=model.hit_count,
+            lookup_count=model.lookup_count,
+            refreshed_at=model.refreshed_at,
+            last_hit_at=model.last_hit_at,
+        )
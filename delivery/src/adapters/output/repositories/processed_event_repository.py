@@ -1,7 +1,8 @@
-from datetime import datetime
+from typing import List
 from uuid import uuid4
 
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.ports import ProcessedEventRepositoryPort
@@ -40,3 +41,30 @@ class SQLAlchemyProcessedEventRepository(ProcessedEventRepositoryPort):
             )
         )
         return result.scalar_one_or_none() is not None
+
+    async def save_if_new(self, event: ProcessedEvent) -> bool:
+        """Record an event with INSERT ... ON CONFLICT DO NOTHING RETURNING."""
+        result = await self._session.execute(
+            insert(ProcessedEventModel)
+            .values(
+                id=event.id if event.id else uuid4(),
+                event_id=event.event_id,
+                event_type=event.event_type,
+            )
+            .on_conflict_do_nothing(index_elements=[ProcessedEventModel.event_id])
+            .returning(ProcessedEventModel.id)
+        )
+        return result.scalar_one_or_none() is not None
+
+    async def filter_unprocessed(self, event_ids: List[str]) -> List[str]:
+        """Return the event IDs that have not been processed, in one query."""
+        if not event_ids:
+            return []
+
+        result = await self._session.execute(
+            select(ProcessedEventModel.event_id).where(
+                ProcessedEventModel.event_id.in_(set(event_ids))
+            )
+        )
+        processed = set(result.scalars().all())
+        return [event_id for event_id in event_ids if event_id not in processed]
@@ -0,0 +1,121 @@
+from datetime import datetime, timezone
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import or_, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.ports import RouteGenerationJobRepositoryPort
+from src.domain.entities import RouteGenerationJob
+from src.domain.exceptions import DuplicateRouteJobError
+from src.domain.value_objects import RouteJobStatus
+from src.infrastructure.database.models import RouteGenerationJobModel
+
+ACTIVE_STATUSES = [RouteJobStatus.QUEUED.value, RouteJobStatus.RUNNING.value]
+
+
+class SQLAlchemyRouteGenerationJobRepository(RouteGenerationJobRepositoryPort):
+    """SQLAlchemy implementation of route-generation job repository."""
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def save(self, job: RouteGenerationJob) -> RouteGenerationJob:
+        """Insert a job; the partial unique index rejects a second active job."""
+        model = RouteGenerationJobModel(
+            id=job.id,
+            fecha_entrega_estimada=job.fecha_entrega_estimada,
+            vehicle_ids=job.vehicle_ids,
+            dedup_key=job.dedup_key,
+            status=job.status.value,
+            progress=job.progress,
+            created_at=job.created_at,
+            lease_expires_at=job.lease_expires_at,
+        )
+        try:
+            async with self._session.begin_nested():
+                self._session.add(model)
+        except IntegrityError:
+            raise DuplicateRouteJobError(job.dedup_key)
+        return job
+
+    async def find_by_id(self, job_id: UUID) -> Optional[RouteGenerationJob]:
+        """Find a job by ID."""
+        result = await self._session.execute(
+            select(RouteGenerationJobModel).where(RouteGenerationJobModel.id == job_id)
+        )
+        model = result.scalar_one_or_none()
+        return self._to_entity(model) if model else None
+
+    async def find_active_by_dedup_key(self, dedup_key: str) -> Optional[RouteGenerationJob]:
+        """Find the queued or running job for a dedup key."""
+        result = await self._session.execute(
+            select(RouteGenerationJobModel).where(
+                RouteGenerationJobModel.dedup_key == dedup_key,
+                RouteGenerationJobModel.status.in_(ACTIVE_STATUSES),
+            )
+        )
+        model = result.scalars().first()
+        return self._to_entity(model) if model else None
+
+    async def update(self, job: RouteGenerationJob) -> RouteGenerationJob:
+        """Persist mutable job fields."""
+        result = await self._session.execute(
+            select(RouteGenerationJobModel).where(RouteGenerationJobModel.id == job.id)
+        )
+        model = result.scalar_one_or_none()
+        if model:
+            model.status = job.status.value
+            model.progress = job.progress
+            model.num_shipments = job.num_shipments
+            model.num_routes = job.num_routes
+            model.num_assigned_shipments = job.num_assigned_shipments
+            model.num_unassigned_shipments = job.num_unassigned_shipments
+            model.error_message = job.error_message
+            model.started_at = job.started_at
+            model.finished_at = job.finished_at
+            model.lease_expires_at = job.lease_expires_at
+            await self._session.flush()
+        return job
+
+    async def fail_expired(self, error_message: str) -> int:
+        """Fail every active job whose lease has lapsed with one UPDATE."""
+        now = datetime.now(timezone.utc)
+        result = await self._session.execute(
+            update(RouteGenerationJobModel)
+            .where(
+                RouteGenerationJobModel.status.in_(ACTIVE_STATUSES),
+                or_(
+                    RouteGenerationJobModel.lease_expires_at.is_(None),
+                    RouteGenerationJobModel.lease_expires_at <= now,
+                ),
+            )
+            .values(
+                status=RouteJobStatus.FAILED.value,
+                error_message=error_message,
+                finished_at=now,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
+    def _to_entity(self, model: RouteGenerationJobModel) -> RouteGenerationJob:
+        """Convert model to entity."""
+        return RouteGenerationJob(
+            id=model.id,
+            fecha_entrega_estimada=model.fecha_entrega_estimada,
+            vehicle_ids=list(model.vehicle_ids or []),
+            dedup_key=model.dedup_key,
+            status=RouteJobStatus(model.status),
+            progress=model.progress,
+            num_shipments=model.num_shipments,
+            num_routes=model.num_routes,
+            num_assigned_shipments=model.num_assigned_shipments,
+            num_unassigned_shipments=model.num_unassigned_shipments,
+            error_message=model.error_message,
+            created_at=model.created_at,
+            started_at=model.started_at,
+            finished_at=model.finished_at,
+            lease_expires_at=model.lease_expires_at,
+        )
@@ -1,8 +1,8 @@
 from datetime import date
-from typing import List, Optional
+from typing import Dict, List, Optional
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -15,6 +15,9 @@ from src.infrastructure.database.models import RouteModel, ShipmentModel
 class SQLAlchemyRouteRepository(RouteRepositoryPort):
     """SQLAlchemy implementation of route repository."""
 
+    # Rows per multi-row statement; keeps bind parameters under driver limits
+    BULK_CHUNK_SIZE = 1000
+
     def __init__(self, session: AsyncSession):
         self._session = session
 
@@ -33,6 +36,25 @@ class SQLAlchemyRouteRepository(RouteRepositoryPort):
         await self._session.flush()
         return route
 
+    async def save_many(self, routes: List[Route]) -> List[Route]:
+        """Insert routes with multi-row INSERT statements."""
+        rows = [
+            {
+                "id": route.id,
+                "vehicle_id": route.vehicle_id,
+                "fecha_ruta": route.fecha_ruta,
+                "estado_ruta": route.estado_ruta.value,
+                "duracion_estimada_minutos": route.duracion_estimada_minutos,
+                "total_distance_km": route.total_distance_km,
+                "total_orders": route.total_orders,
+            }
+            for route in routes
+        ]
+        for start in range(0, len(rows), self.BULK_CHUNK_SIZE):
+            chunk = rows[start:start + self.BULK_CHUNK_SIZE]
+            await self._session.execute(insert(RouteModel).values(chunk))
+        return routes
+
     async def find_by_id(self, route_id: UUID) -> Optional[Route]:
         """Find a route by ID with shipments."""
         result = await self._session.execute(
@@ -43,6 +65,15 @@ class SQLAlchemyRouteRepository(RouteRepositoryPort):
         model = result.scalar_one_or_none()
         return self._to_entity(model) if model else None
 
+    async def find_vehicle_ids(self, route_ids: List[UUID]) -> Dict[UUID, UUID]:
+        """Map route IDs to their vehicle IDs without loading shipments."""
+        if not route_ids:
+            return {}
+        result = await self._session.execute(
+            select(RouteModel.id, RouteModel.vehicle_id).where(RouteModel.id.in_(route_ids))
+        )
+        return {route_id: vehicle_id for route_id, vehicle_id in result.all()}
+
     async def find_by_date(self, fecha_ruta: date) -> List[Route]:
         """Find all routes for a specific date."""
         result = await self._session.execute(
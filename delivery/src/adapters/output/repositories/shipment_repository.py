@@ -1,8 +1,9 @@
-from datetime import date
+from datetime import date, datetime, timedelta, timezone
 from typing import List, Optional
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import DateTime, Integer, Numeric, String, column, func, or_, select, update, values
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.ports import ShipmentRepositoryPort
@@ -14,6 +15,9 @@ from src.infrastructure.database.models import ShipmentModel
 class SQLAlchemyShipmentRepository(ShipmentRepositoryPort):
     """SQLAlchemy implementation of shipment repository."""
 
+    # Rows per bulk statement; keeps bind parameters under driver limits
+    BULK_CHUNK_SIZE = 1000
+
     def __init__(self, session: AsyncSession):
         self._session = session
 
@@ -34,6 +38,8 @@ class SQLAlchemyShipmentRepository(ShipmentRepositoryPort):
             fecha_pedido=shipment.fecha_pedido,
             fecha_entrega_estimada=shipment.fecha_entrega_estimada,
             shipment_status=shipment.shipment_status.value,
+            geocoding_attempts=shipment.geocoding_attempts,
+            geocoding_next_attempt_at=shipment.geocoding_next_attempt_at,
         )
         self._session.add(model)
         await self._session.flush()
@@ -55,6 +61,15 @@ class SQLAlchemyShipmentRepository(ShipmentRepositoryPort):
         model = result.scalar_one_or_none()
         return self._to_entity(model) if model else None
 
+    async def find_by_order_ids(self, order_ids: List[UUID]) -> List[Shipment]:
+        """Find the shipments for a set of order IDs in one query."""
+        if not order_ids:
+            return []
+        result = await self._session.execute(
+            select(ShipmentModel).where(ShipmentModel.order_id.in_(order_ids))
+        )
+        return [self._to_entity(m) for m in result.scalars().all()]
+
     async def find_pending_by_date(self, fecha_entrega_estimada: date) -> List[Shipment]:
         """Find all pending shipments for a specific delivery date."""
         result = await self._session.execute(
@@ -89,6 +104,8 @@ class SQLAlchemyShipmentRepository(ShipmentRepositoryPort):
             model.route_id = shipment.route_id
             model.sequence_in_route = shipment.sequence_in_route
             model.shipment_status = shipment.shipment_status.value
+            model.geocoding_attempts = shipment.geocoding_attempts
+            model.geocoding_next_attempt_at = shipment.geocoding_next_attempt_at
             await self._session.flush()
         return shipment
 
@@ -98,6 +115,116 @@ class SQLAlchemyShipmentRepository(ShipmentRepositoryPort):
             await self.update(shipment)
         return shipments
 
+    async def bulk_update_route_assignments(self, shipments: List[Shipment]) -> int:
+        """
+        Update route assignment columns with UPDATE ... FROM (VALUES ...).
+
+        One statement per chunk instead of a SELECT and flush per shipment.
+        """
+        updated = 0
+        for start in range(0, len(shipments), self.BULK_CHUNK_SIZE):
+            chunk = shipments[start:start + self.BULK_CHUNK_SIZE]
+            assignments = values(
+                column("id", PGUUID(as_uuid=True)),
+                column("route_id", PGUUID(as_uuid=True)),
+                column("sequence_in_route", Integer),
+                column("shipment_status", String),
+                name="assignments",
+            ).data([
+                (s.id, s.route_id, s.sequence_in_route, s.shipment_status.value)
+                for s in chunk
+            ])
+            result = await self._session.execute(
+                update(ShipmentModel)
+                .where(ShipmentModel.id == assignments.c.id)
+                .values(
+                    route_id=assignments.c.route_id,
+                    sequence_in_route=assignments.c.sequence_in_route,
+                    shipment_status=assignments.c.shipment_status,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            updated += result.rowcount
+        return updated
+
+    async def claim_pending_geocoding(self, limit: int, lease: timedelta) -> List[Shipment]:
+        """
+        Claim due pending shipments with UPDATE ... WHERE id IN (SELECT ...
+        FOR UPDATE SKIP LOCKED) RETURNING, so concurrent workers never
+        claim the same row.
+        """
+        now = datetime.now(timezone.utc)
+        due = (
+            select(ShipmentModel.id)
+            .where(ShipmentModel.geocoding_status == GeocodingStatus.PENDING.value)
+            .where(
+                or_(
+                    ShipmentModel.geocoding_next_attempt_at.is_(None),
+                    ShipmentModel.geocoding_next_attempt_at <= now,
+                )
+            )
+            .order_by(ShipmentModel.created_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self._session.execute(
+            update(ShipmentModel)
+            .where(ShipmentModel.id.in_(due.scalar_subquery()))
+            .values(geocoding_next_attempt_at=now + lease)
+            .returning(ShipmentModel)
+            .execution_options(synchronize_session=False)
+        )
+        models = sorted(result.scalars().all(), key=lambda m: m.created_at or now)
+        return [self._to_entity(m) for m in models]
+
+    async def count_pending_geocoding(self) -> int:
+        """Count shipments still waiting for geocoding."""
+        result = await self._session.execute(
+            select(func.count())
+            .select_from(ShipmentModel)
+            .where(ShipmentModel.geocoding_status == GeocodingStatus.PENDING.value)
+        )
+        return result.scalar_one()
+
+    async def bulk_update_geocoding(self, shipments: List[Shipment]) -> int:
+        """Update geocoding columns with UPDATE ... FROM (VALUES ...)."""
+        updated = 0
+        for start in range(0, len(shipments), self.BULK_CHUNK_SIZE):
+            chunk = shipments[start:start + self.BULK_CHUNK_SIZE]
+            results = values(
+                column("id", PGUUID(as_uuid=True)),
+                column("latitude", Numeric(10, 8)),
+                column("longitude", Numeric(11, 8)),
+                column("geocoding_status", String),
+                column("geocoding_attempts", Integer),
+                column("geocoding_next_attempt_at", DateTime(timezone=True)),
+                name="results",
+            ).data([
+                (
+                    s.id,
+                    s.latitude,
+                    s.longitude,
+                    s.geocoding_status.value,
+                    s.geocoding_attempts,
+                    s.geocoding_next_attempt_at,
+                )
+                for s in chunk
+            ])
+            result = await self._session.execute(
+                update(ShipmentModel)
+                .where(ShipmentModel.id == results.c.id)
+                .values(
+                    latitude=results.c.latitude,
+                    longitude=results.c.longitude,
+                    geocoding_status=results.c.geocoding_status,
+                    geocoding_attempts=results.c.geocoding_attempts,
+                    geocoding_next_attempt_at=results.c.geocoding_next_attempt_at,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            updated += result.rowcount
+        return updated
+
     def _to_entity(self, model: ShipmentModel) -> Shipment:
         """Convert model to entity."""
         return Shipment(
@@ -115,4 +242,6 @@ class SQLAlchemyShipmentRepository(ShipmentRepositoryPort):
             fecha_pedido=model.fecha_pedido,
             fecha_entrega_estimada=model.fecha_entrega_estimada,
             shipment_status=ShipmentStatus(model.shipment_status),
+            geocoding_attempts=model.geocoding_attempts or 0,
+            geocoding_next_attempt_at=model.geocoding_next_attempt_at,
         )
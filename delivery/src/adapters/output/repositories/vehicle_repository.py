@@ -23,6 +23,8 @@ class SQLAlchemyVehicleRepository(VehicleRepositoryPort):
             driver_name=vehicle.driver_name,
             driver_phone=vehicle.driver_phone,
             is_active=vehicle.is_active,
+            max_stops=vehicle.max_stops,
+            max_route_minutes=vehicle.max_route_minutes,
         )
         self._session.add(model)
         await self._session.flush()
@@ -75,6 +77,8 @@ class SQLAlchemyVehicleRepository(VehicleRepositoryPort):
             model.driver_name = vehicle.driver_name
             model.driver_phone = vehicle.driver_phone
             model.is_active = vehicle.is_active
+            model.max_stops = vehicle.max_stops
+            model.max_route_minutes = vehicle.max_route_minutes
             await self._session.flush()
         return vehicle
 
@@ -96,4 +100,6 @@ class SQLAlchemyVehicleRepository(VehicleRepositoryPort):
             driver_name=model.driver_name,
             driver_phone=model.driver_phone,
             is_active=model.is_active,
+            max_stops=model.max_stops,
+            max_route_minutes=model.max_route_minutes,
         )
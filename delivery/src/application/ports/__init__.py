@@ -1,6 +1,13 @@
+from .geocode_cache_repository_port import GeocodeCacheRepositoryPort
 from .geocoding_port import GeocodingPort
 from .processed_event_repository_port import ProcessedEventRepositoryPort
-from .route_optimization_port import RouteOptimizationPort, RouteOptimizationResult
+from .route_generation_job_repository_port import RouteGenerationJobRepositoryPort
+from .route_optimization_port import (
+    RouteOptimizationPlan,
+    RouteOptimizationPort,
+    RouteOptimizationResult,
+    UnassignedShipment,
+)
 from .route_repository_port import RouteRepositoryPort
 from .shipment_repository_port import ShipmentRepositoryPort
 from .sqs_event_publisher_port import SQSEventPublisherPort
@@ -9,10 +16,14 @@ from .vehicle_repository_port import VehicleRepositoryPort
 __all__ = [
     "VehicleRepositoryPort",
     "RouteRepositoryPort",
+    "RouteGenerationJobRepositoryPort",
     "ShipmentRepositoryPort",
     "ProcessedEventRepositoryPort",
     "GeocodingPort",
+    "GeocodeCacheRepositoryPort",
     "RouteOptimizationPort",
     "RouteOptimizationResult",
+    "RouteOptimizationPlan",
+    "UnassignedShipment",
     "SQSEventPublisherPort",
 ]
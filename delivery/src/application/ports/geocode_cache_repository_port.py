@@ -0,0 +1,36 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Optional
+
+from src.domain.entities import GeocodeCacheEntry
+
+
+class GeocodeCacheRepositoryPort(ABC):
+    """Port for the persistent geocoding cache."""
+
+    @abstractmethod
+    async def find_by_key(self, address_key: str) -> Optional[GeocodeCacheEntry]:
+        """Find a cached result by its normalized address key."""
+        pass
+
+    @abstractmethod
+    async def upsert(self, entry: GeocodeCacheEntry) -> None:
+        """
+        Insert an entry or refresh an existing one.
+
+        Refreshing replaces the coordinates and refreshed_at and increments
+        lookup_count; hit_count is preserved.
+        """
+        pass
+
+    @abstractmethod
+    async def increment_hits(self, hits: Dict[str, int]) -> int:
+        """
+        Add buffered cache hits to the stored counters.
+
+        Args:
+            hits: Mapping of address key to number of hits
+
+        Returns:
+            Number of entries updated
+        """
+        pass
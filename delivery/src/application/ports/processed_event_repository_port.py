@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import List
 
 from src.domain.entities import ProcessedEvent
 
@@ -15,3 +16,18 @@ class ProcessedEventRepositoryPort(ABC):
     async def exists(self, event_id: str) -> bool:
         """Check if an event has been processed."""
         pass
+
+    @abstractmethod
+    async def save_if_new(self, event: ProcessedEvent) -> bool:
+        """
+        Record an event unless it was already processed, in one statement.
+
+        Returns:
+            True if the event was recorded, False if it is a duplicate
+        """
+        pass
+
+    @abstractmethod
+    async def filter_unprocessed(self, event_ids: List[str]) -> List[str]:
+        """Return the event IDs that have not been processed, in the order given."""
+        pass
@@ -0,0 +1,44 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+from uuid import UUID
+
+from src.domain.entities import RouteGenerationJob
+
+
+class RouteGenerationJobRepositoryPort(ABC):
+    """Port for route-generation job persistence."""
+
+    @abstractmethod
+    async def save(self, job: RouteGenerationJob) -> RouteGenerationJob:
+        """
+        Insert a new job.
+
+        Raises:
+            DuplicateRouteJobError: If an active job with the same dedup_key exists
+        """
+        pass
+
+    @abstractmethod
+    async def find_by_id(self, job_id: UUID) -> Optional[RouteGenerationJob]:
+        """Find a job by ID."""
+        pass
+
+    @abstractmethod
+    async def find_active_by_dedup_key(self, dedup_key: str) -> Optional[RouteGenerationJob]:
+        """Find the queued or running job for a date + vehicle set, if any."""
+        pass
+
+    @abstractmethod
+    async def update(self, job: RouteGenerationJob) -> RouteGenerationJob:
+        """Persist status, progress, counts, timing and lease of a job."""
+        pass
+
+    @abstractmethod
+    async def fail_expired(self, error_message: str) -> int:
+        """
+        Fail all queued or running jobs whose lease has expired.
+
+        Returns:
+            Number of jobs failed
+        """
+        pass
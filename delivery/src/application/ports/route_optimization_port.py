@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from decimal import Decimal
-from typing import List
+from typing import List, Optional
 
 from src.domain.entities import Shipment, Vehicle
 
@@ -14,6 +14,31 @@ class RouteOptimizationResult:
     shipments: List[Shipment]  # Ordered by delivery sequence
     total_distance_km: Decimal
     estimated_duration_minutes: int
+    # Distance of the initial construction before any improvement stage
+    initial_distance_km: Optional[Decimal] = None
+
+    @property
+    def distance_saved_km(self) -> Decimal:
+        """Distance removed by the improvement stage (0 if none ran)."""
+        if self.initial_distance_km is None:
+            return Decimal("0")
+        return self.initial_distance_km - self.total_distance_km
+
+
+@dataclass
+class UnassignedShipment:
+    """Shipment the optimizer could not place on any route."""
+
+    shipment: Shipment
+    reason: str  # not_geocoded | vehicle_capacity | route_duration
+
+
+@dataclass
+class RouteOptimizationPlan:
+    """Routes produced by an optimization run plus the shipments left out."""
+
+    routes: List[RouteOptimizationResult]
+    unassigned: List[UnassignedShipment] = field(default_factory=list)
 
 
 class RouteOptimizationPort(ABC):
@@ -24,6 +49,23 @@ class RouteOptimizationPort(ABC):
     """
 
     @abstractmethod
+    async def plan_routes(
+        self,
+        shipments: List[Shipment],
+        vehicles: List[Vehicle],
+    ) -> RouteOptimizationPlan:
+        """
+        Optimize routes and report shipments that could not be assigned.
+
+        Args:
+            shipments: List of shipments to assign
+            vehicles: List of available vehicles (with optional limits)
+
+        Returns:
+            Plan with one result per used vehicle and the unassigned shipments
+        """
+        pass
+
     async def optimize_routes(
         self,
         shipments: List[Shipment],
@@ -39,4 +81,5 @@ class RouteOptimizationPort(ABC):
         Returns:
             List of optimization results, one per vehicle
         """
-        pass
+        plan = await self.plan_routes(shipments, vehicles)
+        return plan.routes
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from datetime import date
-from typing import List, Optional
+from typing import Dict, List, Optional
 from uuid import UUID
 
 from src.domain.entities import Route
@@ -14,11 +14,21 @@ class RouteRepositoryPort(ABC):
         """Save a route with its shipments."""
         pass
 
+    @abstractmethod
+    async def save_many(self, routes: List[Route]) -> List[Route]:
+        """Insert several routes in bulk (route rows only, not shipments)."""
+        pass
+
     @abstractmethod
     async def find_by_id(self, route_id: UUID) -> Optional[Route]:
         """Find a route by ID with shipments."""
         pass
 
+    @abstractmethod
+    async def find_vehicle_ids(self, route_ids: List[UUID]) -> Dict[UUID, UUID]:
+        """Map route IDs to their vehicle IDs without loading shipments."""
+        pass
+
     @abstractmethod
     async def find_by_date(self, fecha_ruta: date) -> List[Route]:
         """Find all routes for a specific date."""
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from datetime import date
+from datetime import date, timedelta
 from typing import List, Optional
 from uuid import UUID
 
@@ -24,6 +24,11 @@ class ShipmentRepositoryPort(ABC):
         """Find a shipment by order ID."""
         pass
 
+    @abstractmethod
+    async def find_by_order_ids(self, order_ids: List[UUID]) -> List[Shipment]:
+        """Find the shipments for a set of order IDs in one query."""
+        pass
+
     @abstractmethod
     async def find_pending_by_date(self, fecha_entrega_estimada: date) -> List[Shipment]:
         """Find all pending shipments for a specific delivery date."""
@@ -43,3 +48,46 @@ class ShipmentRepositoryPort(ABC):
     async def update_many(self, shipments: List[Shipment]) -> List[Shipment]:
         """Update multiple shipments."""
         pass
+
+    @abstractmethod
+    async def bulk_update_route_assignments(self, shipments: List[Shipment]) -> int:
+        """
+        Persist route_id, sequence_in_route and shipment_status in bulk.
+
+        Returns:
+            Number of rows updated
+        """
+        pass
+
+    @abstractmethod
+    async def claim_pending_geocoding(self, limit: int, lease: timedelta) -> List[Shipment]:
+        """
+        Claim a batch of shipments waiting for geocoding.
+
+        Claimed shipments have their next attempt pushed ``lease`` into the
+        future, so concurrent workers skip them and a crashed worker's batch
+        becomes due again once the lease expires.
+
+        Args:
+            limit: Maximum shipments to claim
+            lease: How long the claim is held
+
+        Returns:
+            Claimed shipments, oldest first
+        """
+        pass
+
+    @abstractmethod
+    async def count_pending_geocoding(self) -> int:
+        """Count shipments whose geocoding status is still pending."""
+        pass
+
+    @abstractmethod
+    async def bulk_update_geocoding(self, shipments: List[Shipment]) -> int:
+        """
+        Persist coordinates, geocoding status and retry state in bulk.
+
+        Returns:
+            Number of rows updated
+        """
+        pass
@@ -1,11 +1,17 @@
 from .consume_order_created import ConsumeOrderCreatedUseCase
 from .create_vehicle import CreateVehicleUseCase
 from .delete_vehicle import DeleteVehicleUseCase
+from .expire_route_generation_jobs import ExpireRouteGenerationJobsUseCase
+from .geocode_pending_shipments import GeocodePendingShipmentsUseCase
 from .generate_routes import GenerateRoutesUseCase
 from .get_route import GetRouteUseCase
+from .get_route_generation_job import GetRouteGenerationJobUseCase
 from .get_shipment_by_order import GetShipmentByOrderUseCase
+from .get_shipments_by_orders import GetShipmentsByOrdersUseCase
 from .list_routes import ListRoutesUseCase
 from .list_vehicles import ListVehiclesUseCase
+from .run_route_generation_job import RunRouteGenerationJobUseCase
+from .submit_route_generation_job import SubmitRouteGenerationJobUseCase
 from .update_route_status import UpdateRouteStatusUseCase
 from .update_shipment_status import UpdateShipmentStatusUseCase
 from .update_vehicle import UpdateVehicleUseCase
@@ -14,11 +20,17 @@ __all__ = [
     "ConsumeOrderCreatedUseCase",
     "CreateVehicleUseCase",
     "DeleteVehicleUseCase",
+    "ExpireRouteGenerationJobsUseCase",
     "GenerateRoutesUseCase",
+    "GeocodePendingShipmentsUseCase",
     "GetRouteUseCase",
+    "GetRouteGenerationJobUseCase",
     "GetShipmentByOrderUseCase",
+    "GetShipmentsByOrdersUseCase",
     "ListRoutesUseCase",
     "ListVehiclesUseCase",
+    "RunRouteGenerationJobUseCase",
+    "SubmitRouteGenerationJobUseCase",
     "UpdateRouteStatusUseCase",
     "UpdateShipmentStatusUseCase",
     "UpdateVehicleUseCase",
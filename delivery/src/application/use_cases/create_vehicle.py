@@ -17,6 +17,8 @@ class CreateVehicleUseCase:
         placa: str,
         driver_name: str,
         driver_phone: Optional[str] = None,
+        max_stops: Optional[int] = None,
+        max_route_minutes: Optional[int] = None,
     ) -> Vehicle:
         """
         Create a new vehicle.
@@ -25,6 +27,8 @@ class CreateVehicleUseCase:
             placa: Vehicle plate
             driver_name: Driver name
             driver_phone: Driver phone (optional)
+            max_stops: Maximum stops per route (optional)
+            max_route_minutes: Maximum route duration in minutes (optional)
 
         Returns:
             Created vehicle
@@ -42,6 +46,8 @@ class CreateVehicleUseCase:
             placa=placa,
             driver_name=driver_name,
             driver_phone=driver_phone,
+            max_stops=max_stops,
+            max_route_minutes=max_route_minutes,
         )
 
         await self._vehicle_repo.save(vehicle)
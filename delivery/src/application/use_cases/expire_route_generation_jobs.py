@@ -0,0 +1,33 @@
+import logging
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.ports import RouteGenerationJobRepositoryPort
+from src.application.use_cases.submit_route_generation_job import LEASE_EXPIRED_MESSAGE
+
+logger = logging.getLogger(__name__)
+
+
+class ExpireRouteGenerationJobsUseCase:
+    """Use case for failing queued or running jobs whose worker stopped renewing the lease."""
+
+    def __init__(
+        self,
+        job_repository: RouteGenerationJobRepositoryPort,
+        session: AsyncSession,
+    ):
+        self._job_repo = job_repository
+        self._session = session
+
+    async def execute(self) -> int:
+        """
+        Fail all jobs with an expired lease.
+
+        Returns:
+            Number of jobs failed
+        """
+        expired = await self._job_repo.fail_expired(LEASE_EXPIRED_MESSAGE)
+        await self._session.commit()
+        if expired:
+            logger.warning(f"Failed {expired} stale route generation jobs")
+        return expired
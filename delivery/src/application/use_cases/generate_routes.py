@@ -1,7 +1,8 @@
 import logging
 import time
+from collections import Counter
 from datetime import date
-from typing import List
+from typing import Awaitable, Callable, List, Optional
 from uuid import UUID, uuid4
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -11,6 +12,7 @@ from src.application.ports import (
     RouteRepositoryPort,
     ShipmentRepositoryPort,
     SQSEventPublisherPort,
+    UnassignedShipment,
     VehicleRepositoryPort,
 )
 from src.domain.entities import Route
@@ -18,6 +20,9 @@ from src.domain.exceptions import RouteOptimizationError
 
 logger = logging.getLogger(__name__)
 
+# Called with a percentage (0-100) and any counts known at that point
+ProgressCallback = Callable[..., Awaitable[None]]
+
 
 class GenerateRoutesUseCase:
     """Use case for generating optimized delivery routes."""
@@ -42,6 +47,7 @@ class GenerateRoutesUseCase:
         self,
         fecha_entrega_estimada: date,
         vehicle_ids: List[UUID],
+        on_progress: Optional[ProgressCallback] = None,
     ) -> List[Route]:
         """
         Generate optimized routes for a given date.
@@ -49,6 +55,7 @@ class GenerateRoutesUseCase:
         Args:
             fecha_entrega_estimada: Target delivery date
             vehicle_ids: List of vehicle IDs to use
+            on_progress: Optional async callback receiving progress updates
 
         Returns:
             List of created routes
@@ -57,6 +64,7 @@ class GenerateRoutesUseCase:
 
         # Fetch pending shipments for date
         shipments = await self._shipment_repo.find_pending_by_date(fecha_entrega_estimada)
+        await self._report(on_progress, 10, num_shipments=len(shipments))
         if not shipments:
             logger.warning(f"No pending shipments for {fecha_entrega_estimada}")
             return []
@@ -72,14 +80,33 @@ class GenerateRoutesUseCase:
         )
 
         # Optimize routes
-        results = await self._optimizer.optimize_routes(shipments, vehicles)
+        optimization_start = time.perf_counter()
+        plan = await self._optimizer.plan_routes(shipments, vehicles)
+        optimization_time_ms = int((time.perf_counter() - optimization_start) * 1000)
+        self._log_unassigned(plan.unassigned)
+        await self._report(
+            on_progress,
+            70,
+            num_routes=len(plan.routes),
+            num_assigned_shipments=sum(len(r.shipments) for r in plan.routes),
+            num_unassigned_shipments=len(plan.unassigned),
+        )
+
+        results = plan.routes
         if not results:
             logger.warning("No routes generated by optimizer")
             return []
 
-        # Create and save routes
+        initial_km = sum(r.initial_distance_km or r.total_distance_km for r in results)
+        final_km = sum(r.total_distance_km for r in results)
+        logger.info(
+            f"Optimizer produced {len(results)} routes: {final_km} km "
+            f"(initial {initial_km} km, saved {initial_km - final_km} km)"
+        )
+
+        # Build routes and shipment assignments in memory
         routes = []
-        total_shipments = 0
+        assigned_shipments = []
 
         for result in results:
             route = Route(
@@ -95,28 +122,65 @@ class GenerateRoutesUseCase:
             for seq, shipment in enumerate(result.shipments, 1):
                 route.add_shipment(shipment, seq)
 
-            # Save route
-            await self._route_repo.save(route)
+            routes.append(route)
+            assigned_shipments.extend(result.shipments)
 
-            # Update shipments with route assignment
-            await self._shipment_repo.update_many(result.shipments)
+        total_shipments = len(assigned_shipments)
 
-            routes.append(route)
-            total_shipments += len(result.shipments)
+        # Persist in bulk: multi-row route insert, then one UPDATE per chunk of shipments
+        write_start = time.perf_counter()
+        await self._route_repo.save_many(routes)
+        await self._shipment_repo.bulk_update_route_assignments(assigned_shipments)
 
         # Commit all routes and shipment updates
         await self._session.commit()
-        logger.info(f"Committed {len(routes)} routes with {total_shipments} shipments to database")
+        write_time_ms = int((time.perf_counter() - write_start) * 1000)
+        logger.info(
+            f"Committed {len(routes)} routes with {total_shipments} shipments "
+            f"to database in {write_time_ms}ms"
+        )
+
+        await self._report(on_progress, 95)
 
         # Publish void event to trigger BFF refetch
         await self._publish_routes_generated()
 
         # Calculate generation time
         generation_time_ms = int((time.time() - start_time) * 1000)
-        logger.info(f"Generated {len(routes)} routes with {total_shipments} shipments in {generation_time_ms}ms")
+        logger.info(
+            f"Generated {len(routes)} routes with {total_shipments} shipments in "
+            f"{generation_time_ms}ms (optimization {optimization_time_ms}ms, "
+            f"write {write_time_ms}ms)"
+        )
 
         return routes
 
+    async def _report(
+        self,
+        on_progress: Optional[ProgressCallback],
+        progress: int,
+        **counts: int,
+    ) -> None:
+        """Forward progress to the caller; failures here never abort generation."""
+        if on_progress is None:
+            return
+        try:
+            await on_progress(progress, **counts)
+        except Exception as e:
+            logger.warning(f"Failed to report route generation progress: {e}")
+
+    def _log_unassigned(self, unassigned: List[UnassignedShipment]) -> None:
+        """Report shipments left out; they stay pending for a later run."""
+        if not unassigned:
+            return
+
+        by_reason = Counter(u.reason for u in unassigned)
+        logger.warning(
+            f"{len(unassigned)} shipments could not be assigned to a route: "
+            f"{dict(by_reason)}",
+            extra={"unassigned_shipment_ids": [str(u.shipment.id) for u in unassigned]},
+        )
+
     async def _publish_routes_generated(self) -> None:
         """Publish delivery_routes_generated void event to BFF queue."""
         try:
@@ -0,0 +1,143 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.ports import GeocodingPort, ShipmentRepositoryPort
+from src.domain.entities import Shipment
+from src.domain.exceptions import AddressNotFoundError, GeocodingError
+from src.domain.value_objects import GeocodingStatus
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class GeocodingBatchResult:
+    """Outcome of one geocoding batch."""
+
+    claimed: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    retried: int = 0
+    duration_ms: int = 0
+
+
+class GeocodePendingShipmentsUseCase:
+    """
+    Use case for geocoding one batch of pending shipments.
+
+    Shipments are claimed and their results written back in two short
+    transactions on the given session; the provider calls in between run
+    concurrently and are throttled by the geocoding service itself.
+    """
+
+    def __init__(
+        self,
+        shipment_repository: ShipmentRepositoryPort,
+        geocoding_service: GeocodingPort,
+        session: AsyncSession,
+        batch_size: int = 50,
+        concurrency: int = 5,
+        max_attempts: int = 5,
+        retry_base_delay: timedelta = timedelta(seconds=30),
+        retry_max_delay: timedelta = timedelta(hours=1),
+        lease: timedelta = timedelta(minutes=5),
+    ):
+        self._shipment_repo = shipment_repository
+        self._geocoding_service = geocoding_service
+        self._session = session
+        self._batch_size = batch_size
+        self._concurrency = concurrency
+        self._max_attempts = max_attempts
+        self._retry_base_delay = retry_base_delay
+        self._retry_max_delay = retry_max_delay
+        self._lease = lease
+
+    async def execute(self) -> GeocodingBatchResult:
+        """
+        Claim, geocode and persist one batch.
+
+        Returns:
+            Batch counts; ``claimed == 0`` means the queue had nothing due
+        """
+        started = datetime.now(timezone.utc)
+        result = GeocodingBatchResult()
+
+        shipments = await self._shipment_repo.claim_pending_geocoding(
+            self._batch_size, self._lease
+        )
+        await self._session.commit()
+        result.claimed = len(shipments)
+        if not shipments:
+            return result
+
+        semaphore = asyncio.Semaphore(self._concurrency)
+
+        async def geocode(shipment: Shipment) -> None:
+            async with semaphore:
+                await self._geocode_shipment(shipment)
+
+        await asyncio.gather(*(geocode(s) for s in shipments))
+
+        await self._shipment_repo.bulk_update_geocoding(shipments)
+        await self._session.commit()
+
+        for shipment in shipments:
+            if shipment.geocoding_status == GeocodingStatus.SUCCESS:
+                result.succeeded += 1
+            elif shipment.geocoding_status == GeocodingStatus.FAILED:
+                result.failed += 1
+            else:
+                result.retried += 1
+        result.duration_ms = int((datetime.now(timezone.utc) - started).total_seconds() * 1000)
+
+        logger.info(
+            f"Geocoded batch of {result.claimed} shipments: "
+            f"{result.succeeded} succeeded, {result.retried} retrying, "
+            f"{result.failed} failed in {result.duration_ms}ms"
+        )
+        return result
+
+    async def _geocode_shipment(self, shipment: Shipment) -> None:
+        """Geocode one shipment, falling back to its city when the address has no match."""
+        try:
+            try:
+                latitude, longitude = await self._geocoding_service.geocode_address(
+                    shipment.direccion_entrega,
+                    shipment.ciudad_entrega,
+                    shipment.pais_entrega,
+                )
+            except AddressNotFoundError as e:
+                logger.warning(f"Full address geocoding failed for shipment {shipment.id}: {e}")
+                latitude, longitude = await self._geocoding_service.geocode_address(
+                    "",  # Empty address - geocode city only
+                    shipment.ciudad_entrega,
+                    shipment.pais_entrega,
+                )
+                logger.info(f"Geocoded shipment {shipment.id} using city fallback")
+            shipment.set_coordinates(latitude, longitude)
+        except AddressNotFoundError as e:
+            # Neither the address nor the city exists; retrying will not help
+            logger.error(f"City-level geocoding also failed for shipment {shipment.id}: {e}")
+            shipment.mark_geocoding_failed()
+        except Exception as e:
+            if not isinstance(e, GeocodingError):
+                logger.exception(f"Unexpected error geocoding shipment {shipment.id}")
+            scheduled = shipment.schedule_geocoding_retry(
+                self._max_attempts,
+                self._retry_base_delay,
+                self._retry_max_delay,
+                datetime.now(timezone.utc),
+            )
+            if scheduled:
+                logger.warning(
+                    f"Geocoding attempt {shipment.geocoding_attempts} failed for shipment "
+                    f"{shipment.id}, retrying at {shipment.geocoding_next_attempt_at}: {e}"
+                )
+            else:
+                logger.error(
+                    f"Giving up geocoding shipment {shipment.id} after "
+                    f"{shipment.geocoding_attempts} attempts: {e}"
+                )
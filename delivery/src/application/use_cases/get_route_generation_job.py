@@ -0,0 +1,24 @@
+from uuid import UUID
+
+from src.application.ports import RouteGenerationJobRepositoryPort
+from src.domain.entities import RouteGenerationJob
+from src.domain.exceptions import EntityNotFoundError
+
+
+class GetRouteGenerationJobUseCase:
+    """Use case for getting the status of a route-generation job."""
+
+    def __init__(self, job_repository: RouteGenerationJobRepositoryPort):
+        self._job_repo = job_repository
+
+    async def execute(self, job_id: UUID) -> RouteGenerationJob:
+        """
+        Get a job by ID.
+
+        Raises:
+            EntityNotFoundError: If job not found
+        """
+        job = await self._job_repo.find_by_id(job_id)
+        if not job:
+            raise EntityNotFoundError("RouteGenerationJob", str(job_id))
+        return job
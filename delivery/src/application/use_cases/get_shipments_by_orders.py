@@ -0,0 +1,59 @@
+from typing import List
+from uuid import UUID
+
+from src.application.ports import ShipmentRepositoryPort, VehicleRepositoryPort, RouteRepositoryPort
+
+
+class GetShipmentsByOrdersUseCase:
+    """
+    Use case for getting shipment information for many orders at once.
+
+    Shipments, their routes and the route vehicles are each loaded with a
+    single query, so the cost does not grow with the number of orders.
+    """
+
+    def __init__(
+        self,
+        shipment_repository: ShipmentRepositoryPort,
+        vehicle_repository: VehicleRepositoryPort,
+        route_repository: RouteRepositoryPort,
+    ):
+        self._shipment_repo = shipment_repository
+        self._vehicle_repo = vehicle_repository
+        self._route_repo = route_repository
+
+    async def execute(self, order_ids: List[UUID]) -> List[dict]:
+        """
+        Get shipment information for a set of orders.
+
+        Args:
+            order_ids: Order IDs; duplicates are ignored
+
+        Returns:
+            Shipment info with vehicle details, one entry per order that has a
+            shipment. Orders without a shipment are left out.
+        """
+        shipments = await self._shipment_repo.find_by_order_ids(list(dict.fromkeys(order_ids)))
+        if not shipments:
+            return []
+
+        route_ids = list({s.route_id for s in shipments if s.route_id})
+        vehicle_by_route = await self._route_repo.find_vehicle_ids(route_ids)
+        vehicles = await self._vehicle_repo.find_by_ids(list(set(vehicle_by_route.values())))
+        vehicles_by_id = {vehicle.id: vehicle for vehicle in vehicles}
+
+        results = []
+        for shipment in shipments:
+            vehicle = vehicles_by_id.get(vehicle_by_route.get(shipment.route_id))
+            results.append(
+                {
+                    "shipment_id": shipment.id,
+                    "order_id": shipment.order_id,
+                    "shipment_status": shipment.shipment_status.value,
+                    "vehicle_plate": vehicle.placa if vehicle else None,
+                    "driver_name": vehicle.driver_name if vehicle else None,
+                    "fecha_entrega_estimada": shipment.fecha_entrega_estimada,
+                    "route_id": shipment.route_id,
+                }
+            )
+        return results
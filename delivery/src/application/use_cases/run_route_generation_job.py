@@ -0,0 +1,142 @@
+import asyncio
+import logging
+from contextlib import AsyncExitStack
+from datetime import timedelta
+from typing import Dict, Optional
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.ports import RouteGenerationJobRepositoryPort
+from src.application.use_cases.generate_routes import GenerateRoutesUseCase
+from src.domain.entities import RouteGenerationJob
+from src.domain.value_objects import RouteJobStatus
+
+logger = logging.getLogger(__name__)
+
+
+class RunRouteGenerationJobUseCase:
+    """
+    Use case for executing a queued route-generation job.
+
+    Job state lives in its own session so progress commits are visible
+    while the route transaction is still open. While the job is queued or
+    running a heartbeat keeps renewing its lease, so a job whose worker
+    dies can be recognised as stale and replaced.
+    """
+
+    def __init__(
+        self,
+        job_repository: RouteGenerationJobRepositoryPort,
+        job_session: AsyncSession,
+        generate_routes_use_case: GenerateRoutesUseCase,
+        concurrency: Optional[asyncio.Semaphore] = None,
+        lease: timedelta = timedelta(minutes=5),
+    ):
+        self._job_repo = job_repository
+        self._job_session = job_session
+        self._generate_routes = generate_routes_use_case
+        self._concurrency = concurrency
+        self._lease = lease
+        # The heartbeat and the run share the job session
+        self._save_lock = asyncio.Lock()
+
+    async def execute(self, job_id: UUID) -> None:
+        """
+        Run a job to completion, recording success or failure on the job.
+
+        Cancellation (e.g. shutdown) marks the job failed before it is
+        re-raised.
+
+        Args:
+            job_id: ID of a queued job
+        """
+        job = await self._job_repo.find_by_id(job_id)
+        if not job or job.status != RouteJobStatus.QUEUED:
+            logger.warning(f"Route generation job {job_id} not found or not queued")
+            return
+
+        stop_heartbeat = asyncio.Event()
+        heartbeat = asyncio.create_task(self._heartbeat(job, stop_heartbeat))
+        try:
+            await self._run(job)
+        except BaseException as e:
+            if job.status.is_active:
+                logger.error(f"Route generation job {job.id} aborted: {e!r}")
+                job.fail(str(e) or type(e).__name__)
+                await self._stop_heartbeat(heartbeat, stop_heartbeat)
+                try:
+                    await self._save(job)
+                except Exception:
+                    logger.exception(f"Could not record failure of route generation job {job.id}")
+            raise
+        finally:
+            await self._stop_heartbeat(heartbeat, stop_heartbeat)
+
+    async def _run(self, job: RouteGenerationJob) -> None:
+        async with AsyncExitStack() as stack:
+            # Throttle: stay queued until a slot is free
+            if self._concurrency is not None:
+                await stack.enter_async_context(self._concurrency)
+
+            job.start()
+            await self._save(job)
+
+            counts: Dict[str, int] = {}
+
+            async def on_progress(progress: int, **new_counts: int) -> None:
+                counts.update(new_counts)
+                job.report_progress(progress)
+                if "num_shipments" in new_counts:
+                    job.num_shipments = new_counts["num_shipments"]
+                await self._save(job)
+
+            try:
+                await self._generate_routes.execute(
+                    job.fecha_entrega_estimada,
+                    job.vehicle_ids,
+                    on_progress=on_progress,
+                )
+            except Exception as e:
+                logger.error(f"Route generation job {job.id} failed: {e}")
+                job.fail(str(e) or type(e).__name__)
+                await self._save(job)
+                return
+
+            job.succeed(
+                num_routes=counts.get("num_routes", 0),
+                num_assigned_shipments=counts.get("num_assigned_shipments", 0),
+                num_unassigned_shipments=counts.get("num_unassigned_shipments", 0),
+            )
+            await self._save(job)
+            logger.info(
+                f"Route generation job {job.id} succeeded in {job.duration_ms}ms: "
+                f"{job.num_routes} routes"
+            )
+
+    async def _heartbeat(self, job: RouteGenerationJob, stop: asyncio.Event) -> None:
+        """Renew the job lease every third of its duration until stopped."""
+        interval = self._lease.total_seconds() / 3
+        while job.status.is_active:
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=interval)
+                return
+            except asyncio.TimeoutError:
+                pass
+            try:
+                await self._save(job)
+            except Exception:
+                logger.exception(f"Heartbeat failed for route generation job {job.id}")
+
+    @staticmethod
+    async def _stop_heartbeat(heartbeat: asyncio.Task, stop: asyncio.Event) -> None:
+        # Let an in-flight save finish instead of cancelling it mid-commit
+        stop.set()
+        await asyncio.gather(heartbeat, return_exceptions=True)
+
+    async def _save(self, job: RouteGenerationJob) -> None:
+        async with self._save_lock:
+            if job.status.is_active:
+                job.renew_lease(self._lease)
+            await self._job_repo.update(job)
+            await self._job_session.commit()
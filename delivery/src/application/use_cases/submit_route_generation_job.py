@@ -0,0 +1,83 @@
+import logging
+from datetime import date, timedelta
+from typing import List, Tuple
+from uuid import UUID, uuid4
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.ports import RouteGenerationJobRepositoryPort
+from src.domain.entities import RouteGenerationJob
+from src.domain.exceptions import DuplicateRouteJobError
+
+logger = logging.getLogger(__name__)
+
+LEASE_EXPIRED_MESSAGE = "Job lease expired; its worker stopped before finishing"
+
+
+class SubmitRouteGenerationJobUseCase:
+    """Use case for queueing a route-generation job, reusing an active duplicate."""
+
+    def __init__(
+        self,
+        job_repository: RouteGenerationJobRepositoryPort,
+        session: AsyncSession,
+        lease: timedelta = timedelta(minutes=5),
+    ):
+        self._job_repo = job_repository
+        self._session = session
+        self._lease = lease
+
+    async def execute(
+        self,
+        fecha_entrega_estimada: date,
+        vehicle_ids: List[UUID],
+    ) -> Tuple[RouteGenerationJob, bool]:
+        """
+        Queue a job for a date and vehicle set.
+
+        Args:
+            fecha_entrega_estimada: Target delivery date
+            vehicle_ids: Vehicles to route
+
+        Returns:
+            Tuple of (job, created). ``created`` is False when a queued or
+            running job for the same date and vehicle set already existed.
+            An active job whose lease expired is failed and replaced.
+        """
+        dedup_key = RouteGenerationJob.build_dedup_key(fecha_entrega_estimada, vehicle_ids)
+
+        existing = await self._job_repo.find_active_by_dedup_key(dedup_key)
+        if existing and existing.is_lease_expired():
+            # Its worker died; free the dedup key in the same transaction as the insert
+            logger.warning(
+                f"Failing stale route generation job {existing.id}: "
+                f"lease expired at {existing.lease_expires_at}"
+            )
+            existing.fail(LEASE_EXPIRED_MESSAGE)
+            await self._job_repo.update(existing)
+            existing = None
+        if existing:
+            logger.info(f"Reusing active route generation job {existing.id}")
+            return existing, False
+
+        job = RouteGenerationJob(
+            id=uuid4(),
+            fecha_entrega_estimada=fecha_entrega_estimada,
+            vehicle_ids=list(vehicle_ids),
+            dedup_key=dedup_key,
+        )
+        job.renew_lease(self._lease)
+
+        try:
+            await self._job_repo.save(job)
+        except DuplicateRouteJobError:
+            # Lost the race against a concurrent request for the same key
+            existing = await self._job_repo.find_active_by_dedup_key(dedup_key)
+            if existing:
+                logger.info(f"Reusing concurrently created job {existing.id}")
+                return existing, False
+            raise
+
+        await self._session.commit()
+        logger.info(f"Queued route generation job {job.id} for {fecha_entrega_estimada}")
+        return job, True
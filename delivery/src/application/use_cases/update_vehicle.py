@@ -17,6 +17,8 @@ class UpdateVehicleUseCase:
         vehicle_id: UUID,
         driver_name: Optional[str] = None,
         driver_phone: Optional[str] = None,
+        max_stops: Optional[int] = None,
+        max_route_minutes: Optional[int] = None,
     ) -> Vehicle:
         """
         Update a vehicle.
@@ -25,6 +27,8 @@ class UpdateVehicleUseCase:
             vehicle_id: Vehicle ID
             driver_name: New driver name (optional)
             driver_phone: New driver phone (optional)
+            max_stops: New maximum stops per route (optional)
+            max_route_minutes: New maximum route duration (optional)
 
         Returns:
             Updated vehicle
@@ -36,6 +40,11 @@ class UpdateVehicleUseCase:
         if not vehicle:
             raise EntityNotFoundError("Vehicle", str(vehicle_id))
 
-        vehicle.update(driver_name=driver_name, driver_phone=driver_phone)
+        vehicle.update(
+            driver_name=driver_name,
+            driver_phone=driver_phone,
+            max_stops=max_stops,
+            max_route_minutes=max_route_minutes,
+        )
         await self._vehicle_repo.update(vehicle)
         return vehicle
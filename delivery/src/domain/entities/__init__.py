@@ -1,6 +1,8 @@
+from .geocode_cache_entry import GeocodeCacheEntry
 from .processed_event import ProcessedEvent
 from .route import Route
+from .route_generation_job import RouteGenerationJob
 from .shipment import Shipment
 from .vehicle import Vehicle
 
-__all__ = ["Vehicle", "Route", "Shipment", "ProcessedEvent"]
+__all__ = ["Vehicle", "Route", "RouteGenerationJob", "Shipment", "ProcessedEvent", "GeocodeCacheEntry"]
@@ -0,0 +1,106 @@
+import hashlib
+import re
+import unicodedata
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Optional, Tuple
+
+# Common street-type abbreviations, so "Cra 7 No. 45-10" and
+# "Carrera 7 # 45-10" share one cache entry.
+ADDRESS_ABBREVIATIONS = {
+    "av": "avenida",
+    "avda": "avenida",
+    "ak": "avenida carrera",
+    "ac": "avenida calle",
+    "cl": "calle",
+    "cll": "calle",
+    "cra": "carrera",
+    "cr": "carrera",
+    "kr": "carrera",
+    "kra": "carrera",
+    "dg": "diagonal",
+    "tv": "transversal",
+    "no": "#",
+    "nro": "#",
+    "numero": "#",
+}
+
+_NON_ADDRESS_CHARS = re.compile(r"[^a-z0-9#\-]+")
+
+
+@dataclass
+class GeocodeCacheEntry:
+    """
+    Cached geocoding result for a normalized (address, city, country).
+
+    Entries without coordinates are negative results: the provider had no
+    match, so the lookup is not repeated until the entry expires.
+    """
+
+    address_key: str
+    address: str
+    city: str
+    country: str
+    latitude: Optional[Decimal] = None
+    longitude: Optional[Decimal] = None
+    hit_count: int = 0
+    lookup_count: int = 1
+    refreshed_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    last_hit_at: Optional[datetime] = None
+
+    @staticmethod
+    def normalize(value: Optional[str]) -> str:
+        """Lowercase, strip accents and punctuation, expand abbreviations."""
+        if not value:
+            return ""
+        text = unicodedata.normalize("NFKD", value)
+        text = "".join(c for c in text if not unicodedata.combining(c)).lower()
+        text = text.replace("#", " # ")
+        tokens = _NON_ADDRESS_CHARS.sub(" ", text).split()
+        return " ".join(ADDRESS_ABBREVIATIONS.get(token, token) for token in tokens)
+
+    @classmethod
+    def build_key(cls, address: str, city: str, country: str) -> str:
+        raw = "|".join(cls.normalize(part) for part in (address, city, country))
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    @classmethod
+    def create(
+        cls,
+        address: str,
+        city: str,
+        country: str,
+        coordinates: Optional[Tuple[Decimal, Decimal]],
+    ) -> "GeocodeCacheEntry":
+        latitude, longitude = coordinates if coordinates else (None, None)
+        return cls(
+            address_key=cls.build_key(address, city, country),
+            address=cls.normalize(address),
+            city=cls.normalize(city),
+            country=cls.normalize(country),
+            latitude=latitude,
+            longitude=longitude,
+        )
+
+    @property
+    def found(self) -> bool:
+        return self.latitude is not None and self.longitude is not None
+
+    @property
+    def coordinates(self) -> Tuple[Decimal, Decimal]:
+        return self.latitude, self.longitude
+
+    def is_expired(
+        self,
+        ttl: timedelta,
+        negative_ttl: timedelta,
+        now: Optional[datetime] = None,
+    ) -> bool:
+        """
+        Check whether the entry must be refreshed from the provider.
+
+        Business Rule: Negative results expire sooner than coordinates
+        """
+        now = now or datetime.now(timezone.utc)
+        return now - self.refreshed_at >= (ttl if self.found else negative_ttl)
@@ -0,0 +1,98 @@
+import hashlib
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from typing import List, Optional
+from uuid import UUID
+
+from ..value_objects import RouteJobStatus
+
+
+@dataclass
+class RouteGenerationJob:
+    """Tracks one asynchronous route-generation run."""
+
+    id: UUID
+    fecha_entrega_estimada: date
+    vehicle_ids: List[UUID]
+    dedup_key: str
+    status: RouteJobStatus = RouteJobStatus.QUEUED
+    progress: int = 0
+    num_shipments: int = 0
+    num_routes: int = 0
+    num_assigned_shipments: int = 0
+    num_unassigned_shipments: int = 0
+    error_message: Optional[str] = None
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    lease_expires_at: Optional[datetime] = None
+
+    @staticmethod
+    def build_dedup_key(fecha_entrega_estimada: date, vehicle_ids: List[UUID]) -> str:
+        """Key identifying the same date and vehicle set, regardless of order."""
+        vehicles = ",".join(sorted({str(v) for v in vehicle_ids}))
+        raw = f"{fecha_entrega_estimada.isoformat()}|{vehicles}"
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    @property
+    def duration_ms(self) -> Optional[int]:
+        if not self.started_at:
+            return None
+        end = self.finished_at or datetime.now(timezone.utc)
+        return int((end - self.started_at).total_seconds() * 1000)
+
+    def renew_lease(self, lease: timedelta, now: Optional[datetime] = None) -> None:
+        """Extend the lease held by the worker that owns this job."""
+        self.lease_expires_at = (now or datetime.now(timezone.utc)) + lease
+
+    def is_lease_expired(self, now: Optional[datetime] = None) -> bool:
+        """
+        Whether an active job has outlived its lease.
+
+        Business Rule: An active job whose lease lapsed lost its worker
+        (crash, restart) and must not block new jobs for its dedup key
+        """
+        if not self.status.is_active:
+            return False
+        if self.lease_expires_at is None:
+            return True
+        return self.lease_expires_at <= (now or datetime.now(timezone.utc))
+
+    def start(self) -> None:
+        """
+        Mark the job as running.
+
+        Business Rule: Only queued jobs can start
+        """
+        if self.status != RouteJobStatus.QUEUED:
+            raise ValueError(f"Cannot start job. Current status: {self.status}")
+        self.status = RouteJobStatus.RUNNING
+        self.started_at = datetime.now(timezone.utc)
+
+    def report_progress(self, progress: int) -> None:
+        """Record progress (0-100); never moves backwards."""
+        self.progress = max(self.progress, min(max(progress, 0), 100))
+
+    def succeed(
+        self,
+        num_routes: int,
+        num_assigned_shipments: int,
+        num_unassigned_shipments: int,
+    ) -> None:
+        """Mark the job as finished successfully."""
+        if self.status != RouteJobStatus.RUNNING:
+            raise ValueError(f"Cannot complete job. Current status: {self.status}")
+        self.status = RouteJobStatus.SUCCEEDED
+        self.progress = 100
+        self.num_routes = num_routes
+        self.num_assigned_shipments = num_assigned_shipments
+        self.num_unassigned_shipments = num_unassigned_shipments
+        self.finished_at = datetime.now(timezone.utc)
+
+    def fail(self, error_message: str) -> None:
+        """Mark the job as failed."""
+        if not self.status.is_active:
+            raise ValueError(f"Cannot fail job. Current status: {self.status}")
+        self.status = RouteJobStatus.FAILED
+        self.error_message = error_message[:1000]
+        self.finished_at = datetime.now(timezone.utc)
@@ -27,6 +27,8 @@ class Shipment:
     route_id: Optional[UUID] = None
     sequence_in_route: Optional[int] = None
     shipment_status: ShipmentStatus = ShipmentStatus.PENDING
+    geocoding_attempts: int = 0
+    geocoding_next_attempt_at: Optional[datetime] = None
 
     def __post_init__(self):
         self.validate()
@@ -54,10 +56,37 @@ class Shipment:
         self.latitude = latitude
         self.longitude = longitude
         self.geocoding_status = GeocodingStatus.SUCCESS
+        self.geocoding_next_attempt_at = None
 
     def mark_geocoding_failed(self) -> None:
         """Mark geocoding as failed."""
         self.geocoding_status = GeocodingStatus.FAILED
+        self.geocoding_next_attempt_at = None
+
+    def schedule_geocoding_retry(
+        self,
+        max_attempts: int,
+        base_delay: timedelta,
+        max_delay: timedelta,
+        now: datetime,
+    ) -> bool:
+        """
+        Record a failed geocoding attempt and schedule the next one.
+
+        Business Rule: Retries back off exponentially (base_delay * 2^n,
+        capped at max_delay); after max_attempts the shipment is marked
+        as geocoding failed.
+
+        Returns:
+            True if another attempt was scheduled
+        """
+        self.geocoding_attempts += 1
+        if self.geocoding_attempts >= max_attempts:
+            self.mark_geocoding_failed()
+            return False
+        delay = min(base_delay * 2 ** (self.geocoding_attempts - 1), max_delay)
+        self.geocoding_next_attempt_at = now + delay
+        return True
 
     def assign_to_route(self, route_id: UUID, sequence: int) -> None:
         """
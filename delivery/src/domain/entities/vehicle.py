@@ -12,6 +12,9 @@ class Vehicle:
     driver_name: str
     driver_phone: Optional[str] = None
     is_active: bool = True
+    # Route planning limits (None = unlimited)
+    max_stops: Optional[int] = None
+    max_route_minutes: Optional[int] = None
 
     def __post_init__(self):
         self.validate()
@@ -21,6 +24,10 @@ class Vehicle:
             raise ValueError("placa is required")
         if not self.driver_name:
             raise ValueError("driver_name is required")
+        if self.max_stops is not None and self.max_stops <= 0:
+            raise ValueError("max_stops must be positive")
+        if self.max_route_minutes is not None and self.max_route_minutes <= 0:
+            raise ValueError("max_route_minutes must be positive")
 
     def deactivate(self) -> None:
         """Deactivate vehicle (soft delete)."""
@@ -30,7 +37,13 @@ class Vehicle:
         """Activate vehicle."""
         self.is_active = True
 
-    def update(self, driver_name: Optional[str] = None, driver_phone: Optional[str] = None) -> None:
+    def update(
+        self,
+        driver_name: Optional[str] = None,
+        driver_phone: Optional[str] = None,
+        max_stops: Optional[int] = None,
+        max_route_minutes: Optional[int] = None,
+    ) -> None:
         """Update vehicle information."""
         if driver_name is not None:
             if not driver_name:
@@ -38,3 +51,8 @@ class Vehicle:
             self.driver_name = driver_name
         if driver_phone is not None:
             self.driver_phone = driver_phone
+        if max_stops is not None:
+            self.max_stops = max_stops
+        if max_route_minutes is not None:
+            self.max_route_minutes = max_route_minutes
+        self.validate()
@@ -34,11 +34,24 @@ class GeocodingError(DomainException):
     pass
 
 
+class AddressNotFoundError(GeocodingError):
+    """Raised when the geocoding provider has no match for an address."""
+    pass
+
+
 class RouteOptimizationError(DomainException):
     """Raised when route optimization fails."""
     pass
 
 
+class DuplicateRouteJobError(DomainException):
+    """Raised when an active route-generation job already covers the request."""
+
+    def __init__(self, dedup_key: str):
+        self.dedup_key = dedup_key
+        super().__init__(f"An active route generation job already exists for key {dedup_key}")
+
+
 class EventPublishingError(DomainException):
     """Raised when event publishing fails."""
     pass
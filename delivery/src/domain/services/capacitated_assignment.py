@@ -0,0 +1,144 @@
+import math
+from typing import Callable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sklearn.cluster import KMeans
+
+# Marks a shipment that no vehicle had capacity for
+UNASSIGNED = -1
+
+
+def vehicle_capacities(
+    max_stops: Sequence[Optional[int]],
+    n_shipments: int,
+    balance_slack: float = 1.2,
+) -> np.ndarray:
+    """
+    Resolve the stop capacity of each vehicle.
+
+    Vehicles with an explicit ``max_stops`` keep it. The shipments left over
+    are shared among the unlimited vehicles, each allowed up to
+    ``balance_slack`` times an even share so no single vehicle absorbs a
+    disproportionate number of stops. An unlimited vehicle is never given
+    less than its slack share of the whole fleet's load, even when the
+    explicit limits alone could cover every shipment.
+    """
+    explicit = sum(m for m in max_stops if m is not None)
+    unlimited = sum(1 for m in max_stops if m is None)
+
+    share = 0
+    if unlimited:
+        remaining = max(n_shipments - explicit, 0)
+        share = max(
+            math.ceil(remaining / unlimited * balance_slack),
+            math.ceil(n_shipments / len(max_stops) * balance_slack),
+        )
+
+    return np.array([m if m is not None else share for m in max_stops], dtype=np.intp)
+
+
+def balanced_assignment(
+    coords: np.ndarray,
+    capacities: np.ndarray,
+    max_iter: int = 10,
+    random_state: int = 42,
+) -> np.ndarray:
+    """
+    Capacitated k-means: assign each point to a cluster without exceeding capacity.
+
+    Centroids start from plain K-means. Each iteration hands out points in
+    order of increasing distance to a centroid, skipping full clusters, then
+    moves centroids to the mean of their members. Points that fit nowhere
+    (total capacity below the number of points) are labelled UNASSIGNED;
+    these are the ones farthest from every centroid with spare room.
+
+    Args:
+        coords: (n, 2) array of [latitude, longitude]
+        capacities: Maximum points per cluster, one entry per cluster
+
+    Returns:
+        Array of n cluster labels (UNASSIGNED for points left out)
+    """
+    n, k = len(coords), len(capacities)
+    if n == 0 or k == 0:
+        return np.full(n, UNASSIGNED, dtype=np.intp)
+
+    if n > k:
+        kmeans = KMeans(n_clusters=k, random_state=random_state, n_init=10)
+        centroids = kmeans.fit(coords).cluster_centers_
+    else:
+        centroids = np.resize(coords, (k, 2))
+
+    labels = np.full(n, UNASSIGNED, dtype=np.intp)
+    for _ in range(max_iter):
+        new_labels = _assign(coords, centroids, capacities)
+        if np.array_equal(new_labels, labels):
+            break
+        labels = new_labels
+        for c in range(k):
+            members = labels == c
+            if members.any():
+                centroids[c] = coords[members].mean(axis=0)
+
+    return labels
+
+
+def _assign(coords: np.ndarray, centroids: np.ndarray, capacities: np.ndarray) -> np.ndarray:
+    n, k = len(coords), len(centroids)
+    # Squared distances; longitude scaled by cos(latitude) so degrees are comparable
+    scale = np.cos(np.radians(coords[:, 0].mean()))
+    dlat = coords[:, None, 0] - centroids[None, :, 0]
+    dlon = (coords[:, None, 1] - centroids[None, :, 1]) * scale
+    dist = dlat ** 2 + dlon ** 2
+
+    labels = np.full(n, UNASSIGNED, dtype=np.intp)
+    remaining = capacities.astype(np.intp).copy()
+    assigned = 0
+    for flat in np.argsort(dist, axis=None, kind="stable"):
+        point, cluster = divmod(int(flat), k)
+        if labels[point] != UNASSIGNED or remaining[cluster] <= 0:
+            continue
+        labels[point] = cluster
+        remaining[cluster] -= 1
+        assigned += 1
+        if assigned == n or not remaining.any():
+            break
+
+    return labels
+
+
+def drop_until_within(
+    matrix: np.ndarray,
+    order: List[int],
+    fits: Callable[[List[int], float], bool],
+) -> Tuple[List[int], List[int]]:
+    """
+    Remove stops from an open route until ``fits(order, length)`` holds.
+
+    Each step drops the stop whose removal shortens the route the most
+    (largest detour), which sheds outliers first.
+
+    Returns:
+        Tuple of (kept order, dropped stops)
+    """
+    tour = list(order)
+    dropped: List[int] = []
+
+    while tour:
+        idx = np.asarray(tour)
+        legs = matrix[idx[:-1], idx[1:]].astype(np.float64)
+        length = float(legs.sum())
+        if fits(tour, length):
+            break
+        if len(tour) == 1:
+            dropped.append(tour.pop())
+            break
+
+        saving = np.zeros(len(tour))
+        saving[0] = legs[0]
+        saving[-1] = legs[-1]
+        if len(tour) > 2:
+            saving[1:-1] = legs[:-1] + legs[1:] - matrix[idx[:-2], idx[2:]]
+        dropped.append(tour.pop(int(np.argmax(saving))))
+
+    return tour, dropped
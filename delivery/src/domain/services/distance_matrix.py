@@ -0,0 +1,101 @@
+from typing import List, Sequence
+
+import numpy as np
+
+from src.domain.entities import Shipment
+
+EARTH_RADIUS_KM = 6371.0
+
+# Rows computed per block when building the matrix; bounds the float64
+# temporaries to BLOCK_ROWS * n instead of n * n.
+BLOCK_ROWS = 512
+
+
+def shipment_coordinates(shipments: Sequence[Shipment]) -> np.ndarray:
+    """Convert shipments to an (n, 2) float array of [latitude, longitude]."""
+    return np.array(
+        [[float(s.latitude), float(s.longitude)] for s in shipments],
+        dtype=np.float64,
+    ).reshape(-1, 2)
+
+
+def haversine_matrix(coords: np.ndarray, dtype=np.float32) -> np.ndarray:
+    """
+    Build the full pairwise Haversine distance matrix in km.
+
+    Same formula as Coordinates.distance_to, evaluated with NumPy
+    broadcasting. Computation runs in float64; the result is stored as
+    ``dtype`` (float32 by default) to halve memory for large clusters.
+    """
+    n = len(coords)
+    result = np.empty((n, n), dtype=dtype)
+    if n == 0:
+        return result
+
+    lat = np.radians(coords[:, 0])
+    lon = np.radians(coords[:, 1])
+    cos_lat = np.cos(lat)
+
+    for start in range(0, n, BLOCK_ROWS):
+        stop = min(start + BLOCK_ROWS, n)
+        dlat = lat[None, :] - lat[start:stop, None]
+        dlon = lon[None, :] - lon[start:stop, None]
+        a = (
+            np.sin(dlat / 2) ** 2
+            + cos_lat[start:stop, None] * cos_lat[None, :] * np.sin(dlon / 2) ** 2
+        )
+        np.clip(a, 0.0, 1.0, out=a)
+        result[start:stop] = 2 * EARTH_RADIUS_KM * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+    return result
+
+
+class DistanceMatrix:
+    """
+    Precomputed pairwise distances (km) for the stops of one route.
+
+    Stops are referred to by their index in the coordinate array the
+    matrix was built from.
+    """
+
+    def __init__(self, coords: np.ndarray):
+        self.coords = coords
+        self.matrix = haversine_matrix(coords)
+
+    @classmethod
+    def from_shipments(cls, shipments: Sequence[Shipment]) -> "DistanceMatrix":
+        return cls(shipment_coordinates(shipments))
+
+    def __len__(self) -> int:
+        return len(self.matrix)
+
+    def nearest_neighbor_order(self, start: int = 0) -> List[int]:
+        """
+        Order stops with the nearest-neighbor heuristic.
+
+        Starts at ``start`` and always moves to the nearest unvisited stop.
+        Each step is one vectorized argmin over the current row.
+        """
+        n = len(self.matrix)
+        if n <= 1:
+            return list(range(n))
+
+        visited = np.zeros(n, dtype=bool)
+        order = [start]
+        visited[start] = True
+        current = start
+
+        for _ in range(n - 1):
+            row = np.where(visited, np.inf, self.matrix[current])
+            current = int(np.argmin(row))
+            visited[current] = True
+            order.append(current)
+
+        return order
+
+    def tour_length(self, order: Sequence[int]) -> float:
+        """Total distance between consecutive stops of an ordering, in km."""
+        if len(order) <= 1:
+            return 0.0
+        idx = np.asarray(order)
+        return float(self.matrix[idx[:-1], idx[1:]].astype(np.float64).sum())
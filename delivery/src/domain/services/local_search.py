@@ -0,0 +1,140 @@
+import logging
+import time
+from typing import List, Sequence
+
+import numpy as np
+
+from src.domain.services.distance_matrix import DistanceMatrix
+
+logger = logging.getLogger(__name__)
+
+
+class LocalSearchImprover:
+    """
+    Improve a route ordering with 2-opt and Or-opt moves.
+
+    Routes are open paths: the first stop stays fixed and there is no
+    return leg. Each move is evaluated for all candidate positions at once
+    against the precomputed DistanceMatrix, and the best improving move is
+    applied. Search stops at a local optimum or when the time budget runs out.
+    """
+
+    # Ignore improvements smaller than this (km) to avoid float noise loops
+    EPSILON_KM = 1e-6
+
+    def __init__(self, max_segment_length: int = 3):
+        """
+        Args:
+            max_segment_length: Longest segment Or-opt will relocate
+        """
+        self.max_segment_length = max_segment_length
+
+    def improve(
+        self,
+        matrix: DistanceMatrix,
+        order: Sequence[int],
+        time_budget_seconds: float,
+    ) -> List[int]:
+        """
+        Run local search on an ordering.
+
+        Args:
+            matrix: Distances between the stops referenced by ``order``
+            order: Initial ordering (indexes into ``matrix``)
+            time_budget_seconds: Wall-clock budget for the search
+
+        Returns:
+            Improved ordering (never longer than the input)
+        """
+        tour = np.asarray(order, dtype=np.intp)
+        if len(tour) < 3 or time_budget_seconds <= 0:
+            return tour.tolist()
+
+        deadline = time.perf_counter() + time_budget_seconds
+        dist = matrix.matrix
+
+        improved = True
+        while improved and time.perf_counter() < deadline:
+            improved = self._two_opt(dist, tour, deadline)
+            improved = self._or_opt(dist, tour, deadline) or improved
+
+        return tour.tolist()
+
+    def _two_opt(self, dist: np.ndarray, tour: np.ndarray, deadline: float) -> bool:
+        """Reverse tour[i:j+1] whenever it shortens the path. Mutates ``tour``."""
+        n = len(tour)
+        improved = False
+
+        for i in range(1, n - 1):
+            if time.perf_counter() >= deadline:
+                break
+
+            a, b = tour[i - 1], tour[i]
+            ends = tour[i + 1:]  # candidate tour[j] for j in i+1..n-1
+            nexts = tour[i + 2:]  # tour[j + 1]; the last j has no successor
+
+            removed = np.full(len(ends), dist[a, b], dtype=np.float64)
+            removed[:-1] += dist[ends[:-1], nexts]
+            added = dist[a, ends].astype(np.float64)
+            added[:-1] += dist[b, nexts]
+
+            delta = added - removed
+            k = int(np.argmin(delta))
+            if delta[k] < -self.EPSILON_KM:
+                j = i + 1 + k
+                tour[i:j + 1] = tour[i:j + 1][::-1].copy()
+                improved = True
+
+        return improved
+
+    def _or_opt(self, dist: np.ndarray, tour: np.ndarray, deadline: float) -> bool:
+        """Relocate short segments (optionally reversed). Mutates ``tour``."""
+        n = len(tour)
+        improved = False
+
+        for length in range(1, self.max_segment_length + 1):
+            if n - 1 <= length:
+                break
+            i = 1
+            while i + length <= n:
+                if time.perf_counter() >= deadline:
+                    return improved
+
+                first, last = tour[i], tour[i + length - 1]
+                prev = tour[i - 1]
+                has_next = i + length < n
+
+                # Gain from cutting the segment out and closing the gap
+                removal = -float(dist[prev, first])
+                if has_next:
+                    nxt = tour[i + length]
+                    removal += float(dist[prev, nxt]) - float(dist[last, nxt])
+
+                # Cost of inserting after each stop of the remaining path
+                rest = np.concatenate((tour[:i], tour[i + length:]))
+                p, q = rest, rest[1:]
+                forward = dist[p, first].astype(np.float64)
+                forward[:-1] += dist[last, q] - dist[p[:-1], q]
+                backward = dist[p, last].astype(np.float64)
+                backward[:-1] += dist[first, q] - dist[p[:-1], q]
+
+                # Re-inserting at the original spot is not a move
+                forward[i - 1] = np.inf
+                backward[i - 1] = np.inf
+
+                k_fwd = int(np.argmin(forward))
+                k_bwd = int(np.argmin(backward))
+                reverse = backward[k_bwd] < forward[k_fwd]
+                k = k_bwd if reverse else k_fwd
+                delta = removal + (backward[k] if reverse else forward[k])
+
+                if delta < -self.EPSILON_KM:
+                    segment = tour[i:i + length]
+                    if reverse:
+                        segment = segment[::-1]
+                    tour[:] = np.concatenate((rest[:k + 1], segment, rest[k + 1:]))
+                    improved = True
+                else:
+                    i += 1
+
+        return improved
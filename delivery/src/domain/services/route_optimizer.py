@@ -1,19 +1,68 @@
 import logging
+import time
+from dataclasses import dataclass, field
 from decimal import Decimal
-from typing import List
+from typing import List, Optional, Tuple
 
 import numpy as np
 from sklearn.cluster import KMeans
 
 from src.application.ports.route_optimization_port import (
+    RouteOptimizationPlan,
     RouteOptimizationPort,
     RouteOptimizationResult,
+    UnassignedShipment,
 )
 from src.domain.entities import Shipment, Vehicle
+from src.domain.services.capacitated_assignment import (
+    UNASSIGNED,
+    balanced_assignment,
+    drop_until_within,
+    vehicle_capacities,
+)
+from src.domain.services.distance_matrix import DistanceMatrix, shipment_coordinates
+from src.domain.services.local_search import LocalSearchImprover
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class VehicleLimits:
+    """Per-vehicle planning limits in array form (index = vehicle position)."""
+
+    max_stops: List[Optional[int]]
+    max_route_minutes: List[Optional[int]]
+
+    @classmethod
+    def from_vehicles(cls, vehicles: List[Vehicle]) -> "VehicleLimits":
+        return cls(
+            max_stops=[v.max_stops for v in vehicles],
+            max_route_minutes=[v.max_route_minutes for v in vehicles],
+        )
+
+    def __len__(self) -> int:
+        return len(self.max_stops)
+
+
+@dataclass
+class PlannedRoute:
+    """One route of a RouteSolution."""
+
+    vehicle_index: int
+    stops: List[int]  # Ordered indexes into the coordinate array
+    distance_km: float
+    initial_distance_km: float
+    duration_minutes: int
+
+
+@dataclass
+class RouteSolution:
+    """Index-based optimization output, cheap to pass between processes."""
+
+    routes: List[PlannedRoute]
+    unassigned: List[Tuple[int, str]] = field(default_factory=list)
+
+
 class GreedyRouteOptimizer(RouteOptimizationPort):
     """
     Greedy route optimization using K-means clustering and nearest-neighbor.
@@ -22,7 +71,15 @@ class GreedyRouteOptimizer(RouteOptimizationPort):
     1. Cluster shipments into K groups (K = number of vehicles) using K-means
     2. Assign each cluster to a vehicle
     3. Order stops within each cluster using nearest-neighbor heuristic
-    4. Calculate total distance and estimated duration
+    4. Optionally improve each ordering with local search (2-opt / Or-opt)
+    5. Calculate total distance and estimated duration
+
+    In capacitated mode step 1-2 use a balanced, capacity-aware assignment,
+    and stops are shed from routes that exceed the vehicle's shift length.
+    Shipments that do not fit are reported as unassigned in the plan.
+
+    Distances come from a vectorized DistanceMatrix built once per cluster,
+    so ordering and route length do no per-pair Python work.
 
     Complexity: O(n * k * i) for clustering + O(n^2) for ordering
     where n = shipments, k = clusters, i = iterations
@@ -32,163 +89,239 @@ class GreedyRouteOptimizer(RouteOptimizationPort):
     AVG_SPEED_KMH = 30  # Average speed in urban areas
     TIME_PER_STOP_MIN = 5  # Time to deliver at each stop
 
-    async def optimize_routes(
+    # Reasons reported for unassigned shipments
+    REASON_NOT_GEOCODED = "not_geocoded"
+    REASON_CAPACITY = "vehicle_capacity"
+    REASON_DURATION = "route_duration"
+
+    def __init__(
+        self,
+        improver: Optional[LocalSearchImprover] = None,
+        improvement_time_budget_seconds: float = 2.0,
+        capacitated: bool = False,
+        balance_slack: float = 1.2,
+    ):
+        """
+        Args:
+            improver: Optional local-search stage applied to each route
+            improvement_time_budget_seconds: Total time the improver may use
+                per plan_routes call, shared across routes
+            capacitated: Use balanced, capacity-aware assignment and enforce
+                each vehicle's max_stops / max_route_minutes
+            balance_slack: How far above an even share an unlimited vehicle
+                may go in capacitated mode (1.2 = 20% more stops)
+        """
+        self._improver = improver
+        self._improvement_budget = improvement_time_budget_seconds
+        self._capacitated = capacitated
+        self._balance_slack = balance_slack
+
+    async def plan_routes(
         self,
         shipments: List[Shipment],
         vehicles: List[Vehicle],
-    ) -> List[RouteOptimizationResult]:
+    ) -> RouteOptimizationPlan:
         """Optimize routes using greedy algorithm."""
 
         if not shipments:
             logger.warning("No shipments to optimize")
-            return []
+            return RouteOptimizationPlan(routes=[])
 
         if not vehicles:
             raise ValueError("At least one vehicle is required")
 
-        # Filter shipments with valid coordinates
-        valid_shipments = [s for s in shipments if s.is_geocoded]
-        invalid_count = len(shipments) - len(valid_shipments)
-
-        if invalid_count > 0:
-            logger.warning(
-                f"Excluding {invalid_count} shipments without coordinates"
-            )
-
+        valid_shipments, unassigned = self.split_geocoded(shipments)
         if not valid_shipments:
             logger.warning("No shipments with valid coordinates")
-            return []
+            return RouteOptimizationPlan(routes=[], unassigned=unassigned)
 
         logger.info(
             f"Optimizing routes for {len(valid_shipments)} shipments "
             f"and {len(vehicles)} vehicles"
         )
 
+        # Convert Decimal coordinates to floats once for all later math
+        coords = shipment_coordinates(valid_shipments)
+        solution = self.solve(coords, VehicleLimits.from_vehicles(vehicles))
+
+        return self.build_plan(solution, valid_shipments, vehicles, unassigned)
+
+    def split_geocoded(
+        self,
+        shipments: List[Shipment],
+    ) -> Tuple[List[Shipment], List[UnassignedShipment]]:
+        """Separate routable shipments from those without coordinates."""
+        valid_shipments = [s for s in shipments if s.is_geocoded]
+        unassigned = [
+            UnassignedShipment(shipment=s, reason=self.REASON_NOT_GEOCODED)
+            for s in shipments
+            if not s.is_geocoded
+        ]
+
+        if unassigned:
+            logger.warning(
+                f"Excluding {len(unassigned)} shipments without coordinates"
+            )
+
+        return valid_shipments, unassigned
+
+    def solve(self, coords: np.ndarray, limits: VehicleLimits) -> RouteSolution:
+        """
+        Compute routes on plain arrays.
+
+        Works only with coordinates and vehicle limits (no entities), so it
+        can run in a worker process. Indexes in the result refer to rows of
+        ``coords`` and positions in ``limits``.
+        """
+        n_vehicles = len(limits)
+        unassigned: List[Tuple[int, str]] = []
+
         # Step 1: Cluster shipments
-        clusters = self._cluster_shipments(valid_shipments, len(vehicles))
+        if self._capacitated:
+            clusters, overflow = self._assign_with_capacity(coords, limits.max_stops)
+            unassigned.extend((int(j), self.REASON_CAPACITY) for j in overflow)
+        else:
+            clusters = self._cluster_shipments(coords, n_vehicles)
 
-        # Step 2: Order each cluster and create results
-        results = []
+        # Step 2: Order each cluster
+        deadline = time.perf_counter() + self._improvement_budget
+        pending = sum(1 for cluster in clusters if len(cluster) > 0)
+
+        routes = []
         for i, cluster in enumerate(clusters):
-            if not cluster:
+            if len(cluster) == 0:
                 continue
 
-            vehicle = vehicles[i]
+            # Order stops using nearest-neighbor on the cluster's matrix
+            matrix = DistanceMatrix(coords[cluster])
+            order = matrix.nearest_neighbor_order()
+            initial_distance = matrix.tour_length(order)
+
+            # Improve ordering, splitting the remaining budget evenly
+            if self._improver is not None:
+                budget = max(deadline - time.perf_counter(), 0.0) / pending
+                order = self._improver.improve(matrix, order, budget)
+            pending -= 1
+
+            # Shed stops until the route fits the vehicle's shift
+            max_minutes = limits.max_route_minutes[i]
+            if self._capacitated and max_minutes is not None:
+                order, dropped = drop_until_within(
+                    matrix.matrix,
+                    order,
+                    lambda tour, km: self._duration_minutes(len(tour), km)
+                    <= max_minutes,
+                )
+                unassigned.extend((int(cluster[j]), self.REASON_DURATION) for j in dropped)
+                if not order:
+                    continue
+
+            distance = matrix.tour_length(order)
+            routes.append(PlannedRoute(
+                vehicle_index=i,
+                stops=[int(cluster[j]) for j in order],
+                distance_km=distance,
+                initial_distance_km=initial_distance,
+                duration_minutes=self._duration_minutes(len(order), distance),
+            ))
+
+        return RouteSolution(routes=routes, unassigned=unassigned)
 
-            # Order stops using nearest-neighbor
-            ordered = self._nearest_neighbor_order(cluster)
+    def build_plan(
+        self,
+        solution: RouteSolution,
+        shipments: List[Shipment],
+        vehicles: List[Vehicle],
+        unassigned: Optional[List[UnassignedShipment]] = None,
+    ) -> RouteOptimizationPlan:
+        """Map an index-based solution back onto shipment and vehicle entities."""
+        unassigned = list(unassigned or [])
+        results = []
 
-            # Calculate metrics
-            distance = self._calculate_total_distance(ordered)
-            duration = self._estimate_duration(ordered, distance)
+        for route in solution.routes:
+            vehicle = vehicles[route.vehicle_index]
+            ordered = [shipments[j] for j in route.stops]
 
             results.append(RouteOptimizationResult(
                 vehicle=vehicle,
                 shipments=ordered,
-                total_distance_km=Decimal(str(round(distance, 2))),
-                estimated_duration_minutes=duration,
+                total_distance_km=Decimal(str(round(route.distance_km, 2))),
+                estimated_duration_minutes=route.duration_minutes,
+                initial_distance_km=Decimal(str(round(route.initial_distance_km, 2))),
             ))
 
             logger.info(
                 f"Route for {vehicle.placa}: "
                 f"{len(ordered)} stops, "
-                f"{distance:.2f} km, "
-                f"{duration} min"
+                f"{route.distance_km:.2f} km (initial {route.initial_distance_km:.2f} km), "
+                f"{route.duration_minutes} min"
             )
 
-        return results
+        unassigned.extend(
+            UnassignedShipment(shipment=shipments[j], reason=reason)
+            for j, reason in solution.unassigned
+        )
+        if unassigned:
+            logger.warning(f"{len(unassigned)} shipments left unassigned")
+
+        return RouteOptimizationPlan(routes=results, unassigned=unassigned)
+
+    def _assign_with_capacity(
+        self,
+        coords: np.ndarray,
+        max_stops: List[Optional[int]],
+    ) -> Tuple[List[np.ndarray], np.ndarray]:
+        """
+        Balanced assignment honouring each vehicle's max_stops.
+
+        Returns (clusters, overflow) where clusters[i] holds indexes into
+        ``coords`` for vehicle i and overflow holds indexes that did not fit.
+        """
+        capacities = vehicle_capacities(max_stops, len(coords), self._balance_slack)
+        labels = balanced_assignment(coords, capacities)
+        clusters = [np.flatnonzero(labels == k) for k in range(len(max_stops))]
+        return clusters, np.flatnonzero(labels == UNASSIGNED)
 
     def _cluster_shipments(
         self,
-        shipments: List[Shipment],
+        coords: np.ndarray,
         n_clusters: int,
-    ) -> List[List[Shipment]]:
+    ) -> List[np.ndarray]:
         """
         Cluster shipments using K-means on coordinates.
 
-        Returns list of clusters, each containing shipments.
+        Returns list of clusters, each an array of indexes into ``coords``.
         """
-        if len(shipments) <= n_clusters:
+        n = len(coords)
+        if n <= n_clusters:
             # One shipment per cluster (or empty clusters)
-            clusters = [[s] for s in shipments]
+            clusters = [np.array([i]) for i in range(n)]
             while len(clusters) < n_clusters:
-                clusters.append([])
+                clusters.append(np.array([], dtype=int))
             return clusters
 
-        # Extract coordinates for clustering
-        coords = np.array([
-            [float(s.latitude), float(s.longitude)]
-            for s in shipments
-        ])
-
         # Run K-means
         kmeans = KMeans(n_clusters=n_clusters, random_state=42, n_init=10)
         labels = kmeans.fit_predict(coords)
 
-        # Group shipments by cluster
-        clusters = [[] for _ in range(n_clusters)]
-        for i, shipment in enumerate(shipments):
-            clusters[labels[i]].append(shipment)
-
-        return clusters
-
-    def _nearest_neighbor_order(
-        self,
-        shipments: List[Shipment],
-    ) -> List[Shipment]:
-        """
-        Order shipments using nearest-neighbor heuristic.
-
-        Starts at first shipment and always moves to nearest unvisited.
-        """
-        if len(shipments) <= 1:
-            return shipments
-
-        ordered = [shipments[0]]
-        remaining = set(range(1, len(shipments)))
-
-        while remaining:
-            current = ordered[-1]
-            nearest_idx = None
-            nearest_dist = float('inf')
-
-            for idx in remaining:
-                dist = current.coordinates.distance_to(
-                    shipments[idx].coordinates
-                )
-                if dist < nearest_dist:
-                    nearest_dist = dist
-                    nearest_idx = idx
-
-            ordered.append(shipments[nearest_idx])
-            remaining.remove(nearest_idx)
-
-        return ordered
-
-    def _calculate_total_distance(self, shipments: List[Shipment]) -> float:
-        """Calculate total distance between consecutive stops in km."""
-        if len(shipments) <= 1:
-            return 0.0
-
-        total = 0.0
-        for i in range(len(shipments) - 1):
-            total += shipments[i].coordinates.distance_to(
-                shipments[i + 1].coordinates
-            )
-
-        return total
+        # Group shipment indexes by cluster
+        return [np.flatnonzero(labels == k) for k in range(n_clusters)]
 
     def _estimate_duration(
         self,
         shipments: List[Shipment],
         total_distance_km: float,
     ) -> int:
+        """Estimate total duration in minutes for a list of stops."""
+        return self._duration_minutes(len(shipments), total_distance_km)
+
+    def _duration_minutes(self, stops: int, total_distance_km: float) -> int:
         """
         Estimate total duration in minutes.
 
         Formula: (distance / speed * 60) + (stops * time_per_stop)
         """
         driving_time = (total_distance_km / self.AVG_SPEED_KMH) * 60
-        stop_time = len(shipments) * self.TIME_PER_STOP_MIN
+        stop_time = stops * self.TIME_PER_STOP_MIN
 
         return int(driving_time + stop_time)
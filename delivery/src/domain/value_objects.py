@@ -18,6 +18,17 @@ class RouteStatus(str, Enum):
     CANCELADA = "cancelada"
 
 
+class RouteJobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+    @property
+    def is_active(self) -> bool:
+        return self in (RouteJobStatus.QUEUED, RouteJobStatus.RUNNING)
+
+
 class GeocodingStatus(str, Enum):
     PENDING = "pending"
     SUCCESS = "success"
@@ -35,6 +35,10 @@ class Settings(BaseSettings):
     sqs_order_events_queue_url: str = Field(
         default="http://localstack:4566/000000000000/medisupply-order-events-delivery-queue"
     )
+    sqs_consumer_max_concurrency: int = Field(default=10)
+    sqs_consumer_wait_time_seconds: int = Field(default=20)
+    sqs_recent_event_ids_size: int = Field(default=10000)  # 0 disables the in-memory filter
+    sqs_recent_event_ids_ttl_seconds: float = Field(default=300.0)
 
     # SQS Configuration (Publisher)
     sqs_routes_generated_queue_url: str = Field(
@@ -45,6 +49,34 @@ class Settings(BaseSettings):
     nominatim_base_url: str = Field(default="https://nominatim.openstreetmap.org")
     nominatim_rate_limit_seconds: float = Field(default=1.0)
 
+    # Geocoding cache
+    geocode_cache_enabled: bool = Field(default=True)
+    geocode_cache_memory_size: int = Field(default=10000)
+    geocode_cache_ttl_days: int = Field(default=90)
+    geocode_cache_negative_ttl_hours: int = Field(default=24)
+    geocode_cache_hit_flush_threshold: int = Field(default=100)
+
+    # Geocoding worker
+    geocoding_worker_enabled: bool = Field(default=True)
+    geocoding_batch_size: int = Field(default=50)
+    geocoding_concurrency: int = Field(default=5)
+    geocoding_poll_interval_seconds: float = Field(default=5.0)
+    geocoding_max_attempts: int = Field(default=5)
+    geocoding_retry_base_delay_seconds: float = Field(default=30.0)
+    geocoding_retry_max_delay_seconds: float = Field(default=3600.0)
+    geocoding_lease_seconds: float = Field(default=300.0)
+
+    # Route optimization
+    route_optimizer_strategy: str = Field(default="local_search")  # greedy | local_search
+    route_improvement_time_budget_seconds: float = Field(default=2.0)
+    route_improvement_max_segment_length: int = Field(default=3)
+    route_assignment_mode: str = Field(default="capacitated")  # kmeans | capacitated
+    route_balance_slack: float = Field(default=1.2)
+    route_optimization_workers: int = Field(default=2)  # 0 = run in-process
+    route_optimization_timeout_seconds: float = Field(default=300.0)
+    route_generation_max_concurrent_jobs: int = Field(default=1)
+    route_generation_job_lease_seconds: float = Field(default=300.0)
+
     # Logging
     log_level: str = Field(default="INFO")
 
@@ -1,6 +1,8 @@
 from .base import Base
+from .geocode_cache import GeocodeCacheModel
 from .processed_event import ProcessedEventModel
 from .route import RouteModel
+from .route_generation_job import RouteGenerationJobModel
 from .shipment import ShipmentModel
 from .vehicle import VehicleModel
 
@@ -8,6 +10,8 @@ __all__ = [
     "Base",
     "VehicleModel",
     "RouteModel",
+    "RouteGenerationJobModel",
     "ShipmentModel",
     "ProcessedEventModel",
+    "GeocodeCacheModel",
 ]
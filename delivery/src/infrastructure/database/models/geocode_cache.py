@@ -0,0 +1,19 @@
+from sqlalchemy import Column, DateTime, Integer, Numeric, String, Text, func
+
+from .base import Base
+
+
+class GeocodeCacheModel(Base):
+    __tablename__ = "geocode_cache"
+
+    address_key = Column(String(64), primary_key=True)
+    address = Column(Text, nullable=False)
+    city = Column(String(255), nullable=False)
+    country = Column(String(255), nullable=False)
+    latitude = Column(Numeric(10, 8), nullable=True)
+    longitude = Column(Numeric(11, 8), nullable=True)
+    hit_count = Column(Integer, nullable=False, default=0)
+    lookup_count = Column(Integer, nullable=False, default=1)
+    refreshed_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), index=True)
+    last_hit_at = Column(DateTime(timezone=True), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -0,0 +1,36 @@
+import uuid
+
+from sqlalchemy import Column, Date, DateTime, Index, Integer, String, Text, func, text
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
+
+from .base import Base
+
+
+class RouteGenerationJobModel(Base):
+    __tablename__ = "route_generation_jobs"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    fecha_entrega_estimada = Column(Date, nullable=False, index=True)
+    vehicle_ids = Column(ARRAY(UUID(as_uuid=True)), nullable=False)
+    dedup_key = Column(String(64), nullable=False)
+    status = Column(String(20), nullable=False, default="queued", index=True)
+    progress = Column(Integer, nullable=False, default=0)
+    num_shipments = Column(Integer, nullable=False, default=0)
+    num_routes = Column(Integer, nullable=False, default=0)
+    num_assigned_shipments = Column(Integer, nullable=False, default=0)
+    num_unassigned_shipments = Column(Integer, nullable=False, default=0)
+    error_message = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+    lease_expires_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        # At most one queued/running job per date + vehicle set
+        Index(
+            "uq_route_generation_jobs_active_dedup_key",
+            "dedup_key",
+            unique=True,
+            postgresql_where=text("status IN ('queued', 'running')"),
+        ),
+    )
@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import Column, Date, DateTime, ForeignKey, Integer, Numeric, String, func
+from sqlalchemy import Column, Date, DateTime, ForeignKey, Index, Integer, Numeric, String, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -19,6 +19,8 @@ class ShipmentModel(Base):
     latitude = Column(Numeric(10, 8), nullable=True)
     longitude = Column(Numeric(11, 8), nullable=True)
     geocoding_status = Column(String(20), nullable=False, default="pending", index=True)
+    geocoding_attempts = Column(Integer, nullable=False, default=0)
+    geocoding_next_attempt_at = Column(DateTime(timezone=True), nullable=True)
     route_id = Column(
         UUID(as_uuid=True), ForeignKey("routes.id"), nullable=True, index=True
     )
@@ -33,3 +35,12 @@ class ShipmentModel(Base):
 
     # Relationships
     route = relationship("RouteModel", back_populates="shipments")
+
+    __table_args__ = (
+        # Geocoding worker: pending shipments whose next attempt is due
+        Index(
+            "ix_shipments_geocoding_queue",
+            "geocoding_status",
+            "geocoding_next_attempt_at",
+        ),
+    )
@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import Boolean, Column, DateTime, String, func
+from sqlalchemy import Boolean, Column, DateTime, Integer, String, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -15,6 +15,8 @@ class VehicleModel(Base):
     driver_name = Column(String(100), nullable=False)
     driver_phone = Column(String(30), nullable=True)
     is_active = Column(Boolean, nullable=False, default=True, index=True)
+    max_stops = Column(Integer, nullable=True)
+    max_route_minutes = Column(Integer, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
@@ -1,12 +1,22 @@
+import asyncio
+from datetime import timedelta
+from typing import Optional
+from uuid import UUID
+
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.adapters.input.geocoding_worker import GeocodingWorker
 from src.adapters.output.adapters import (
+    CachedGeocodingService,
     NominatimGeocodingService,
+    ProcessPoolRouteOptimizer,
     SQSEventPublisher,
 )
 from src.adapters.output.repositories import (
+    SQLAlchemyGeocodeCacheRepository,
     SQLAlchemyProcessedEventRepository,
+    SQLAlchemyRouteGenerationJobRepository,
     SQLAlchemyRouteRepository,
     SQLAlchemyShipmentRepository,
     SQLAlchemyVehicleRepository,
@@ -14,17 +24,30 @@ from src.adapters.output.repositories import (
 from src.application.use_cases.consume_order_created import ConsumeOrderCreatedUseCase
 from src.application.use_cases.create_vehicle import CreateVehicleUseCase
 from src.application.use_cases.delete_vehicle import DeleteVehicleUseCase
+from src.application.use_cases.expire_route_generation_jobs import (
+    ExpireRouteGenerationJobsUseCase,
+)
 from src.application.use_cases.generate_routes import GenerateRoutesUseCase
+from src.application.use_cases.geocode_pending_shipments import GeocodePendingShipmentsUseCase
 from src.application.use_cases.get_route import GetRouteUseCase
+from src.application.use_cases.get_route_generation_job import GetRouteGenerationJobUseCase
 from src.application.use_cases.get_shipment_by_order import GetShipmentByOrderUseCase
+from src.application.use_cases.get_shipments_by_orders import GetShipmentsByOrdersUseCase
 from src.application.use_cases.list_routes import ListRoutesUseCase
 from src.application.use_cases.list_vehicles import ListVehiclesUseCase
+from src.application.use_cases.run_route_generation_job import RunRouteGenerationJobUseCase
+from src.application.use_cases.submit_route_generation_job import (
+    SubmitRouteGenerationJobUseCase,
+)
 from src.application.use_cases.update_route_status import UpdateRouteStatusUseCase
 from src.application.use_cases.update_shipment_status import UpdateShipmentStatusUseCase
 from src.application.use_cases.update_vehicle import UpdateVehicleUseCase
+from src.application.ports import GeocodingPort, RouteOptimizationPort
+from src.domain.services.local_search import LocalSearchImprover
 from src.domain.services.route_optimizer import GreedyRouteOptimizer
 from src.infrastructure.config.settings import settings
-from src.infrastructure.database.config import get_db
+from src.infrastructure.database.config import async_session, get_db
+from src.infrastructure.executors import get_optimization_executor
 
 
 # Repository factories
@@ -44,12 +67,54 @@ def get_processed_event_repository(session: AsyncSession) -> SQLAlchemyProcessed
     return SQLAlchemyProcessedEventRepository(session)
 
 
+def get_route_generation_job_repository(
+    session: AsyncSession,
+) -> SQLAlchemyRouteGenerationJobRepository:
+    return SQLAlchemyRouteGenerationJobRepository(session)
+
+
+def get_geocode_cache_repository(session: AsyncSession) -> SQLAlchemyGeocodeCacheRepository:
+    return SQLAlchemyGeocodeCacheRepository(session)
+
+
 # External adapter factories
-def get_geocoding_service() -> NominatimGeocodingService:
-    return NominatimGeocodingService(
-        base_url=settings.nominatim_base_url,
-        rate_limit_seconds=settings.nominatim_rate_limit_seconds,
-    )
+_geocoding_service: Optional[GeocodingPort] = None
+
+
+def get_geocoding_service() -> GeocodingPort:
+    """
+    Get the process-wide geocoding service.
+
+    A singleton so the in-process cache and the provider rate limit are
+    shared by every caller.
+    """
+    global _geocoding_service
+    if _geocoding_service is None:
+        nominatim = NominatimGeocodingService(
+            base_url=settings.nominatim_base_url,
+            rate_limit_seconds=settings.nominatim_rate_limit_seconds,
+        )
+        if settings.geocode_cache_enabled:
+            _geocoding_service = CachedGeocodingService(
+                upstream=nominatim,
+                session_factory=async_session,
+                repository_factory=get_geocode_cache_repository,
+                memory_size=settings.geocode_cache_memory_size,
+                ttl=timedelta(days=settings.geocode_cache_ttl_days),
+                negative_ttl=timedelta(hours=settings.geocode_cache_negative_ttl_hours),
+                hit_flush_threshold=settings.geocode_cache_hit_flush_threshold,
+            )
+        else:
+            _geocoding_service = nominatim
+    return _geocoding_service
+
+
+async def close_geocoding_service() -> None:
+    """Flush buffered cache counters and drop the singleton."""
+    global _geocoding_service
+    service, _geocoding_service = _geocoding_service, None
+    if isinstance(service, CachedGeocodingService):
+        await service.flush_hits()
 
 
 def get_event_publisher() -> SQSEventPublisher:
@@ -62,8 +127,21 @@ def get_event_publisher() -> SQSEventPublisher:
     )
 
 
-def get_route_optimizer() -> GreedyRouteOptimizer:
-    return GreedyRouteOptimizer()
+def get_route_optimizer() -> RouteOptimizationPort:
+    improver = None
+    if settings.route_optimizer_strategy == "local_search":
+        improver = LocalSearchImprover(
+            max_segment_length=settings.route_improvement_max_segment_length,
+        )
+    optimizer = GreedyRouteOptimizer(
+        improver=improver,
+        improvement_time_budget_seconds=settings.route_improvement_time_budget_seconds,
+        capacitated=settings.route_assignment_mode == "capacitated",
+        balance_slack=settings.route_balance_slack,
+    )
+    if settings.route_optimization_workers > 0:
+        return ProcessPoolRouteOptimizer(optimizer, get_optimization_executor())
+    return optimizer
 
 
 # Use case factories with dependency injection
@@ -136,6 +214,16 @@ async def get_get_shipment_by_order_use_case(
     )
 
 
+async def get_get_shipments_by_orders_use_case(
+    session: AsyncSession = Depends(get_db),
+) -> GetShipmentsByOrdersUseCase:
+    return GetShipmentsByOrdersUseCase(
+        shipment_repository=get_shipment_repository(session),
+        vehicle_repository=get_vehicle_repository(session),
+        route_repository=get_route_repository(session),
+    )
+
+
 async def get_update_shipment_status_use_case(
     session: AsyncSession = Depends(get_db),
 ) -> UpdateShipmentStatusUseCase:
@@ -157,11 +245,110 @@ async def get_generate_routes_use_case(
     )
 
 
-async def get_consume_order_created_use_case(
+async def get_submit_route_generation_job_use_case(
+    session: AsyncSession = Depends(get_db),
+) -> SubmitRouteGenerationJobUseCase:
+    return SubmitRouteGenerationJobUseCase(
+        job_repository=get_route_generation_job_repository(session),
+        session=session,
+        lease=timedelta(seconds=settings.route_generation_job_lease_seconds),
+    )
+
+
+async def get_get_route_generation_job_use_case(
     session: AsyncSession = Depends(get_db),
+) -> GetRouteGenerationJobUseCase:
+    return GetRouteGenerationJobUseCase(
+        job_repository=get_route_generation_job_repository(session),
+    )
+
+
+_route_job_semaphore: Optional[asyncio.Semaphore] = None
+
+
+def get_route_job_semaphore() -> asyncio.Semaphore:
+    """Limits how many route-generation jobs run at once in this process."""
+    global _route_job_semaphore
+    if _route_job_semaphore is None:
+        _route_job_semaphore = asyncio.Semaphore(settings.route_generation_max_concurrent_jobs)
+    return _route_job_semaphore
+
+
+async def run_route_generation_job(job_id: UUID) -> None:
+    """
+    Background entry point for a queued job.
+
+    Opens its own sessions because the request-scoped session is closed
+    once the 202 response has been sent.
+    """
+    async with async_session() as session, async_session() as job_session:
+        generate_routes = GenerateRoutesUseCase(
+            shipment_repository=get_shipment_repository(session),
+            vehicle_repository=get_vehicle_repository(session),
+            route_repository=get_route_repository(session),
+            route_optimizer=get_route_optimizer(),
+            event_publisher=get_event_publisher(),
+            session=session,
+        )
+        use_case = RunRouteGenerationJobUseCase(
+            job_repository=get_route_generation_job_repository(job_session),
+            job_session=job_session,
+            generate_routes_use_case=generate_routes,
+            concurrency=get_route_job_semaphore(),
+            lease=timedelta(seconds=settings.route_generation_job_lease_seconds),
+        )
+        await use_case.execute(job_id)
+
+
+async def expire_route_generation_jobs() -> int:
+    """Fail jobs left queued or running by a worker that died (run at startup)."""
+    async with async_session() as session:
+        use_case = ExpireRouteGenerationJobsUseCase(
+            job_repository=get_route_generation_job_repository(session),
+            session=session,
+        )
+        return await use_case.execute()
+
+
+# SQS consumer (one session per message)
+def get_consume_order_created_use_case(
+    session: AsyncSession,
 ) -> ConsumeOrderCreatedUseCase:
     return ConsumeOrderCreatedUseCase(
         shipment_repository=get_shipment_repository(session),
         processed_event_repository=get_processed_event_repository(session),
+        session=session,
+        on_shipment_created=get_geocoding_worker().wake,
+    )
+
+
+# Geocoding worker
+def get_geocode_pending_shipments_use_case(
+    session: AsyncSession,
+) -> GeocodePendingShipmentsUseCase:
+    return GeocodePendingShipmentsUseCase(
+        shipment_repository=get_shipment_repository(session),
         geocoding_service=get_geocoding_service(),
+        session=session,
+        batch_size=settings.geocoding_batch_size,
+        concurrency=settings.geocoding_concurrency,
+        max_attempts=settings.geocoding_max_attempts,
+        retry_base_delay=timedelta(seconds=settings.geocoding_retry_base_delay_seconds),
+        retry_max_delay=timedelta(seconds=settings.geocoding_retry_max_delay_seconds),
+        lease=timedelta(seconds=settings.geocoding_lease_seconds),
     )
+
+
+_geocoding_worker: Optional[GeocodingWorker] = None
+
+
+def get_geocoding_worker() -> GeocodingWorker:
+    """Get the process-wide geocoding worker."""
+    global _geocoding_worker
+    if _geocoding_worker is None:
+        _geocoding_worker = GeocodingWorker(
+            session_factory=async_session,
+            use_case_factory=get_geocode_pending_shipments_use_case,
+            poll_interval_seconds=settings.geocoding_poll_interval_seconds,
+        )
+    return _geocoding_worker
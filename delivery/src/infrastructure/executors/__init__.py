@@ -0,0 +1,11 @@
+from .optimization_executor import (
+    OptimizationExecutor,
+    get_optimization_executor,
+    shutdown_optimization_executor,
+)
+
+__all__ = [
+    "OptimizationExecutor",
+    "get_optimization_executor",
+    "shutdown_optimization_executor",
+]
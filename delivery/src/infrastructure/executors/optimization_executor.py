@@ -0,0 +1,135 @@
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from typing import Any, Callable, List, Optional, Set
+
+from src.domain.exceptions import RouteOptimizationError
+
+logger = logging.getLogger(__name__)
+
+
+class OptimizationExecutor:
+    """
+    Runs CPU-bound route optimization in worker processes.
+
+    Keeps KMeans and the routing loops off the event loop so HTTP handlers
+    and the SQS consumer stay responsive. Each running job has a worker
+    process of its own (idle workers are reused), so a job that exceeds the
+    timeout, or whose awaiting task is cancelled, has just its own worker
+    killed while other jobs keep running.
+    """
+
+    def __init__(self, max_workers: int = 2, timeout_seconds: Optional[float] = 300.0):
+        """
+        Args:
+            max_workers: Number of worker processes (jobs running at once)
+            timeout_seconds: Per-job timeout (None = wait indefinitely)
+        """
+        self.max_workers = max_workers
+        self.timeout_seconds = timeout_seconds
+        self._slots = asyncio.Semaphore(max_workers)
+        self._idle: List[ProcessPoolExecutor] = []
+        self._busy: Set[ProcessPoolExecutor] = set()
+
+    def _acquire_worker(self) -> ProcessPoolExecutor:
+        if self._idle:
+            worker = self._idle.pop()
+        else:
+            # forkserver avoids forking a process that holds the event loop,
+            # DB connections and SQS clients
+            context = multiprocessing.get_context("forkserver")
+            worker = ProcessPoolExecutor(max_workers=1, mp_context=context)
+            logger.info("Started optimization worker process")
+        self._busy.add(worker)
+        return worker
+
+    def _release_worker(self, worker: ProcessPoolExecutor, healthy: bool) -> None:
+        self._busy.discard(worker)
+        if healthy:
+            self._idle.append(worker)
+        else:
+            self._terminate(worker)
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run ``fn(*args)`` in a worker process and await the result.
+
+        ``fn`` and its arguments must be picklable.
+
+        Raises:
+            RouteOptimizationError: On timeout or if the worker process dies
+        """
+        async with self._slots:
+            worker = self._acquire_worker()
+            healthy = False
+            try:
+                loop = asyncio.get_running_loop()
+                future = loop.run_in_executor(worker, partial(fn, *args))
+                result = await asyncio.wait_for(future, timeout=self.timeout_seconds)
+                healthy = True
+                return result
+            except asyncio.TimeoutError:
+                raise RouteOptimizationError(
+                    f"Route optimization timed out after {self.timeout_seconds}s"
+                )
+            except BrokenProcessPool as e:
+                raise RouteOptimizationError(f"Optimization worker crashed: {e}")
+            except Exception:
+                # Raised by fn inside the worker, which is still usable
+                healthy = True
+                raise
+            finally:
+                self._release_worker(worker, healthy)
+
+    @staticmethod
+    def _terminate(worker: ProcessPoolExecutor) -> None:
+        """Kill one job's worker so an abandoned job stops consuming CPU."""
+        # ProcessPoolExecutor cannot cancel a running call; stop its process
+        for process in list((worker._processes or {}).values()):
+            if process.is_alive():
+                process.terminate()
+        worker.shutdown(wait=False, cancel_futures=True)
+        logger.warning("Optimization worker process terminated")
+
+    def shutdown(self) -> None:
+        """
+        Stop the workers, waiting for running jobs to finish.
+
+        Blocks; call it from a thread when an event loop is running.
+        """
+        workers = self._idle + list(self._busy)
+        self._idle, self._busy = [], set()
+        for worker in workers:
+            worker.shutdown(wait=True, cancel_futures=True)
+        if workers:
+            logger.info("Optimization worker processes stopped")
+
+
+_executor_instance: Optional[OptimizationExecutor] = None
+
+
+def get_optimization_executor() -> OptimizationExecutor:
+    """Get singleton optimization executor configured from settings."""
+    global _executor_instance
+
+    if _executor_instance is None:
+        from src.infrastructure.config.settings import settings
+
+        _executor_instance = OptimizationExecutor(
+            max_workers=settings.route_optimization_workers,
+            timeout_seconds=settings.route_optimization_timeout_seconds,
+        )
+
+    return _executor_instance
+
+
+def shutdown_optimization_executor() -> None:
+    """Shut down and reset the singleton executor (blocks until jobs finish)."""
+    global _executor_instance
+
+    if _executor_instance is not None:
+        _executor_instance.shutdown()
+        _executor_instance = None
@@ -0,0 +1,3 @@
+from .token_bucket import TokenBucket
+
+__all__ = ["TokenBucket"]
@@ -0,0 +1,64 @@
+import asyncio
+import time
+
+
+class TokenBucket:
+    """
+    Async token-bucket rate limiter shared by concurrent callers.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``.
+    ``acquire()`` waits until a token is available; waiters are served in
+    arrival order because the refill-and-wait step runs under a lock.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        """
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+        self.acquired_total = 0
+        self.waited_seconds_total = 0.0
+
+    @classmethod
+    def per_interval(cls, interval_seconds: float, capacity: float = 1.0) -> "TokenBucket":
+        """Bucket allowing one call every ``interval_seconds`` on average."""
+        return cls(rate=1.0 / interval_seconds, capacity=capacity)
+
+    @property
+    def available(self) -> float:
+        self._refill()
+        return self._tokens
+
+    async def acquire(self) -> float:
+        """
+        Take one token, waiting for it if necessary.
+
+        Returns:
+            Seconds spent waiting
+        """
+        async with self._lock:
+            self._refill()
+            waited = 0.0
+            if self._tokens < 1:
+                waited = (1 - self._tokens) / self.rate
+                await asyncio.sleep(waited)
+                self._refill()
+            self._tokens = max(self._tokens - 1, 0.0)
+            self.acquired_total += 1
+            self.waited_seconds_total += waited
+            return waited
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
@@ -10,12 +10,14 @@ from httpx import ASGITransport, AsyncClient
 
 from src.adapters.input.controllers.route_controller import router
 from src.domain.entities.route import Route
-from src.domain.value_objects import RouteStatus
+from src.domain.entities.route_generation_job import RouteGenerationJob
+from src.domain.value_objects import RouteJobStatus, RouteStatus
 from src.domain.exceptions import EntityNotFoundError, InvalidStatusTransitionError
 from src.infrastructure.dependencies import (
-    get_generate_routes_use_case,
+    get_get_route_generation_job_use_case,
     get_list_routes_use_case,
     get_get_route_use_case,
+    get_submit_route_generation_job_use_case,
     get_update_route_status_use_case,
 )
 from src.infrastructure.database.config import get_db
@@ -24,29 +26,42 @@ from src.infrastructure.database.config import get_db
 class TestGenerateRoutes:
     """Tests for generate_routes endpoint."""
 
+    def _job(self, delivery_date, vehicle_ids, status=RouteJobStatus.QUEUED):
+        return RouteGenerationJob(
+            id=uuid4(),
+            fecha_entrega_estimada=delivery_date,
+            vehicle_ids=vehicle_ids,
+            dedup_key=RouteGenerationJob.build_dedup_key(delivery_date, vehicle_ids),
+            status=status,
+        )
+
     @pytest.mark.asyncio
     async def test_generate_routes_success(self):
         """Test successful route generation."""
         vehicle_ids = [uuid4(), uuid4()]
         delivery_date = date.today() + timedelta(days=1)
+        job = self._job(delivery_date, vehicle_ids)
 
         app = FastAPI()
         app.include_router(router, prefix="/delivery")
 
         # Create mocks
         mock_use_case = MagicMock()
-        mock_use_case.execute = AsyncMock(return_value=None)
+        mock_use_case.execute = AsyncMock(return_value=(job, True))
 
         mock_shipment_repo = MagicMock()
         mock_shipment_repo.find_pending_by_date = AsyncMock(return_value=[MagicMock(), MagicMock()])
 
         # Override dependencies
-        app.dependency_overrides[get_generate_routes_use_case] = lambda: mock_use_case
+        app.dependency_overrides[get_submit_route_generation_job_use_case] = lambda: mock_use_case
 
         with patch(
             "src.adapters.input.controllers.route_controller.get_shipment_repository",
             return_value=mock_shipment_repo
-        ):
+        ), patch(
+            "src.adapters.input.controllers.route_controller.run_route_generation_job",
+            new_callable=AsyncMock,
+        ) as mock_run:
             async with AsyncClient(
                 transport=ASGITransport(app=app), base_url="http://test"
             ) as client:
@@ -63,6 +78,55 @@ class TestGenerateRoutes:
             assert data["message"] == "Route generation started"
             assert data["num_vehicles"] == 2
             assert data["num_pending_shipments"] == 2
+            assert data["job_id"] == str(job.id)
+            assert data["job_status"] == "queued"
+            assert data["deduplicated"] is False
+            mock_run.assert_awaited_once_with(job.id)
+
+        app.dependency_overrides.clear()
+
+    @pytest.mark.asyncio
+    async def test_generate_routes_reuses_active_job(self):
+        """Test that a duplicate request returns the running job without a new run."""
+        vehicle_ids = [uuid4()]
+        delivery_date = date.today() + timedelta(days=1)
+        job = self._job(delivery_date, vehicle_ids, status=RouteJobStatus.RUNNING)
+
+        app = FastAPI()
+        app.include_router(router, prefix="/delivery")
+
+        mock_use_case = MagicMock()
+        mock_use_case.execute = AsyncMock(return_value=(job, False))
+
+        mock_shipment_repo = MagicMock()
+        mock_shipment_repo.find_pending_by_date = AsyncMock(return_value=[])
+
+        app.dependency_overrides[get_submit_route_generation_job_use_case] = lambda: mock_use_case
+
+        with patch(
+            "src.adapters.input.controllers.route_controller.get_shipment_repository",
+            return_value=mock_shipment_repo
+        ), patch(
+            "src.adapters.input.controllers.route_controller.run_route_generation_job",
+            new_callable=AsyncMock,
+        ) as mock_run:
+            async with AsyncClient(
+                transport=ASGITransport(app=app), base_url="http://test"
+            ) as client:
+                response = await client.post(
+                    "/delivery/routes/generate",
+                    json={
+                        "fecha_entrega_estimada": delivery_date.isoformat(),
+                        "vehicle_ids": [str(vid) for vid in vehicle_ids],
+                    },
+                )
+
+            assert response.status_code == status.HTTP_202_ACCEPTED
+            data = response.json()
+            assert data["job_id"] == str(job.id)
+            assert data["job_status"] == "running"
+            assert data["deduplicated"] is True
+            mock_run.assert_not_called()
 
         app.dependency_overrides.clear()
 
@@ -73,16 +137,19 @@ class TestGenerateRoutes:
         app.include_router(router, prefix="/delivery")
 
         mock_use_case = MagicMock()
-        mock_use_case.execute = AsyncMock(return_value=None)
+        mock_use_case.execute = AsyncMock(return_value=(self._job(date.today(), []), True))
 
         mock_shipment_repo = MagicMock()
         mock_shipment_repo.find_pending_by_date = AsyncMock(return_value=[])
 
-        app.dependency_overrides[get_generate_routes_use_case] = lambda: mock_use_case
+        app.dependency_overrides[get_submit_route_generation_job_use_case] = lambda: mock_use_case
 
         with patch(
             "src.adapters.input.controllers.route_controller.get_shipment_repository",
             return_value=mock_shipment_repo
+        ), patch(
+            "src.adapters.input.controllers.route_controller.run_route_generation_job",
+            new_callable=AsyncMock,
         ):
             async with AsyncClient(
                 transport=ASGITransport(app=app), base_url="http://test"
@@ -101,6 +168,69 @@ class TestGenerateRoutes:
         app.dependency_overrides.clear()
 
 
+class TestGetRouteGenerationJob:
+    """Tests for get_route_generation_job endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_get_job_success(self):
+        """Test getting a job's progress."""
+        delivery_date = date.today()
+        vehicle_ids = [uuid4()]
+        job = RouteGenerationJob(
+            id=uuid4(),
+            fecha_entrega_estimada=delivery_date,
+            vehicle_ids=vehicle_ids,
+            dedup_key=RouteGenerationJob.build_dedup_key(delivery_date, vehicle_ids),
+        )
+        job.start()
+        job.report_progress(70)
+        job.num_shipments = 12
+
+        app = FastAPI()
+        app.include_router(router, prefix="/delivery")
+
+        mock_use_case = MagicMock()
+        mock_use_case.execute = AsyncMock(return_value=job)
+        app.dependency_overrides[get_get_route_generation_job_use_case] = lambda: mock_use_case
+
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.get(f"/delivery/route-jobs/{job.id}")
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["status"] == "running"
+        assert data["progress"] == 70
+        assert data["num_shipments"] == 12
+        assert data["started_at"] is not None
+        assert data["finished_at"] is None
+
+        app.dependency_overrides.clear()
+
+    @pytest.mark.asyncio
+    async def test_get_job_not_found(self):
+        """Test 404 for unknown job."""
+        job_id = uuid4()
+        app = FastAPI()
+        app.include_router(router, prefix="/delivery")
+
+        mock_use_case = MagicMock()
+        mock_use_case.execute = AsyncMock(
+            side_effect=EntityNotFoundError("RouteGenerationJob", str(job_id))
+        )
+        app.dependency_overrides[get_get_route_generation_job_use_case] = lambda: mock_use_case
+
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.get(f"/delivery/route-jobs/{job_id}")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+        app.dependency_overrides.clear()
+
+
 class TestListRoutes:
     """Tests for list_routes endpoint."""
 
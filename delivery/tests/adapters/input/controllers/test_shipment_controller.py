@@ -8,12 +8,19 @@ from unittest.mock import AsyncMock, MagicMock
 from fastapi import FastAPI, status
 from httpx import ASGITransport, AsyncClient
 
-from src.adapters.input.controllers.shipment_controller import router
+from src.adapters.input.controllers.shipment_controller import (
+    MAX_ORDER_IDS_PER_REQUEST,
+    router,
+)
 from src.domain.entities.shipment import Shipment
 from src.domain.value_objects import ShipmentStatus
 from src.domain.exceptions import EntityNotFoundError, InvalidStatusTransitionError
+from src.infrastructure.database.config import get_db
 from src.infrastructure.dependencies import (
+    get_geocoding_service,
+    get_geocoding_worker,
     get_get_shipment_by_order_use_case,
+    get_get_shipments_by_orders_use_case,
     get_update_shipment_status_use_case,
 )
 
@@ -82,6 +89,91 @@ class TestGetShipment:
         app.dependency_overrides.clear()
 
 
+class TestGetShipmentsByOrders:
+    """Tests for the batch get_shipments_by_orders endpoint."""
+
+    def _app(self, mock_use_case):
+        app = FastAPI()
+        app.include_router(router, prefix="/delivery")
+        app.dependency_overrides[get_get_shipments_by_orders_use_case] = lambda: mock_use_case
+        return app
+
+    @pytest.mark.asyncio
+    async def test_get_shipments_comma_separated(self):
+        """Test batch lookup with a comma-separated order_ids value."""
+        order_ids = [uuid4(), uuid4()]
+        mock_use_case = MagicMock()
+        mock_use_case.execute = AsyncMock(return_value=[{
+            "shipment_id": str(uuid4()),
+            "order_id": str(order_ids[0]),
+            "shipment_status": "pending",
+            "vehicle_plate": None,
+            "driver_name": None,
+            "fecha_entrega_estimada": date.today().isoformat(),
+            "route_id": None,
+        }])
+
+        async with AsyncClient(
+            transport=ASGITransport(app=self._app(mock_use_case)), base_url="http://test"
+        ) as client:
+            response = await client.get(
+                "/delivery/shipments",
+                params={"order_ids": ",".join(str(o) for o in order_ids)},
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        items = response.json()["items"]
+        assert len(items) == 1
+        assert items[0]["order_id"] == str(order_ids[0])
+        mock_use_case.execute.assert_called_once_with(order_ids)
+
+    @pytest.mark.asyncio
+    async def test_get_shipments_repeated_param(self):
+        """Test batch lookup with repeated order_ids parameters."""
+        order_ids = [uuid4(), uuid4()]
+        mock_use_case = MagicMock()
+        mock_use_case.execute = AsyncMock(return_value=[])
+
+        async with AsyncClient(
+            transport=ASGITransport(app=self._app(mock_use_case)), base_url="http://test"
+        ) as client:
+            response = await client.get(
+                "/delivery/shipments",
+                params=[("order_ids", str(o)) for o in order_ids],
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {"items": []}
+        mock_use_case.execute.assert_called_once_with(order_ids)
+
+    @pytest.mark.asyncio
+    async def test_get_shipments_invalid_uuid(self):
+        mock_use_case = MagicMock()
+        mock_use_case.execute = AsyncMock()
+
+        async with AsyncClient(
+            transport=ASGITransport(app=self._app(mock_use_case)), base_url="http://test"
+        ) as client:
+            response = await client.get("/delivery/shipments", params={"order_ids": "nope"})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        mock_use_case.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_shipments_too_many_ids(self):
+        mock_use_case = MagicMock()
+        mock_use_case.execute = AsyncMock()
+        order_ids = ",".join(str(uuid4()) for _ in range(MAX_ORDER_IDS_PER_REQUEST + 1))
+
+        async with AsyncClient(
+            transport=ASGITransport(app=self._app(mock_use_case)), base_url="http://test"
+        ) as client:
+            response = await client.get("/delivery/shipments", params={"order_ids": order_ids})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        mock_use_case.execute.assert_not_called()
+
+
 class TestUpdateShipmentStatus:
     """Tests for update_shipment_status endpoint."""
 
@@ -208,3 +300,48 @@ class TestUpdateShipmentStatus:
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
         app.dependency_overrides.clear()
+
+
+class TestGeocodingMetrics:
+    """Tests for the geocoding metrics endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_returns_queue_depth_and_worker_metrics(self):
+        app = FastAPI()
+        app.include_router(router, prefix="/delivery")
+
+        count_result = MagicMock()
+        count_result.scalar_one.return_value = 17
+        mock_session = AsyncMock()
+        mock_session.execute = AsyncMock(return_value=count_result)
+
+        mock_worker = MagicMock()
+        mock_worker.metrics.return_value = {
+            "running": True,
+            "batches": 2,
+            "processed": 60,
+            "succeeded": 55,
+            "failed": 1,
+            "retried": 4,
+            "errors": 0,
+            "last_batch_ms": 1200,
+            "throughput_per_second": 1.0,
+        }
+
+        app.dependency_overrides[get_db] = lambda: mock_session
+        app.dependency_overrides[get_geocoding_worker] = lambda: mock_worker
+        app.dependency_overrides[get_geocoding_service] = lambda: MagicMock()
+
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.get("/delivery/shipments/geocoding/metrics")
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["queue_depth"] == 17
+        assert data["processed"] == 60
+        assert data["throughput_per_second"] == 1.0
+        assert data["cache"] is None
+
+        app.dependency_overrides.clear()
@@ -122,6 +122,51 @@ class TestCreateVehicle:
 
         app.dependency_overrides.clear()
 
+    @pytest.mark.asyncio
+    async def test_create_vehicle_with_route_limits(self):
+        """Test creating a vehicle with capacity and shift limits."""
+        app = FastAPI()
+        app.include_router(router, prefix="/delivery")
+
+        mock_vehicle = Vehicle(
+            id=uuid4(),
+            placa="ABC-123",
+            driver_name="Juan Perez",
+            max_stops=40,
+            max_route_minutes=480,
+        )
+
+        mock_use_case = MagicMock()
+        mock_use_case.execute = AsyncMock(return_value=mock_vehicle)
+
+        app.dependency_overrides[get_create_vehicle_use_case] = lambda: mock_use_case
+
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.post(
+                "/delivery/vehicles",
+                json={
+                    "placa": "ABC-123",
+                    "driver_name": "Juan Perez",
+                    "max_stops": 40,
+                    "max_route_minutes": 480,
+                },
+            )
+            invalid = await client.post(
+                "/delivery/vehicles",
+                json={"placa": "XYZ-999", "driver_name": "Ana", "max_stops": 0},
+            )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        data = response.json()
+        assert data["max_stops"] == 40
+        assert data["max_route_minutes"] == 480
+        assert mock_use_case.execute.call_args.kwargs["max_stops"] == 40
+        assert invalid.status_code == 422
+
+        app.dependency_overrides.clear()
+
     @pytest.mark.asyncio
     async def test_create_vehicle_validation_error(self):
         """Test creating a vehicle with validation error."""
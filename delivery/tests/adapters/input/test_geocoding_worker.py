@@ -0,0 +1,107 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.adapters.input.geocoding_worker import GeocodingWorker
+from src.application.use_cases.geocode_pending_shipments import GeocodingBatchResult
+
+
+class FakeSession:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+def _worker(results, **kwargs):
+    use_case = MagicMock()
+    use_case.execute = AsyncMock(side_effect=results)
+    sessions = []
+
+    def factory(session):
+        sessions.append(session)
+        return use_case
+
+    worker = GeocodingWorker(
+        session_factory=FakeSession,
+        use_case_factory=factory,
+        **kwargs,
+    )
+    return worker, use_case, sessions
+
+
+class TestGeocodingWorker:
+    @pytest.mark.asyncio
+    async def test_each_batch_gets_its_own_session(self):
+        worker, _, sessions = _worker([
+            GeocodingBatchResult(claimed=2, succeeded=2, duration_ms=10),
+            GeocodingBatchResult(claimed=1, retried=1, duration_ms=5),
+        ])
+
+        await worker.run_batch()
+        await worker.run_batch()
+
+        assert len(sessions) == 2
+        assert sessions[0] is not sessions[1]
+
+    @pytest.mark.asyncio
+    async def test_metrics_accumulate(self):
+        worker, _, _ = _worker([
+            GeocodingBatchResult(claimed=3, succeeded=2, failed=1, duration_ms=40),
+            GeocodingBatchResult(claimed=0),
+        ])
+
+        await worker.run_batch()
+        await worker.run_batch()
+        metrics = worker.metrics()
+
+        assert metrics["batches"] == 1
+        assert metrics["processed"] == 3
+        assert metrics["succeeded"] == 2
+        assert metrics["failed"] == 1
+        assert metrics["last_batch_ms"] == 40
+        assert metrics["throughput_per_second"] == pytest.approx(3 / 60, abs=1e-3)
+
+    @pytest.mark.asyncio
+    async def test_drains_queue_then_waits_for_wake(self):
+        worker, use_case, _ = _worker(
+            [
+                GeocodingBatchResult(claimed=5, succeeded=5),
+                GeocodingBatchResult(claimed=0),
+                GeocodingBatchResult(claimed=1, succeeded=1),
+                GeocodingBatchResult(claimed=0),
+            ]
+            + [GeocodingBatchResult(claimed=0)] * 10,
+            poll_interval_seconds=60,
+        )
+
+        task = asyncio.create_task(worker.start())
+        await asyncio.sleep(0.05)
+        # Full batches run back to back; the empty one puts the worker to sleep
+        assert use_case.execute.await_count == 2
+
+        worker.wake()
+        await asyncio.sleep(0.05)
+        assert use_case.execute.await_count == 4
+
+        await worker.stop()
+        await asyncio.wait_for(task, timeout=1)
+        assert worker.metrics()["processed"] == 6
+
+    @pytest.mark.asyncio
+    async def test_batch_errors_are_counted_and_loop_continues(self):
+        worker, use_case, _ = _worker(
+            [RuntimeError("db down")] + [GeocodingBatchResult(claimed=0)] * 10,
+            poll_interval_seconds=60,
+            error_backoff_seconds=0.01,
+        )
+
+        task = asyncio.create_task(worker.start())
+        await asyncio.sleep(0.05)
+        await worker.stop()
+        await asyncio.wait_for(task, timeout=1)
+
+        assert worker.metrics()["errors"] == 1
+        assert use_case.execute.await_count == 2
@@ -0,0 +1,36 @@
+from src.adapters.input.recent_event_filter import RecentEventFilter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestRecentEventFilter:
+    def test_added_event_is_seen(self):
+        recent = RecentEventFilter()
+        recent.add("evt-1")
+
+        assert recent.seen("evt-1") is True
+        assert recent.seen("evt-2") is False
+
+    def test_event_expires_after_ttl(self):
+        clock = FakeClock()
+        recent = RecentEventFilter(ttl_seconds=10, clock=clock)
+        recent.add("evt-1")
+
+        clock.now = 10.0
+
+        assert recent.seen("evt-1") is False
+        assert len(recent) == 0
+
+    def test_oldest_event_is_evicted_when_full(self):
+        recent = RecentEventFilter(max_size=2)
+        for event_id in ("evt-1", "evt-2", "evt-3"):
+            recent.add(event_id)
+
+        assert not recent.seen("evt-1")
+        assert recent.seen("evt-2") and recent.seen("evt-3")
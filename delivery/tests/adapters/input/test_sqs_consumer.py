@@ -0,0 +1,231 @@
+import asyncio
+import json
+from typing import Any, Dict, List
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.adapters.input.recent_event_filter import RecentEventFilter
+from src.adapters.input.sqs_consumer import SQSConsumer
+from src.domain.exceptions import DuplicateEventError
+
+
+class FakeSession:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeSQS:
+    def __init__(self, bodies: List[Dict[str, Any]], receive_count: int = 1):
+        self.queue = [
+            {
+                "MessageId": f"msg-{i}",
+                "ReceiptHandle": f"rh-{i}",
+                "Body": json.dumps(body),
+                "Attributes": {"ApproximateReceiveCount": str(receive_count)},
+            }
+            for i, body in enumerate(bodies)
+        ]
+        self.deleted: List[str] = []
+        self.clients_opened = 0
+
+    async def __aenter__(self):
+        self.clients_opened += 1
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def receive_message(self, QueueUrl, MaxNumberOfMessages, WaitTimeSeconds, **kwargs):
+        batch = self.queue[:MaxNumberOfMessages]
+        del self.queue[:MaxNumberOfMessages]
+        await asyncio.sleep(0.001 if batch else 0.01)
+        return {"Messages": batch}
+
+    async def delete_message(self, QueueUrl, ReceiptHandle):
+        self.deleted.append(ReceiptHandle)
+
+
+def _event(n: int) -> Dict[str, Any]:
+    return {
+        "event_type": "order_created",
+        "event_id": f"evt-{n}",
+        "order_id": "00000000-0000-0000-0000-000000000001",
+        "customer_id": "00000000-0000-0000-0000-000000000002",
+        "direccion_entrega": "Calle 1",
+        "ciudad_entrega": "Bogotá",
+        "pais_entrega": "Colombia",
+        "fecha_pedido": "2025-11-20T10:00:00Z",
+    }
+
+
+def _consumer(sqs: FakeSQS, execute, **kwargs):
+    sessions = []
+
+    def use_case_factory(session):
+        sessions.append(session)
+        use_case = MagicMock()
+        use_case.execute = AsyncMock(side_effect=execute)
+        return use_case
+
+    consumer = SQSConsumer(
+        queue_url="https://test",
+        region="us-east-1",
+        access_key_id="test",
+        secret_access_key="test",
+        endpoint_url=None,
+        session_factory=FakeSession,
+        use_case_factory=use_case_factory,
+        wait_time_seconds=0,
+        **kwargs,
+    )
+    consumer._create_client = lambda: sqs
+    return consumer, sessions
+
+
+async def _run_until(consumer: SQSConsumer, condition) -> None:
+    task = asyncio.create_task(consumer.start())
+    for _ in range(200):
+        if condition():
+            break
+        await asyncio.sleep(0.01)
+    await consumer.stop()
+    await asyncio.wait_for(task, timeout=1)
+
+
+class TestSQSConsumer:
+    @pytest.mark.asyncio
+    async def test_each_message_gets_its_own_session(self):
+        sqs = FakeSQS([_event(n) for n in range(3)])
+        consumer, sessions = _consumer(sqs, execute=None)
+
+        await _run_until(consumer, lambda: len(sqs.deleted) == 3)
+
+        assert len(sessions) == 3
+        assert len({id(s) for s in sessions}) == 3
+        assert sorted(sqs.deleted) == ["rh-0", "rh-1", "rh-2"]
+
+    @pytest.mark.asyncio
+    async def test_client_is_reused_across_polls(self):
+        sqs = FakeSQS([_event(n) for n in range(25)])
+        consumer, _ = _consumer(sqs, execute=None)
+
+        await _run_until(consumer, lambda: len(sqs.deleted) == 25)
+
+        assert sqs.clients_opened == 1
+
+    @pytest.mark.asyncio
+    async def test_messages_are_processed_concurrently(self):
+        running = 0
+        peak = 0
+
+        async def execute(**kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.03)
+            running -= 1
+
+        sqs = FakeSQS([_event(n) for n in range(8)])
+        consumer, _ = _consumer(sqs, execute=execute, max_concurrency=4)
+
+        await _run_until(consumer, lambda: len(sqs.deleted) == 8)
+
+        assert peak == 4
+
+    @pytest.mark.asyncio
+    async def test_failed_message_is_not_deleted_and_others_continue(self):
+        async def execute(event_id, **kwargs):
+            if event_id == "evt-1":
+                raise RuntimeError("db down")
+
+        sqs = FakeSQS([_event(n) for n in range(3)])
+        consumer, _ = _consumer(sqs, execute=execute)
+
+        await _run_until(consumer, lambda: len(sqs.deleted) == 2)
+
+        assert sorted(sqs.deleted) == ["rh-0", "rh-2"]
+
+    @pytest.mark.asyncio
+    async def test_duplicate_and_ignored_events_are_deleted(self):
+        sqs = FakeSQS([_event(0), {"event_type": "order_cancelled"}])
+        consumer, _ = _consumer(sqs, execute=DuplicateEventError("evt-0"))
+
+        await _run_until(consumer, lambda: len(sqs.deleted) == 2)
+
+        assert sorted(sqs.deleted) == ["rh-0", "rh-1"]
+
+    @pytest.mark.asyncio
+    async def test_stop_waits_for_in_flight_messages(self):
+        finished = []
+
+        async def execute(event_id, **kwargs):
+            await asyncio.sleep(0.05)
+            finished.append(event_id)
+
+        sqs = FakeSQS([_event(n) for n in range(2)])
+        consumer, _ = _consumer(sqs, execute=execute)
+
+        task = asyncio.create_task(consumer.start())
+        await asyncio.sleep(0.01)
+        await consumer.stop()
+        await asyncio.wait_for(task, timeout=1)
+
+        assert sorted(finished) == ["evt-0", "evt-1"]
+
+    @pytest.mark.asyncio
+    async def test_recent_duplicates_skip_the_use_case(self):
+        sqs = FakeSQS([_event(0), _event(0)])
+        recent_events = RecentEventFilter()
+        recent_events.add("evt-0")
+        consumer, sessions = _consumer(sqs, execute=None, recent_events=recent_events)
+
+        await _run_until(consumer, lambda: len(sqs.deleted) == 2)
+
+        assert sessions == []
+
+    @pytest.mark.asyncio
+    async def test_processed_events_are_remembered(self):
+        sqs = FakeSQS([_event(0)])
+        recent_events = RecentEventFilter()
+        consumer, _ = _consumer(sqs, execute=None, recent_events=recent_events)
+
+        await _run_until(consumer, lambda: len(sqs.deleted) == 1)
+
+        assert recent_events.seen("evt-0")
+
+    @pytest.mark.asyncio
+    async def test_redeliveries_checked_in_one_query(self):
+        repository = MagicMock()
+        repository.filter_unprocessed = AsyncMock(return_value=["evt-1"])
+        sqs = FakeSQS([_event(n) for n in range(3)], receive_count=2)
+        consumer, sessions = _consumer(
+            sqs,
+            execute=None,
+            processed_event_repository_factory=lambda session: repository,
+        )
+
+        await _run_until(consumer, lambda: len(sqs.deleted) == 3)
+
+        repository.filter_unprocessed.assert_awaited_once_with(["evt-0", "evt-1", "evt-2"])
+        # Only the unprocessed event reached the use case
+        assert len(sessions) == 1
+
+    @pytest.mark.asyncio
+    async def test_first_deliveries_skip_the_batch_query(self):
+        repository = MagicMock()
+        repository.filter_unprocessed = AsyncMock(return_value=[])
+        sqs = FakeSQS([_event(n) for n in range(3)])
+        consumer, sessions = _consumer(
+            sqs,
+            execute=None,
+            processed_event_repository_factory=lambda session: repository,
+        )
+
+        await _run_until(consumer, lambda: len(sqs.deleted) == 3)
+
+        repository.filter_unprocessed.assert_not_awaited()
+        assert len(sessions) == 3
@@ -0,0 +1,214 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Dict, Optional
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.adapters.output.adapters.cached_geocoding import CachedGeocodingService
+from src.application.ports import GeocodeCacheRepositoryPort
+from src.domain.entities import GeocodeCacheEntry
+from src.domain.exceptions import AddressNotFoundError, GeocodingError
+
+BOGOTA = (Decimal("4.60971"), Decimal("-74.08175"))
+
+
+class InMemoryGeocodeCacheRepository(GeocodeCacheRepositoryPort):
+    """Stand-in for the geocode_cache table shared across sessions."""
+
+    def __init__(self):
+        self.entries: Dict[str, GeocodeCacheEntry] = {}
+        self.hits: Dict[str, int] = {}
+        self.fail = False
+
+    async def find_by_key(self, address_key: str) -> Optional[GeocodeCacheEntry]:
+        if self.fail:
+            raise RuntimeError("database unavailable")
+        return self.entries.get(address_key)
+
+    async def upsert(self, entry: GeocodeCacheEntry) -> None:
+        if self.fail:
+            raise RuntimeError("database unavailable")
+        self.entries[entry.address_key] = entry
+
+    async def increment_hits(self, hits: Dict[str, int]) -> int:
+        for key, count in hits.items():
+            self.hits[key] = self.hits.get(key, 0) + count
+        return len(hits)
+
+
+class FakeSession:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def commit(self):
+        pass
+
+
+@pytest.fixture
+def table():
+    return InMemoryGeocodeCacheRepository()
+
+
+@pytest.fixture
+def upstream():
+    service = AsyncMock()
+    service.geocode_address.return_value = BOGOTA
+    return service
+
+
+def _service(upstream, table, **kwargs):
+    return CachedGeocodingService(
+        upstream=upstream,
+        session_factory=FakeSession,
+        repository_factory=lambda session: table,
+        **kwargs,
+    )
+
+
+class TestCachedGeocodingService:
+    @pytest.mark.asyncio
+    async def test_repeated_address_calls_provider_once(self, upstream, table):
+        service = _service(upstream, table)
+
+        first = await service.geocode_address("Calle 100 #15-20", "Bogotá", "Colombia")
+        second = await service.geocode_address("CL 100 # 15-20", "Bogota", "Colombia")
+
+        assert first == second == BOGOTA
+        upstream.geocode_address.assert_awaited_once()
+        assert service.stats.misses == 1
+        assert service.stats.memory_hits == 1
+        assert len(table.entries) == 1
+
+    @pytest.mark.asyncio
+    async def test_table_serves_new_process(self, upstream, table):
+        await _service(upstream, table).geocode_address("Calle 1", "Bogota", "Colombia")
+        restarted = _service(upstream, table)
+
+        result = await restarted.geocode_address("Calle 1", "Bogota", "Colombia")
+
+        assert result == BOGOTA
+        assert upstream.geocode_address.await_count == 1
+        assert restarted.stats.persistent_hits == 1
+
+    @pytest.mark.asyncio
+    async def test_not_found_is_cached_as_negative(self, upstream, table):
+        upstream.geocode_address.side_effect = AddressNotFoundError("No results")
+        service = _service(upstream, table)
+
+        for _ in range(3):
+            with pytest.raises(AddressNotFoundError):
+                await service.geocode_address("Nowhere 1", "Bogota", "Colombia")
+
+        upstream.geocode_address.assert_awaited_once()
+        assert next(iter(table.entries.values())).found is False
+
+    @pytest.mark.asyncio
+    async def test_transient_error_is_not_cached(self, upstream, table):
+        upstream.geocode_address.side_effect = [GeocodingError("Timeout"), BOGOTA]
+        service = _service(upstream, table)
+
+        with pytest.raises(GeocodingError):
+            await service.geocode_address("Calle 1", "Bogota", "Colombia")
+        result = await service.geocode_address("Calle 1", "Bogota", "Colombia")
+
+        assert result == BOGOTA
+        assert upstream.geocode_address.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_refreshed(self, upstream, table):
+        stale = GeocodeCacheEntry.create("Calle 1", "Bogota", "Colombia", (Decimal("1"), Decimal("2")))
+        stale.refreshed_at = datetime.now(timezone.utc) - timedelta(days=100)
+        stale.hit_count = 7
+        table.entries[stale.address_key] = stale
+        service = _service(upstream, table, ttl=timedelta(days=90))
+
+        result = await service.geocode_address("Calle 1", "Bogota", "Colombia")
+
+        assert result == BOGOTA
+        refreshed = table.entries[stale.address_key]
+        assert refreshed.hit_count == 7
+        assert refreshed.lookup_count == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_served_when_provider_fails(self, upstream, table):
+        stale = GeocodeCacheEntry.create("Calle 1", "Bogota", "Colombia", (Decimal("1"), Decimal("2")))
+        stale.refreshed_at = datetime.now(timezone.utc) - timedelta(days=100)
+        table.entries[stale.address_key] = stale
+        upstream.geocode_address.side_effect = GeocodingError("HTTP error")
+        service = _service(upstream, table)
+
+        result = await service.geocode_address("Calle 1", "Bogota", "Colombia")
+
+        assert result == (Decimal("1"), Decimal("2"))
+        assert service.stats.stale_served == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_share_one_provider_call(self, table):
+        release = asyncio.Event()
+
+        async def slow_geocode(*args):
+            await release.wait()
+            return BOGOTA
+
+        upstream = AsyncMock()
+        upstream.geocode_address.side_effect = slow_geocode
+        service = _service(upstream, table)
+
+        tasks = [
+            asyncio.create_task(service.geocode_address("Calle 1", "Bogota", "Colombia"))
+            for _ in range(5)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*tasks) == [BOGOTA] * 5
+        upstream.geocode_address.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_lru_evicts_least_recently_used(self, upstream, table):
+        service = _service(upstream, table, memory_size=2)
+
+        for address in ("A 1", "B 2", "A 1", "C 3"):
+            await service.geocode_address(address, "Bogota", "Colombia")
+
+        assert service.metrics()["memory_entries"] == 2
+        table.entries.clear()
+        await service.geocode_address("A 1", "Bogota", "Colombia")
+        await service.geocode_address("B 2", "Bogota", "Colombia")
+
+        # "A 1" stayed in memory, "B 2" had to go back to the provider
+        assert upstream.geocode_address.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_hits_are_buffered_and_flushed(self, upstream, table):
+        service = _service(upstream, table, hit_flush_threshold=3)
+        key = GeocodeCacheEntry.build_key("Calle 1", "Bogota", "Colombia")
+
+        # One miss followed by two hits stays buffered
+        for _ in range(3):
+            await service.geocode_address("Calle 1", "Bogota", "Colombia")
+        assert table.hits == {}
+
+        # The third hit reaches the threshold
+        await service.geocode_address("Calle 1", "Bogota", "Colombia")
+        assert table.hits == {key: 3}
+
+        await service.geocode_address("Calle 1", "Bogota", "Colombia")
+        await service.flush_hits()
+
+        assert table.hits == {key: 4}
+
+    @pytest.mark.asyncio
+    async def test_cache_failures_fall_back_to_provider(self, upstream, table):
+        table.fail = True
+        service = _service(upstream, table)
+
+        result = await service.geocode_address("Calle 1", "Bogota", "Colombia")
+
+        assert result == BOGOTA
+        assert service.stats.cache_errors == 2
@@ -5,7 +5,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import httpx
 
 from src.adapters.output.adapters.nominatim_geocoding import NominatimGeocodingService
-from src.domain.exceptions import GeocodingError
+from src.domain.exceptions import AddressNotFoundError, GeocodingError
 
 
 class TestNominatimGeocodingService:
@@ -51,6 +51,7 @@ class TestNominatimGeocodingService:
                 await service.geocode_address("Invalid", "City", "Country")
 
             assert "No results" in str(exc_info.value)
+            assert isinstance(exc_info.value, AddressNotFoundError)
 
     @pytest.mark.asyncio
     async def test_geocode_address_api_error(self, service):
@@ -151,8 +152,8 @@ class TestNominatimGeocodingService:
                 return_value=mock_response
             )
 
-            # Set last request time to now to trigger rate limiting
-            service._last_request_time = time.time()
+            # Use up the only token to trigger rate limiting
+            await service._rate_limiter.acquire()
 
             start = time.time()
             await service.geocode_address("Calle 123", "Bogota", "Colombia")
@@ -160,3 +161,36 @@ class TestNominatimGeocodingService:
 
             # Should have waited due to rate limiting
             assert elapsed >= 0.05  # At least some delay
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_rate_limit(self):
+        """Test that concurrent requests are spaced by one shared token bucket."""
+        import asyncio
+        import time
+
+        service = NominatimGeocodingService(
+            base_url="https://nominatim.openstreetmap.org",
+            rate_limit_seconds=0.05,
+        )
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = [
+            {"lat": "4.60971", "lon": "-74.08175"}
+        ]
+
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
+                return_value=mock_response
+            )
+
+            start = time.monotonic()
+            await asyncio.gather(*(
+                service.geocode_address(f"Calle {i}", "Bogota", "Colombia")
+                for i in range(4)
+            ))
+            elapsed = time.monotonic() - start
+
+        # First call uses the initial token, the other three wait 0.05s each
+        assert elapsed >= 0.14
+        assert service._rate_limiter.acquired_total == 4
@@ -0,0 +1,171 @@
+import asyncio
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+from uuid import uuid4
+
+import numpy as np
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from src.adapters.input.controllers.common_controller import router as common_router
+from src.adapters.output.adapters import ProcessPoolRouteOptimizer
+from src.domain.entities import Shipment, Vehicle
+from src.domain.exceptions import RouteOptimizationError
+from src.domain.services.route_optimizer import GreedyRouteOptimizer
+from src.infrastructure.executors import OptimizationExecutor
+
+
+class SlowRouteOptimizer(GreedyRouteOptimizer):
+    """Greedy optimizer that burns CPU before solving, to simulate a large run."""
+
+    def __init__(self, busy_seconds: float):
+        super().__init__()
+        self.busy_seconds = busy_seconds
+
+    def solve(self, coords, limits):
+        end = time.perf_counter() + self.busy_seconds
+        while time.perf_counter() < end:
+            pass
+        return super().solve(coords, limits)
+
+
+def _create_shipment(lat, lon):
+    shipment = Shipment(
+        id=uuid4(),
+        order_id=uuid4(),
+        customer_id=uuid4(),
+        direccion_entrega="Test Address",
+        ciudad_entrega="Bogota",
+        pais_entrega="Colombia",
+        fecha_pedido=datetime.now(),
+        fecha_entrega_estimada=(datetime.now() + timedelta(days=1)).date(),
+    )
+    shipment.set_coordinates(Decimal(str(lat)), Decimal(str(lon)))
+    return shipment
+
+
+@pytest.fixture
+def shipments():
+    rng = np.random.default_rng(11)
+    return [
+        _create_shipment(round(lat, 6), round(lon, 6))
+        for lat, lon in rng.uniform([4.5, -74.2], [4.8, -74.0], (40, 2))
+    ]
+
+
+@pytest.fixture
+def vehicles():
+    return [
+        Vehicle(id=uuid4(), placa="ABC-123", driver_name="Driver 1"),
+        Vehicle(id=uuid4(), placa="DEF-456", driver_name="Driver 2"),
+    ]
+
+
+@pytest.fixture(scope="module")
+def executor():
+    executor = OptimizationExecutor(max_workers=1, timeout_seconds=30)
+    yield executor
+    executor.shutdown()
+
+
+class TestProcessPoolRouteOptimizer:
+    @pytest.mark.asyncio
+    async def test_matches_in_process_result(self, executor, shipments, vehicles):
+        in_process = await GreedyRouteOptimizer().plan_routes(shipments, vehicles)
+
+        plan = await ProcessPoolRouteOptimizer(GreedyRouteOptimizer(), executor).plan_routes(
+            shipments, vehicles
+        )
+
+        assert len(plan.routes) == len(in_process.routes)
+        for pooled, local in zip(plan.routes, in_process.routes):
+            assert pooled.vehicle is local.vehicle
+            assert [s.id for s in pooled.shipments] == [s.id for s in local.shipments]
+            assert pooled.shipments[0] is local.shipments[0]
+            assert pooled.total_distance_km == local.total_distance_km
+
+    @pytest.mark.asyncio
+    async def test_ungeocoded_shipments_stay_in_parent(self, executor, vehicles):
+        ungeocoded = Shipment(
+            id=uuid4(),
+            order_id=uuid4(),
+            customer_id=uuid4(),
+            direccion_entrega="Test Address",
+            ciudad_entrega="Bogota",
+            pais_entrega="Colombia",
+            fecha_pedido=datetime.now(),
+            fecha_entrega_estimada=(datetime.now() + timedelta(days=1)).date(),
+        )
+
+        plan = await ProcessPoolRouteOptimizer(GreedyRouteOptimizer(), executor).plan_routes(
+            [ungeocoded], vehicles
+        )
+
+        assert plan.routes == []
+        assert plan.unassigned[0].shipment is ungeocoded
+
+    @pytest.mark.asyncio
+    async def test_timeout_raises_and_pool_recovers(self, shipments, vehicles):
+        executor = OptimizationExecutor(max_workers=1, timeout_seconds=0.5)
+        try:
+            slow = ProcessPoolRouteOptimizer(SlowRouteOptimizer(busy_seconds=30), executor)
+            with pytest.raises(RouteOptimizationError, match="timed out"):
+                await slow.plan_routes(shipments, vehicles)
+
+            executor.timeout_seconds = 30
+            plan = await ProcessPoolRouteOptimizer(GreedyRouteOptimizer(), executor).plan_routes(
+                shipments, vehicles
+            )
+            assert sum(len(r.shipments) for r in plan.routes) == len(shipments)
+        finally:
+            executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_job_leaves_other_jobs_running(self, shipments, vehicles):
+        executor = OptimizationExecutor(max_workers=2, timeout_seconds=30)
+        try:
+            abandoned = asyncio.create_task(
+                ProcessPoolRouteOptimizer(
+                    SlowRouteOptimizer(busy_seconds=30), executor
+                ).plan_routes(shipments, vehicles)
+            )
+            running = asyncio.create_task(
+                ProcessPoolRouteOptimizer(
+                    SlowRouteOptimizer(busy_seconds=1), executor
+                ).plan_routes(shipments, vehicles)
+            )
+            await asyncio.sleep(0.5)
+
+            abandoned.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await abandoned
+
+            plan = await running
+            assert sum(len(r.shipments) for r in plan.routes) == len(shipments)
+        finally:
+            executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_health_check_responds_during_optimization(self, executor, shipments, vehicles):
+        app = FastAPI()
+        app.include_router(common_router, prefix="/delivery")
+        optimizer = ProcessPoolRouteOptimizer(SlowRouteOptimizer(busy_seconds=2), executor)
+
+        task = asyncio.create_task(optimizer.plan_routes(shipments, vehicles))
+        await asyncio.sleep(0.2)
+
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            start = time.perf_counter()
+            response = await client.get("/delivery/health")
+            latency = time.perf_counter() - start
+
+        assert response.status_code == 200
+        assert latency < 0.5
+        assert not task.done()
+
+        plan = await task
+        assert sum(len(r.shipments) for r in plan.routes) == len(shipments)
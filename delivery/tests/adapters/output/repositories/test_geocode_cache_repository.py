@@ -0,0 +1,76 @@
+import pytest
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+from sqlalchemy.dialects.postgresql import asyncpg
+
+from src.adapters.output.repositories.geocode_cache_repository import (
+    SQLAlchemyGeocodeCacheRepository,
+)
+from src.domain.entities import GeocodeCacheEntry
+
+
+def _compiled(mock_session, call=0):
+    statement = mock_session.execute.call_args_list[call][0][0]
+    return str(statement.compile(dialect=asyncpg.dialect()))
+
+
+class TestSQLAlchemyGeocodeCacheRepository:
+    @pytest.fixture
+    def mock_session(self):
+        session = AsyncMock()
+        session.execute = AsyncMock()
+        return session
+
+    @pytest.fixture
+    def repository(self, mock_session):
+        return SQLAlchemyGeocodeCacheRepository(mock_session)
+
+    @pytest.mark.asyncio
+    async def test_find_by_key_maps_model(self, repository, mock_session):
+        entry = GeocodeCacheEntry.create("Calle 1", "Cali", "Colombia", (Decimal("3.4"), Decimal("-76.5")))
+        model = MagicMock(**{k: v for k, v in entry.__dict__.items()})
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = model
+        mock_session.execute.return_value = mock_result
+
+        result = await repository.find_by_key(entry.address_key)
+
+        assert result == entry
+
+    @pytest.mark.asyncio
+    async def test_find_by_key_not_found(self, repository, mock_session):
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = None
+        mock_session.execute.return_value = mock_result
+
+        assert await repository.find_by_key("missing") is None
+
+    @pytest.mark.asyncio
+    async def test_upsert_uses_on_conflict(self, repository, mock_session):
+        entry = GeocodeCacheEntry.create("Calle 1", "Cali", "Colombia", None)
+
+        await repository.upsert(entry)
+
+        sql = _compiled(mock_session)
+        assert sql.startswith("INSERT INTO geocode_cache")
+        assert "ON CONFLICT (address_key) DO UPDATE" in sql
+        assert "lookup_count = (geocode_cache.lookup_count + $" in sql
+        assert "hit_count = " not in sql.split("DO UPDATE")[1]
+
+    @pytest.mark.asyncio
+    async def test_increment_hits_single_statement(self, repository, mock_session):
+        mock_session.execute.return_value = MagicMock(rowcount=2)
+
+        updated = await repository.increment_hits({"a": 3, "b": 1})
+
+        assert updated == 2
+        assert mock_session.execute.call_count == 1
+        sql = _compiled(mock_session)
+        assert sql.startswith("UPDATE geocode_cache SET hit_count=(geocode_cache.hit_count + counts.hits)")
+        assert "FROM (VALUES" in sql
+
+    @pytest.mark.asyncio
+    async def test_increment_hits_empty_is_noop(self, repository, mock_session):
+        assert await repository.increment_hits({}) == 0
+        mock_session.execute.assert_not_called()
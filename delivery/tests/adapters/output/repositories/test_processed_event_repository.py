@@ -2,6 +2,8 @@ import pytest
 from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
+from sqlalchemy.dialects.postgresql import asyncpg
+
 from src.adapters.output.repositories.processed_event_repository import SQLAlchemyProcessedEventRepository
 from src.domain.entities import ProcessedEvent
 
@@ -57,3 +59,48 @@ class TestSQLAlchemyProcessedEventRepository:
         result = await repository.exists("evt-123")
 
         assert result is False
+
+    @pytest.mark.asyncio
+    async def test_save_if_new_uses_on_conflict_do_nothing(self, repository, mock_session):
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = uuid4()
+        mock_session.execute.return_value = mock_result
+
+        result = await repository.save_if_new(
+            ProcessedEvent(id=uuid4(), event_id="evt-123", event_type="order_created")
+        )
+
+        assert result is True
+        statement = mock_session.execute.call_args[0][0]
+        sql = str(statement.compile(dialect=asyncpg.dialect()))
+        assert "ON CONFLICT (event_id) DO NOTHING" in sql
+        assert "RETURNING" in sql
+        mock_session.add.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_save_if_new_duplicate(self, repository, mock_session):
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = None
+        mock_session.execute.return_value = mock_result
+
+        result = await repository.save_if_new(
+            ProcessedEvent(id=uuid4(), event_id="evt-123", event_type="order_created")
+        )
+
+        assert result is False
+
+    @pytest.mark.asyncio
+    async def test_filter_unprocessed_single_query(self, repository, mock_session):
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = ["evt-2"]
+        mock_session.execute.return_value = mock_result
+
+        result = await repository.filter_unprocessed(["evt-1", "evt-2", "evt-3"])
+
+        assert result == ["evt-1", "evt-3"]
+        mock_session.execute.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_filter_unprocessed_empty(self, repository, mock_session):
+        assert await repository.filter_unprocessed([]) == []
+        mock_session.execute.assert_not_called()
@@ -0,0 +1,139 @@
+import pytest
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from sqlalchemy.exc import IntegrityError
+
+from src.adapters.output.repositories.route_generation_job_repository import (
+    SQLAlchemyRouteGenerationJobRepository,
+)
+from src.domain.entities import RouteGenerationJob
+from src.domain.exceptions import DuplicateRouteJobError
+from src.domain.value_objects import RouteJobStatus
+
+
+def _job():
+    vehicle_ids = [uuid4()]
+    return RouteGenerationJob(
+        id=uuid4(),
+        fecha_entrega_estimada=date(2025, 1, 15),
+        vehicle_ids=vehicle_ids,
+        dedup_key=RouteGenerationJob.build_dedup_key(date(2025, 1, 15), vehicle_ids),
+    )
+
+
+class _Savepoint:
+    def __init__(self, error=None):
+        self._error = error
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        if self._error:
+            raise self._error
+        return False
+
+
+class TestSQLAlchemyRouteGenerationJobRepository:
+    @pytest.fixture
+    def mock_session(self):
+        session = AsyncMock()
+        session.execute = AsyncMock()
+        session.flush = AsyncMock()
+        session.add = MagicMock()
+        session.begin_nested = MagicMock(return_value=_Savepoint())
+        return session
+
+    @pytest.fixture
+    def repository(self, mock_session):
+        return SQLAlchemyRouteGenerationJobRepository(mock_session)
+
+    @pytest.mark.asyncio
+    async def test_save_job(self, repository, mock_session):
+        job = _job()
+
+        result = await repository.save(job)
+
+        assert result is job
+        model = mock_session.add.call_args[0][0]
+        assert model.dedup_key == job.dedup_key
+        assert model.status == "queued"
+
+    @pytest.mark.asyncio
+    async def test_save_duplicate_active_job_raises(self, repository, mock_session):
+        mock_session.begin_nested.return_value = _Savepoint(
+            IntegrityError("INSERT", {}, Exception("duplicate key"))
+        )
+
+        with pytest.raises(DuplicateRouteJobError):
+            await repository.save(_job())
+
+    @pytest.mark.asyncio
+    async def test_find_active_by_dedup_key(self, repository, mock_session):
+        job = _job()
+        mock_model = MagicMock(
+            id=job.id,
+            fecha_entrega_estimada=job.fecha_entrega_estimada,
+            vehicle_ids=job.vehicle_ids,
+            dedup_key=job.dedup_key,
+            status="running",
+            progress=40,
+            num_shipments=10,
+            num_routes=0,
+            num_assigned_shipments=0,
+            num_unassigned_shipments=0,
+            error_message=None,
+            created_at=None,
+            started_at=None,
+            finished_at=None,
+            lease_expires_at=None,
+        )
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.first.return_value = mock_model
+        mock_session.execute.return_value = mock_result
+
+        result = await repository.find_active_by_dedup_key(job.dedup_key)
+
+        assert result.id == job.id
+        assert result.status == RouteJobStatus.RUNNING
+        assert result.progress == 40
+
+    @pytest.mark.asyncio
+    async def test_find_by_id_not_found(self, repository, mock_session):
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = None
+        mock_session.execute.return_value = mock_result
+
+        assert await repository.find_by_id(uuid4()) is None
+
+    @pytest.mark.asyncio
+    async def test_update_job(self, repository, mock_session):
+        job = _job()
+        job.start()
+        job.report_progress(70)
+        mock_model = MagicMock()
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = mock_model
+        mock_session.execute.return_value = mock_result
+
+        await repository.update(job)
+
+        assert mock_model.status == "running"
+        assert mock_model.progress == 70
+        assert mock_model.started_at == job.started_at
+        assert mock_model.lease_expires_at == job.lease_expires_at
+        mock_session.flush.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_fail_expired_is_one_update(self, repository, mock_session):
+        mock_session.execute.return_value = MagicMock(rowcount=3)
+
+        expired = await repository.fail_expired("lease expired")
+
+        assert expired == 3
+        mock_session.execute.assert_awaited_once()
+        sql = str(mock_session.execute.call_args[0][0])
+        assert sql.startswith("UPDATE route_generation_jobs SET")
+        assert "lease_expires_at" in sql
@@ -48,6 +48,23 @@ class TestSQLAlchemyRouteRepository:
         mock_session.flush.assert_called_once()
         assert result == route
 
+    @pytest.mark.asyncio
+    async def test_find_vehicle_ids(self, repository, mock_session):
+        route_id = uuid4()
+        vehicle_id = uuid4()
+        mock_result = MagicMock()
+        mock_result.all.return_value = [(route_id, vehicle_id)]
+        mock_session.execute.return_value = mock_result
+
+        result = await repository.find_vehicle_ids([route_id])
+
+        assert result == {route_id: vehicle_id}
+
+    @pytest.mark.asyncio
+    async def test_find_vehicle_ids_empty_skips_query(self, repository, mock_session):
+        assert await repository.find_vehicle_ids([]) == {}
+        mock_session.execute.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_find_by_id_found(self, repository, mock_session):
         mock_model = self._create_mock_model()
@@ -251,3 +268,33 @@ class TestSQLAlchemyRouteRepository:
         assert result is not None
         assert len(result.shipments) == 1
         assert result.shipments[0].direccion_entrega == "Calle 123"
+
+    @pytest.mark.asyncio
+    async def test_save_many_uses_multi_row_insert(self, repository, mock_session, monkeypatch):
+        from sqlalchemy.dialects.postgresql import asyncpg
+
+        monkeypatch.setattr(SQLAlchemyRouteRepository, "BULK_CHUNK_SIZE", 2)
+        routes = [
+            Route(
+                id=uuid4(),
+                vehicle_id=uuid4(),
+                fecha_ruta=date.today(),
+                total_distance_km=Decimal("10.5"),
+                total_orders=3,
+            )
+            for _ in range(3)
+        ]
+
+        result = await repository.save_many(routes)
+
+        assert result == routes
+        assert mock_session.execute.call_count == 2
+        first_sql = str(mock_session.execute.call_args_list[0][0][0].compile(dialect=asyncpg.dialect()))
+        assert first_sql.startswith("INSERT INTO routes")
+        assert first_sql.count("::DATE") == 2  # two rows in one statement
+        mock_session.add.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_save_many_empty(self, repository, mock_session):
+        assert await repository.save_many([]) == []
+        mock_session.execute.assert_not_called()
@@ -93,6 +93,25 @@ class TestSQLAlchemyShipmentRepository:
 
         assert result is not None
 
+    @pytest.mark.asyncio
+    async def test_find_by_order_ids(self, repository, mock_session):
+        mock_models = [self._create_mock_model(), self._create_mock_model()]
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = mock_models
+        mock_session.execute.return_value = mock_result
+
+        result = await repository.find_by_order_ids([m.order_id for m in mock_models])
+
+        assert len(result) == 2
+        mock_session.execute.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_find_by_order_ids_empty_skips_query(self, repository, mock_session):
+        result = await repository.find_by_order_ids([])
+
+        assert result == []
+        mock_session.execute.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_find_pending_by_date(self, repository, mock_session):
         mock_models = [self._create_mock_model()]
@@ -164,3 +183,106 @@ class TestSQLAlchemyShipmentRepository:
         # Should still return the shipment but not call flush
         assert result == sample_shipment
         mock_session.flush.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_bulk_update_route_assignments(self, repository, mock_session, monkeypatch):
+        from sqlalchemy.dialects.postgresql import asyncpg
+
+        monkeypatch.setattr(SQLAlchemyShipmentRepository, "BULK_CHUNK_SIZE", 2)
+        route_id = uuid4()
+        shipments = []
+        for seq in range(1, 4):
+            shipment = Shipment(
+                id=uuid4(),
+                order_id=uuid4(),
+                customer_id=uuid4(),
+                direccion_entrega="Calle 123",
+                ciudad_entrega="Bogota",
+                pais_entrega="Colombia",
+                fecha_pedido=datetime.now(),
+                fecha_entrega_estimada=date.today(),
+            )
+            shipment.assign_to_route(route_id, seq)
+            shipments.append(shipment)
+        mock_session.execute.side_effect = [MagicMock(rowcount=2), MagicMock(rowcount=1)]
+
+        updated = await repository.bulk_update_route_assignments(shipments)
+
+        assert updated == 3
+        assert mock_session.execute.call_count == 2
+        sql = str(mock_session.execute.call_args_list[0][0][0].compile(dialect=asyncpg.dialect()))
+        assert sql.startswith("UPDATE shipments SET route_id=assignments.route_id")
+        assert "FROM (VALUES" in sql
+        mock_session.flush.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_claim_pending_geocoding_skips_locked_rows(self, repository, mock_session):
+        from sqlalchemy.dialects.postgresql import asyncpg
+
+        model = MagicMock()
+        model.id = uuid4()
+        model.order_id = uuid4()
+        model.customer_id = uuid4()
+        model.direccion_entrega = "Calle 123"
+        model.ciudad_entrega = "Bogota"
+        model.pais_entrega = "Colombia"
+        model.latitude = None
+        model.longitude = None
+        model.geocoding_status = "pending"
+        model.route_id = None
+        model.sequence_in_route = None
+        model.fecha_pedido = datetime.now()
+        model.fecha_entrega_estimada = date.today()
+        model.shipment_status = "pending"
+        model.geocoding_attempts = 1
+        model.geocoding_next_attempt_at = None
+        model.created_at = datetime.now()
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = [model]
+        mock_session.execute.return_value = mock_result
+
+        claimed = await repository.claim_pending_geocoding(25, timedelta(minutes=5))
+
+        assert [s.id for s in claimed] == [model.id]
+        assert claimed[0].geocoding_attempts == 1
+        sql = str(mock_session.execute.call_args[0][0].compile(dialect=asyncpg.dialect()))
+        assert sql.startswith("UPDATE shipments SET geocoding_next_attempt_at=")
+        assert "FOR UPDATE SKIP LOCKED" in sql
+        assert "RETURNING" in sql
+
+    @pytest.mark.asyncio
+    async def test_count_pending_geocoding(self, repository, mock_session):
+        mock_result = MagicMock()
+        mock_result.scalar_one.return_value = 42
+        mock_session.execute.return_value = mock_result
+
+        assert await repository.count_pending_geocoding() == 42
+
+    @pytest.mark.asyncio
+    async def test_bulk_update_geocoding_single_statement(self, repository, mock_session):
+        from sqlalchemy.dialects.postgresql import asyncpg
+
+        shipments = []
+        for i in range(3):
+            shipment = Shipment(
+                id=uuid4(),
+                order_id=uuid4(),
+                customer_id=uuid4(),
+                direccion_entrega="Calle 123",
+                ciudad_entrega="Bogota",
+                pais_entrega="Colombia",
+                fecha_pedido=datetime.now(),
+                fecha_entrega_estimada=date.today(),
+            )
+            if i == 0:
+                shipment.set_coordinates(Decimal("4.6"), Decimal("-74.1"))
+            shipments.append(shipment)
+        mock_session.execute.return_value = MagicMock(rowcount=3)
+
+        updated = await repository.bulk_update_geocoding(shipments)
+
+        assert updated == 3
+        assert mock_session.execute.call_count == 1
+        sql = str(mock_session.execute.call_args[0][0].compile(dialect=asyncpg.dialect()))
+        assert sql.startswith("UPDATE shipments SET latitude=results.latitude")
+        assert "FROM (VALUES" in sql
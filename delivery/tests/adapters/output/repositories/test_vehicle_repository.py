@@ -42,6 +42,8 @@ class TestSQLAlchemyVehicleRepository:
         mock_model.driver_name = "Driver 1"
         mock_model.driver_phone = None
         mock_model.is_active = True
+        mock_model.max_stops = None
+        mock_model.max_route_minutes = None
 
         mock_result = MagicMock()
         mock_result.scalar_one_or_none.return_value = mock_model
@@ -70,6 +72,8 @@ class TestSQLAlchemyVehicleRepository:
         mock_model.driver_name = "Driver 1"
         mock_model.driver_phone = None
         mock_model.is_active = True
+        mock_model.max_stops = None
+        mock_model.max_route_minutes = None
 
         mock_result = MagicMock()
         mock_result.scalar_one_or_none.return_value = mock_model
@@ -87,8 +91,8 @@ class TestSQLAlchemyVehicleRepository:
     @pytest.mark.asyncio
     async def test_find_by_ids_returns_vehicles(self, repository, mock_session):
         mock_models = [
-            MagicMock(id=uuid4(), placa="ABC-123", driver_name="D1", driver_phone=None, is_active=True),
-            MagicMock(id=uuid4(), placa="DEF-456", driver_name="D2", driver_phone=None, is_active=True),
+            MagicMock(id=uuid4(), placa="ABC-123", driver_name="D1", driver_phone=None, is_active=True, max_stops=None, max_route_minutes=None),
+            MagicMock(id=uuid4(), placa="DEF-456", driver_name="D2", driver_phone=None, is_active=True, max_stops=None, max_route_minutes=None),
         ]
 
         mock_result = MagicMock()
@@ -102,7 +106,7 @@ class TestSQLAlchemyVehicleRepository:
     @pytest.mark.asyncio
     async def test_find_all_active(self, repository, mock_session):
         mock_models = [
-            MagicMock(id=uuid4(), placa="ABC-123", driver_name="D1", driver_phone=None, is_active=True),
+            MagicMock(id=uuid4(), placa="ABC-123", driver_name="D1", driver_phone=None, is_active=True, max_stops=None, max_route_minutes=None),
         ]
 
         mock_result = MagicMock()
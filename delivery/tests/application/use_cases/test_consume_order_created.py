@@ -7,7 +7,7 @@ from decimal import Decimal
 from src.application.use_cases.consume_order_created import ConsumeOrderCreatedUseCase
 from src.domain.entities import Shipment, ProcessedEvent
 from src.domain.value_objects import ShipmentStatus, GeocodingStatus
-from src.domain.exceptions import DuplicateEventError, GeocodingError
+from src.domain.exceptions import DuplicateEventError
 
 
 class TestConsumeOrderCreatedUseCase:
@@ -23,24 +23,17 @@ class TestConsumeOrderCreatedUseCase:
         """Create a mock processed event repository."""
         return AsyncMock()
 
-    @pytest.fixture
-    def mock_geocoding_service(self):
-        """Create a mock geocoding service."""
-        return AsyncMock()
-
     @pytest.fixture
     def use_case(
         self,
         mock_shipment_repository,
         mock_processed_event_repository,
-        mock_geocoding_service,
         session,
     ):
         """Create a ConsumeOrderCreatedUseCase instance with mocked dependencies."""
         return ConsumeOrderCreatedUseCase(
             shipment_repository=mock_shipment_repository,
             processed_event_repository=mock_processed_event_repository,
-            geocoding_service=mock_geocoding_service,
             session=session,
         )
 
@@ -50,7 +43,6 @@ class TestConsumeOrderCreatedUseCase:
         use_case,
         mock_shipment_repository,
         mock_processed_event_repository,
-        mock_geocoding_service,
     ):
         """Test successful shipment creation from order created event."""
         # Arrange
@@ -62,10 +54,8 @@ class TestConsumeOrderCreatedUseCase:
         pais_entrega = "Country"
         fecha_pedido = datetime(2024, 1, 14, 10, 0, 0)
 
-        mock_processed_event_repository.exists.return_value = False
+        mock_processed_event_repository.save_if_new.return_value = True
         mock_shipment_repository.save.side_effect = lambda s: s
-        mock_processed_event_repository.save.return_value = None
-        mock_geocoding_service.geocode_address.return_value = (Decimal("40.7128"), Decimal("-74.0060"))
 
         # Act
         result = await use_case.execute(
@@ -88,9 +78,10 @@ class TestConsumeOrderCreatedUseCase:
         assert result.fecha_pedido == fecha_pedido
         assert result.shipment_status == ShipmentStatus.PENDING
 
-        mock_processed_event_repository.exists.assert_called_once_with(event_id)
+        mock_processed_event_repository.exists.assert_not_called()
+        assert mock_processed_event_repository.save_if_new.call_args[0][0].event_id == event_id
         mock_shipment_repository.save.assert_called_once()
-        mock_processed_event_repository.save.assert_called_once()
+        mock_processed_event_repository.save_if_new.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_execute_calculates_estimated_delivery_date(
@@ -98,7 +89,6 @@ class TestConsumeOrderCreatedUseCase:
         use_case,
         mock_shipment_repository,
         mock_processed_event_repository,
-        mock_geocoding_service,
     ):
         """Test that estimated delivery date is calculated correctly."""
         # Arrange
@@ -107,7 +97,7 @@ class TestConsumeOrderCreatedUseCase:
         customer_id = str(uuid4())
         fecha_pedido = datetime(2024, 1, 14, 10, 0, 0)
 
-        mock_processed_event_repository.exists.return_value = False
+        mock_processed_event_repository.save_if_new.return_value = True
         mock_shipment_repository.save.side_effect = lambda s: s
 
         # Act
@@ -131,13 +121,12 @@ class TestConsumeOrderCreatedUseCase:
         use_case,
         mock_shipment_repository,
         mock_processed_event_repository,
-        mock_geocoding_service,
     ):
         """Test that DuplicateEventError is raised for already processed event."""
         # Arrange
         event_id = str(uuid4())
 
-        mock_processed_event_repository.exists.return_value = True
+        mock_processed_event_repository.save_if_new.return_value = False
 
         # Act & Assert
         with pytest.raises(DuplicateEventError) as exc_info:
@@ -160,7 +149,6 @@ class TestConsumeOrderCreatedUseCase:
         use_case,
         mock_shipment_repository,
         mock_processed_event_repository,
-        mock_geocoding_service,
     ):
         """Test that event is marked as processed after successful handling."""
         # Arrange
@@ -168,7 +156,7 @@ class TestConsumeOrderCreatedUseCase:
         order_id = str(uuid4())
         customer_id = str(uuid4())
 
-        mock_processed_event_repository.exists.return_value = False
+        mock_processed_event_repository.save_if_new.return_value = True
         mock_shipment_repository.save.side_effect = lambda s: s
 
         # Act
@@ -183,172 +171,24 @@ class TestConsumeOrderCreatedUseCase:
         )
 
         # Assert
-        mock_processed_event_repository.save.assert_called_once()
-        saved_event = mock_processed_event_repository.save.call_args[0][0]
+        mock_processed_event_repository.save_if_new.assert_called_once()
+        saved_event = mock_processed_event_repository.save_if_new.call_args[0][0]
         assert isinstance(saved_event, ProcessedEvent)
         assert saved_event.event_id == event_id
         assert saved_event.event_type == "order_created"
 
-    @pytest.mark.asyncio
-    async def test_execute_triggers_async_geocoding(
-        self,
-        use_case,
-        mock_shipment_repository,
-        mock_processed_event_repository,
-        mock_geocoding_service,
-    ):
-        """Test that geocoding is triggered asynchronously."""
-        # Arrange
-        event_id = str(uuid4())
-
-        mock_processed_event_repository.exists.return_value = False
-        mock_shipment_repository.save.side_effect = lambda s: s
-        mock_geocoding_service.geocode_address.return_value = (
-            Decimal("40.7128"),
-            Decimal("-74.0060"),
-        )
-
-        # Act
-        result = await use_case.execute(
-            event_id=event_id,
-            order_id=str(uuid4()),
-            customer_id=str(uuid4()),
-            direccion_entrega="123 Main St",
-            ciudad_entrega="New York",
-            pais_entrega="USA",
-            fecha_pedido=datetime.now(),
-        )
-
-        # Allow async task to complete
-        import asyncio
-        await asyncio.sleep(0.1)
-
-        # Assert - geocoding should have been called
-        mock_geocoding_service.geocode_address.assert_called_once_with(
-            "123 Main St",
-            "New York",
-            "USA",
-        )
-
-    @pytest.mark.asyncio
-    async def test_execute_geocoding_success_updates_shipment(
-        self,
-        use_case,
-        mock_shipment_repository,
-        mock_processed_event_repository,
-        mock_geocoding_service,
-    ):
-        """Test that successful geocoding updates shipment coordinates."""
-        # Arrange
-        event_id = str(uuid4())
-        latitude = Decimal("40.7128")
-        longitude = Decimal("-74.0060")
-
-        mock_processed_event_repository.exists.return_value = False
-        mock_shipment_repository.save.side_effect = lambda s: s
-        mock_geocoding_service.geocode_address.return_value = (latitude, longitude)
-
-        # Act
-        result = await use_case.execute(
-            event_id=event_id,
-            order_id=str(uuid4()),
-            customer_id=str(uuid4()),
-            direccion_entrega="Address",
-            ciudad_entrega="City",
-            pais_entrega="Country",
-            fecha_pedido=datetime.now(),
-        )
-
-        # Allow async task to complete
-        import asyncio
-        await asyncio.sleep(0.1)
-
-        # Assert - shipment should be updated
-        assert mock_shipment_repository.update.called
-
-    @pytest.mark.asyncio
-    async def test_execute_geocoding_error_marks_shipment_failed(
-        self,
-        use_case,
-        mock_shipment_repository,
-        mock_processed_event_repository,
-        mock_geocoding_service,
-    ):
-        """Test that geocoding error marks shipment as geocoding failed."""
-        # Arrange
-        event_id = str(uuid4())
-
-        mock_processed_event_repository.exists.return_value = False
-        mock_shipment_repository.save.side_effect = lambda s: s
-        mock_geocoding_service.geocode_address.side_effect = GeocodingError("Failed")
-
-        # Act
-        result = await use_case.execute(
-            event_id=event_id,
-            order_id=str(uuid4()),
-            customer_id=str(uuid4()),
-            direccion_entrega="Invalid Address",
-            ciudad_entrega="City",
-            pais_entrega="Country",
-            fecha_pedido=datetime.now(),
-        )
-
-        # Allow async task to complete
-        import asyncio
-        await asyncio.sleep(0.1)
-
-        # Assert - shipment should still be created
-        assert result is not None
-        # The update should have been called to mark geocoding failed
-        assert mock_shipment_repository.update.called
-
-    @pytest.mark.asyncio
-    async def test_execute_unexpected_geocoding_error_handled(
-        self,
-        use_case,
-        mock_shipment_repository,
-        mock_processed_event_repository,
-        mock_geocoding_service,
-    ):
-        """Test that unexpected geocoding errors are handled gracefully."""
-        # Arrange
-        event_id = str(uuid4())
-
-        mock_processed_event_repository.exists.return_value = False
-        mock_shipment_repository.save.side_effect = lambda s: s
-        mock_geocoding_service.geocode_address.side_effect = Exception("Unexpected error")
-
-        # Act - should not raise
-        result = await use_case.execute(
-            event_id=event_id,
-            order_id=str(uuid4()),
-            customer_id=str(uuid4()),
-            direccion_entrega="Address",
-            ciudad_entrega="City",
-            pais_entrega="Country",
-            fecha_pedido=datetime.now(),
-        )
-
-        # Allow async task to complete
-        import asyncio
-        await asyncio.sleep(0.1)
-
-        # Assert - shipment should still be created
-        assert result is not None
-
     @pytest.mark.asyncio
     async def test_execute_shipment_repository_save_error_propagates(
         self,
         use_case,
         mock_shipment_repository,
         mock_processed_event_repository,
-        mock_geocoding_service,
     ):
         """Test that shipment save errors are propagated."""
         # Arrange
         event_id = str(uuid4())
 
-        mock_processed_event_repository.exists.return_value = False
+        mock_processed_event_repository.save_if_new.return_value = True
         mock_shipment_repository.save.side_effect = Exception("Database error")
 
         # Act & Assert
@@ -371,13 +211,12 @@ class TestConsumeOrderCreatedUseCase:
         use_case,
         mock_shipment_repository,
         mock_processed_event_repository,
-        mock_geocoding_service,
     ):
         """Test that processed event repository errors are propagated."""
         # Arrange
         event_id = str(uuid4())
 
-        mock_processed_event_repository.exists.side_effect = Exception("Repository error")
+        mock_processed_event_repository.save_if_new.side_effect = Exception("Repository error")
 
         # Act & Assert
         with pytest.raises(Exception) as exc_info:
@@ -399,15 +238,14 @@ class TestConsumeOrderCreatedUseCase:
         use_case,
         mock_shipment_repository,
         mock_processed_event_repository,
-        mock_geocoding_service,
     ):
         """Test that processed event save errors are propagated."""
         # Arrange
         event_id = str(uuid4())
 
-        mock_processed_event_repository.exists.return_value = False
+        mock_processed_event_repository.save_if_new.return_value = True
         mock_shipment_repository.save.side_effect = lambda s: s
-        mock_processed_event_repository.save.side_effect = Exception("Save error")
+        mock_processed_event_repository.save_if_new.side_effect = Exception("Save error")
 
         # Act & Assert
         with pytest.raises(Exception) as exc_info:
@@ -429,14 +267,13 @@ class TestConsumeOrderCreatedUseCase:
         use_case,
         mock_shipment_repository,
         mock_processed_event_repository,
-        mock_geocoding_service,
     ):
         """Test that the saved shipment is returned."""
         # Arrange
         event_id = str(uuid4())
         order_id = str(uuid4())
 
-        mock_processed_event_repository.exists.return_value = False
+        mock_processed_event_repository.save_if_new.return_value = True
         mock_shipment_repository.save.side_effect = lambda s: s
 
         # Act
@@ -460,13 +297,12 @@ class TestConsumeOrderCreatedUseCase:
         use_case,
         mock_shipment_repository,
         mock_processed_event_repository,
-        mock_geocoding_service,
     ):
         """Test that created shipment has PENDING status."""
         # Arrange
         event_id = str(uuid4())
 
-        mock_processed_event_repository.exists.return_value = False
+        mock_processed_event_repository.save_if_new.return_value = True
         mock_shipment_repository.save.side_effect = lambda s: s
 
         # Act
@@ -489,13 +325,12 @@ class TestConsumeOrderCreatedUseCase:
         use_case,
         mock_shipment_repository,
         mock_processed_event_repository,
-        mock_geocoding_service,
     ):
         """Test that created shipment has PENDING geocoding status initially."""
         # Arrange
         event_id = str(uuid4())
 
-        mock_processed_event_repository.exists.return_value = False
+        mock_processed_event_repository.save_if_new.return_value = True
         mock_shipment_repository.save.side_effect = lambda s: s
 
         # Act
@@ -518,11 +353,10 @@ class TestConsumeOrderCreatedUseCase:
         use_case,
         mock_shipment_repository,
         mock_processed_event_repository,
-        mock_geocoding_service,
     ):
         """Test that each shipment gets a unique ID."""
         # Arrange
-        mock_processed_event_repository.exists.return_value = False
+        mock_processed_event_repository.save_if_new.return_value = True
         mock_shipment_repository.save.side_effect = lambda s: s
 
         # Act
@@ -555,11 +389,10 @@ class TestConsumeOrderCreatedUseCase:
         use_case,
         mock_shipment_repository,
         mock_processed_event_repository,
-        mock_geocoding_service,
     ):
         """Test shipment creation with various order dates."""
         # Arrange
-        mock_processed_event_repository.exists.return_value = False
+        mock_processed_event_repository.save_if_new.return_value = True
         mock_shipment_repository.save.side_effect = lambda s: s
 
         test_dates = [
@@ -589,13 +422,12 @@ class TestConsumeOrderCreatedUseCase:
         use_case,
         mock_shipment_repository,
         mock_processed_event_repository,
-        mock_geocoding_service,
     ):
         """Test that created shipment has no route assignment initially."""
         # Arrange
         event_id = str(uuid4())
 
-        mock_processed_event_repository.exists.return_value = False
+        mock_processed_event_repository.save_if_new.return_value = True
         mock_shipment_repository.save.side_effect = lambda s: s
 
         # Act
@@ -612,3 +444,36 @@ class TestConsumeOrderCreatedUseCase:
         # Assert
         assert result.route_id is None
         assert result.sequence_in_route is None
+
+    @pytest.mark.asyncio
+    async def test_execute_notifies_after_commit_without_geocoding(
+        self,
+        mock_shipment_repository,
+        mock_processed_event_repository,
+        session,
+    ):
+        """Test that geocoding is left to the worker, which is woken after commit."""
+        calls = []
+        session.commit.side_effect = lambda: calls.append("commit")
+        use_case = ConsumeOrderCreatedUseCase(
+            shipment_repository=mock_shipment_repository,
+            processed_event_repository=mock_processed_event_repository,
+            session=session,
+            on_shipment_created=lambda: calls.append("wake"),
+        )
+        mock_processed_event_repository.save_if_new.return_value = True
+        mock_shipment_repository.save.side_effect = lambda s: s
+
+        result = await use_case.execute(
+            event_id=str(uuid4()),
+            order_id=str(uuid4()),
+            customer_id=str(uuid4()),
+            direccion_entrega="Address",
+            ciudad_entrega="City",
+            pais_entrega="Country",
+            fecha_pedido=datetime.now(),
+        )
+
+        assert calls == ["commit", "wake"]
+        assert result.geocoding_status == GeocodingStatus.PENDING
+        mock_shipment_repository.update.assert_not_called()
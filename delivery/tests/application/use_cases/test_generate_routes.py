@@ -4,7 +4,9 @@ from uuid import uuid4
 from datetime import date, datetime
 from decimal import Decimal
 from dataclasses import dataclass
+from typing import Optional
 
+from src.application.ports import RouteOptimizationPlan, UnassignedShipment
 from src.application.use_cases.generate_routes import GenerateRoutesUseCase
 from src.domain.entities import Route, Vehicle, Shipment
 from src.domain.value_objects import ShipmentStatus, RouteStatus
@@ -18,6 +20,7 @@ class MockOptimizationResult:
     shipments: list
     estimated_duration_minutes: int
     total_distance_km: Decimal
+    initial_distance_km: Optional[Decimal] = None
 
 
 class TestGenerateRoutesUseCase:
@@ -119,9 +122,9 @@ class TestGenerateRoutesUseCase:
 
         mock_shipment_repository.find_pending_by_date.return_value = shipments
         mock_vehicle_repository.find_by_ids.return_value = [vehicle]
-        mock_route_optimizer.optimize_routes.return_value = [optimization_result]
-        mock_route_repository.save.return_value = None
-        mock_shipment_repository.update_many.return_value = None
+        mock_route_optimizer.plan_routes.return_value = RouteOptimizationPlan(routes=[optimization_result])
+        mock_route_repository.save_many.return_value = None
+        mock_shipment_repository.bulk_update_route_assignments.return_value = 2
 
         # Act
         result = await use_case.execute(
@@ -138,9 +141,9 @@ class TestGenerateRoutesUseCase:
 
         mock_shipment_repository.find_pending_by_date.assert_called_once_with(fecha_entrega)
         mock_vehicle_repository.find_by_ids.assert_called_once_with(vehicle_ids)
-        mock_route_optimizer.optimize_routes.assert_called_once()
-        mock_route_repository.save.assert_called_once()
-        mock_shipment_repository.update_many.assert_called_once()
+        mock_route_optimizer.plan_routes.assert_called_once()
+        mock_route_repository.save_many.assert_called_once()
+        mock_shipment_repository.bulk_update_route_assignments.assert_called_once_with(shipments)
 
     @pytest.mark.asyncio
     async def test_execute_no_pending_shipments_returns_empty(
@@ -168,7 +171,7 @@ class TestGenerateRoutesUseCase:
         # Assert
         assert result == []
         mock_vehicle_repository.find_by_ids.assert_not_called()
-        mock_route_optimizer.optimize_routes.assert_not_called()
+        mock_route_optimizer.plan_routes.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_execute_no_valid_vehicles_raises_error(
@@ -198,7 +201,7 @@ class TestGenerateRoutesUseCase:
             )
 
         assert "No valid vehicles found" in str(exc_info.value)
-        mock_route_optimizer.optimize_routes.assert_not_called()
+        mock_route_optimizer.plan_routes.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_execute_optimizer_returns_no_routes(
@@ -220,7 +223,7 @@ class TestGenerateRoutesUseCase:
 
         mock_shipment_repository.find_pending_by_date.return_value = shipments
         mock_vehicle_repository.find_by_ids.return_value = [vehicle]
-        mock_route_optimizer.optimize_routes.return_value = []
+        mock_route_optimizer.plan_routes.return_value = RouteOptimizationPlan(routes=[])
 
         # Act
         result = await use_case.execute(
@@ -230,7 +233,7 @@ class TestGenerateRoutesUseCase:
 
         # Assert
         assert result == []
-        mock_route_repository.save.assert_not_called()
+        mock_route_repository.save_many.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_execute_multiple_routes(
@@ -269,7 +272,7 @@ class TestGenerateRoutesUseCase:
 
         mock_shipment_repository.find_pending_by_date.return_value = shipments1 + shipments2
         mock_vehicle_repository.find_by_ids.return_value = [vehicle1, vehicle2]
-        mock_route_optimizer.optimize_routes.return_value = optimization_results
+        mock_route_optimizer.plan_routes.return_value = RouteOptimizationPlan(routes=optimization_results)
 
         # Act
         result = await use_case.execute(
@@ -279,8 +282,12 @@ class TestGenerateRoutesUseCase:
 
         # Assert
         assert len(result) == 2
-        assert mock_route_repository.save.call_count == 2
-        assert mock_shipment_repository.update_many.call_count == 2
+        # One bulk write for all routes and one for all shipments
+        mock_route_repository.save_many.assert_called_once()
+        assert len(mock_route_repository.save_many.call_args[0][0]) == 2
+        mock_shipment_repository.bulk_update_route_assignments.assert_called_once_with(
+            shipments1 + shipments2
+        )
 
     @pytest.mark.asyncio
     async def test_execute_publishes_routes_generated_void_event(
@@ -309,7 +316,7 @@ class TestGenerateRoutesUseCase:
 
         mock_shipment_repository.find_pending_by_date.return_value = shipments
         mock_vehicle_repository.find_by_ids.return_value = [vehicle]
-        mock_route_optimizer.optimize_routes.return_value = [optimization_result]
+        mock_route_optimizer.plan_routes.return_value = RouteOptimizationPlan(routes=[optimization_result])
 
         # Act
         await use_case.execute(
@@ -347,7 +354,7 @@ class TestGenerateRoutesUseCase:
 
         mock_shipment_repository.find_pending_by_date.return_value = shipments
         mock_vehicle_repository.find_by_ids.return_value = [vehicle]
-        mock_route_optimizer.optimize_routes.return_value = [optimization_result]
+        mock_route_optimizer.plan_routes.return_value = RouteOptimizationPlan(routes=[optimization_result])
         mock_event_publisher.publish_routes_generated.side_effect = Exception("SQS error")
 
         # Act - should not raise
@@ -434,7 +441,7 @@ class TestGenerateRoutesUseCase:
 
         mock_shipment_repository.find_pending_by_date.return_value = shipments
         mock_vehicle_repository.find_by_ids.return_value = [vehicle]
-        mock_route_optimizer.optimize_routes.side_effect = Exception("Optimizer error")
+        mock_route_optimizer.plan_routes.side_effect = Exception("Optimizer error")
 
         # Act & Assert
         with pytest.raises(Exception) as exc_info:
@@ -472,8 +479,8 @@ class TestGenerateRoutesUseCase:
 
         mock_shipment_repository.find_pending_by_date.return_value = shipments
         mock_vehicle_repository.find_by_ids.return_value = [vehicle]
-        mock_route_optimizer.optimize_routes.return_value = [optimization_result]
-        mock_route_repository.save.side_effect = Exception("Save error")
+        mock_route_optimizer.plan_routes.return_value = RouteOptimizationPlan(routes=[optimization_result])
+        mock_route_repository.save_many.side_effect = Exception("Save error")
 
         # Act & Assert
         with pytest.raises(Exception) as exc_info:
@@ -511,7 +518,7 @@ class TestGenerateRoutesUseCase:
 
         mock_shipment_repository.find_pending_by_date.return_value = shipments
         mock_vehicle_repository.find_by_ids.return_value = [vehicle]
-        mock_route_optimizer.optimize_routes.return_value = [optimization_result]
+        mock_route_optimizer.plan_routes.return_value = RouteOptimizationPlan(routes=[optimization_result])
 
         # Act
         result = await use_case.execute(
@@ -555,7 +562,7 @@ class TestGenerateRoutesUseCase:
 
         mock_shipment_repository.find_pending_by_date.return_value = shipments
         mock_vehicle_repository.find_by_ids.return_value = [vehicle]
-        mock_route_optimizer.optimize_routes.return_value = [optimization_result]
+        mock_route_optimizer.plan_routes.return_value = RouteOptimizationPlan(routes=[optimization_result])
 
         # Act
         result = await use_case.execute(
@@ -593,7 +600,7 @@ class TestGenerateRoutesUseCase:
 
         mock_shipment_repository.find_pending_by_date.return_value = shipments
         mock_vehicle_repository.find_by_ids.return_value = [vehicle]
-        mock_route_optimizer.optimize_routes.return_value = [optimization_result]
+        mock_route_optimizer.plan_routes.return_value = RouteOptimizationPlan(routes=[optimization_result])
 
         # Act
         result = await use_case.execute(
@@ -641,7 +648,7 @@ class TestGenerateRoutesUseCase:
 
         mock_shipment_repository.find_pending_by_date.return_value = shipments1 + shipments2
         mock_vehicle_repository.find_by_ids.return_value = [vehicle1, vehicle2]
-        mock_route_optimizer.optimize_routes.return_value = optimization_results
+        mock_route_optimizer.plan_routes.return_value = RouteOptimizationPlan(routes=optimization_results)
 
         # Act
         await use_case.execute(
@@ -651,3 +658,80 @@ class TestGenerateRoutesUseCase:
 
         # Assert - only one routes_generated void event
         mock_event_publisher.publish_routes_generated.assert_called_once_with()
+
+    @pytest.mark.asyncio
+    async def test_execute_leaves_unassigned_shipments_pending(
+        self,
+        use_case,
+        mock_shipment_repository,
+        mock_vehicle_repository,
+        mock_route_repository,
+        mock_route_optimizer,
+        mock_event_publisher,
+    ):
+        """Test that shipments the optimizer could not place are not routed."""
+        fecha_entrega = date(2024, 1, 15)
+        vehicle = self._create_vehicle()
+        assigned = self._create_shipment()
+        left_out = self._create_shipment()
+
+        mock_shipment_repository.find_pending_by_date.return_value = [assigned, left_out]
+        mock_vehicle_repository.find_by_ids.return_value = [vehicle]
+        mock_route_optimizer.plan_routes.return_value = RouteOptimizationPlan(
+            routes=[
+                MockOptimizationResult(
+                    vehicle=vehicle,
+                    shipments=[assigned],
+                    estimated_duration_minutes=30,
+                    total_distance_km=Decimal("5.0"),
+                )
+            ],
+            unassigned=[UnassignedShipment(shipment=left_out, reason="vehicle_capacity")],
+        )
+
+        result = await use_case.execute(
+            fecha_entrega_estimada=fecha_entrega,
+            vehicle_ids=[vehicle.id],
+        )
+
+        assert len(result) == 1
+        assert result[0].total_orders == 1
+        assert left_out.shipment_status == ShipmentStatus.PENDING
+        assert left_out.route_id is None
+        mock_shipment_repository.bulk_update_route_assignments.assert_called_once_with([assigned])
+
+    @pytest.mark.asyncio
+    async def test_execute_reports_progress(
+        self,
+        use_case,
+        mock_shipment_repository,
+        mock_vehicle_repository,
+        mock_route_optimizer,
+    ):
+        """Test that progress milestones and counts reach the callback."""
+        vehicle = self._create_vehicle()
+        shipments = [self._create_shipment(), self._create_shipment()]
+
+        mock_shipment_repository.find_pending_by_date.return_value = shipments
+        mock_vehicle_repository.find_by_ids.return_value = [vehicle]
+        mock_route_optimizer.plan_routes.return_value = RouteOptimizationPlan(
+            routes=[
+                MockOptimizationResult(
+                    vehicle=vehicle,
+                    shipments=shipments,
+                    estimated_duration_minutes=30,
+                    total_distance_km=Decimal("5.0"),
+                )
+            ],
+        )
+        on_progress = AsyncMock()
+
+        await use_case.execute(date(2024, 1, 15), [vehicle.id], on_progress=on_progress)
+
+        calls = [(c.args, c.kwargs) for c in on_progress.await_args_list]
+        assert calls[0] == ((10,), {"num_shipments": 2})
+        assert calls[1] == (
+            (70,),
+            {"num_routes": 1, "num_assigned_shipments": 2, "num_unassigned_shipments": 0},
+        )
+        assert calls[-1] == ((95,), {})
@@ -0,0 +1,199 @@
+import pytest
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+from src.application.use_cases.geocode_pending_shipments import GeocodePendingShipmentsUseCase
+from src.domain.entities import Shipment
+from src.domain.exceptions import AddressNotFoundError, GeocodingError
+from src.domain.value_objects import GeocodingStatus
+
+BOGOTA = (Decimal("4.60971"), Decimal("-74.08175"))
+LEASE = timedelta(minutes=5)
+
+
+def _shipment(address="Calle 123"):
+    return Shipment(
+        id=uuid4(),
+        order_id=uuid4(),
+        customer_id=uuid4(),
+        direccion_entrega=address,
+        ciudad_entrega="Bogota",
+        pais_entrega="Colombia",
+        fecha_pedido=datetime(2025, 1, 14, 10, 0, 0),
+        fecha_entrega_estimada=date(2025, 1, 15),
+    )
+
+
+class TestGeocodePendingShipmentsUseCase:
+    """Test suite for GeocodePendingShipmentsUseCase."""
+
+    @pytest.fixture
+    def mock_shipment_repository(self):
+        repo = AsyncMock()
+        repo.bulk_update_geocoding.side_effect = lambda shipments: len(shipments)
+        return repo
+
+    @staticmethod
+    def _claim(repo, shipments):
+        """Hand out shipments holding the lease the real repository sets on claim."""
+
+        async def claim(limit, lease):
+            for shipment in shipments:
+                shipment.geocoding_next_attempt_at = datetime.now() + lease
+            return shipments
+
+        repo.claim_pending_geocoding.side_effect = claim
+
+    @pytest.fixture
+    def mock_geocoding_service(self):
+        service = AsyncMock()
+        service.geocode_address.return_value = BOGOTA
+        return service
+
+    @pytest.fixture
+    def use_case(self, mock_shipment_repository, mock_geocoding_service, session):
+        return GeocodePendingShipmentsUseCase(
+            shipment_repository=mock_shipment_repository,
+            geocoding_service=mock_geocoding_service,
+            session=session,
+            batch_size=10,
+            max_attempts=3,
+            retry_base_delay=timedelta(seconds=30),
+        )
+
+    @pytest.mark.asyncio
+    async def test_empty_queue_does_nothing(self, use_case, mock_shipment_repository, mock_geocoding_service):
+        mock_shipment_repository.claim_pending_geocoding.return_value = []
+
+        result = await use_case.execute()
+
+        assert result.claimed == 0
+        mock_shipment_repository.claim_pending_geocoding.assert_awaited_once_with(
+            10, LEASE
+        )
+        mock_geocoding_service.geocode_address.assert_not_called()
+        mock_shipment_repository.bulk_update_geocoding.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_batch_success_written_in_one_update(
+        self, use_case, mock_shipment_repository, session
+    ):
+        shipments = [_shipment(f"Calle {i}") for i in range(3)]
+        self._claim(mock_shipment_repository, shipments)
+
+        result = await use_case.execute()
+
+        assert result.claimed == 3
+        assert result.succeeded == 3
+        assert all(s.geocoding_next_attempt_at is None for s in shipments)
+        assert all(s.is_geocoded and s.coordinates for s in shipments)
+        mock_shipment_repository.bulk_update_geocoding.assert_awaited_once_with(shipments)
+        mock_shipment_repository.update.assert_not_called()
+        # One commit for the claim, one for the results
+        assert session.commit.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_address_not_found_falls_back_to_city(
+        self, use_case, mock_shipment_repository, mock_geocoding_service
+    ):
+        shipment = _shipment()
+        self._claim(mock_shipment_repository, [shipment])
+        mock_geocoding_service.geocode_address.side_effect = [
+            AddressNotFoundError("No results"),
+            BOGOTA,
+        ]
+
+        result = await use_case.execute()
+
+        assert result.succeeded == 1
+        assert mock_geocoding_service.geocode_address.call_args_list[1].args == (
+            "",
+            "Bogota",
+            "Colombia",
+        )
+
+    @pytest.mark.asyncio
+    async def test_city_not_found_fails_without_retry(
+        self, use_case, mock_shipment_repository, mock_geocoding_service
+    ):
+        shipment = _shipment()
+        self._claim(mock_shipment_repository, [shipment])
+        mock_geocoding_service.geocode_address.side_effect = AddressNotFoundError("No results")
+
+        result = await use_case.execute()
+
+        assert (result.failed, result.retried) == (1, 0)
+        assert shipment.geocoding_status == GeocodingStatus.FAILED
+        assert shipment.geocoding_next_attempt_at is None
+
+    @pytest.mark.asyncio
+    async def test_transient_error_schedules_retry(
+        self, use_case, mock_shipment_repository, mock_geocoding_service
+    ):
+        shipment = _shipment()
+        self._claim(mock_shipment_repository, [shipment])
+        mock_geocoding_service.geocode_address.side_effect = GeocodingError("Timeout")
+
+        result = await use_case.execute()
+
+        assert (result.retried, result.failed) == (1, 0)
+        assert shipment.geocoding_status == GeocodingStatus.PENDING
+        assert shipment.geocoding_attempts == 1
+        assert shipment.geocoding_next_attempt_at is not None
+        # Transient errors do not trigger the city fallback
+        mock_geocoding_service.geocode_address.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_unexpected_error_counts_as_attempt(
+        self, use_case, mock_shipment_repository, mock_geocoding_service
+    ):
+        shipment = _shipment()
+        shipment.geocoding_attempts = 2
+        self._claim(mock_shipment_repository, [shipment])
+        mock_geocoding_service.geocode_address.side_effect = Exception("boom")
+
+        result = await use_case.execute()
+
+        assert result.failed == 1
+        assert shipment.geocoding_status == GeocodingStatus.FAILED
+
+    @pytest.mark.asyncio
+    async def test_mixed_batch_counts(
+        self, use_case, mock_shipment_repository, mock_geocoding_service
+    ):
+        ok, retry = _shipment("Calle 1"), _shipment("Calle 2")
+        self._claim(mock_shipment_repository, [ok, retry])
+
+        async def geocode(address, city, country):
+            if address == "Calle 2":
+                raise GeocodingError("HTTP error")
+            return BOGOTA
+
+        mock_geocoding_service.geocode_address.side_effect = geocode
+
+        result = await use_case.execute()
+
+        assert (result.claimed, result.succeeded, result.retried, result.failed) == (2, 1, 1, 0)
+
+    @pytest.mark.asyncio
+    async def test_mixed_batch_counts_terminal_failures_as_failed(
+        self, use_case, mock_shipment_repository, mock_geocoding_service
+    ):
+        ok, retry, missing = _shipment("Calle 1"), _shipment("Calle 2"), _shipment("Calle 3")
+        missing.ciudad_entrega = "Atlantis"
+        self._claim(mock_shipment_repository, [ok, retry, missing])
+
+        async def geocode(address, city, country):
+            if city == "Atlantis":
+                raise AddressNotFoundError("No results")
+            if address == "Calle 2":
+                raise GeocodingError("HTTP error")
+            return BOGOTA
+
+        mock_geocoding_service.geocode_address.side_effect = geocode
+
+        result = await use_case.execute()
+
+        assert (result.claimed, result.succeeded, result.retried, result.failed) == (3, 1, 1, 1)
@@ -0,0 +1,114 @@
+import pytest
+from unittest.mock import AsyncMock
+from uuid import uuid4
+from datetime import date, datetime
+
+from src.application.use_cases.get_shipments_by_orders import GetShipmentsByOrdersUseCase
+from src.domain.entities import Shipment, Vehicle
+from src.domain.value_objects import ShipmentStatus
+
+
+class TestGetShipmentsByOrdersUseCase:
+    """Test suite for GetShipmentsByOrdersUseCase."""
+
+    @pytest.fixture
+    def mock_shipment_repository(self):
+        return AsyncMock()
+
+    @pytest.fixture
+    def mock_vehicle_repository(self):
+        return AsyncMock()
+
+    @pytest.fixture
+    def mock_route_repository(self):
+        return AsyncMock()
+
+    @pytest.fixture
+    def use_case(
+        self, mock_shipment_repository, mock_vehicle_repository, mock_route_repository
+    ):
+        return GetShipmentsByOrdersUseCase(
+            shipment_repository=mock_shipment_repository,
+            vehicle_repository=mock_vehicle_repository,
+            route_repository=mock_route_repository,
+        )
+
+    def _create_shipment(self, route_id=None):
+        shipment = Shipment(
+            id=uuid4(),
+            order_id=uuid4(),
+            customer_id=uuid4(),
+            direccion_entrega="123 Main St",
+            ciudad_entrega="City",
+            pais_entrega="Country",
+            fecha_pedido=datetime(2024, 1, 14, 10, 0, 0),
+            fecha_entrega_estimada=date(2024, 1, 15),
+        )
+        if route_id:
+            shipment.route_id = route_id
+            shipment.sequence_in_route = 1
+            shipment.shipment_status = ShipmentStatus.ASSIGNED_TO_ROUTE
+        return shipment
+
+    @pytest.mark.asyncio
+    async def test_execute_batches_route_and_vehicle_lookups(
+        self,
+        use_case,
+        mock_shipment_repository,
+        mock_vehicle_repository,
+        mock_route_repository,
+    ):
+        route_id = uuid4()
+        vehicle_id = uuid4()
+        routed = [self._create_shipment(route_id) for _ in range(3)]
+        unrouted = self._create_shipment()
+        vehicle = Vehicle(id=vehicle_id, placa="ABC123", driver_name="John Doe")
+
+        mock_shipment_repository.find_by_order_ids.return_value = routed + [unrouted]
+        mock_route_repository.find_vehicle_ids.return_value = {route_id: vehicle_id}
+        mock_vehicle_repository.find_by_ids.return_value = [vehicle]
+
+        order_ids = [s.order_id for s in routed] + [unrouted.order_id, uuid4()]
+        result = await use_case.execute(order_ids)
+
+        assert len(result) == 4
+        by_order = {item["order_id"]: item for item in result}
+        for shipment in routed:
+            assert by_order[shipment.order_id]["vehicle_plate"] == "ABC123"
+            assert by_order[shipment.order_id]["driver_name"] == "John Doe"
+            assert by_order[shipment.order_id]["shipment_status"] == "assigned_to_route"
+        assert by_order[unrouted.order_id]["vehicle_plate"] is None
+        assert by_order[unrouted.order_id]["route_id"] is None
+
+        mock_shipment_repository.find_by_order_ids.assert_called_once_with(order_ids)
+        mock_route_repository.find_vehicle_ids.assert_called_once_with([route_id])
+        mock_vehicle_repository.find_by_ids.assert_called_once_with([vehicle_id])
+
+    @pytest.mark.asyncio
+    async def test_execute_deduplicates_order_ids(self, use_case, mock_shipment_repository):
+        order_id = uuid4()
+        mock_shipment_repository.find_by_order_ids.return_value = []
+
+        result = await use_case.execute([order_id, order_id])
+
+        assert result == []
+        mock_shipment_repository.find_by_order_ids.assert_called_once_with([order_id])
+
+    @pytest.mark.asyncio
+    async def test_execute_missing_vehicle_leaves_vehicle_fields_empty(
+        self,
+        use_case,
+        mock_shipment_repository,
+        mock_vehicle_repository,
+        mock_route_repository,
+    ):
+        shipment = self._create_shipment(uuid4())
+        mock_shipment_repository.find_by_order_ids.return_value = [shipment]
+        mock_route_repository.find_vehicle_ids.return_value = {}
+        mock_vehicle_repository.find_by_ids.return_value = []
+
+        result = await use_case.execute([shipment.order_id])
+
+        assert result[0]["route_id"] == shipment.route_id
+        assert result[0]["vehicle_plate"] is None
+        assert result[0]["driver_name"] is None
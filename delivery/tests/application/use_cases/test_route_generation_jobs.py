@@ -0,0 +1,323 @@
+import asyncio
+import pytest
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from src.application.use_cases.expire_route_generation_jobs import (
+    ExpireRouteGenerationJobsUseCase,
+)
+from src.application.use_cases.get_route_generation_job import GetRouteGenerationJobUseCase
+from src.application.use_cases.run_route_generation_job import RunRouteGenerationJobUseCase
+from src.application.use_cases.submit_route_generation_job import (
+    LEASE_EXPIRED_MESSAGE,
+    SubmitRouteGenerationJobUseCase,
+)
+from src.domain.entities import RouteGenerationJob
+from src.domain.exceptions import (
+    DuplicateRouteJobError,
+    EntityNotFoundError,
+    RouteOptimizationError,
+)
+from src.domain.value_objects import RouteJobStatus
+
+
+def _job(status=RouteJobStatus.QUEUED):
+    vehicle_ids = [uuid4()]
+    fecha = date(2025, 1, 15)
+    job = RouteGenerationJob(
+        id=uuid4(),
+        fecha_entrega_estimada=fecha,
+        vehicle_ids=vehicle_ids,
+        dedup_key=RouteGenerationJob.build_dedup_key(fecha, vehicle_ids),
+        status=status,
+    )
+    job.renew_lease(timedelta(minutes=5))
+    return job
+
+
+@pytest.fixture
+def mock_job_repository():
+    return AsyncMock()
+
+
+class TestSubmitRouteGenerationJobUseCase:
+    @pytest.fixture
+    def use_case(self, mock_job_repository, session):
+        return SubmitRouteGenerationJobUseCase(
+            job_repository=mock_job_repository,
+            session=session,
+        )
+
+    @pytest.mark.asyncio
+    async def test_creates_queued_job(self, use_case, mock_job_repository, session):
+        mock_job_repository.find_active_by_dedup_key.return_value = None
+        vehicle_ids = [uuid4(), uuid4()]
+
+        job, created = await use_case.execute(date(2025, 1, 15), vehicle_ids)
+
+        assert created is True
+        assert job.status == RouteJobStatus.QUEUED
+        assert job.vehicle_ids == vehicle_ids
+        assert job.dedup_key == RouteGenerationJob.build_dedup_key(date(2025, 1, 15), vehicle_ids)
+        assert job.lease_expires_at > datetime.now(timezone.utc)
+        mock_job_repository.save.assert_awaited_once_with(job)
+        session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_returns_active_job_for_same_key(self, use_case, mock_job_repository, session):
+        existing = _job(RouteJobStatus.RUNNING)
+        mock_job_repository.find_active_by_dedup_key.return_value = existing
+
+        job, created = await use_case.execute(existing.fecha_entrega_estimada, existing.vehicle_ids)
+
+        assert job is existing
+        assert created is False
+        mock_job_repository.save.assert_not_called()
+        session.commit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_replaces_active_job_with_expired_lease(
+        self, use_case, mock_job_repository, session
+    ):
+        stale = _job(RouteJobStatus.RUNNING)
+        stale.lease_expires_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+        mock_job_repository.find_active_by_dedup_key.return_value = stale
+
+        job, created = await use_case.execute(stale.fecha_entrega_estimada, stale.vehicle_ids)
+
+        assert created is True
+        assert job is not stale
+        assert stale.status == RouteJobStatus.FAILED
+        assert stale.error_message == LEASE_EXPIRED_MESSAGE
+        mock_job_repository.update.assert_awaited_once_with(stale)
+        mock_job_repository.save.assert_awaited_once_with(job)
+        session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_insert_returns_winner(self, use_case, mock_job_repository):
+        winner = _job()
+        mock_job_repository.find_active_by_dedup_key.side_effect = [None, winner]
+        mock_job_repository.save.side_effect = DuplicateRouteJobError(winner.dedup_key)
+
+        job, created = await use_case.execute(winner.fecha_entrega_estimada, winner.vehicle_ids)
+
+        assert job is winner
+        assert created is False
+
+
+class TestExpireRouteGenerationJobsUseCase:
+    @pytest.mark.asyncio
+    async def test_fails_expired_jobs(self, mock_job_repository, session):
+        mock_job_repository.fail_expired.return_value = 2
+
+        expired = await ExpireRouteGenerationJobsUseCase(mock_job_repository, session).execute()
+
+        assert expired == 2
+        mock_job_repository.fail_expired.assert_awaited_once_with(LEASE_EXPIRED_MESSAGE)
+        session.commit.assert_awaited_once()
+
+
+class TestGetRouteGenerationJobUseCase:
+    @pytest.mark.asyncio
+    async def test_returns_job(self, mock_job_repository):
+        job = _job()
+        mock_job_repository.find_by_id.return_value = job
+
+        result = await GetRouteGenerationJobUseCase(mock_job_repository).execute(job.id)
+
+        assert result is job
+
+    @pytest.mark.asyncio
+    async def test_not_found(self, mock_job_repository):
+        mock_job_repository.find_by_id.return_value = None
+
+        with pytest.raises(EntityNotFoundError):
+            await GetRouteGenerationJobUseCase(mock_job_repository).execute(uuid4())
+
+
+class TestRunRouteGenerationJobUseCase:
+    @pytest.fixture
+    def mock_generate_routes(self):
+        return MagicMock()
+
+    @pytest.fixture
+    def use_case(self, mock_job_repository, session, mock_generate_routes):
+        return RunRouteGenerationJobUseCase(
+            job_repository=mock_job_repository,
+            job_session=session,
+            generate_routes_use_case=mock_generate_routes,
+            concurrency=asyncio.Semaphore(1),
+        )
+
+    @pytest.mark.asyncio
+    async def test_success_records_progress_and_counts(
+        self, use_case, mock_job_repository, mock_generate_routes, session
+    ):
+        job = _job()
+        mock_job_repository.find_by_id.return_value = job
+        statuses = []
+        mock_job_repository.update.side_effect = lambda j: statuses.append((j.status, j.progress))
+
+        async def fake_generate(fecha, vehicle_ids, on_progress):
+            await on_progress(10, num_shipments=5)
+            await on_progress(
+                70, num_routes=1, num_assigned_shipments=4, num_unassigned_shipments=1
+            )
+            return [MagicMock()]
+
+        mock_generate_routes.execute = AsyncMock(side_effect=fake_generate)
+
+        await use_case.execute(job.id)
+
+        assert job.status == RouteJobStatus.SUCCEEDED
+        assert job.num_shipments == 5
+        assert job.num_routes == 1
+        assert job.num_assigned_shipments == 4
+        assert job.num_unassigned_shipments == 1
+        assert statuses == [
+            (RouteJobStatus.RUNNING, 0),
+            (RouteJobStatus.RUNNING, 10),
+            (RouteJobStatus.RUNNING, 70),
+            (RouteJobStatus.SUCCEEDED, 100),
+        ]
+        assert session.commit.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_failure_is_recorded(self, use_case, mock_job_repository, mock_generate_routes):
+        job = _job()
+        mock_job_repository.find_by_id.return_value = job
+        mock_generate_routes.execute = AsyncMock(
+            side_effect=RouteOptimizationError("No valid vehicles found")
+        )
+
+        await use_case.execute(job.id)
+
+        assert job.status == RouteJobStatus.FAILED
+        assert job.error_message == "No valid vehicles found"
+        assert job.finished_at is not None
+
+    @pytest.mark.asyncio
+    async def test_skips_job_not_queued(self, use_case, mock_job_repository, mock_generate_routes):
+        mock_job_repository.find_by_id.return_value = _job(RouteJobStatus.SUCCEEDED)
+        mock_generate_routes.execute = AsyncMock()
+
+        await use_case.execute(uuid4())
+
+        mock_generate_routes.execute.assert_not_called()
+        mock_job_repository.update.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_waits_for_concurrency_slot(
+        self, mock_job_repository, session, mock_generate_routes
+    ):
+        semaphore = asyncio.Semaphore(1)
+        job = _job()
+        mock_job_repository.find_by_id.return_value = job
+        mock_generate_routes.execute = AsyncMock(return_value=[])
+        use_case = RunRouteGenerationJobUseCase(
+            job_repository=mock_job_repository,
+            job_session=session,
+            generate_routes_use_case=mock_generate_routes,
+            concurrency=semaphore,
+        )
+
+        await semaphore.acquire()
+        task = asyncio.create_task(use_case.execute(job.id))
+        await asyncio.sleep(0.05)
+        assert job.status == RouteJobStatus.QUEUED
+
+        semaphore.release()
+        await task
+        assert job.status == RouteJobStatus.SUCCEEDED
+
+    @pytest.mark.asyncio
+    async def test_every_save_renews_lease(
+        self, use_case, mock_job_repository, mock_generate_routes
+    ):
+        job = _job()
+        job.lease_expires_at = datetime.now(timezone.utc)
+        mock_job_repository.find_by_id.return_value = job
+        leases = []
+        mock_job_repository.update.side_effect = lambda j: leases.append(j.lease_expires_at)
+        mock_generate_routes.execute = AsyncMock(return_value=[])
+
+        await use_case.execute(job.id)
+
+        assert leases[0] > datetime.now(timezone.utc) + timedelta(minutes=4)
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_renews_lease_while_queued(
+        self, mock_job_repository, session, mock_generate_routes
+    ):
+        semaphore = asyncio.Semaphore(1)
+        job = _job()
+        job.lease_expires_at = datetime.now(timezone.utc)
+        mock_job_repository.find_by_id.return_value = job
+        mock_generate_routes.execute = AsyncMock(return_value=[])
+        use_case = RunRouteGenerationJobUseCase(
+            job_repository=mock_job_repository,
+            job_session=session,
+            generate_routes_use_case=mock_generate_routes,
+            concurrency=semaphore,
+            lease=timedelta(seconds=0.03),
+        )
+
+        await semaphore.acquire()
+        task = asyncio.create_task(use_case.execute(job.id))
+        await asyncio.sleep(0.05)
+
+        assert job.status == RouteJobStatus.QUEUED
+        assert mock_job_repository.update.await_count >= 1
+
+        semaphore.release()
+        await task
+        assert job.status == RouteJobStatus.SUCCEEDED
+
+    @pytest.mark.asyncio
+    async def test_cancellation_marks_job_failed(
+        self, use_case, mock_job_repository, mock_generate_routes
+    ):
+        job = _job()
+        mock_job_repository.find_by_id.return_value = job
+        started = asyncio.Event()
+
+        async def hang(fecha, vehicle_ids, on_progress):
+            started.set()
+            await asyncio.Event().wait()
+
+        mock_generate_routes.execute = AsyncMock(side_effect=hang)
+
+        task = asyncio.create_task(use_case.execute(job.id))
+        await started.wait()
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert job.status == RouteJobStatus.FAILED
+        assert job.error_message == "CancelledError"
+        mock_job_repository.update.assert_awaited_with(job)
+
+    @pytest.mark.asyncio
+    async def test_cancellation_while_queued_marks_job_failed(
+        self, mock_job_repository, session, mock_generate_routes
+    ):
+        semaphore = asyncio.Semaphore(1)
+        job = _job()
+        mock_job_repository.find_by_id.return_value = job
+        use_case = RunRouteGenerationJobUseCase(
+            job_repository=mock_job_repository,
+            job_session=session,
+            generate_routes_use_case=mock_generate_routes,
+            concurrency=semaphore,
+        )
+
+        await semaphore.acquire()
+        task = asyncio.create_task(use_case.execute(job.id))
+        await asyncio.sleep(0.01)
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert job.status == RouteJobStatus.FAILED
+        mock_generate_routes.execute.assert_not_called()
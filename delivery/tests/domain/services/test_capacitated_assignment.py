@@ -0,0 +1,88 @@
+import numpy as np
+
+from src.domain.services.capacitated_assignment import (
+    UNASSIGNED,
+    balanced_assignment,
+    drop_until_within,
+    vehicle_capacities,
+)
+from src.domain.services.distance_matrix import haversine_matrix
+
+
+class TestVehicleCapacities:
+    def test_explicit_limits_kept(self):
+        capacities = vehicle_capacities([10, 20], n_shipments=100)
+        assert capacities.tolist() == [10, 20]
+
+    def test_unlimited_vehicles_share_remainder_with_slack(self):
+        capacities = vehicle_capacities([10, None, None], n_shipments=110, balance_slack=1.2)
+        assert capacities.tolist() == [10, 60, 60]
+
+    def test_unlimited_vehicles_keep_fleet_share_when_explicit_limits_cover_all(self):
+        capacities = vehicle_capacities([60, 60, None], n_shipments=100, balance_slack=1.2)
+        assert capacities.tolist() == [60, 60, 40]
+
+    def test_unlimited_vehicles_cover_all_shipments(self):
+        capacities = vehicle_capacities([None, None, None], n_shipments=100, balance_slack=1.0)
+        assert capacities.sum() >= 100
+
+
+class TestBalancedAssignment:
+    def test_respects_capacity_with_skewed_demand(self):
+        rng = np.random.default_rng(0)
+        # 90 stops packed in one neighbourhood, 10 far away
+        dense = rng.uniform([4.60, -74.10], [4.62, -74.08], (90, 2))
+        sparse = rng.uniform([4.75, -74.00], [4.80, -73.95], (10, 2))
+        coords = np.vstack([dense, sparse])
+
+        labels = balanced_assignment(coords, np.array([55, 55]))
+
+        counts = np.bincount(labels[labels != UNASSIGNED], minlength=2)
+        assert counts.max() <= 55
+        assert (labels != UNASSIGNED).all()
+
+    def test_overflow_is_unassigned(self):
+        coords = np.random.default_rng(1).uniform([4.5, -74.2], [4.8, -74.0], (30, 2))
+
+        labels = balanced_assignment(coords, np.array([10, 5]))
+
+        assert (labels == 0).sum() == 10
+        assert (labels == 1).sum() == 5
+        assert (labels == UNASSIGNED).sum() == 15
+
+    def test_fewer_points_than_clusters(self):
+        coords = np.array([[4.6, -74.1], [4.7, -74.0]])
+
+        labels = balanced_assignment(coords, np.array([1, 1, 1]))
+
+        assert sorted(labels.tolist()) != [UNASSIGNED, UNASSIGNED]
+        assert len(set(labels.tolist())) == 2
+
+
+class TestDropUntilWithin:
+    def test_drops_outlier_first(self):
+        coords = np.array([[4.60, -74.10], [4.61, -74.10], [4.90, -74.10], [4.62, -74.10]])
+        matrix = haversine_matrix(coords)
+
+        kept, dropped = drop_until_within(
+            matrix, [0, 1, 2, 3], lambda tour, km: km < 5
+        )
+
+        assert dropped == [2]
+        assert kept == [0, 1, 3]
+
+    def test_keeps_route_that_fits(self):
+        matrix = haversine_matrix(np.array([[4.60, -74.10], [4.61, -74.10]]))
+
+        kept, dropped = drop_until_within(matrix, [0, 1], lambda tour, km: True)
+
+        assert kept == [0, 1]
+        assert dropped == []
+
+    def test_can_drop_everything(self):
+        matrix = haversine_matrix(np.array([[4.60, -74.10], [4.61, -74.10]]))
+
+        kept, dropped = drop_until_within(matrix, [0, 1], lambda tour, km: False)
+
+        assert kept == []
+        assert sorted(dropped) == [0, 1]
@@ -0,0 +1,104 @@
+import numpy as np
+import pytest
+from datetime import datetime, timedelta
+from decimal import Decimal
+from uuid import uuid4
+
+from src.domain.entities import Shipment
+from src.domain.services.distance_matrix import (
+    DistanceMatrix,
+    haversine_matrix,
+    shipment_coordinates,
+)
+from src.domain.value_objects import Coordinates
+
+
+def _create_shipment(lat, lon):
+    shipment = Shipment(
+        id=uuid4(),
+        order_id=uuid4(),
+        customer_id=uuid4(),
+        direccion_entrega="Test Address",
+        ciudad_entrega="Bogota",
+        pais_entrega="Colombia",
+        fecha_pedido=datetime.now(),
+        fecha_entrega_estimada=(datetime.now() + timedelta(days=1)).date(),
+    )
+    shipment.set_coordinates(Decimal(str(lat)), Decimal(str(lon)))
+    return shipment
+
+
+class TestHaversineMatrix:
+    def test_matches_scalar_distance(self):
+        points = [(4.60, -74.08), (4.69, -74.08), (6.25, -75.56), (3.45, -76.53)]
+        coords = np.array(points)
+
+        matrix = haversine_matrix(coords, dtype=np.float64)
+
+        for i, (lat1, lon1) in enumerate(points):
+            for j, (lat2, lon2) in enumerate(points):
+                expected = Coordinates(Decimal(str(lat1)), Decimal(str(lon1))).distance_to(
+                    Coordinates(Decimal(str(lat2)), Decimal(str(lon2)))
+                )
+                assert matrix[i, j] == pytest.approx(expected, rel=1e-9, abs=1e-9)
+
+    def test_symmetric_with_zero_diagonal(self):
+        coords = np.random.default_rng(1).uniform([4.5, -74.2], [4.8, -74.0], (50, 2))
+
+        matrix = haversine_matrix(coords)
+
+        assert matrix.shape == (50, 50)
+        assert matrix.dtype == np.float32
+        np.testing.assert_allclose(matrix, matrix.T, rtol=1e-6)
+        assert np.all(np.diag(matrix) == 0)
+
+    def test_block_boundaries_are_seamless(self, monkeypatch):
+        from src.domain.services import distance_matrix
+
+        coords = np.random.default_rng(2).uniform([4.5, -74.2], [4.8, -74.0], (37, 2))
+        expected = haversine_matrix(coords, dtype=np.float64)
+
+        monkeypatch.setattr(distance_matrix, "BLOCK_ROWS", 8)
+        blocked = haversine_matrix(coords, dtype=np.float64)
+
+        np.testing.assert_array_equal(blocked, expected)
+
+    def test_empty(self):
+        assert haversine_matrix(np.empty((0, 2))).shape == (0, 0)
+
+
+class TestDistanceMatrix:
+    def test_from_shipments(self):
+        shipments = [_create_shipment(4.60, -74.08), _create_shipment(4.61, -74.09)]
+
+        matrix = DistanceMatrix.from_shipments(shipments)
+
+        assert len(matrix) == 2
+        np.testing.assert_allclose(
+            shipment_coordinates(shipments), [[4.60, -74.08], [4.61, -74.09]]
+        )
+
+    def test_nearest_neighbor_order(self):
+        coords = np.array([[4.60, -74.08], [4.80, -74.20], [4.61, -74.09], [4.70, -74.15]])
+
+        order = DistanceMatrix(coords).nearest_neighbor_order()
+
+        assert order == [0, 2, 3, 1]
+
+    def test_nearest_neighbor_order_trivial(self):
+        assert DistanceMatrix(np.empty((0, 2))).nearest_neighbor_order() == []
+        assert DistanceMatrix(np.array([[4.6, -74.0]])).nearest_neighbor_order() == [0]
+
+    def test_tour_length(self):
+        points = [(4.60, -74.08), (4.61, -74.08), (4.62, -74.08)]
+        matrix = DistanceMatrix(np.array(points))
+
+        expected = sum(
+            Coordinates(Decimal(str(a[0])), Decimal(str(a[1]))).distance_to(
+                Coordinates(Decimal(str(b[0])), Decimal(str(b[1])))
+            )
+            for a, b in zip(points, points[1:])
+        )
+
+        assert matrix.tour_length([0, 1, 2]) == pytest.approx(expected, rel=1e-6)
+        assert matrix.tour_length([0]) == 0.0
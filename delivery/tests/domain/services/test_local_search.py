@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from src.domain.services.distance_matrix import DistanceMatrix
+from src.domain.services.local_search import LocalSearchImprover
+
+
+def _random_matrix(n, seed=0):
+    coords = np.random.default_rng(seed).uniform([4.5, -74.2], [4.8, -74.0], (n, 2))
+    return DistanceMatrix(coords)
+
+
+class TestLocalSearchImprover:
+    @pytest.fixture
+    def improver(self):
+        return LocalSearchImprover()
+
+    def test_never_worse_than_nearest_neighbor(self, improver):
+        for seed in range(5):
+            matrix = _random_matrix(80, seed)
+            initial = matrix.nearest_neighbor_order()
+
+            improved = improver.improve(matrix, initial, time_budget_seconds=5)
+
+            assert sorted(improved) == list(range(80))
+            assert improved[0] == initial[0]
+            assert matrix.tour_length(improved) <= matrix.tour_length(initial) + 1e-6
+
+    def test_untangles_crossing(self, improver):
+        # Points on a line visited out of order: 0 -> 2 -> 1 -> 3
+        coords = np.array([[4.60, -74.10], [4.61, -74.10], [4.62, -74.10], [4.63, -74.10]])
+        matrix = DistanceMatrix(coords)
+
+        improved = improver.improve(matrix, [0, 2, 1, 3], time_budget_seconds=1)
+
+        assert improved == [0, 1, 2, 3]
+
+    def test_or_opt_relocates_stop(self):
+        # Stop 3 sits between 0 and 1 but is visited last
+        coords = np.array(
+            [[4.60, -74.10], [4.62, -74.10], [4.63, -74.10], [4.61, -74.10], [4.64, -74.10]]
+        )
+        matrix = DistanceMatrix(coords)
+        improver = LocalSearchImprover(max_segment_length=1)
+
+        improved = improver.improve(matrix, [0, 1, 2, 4, 3], time_budget_seconds=1)
+
+        assert improved == [0, 3, 1, 2, 4]
+
+    def test_zero_budget_returns_input(self, improver):
+        matrix = _random_matrix(30)
+        order = matrix.nearest_neighbor_order()
+
+        assert improver.improve(matrix, order, time_budget_seconds=0) == order
+
+    def test_small_routes_unchanged(self, improver):
+        matrix = _random_matrix(2)
+
+        assert improver.improve(matrix, [1, 0], time_budget_seconds=1) == [1, 0]
+        assert improver.improve(_random_matrix(0), [], time_budget_seconds=1) == []
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 from datetime import datetime, timedelta
 from decimal import Decimal
@@ -280,3 +281,92 @@ class TestGreedyRouteOptimizer:
 
         # Should only return 1 result (non-empty clusters)
         assert len(results) == 1
+
+    @pytest.mark.asyncio
+    async def test_optimize_with_local_search_reports_initial_distance(self, sample_vehicles):
+        from src.domain.services.local_search import LocalSearchImprover
+
+        optimizer = GreedyRouteOptimizer(
+            improver=LocalSearchImprover(), improvement_time_budget_seconds=5
+        )
+        rng = np.random.default_rng(7)
+        shipments = [
+            self._create_shipment(round(lat, 6), round(lon, 6))
+            for lat, lon in rng.uniform([4.5, -74.2], [4.8, -74.0], (60, 2))
+        ]
+
+        results = await optimizer.optimize_routes(shipments, sample_vehicles)
+
+        assert sum(len(r.shipments) for r in results) == 60
+        for result in results:
+            assert result.initial_distance_km is not None
+            assert result.total_distance_km <= result.initial_distance_km
+            assert result.distance_saved_km >= 0
+
+    @pytest.mark.asyncio
+    async def test_plan_capacitated_respects_max_stops(self):
+        optimizer = GreedyRouteOptimizer(capacitated=True)
+        vehicles = [
+            Vehicle(id=uuid4(), placa="ABC-123", driver_name="Driver 1", max_stops=10),
+            Vehicle(id=uuid4(), placa="DEF-456", driver_name="Driver 2", max_stops=10),
+        ]
+        rng = np.random.default_rng(3)
+        shipments = [
+            self._create_shipment(round(lat, 6), round(lon, 6))
+            for lat, lon in rng.uniform([4.5, -74.2], [4.8, -74.0], (25, 2))
+        ]
+
+        plan = await optimizer.plan_routes(shipments, vehicles)
+
+        assert all(len(r.shipments) <= 10 for r in plan.routes)
+        assert sum(len(r.shipments) for r in plan.routes) == 20
+        assert len(plan.unassigned) == 5
+        assert {u.reason for u in plan.unassigned} == {"vehicle_capacity"}
+
+    @pytest.mark.asyncio
+    async def test_plan_capacitated_balances_unlimited_vehicles(self, sample_vehicles):
+        optimizer = GreedyRouteOptimizer(capacitated=True, balance_slack=1.0)
+        rng = np.random.default_rng(4)
+        dense = rng.uniform([4.60, -74.10], [4.62, -74.08], (45, 2))
+        sparse = rng.uniform([4.75, -74.00], [4.80, -73.95], (5, 2))
+        shipments = [
+            self._create_shipment(round(lat, 6), round(lon, 6))
+            for lat, lon in np.vstack([dense, sparse])
+        ]
+
+        plan = await optimizer.plan_routes(shipments, sample_vehicles)
+
+        assert sorted(len(r.shipments) for r in plan.routes) == [25, 25]
+        assert plan.unassigned == []
+
+    @pytest.mark.asyncio
+    async def test_plan_capacitated_sheds_stops_over_shift_length(self):
+        optimizer = GreedyRouteOptimizer(capacitated=True)
+        vehicle = Vehicle(
+            id=uuid4(), placa="ABC-123", driver_name="Driver 1", max_route_minutes=19
+        )
+        shipments = [
+            self._create_shipment(4.600, -74.080),
+            self._create_shipment(4.601, -74.080),
+            self._create_shipment(4.602, -74.080),
+            self._create_shipment(4.603, -74.080),
+        ]
+
+        plan = await optimizer.plan_routes(shipments, [vehicle])
+
+        assert len(plan.routes) == 1
+        assert plan.routes[0].estimated_duration_minutes <= 19
+        assert len(plan.routes[0].shipments) == 3
+        assert [u.reason for u in plan.unassigned] == ["route_duration"]
+
+    @pytest.mark.asyncio
+    async def test_plan_reports_ungeocoded_as_unassigned(self, optimizer, sample_vehicles):
+        ungeocoded = self._create_ungecoded_shipment()
+
+        plan = await optimizer.plan_routes(
+            [self._create_shipment(4.60, -74.08), ungeocoded], sample_vehicles
+        )
+
+        assert len(plan.routes) == 1
+        assert plan.unassigned[0].shipment is ungeocoded
+        assert plan.unassigned[0].reason == "not_geocoded"
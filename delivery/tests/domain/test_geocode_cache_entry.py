@@ -0,0 +1,52 @@
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+from src.domain.entities import GeocodeCacheEntry
+
+
+class TestGeocodeCacheEntry:
+    def test_normalize_strips_accents_case_and_punctuation(self):
+        assert GeocodeCacheEntry.normalize("  Bogotá,  D.C. ") == "bogota d c"
+
+    def test_normalize_expands_street_abbreviations(self):
+        assert GeocodeCacheEntry.normalize("Cra. 7 No. 45-10") == GeocodeCacheEntry.normalize(
+            "Carrera 7 # 45-10"
+        )
+
+    def test_build_key_ignores_formatting_differences(self):
+        key = GeocodeCacheEntry.build_key("Calle 100 #15-20", "Bogotá", "Colombia")
+
+        assert key == GeocodeCacheEntry.build_key("CL 100 # 15-20", "bogota", " COLOMBIA ")
+        assert key != GeocodeCacheEntry.build_key("Calle 100 #15-21", "Bogota", "Colombia")
+
+    def test_build_key_separates_city_only_lookups(self):
+        assert GeocodeCacheEntry.build_key("", "Bogota", "Colombia") != GeocodeCacheEntry.build_key(
+            "Bogota", "", "Colombia"
+        )
+
+    def test_create_positive_entry(self):
+        entry = GeocodeCacheEntry.create(
+            "Calle 1", "Cali", "Colombia", (Decimal("3.45"), Decimal("-76.53"))
+        )
+
+        assert entry.found is True
+        assert entry.coordinates == (Decimal("3.45"), Decimal("-76.53"))
+        assert entry.address == "calle 1"
+        assert entry.lookup_count == 1
+
+    def test_create_negative_entry(self):
+        entry = GeocodeCacheEntry.create("Nowhere 1", "Cali", "Colombia", None)
+
+        assert entry.found is False
+
+    def test_negative_entries_expire_sooner(self):
+        now = datetime.now(timezone.utc)
+        refreshed = now - timedelta(days=2)
+        positive = GeocodeCacheEntry.create("a", "b", "c", (Decimal("1"), Decimal("2")))
+        negative = GeocodeCacheEntry.create("a", "b", "c", None)
+        positive.refreshed_at = negative.refreshed_at = refreshed
+
+        ttl, negative_ttl = timedelta(days=90), timedelta(days=1)
+
+        assert positive.is_expired(ttl, negative_ttl, now) is False
+        assert negative.is_expired(ttl, negative_ttl, now) is True
@@ -0,0 +1,93 @@
+import pytest
+from datetime import date, datetime, timedelta, timezone
+from uuid import uuid4
+
+from src.domain.entities import RouteGenerationJob
+from src.domain.value_objects import RouteJobStatus
+
+
+@pytest.fixture
+def job():
+    vehicle_ids = [uuid4(), uuid4()]
+    return RouteGenerationJob(
+        id=uuid4(),
+        fecha_entrega_estimada=date(2025, 1, 15),
+        vehicle_ids=vehicle_ids,
+        dedup_key=RouteGenerationJob.build_dedup_key(date(2025, 1, 15), vehicle_ids),
+    )
+
+
+class TestRouteGenerationJob:
+    def test_new_job_is_queued(self, job):
+        assert job.status == RouteJobStatus.QUEUED
+        assert job.progress == 0
+        assert job.duration_ms is None
+
+    def test_dedup_key_ignores_vehicle_order_and_duplicates(self):
+        a, b = uuid4(), uuid4()
+        key = RouteGenerationJob.build_dedup_key(date(2025, 1, 15), [a, b])
+
+        assert key == RouteGenerationJob.build_dedup_key(date(2025, 1, 15), [b, a, a])
+        assert key != RouteGenerationJob.build_dedup_key(date(2025, 1, 16), [a, b])
+        assert key != RouteGenerationJob.build_dedup_key(date(2025, 1, 15), [a])
+
+    def test_lifecycle_success(self, job):
+        job.start()
+        assert job.status == RouteJobStatus.RUNNING
+        assert job.started_at is not None
+
+        job.report_progress(40)
+        job.report_progress(10)
+        assert job.progress == 40
+
+        job.succeed(num_routes=2, num_assigned_shipments=30, num_unassigned_shipments=1)
+        assert job.status == RouteJobStatus.SUCCEEDED
+        assert job.progress == 100
+        assert job.num_routes == 2
+        assert job.finished_at is not None
+        assert job.duration_ms >= 0
+
+    def test_fail_records_error(self, job):
+        job.start()
+        job.fail("No valid vehicles found")
+
+        assert job.status == RouteJobStatus.FAILED
+        assert job.error_message == "No valid vehicles found"
+
+    def test_cannot_start_twice(self, job):
+        job.start()
+        with pytest.raises(ValueError):
+            job.start()
+
+    def test_cannot_succeed_without_running(self, job):
+        with pytest.raises(ValueError):
+            job.succeed(num_routes=0, num_assigned_shipments=0, num_unassigned_shipments=0)
+
+    def test_cannot_fail_finished_job(self, job):
+        job.start()
+        job.succeed(num_routes=0, num_assigned_shipments=0, num_unassigned_shipments=0)
+        with pytest.raises(ValueError):
+            job.fail("late error")
+
+    def test_active_statuses(self):
+        assert RouteJobStatus.QUEUED.is_active
+        assert RouteJobStatus.RUNNING.is_active
+        assert not RouteJobStatus.SUCCEEDED.is_active
+        assert not RouteJobStatus.FAILED.is_active
+
+    def test_renewed_lease_is_not_expired(self, job):
+        now = datetime(2025, 1, 15, 12, 0, tzinfo=timezone.utc)
+        job.renew_lease(timedelta(minutes=5), now)
+
+        assert job.lease_expires_at == now + timedelta(minutes=5)
+        assert not job.is_lease_expired(now + timedelta(minutes=4))
+        assert job.is_lease_expired(now + timedelta(minutes=5))
+
+    def test_active_job_without_lease_is_expired(self, job):
+        assert job.is_lease_expired()
+
+    def test_finished_job_lease_never_expires(self, job):
+        job.start()
+        job.fail("boom")
+
+        assert not job.is_lease_expired()
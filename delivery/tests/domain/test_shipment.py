@@ -107,20 +107,24 @@ class TestShipmentGeocoding:
     def test_set_coordinates_updates_status(self, sample_shipment):
         """Test that setting coordinates updates geocoding status to SUCCESS."""
         assert sample_shipment.geocoding_status == GeocodingStatus.PENDING
+        sample_shipment.geocoding_next_attempt_at = datetime(2025, 1, 15, 12, 5, 0)
 
         sample_shipment.set_coordinates(Decimal("4.70"), Decimal("-74.15"))
 
         assert sample_shipment.latitude == Decimal("4.70")
         assert sample_shipment.longitude == Decimal("-74.15")
         assert sample_shipment.geocoding_status == GeocodingStatus.SUCCESS
+        assert sample_shipment.geocoding_next_attempt_at is None
 
     def test_mark_geocoding_failed(self, sample_shipment):
         """Test marking geocoding as failed."""
         assert sample_shipment.geocoding_status == GeocodingStatus.PENDING
+        sample_shipment.geocoding_next_attempt_at = datetime(2025, 1, 15, 12, 5, 0)
 
         sample_shipment.mark_geocoding_failed()
 
         assert sample_shipment.geocoding_status == GeocodingStatus.FAILED
+        assert sample_shipment.geocoding_next_attempt_at is None
 
     def test_coordinates_property_with_values(self, geocoded_shipment):
         """Test coordinates property returns Coordinates object when values exist."""
@@ -361,3 +365,30 @@ class TestShipmentEdgeCases:
         sample_shipment.set_coordinates(Decimal("4.80"), Decimal("-74.20"))
         assert sample_shipment.geocoding_status == GeocodingStatus.SUCCESS
         assert sample_shipment.latitude == Decimal("4.80")
+
+    def test_schedule_geocoding_retry_backs_off_exponentially(self, sample_shipment):
+        """Test retry delays double with each failed attempt up to the cap."""
+        now = datetime(2025, 1, 15, 12, 0, 0)
+        base, cap = timedelta(seconds=30), timedelta(seconds=100)
+
+        delays = []
+        for _ in range(3):
+            assert sample_shipment.schedule_geocoding_retry(5, base, cap, now) is True
+            delays.append(sample_shipment.geocoding_next_attempt_at - now)
+
+        assert delays == [timedelta(seconds=30), timedelta(seconds=60), timedelta(seconds=100)]
+        assert sample_shipment.geocoding_attempts == 3
+        assert sample_shipment.geocoding_status == GeocodingStatus.PENDING
+
+    def test_schedule_geocoding_retry_gives_up_after_max_attempts(self, sample_shipment):
+        """Test the last allowed attempt marks geocoding as failed."""
+        now = datetime(2025, 1, 15, 12, 0, 0)
+        sample_shipment.geocoding_attempts = 2
+
+        scheduled = sample_shipment.schedule_geocoding_retry(
+            3, timedelta(seconds=30), timedelta(hours=1), now
+        )
+
+        assert scheduled is False
+        assert sample_shipment.geocoding_status == GeocodingStatus.FAILED
+        assert sample_shipment.geocoding_next_attempt_at is None
@@ -80,3 +80,28 @@ class TestVehicle:
         sample_vehicle.update(driver_name=None, driver_phone=None)
         assert sample_vehicle.driver_name == original_name
         assert sample_vehicle.driver_phone == original_phone
+
+    def test_create_vehicle_with_route_limits(self):
+        vehicle = Vehicle(
+            id=uuid4(),
+            placa="ABC-123",
+            driver_name="Juan Perez",
+            max_stops=40,
+            max_route_minutes=480,
+        )
+        assert vehicle.max_stops == 40
+        assert vehicle.max_route_minutes == 480
+
+    def test_create_vehicle_non_positive_limits_fail(self):
+        with pytest.raises(ValueError) as exc_info:
+            Vehicle(id=uuid4(), placa="ABC-123", driver_name="Juan Perez", max_stops=0)
+        assert "max_stops must be positive" in str(exc_info.value)
+
+        with pytest.raises(ValueError) as exc_info:
+            Vehicle(id=uuid4(), placa="ABC-123", driver_name="Juan Perez", max_route_minutes=-5)
+        assert "max_route_minutes must be positive" in str(exc_info.value)
+
+    def test_update_route_limits(self, sample_vehicle):
+        sample_vehicle.update(max_stops=25, max_route_minutes=360)
+        assert sample_vehicle.max_stops == 25
+        assert sample_vehicle.max_route_minutes == 360
@@ -0,0 +1,40 @@
+"""Inventory keyset indexes
+
+Revision ID: 3f9d7a2c5e14
+Revises: 8b2e4c6d1a90
+Create Date: 2025-11-28 09:44:10.281537
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9d7a2c5e14'
+down_revision: Union[str, Sequence[str], None] = '8b2e4c6d1a90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'idx_inventories_product_name_id',
+        'inventories',
+        ['product_name', 'id'],
+        unique=False,
+    )
+    op.create_index(
+        'idx_inventories_warehouse_product_name',
+        'inventories',
+        ['warehouse_id', 'product_name', 'id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_inventories_warehouse_product_name', table_name='inventories')
+    op.drop_index('idx_inventories_product_name_id', table_name='inventories')
@@ -0,0 +1,33 @@
+"""Report keyset index
+
+Revision ID: 8b2e4c6d1a90
+Revises: 616db0968775
+Create Date: 2025-11-26 10:06:52.114907
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b2e4c6d1a90'
+down_revision: Union[str, Sequence[str], None] = '616db0968775'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'idx_reports_user_created',
+        'inventory_reports',
+        ['user_id', 'created_at', 'id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_reports_user_created', table_name='inventory_reports')
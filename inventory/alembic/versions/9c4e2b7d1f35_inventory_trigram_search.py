@@ -0,0 +1,48 @@
+"""Inventory trigram search indexes
+
+Revision ID: 9c4e2b7d1f35
+Revises: 3f9d7a2c5e14
+Create Date: 2025-11-29 10:12:37.604218
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c4e2b7d1f35'
+down_revision: Union[str, Sequence[str], None] = '3f9d7a2c5e14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute("CREATE EXTENSION IF NOT EXISTS unaccent")
+    # unaccent() is only STABLE, so index expressions need an IMMUTABLE wrapper
+    # that pins the dictionary
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION f_unaccent(text) RETURNS text
+        LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT
+        AS $$ SELECT public.unaccent('public.unaccent'::regdictionary, $1) $$
+        """
+    )
+    op.execute(
+        "CREATE INDEX idx_inventories_product_name_trgm ON inventories "
+        "USING gin (f_unaccent(lower(product_name)) gin_trgm_ops)"
+    )
+    op.execute(
+        "CREATE INDEX idx_inventories_product_sku_trgm ON inventories "
+        "USING gin (lower(product_sku) gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_inventories_product_sku_trgm', table_name='inventories')
+    op.drop_index('idx_inventories_product_name_trgm', table_name='inventories')
+    op.execute("DROP FUNCTION IF EXISTS f_unaccent(text)")
@@ -0,0 +1,46 @@
+"""Report dedup
+
+Revision ID: d7e1a5c3b820
+Revises: 9c4e2b7d1f35
+Create Date: 2025-12-01 09:14:05.472381
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7e1a5c3b820'
+down_revision: Union[str, Sequence[str], None] = '9c4e2b7d1f35'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('inventory_reports', sa.Column('fingerprint', sa.String(length=64), nullable=True))
+    op.add_column('inventory_reports', sa.Column('source_report_id', sa.UUID(), nullable=True))
+    op.create_index(
+        'idx_reports_fingerprint',
+        'inventory_reports',
+        ['fingerprint', 'created_at'],
+        unique=False,
+    )
+    op.create_index(
+        'idx_reports_source',
+        'inventory_reports',
+        ['source_report_id'],
+        unique=False,
+    )
+    op.create_index('idx_inventories_updated_at', 'inventories', ['updated_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_inventories_updated_at', table_name='inventories')
+    op.drop_index('idx_reports_source', table_name='inventory_reports')
+    op.drop_index('idx_reports_fingerprint', table_name='inventory_reports')
+    op.drop_column('inventory_reports', 'source_report_id')
+    op.drop_column('inventory_reports', 'fingerprint')
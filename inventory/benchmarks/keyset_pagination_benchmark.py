@@ -0,0 +1,134 @@
+"""
+Benchmark: offset vs. keyset pagination of the inventory listing.
+
+Seeds an in-memory SQLite database with synthetic inventory rows and times
+``InventoryRepository.list_inventories`` at increasing depths, once with
+``offset`` and once with the keyset cursor (``after``) of the row just
+before that depth. Offset pages get slower the deeper they are because the
+database still reads every skipped row; keyset pages seek on the
+(product_name, id) index and stay flat. Counting is disabled for both so
+only the page query is timed.
+
+Usage (from the inventory directory):
+    python -m benchmarks.keyset_pagination_benchmark --rows 120000 --depths 0 10000 100000
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import List
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.adapters.output.repositories.inventory_repository import InventoryRepository
+from src.domain.value_objects import InventoryCursor
+from src.infrastructure.database.models import Base
+from src.infrastructure.database.models import Inventory as ORMInventory
+
+
+async def _seed(session: AsyncSession, rows: int, batch: int = 10000) -> None:
+    warehouses = [uuid.uuid4() for _ in range(10)]
+    expiration = datetime(2027, 1, 1, tzinfo=timezone.utc)
+    for start in range(0, rows, batch):
+        await session.execute(
+            insert(ORMInventory),
+            [
+                {
+                    "id": uuid.uuid4(),
+                    "product_id": uuid.uuid4(),
+                    "warehouse_id": warehouses[i % len(warehouses)],
+                    "total_quantity": 100,
+                    "reserved_quantity": 0,
+                    "batch_number": f"BATCH-{i}",
+                    "expiration_date": expiration,
+                    "product_sku": f"SKU-{i:07d}",
+                    "product_name": f"Product {i * 7919 % rows:07d}",
+                    "product_price": Decimal("10.00"),
+                    "product_category": "medicamentos_especiales",
+                    "warehouse_name": "Bodega",
+                    "warehouse_city": "Bogota",
+                    "warehouse_country": "Colombia",
+                }
+                for i in range(start, min(start + batch, rows))
+            ],
+        )
+    await session.commit()
+
+
+async def _cursor_before(session: AsyncSession, depth: int) -> InventoryCursor | None:
+    """Cursor of the row just before ``depth``, as the previous page would return."""
+    if depth == 0:
+        return None
+    row = (
+        await session.execute(
+            select(ORMInventory.product_name, ORMInventory.id)
+            .order_by(ORMInventory.product_name, ORMInventory.id)
+            .offset(depth - 1)
+            .limit(1)
+        )
+    ).one()
+    return InventoryCursor(product_name=row.product_name, id=row.id)
+
+
+async def _time(coro_factory, repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        await coro_factory()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _report(depth: int, offset_s: float, keyset_s: float) -> None:
+    print(
+        f"depth {depth:>8}   offset {offset_s * 1000:>8.2f} ms   "
+        f"keyset {keyset_s * 1000:>6.2f} ms   x{offset_s / keyset_s:>7.1f}"
+    )
+
+
+async def main(rows: int, depths: List[int], limit: int, repeats: int) -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with session_factory() as session:
+        print(f"Seeding {rows} inventory rows...")
+        await _seed(session, rows)
+        print(f"{rows} rows, page size {limit}, best of {repeats}\n")
+
+        repository = InventoryRepository(session)
+        for depth in depths:
+            if depth >= rows:
+                print(f"depth {depth:>8}   skipped (only {rows} rows)")
+                continue
+            after = await _cursor_before(session, depth)
+            offset_s = await _time(
+                lambda: repository.list_inventories(
+                    limit=limit, offset=depth, include_total=False
+                ),
+                repeats,
+            )
+            keyset_s = await _time(
+                lambda: repository.list_inventories(
+                    limit=limit, after=after, include_total=False
+                ),
+                repeats,
+            )
+            _report(depth, offset_s, keyset_s)
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=120000)
+    parser.add_argument("--depths", type=int, nargs="+", default=[0, 1000, 10000, 100000])
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.depths, args.limit, args.repeats))
@@ -15,21 +15,32 @@ from src.adapters.input.examples import (
     inventory_create_response_example,
 )
 from src.adapters.input.schemas import (
+    InventoryBatchRequest,
+    InventoryBatchResponse,
     InventoryCreate,
+    InventoryReservationsRequest,
+    InventoryReservationsResponse,
     InventoryReserveRequest,
     InventoryResponse,
+    InventorySearchResponse,
     PaginatedInventoriesResponse,
 )
 from src.application.use_cases.create_inventory import CreateInventoryUseCase
+from src.application.use_cases.get_inventories_batch import GetInventoriesBatchUseCase
 from src.application.use_cases.get_inventory import GetInventoryUseCase
 from src.application.use_cases.list_inventories import ListInventoriesUseCase
+from src.application.use_cases.reserve_inventories import ReserveInventoriesUseCase
+from src.application.use_cases.search_inventories import SearchInventoriesUseCase
 from src.application.use_cases.update_reserved_quantity import (
     UpdateReservedQuantityUseCase,
 )
 from src.infrastructure.dependencies import (
     get_create_inventory_use_case,
+    get_get_inventories_batch_use_case,
     get_get_inventory_use_case,
     get_list_inventories_use_case,
+    get_reserve_inventories_use_case,
+    get_search_inventories_use_case,
     get_update_reserved_quantity_use_case,
 )
 
@@ -85,11 +96,13 @@ async def list_inventories(
     sku: Optional[str] = Query(None),
     category: Optional[str] = Query(None),
     name: Optional[str] = Query(None),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    include_total: bool = Query(True, description="Count all matches (first page only)"),
     use_case: ListInventoriesUseCase = Depends(get_list_inventories_use_case),
 ):
     """List inventories with optional filters - THIN controller."""
     # Delegate to use case
-    inventories, total = await use_case.execute(
+    inventories, total, next_cursor = await use_case.execute(
         limit=limit,
         offset=offset,
         product_id=product_id,
@@ -97,11 +110,17 @@ async def list_inventories(
         sku=sku,
         category=category,
         name=name,
+        cursor=cursor,
+        include_total=include_total,
     )
 
+    # Without a total (cursor pages), has_next comes from the cursor
     page = (offset // limit) + 1
-    has_next = (offset + limit) < total
-    has_previous = offset > 0
+    if total is not None:
+        has_next = (offset + limit) < total
+    else:
+        has_next = next_cursor is not None
+    has_previous = offset > 0 or cursor is not None
 
     return PaginatedInventoriesResponse(
         items=[
@@ -113,6 +132,60 @@ async def list_inventories(
         size=len(inventories),
         has_next=has_next,
         has_previous=has_previous,
+        next_cursor=next_cursor if has_next else None,
+    )
+
+
+@router.get(
+    "/inventories/search",
+    response_model=InventorySearchResponse,
+    responses={
+        200: {"description": "Inventories matching the query, best match first"},
+        422: {"description": "Invalid query parameters", "model": ValidationErrorResponse},
+    },
+)
+async def search_inventories(
+    q: str = Query(..., min_length=3, max_length=100, description="Product name or SKU text"),
+    limit: int = Query(10, ge=1, le=50),
+    warehouse_id: Optional[UUID] = Query(None),
+    use_case: SearchInventoriesUseCase = Depends(get_search_inventories_use_case),
+):
+    """Search-as-you-type on product name or SKU - THIN controller.
+
+    Matching ignores case and accents and tolerates small typos.
+    """
+    inventories = await use_case.execute(query=q, limit=limit, warehouse_id=warehouse_id)
+    return InventorySearchResponse(
+        items=[
+            InventoryResponse.model_validate(inventory, from_attributes=True)
+            for inventory in inventories
+        ]
+    )
+
+
+@router.post(
+    "/inventories/batch",
+    response_model=InventoryBatchResponse,
+    responses={
+        200: {"description": "Inventories found, plus IDs that do not exist"},
+        422: {"description": "Invalid request data", "model": ValidationErrorResponse},
+    },
+)
+async def get_inventories_batch(
+    request: InventoryBatchRequest,
+    use_case: GetInventoriesBatchUseCase = Depends(get_get_inventories_batch_use_case),
+):
+    """Get several inventory entries by ID with a single query.
+
+    IDs are sent in the body so large orders do not hit URL length limits.
+    """
+    inventories, missing_ids = await use_case.execute(request.ids)
+    return InventoryBatchResponse(
+        items=[
+            InventoryResponse.model_validate(inventory, from_attributes=True)
+            for inventory in inventories
+        ],
+        missing_ids=missing_ids,
     )
 
 
@@ -180,3 +253,37 @@ async def update_reserved_quantity(
     """
     inventory = await use_case.execute(inventory_id, request.quantity_delta)
     return InventoryResponse.model_validate(inventory, from_attributes=True)
+
+
+@router.post(
+    "/reservations",
+    response_model=InventoryReservationsResponse,
+    responses={
+        200: {"description": "All reservations applied"},
+        404: {"description": "Inventory not found", "model": ValidationErrorResponse},
+        409: {
+            "description": "Insufficient inventory or invalid release",
+            "model": ValidationErrorResponse,
+        },
+        422: {"description": "Invalid request data", "model": ValidationErrorResponse},
+    },
+)
+async def reserve_inventories(
+    request: InventoryReservationsRequest,
+    use_case: ReserveInventoriesUseCase = Depends(get_reserve_inventories_use_case),
+):
+    """
+    Update reserved quantity on several inventories in one transaction.
+
+    - All-or-nothing: if any line fails, no reservation is applied
+    - Rows are locked in ID order so concurrent orders cannot deadlock
+    """
+    inventories = await use_case.execute(
+        (line.inventory_id, line.quantity_delta) for line in request.items
+    )
+    return InventoryReservationsResponse(
+        items=[
+            InventoryResponse.model_validate(inventory, from_attributes=True)
+            for inventory in inventories
+        ]
+    )
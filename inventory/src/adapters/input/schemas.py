@@ -3,7 +3,13 @@ from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 import pycountry
-from pydantic import BaseModel, computed_field, field_serializer, field_validator
+from pydantic import (
+    BaseModel,
+    Field,
+    computed_field,
+    field_serializer,
+    field_validator,
+)
 
 from .examples import inventory_create_example, warehouse_create_example
 
@@ -120,11 +126,16 @@ class InventoryResponse(BaseModel):
 
 class PaginatedInventoriesResponse(BaseModel):
     items: List[InventoryResponse]
-    total: int
+    total: Optional[int]  # None on cursor pages or when include_total=false
     page: int
     size: int
     has_next: bool
     has_previous: bool
+    next_cursor: Optional[str] = None  # Pass as ``cursor`` to continue after this page
+
+
+class InventorySearchResponse(BaseModel):
+    items: List[InventoryResponse]  # Best match first
 
 
 # Report schemas
@@ -170,6 +181,18 @@ class PaginatedReportsResponse(BaseModel):
     size: int
     has_next: bool
     has_previous: bool
+    next_cursor: Optional[str] = None  # Pass as ``cursor`` to continue after this page
+
+
+class ReportDedupMetricsResponse(BaseModel):
+    """Outcomes of report requests since the process started."""
+
+    requests: int
+    reused: int  # Served by a completed report's artifact
+    joined: int  # Waited on a report already being generated
+    generated: int
+    hit_rate: float
+    freshness_window_seconds: int
 
 
 class InventoryReserveRequest(BaseModel):
@@ -192,3 +215,61 @@ class InventoryReserveRequest(BaseModel):
         if v == 0:
             raise ValueError("quantity_delta cannot be zero")
         return v
+
+
+class InventoryBatchRequest(BaseModel):
+    """Request to fetch several inventories by ID."""
+
+    ids: List[UUID] = Field(..., min_length=1, max_length=500)
+
+
+class InventoryBatchResponse(BaseModel):
+    """Inventories found for a batch request, plus IDs that do not exist."""
+
+    items: List[InventoryResponse]
+    missing_ids: List[UUID]
+
+
+class ReservationLine(BaseModel):
+    """Single line of a batch reservation."""
+
+    inventory_id: UUID
+    quantity_delta: int
+
+    @field_validator("quantity_delta")
+    @classmethod
+    def validate_quantity_delta(cls, v: int) -> int:
+        if v == 0:
+            raise ValueError("quantity_delta cannot be zero")
+        return v
+
+
+class InventoryReservationsRequest(BaseModel):
+    """Request to update reserved quantity on several inventories atomically."""
+
+    items: List[ReservationLine] = Field(..., min_length=1, max_length=500)
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "items": [
+                        {
+                            "inventory_id": "550e8400-e29b-41d4-a716-446655440000",
+                            "quantity_delta": 10,
+                        },
+                        {
+                            "inventory_id": "660e8400-e29b-41d4-a716-446655440000",
+                            "quantity_delta": 3,
+                        },
+                    ]
+                }
+            ]
+        }
+    }
+
+
+class InventoryReservationsResponse(BaseModel):
+    """Inventories after a batch reservation."""
+
+    items: List[InventoryResponse]
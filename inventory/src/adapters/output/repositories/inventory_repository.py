@@ -1,8 +1,8 @@
 import logging
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import func, literal, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.ports.inventory_repository_port import InventoryRepositoryPort
@@ -12,11 +12,17 @@ from src.domain.exceptions import (
     InvalidReservationReleaseException,
     InventoryNotFoundException,
 )
+from src.domain.value_objects import InventoryCursor
 from src.infrastructure.database.models import Inventory as ORMInventory
 
 logger = logging.getLogger(__name__)
 
 
+def _search_key(column):
+    """Accent- and case-folded column, as indexed by the pg_trgm GIN indexes."""
+    return func.f_unaccent(func.lower(column))
+
+
 class InventoryRepository(InventoryRepositoryPort):
     """Implementation of InventoryRepositoryPort for PostgreSQL."""
 
@@ -55,6 +61,23 @@ class InventoryRepository(InventoryRepositoryPort):
             logger.error(f"DB: Find inventory by id failed: {e}")
             raise
 
+    async def find_by_ids(self, inventory_ids: List[UUID]) -> List[DomainInventory]:
+        """Find several inventories with a single IN query."""
+        logger.debug(f"DB: Finding inventories by ids: count={len(inventory_ids)}")
+        if not inventory_ids:
+            return []
+        try:
+            stmt = select(ORMInventory).where(ORMInventory.id.in_(set(inventory_ids)))
+            result = await self.session.execute(stmt)
+            orm_inventories = result.scalars().all()
+            logger.debug(
+                f"DB: Successfully found inventories: found={len(orm_inventories)}, requested={len(inventory_ids)}"
+            )
+            return [self._to_domain(i) for i in orm_inventories]
+        except Exception as e:
+            logger.error(f"DB: Find inventories by ids failed: {e}")
+            raise
+
     async def list_inventories(
         self,
         limit: int = 10,
@@ -64,8 +87,15 @@ class InventoryRepository(InventoryRepositoryPort):
         sku: Optional[str] = None,
         category: Optional[str] = None,
         name: Optional[str] = None,
-    ) -> Tuple[List[DomainInventory], int]:
-        """List inventories with pagination and filters, return domain entities."""
+        after: Optional[InventoryCursor] = None,
+        include_total: bool = True,
+    ) -> Tuple[List[DomainInventory], Optional[int]]:
+        """List inventories with pagination and filters, return domain entities.
+
+        Rows are ordered by (product_name, id). ``after`` seeks past a cursor
+        on that key instead of skipping rows; the count is skipped (total is
+        None) unless ``include_total``.
+        """
         logger.debug(
             f"DB: Listing inventories with limit={limit}, offset={offset}, product_id={product_id}, warehouse_id={warehouse_id}, sku={sku}, category={category}, name={name}"
         )
@@ -107,11 +137,27 @@ class InventoryRepository(InventoryRepositoryPort):
                 )
 
             # Get total count with filters
-            count_result = await self.session.execute(count_query)
-            total = count_result.scalar()
+            total = None
+            if include_total:
+                count_result = await self.session.execute(count_query)
+                total = count_result.scalar()
 
-            # Get paginated data with filters, ordered by product name
-            query = query.order_by(ORMInventory.product_name).limit(limit).offset(offset)
+            if after:
+                logger.debug(f"DB: Seeking past cursor: {after}")
+                # The leading range bound lets the index seek; the OR only
+                # breaks ties on product_name
+                query = query.where(
+                    ORMInventory.product_name >= after.product_name,
+                    or_(
+                        ORMInventory.product_name > after.product_name,
+                        ORMInventory.id > after.id,
+                    ),
+                )
+
+            # Get paginated data with filters, ordered by product name then id
+            query = query.order_by(ORMInventory.product_name, ORMInventory.id).limit(limit)
+            if not after:
+                query = query.offset(offset)
             result = await self.session.execute(query)
             orm_inventories = result.scalars().all()
 
@@ -123,6 +169,49 @@ class InventoryRepository(InventoryRepositoryPort):
             logger.error(f"DB: List inventories failed: {e}")
             raise
 
+    async def search_inventories(
+        self,
+        term: str,
+        limit: int = 10,
+        warehouse_id: Optional[UUID] = None,
+    ) -> List[DomainInventory]:
+        """Trigram search on product name and SKU, ranked by similarity.
+
+        Substring matches and close (typo) matches on the name both qualify;
+        the pg_trgm GIN indexes serve both, so no sequential scan is needed.
+        """
+        logger.debug(
+            f"DB: Searching inventories: term={term}, limit={limit}, warehouse_id={warehouse_id}"
+        )
+        try:
+            name_key = _search_key(ORMInventory.product_name)
+            sku_key = func.lower(ORMInventory.product_sku)
+            rank = func.greatest(
+                func.word_similarity(term, name_key), func.similarity(term, sku_key)
+            )
+
+            query = select(ORMInventory).where(
+                or_(
+                    name_key.contains(term, autoescape=True),
+                    sku_key.contains(term, autoescape=True),
+                    literal(term).op("<%")(name_key),
+                )
+            )
+            if warehouse_id:
+                query = query.where(ORMInventory.warehouse_id == warehouse_id)
+            query = query.order_by(
+                rank.desc(), ORMInventory.product_name, ORMInventory.id
+            ).limit(limit)
+
+            result = await self.session.execute(query)
+            orm_inventories = result.scalars().all()
+
+            logger.debug(f"DB: Inventory search found {len(orm_inventories)} results")
+            return [self._to_domain(i) for i in orm_inventories]
+        except Exception as e:
+            logger.error(f"DB: Search inventories failed: {e}")
+            raise
+
     async def update_reserved_quantity(
         self, inventory_id: UUID, quantity_delta: int
     ) -> DomainInventory:
@@ -174,6 +263,60 @@ class InventoryRepository(InventoryRepositoryPort):
             await self.session.rollback()
             raise
 
+    async def update_reserved_quantities(
+        self, quantity_deltas: Dict[UUID, int]
+    ) -> List[DomainInventory]:
+        """Update several reservations atomically, locking rows in ID order."""
+        logger.debug(
+            f"DB: Updating reserved quantities: lines={len(quantity_deltas)}"
+        )
+
+        try:
+            # SELECT FOR UPDATE ordered by id: every transaction acquires row
+            # locks in the same order, so concurrent batches cannot deadlock
+            stmt = (
+                select(ORMInventory)
+                .where(ORMInventory.id.in_(list(quantity_deltas)))
+                .order_by(ORMInventory.id)
+                .with_for_update()
+            )
+            result = await self.session.execute(stmt)
+            orm_inventories = {i.id: i for i in result.scalars().all()}
+
+            for inventory_id in sorted(quantity_deltas):
+                orm_inventory = orm_inventories.get(inventory_id)
+                if orm_inventory is None:
+                    raise InventoryNotFoundException(inventory_id)
+
+                # Apply business logic (validates constraints)
+                domain_inventory = self._to_domain(orm_inventory)
+                domain_inventory.adjust_reservation(quantity_deltas[inventory_id])
+                orm_inventory.reserved_quantity = domain_inventory.reserved_quantity
+
+            # Commit transaction (all lines or none)
+            await self.session.commit()
+
+            updated = []
+            for inventory_id in sorted(quantity_deltas):
+                orm_inventory = orm_inventories[inventory_id]
+                await self.session.refresh(orm_inventory)
+                updated.append(self._to_domain(orm_inventory))
+
+            logger.debug(f"DB: Successfully updated {len(updated)} reservations")
+            return updated
+
+        except (
+            InventoryNotFoundException,
+            InsufficientInventoryException,
+            InvalidReservationReleaseException,
+        ):
+            await self.session.rollback()
+            raise
+        except Exception as e:
+            logger.error(f"DB: Batch update failed: {e}")
+            await self.session.rollback()
+            raise
+
     @staticmethod
     def _to_domain(orm_inventory: ORMInventory) -> DomainInventory:
         """Map ORM model to domain entity."""
@@ -3,11 +3,13 @@ from datetime import datetime, timezone
 from typing import List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import and_, case, func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.ports.report_repository_port import ReportRepositoryPort
 from src.domain.entities.report import Report as DomainReport
+from src.domain.value_objects import ReportCursor
+from src.infrastructure.database.models.inventory import Inventory as ORMInventory
 from src.infrastructure.database.models.report import Report as ORMReport
 
 logger = logging.getLogger(__name__)
@@ -61,8 +63,13 @@ class ReportRepository(ReportRepositoryPort):
         offset: int = 0,
         status: Optional[str] = None,
         report_type: Optional[str] = None,
+        before: Optional[ReportCursor] = None,
     ) -> Tuple[List[DomainReport], int]:
-        """List reports with pagination and filters, return domain entities."""
+        """List reports with pagination and filters, return domain entities.
+
+        Reports are ordered by (created_at, id) DESC; ``before`` continues the
+        listing after that key without affecting the total count.
+        """
         logger.debug(
             f"DB: Listing reports with user_id={user_id}, limit={limit}, offset={offset}, "
             f"status={status}, report_type={report_type}"
@@ -89,8 +96,25 @@ class ReportRepository(ReportRepositoryPort):
             count_result = await self.session.execute(count_query)
             total = count_result.scalar()
 
-            # Get paginated data with filters, ordered by created_at DESC
-            query = query.order_by(ORMReport.created_at.desc()).limit(limit).offset(offset)
+            # Seek past the cursor instead of skipping; the count is unaffected
+            if before:
+                offset = 0
+                query = query.where(
+                    or_(
+                        ORMReport.created_at < before.created_at,
+                        and_(
+                            ORMReport.created_at == before.created_at,
+                            ORMReport.id < before.id,
+                        ),
+                    )
+                )
+
+            # Get paginated data with filters, ordered by created_at, id DESC
+            query = (
+                query.order_by(ORMReport.created_at.desc(), ORMReport.id.desc())
+                .limit(limit)
+                .offset(offset)
+            )
             result = await self.session.execute(query)
             orm_reports = result.scalars().all()
 
@@ -145,6 +169,101 @@ class ReportRepository(ReportRepositoryPort):
             logger.error(f"DB: Update report status failed: {e}")
             raise
 
+    async def find_reusable(
+        self, fingerprint: str, created_after: datetime
+    ) -> Optional[DomainReport]:
+        """Find a report another request with this fingerprint can share."""
+        logger.debug(f"DB: Finding reusable report: fingerprint={fingerprint}")
+        try:
+            stmt = (
+                select(ORMReport)
+                .where(
+                    ORMReport.fingerprint == fingerprint,
+                    ORMReport.created_at >= created_after,
+                    ORMReport.source_report_id.is_(None),
+                    ORMReport.status.in_(("pending", "processing", "completed")),
+                )
+                .order_by(
+                    case((ORMReport.status == "completed", 0), else_=1),
+                    ORMReport.created_at.desc(),
+                )
+                .limit(1)
+            )
+            result = await self.session.execute(stmt)
+            orm_report = result.scalars().first()
+            return self._to_domain(orm_report) if orm_report else None
+        except Exception as e:
+            logger.error(f"DB: Find reusable report failed: {e}")
+            raise
+
+    async def resolve_followers(
+        self,
+        source_report_id: UUID,
+        status: str,
+        s3_bucket: Optional[str] = None,
+        s3_key: Optional[str] = None,
+        error_message: Optional[str] = None,
+    ) -> List[DomainReport]:
+        """Finish the still-pending reports waiting on a source report."""
+        logger.debug(
+            f"DB: Resolving reports waiting on {source_report_id}: status={status}"
+        )
+        try:
+            values = {"status": status, "completed_at": datetime.now(timezone.utc)}
+            if status == "completed":
+                values.update(s3_bucket=s3_bucket, s3_key=s3_key)
+            else:
+                values.update(error_message=error_message)
+
+            # Conditional on the status, so concurrent callers split the rows
+            stmt = (
+                update(ORMReport)
+                .where(
+                    ORMReport.source_report_id == source_report_id,
+                    ORMReport.status.in_(("pending", "processing")),
+                )
+                .values(**values)
+                .returning(ORMReport)
+                .execution_options(synchronize_session=False)
+            )
+            result = await self.session.execute(stmt)
+            followers = [self._to_domain(r) for r in result.scalars().all()]
+            await self.session.commit()
+            logger.debug(f"DB: Resolved {len(followers)} report(s)")
+            return followers
+        except Exception as e:
+            logger.error(f"DB: Resolve followers failed: {e}")
+            raise
+
+    async def adopt_followers(self, stale_report_id: UUID, new_source_id: UUID) -> int:
+        """Move an unfinished stale report and its waiting reports onto a new source."""
+        logger.debug(f"DB: Moving reports from {stale_report_id} to {new_source_id}")
+        try:
+            stmt = (
+                update(ORMReport)
+                .where(
+                    or_(
+                        ORMReport.id == stale_report_id,
+                        ORMReport.source_report_id == stale_report_id,
+                    ),
+                    ORMReport.status.in_(("pending", "processing")),
+                )
+                .values(source_report_id=new_source_id)
+                .execution_options(synchronize_session=False)
+            )
+            result = await self.session.execute(stmt)
+            await self.session.commit()
+            logger.debug(f"DB: Moved {result.rowcount} report(s)")
+            return result.rowcount
+        except Exception as e:
+            logger.error(f"DB: Adopt followers failed: {e}")
+            raise
+
+    async def get_data_version(self) -> Optional[datetime]:
+        """Latest inventory change (an index seek on updated_at)."""
+        result = await self.session.execute(select(func.max(ORMInventory.updated_at)))
+        return result.scalar()
+
     @staticmethod
     def _to_domain(orm_report: ORMReport) -> DomainReport:
         """Map ORM model to domain entity."""
@@ -161,4 +280,6 @@ class ReportRepository(ReportRepositoryPort):
             error_message=orm_report.error_message,
             created_at=orm_report.created_at,
             completed_at=orm_report.completed_at,
+            fingerprint=orm_report.fingerprint,
+            source_report_id=orm_report.source_report_id,
         )
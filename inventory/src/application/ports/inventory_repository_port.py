@@ -1,10 +1,11 @@
 """Inventory repository port (interface)."""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 
 from src.domain.entities.inventory import Inventory
+from src.domain.value_objects import InventoryCursor
 
 
 class InventoryRepositoryPort(ABC):
@@ -28,7 +29,29 @@ class InventoryRepositoryPort(ABC):
         sku: Optional[str] = None,
         category: Optional[str] = None,
         name: Optional[str] = None,
-    ) -> Tuple[List[Inventory], int]: ...  # pragma: no cover
+        after: Optional[InventoryCursor] = None,
+        include_total: bool = True,
+    ) -> Tuple[List[Inventory], Optional[int]]: ...  # pragma: no cover
+
+    @abstractmethod
+    async def search_inventories(
+        self,
+        term: str,
+        limit: int = 10,
+        warehouse_id: Optional[UUID] = None,
+    ) -> List[Inventory]:
+        """
+        Find inventories whose product name or SKU matches a search term.
+
+        Args:
+            term: Lowercase, accent-free search text
+            limit: Maximum number of results
+            warehouse_id: Optional warehouse to search in
+
+        Returns:
+            Matching inventories, best match first
+        """
+        ...  # pragma: no cover
 
     @abstractmethod
     async def update_reserved_quantity(
@@ -50,3 +73,39 @@ class InventoryRepositoryPort(ABC):
             InvalidReservationReleaseException: If trying to release more than reserved
         """
         ...  # pragma: no cover
+
+    @abstractmethod
+    async def find_by_ids(self, inventory_ids: List[UUID]) -> List[Inventory]:
+        """
+        Find several inventories with a single query.
+
+        Args:
+            inventory_ids: IDs of inventories to fetch
+
+        Returns:
+            Inventories that exist (missing IDs are simply absent)
+        """
+        ...  # pragma: no cover
+
+    @abstractmethod
+    async def update_reserved_quantities(
+        self, quantity_deltas: Dict[UUID, int]
+    ) -> List[Inventory]:
+        """
+        Update reserved quantity on several inventories in one transaction.
+
+        Rows are locked in ascending ID order so concurrent batches cannot
+        deadlock. Either every delta is applied or none is.
+
+        Args:
+            quantity_deltas: Mapping of inventory ID to reservation delta
+
+        Returns:
+            Updated inventory domain entities, ordered by ID
+
+        Raises:
+            InventoryNotFoundException: If any inventory doesn't exist
+            InsufficientInventoryException: If any line lacks available quantity
+            InvalidReservationReleaseException: If any line releases more than reserved
+        """
+        ...  # pragma: no cover
@@ -1,9 +1,11 @@
 """Report repository port (interface)."""
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import List, Optional, Tuple
 from uuid import UUID
 
 from src.domain.entities.report import Report
+from src.domain.value_objects import ReportCursor
 
 
 class ReportRepositoryPort(ABC):
@@ -25,7 +27,12 @@ class ReportRepositoryPort(ABC):
         offset: int = 0,
         status: Optional[str] = None,
         report_type: Optional[str] = None,
+        before: Optional[ReportCursor] = None,
     ) -> Tuple[List[Report], int]:
+        """Reports ordered by (created_at, id) DESC, starting after ``before`` if given.
+
+        The total count ignores ``before``.
+        """
         ...  # pragma: no cover
 
     @abstractmethod
@@ -38,3 +45,40 @@ class ReportRepositoryPort(ABC):
         error_message: Optional[str] = None,
     ) -> Optional[Report]:
         ...  # pragma: no cover
+
+    @abstractmethod
+    async def find_reusable(
+        self, fingerprint: str, created_after: datetime
+    ) -> Optional[Report]:
+        """Newest completed report with this fingerprint created after
+        ``created_after``, else the newest pending/processing one.
+
+        Reports that share another report's artifact are never returned.
+        """
+        ...  # pragma: no cover
+
+    @abstractmethod
+    async def resolve_followers(
+        self,
+        source_report_id: UUID,
+        status: str,
+        s3_bucket: Optional[str] = None,
+        s3_key: Optional[str] = None,
+        error_message: Optional[str] = None,
+    ) -> List[Report]:
+        """Move the pending/processing reports sharing ``source_report_id`` to
+        ``status`` and return them; each report is resolved at most once.
+        """
+        ...  # pragma: no cover
+
+    @abstractmethod
+    async def adopt_followers(self, stale_report_id: UUID, new_source_id: UUID) -> int:
+        """Point the unfinished stale report and the reports waiting on it at
+        ``new_source_id``, whose job then resolves them; returns how many moved.
+        """
+        ...  # pragma: no cover
+
+    @abstractmethod
+    async def get_data_version(self) -> Optional[datetime]:
+        """Latest inventory change, or None if there is no inventory."""
+        ...  # pragma: no cover
@@ -2,12 +2,19 @@
 
 import logging
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, Optional
 from uuid import UUID
 
 from src.application.ports.report_repository_port import ReportRepositoryPort
 from src.domain.entities.report import Report
+from src.domain.services.report_dedup import (
+    GENERATED,
+    JOINED,
+    REUSED,
+    ReportDedupMetrics,
+    report_fingerprint,
+)
 from src.domain.value_objects import ReportStatus, ReportType
 
 logger = logging.getLogger(__name__)
@@ -25,10 +32,29 @@ class CreateReportInput:
 
 
 class CreateReportUseCase:
-    """Use case for creating a new report request."""
-
-    def __init__(self, report_repository: ReportRepositoryPort):
+    """Use case for creating a new report request.
+
+    With a freshness window, a request matching a report created within the
+    window (same fingerprint) does not start a new job: it reuses that
+    report's artifact if it is completed, or waits on it if it is still
+    being generated.
+
+    A match still unfinished ``stale_after`` after it was created is presumed
+    dead: the new report is generated instead and takes over the stale one
+    and the reports waiting on it.
+    """
+
+    def __init__(
+        self,
+        report_repository: ReportRepositoryPort,
+        freshness_window: timedelta = timedelta(0),
+        metrics: Optional[ReportDedupMetrics] = None,
+        stale_after: timedelta = timedelta(minutes=15),
+    ):
         self.report_repository = report_repository
+        self.freshness_window = freshness_window
+        self.metrics = metrics
+        self.stale_after = stale_after
         logger.debug("Initialized CreateReportUseCase")
 
     async def execute(self, input_data: CreateReportInput) -> Report:
@@ -39,7 +65,8 @@ class CreateReportUseCase:
             input_data: Report creation data
 
         Returns:
-            Created report entity with PENDING status
+            Created report entity with PENDING status, or COMPLETED when an
+            existing artifact is reused
 
         Raises:
             ValueError: If end_date is before start_date
@@ -67,8 +94,60 @@ class CreateReportUseCase:
             "filters": input_data.filters or {},
         }
 
+        outcome = GENERATED
+        stale_source = None
+        if self.freshness_window > timedelta(0):
+            fingerprint = report_fingerprint(
+                report_type=input_data.report_type.value,
+                start_date=input_data.start_date,
+                end_date=input_data.end_date,
+                filters=input_data.filters,
+                data_version=await self.report_repository.get_data_version(),
+            )
+            source = await self.report_repository.find_reusable(
+                fingerprint,
+                created_after=datetime.now(timezone.utc) - self.freshness_window,
+            )
+            report_data["fingerprint"] = fingerprint
+            if source is not None and self._is_stale(source):
+                logger.warning(
+                    f"Report {source.id} is {source.status} since {source.created_at}; "
+                    f"generating instead of joining it"
+                )
+                stale_source, source = source, None
+            if source is not None:
+                report_data["source_report_id"] = source.id
+                if source.status == ReportStatus.COMPLETED.value:
+                    report_data.update(
+                        status=ReportStatus.COMPLETED.value,
+                        s3_bucket=source.s3_bucket,
+                        s3_key=source.s3_key,
+                        completed_at=datetime.now(timezone.utc),
+                    )
+                    outcome = REUSED
+                else:
+                    outcome = JOINED
+                logger.info(
+                    f"Report request matches report {source.id} ({source.status}): {outcome}"
+                )
+
+        if self.metrics:
+            self.metrics.record(outcome)
+
         # Save to repository
         report = await self.report_repository.create(report_data)
+        if stale_source is not None:
+            await self.report_repository.adopt_followers(stale_source.id, report.id)
         logger.info(f"Report created successfully: report_id={report.id}")
 
         return report
+
+    def _is_stale(self, source: Report) -> bool:
+        """Whether an unfinished match has outlived ``stale_after``."""
+        unfinished = (ReportStatus.PENDING.value, ReportStatus.PROCESSING.value)
+        if source.status not in unfinished:
+            return False
+        created_at = source.created_at
+        if created_at.tzinfo is None:
+            created_at = created_at.replace(tzinfo=timezone.utc)
+        return datetime.now(timezone.utc) - created_at >= self.stale_after
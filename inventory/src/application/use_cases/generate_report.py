@@ -1,6 +1,7 @@
 """Use case for generating report asynchronously."""
 
 import logging
+from typing import AsyncIterator
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -43,16 +44,25 @@ class GenerateReportUseCase:
             1. Load report from database
             2. Update status to PROCESSING
             3. Generate report data based on report_type
-            4. Upload report to S3
+            4. Upload report to S3 (multipart, while it is generated)
             5. Update status to COMPLETED with S3 info
             6. Publish SQS notification (fire-and-forget)
+            7. Resolve the reports that joined this one while it was generated
+
+        A report that shares another report's artifact skips steps 2-6; it is
+        resolved here if its source already finished, else by the source's
+        step 7. Its row is committed when it is created, so a source that
+        finishes concurrently always sees it.
 
         Exception handling:
             - On any error: Update status to FAILED with error message
             - Publish failure notification to SQS (fire-and-forget)
+            - Step 7 runs after the report is settled; its errors are only
+              logged, so they never fail a completed report
         """
         logger.info(f"Starting report generation: report_id={report_id}")
 
+        finished = None
         try:
             # Step 1: Load report (no user_id filtering for internal background task)
             # We need to get the report first to know the user_id
@@ -67,22 +77,21 @@ class GenerateReportUseCase:
                 f"user_id={report.user_id}"
             )
 
+            if report.source_report_id and await self._follow(report):
+                return
+
             # Step 2: Update status to PROCESSING
             await self.report_repository.update_status(
                 report_id=report.id, status=ReportStatus.PROCESSING.value
             )
             logger.info(f"Report status updated to PROCESSING: report_id={report.id}")
 
-            # Step 3: Generate report data based on report_type
-            report_data = await self._generate_report_data(report)
-            logger.debug(f"Report data generated: report_id={report.id}")
-
-            # Step 4: Upload to S3
-            s3_key = await self.s3_service.upload_report(
+            # Steps 3-4: Generate report data and stream it to S3 as it is produced
+            s3_key = await self.s3_service.upload_report_stream(
                 report_id=report.id,
                 user_id=report.user_id,
                 report_type=report.report_type,
-                data=report_data,
+                chunks=self._stream_report_data(report),
             )
             logger.info(
                 f"Report uploaded to S3: report_id={report.id}, "
@@ -111,6 +120,11 @@ class GenerateReportUseCase:
                 f"Report generation completed successfully: report_id={report.id}"
             )
 
+            report.status = ReportStatus.COMPLETED.value
+            report.s3_bucket = self.s3_service.bucket_name
+            report.s3_key = s3_key
+            finished = report
+
         except Exception as e:
             logger.error(
                 f"Report generation failed: report_id={report_id}, error={str(e)}",
@@ -136,6 +150,7 @@ class GenerateReportUseCase:
                         report_type=failed_report.report_type,
                         error_message=str(e),
                     )
+                    finished = failed_report
             except Exception as update_error:
                 logger.error(
                     f"Failed to update report status to FAILED: "
@@ -143,6 +158,16 @@ class GenerateReportUseCase:
                     exc_info=True,
                 )
 
+        # Step 7: Resolve the reports waiting on this one
+        if finished is not None:
+            try:
+                await self._resolve_followers(finished)
+            except Exception as e:
+                logger.error(
+                    f"Failed to resolve reports waiting on report_id={report_id}: {e}",
+                    exc_info=True,
+                )
+
     async def _load_report(self, report_id: UUID):
         """Load report without user_id filter (internal use)."""
         # We need to query directly since repository methods require user_id
@@ -173,13 +198,88 @@ class GenerateReportUseCase:
             error_message=orm_report.error_message,
             created_at=orm_report.created_at,
             completed_at=orm_report.completed_at,
+            fingerprint=orm_report.fingerprint,
+            source_report_id=orm_report.source_report_id,
         )
 
-    async def _generate_report_data(self, report):
-        """Generate report data based on report_type."""
+    async def _follow(self, report) -> bool:
+        """
+        Handle a report that shares another report's artifact.
+
+        Returns:
+            False if the source report is gone and this one must be generated
+        """
+        if report.status == ReportStatus.COMPLETED.value:
+            await self.sqs_publisher.publish_report_generated(
+                report_id=report.id,
+                user_id=report.user_id,
+                report_type=report.report_type,
+                status=ReportStatus.COMPLETED.value,
+                s3_bucket=report.s3_bucket,
+                s3_key=report.s3_key,
+            )
+            logger.info(
+                f"Report reuses an existing artifact: report_id={report.id}, "
+                f"source_report_id={report.source_report_id}"
+            )
+            return True
+
+        source = await self._load_report(report.source_report_id)
+        if source is None:
+            logger.warning(
+                f"Source report not found, generating: report_id={report.id}, "
+                f"source_report_id={report.source_report_id}"
+            )
+            return False
+
+        if source.status in (ReportStatus.COMPLETED.value, ReportStatus.FAILED.value):
+            await self._resolve_followers(source)
+        else:
+            logger.info(f"Report waits on report_id={source.id}: report_id={report.id}")
+        return True
+
+    async def _resolve_followers(self, source) -> None:
+        """Complete or fail the reports waiting on ``source`` and notify their users."""
+        completed = source.status == ReportStatus.COMPLETED.value
+        if completed:
+            followers = await self.report_repository.resolve_followers(
+                source.id,
+                ReportStatus.COMPLETED.value,
+                s3_bucket=source.s3_bucket,
+                s3_key=source.s3_key,
+            )
+        else:
+            followers = await self.report_repository.resolve_followers(
+                source.id, ReportStatus.FAILED.value, error_message=source.error_message
+            )
+
+        for follower in followers:
+            if completed:
+                await self.sqs_publisher.publish_report_generated(
+                    report_id=follower.id,
+                    user_id=follower.user_id,
+                    report_type=follower.report_type,
+                    status=ReportStatus.COMPLETED.value,
+                    s3_bucket=source.s3_bucket,
+                    s3_key=source.s3_key,
+                )
+            else:
+                await self.sqs_publisher.publish_report_failed(
+                    report_id=follower.id,
+                    user_id=follower.user_id,
+                    report_type=follower.report_type,
+                    error_message=source.error_message,
+                )
+        if followers:
+            logger.info(
+                f"Resolved {len(followers)} report(s) waiting on report_id={source.id}"
+            )
+
+    def _stream_report_data(self, report) -> AsyncIterator[bytes]:
+        """Report body chunks based on report_type; fails fast on unknown types."""
         if report.report_type == ReportType.LOW_STOCK.value:
             generator = LowStockReportGenerator(self.db_session)
-            return await generator.generate(
+            return generator.stream(
                 start_date=report.start_date,
                 end_date=report.end_date,
                 filters=report.filters,
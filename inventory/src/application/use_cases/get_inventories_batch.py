@@ -0,0 +1,46 @@
+"""Use case for retrieving several inventory entries in one call."""
+import logging
+from typing import List, Tuple
+from uuid import UUID
+
+from src.application.ports.inventory_repository_port import InventoryRepositoryPort
+from src.domain.entities.inventory import Inventory
+
+logger = logging.getLogger(__name__)
+
+
+class GetInventoriesBatchUseCase:
+    """Use case for fetching many inventory entries with a single query.
+
+    Used by the Order Service to validate every line of an order in one
+    round trip instead of one GET per item.
+    """
+
+    def __init__(self, repository: InventoryRepositoryPort):
+        self.repository = repository
+
+    async def execute(
+        self, inventory_ids: List[UUID]
+    ) -> Tuple[List[Inventory], List[UUID]]:
+        """Get inventory entries by ID.
+
+        Args:
+            inventory_ids: UUIDs of the inventory entries
+
+        Returns:
+            Tuple of (found inventories in request order, missing IDs)
+        """
+        unique_ids = list(dict.fromkeys(inventory_ids))
+        logger.info(f"Fetching inventories batch: count={len(unique_ids)}")
+
+        found = {
+            inventory.id: inventory
+            for inventory in await self.repository.find_by_ids(unique_ids)
+        }
+        inventories = [found[i] for i in unique_ids if i in found]
+        missing_ids = [i for i in unique_ids if i not in found]
+
+        if missing_ids:
+            logger.warning(f"Inventories not found: {missing_ids}")
+
+        return inventories, missing_ids
@@ -4,12 +4,18 @@ from uuid import UUID
 
 from src.application.ports.inventory_repository_port import InventoryRepositoryPort
 from src.domain.entities.inventory import Inventory
+from src.domain.value_objects import InventoryCursor
 
 logger = logging.getLogger(__name__)
 
 
 class ListInventoriesUseCase:
-    """Use case for listing inventories with pagination and filters."""
+    """Use case for listing inventories with pagination and filters.
+
+    A cursor from a previous page continues the listing by keyset on
+    (product_name, id) instead of offset; the total is only counted for the
+    first page.
+    """
 
     def __init__(self, repository: InventoryRepositoryPort):
         self.repository = repository
@@ -23,11 +29,17 @@ class ListInventoriesUseCase:
         sku: Optional[str] = None,
         category: Optional[str] = None,
         name: Optional[str] = None,
-    ) -> Tuple[List[Inventory], int]:
-        """List inventories with pagination and filters."""
-        logger.info(f"Listing inventories: limit={limit}, offset={offset}, product_id={product_id}, warehouse_id={warehouse_id}, sku={sku}, category={category}, name={name}")
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+    ) -> Tuple[List[Inventory], Optional[int], Optional[str]]:
+        """List inventories with pagination and filters.
+
+        Returns (inventories, total or None, next cursor or None).
+        """
+        logger.info(f"Listing inventories: limit={limit}, offset={offset}, product_id={product_id}, warehouse_id={warehouse_id}, sku={sku}, category={category}, name={name}, cursor={cursor}")
         logger.debug(f"Fetching inventories with filters and pagination")
 
+        after = InventoryCursor.decode(cursor) if cursor else None
         inventories, total = await self.repository.list_inventories(
             limit=limit,
             offset=offset,
@@ -36,8 +48,16 @@ class ListInventoriesUseCase:
             sku=sku,
             category=category,
             name=name,
+            after=after,
+            include_total=include_total and after is None,
         )
 
+        # A full page may have more after it; a short page is the last one
+        next_cursor = None
+        if inventories and len(inventories) == limit:
+            last = inventories[-1]
+            next_cursor = InventoryCursor(product_name=last.product_name, id=last.id).encode()
+
         logger.info(f"Inventories retrieved successfully: count={len(inventories)}, total={total}")
         logger.debug(f"Retrieved inventory IDs: {[str(i.id) for i in inventories]}")
-        return inventories, total
+        return inventories, total, next_cursor
@@ -7,6 +7,7 @@ from uuid import UUID
 
 from src.application.ports.report_repository_port import ReportRepositoryPort
 from src.domain.entities.report import Report
+from src.domain.value_objects import ReportCursor
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +21,7 @@ class ListReportsInput:
     offset: int = 0
     status: Optional[str] = None
     report_type: Optional[str] = None
+    cursor: Optional[str] = None
 
 
 @dataclass
@@ -30,6 +32,7 @@ class ListReportsOutput:
     total: int
     limit: int
     offset: int
+    next_cursor: Optional[str] = None
 
 
 class ListReportsUseCase:
@@ -55,13 +58,18 @@ class ListReportsUseCase:
             f"status={input_data.status}, report_type={input_data.report_type}"
         )
 
+        before = ReportCursor.decode(input_data.cursor) if input_data.cursor else None
+        # The cursor marks the position; an offset on top would skip reports
+        offset = 0 if before else input_data.offset
+
         # Retrieve reports from repository
         reports, total = await self.report_repository.list_reports(
             user_id=input_data.user_id,
             limit=input_data.limit,
-            offset=input_data.offset,
+            offset=offset,
             status=input_data.status,
             report_type=input_data.report_type,
+            before=before,
         )
 
         logger.info(
@@ -69,9 +77,16 @@ class ListReportsUseCase:
             f"count={len(reports)}, total={total}"
         )
 
+        # A full page may have more after it; a short page is the last one
+        next_cursor = None
+        if reports and len(reports) == input_data.limit:
+            last = reports[-1]
+            next_cursor = ReportCursor(created_at=last.created_at, id=last.id).encode()
+
         return ListReportsOutput(
             reports=reports,
             total=total,
             limit=input_data.limit,
-            offset=input_data.offset,
+            offset=offset,
+            next_cursor=next_cursor,
         )
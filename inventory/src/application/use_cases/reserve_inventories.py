@@ -0,0 +1,49 @@
+"""Use case for reserving several inventory lines in one transaction."""
+
+import logging
+from typing import Dict, Iterable, List, Tuple
+from uuid import UUID
+
+from src.application.ports.inventory_repository_port import InventoryRepositoryPort
+from src.domain.entities.inventory import Inventory
+
+logger = logging.getLogger(__name__)
+
+
+class ReserveInventoriesUseCase:
+    """Use case for updating reserved quantity on many inventories at once."""
+
+    def __init__(self, repository: InventoryRepositoryPort):
+        self.repository = repository
+
+    async def execute(self, lines: Iterable[Tuple[UUID, int]]) -> List[Inventory]:
+        """
+        Apply every reservation delta, all-or-nothing.
+
+        Lines for the same inventory are summed before being applied.
+
+        Args:
+            lines: (inventory_id, quantity_delta) pairs
+
+        Returns:
+            Updated inventory domain entities
+        """
+        quantity_deltas: Dict[UUID, int] = {}
+        for inventory_id, quantity_delta in lines:
+            quantity_deltas[inventory_id] = (
+                quantity_deltas.get(inventory_id, 0) + quantity_delta
+            )
+
+        # Lines that cancel each other out need no row lock
+        quantity_deltas = {k: v for k, v in quantity_deltas.items() if v != 0}
+
+        logger.info(f"UC: Reserving inventories batch: lines={len(quantity_deltas)}")
+
+        if not quantity_deltas:
+            return []
+
+        inventories = await self.repository.update_reserved_quantities(quantity_deltas)
+
+        logger.info(f"UC: Successfully reserved {len(inventories)} inventories")
+
+        return inventories
@@ -0,0 +1,55 @@
+"""Use case for search-as-you-type over inventory product names and SKUs."""
+import logging
+import unicodedata
+from typing import List, Optional
+from uuid import UUID
+
+from src.application.ports.inventory_repository_port import InventoryRepositoryPort
+from src.domain.entities.inventory import Inventory
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_search_term(text: str) -> str:
+    """Fold case, accents and whitespace ("  Acetaminofén " -> "acetaminofen").
+
+    Mirrors the ``f_unaccent(lower(...))`` expression the name indexes are
+    built on, so "jeringa" finds "Jeringa" and "algodon" finds "Algodón".
+    """
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(stripped.lower().split())
+
+
+class SearchInventoriesUseCase:
+    """Use case for ranked substring search on product name or SKU."""
+
+    def __init__(self, repository: InventoryRepositoryPort):
+        self.repository = repository
+
+    async def execute(
+        self,
+        query: str,
+        limit: int = 10,
+        warehouse_id: Optional[UUID] = None,
+    ) -> List[Inventory]:
+        """Search inventories, best match first.
+
+        Args:
+            query: Text typed by the user
+            limit: Maximum number of results
+            warehouse_id: Optional warehouse to search in
+
+        Returns:
+            Matching inventories; empty when the query has no searchable text
+        """
+        term = normalize_search_term(query)
+        logger.info(f"Searching inventories: term={term}, limit={limit}, warehouse_id={warehouse_id}")
+        if not term:
+            return []
+
+        inventories = await self.repository.search_inventories(
+            term=term, limit=limit, warehouse_id=warehouse_id
+        )
+        logger.info(f"Inventory search returned {len(inventories)} results")
+        return inventories
@@ -21,3 +21,5 @@ class Report:
     error_message: Optional[str]
     created_at: datetime
     completed_at: Optional[datetime]
+    fingerprint: Optional[str] = None  # Identifies identical requests
+    source_report_id: Optional[UUID] = None  # Report whose artifact this one shares
@@ -0,0 +1,84 @@
+"""Report deduplication: request fingerprints and reuse counters."""
+
+import hashlib
+import json
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+# Outcomes of a report request
+REUSED = "reused"  # A completed report's artifact was reused
+JOINED = "joined"  # The request joined a report still being generated
+GENERATED = "generated"  # A new report is generated
+
+
+def _normalize_datetime(value: datetime) -> str:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).isoformat()
+
+
+def _normalize_filter_value(value: Any) -> Any:
+    # IDs may arrive in any case; the generators parse them with UUID()
+    if isinstance(value, str):
+        try:
+            return str(UUID(value))
+        except ValueError:
+            return value.strip()
+    return value
+
+
+def report_fingerprint(
+    report_type: str,
+    start_date: datetime,
+    end_date: datetime,
+    filters: Optional[Dict[str, Any]],
+    data_version: Optional[datetime],
+) -> str:
+    """
+    Identify the data a report request would produce.
+
+    Two requests share a fingerprint when they have the same type, the same
+    date range (compared in UTC), the same filters (ignoring key order and
+    empty values) and were made at the same source data version.
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    canonical = {
+        "report_type": report_type,
+        "start_date": _normalize_datetime(start_date),
+        "end_date": _normalize_datetime(end_date),
+        "filters": {
+            key: _normalize_filter_value(value)
+            for key, value in (filters or {}).items()
+            if value is not None
+        },
+        "data_version": _normalize_datetime(data_version) if data_version else None,
+    }
+    encoded = json.dumps(canonical, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class ReportDedupMetrics:
+    """Process-wide counters of report request outcomes."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = {REUSED: 0, JOINED: 0, GENERATED: 0}
+
+    def record(self, outcome: str) -> None:
+        with self._lock:
+            self._counts[outcome] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            counts = dict(self._counts)
+        requests = sum(counts.values())
+        hits = counts[REUSED] + counts[JOINED]
+        return {
+            "requests": requests,
+            **counts,
+            "hit_rate": round(hits / requests, 4) if requests else 0.0,
+        }
@@ -1,8 +1,9 @@
 """Report generator for low stock inventory report."""
 
+import json
 import logging
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, Optional
 from uuid import UUID
 
 from sqlalchemy import and_, select
@@ -14,6 +15,45 @@ logger = logging.getLogger(__name__)
 
 DEFAULT_LOW_STOCK_THRESHOLD = 10
 
+# Rows fetched per round trip from the server-side cursor; each batch is
+# serialized into one chunk of the report body
+STREAM_BATCH_SIZE = 1000
+
+
+class _LowStockSummary:
+    """Summary statistics accumulated in the same pass that writes the rows."""
+
+    def __init__(self):
+        self.total_items = 0
+        self.total_available = 0
+        self.critical_items = 0
+        self.warehouses: Dict[str, Dict[str, Any]] = {}
+
+    def add(self, item: Dict[str, Any]) -> None:
+        self.total_items += 1
+        self.total_available += item["available_quantity"]
+        if item["available_quantity"] <= 0:
+            self.critical_items += 1
+
+        wh_id = item["warehouse_id"]
+        if wh_id not in self.warehouses:
+            self.warehouses[wh_id] = {
+                "warehouse_id": wh_id,
+                "warehouse_name": item["warehouse_name"],
+                "warehouse_city": item["warehouse_city"],
+                "low_stock_items": 0,
+            }
+        self.warehouses[wh_id]["low_stock_items"] += 1
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "total_low_stock_items": self.total_items,
+            "total_available_quantity": self.total_available,
+            "critical_items": self.critical_items,  # Items with 0 or negative available
+            "affected_warehouses": len(self.warehouses),
+            "warehouses": list(self.warehouses.values()),
+        }
+
 
 class LowStockReportGenerator:
     """Generate low stock inventory report."""
@@ -31,6 +71,9 @@ class LowStockReportGenerator:
         """
         Generate low stock report showing inventory items below threshold.
 
+        Collects the output of ``stream`` into a dictionary, so the whole
+        report is held in memory; report jobs upload ``stream`` directly.
+
         Args:
             start_date: Start date for report (not used for low_stock, but kept for consistency)
             end_date: End date for report (not used for low_stock, but kept for consistency)
@@ -41,6 +84,31 @@ class LowStockReportGenerator:
         Returns:
             Report data as dictionary with low stock items
         """
+        body = b"".join([chunk async for chunk in self.stream(start_date, end_date, filters)])
+        return json.loads(body)
+
+    async def stream(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Generate the low stock report as a stream of UTF-8 JSON chunks.
+
+        The chunks concatenate to the same document ``generate`` returns.
+        Rows come from a server-side cursor in batches of
+        ``STREAM_BATCH_SIZE`` and the summary is accumulated while they are
+        written, so memory use does not grow with the number of rows.
+
+        Args:
+            start_date: Start date for report (not used for low_stock, but kept for consistency)
+            end_date: End date for report (not used for low_stock, but kept for consistency)
+            filters: Same filters as ``generate``
+
+        Yields:
+            Consecutive pieces of the JSON report body
+        """
         logger.info("Generating low_stock report")
 
         filters = filters or {}
@@ -51,9 +119,8 @@ class LowStockReportGenerator:
 
         # Build query filters
         # Low stock = available quantity (total - reserved) is below threshold
-        query_filters = [
-            (InventoryModel.total_quantity - InventoryModel.reserved_quantity) < threshold
-        ]
+        available = InventoryModel.total_quantity - InventoryModel.reserved_quantity
+        query_filters = [available < threshold]
 
         # Apply optional warehouse filter
         if warehouse_id:
@@ -63,85 +130,76 @@ class LowStockReportGenerator:
             except ValueError:
                 logger.warning(f"Invalid warehouse_id format: {warehouse_id}, skipping filter")
 
-        # Query for low stock items
+        # Query for low stock items; plain columns, so no ORM objects pile up
         stmt = (
-            select(InventoryModel)
-            .where(and_(*query_filters))
-            .order_by(
-                (InventoryModel.total_quantity - InventoryModel.reserved_quantity).asc()
+            select(
+                InventoryModel.id,
+                InventoryModel.product_id,
+                InventoryModel.product_sku,
+                InventoryModel.product_name,
+                InventoryModel.warehouse_id,
+                InventoryModel.warehouse_name,
+                InventoryModel.warehouse_city,
+                InventoryModel.total_quantity,
+                InventoryModel.reserved_quantity,
+                InventoryModel.batch_number,
+                InventoryModel.expiration_date,
+                InventoryModel.product_price,
             )
+            .where(and_(*query_filters))
+            .order_by(available.asc())
+            .execution_options(yield_per=STREAM_BATCH_SIZE)
         )
 
-        result = await self.session.execute(stmt)
-        inventory_items = result.scalars().all()
-
-        logger.info(f"Found {len(inventory_items)} low stock items")
-
-        # Format data
-        data = []
-        for item in inventory_items:
-            available_quantity = item.total_quantity - item.reserved_quantity
-            data.append(
-                {
-                    "inventory_id": str(item.id),
-                    "product_id": str(item.product_id),
-                    "product_sku": item.product_sku,
-                    "product_name": item.product_name,
-                    "warehouse_id": str(item.warehouse_id),
-                    "warehouse_name": item.warehouse_name,
-                    "warehouse_city": item.warehouse_city,
-                    "total_quantity": item.total_quantity,
-                    "reserved_quantity": item.reserved_quantity,
-                    "available_quantity": available_quantity,
-                    "batch_number": item.batch_number,
-                    "expiration_date": (
-                        item.expiration_date.isoformat() if item.expiration_date else None
-                    ),
-                    "product_price": float(item.product_price) if item.product_price else None,
-                }
-            )
+        header = json.dumps(
+            {
+                "report_type": "low_stock",
+                "generated_at": datetime.utcnow().isoformat(),
+                "date_range": {
+                    "start_date": start_date.isoformat(),
+                    "end_date": end_date.isoformat(),
+                },
+                "filters": {
+                    "threshold": threshold,
+                    "warehouse_id": warehouse_id,
+                },
+            }
+        )
+        # Reopen the header object to append the data array and the summary
+        yield f'{header[:-1]}, "data": ['.encode("utf-8")
 
-        # Calculate summary statistics
-        total_items = len(data)
-        total_available = sum(item["available_quantity"] for item in data)
-        critical_items = len([item for item in data if item["available_quantity"] <= 0])
-
-        # Group by warehouse for summary
-        warehouses = {}
-        for item in data:
-            wh_id = item["warehouse_id"]
-            if wh_id not in warehouses:
-                warehouses[wh_id] = {
-                    "warehouse_id": wh_id,
-                    "warehouse_name": item["warehouse_name"],
-                    "warehouse_city": item["warehouse_city"],
-                    "low_stock_items": 0,
-                }
-            warehouses[wh_id]["low_stock_items"] += 1
-
-        report = {
-            "report_type": "low_stock",
-            "generated_at": datetime.utcnow().isoformat(),
-            "date_range": {
-                "start_date": start_date.isoformat(),
-                "end_date": end_date.isoformat(),
-            },
-            "filters": {
-                "threshold": threshold,
-                "warehouse_id": warehouse_id,
-            },
-            "data": data,
-            "summary": {
-                "total_low_stock_items": total_items,
-                "total_available_quantity": total_available,
-                "critical_items": critical_items,  # Items with 0 or negative available
-                "affected_warehouses": len(warehouses),
-                "warehouses": list(warehouses.values()),
-            },
-        }
+        summary = _LowStockSummary()
+        result = await self.session.stream(stmt)
+        async for rows in result.partitions():
+            items = [self._format_row(row) for row in rows]
+            for item in items:
+                summary.add(item)
+            separator = ", " if summary.total_items > len(items) else ""
+            yield (separator + ", ".join(json.dumps(item) for item in items)).encode("utf-8")
+
+        yield f'], "summary": {json.dumps(summary.as_dict())}}}'.encode("utf-8")
 
         logger.info(
-            f"Generated low_stock report: {total_items} items, {critical_items} critical, "
-            f"{len(warehouses)} warehouses affected"
+            f"Generated low_stock report: {summary.total_items} items, "
+            f"{summary.critical_items} critical, {len(summary.warehouses)} warehouses affected"
         )
-        return report
+
+    @staticmethod
+    def _format_row(row) -> Dict[str, Any]:
+        return {
+            "inventory_id": str(row.id),
+            "product_id": str(row.product_id),
+            "product_sku": row.product_sku,
+            "product_name": row.product_name,
+            "warehouse_id": str(row.warehouse_id),
+            "warehouse_name": row.warehouse_name,
+            "warehouse_city": row.warehouse_city,
+            "total_quantity": row.total_quantity,
+            "reserved_quantity": row.reserved_quantity,
+            "available_quantity": row.total_quantity - row.reserved_quantity,
+            "batch_number": row.batch_number,
+            "expiration_date": (
+                row.expiration_date.isoformat() if row.expiration_date else None
+            ),
+            "product_price": float(row.product_price) if row.product_price else None,
+        }
@@ -3,20 +3,30 @@
 import json
 import logging
 from datetime import datetime, timedelta
-from typing import Any, Dict
+from typing import Any, AsyncIterator, Dict, List
 from uuid import UUID
 
 import aioboto3
 
 logger = logging.getLogger(__name__)
 
+# Buffered bytes per multipart part; S3 requires at least 5 MiB for every
+# part except the last
+MULTIPART_PART_SIZE = 8 * 1024 * 1024
+
 
 class S3Service:
     """Service for uploading and managing reports in S3."""
 
-    def __init__(self, bucket_name: str, region: str = "us-east-1"):
+    def __init__(
+        self,
+        bucket_name: str,
+        region: str = "us-east-1",
+        part_size: int = MULTIPART_PART_SIZE,
+    ):
         self.bucket_name = bucket_name
         self.region = region
+        self.part_size = part_size
         self.session = aioboto3.Session()
         logger.info(f"Initialized S3Service with bucket={bucket_name}, region={region}")
 
@@ -38,8 +48,7 @@ class S3Service:
         Raises:
             Exception: If upload fails
         """
-        timestamp = datetime.utcnow().strftime("%Y-%m-%dT%H-%M-%S")
-        s3_key = f"{report_type}/{user_id}/{timestamp}-{report_id}.json"
+        s3_key = self._report_key(report_id, user_id, report_type)
 
         logger.info(f"Uploading report {report_id} to s3://{self.bucket_name}/{s3_key}")
 
@@ -66,6 +75,101 @@ class S3Service:
                 logger.error(f"Failed to upload report {report_id} to S3: {e}", exc_info=True)
                 raise
 
+    async def upload_report_stream(
+        self,
+        report_id: UUID,
+        user_id: UUID,
+        report_type: str,
+        chunks: AsyncIterator[bytes],
+    ) -> str:
+        """
+        Upload a report body produced incrementally, using S3 multipart upload.
+
+        Chunks are buffered until ``part_size`` bytes are available and then
+        sent as one part, so at most about one part is held in memory
+        whatever the report size. On any failure the multipart upload is
+        aborted so no orphaned parts are left behind.
+
+        Args:
+            report_id: Report UUID
+            user_id: User UUID
+            report_type: Type of report
+            chunks: Consecutive pieces of the JSON report body
+
+        Returns:
+            S3 key of the uploaded file
+
+        Raises:
+            Exception: If producing the body or uploading fails
+        """
+        s3_key = self._report_key(report_id, user_id, report_type)
+
+        logger.info(
+            f"Streaming report {report_id} to s3://{self.bucket_name}/{s3_key} "
+            f"(part size {self.part_size} bytes)"
+        )
+
+        async with self.session.client("s3", region_name=self.region) as s3:
+            upload = await s3.create_multipart_upload(
+                Bucket=self.bucket_name,
+                Key=s3_key,
+                ContentType="application/json",
+                Metadata={
+                    "report_id": str(report_id),
+                    "user_id": str(user_id),
+                    "report_type": report_type,
+                },
+            )
+            upload_id = upload["UploadId"]
+            parts: List[Dict[str, Any]] = []
+
+            async def send_part(body: bytes) -> None:
+                part_number = len(parts) + 1
+                response = await s3.upload_part(
+                    Bucket=self.bucket_name,
+                    Key=s3_key,
+                    UploadId=upload_id,
+                    PartNumber=part_number,
+                    Body=body,
+                )
+                parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+                logger.debug(f"Uploaded part {part_number} ({len(body)} bytes) of report {report_id}")
+
+            try:
+                buffer = bytearray()
+                async for chunk in chunks:
+                    buffer += chunk
+                    if len(buffer) >= self.part_size:
+                        await send_part(bytes(buffer))
+                        buffer.clear()
+                # The last part may be smaller than the minimum; an upload needs at least one
+                if buffer or not parts:
+                    await send_part(bytes(buffer))
+
+                await s3.complete_multipart_upload(
+                    Bucket=self.bucket_name,
+                    Key=s3_key,
+                    UploadId=upload_id,
+                    MultipartUpload={"Parts": parts},
+                )
+
+                logger.info(
+                    f"Successfully uploaded report {report_id} to {s3_key} in {len(parts)} part(s)"
+                )
+                return s3_key
+
+            except Exception as e:
+                logger.error(f"Failed to stream report {report_id} to S3: {e}", exc_info=True)
+                try:
+                    await s3.abort_multipart_upload(
+                        Bucket=self.bucket_name, Key=s3_key, UploadId=upload_id
+                    )
+                except Exception as abort_error:
+                    logger.error(
+                        f"Failed to abort multipart upload {upload_id} for {s3_key}: {abort_error}"
+                    )
+                raise
+
     async def generate_presigned_url(self, s3_key: str, expiration: int = 3600) -> str:
         """
         Generate a presigned URL for downloading a report.
@@ -99,3 +203,8 @@ class S3Service:
             except Exception as e:
                 logger.error(f"Failed to generate presigned URL for {s3_key}: {e}", exc_info=True)
                 raise
+
+    @staticmethod
+    def _report_key(report_id: UUID, user_id: UUID, report_type: str) -> str:
+        timestamp = datetime.utcnow().strftime("%Y-%m-%dT%H-%M-%S")
+        return f"{report_type}/{user_id}/{timestamp}-{report_id}.json"
@@ -1,6 +1,17 @@
 """Value objects for the Inventory domain."""
 
+import base64
+import binascii
+from dataclasses import dataclass
+from datetime import datetime
 from enum import Enum
+from typing import Tuple
+from uuid import UUID
+
+from src.domain.exceptions import (
+    InvalidInventoryCursorException,
+    InvalidReportCursorException,
+)
 
 
 class ReportType(str, Enum):
@@ -16,3 +27,74 @@ class ReportStatus(str, Enum):
     PROCESSING = "processing"
     COMPLETED = "completed"
     FAILED = "failed"
+
+
+@dataclass(frozen=True)
+class ReportCursor:
+    """Keyset position in a report listing ordered by (created_at, id) DESC.
+
+    Encoded as an opaque URL-safe token. The BFF merges report pages from
+    several services by this same key, so the format must stay in sync with
+    the order service and the BFF.
+    """
+
+    created_at: datetime
+    id: UUID
+
+    def encode(self) -> str:
+        return _encode_keyset(self.created_at.isoformat(), self.id)
+
+    @classmethod
+    def decode(cls, token: str) -> "ReportCursor":
+        """Parse a token produced by ``encode``.
+
+        Raises:
+            InvalidReportCursorException: If the token is malformed
+        """
+        try:
+            created_at, report_id = _decode_keyset(token)
+            return cls(created_at=datetime.fromisoformat(created_at), id=report_id)
+        except ValueError as e:
+            raise InvalidReportCursorException(token) from e
+
+
+@dataclass(frozen=True)
+class InventoryCursor:
+    """Keyset position in an inventory listing ordered by (product_name, id)."""
+
+    product_name: str
+    id: UUID
+
+    def encode(self) -> str:
+        return _encode_keyset(self.product_name, self.id)
+
+    @classmethod
+    def decode(cls, token: str) -> "InventoryCursor":
+        """Parse a token produced by ``encode``.
+
+        Raises:
+            InvalidInventoryCursorException: If the token is malformed
+        """
+        try:
+            product_name, inventory_id = _decode_keyset(token)
+        except ValueError as e:
+            raise InvalidInventoryCursorException(token) from e
+        return cls(product_name=product_name, id=inventory_id)
+
+
+def _encode_keyset(key: str, id: UUID) -> str:
+    raw = f"{key}|{id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_keyset(token: str) -> Tuple[str, UUID]:
+    """Inverse of ``_encode_keyset``; raises ValueError on a malformed token.
+
+    The key may itself contain ``|`` (product names), the id never does.
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        key, id = base64.urlsafe_b64decode(padded).decode().rsplit("|", 1)
+        return key, UUID(id)
+    except (binascii.Error, UnicodeDecodeError) as e:
+        raise ValueError(str(e)) from e
@@ -29,5 +29,15 @@ class Settings(BaseSettings):
     # External Services
     catalog_service_url: str = Field(default="http://localhost:8001")
 
+    # Report deduplication
+    report_dedup_window_seconds: int = Field(
+        default=300,
+        description="Identical report requests within this window share one artifact (0 disables)"
+    )
+    report_dedup_stale_after_seconds: int = Field(
+        default=120,
+        description="An unfinished match older than this is replaced, not joined (keep below the window)"
+    )
+
 
 settings = Settings()
@@ -3,7 +3,7 @@ from datetime import datetime
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
-from sqlalchemy import UUID, DateTime, Integer, Numeric, String, func
+from sqlalchemy import UUID, DateTime, Index, Integer, Numeric, String, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import Base
@@ -14,6 +14,15 @@ if TYPE_CHECKING:
 
 class Inventory(Base):
     __tablename__ = "inventories"
+    __table_args__ = (
+        # Keyset listing by (product_name, id), overall and per warehouse
+        Index("idx_inventories_product_name_id", "product_name", "id"),
+        Index("idx_inventories_warehouse_product_name", "warehouse_id", "product_name", "id"),
+        # max(updated_at) is the data version of report fingerprints
+        Index("idx_inventories_updated_at", "updated_at"),
+        # Search also uses pg_trgm GIN indexes on f_unaccent(lower(product_name))
+        # and lower(product_sku); they are Postgres-only, see migration 9c4e2b7d1f35
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
@@ -64,9 +64,20 @@ class Report(Base):
         DateTime(timezone=True), nullable=True
     )
 
+    # Hash of the request and the inventory data version; see report_dedup
+    fingerprint: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+
+    # Set when this report shares another report's artifact
+    source_report_id: Mapped[Optional[uuid.UUID]] = mapped_column(
+        UUID(as_uuid=True), nullable=True
+    )
+
     __table_args__ = (
         Index("idx_reports_user_id", "user_id"),
         Index("idx_reports_status", "status"),
         Index("idx_reports_created_at", "created_at"),
         Index("idx_reports_user_status", "user_id", "status"),
+        Index("idx_reports_user_created", "user_id", "created_at", "id"),  # Keyset listing
+        Index("idx_reports_fingerprint", "fingerprint", "created_at"),  # Dedup lookup
+        Index("idx_reports_source", "source_report_id"),
     )
@@ -1,5 +1,7 @@
 """Dependency injection container for FastAPI."""
 import os
+from datetime import timedelta
+from functools import lru_cache
 
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -14,14 +16,18 @@ from src.application.use_cases.create_inventory import CreateInventoryUseCase
 from src.application.use_cases.create_report import CreateReportUseCase
 from src.application.use_cases.create_warehouse import CreateWarehouseUseCase
 from src.application.use_cases.generate_report import GenerateReportUseCase
+from src.application.use_cases.get_inventories_batch import GetInventoriesBatchUseCase
 from src.application.use_cases.get_inventory import GetInventoryUseCase
 from src.application.use_cases.get_report import GetReportUseCase
 from src.application.use_cases.list_inventories import ListInventoriesUseCase
 from src.application.use_cases.list_reports import ListReportsUseCase
 from src.application.use_cases.list_warehouses import ListWarehousesUseCase
+from src.application.use_cases.reserve_inventories import ReserveInventoriesUseCase
+from src.application.use_cases.search_inventories import SearchInventoriesUseCase
 from src.application.use_cases.update_reserved_quantity import (
     UpdateReservedQuantityUseCase,
 )
+from src.domain.services.report_dedup import ReportDedupMetrics
 from src.domain.services.s3_service import S3Service
 from src.domain.services.sqs_publisher import SQSPublisher
 from src.infrastructure.config.settings import settings
@@ -74,6 +80,13 @@ def get_list_inventories_use_case(
     return ListInventoriesUseCase(repo)
 
 
+def get_search_inventories_use_case(
+    repo: InventoryRepositoryPort = Depends(get_inventory_repository),
+) -> SearchInventoriesUseCase:
+    """Get search inventories use case with injected dependencies."""
+    return SearchInventoriesUseCase(repo)
+
+
 def get_get_inventory_use_case(
     repo: InventoryRepositoryPort = Depends(get_inventory_repository),
 ) -> GetInventoryUseCase:
@@ -88,6 +101,20 @@ def get_update_reserved_quantity_use_case(
     return UpdateReservedQuantityUseCase(repo)
 
 
+def get_get_inventories_batch_use_case(
+    repo: InventoryRepositoryPort = Depends(get_inventory_repository),
+) -> GetInventoriesBatchUseCase:
+    """Get batch inventory lookup use case with injected dependencies."""
+    return GetInventoriesBatchUseCase(repo)
+
+
+def get_reserve_inventories_use_case(
+    repo: InventoryRepositoryPort = Depends(get_inventory_repository),
+) -> ReserveInventoriesUseCase:
+    """Get batch reservation use case with injected dependencies."""
+    return ReserveInventoriesUseCase(repo)
+
+
 # Repository providers - Report
 def get_report_repository(
     db: AsyncSession = Depends(get_db),
@@ -111,12 +138,24 @@ def get_sqs_publisher() -> SQSPublisher:
     return SQSPublisher(queue_url=queue_url, region=region)
 
 
+@lru_cache()
+def get_report_dedup_metrics() -> ReportDedupMetrics:
+    """Get the process-wide report deduplication counters."""
+    return ReportDedupMetrics()
+
+
 # Use case providers - Report
 def get_create_report_use_case(
     repo: ReportRepositoryPort = Depends(get_report_repository),
+    metrics: ReportDedupMetrics = Depends(get_report_dedup_metrics),
 ) -> CreateReportUseCase:
     """Get create report use case with injected dependencies."""
-    return CreateReportUseCase(repo)
+    return CreateReportUseCase(
+        repo,
+        freshness_window=timedelta(seconds=settings.report_dedup_window_seconds),
+        metrics=metrics,
+        stale_after=timedelta(seconds=settings.report_dedup_stale_after_seconds),
+    )
 
 
 def get_list_reports_use_case(
@@ -79,7 +79,7 @@ async def test_list_inventories_empty():
 
     # Mock the use case
     mock_use_case = AsyncMock()
-    mock_use_case.execute = AsyncMock(return_value=([], 0))
+    mock_use_case.execute = AsyncMock(return_value=([], 0, None))
 
     # Override DI dependency
     app.dependency_overrides[get_list_inventories_use_case] = lambda: mock_use_case
@@ -129,7 +129,7 @@ async def test_list_inventories_with_data():
 
     # Mock the use case
     mock_use_case = AsyncMock()
-    mock_use_case.execute = AsyncMock(return_value=(mock_inventories, 1))
+    mock_use_case.execute = AsyncMock(return_value=(mock_inventories, 1, None))
 
     # Override DI dependency
     app.dependency_overrides[get_list_inventories_use_case] = lambda: mock_use_case
@@ -219,7 +219,7 @@ async def test_list_inventories_with_category_filter():
 
     # Mock the use case
     mock_use_case = AsyncMock()
-    mock_use_case.execute = AsyncMock(return_value=(mock_inventories, 1))
+    mock_use_case.execute = AsyncMock(return_value=(mock_inventories, 1, None))
 
     # Override DI dependency
     app.dependency_overrides[get_list_inventories_use_case] = lambda: mock_use_case
@@ -249,7 +249,7 @@ async def test_list_inventories_with_all_filters():
 
     # Mock the use case
     mock_use_case = AsyncMock()
-    mock_use_case.execute = AsyncMock(return_value=([], 0))
+    mock_use_case.execute = AsyncMock(return_value=([], 0, None))
 
     # Override DI dependency
     app.dependency_overrides[get_list_inventories_use_case] = lambda: mock_use_case
@@ -310,7 +310,7 @@ async def test_list_inventories_pagination_metadata():
 
     # Mock the use case - return 10 items, total 100
     mock_use_case = AsyncMock()
-    mock_use_case.execute = AsyncMock(return_value=(mock_inventories, 100))
+    mock_use_case.execute = AsyncMock(return_value=(mock_inventories, 100, None))
 
     # Override DI dependency
     app.dependency_overrides[get_list_inventories_use_case] = lambda: mock_use_case
@@ -685,3 +685,187 @@ async def test_update_reserved_quantity_not_found():
     assert response.status_code == 404
     data = response.json()
     assert "message" in data
+
+
+def _domain_inventory(inventory_id, reserved=0):
+    from src.domain.entities.inventory import Inventory as DomainInventory
+
+    return DomainInventory(
+        id=inventory_id,
+        product_id=uuid.uuid4(),
+        warehouse_id=uuid.uuid4(),
+        total_quantity=100,
+        reserved_quantity=reserved,
+        batch_number="BATCH001",
+        expiration_date=datetime(2026, 12, 31, tzinfo=timezone.utc),
+        product_sku="TEST-SKU-001",
+        product_name="Test Product",
+        product_price=Decimal("100.50"),
+        product_category="medicamentos_especiales",
+        warehouse_name="Test Warehouse",
+        warehouse_city="Test City",
+        warehouse_country="Colombia",
+        created_at=datetime.now(timezone.utc),
+        updated_at=datetime.now(timezone.utc),
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_inventories_batch():
+    """Test fetching several inventories in one request."""
+    from src.infrastructure.dependencies import get_get_inventories_batch_use_case
+
+    app = FastAPI()
+    app.include_router(router)
+
+    found_id, missing_id = uuid.uuid4(), uuid.uuid4()
+    mock_use_case = AsyncMock()
+    mock_use_case.execute = AsyncMock(
+        return_value=([_domain_inventory(found_id)], [missing_id])
+    )
+    app.dependency_overrides[get_get_inventories_batch_use_case] = lambda: mock_use_case
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.post(
+            "/inventories/batch", json={"ids": [str(found_id), str(missing_id)]}
+        )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [item["id"] for item in data["items"]] == [str(found_id)]
+    assert data["items"][0]["available_quantity"] == 100
+    assert data["missing_ids"] == [str(missing_id)]
+
+
+@pytest.mark.asyncio
+async def test_get_inventories_batch_requires_ids():
+    """Test that an empty id list is rejected."""
+    app = FastAPI()
+    app.include_router(router)
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.post("/inventories/batch", json={"ids": []})
+
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_reserve_inventories_success():
+    """Test reserving several inventories atomically."""
+    from src.infrastructure.dependencies import get_reserve_inventories_use_case
+
+    app = FastAPI()
+    app.include_router(router)
+
+    first, second = uuid.uuid4(), uuid.uuid4()
+    mock_use_case = AsyncMock()
+    mock_use_case.execute = AsyncMock(
+        return_value=[_domain_inventory(first, 5), _domain_inventory(second, 2)]
+    )
+    app.dependency_overrides[get_reserve_inventories_use_case] = lambda: mock_use_case
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.post(
+            "/reservations",
+            json={
+                "items": [
+                    {"inventory_id": str(first), "quantity_delta": 5},
+                    {"inventory_id": str(second), "quantity_delta": 2},
+                ]
+            },
+        )
+
+    assert response.status_code == 200
+    assert [item["reserved_quantity"] for item in response.json()["items"]] == [5, 2]
+    lines = list(mock_use_case.execute.call_args[0][0])
+    assert lines == [(first, 5), (second, 2)]
+
+
+@pytest.mark.asyncio
+async def test_reserve_inventories_insufficient_inventory():
+    """Test that a failing line returns 409 for the whole batch."""
+    from src.domain.exceptions import InsufficientInventoryException
+    from src.infrastructure.api.exception_handlers import register_exception_handlers
+    from src.infrastructure.dependencies import get_reserve_inventories_use_case
+
+    app = FastAPI()
+    app.include_router(router)
+    register_exception_handlers(app)
+
+    inventory_id = uuid.uuid4()
+    mock_use_case = AsyncMock()
+    mock_use_case.execute = AsyncMock(
+        side_effect=InsufficientInventoryException(
+            inventory_id=inventory_id, requested=10, available=3
+        )
+    )
+    app.dependency_overrides[get_reserve_inventories_use_case] = lambda: mock_use_case
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.post(
+            "/reservations",
+            json={"items": [{"inventory_id": str(inventory_id), "quantity_delta": 10}]},
+        )
+
+    assert response.status_code == 409
+    assert response.json()["error_code"] == "INSUFFICIENT_INVENTORY"
+
+
+@pytest.mark.asyncio
+async def test_search_inventories():
+    """Test searching inventories by product name."""
+    from src.domain.entities.inventory import Inventory as DomainInventory
+    from src.infrastructure.dependencies import get_search_inventories_use_case
+
+    app = FastAPI()
+    app.include_router(router)
+
+    warehouse_id = uuid.uuid4()
+    mock_inventory = DomainInventory(
+        id=uuid.uuid4(),
+        product_id=uuid.uuid4(),
+        warehouse_id=warehouse_id,
+        total_quantity=100,
+        reserved_quantity=10,
+        batch_number="BATCH001",
+        expiration_date=datetime(2026, 12, 31, tzinfo=timezone.utc),
+        product_sku="MED-001",
+        product_name="Acetaminofén 500mg",
+        product_price=Decimal("10.00"),
+        product_category="medicamentos_especiales",
+        warehouse_name="Test Warehouse",
+        warehouse_city="Test City",
+        warehouse_country="Colombia",
+        created_at=datetime.now(timezone.utc),
+        updated_at=datetime.now(timezone.utc),
+    )
+
+    mock_use_case = AsyncMock()
+    mock_use_case.execute = AsyncMock(return_value=[mock_inventory])
+    app.dependency_overrides[get_search_inventories_use_case] = lambda: mock_use_case
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.get(
+            "/inventories/search",
+            params={"q": "acetamin", "limit": 5, "warehouse_id": str(warehouse_id)},
+        )
+        too_short = await client.get("/inventories/search", params={"q": "ac"})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [item["product_name"] for item in data["items"]] == ["Acetaminofén 500mg"]
+    assert data["items"][0]["available_quantity"] == 90
+    mock_use_case.execute.assert_called_once_with(
+        query="acetamin", limit=5, warehouse_id=warehouse_id
+    )
+    assert too_short.status_code == 422
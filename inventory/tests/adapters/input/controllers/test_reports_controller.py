@@ -256,6 +256,38 @@ async def test_list_reports_with_filters():
     mock_use_case.execute.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_list_reports_with_cursor():
+    """Test cursor pagination passes the cursor through and returns the next one."""
+    from src.application.use_cases.list_reports import ListReportsOutput
+    from src.infrastructure.dependencies import get_list_reports_use_case
+
+    app = FastAPI()
+    app.include_router(router)
+
+    user_id = uuid.uuid4()
+
+    mock_output = ListReportsOutput(
+        reports=[], total=5, limit=2, offset=0, next_cursor="next-token"
+    )
+    mock_use_case = AsyncMock()
+    mock_use_case.execute = AsyncMock(return_value=mock_output)
+
+    app.dependency_overrides[get_list_reports_use_case] = lambda: mock_use_case
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.get(f"/reports?user_id={user_id}&limit=2&cursor=page-token")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["next_cursor"] == "next-token"
+    assert data["has_next"] is True
+    assert data["has_previous"] is True
+    assert mock_use_case.execute.call_args[0][0].cursor == "page-token"
+
+
 @pytest.mark.asyncio
 async def test_list_reports_validation_errors():
     """Test list reports with invalid query parameters."""
@@ -435,3 +467,34 @@ async def test_get_report_missing_user_id():
 
     # FastAPI should return 422 for missing required query parameter
     assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_get_report_dedup_metrics():
+    """Test the report deduplication metrics endpoint."""
+    from src.domain.services.report_dedup import JOINED, REUSED, ReportDedupMetrics
+    from src.infrastructure.config.settings import settings
+    from src.infrastructure.dependencies import get_report_dedup_metrics
+
+    app = FastAPI()
+    app.include_router(router)
+
+    metrics = ReportDedupMetrics()
+    metrics.record(REUSED)
+    metrics.record(JOINED)
+    app.dependency_overrides[get_report_dedup_metrics] = lambda: metrics
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.get("/reports/dedup/metrics")
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "requests": 2,
+        "reused": 1,
+        "joined": 1,
+        "generated": 0,
+        "hit_rate": 1.0,
+        "freshness_window_seconds": settings.report_dedup_window_seconds,
+    }
@@ -1,8 +1,10 @@
 import uuid
 from datetime import datetime, timezone
 from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from sqlalchemy.dialects.postgresql import asyncpg
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.adapters.output.repositories.inventory_repository import (
@@ -124,6 +126,84 @@ async def test_list_inventories_pagination(db_session: AsyncSession):
     assert total == 5
 
 
+@pytest.mark.asyncio
+async def test_list_inventories_cursor_ignores_offset(db_session: AsyncSession):
+    """Test that an offset given with a cursor does not skip rows past it."""
+    from src.domain.value_objects import InventoryCursor
+
+    repository = InventoryRepository(db_session)
+
+    for i, name in enumerate(["Alpha", "Beta", "Gamma", "Delta", "Epsilon"]):
+        await repository.create({
+            "product_id": uuid.uuid4(),
+            "warehouse_id": uuid.uuid4(),
+            "total_quantity": 100,
+            "reserved_quantity": 0,
+            "batch_number": f"BATCH00{i}",
+            "expiration_date": datetime(2026, 12, 31, tzinfo=timezone.utc),
+            "product_sku": f"SKU-00{i}",
+            "product_name": name,
+            "product_price": Decimal("10.00"),
+            "warehouse_name": "Test Warehouse",
+            "warehouse_city": "Test City",
+            "warehouse_country": "Colombia",
+        })
+
+    first, _ = await repository.list_inventories(limit=2)
+    after = InventoryCursor(product_name=first[-1].product_name, id=first[-1].id)
+
+    page, _ = await repository.list_inventories(limit=2, offset=2, after=after)
+
+    assert [i.product_name for i in page] == ["Delta", "Epsilon"]
+
+
+@pytest.mark.asyncio
+async def test_list_inventories_keyset_walk(db_session: AsyncSession):
+    """Test seeking by (product_name, id) returns every row once, name ties included."""
+    from src.domain.value_objects import InventoryCursor
+
+    repository = InventoryRepository(db_session)
+
+    for i, name in enumerate(["Beta", "Alpha", "Beta", "Gamma | Plus", "Alpha"]):
+        await repository.create({
+            "product_id": uuid.uuid4(),
+            "warehouse_id": uuid.uuid4(),
+            "total_quantity": 100,
+            "reserved_quantity": 0,
+            "batch_number": f"BATCH00{i}",
+            "expiration_date": datetime(2026, 12, 31, tzinfo=timezone.utc),
+            "product_sku": f"SKU-00{i}",
+            "product_name": name,
+            "product_price": Decimal("10.00"),
+            "warehouse_name": "Test Warehouse",
+            "warehouse_city": "Test City",
+            "warehouse_country": "Colombia",
+        })
+
+    everything, total = await repository.list_inventories(limit=100)
+
+    seen = []
+    after = None
+    while True:
+        page, page_total = await repository.list_inventories(
+            limit=2, after=after, include_total=False
+        )
+        assert page_total is None
+        seen.extend(page)
+        if len(page) < 2:
+            break
+        # Round-trip through the token like a client would
+        after = InventoryCursor.decode(
+            InventoryCursor(product_name=page[-1].product_name, id=page[-1].id).encode()
+        )
+
+    assert total == 5
+    assert [i.id for i in seen] == [i.id for i in everything]
+    assert [i.product_name for i in everything] == [
+        "Alpha", "Alpha", "Beta", "Beta", "Gamma | Plus"
+    ]
+
+
 @pytest.mark.asyncio
 async def test_find_by_id_found(db_session: AsyncSession):
     """Test finding inventory by ID when it exists."""
@@ -270,3 +350,27 @@ async def test_list_inventories_filter_by_warehouse_id(db_session: AsyncSession)
     assert len(inventories) == 2
     assert total == 2
     assert all(inv.warehouse_id == warehouse_id_1 for inv in inventories)
+
+
+@pytest.mark.asyncio
+async def test_search_inventories_uses_trigram_index_expressions():
+    """Search must filter on the exact expressions the GIN indexes are built on."""
+    session = AsyncMock()
+    session.execute.return_value = MagicMock()
+    repository = InventoryRepository(session)
+    warehouse_id = uuid.uuid4()
+
+    await repository.search_inventories("acetamin_", limit=5, warehouse_id=warehouse_id)
+
+    statement = session.execute.call_args[0][0]
+    sql = str(statement.compile(dialect=asyncpg.dialect()))
+    params = statement.compile(dialect=asyncpg.dialect()).params
+    assert "f_unaccent(lower(inventories.product_name)) LIKE" in sql
+    assert "lower(inventories.product_sku) LIKE" in sql
+    assert "<% f_unaccent(lower(inventories.product_name))" in sql
+    assert "inventories.warehouse_id = " in sql
+    assert "ORDER BY greatest(word_similarity(" in sql
+    assert "DESC, inventories.product_name, inventories.id" in sql
+    # LIKE wildcards typed by the user are matched literally
+    assert "acetamin/_" in params.values()
+    assert 5 in params.values()
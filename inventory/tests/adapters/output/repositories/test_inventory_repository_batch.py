@@ -0,0 +1,95 @@
+"""Tests for batch lookup and batch reservation in InventoryRepository."""
+
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.adapters.output.repositories.inventory_repository import (
+    InventoryRepository,
+)
+from src.domain.exceptions import (
+    InsufficientInventoryException,
+    InventoryNotFoundException,
+)
+
+
+async def _create_inventory(repository, total=100, reserved=0, sku="TEST-SKU-001"):
+    return await repository.create(
+        {
+            "product_id": uuid.uuid4(),
+            "warehouse_id": uuid.uuid4(),
+            "total_quantity": total,
+            "reserved_quantity": reserved,
+            "batch_number": "BATCH001",
+            "expiration_date": datetime(2026, 12, 31, tzinfo=timezone.utc),
+            "product_sku": sku,
+            "product_name": "Test Product",
+            "product_price": Decimal("100.50"),
+            "warehouse_name": "Test Warehouse",
+            "warehouse_city": "Test City",
+            "warehouse_country": "Colombia",
+        }
+    )
+
+
+@pytest.mark.asyncio
+async def test_find_by_ids_returns_existing_only(db_session: AsyncSession):
+    repository = InventoryRepository(db_session)
+    first = await _create_inventory(repository)
+    second = await _create_inventory(repository)
+
+    inventories = await repository.find_by_ids([first.id, second.id, uuid.uuid4()])
+
+    assert {i.id for i in inventories} == {first.id, second.id}
+
+
+@pytest.mark.asyncio
+async def test_find_by_ids_empty_list(db_session: AsyncSession):
+    repository = InventoryRepository(db_session)
+
+    assert await repository.find_by_ids([]) == []
+
+
+@pytest.mark.asyncio
+async def test_update_reserved_quantities_applies_all_lines(db_session: AsyncSession):
+    repository = InventoryRepository(db_session)
+    first = await _create_inventory(repository, total=50)
+    second = await _create_inventory(repository, total=20, reserved=10)
+
+    updated = await repository.update_reserved_quantities(
+        {first.id: 30, second.id: -4}
+    )
+
+    by_id = {i.id: i for i in updated}
+    assert by_id[first.id].reserved_quantity == 30
+    assert by_id[second.id].reserved_quantity == 6
+    assert [i.id for i in updated] == sorted([first.id, second.id])
+
+
+@pytest.mark.asyncio
+async def test_update_reserved_quantities_is_all_or_nothing(db_session: AsyncSession):
+    repository = InventoryRepository(db_session)
+    plenty = await _create_inventory(repository, total=100)
+    scarce = await _create_inventory(repository, total=5, sku="LOW-001")
+
+    with pytest.raises(InsufficientInventoryException):
+        await repository.update_reserved_quantities({plenty.id: 10, scarce.id: 6})
+
+    reloaded = {i.id: i for i in await repository.find_by_ids([plenty.id, scarce.id])}
+    assert reloaded[plenty.id].reserved_quantity == 0
+    assert reloaded[scarce.id].reserved_quantity == 0
+
+
+@pytest.mark.asyncio
+async def test_update_reserved_quantities_missing_inventory(db_session: AsyncSession):
+    repository = InventoryRepository(db_session)
+    existing = await _create_inventory(repository)
+
+    with pytest.raises(InventoryNotFoundException):
+        await repository.update_reserved_quantities({existing.id: 1, uuid.uuid4(): 1})
+
+    reloaded = await repository.find_by_ids([existing.id])
+    assert reloaded[0].reserved_quantity == 0
@@ -1,6 +1,6 @@
 """Unit tests for ReportRepository."""
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -415,3 +415,87 @@ async def test_update_status_to_processing(db_session: AsyncSession):
     assert updated.id == created.id
     assert updated.status == "processing"
     assert updated.completed_at is None  # Should NOT be set for processing status
+
+
+def _fingerprinted_report(fingerprint: str, status: str = "pending", **extra) -> dict:
+    return {
+        "report_type": "low_stock",
+        "status": status,
+        "user_id": uuid.uuid4(),
+        "start_date": datetime(2025, 1, 1, tzinfo=timezone.utc),
+        "end_date": datetime(2025, 1, 31, tzinfo=timezone.utc),
+        "filters": {},
+        "fingerprint": fingerprint,
+        **extra,
+    }
+
+
+@pytest.mark.asyncio
+async def test_find_reusable_prefers_completed_source(db_session: AsyncSession):
+    """Test that completed sources win and followers and failures are skipped."""
+    repository = ReportRepository(db_session)
+    fingerprint = uuid.uuid4().hex
+    window_start = datetime.now(timezone.utc) - timedelta(minutes=5)
+
+    assert await repository.find_reusable(fingerprint, window_start) is None
+
+    pending = await repository.create(_fingerprinted_report(fingerprint))
+    await repository.create(_fingerprinted_report(fingerprint, status="failed"))
+    await repository.create(
+        _fingerprinted_report(fingerprint, status="completed", source_report_id=pending.id)
+    )
+    assert (await repository.find_reusable(fingerprint, window_start)).id == pending.id
+
+    completed = await repository.create(_fingerprinted_report(fingerprint, status="completed"))
+    assert (await repository.find_reusable(fingerprint, window_start)).id == completed.id
+    window_later = datetime.now(timezone.utc) + timedelta(minutes=1)
+    assert await repository.find_reusable(fingerprint, window_later) is None
+
+
+@pytest.mark.asyncio
+async def test_resolve_followers_resolves_each_report_once(db_session: AsyncSession):
+    """Test that only waiting followers are resolved, and only once."""
+    repository = ReportRepository(db_session)
+    fingerprint = uuid.uuid4().hex
+    source = await repository.create(_fingerprinted_report(fingerprint))
+    follower = await repository.create(
+        _fingerprinted_report(fingerprint, source_report_id=source.id)
+    )
+    await repository.create(
+        _fingerprinted_report(fingerprint, status="failed", source_report_id=source.id)
+    )
+
+    resolved = await repository.resolve_followers(
+        source.id, "completed", s3_bucket="bucket", s3_key="key.json"
+    )
+    assert [r.id for r in resolved] == [follower.id]
+    assert resolved[0].status == "completed"
+    assert resolved[0].s3_key == "key.json"
+    assert resolved[0].completed_at is not None
+
+    assert await repository.resolve_followers(source.id, "completed") == []
+
+
+@pytest.mark.asyncio
+async def test_adopt_followers_moves_unfinished_reports(db_session: AsyncSession):
+    """Test that a stale report and its waiting reports move to a new source."""
+    repository = ReportRepository(db_session)
+    fingerprint = uuid.uuid4().hex
+    stale = await repository.create(_fingerprinted_report(fingerprint))
+    waiting = await repository.create(
+        _fingerprinted_report(fingerprint, source_report_id=stale.id)
+    )
+    resolved = await repository.create(
+        _fingerprinted_report(fingerprint, status="failed", source_report_id=stale.id)
+    )
+    new_source = await repository.create(_fingerprinted_report(fingerprint))
+
+    assert await repository.adopt_followers(stale.id, new_source.id) == 2
+
+    for report, source_id in (
+        (stale, new_source.id),
+        (waiting, new_source.id),
+        (resolved, stale.id),
+    ):
+        found = await repository.find_by_id(report.id, report.user_id)
+        assert found.source_report_id == source_id
@@ -1,15 +1,20 @@
 """Unit tests for CreateReportUseCase."""
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
 
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.adapters.output.repositories.inventory_repository import (
+    InventoryRepository,
+)
 from src.adapters.output.repositories.report_repository import ReportRepository
 from src.application.use_cases.create_report import (
     CreateReportInput,
     CreateReportUseCase,
 )
+from src.domain.services.report_dedup import ReportDedupMetrics
 from src.domain.value_objects import ReportStatus, ReportType
 
 
@@ -107,3 +112,117 @@ async def test_create_report_equal_dates(db_session: AsyncSession):
     assert report.id is not None
     assert report.start_date.date() == same_date.date()
     assert report.end_date.date() == same_date.date()
+
+
+def _low_stock_request(warehouse_id: uuid.UUID) -> CreateReportInput:
+    # The warehouse filter keeps fingerprints apart between tests
+    return CreateReportInput(
+        user_id=uuid.uuid4(),
+        report_type=ReportType.LOW_STOCK,
+        start_date=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        end_date=datetime(2025, 1, 31, tzinfo=timezone.utc),
+        filters={"warehouse_id": str(warehouse_id)},
+    )
+
+
+@pytest.mark.asyncio
+async def test_create_report_dedup_joins_then_reuses(db_session: AsyncSession):
+    """Test that identical requests join an in-flight report, then reuse it."""
+    repository = ReportRepository(db_session)
+    metrics = ReportDedupMetrics()
+    use_case = CreateReportUseCase(
+        repository, freshness_window=timedelta(minutes=5), metrics=metrics
+    )
+    warehouse_id = uuid.uuid4()
+
+    first = await use_case.execute(_low_stock_request(warehouse_id))
+    joined = await use_case.execute(_low_stock_request(warehouse_id))
+
+    assert first.fingerprint is not None
+    assert first.source_report_id is None
+    assert joined.fingerprint == first.fingerprint
+    assert joined.source_report_id == first.id
+    assert joined.status == ReportStatus.PENDING.value
+
+    await repository.update_status(
+        first.id, ReportStatus.COMPLETED.value, s3_bucket="bucket", s3_key="key.json"
+    )
+    reused = await use_case.execute(_low_stock_request(warehouse_id))
+
+    assert reused.source_report_id == first.id
+    assert reused.status == ReportStatus.COMPLETED.value
+    assert (reused.s3_bucket, reused.s3_key) == ("bucket", "key.json")
+    assert reused.completed_at is not None
+    assert metrics.snapshot() == {
+        "requests": 3,
+        "reused": 1,
+        "joined": 1,
+        "generated": 1,
+        "hit_rate": 0.6667,
+    }
+
+
+@pytest.mark.asyncio
+async def test_create_report_dedup_replaces_stale_source(db_session: AsyncSession):
+    """Test that an unfinished match past stale_after is replaced, not joined."""
+    repository = ReportRepository(db_session)
+    use_case = CreateReportUseCase(
+        repository, freshness_window=timedelta(minutes=5), stale_after=timedelta(0)
+    )
+    warehouse_id = uuid.uuid4()
+
+    stale = await use_case.execute(_low_stock_request(warehouse_id))
+    follower = await CreateReportUseCase(
+        repository, freshness_window=timedelta(minutes=5)
+    ).execute(_low_stock_request(warehouse_id))
+    replacement = await use_case.execute(_low_stock_request(warehouse_id))
+
+    assert follower.source_report_id == stale.id
+    assert replacement.source_report_id is None
+    assert replacement.status == ReportStatus.PENDING.value
+    for report in (stale, follower):
+        adopted = await repository.find_by_id(report.id, report.user_id)
+        assert adopted.source_report_id == replacement.id
+
+
+@pytest.mark.asyncio
+async def test_create_report_dedup_misses_after_inventory_change(db_session: AsyncSession):
+    """Test that a change to the inventory starts a new report."""
+    repository = ReportRepository(db_session)
+    use_case = CreateReportUseCase(repository, freshness_window=timedelta(minutes=5))
+    warehouse_id = uuid.uuid4()
+
+    first = await use_case.execute(_low_stock_request(warehouse_id))
+    await InventoryRepository(db_session).create(
+        {
+            "product_id": uuid.uuid4(),
+            "warehouse_id": warehouse_id,
+            "total_quantity": 5,
+            "reserved_quantity": 0,
+            "batch_number": "BATCH001",
+            "expiration_date": datetime(2026, 12, 31, tzinfo=timezone.utc),
+            "product_sku": "SKU-001",
+            "product_name": "Test Product",
+            "product_price": Decimal("50.00"),
+            "warehouse_name": "Test Warehouse",
+            "warehouse_city": "Test City",
+            "warehouse_country": "Colombia",
+        }
+    )
+    second = await use_case.execute(_low_stock_request(warehouse_id))
+
+    assert second.fingerprint != first.fingerprint
+    assert second.source_report_id is None
+
+
+@pytest.mark.asyncio
+async def test_create_report_dedup_disabled_by_default(db_session: AsyncSession):
+    """Test that without a freshness window every request is generated."""
+    use_case = CreateReportUseCase(ReportRepository(db_session))
+    warehouse_id = uuid.uuid4()
+
+    first = await use_case.execute(_low_stock_request(warehouse_id))
+    second = await use_case.execute(_low_stock_request(warehouse_id))
+
+    assert first.fingerprint is None
+    assert second.source_report_id is None
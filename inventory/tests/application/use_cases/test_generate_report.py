@@ -22,7 +22,7 @@ def mock_s3_service():
     """Create a mock S3Service."""
     service = MagicMock(spec=S3Service)
     service.bucket_name = "test-bucket"
-    service.upload_report = AsyncMock(return_value="low_stock/user-123/report-123.json")
+    service.upload_report_stream = AsyncMock(return_value="low_stock/user-123/report-123.json")
     return service
 
 
@@ -88,7 +88,7 @@ async def test_generate_report_success(
     assert updated_report.completed_at is not None
 
     # Verify S3 upload was called
-    mock_s3_service.upload_report.assert_called_once()
+    mock_s3_service.upload_report_stream.assert_called_once()
 
     # Verify SQS notification was sent
     mock_sqs_publisher.publish_report_generated.assert_called_once()
@@ -113,7 +113,7 @@ async def test_generate_report_not_found(
     await use_case.execute(uuid.uuid4())
 
     # Verify no S3 upload or SQS notification
-    mock_s3_service.upload_report.assert_not_called()
+    mock_s3_service.upload_report_stream.assert_not_called()
     mock_sqs_publisher.publish_report_generated.assert_not_called()
 
 
@@ -138,7 +138,7 @@ async def test_generate_report_s3_upload_failure(
     report = await report_repository.create(report_data)
 
     # Mock S3 upload to raise exception
-    mock_s3_service.upload_report.side_effect = Exception("S3 upload failed")
+    mock_s3_service.upload_report_stream.side_effect = Exception("S3 upload failed")
 
     # Execute use case
     use_case = GenerateReportUseCase(
@@ -214,7 +214,7 @@ async def test_generate_report_update_failure_in_exception_handler(
     report = await report_repository.create(report_data)
 
     # Mock S3 upload to raise exception
-    mock_s3_service.upload_report.side_effect = Exception("S3 upload failed")
+    mock_s3_service.upload_report_stream.side_effect = Exception("S3 upload failed")
 
     # Execute use case
     use_case = GenerateReportUseCase(
@@ -297,7 +297,7 @@ async def test_generate_report_failed_report_not_reloadable(
     report = await report_repository.create(report_data)
 
     # Mock S3 upload to raise exception
-    mock_s3_service.upload_report.side_effect = Exception("S3 upload failed")
+    mock_s3_service.upload_report_stream.side_effect = Exception("S3 upload failed")
 
     # Execute use case
     use_case = GenerateReportUseCase(
@@ -325,3 +325,123 @@ async def test_generate_report_failed_report_not_reloadable(
     # The SQS publisher should only have been called once (for processing status update)
     # Actually it won't be called at all because the exception happens before completion
     assert mock_sqs_publisher.publish_report_generated.call_count == 0
+
+
+def _pending_report_data(**extra) -> dict:
+    return {
+        "report_type": ReportType.LOW_STOCK.value,
+        "status": ReportStatus.PENDING.value,
+        "user_id": uuid.uuid4(),
+        "start_date": datetime(2025, 1, 1, tzinfo=timezone.utc),
+        "end_date": datetime(2025, 1, 31, tzinfo=timezone.utc),
+        "filters": {},
+        **extra,
+    }
+
+
+@pytest.mark.asyncio
+async def test_generate_report_resolves_followers(
+    db_session: AsyncSession, mock_s3_service, mock_sqs_publisher
+):
+    """Test that finishing a report completes and notifies the reports waiting on it."""
+    report_repository = ReportRepository(db_session)
+    source = await report_repository.create(_pending_report_data())
+    follower = await report_repository.create(
+        _pending_report_data(source_report_id=source.id)
+    )
+    use_case = GenerateReportUseCase(
+        report_repository, db_session, mock_s3_service, mock_sqs_publisher
+    )
+
+    # The follower's own job finds its source still pending and waits
+    await use_case.execute(follower.id)
+    mock_sqs_publisher.publish_report_generated.assert_not_called()
+
+    await use_case.execute(source.id)
+
+    resolved = await report_repository.find_by_id(follower.id, follower.user_id)
+    assert resolved.status == ReportStatus.COMPLETED.value
+    assert resolved.s3_key == "low_stock/user-123/report-123.json"
+    mock_s3_service.upload_report_stream.assert_called_once()
+    notified = [
+        call.kwargs["report_id"]
+        for call in mock_sqs_publisher.publish_report_generated.call_args_list
+    ]
+    assert notified == [source.id, follower.id]
+
+
+@pytest.mark.asyncio
+async def test_generate_report_follower_of_finished_source(
+    db_session: AsyncSession, mock_s3_service, mock_sqs_publisher
+):
+    """Test that a follower whose source already failed resolves itself."""
+    mock_sqs_publisher.publish_report_failed = AsyncMock()
+    report_repository = ReportRepository(db_session)
+    source = await report_repository.create(_pending_report_data())
+    follower = await report_repository.create(
+        _pending_report_data(source_report_id=source.id)
+    )
+    await report_repository.update_status(
+        source.id, ReportStatus.FAILED.value, error_message="S3 down"
+    )
+
+    use_case = GenerateReportUseCase(
+        report_repository, db_session, mock_s3_service, mock_sqs_publisher
+    )
+    await use_case.execute(follower.id)
+
+    resolved = await report_repository.find_by_id(follower.id, follower.user_id)
+    assert resolved.status == ReportStatus.FAILED.value
+    assert resolved.error_message == "S3 down"
+    mock_s3_service.upload_report_stream.assert_not_called()
+    mock_sqs_publisher.publish_report_failed.assert_called_once()
+    assert mock_sqs_publisher.publish_report_failed.call_args.kwargs["report_id"] == follower.id
+
+
+@pytest.mark.asyncio
+async def test_generate_report_reused_report_only_notifies(
+    db_session: AsyncSession, mock_s3_service, mock_sqs_publisher
+):
+    """Test that a report reusing an artifact is not generated again."""
+    report_repository = ReportRepository(db_session)
+    source = await report_repository.create(_pending_report_data())
+    reused = await report_repository.create(
+        _pending_report_data(
+            status=ReportStatus.COMPLETED.value,
+            source_report_id=source.id,
+            s3_bucket="test-bucket",
+            s3_key="low_stock/shared.json",
+        )
+    )
+
+    use_case = GenerateReportUseCase(
+        report_repository, db_session, mock_s3_service, mock_sqs_publisher
+    )
+    await use_case.execute(reused.id)
+
+    mock_s3_service.upload_report_stream.assert_not_called()
+    call_args = mock_sqs_publisher.publish_report_generated.call_args.kwargs
+    assert call_args["report_id"] == reused.id
+    assert call_args["s3_key"] == "low_stock/shared.json"
+
+
+@pytest.mark.asyncio
+async def test_generate_report_follower_resolution_error_keeps_report_completed(
+    db_session: AsyncSession, mock_s3_service, mock_sqs_publisher
+):
+    """Test that failing to resolve followers does not fail the finished report."""
+    mock_sqs_publisher.publish_report_failed = AsyncMock()
+    report_repository = ReportRepository(db_session)
+    source = await report_repository.create(_pending_report_data())
+    use_case = GenerateReportUseCase(
+        report_repository, db_session, mock_s3_service, mock_sqs_publisher
+    )
+
+    report_repository.resolve_followers = AsyncMock(side_effect=Exception("db down"))
+
+    await use_case.execute(source.id)
+
+    finished = await report_repository.find_by_id(source.id, source.user_id)
+    assert finished.status == ReportStatus.COMPLETED.value
+    assert finished.error_message is None
+    mock_sqs_publisher.publish_report_failed.assert_not_called()
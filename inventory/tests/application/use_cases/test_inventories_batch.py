@@ -0,0 +1,75 @@
+"""Tests for GetInventoriesBatchUseCase and ReserveInventoriesUseCase."""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from src.application.use_cases.get_inventories_batch import GetInventoriesBatchUseCase
+from src.application.use_cases.reserve_inventories import ReserveInventoriesUseCase
+from src.domain.entities.inventory import Inventory as DomainInventory
+
+
+def _inventory(inventory_id, reserved=0):
+    return DomainInventory(
+        id=inventory_id,
+        product_id=uuid4(),
+        warehouse_id=uuid4(),
+        total_quantity=100,
+        reserved_quantity=reserved,
+        batch_number="BATCH-001",
+        expiration_date=datetime.now(timezone.utc),
+        product_sku="MED-001",
+        product_name="Test Product",
+        product_price=Decimal("10.00"),
+        product_category="medicamentos_especiales",
+        warehouse_name="Test Warehouse",
+        warehouse_city="Test City",
+        warehouse_country="Colombia",
+        created_at=datetime.now(timezone.utc),
+        updated_at=datetime.now(timezone.utc),
+    )
+
+
+@pytest.mark.asyncio
+async def test_batch_lookup_preserves_request_order_and_reports_missing():
+    first, second, missing = uuid4(), uuid4(), uuid4()
+    repository = AsyncMock()
+    repository.find_by_ids.return_value = [_inventory(second), _inventory(first)]
+
+    inventories, missing_ids = await GetInventoriesBatchUseCase(repository).execute(
+        [first, missing, second, first]
+    )
+
+    repository.find_by_ids.assert_called_once_with([first, missing, second])
+    assert [i.id for i in inventories] == [first, second]
+    assert missing_ids == [missing]
+
+
+@pytest.mark.asyncio
+async def test_reserve_aggregates_lines_per_inventory():
+    first, second = uuid4(), uuid4()
+    repository = AsyncMock()
+    repository.update_reserved_quantities.return_value = [_inventory(first, 7)]
+
+    result = await ReserveInventoriesUseCase(repository).execute(
+        [(first, 5), (second, 3), (first, 2), (second, -3)]
+    )
+
+    repository.update_reserved_quantities.assert_called_once_with({first: 7})
+    assert result[0].reserved_quantity == 7
+
+
+@pytest.mark.asyncio
+async def test_reserve_with_no_net_change_skips_repository():
+    inventory_id = uuid4()
+    repository = AsyncMock()
+
+    result = await ReserveInventoriesUseCase(repository).execute(
+        [(inventory_id, 4), (inventory_id, -4)]
+    )
+
+    assert result == []
+    repository.update_reserved_quantities.assert_not_called()
@@ -16,12 +16,13 @@ async def test_list_inventories_use_case_empty():
     mock_repository.list_inventories = AsyncMock(return_value=([], 0))
 
     use_case = ListInventoriesUseCase(mock_repository)
-    inventories, total = await use_case.execute(limit=10, offset=0)
+    inventories, total, next_cursor = await use_case.execute(limit=10, offset=0)
 
     assert len(inventories) == 0
     assert total == 0
     mock_repository.list_inventories.assert_called_once_with(
-        limit=10, offset=0, product_id=None, warehouse_id=None, sku=None, category=None, name=None
+        limit=10, offset=0, product_id=None, warehouse_id=None, sku=None, category=None, name=None,
+        after=None, include_total=True
     )
 
 
@@ -58,12 +59,13 @@ async def test_list_inventories_use_case_with_data():
     mock_repository.list_inventories = AsyncMock(return_value=(mock_inventories, 3))
 
     use_case = ListInventoriesUseCase(mock_repository)
-    inventories, total = await use_case.execute(limit=10, offset=0)
+    inventories, total, next_cursor = await use_case.execute(limit=10, offset=0)
 
     assert len(inventories) == 3
     assert total == 3
     mock_repository.list_inventories.assert_called_once_with(
-        limit=10, offset=0, product_id=None, warehouse_id=None, sku=None, category=None, name=None
+        limit=10, offset=0, product_id=None, warehouse_id=None, sku=None, category=None, name=None,
+        after=None, include_total=True
     )
 
 
@@ -77,7 +79,8 @@ async def test_list_inventories_use_case_default_pagination():
     await use_case.execute()
 
     mock_repository.list_inventories.assert_called_once_with(
-        limit=10, offset=0, product_id=None, warehouse_id=None, sku=None, category=None, name=None
+        limit=10, offset=0, product_id=None, warehouse_id=None, sku=None, category=None, name=None,
+        after=None, include_total=True
     )
 
 
@@ -91,7 +94,8 @@ async def test_list_inventories_use_case_with_offset():
     await use_case.execute(limit=5, offset=10)
 
     mock_repository.list_inventories.assert_called_once_with(
-        limit=5, offset=10, product_id=None, warehouse_id=None, sku=None, category=None, name=None
+        limit=5, offset=10, product_id=None, warehouse_id=None, sku=None, category=None, name=None,
+        after=None, include_total=True
     )
 
 
@@ -127,7 +131,7 @@ async def test_list_inventories_use_case_limit_exceeds_total():
     mock_repository.list_inventories = AsyncMock(return_value=(mock_inventories, 1))
 
     use_case = ListInventoriesUseCase(mock_repository)
-    inventories, total = await use_case.execute(limit=100, offset=0)
+    inventories, total, next_cursor = await use_case.execute(limit=100, offset=0)
 
     assert len(inventories) == 1
     assert total == 1
@@ -144,7 +148,8 @@ async def test_list_inventories_use_case_with_product_id_filter():
     await use_case.execute(product_id=product_id)
 
     mock_repository.list_inventories.assert_called_once_with(
-        limit=10, offset=0, product_id=product_id, warehouse_id=None, sku=None, category=None, name=None
+        limit=10, offset=0, product_id=product_id, warehouse_id=None, sku=None, category=None, name=None,
+        after=None, include_total=True
     )
 
 
@@ -159,7 +164,8 @@ async def test_list_inventories_use_case_with_warehouse_id_filter():
     await use_case.execute(warehouse_id=warehouse_id)
 
     mock_repository.list_inventories.assert_called_once_with(
-        limit=10, offset=0, product_id=None, warehouse_id=warehouse_id, sku=None, category=None, name=None
+        limit=10, offset=0, product_id=None, warehouse_id=warehouse_id, sku=None, category=None, name=None,
+        after=None, include_total=True
     )
 
 
@@ -173,7 +179,8 @@ async def test_list_inventories_use_case_with_sku_filter():
     await use_case.execute(sku="MED-001")
 
     mock_repository.list_inventories.assert_called_once_with(
-        limit=10, offset=0, product_id=None, warehouse_id=None, sku="MED-001", category=None, name=None
+        limit=10, offset=0, product_id=None, warehouse_id=None, sku="MED-001", category=None, name=None,
+        after=None, include_total=True
     )
 
 
@@ -187,7 +194,8 @@ async def test_list_inventories_use_case_with_category_filter():
     await use_case.execute(category="medicamentos_especiales")
 
     mock_repository.list_inventories.assert_called_once_with(
-        limit=10, offset=0, product_id=None, warehouse_id=None, sku=None, category="medicamentos_especiales", name=None
+        limit=10, offset=0, product_id=None, warehouse_id=None, sku=None, category="medicamentos_especiales", name=None,
+        after=None, include_total=True
     )
 
 
@@ -216,7 +224,9 @@ async def test_list_inventories_use_case_with_all_filters():
         warehouse_id=warehouse_id,
         sku="MED-001",
         category="insumos_quirurgicos",
-        name=None
+        name=None,
+        after=None,
+        include_total=True,
     )
 
 
@@ -251,7 +261,7 @@ async def test_list_inventories_use_case_returns_domain_entities():
     mock_repository.list_inventories = AsyncMock(return_value=([inventory], 1))
 
     use_case = ListInventoriesUseCase(mock_repository)
-    inventories, total = await use_case.execute()
+    inventories, total, next_cursor = await use_case.execute()
 
     assert len(inventories) == 1
     assert total == 1
@@ -273,7 +283,8 @@ async def test_list_inventories_use_case_with_name_filter():
     await use_case.execute(name="Aspirin")
 
     mock_repository.list_inventories.assert_called_once_with(
-        limit=10, offset=0, product_id=None, warehouse_id=None, sku=None, category=None, name="Aspirin"
+        limit=10, offset=0, product_id=None, warehouse_id=None, sku=None, category=None, name="Aspirin",
+        after=None, include_total=True
     )
 
 
@@ -308,13 +319,14 @@ async def test_list_inventories_use_case_with_name_filter_partial_match():
     mock_repository.list_inventories = AsyncMock(return_value=([aspirin_inventory], 1))
 
     use_case = ListInventoriesUseCase(mock_repository)
-    inventories, total = await use_case.execute(name="asp")
+    inventories, total, next_cursor = await use_case.execute(name="asp")
 
     assert len(inventories) == 1
     assert total == 1
     assert inventories[0].product_name == "Aspirin 100mg"
     mock_repository.list_inventories.assert_called_once_with(
-        limit=10, offset=0, product_id=None, warehouse_id=None, sku=None, category=None, name="asp"
+        limit=10, offset=0, product_id=None, warehouse_id=None, sku=None, category=None, name="asp",
+        after=None, include_total=True
     )
 
 
@@ -350,13 +362,14 @@ async def test_list_inventories_use_case_with_name_filter_case_insensitive():
 
     use_case = ListInventoriesUseCase(mock_repository)
     # Test with uppercase query on product with mixed case name
-    inventories, total = await use_case.execute(name="ASPIRIN")
+    inventories, total, next_cursor = await use_case.execute(name="ASPIRIN")
 
     assert len(inventories) == 1
     assert total == 1
     assert inventories[0].product_name == "Aspirin 100mg"
     mock_repository.list_inventories.assert_called_once_with(
-        limit=10, offset=0, product_id=None, warehouse_id=None, sku=None, category=None, name="ASPIRIN"
+        limit=10, offset=0, product_id=None, warehouse_id=None, sku=None, category=None, name="ASPIRIN",
+        after=None, include_total=True
     )
 
 
@@ -367,12 +380,13 @@ async def test_list_inventories_use_case_with_name_filter_no_results():
     mock_repository.list_inventories = AsyncMock(return_value=([], 0))
 
     use_case = ListInventoriesUseCase(mock_repository)
-    inventories, total = await use_case.execute(name="NonexistentProduct")
+    inventories, total, next_cursor = await use_case.execute(name="NonexistentProduct")
 
     assert len(inventories) == 0
     assert total == 0
     mock_repository.list_inventories.assert_called_once_with(
-        limit=10, offset=0, product_id=None, warehouse_id=None, sku=None, category=None, name="NonexistentProduct"
+        limit=10, offset=0, product_id=None, warehouse_id=None, sku=None, category=None, name="NonexistentProduct",
+        after=None, include_total=True
     )
 
 
@@ -412,13 +426,14 @@ async def test_list_inventories_use_case_with_name_filter_multiple_results():
     mock_repository.list_inventories = AsyncMock(return_value=(vitamin_inventories, 3))
 
     use_case = ListInventoriesUseCase(mock_repository)
-    inventories, total = await use_case.execute(name="Vitamin")
+    inventories, total, next_cursor = await use_case.execute(name="Vitamin")
 
     assert len(inventories) == 3
     assert total == 3
     assert all("Vitamin" in inv.product_name for inv in inventories)
     mock_repository.list_inventories.assert_called_once_with(
-        limit=10, offset=0, product_id=None, warehouse_id=None, sku=None, category=None, name="Vitamin"
+        limit=10, offset=0, product_id=None, warehouse_id=None, sku=None, category=None, name="Vitamin",
+        after=None, include_total=True
     )
 
 
@@ -475,13 +490,14 @@ async def test_list_inventories_use_case_with_name_filter_and_pagination():
     mock_repository.list_inventories = AsyncMock(return_value=([medicine_inventories[0]], 2))
 
     use_case = ListInventoriesUseCase(mock_repository)
-    inventories, total = await use_case.execute(name="Medicine", limit=1, offset=0)
+    inventories, total, next_cursor = await use_case.execute(name="Medicine", limit=1, offset=0)
 
     assert len(inventories) == 1
     assert total == 2
     assert inventories[0].product_name == "Medicine A"
     mock_repository.list_inventories.assert_called_once_with(
-        limit=1, offset=0, product_id=None, warehouse_id=None, sku=None, category=None, name="Medicine"
+        limit=1, offset=0, product_id=None, warehouse_id=None, sku=None, category=None, name="Medicine",
+        after=None, include_total=True
     )
 
 
@@ -518,13 +534,14 @@ async def test_list_inventories_use_case_with_name_filter_pagination_second_page
     mock_repository.list_inventories = AsyncMock(return_value=([medicine_inventory], 2))
 
     use_case = ListInventoriesUseCase(mock_repository)
-    inventories, total = await use_case.execute(name="Medicine", limit=1, offset=1)
+    inventories, total, next_cursor = await use_case.execute(name="Medicine", limit=1, offset=1)
 
     assert len(inventories) == 1
     assert total == 2
     assert inventories[0].product_name == "Medicine B"
     mock_repository.list_inventories.assert_called_once_with(
-        limit=1, offset=1, product_id=None, warehouse_id=None, sku=None, category=None, name="Medicine"
+        limit=1, offset=1, product_id=None, warehouse_id=None, sku=None, category=None, name="Medicine",
+        after=None, include_total=True
     )
 
 
@@ -559,7 +576,7 @@ async def test_list_inventories_use_case_with_name_and_other_filters():
     mock_repository.list_inventories = AsyncMock(return_value=([inventory], 1))
 
     use_case = ListInventoriesUseCase(mock_repository)
-    inventories, total = await use_case.execute(
+    inventories, total, next_cursor = await use_case.execute(
         name="Aspirin",
         sku="ASP-001",
         category="medicamentos_generales",
@@ -578,6 +595,8 @@ async def test_list_inventories_use_case_with_name_and_other_filters():
         sku="ASP-001",
         category="medicamentos_generales",
         name="Aspirin",
+        after=None,
+        include_total=True,
     )
 
 
@@ -613,13 +632,14 @@ async def test_list_inventories_use_case_with_name_filter_whitespace():
 
     use_case = ListInventoriesUseCase(mock_repository)
     # Test with whitespace in query
-    inventories, total = await use_case.execute(name="Ibuprofen 400")
+    inventories, total, next_cursor = await use_case.execute(name="Ibuprofen 400")
 
     assert len(inventories) == 1
     assert total == 1
     assert inventories[0].product_name == "Ibuprofen 400mg"
     mock_repository.list_inventories.assert_called_once_with(
-        limit=10, offset=0, product_id=None, warehouse_id=None, sku=None, category=None, name="Ibuprofen 400"
+        limit=10, offset=0, product_id=None, warehouse_id=None, sku=None, category=None, name="Ibuprofen 400",
+        after=None, include_total=True
     )
 
 
@@ -656,13 +676,14 @@ async def test_list_inventories_use_case_with_name_filter_special_characters():
 
     use_case = ListInventoriesUseCase(mock_repository)
     # Test with partial match including special characters
-    inventories, total = await use_case.execute(name="Cyanocobalamin")
+    inventories, total, next_cursor = await use_case.execute(name="Cyanocobalamin")
 
     assert len(inventories) == 1
     assert total == 1
     assert "Cyanocobalamin" in inventories[0].product_name
     mock_repository.list_inventories.assert_called_once_with(
-        limit=10, offset=0, product_id=None, warehouse_id=None, sku=None, category=None, name="Cyanocobalamin"
+        limit=10, offset=0, product_id=None, warehouse_id=None, sku=None, category=None, name="Cyanocobalamin",
+        after=None, include_total=True
     )
 
 
@@ -677,7 +698,8 @@ async def test_list_inventories_use_case_with_empty_name_filter():
     await use_case.execute(name="")
 
     mock_repository.list_inventories.assert_called_once_with(
-        limit=10, offset=0, product_id=None, warehouse_id=None, sku=None, category=None, name=""
+        limit=10, offset=0, product_id=None, warehouse_id=None, sku=None, category=None, name="",
+        after=None, include_total=True
     )
 
 
@@ -713,13 +735,14 @@ async def test_list_inventories_use_case_name_filter_middle_of_string():
 
     use_case = ListInventoriesUseCase(mock_repository)
     # Test matching text in the middle of product name
-    inventories, total = await use_case.execute(name="cetamol")
+    inventories, total, next_cursor = await use_case.execute(name="cetamol")
 
     assert len(inventories) == 1
     assert total == 1
     assert "cetamol" in inventories[0].product_name.lower()
     mock_repository.list_inventories.assert_called_once_with(
-        limit=10, offset=0, product_id=None, warehouse_id=None, sku=None, category=None, name="cetamol"
+        limit=10, offset=0, product_id=None, warehouse_id=None, sku=None, category=None, name="cetamol",
+        after=None, include_total=True
     )
 
 
@@ -755,11 +778,71 @@ async def test_list_inventories_use_case_name_filter_end_of_string():
 
     use_case = ListInventoriesUseCase(mock_repository)
     # Test matching text at the end of product name
-    inventories, total = await use_case.execute(name="Capsules")
+    inventories, total, next_cursor = await use_case.execute(name="Capsules")
 
     assert len(inventories) == 1
     assert total == 1
     assert inventories[0].product_name.endswith("Capsules")
     mock_repository.list_inventories.assert_called_once_with(
-        limit=10, offset=0, product_id=None, warehouse_id=None, sku=None, category=None, name="Capsules"
+        limit=10, offset=0, product_id=None, warehouse_id=None, sku=None, category=None, name="Capsules",
+        after=None, include_total=True
     )
+
+
+@pytest.mark.asyncio
+async def test_list_inventories_use_case_with_cursor():
+    """Test a cursor page seeks by keyset, skips the count and returns the next cursor."""
+    from src.domain.value_objects import InventoryCursor
+
+    now = datetime.now(timezone.utc)
+    mock_inventories = [
+        Inventory(
+            id=uuid.uuid4(),
+            product_id=uuid.uuid4(),
+            warehouse_id=uuid.uuid4(),
+            total_quantity=100,
+            reserved_quantity=0,
+            batch_number=f"BATCH00{i}",
+            expiration_date=datetime(2026, 12, 31, tzinfo=timezone.utc),
+            product_sku=f"SKU-00{i}",
+            product_name=f"Product {i}",
+            product_price=Decimal("10.50"),
+            product_category="medicamentos_especiales",
+            warehouse_name="Test Warehouse",
+            warehouse_city="Test City",
+            warehouse_country="Colombia",
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(2)
+    ]
+    mock_repository = AsyncMock()
+    mock_repository.list_inventories = AsyncMock(return_value=(mock_inventories, None))
+    cursor = InventoryCursor(product_name="Product 0", id=uuid.uuid4())
+
+    use_case = ListInventoriesUseCase(mock_repository)
+    inventories, total, next_cursor = await use_case.execute(limit=2, cursor=cursor.encode())
+
+    assert inventories == mock_inventories
+    assert total is None
+    assert InventoryCursor.decode(next_cursor) == InventoryCursor(
+        product_name="Product 1", id=mock_inventories[1].id
+    )
+    mock_repository.list_inventories.assert_called_once_with(
+        limit=2, offset=0, product_id=None, warehouse_id=None, sku=None, category=None,
+        name=None, after=cursor, include_total=False,
+    )
+
+
+@pytest.mark.asyncio
+async def test_list_inventories_use_case_invalid_cursor():
+    """Test a malformed cursor is rejected before querying."""
+    from src.domain.exceptions import InvalidInventoryCursorException
+
+    mock_repository = AsyncMock()
+    use_case = ListInventoriesUseCase(mock_repository)
+
+    with pytest.raises(InvalidInventoryCursorException):
+        await use_case.execute(cursor="%%%")
+
+    mock_repository.list_inventories.assert_not_called()
@@ -50,7 +50,7 @@ class TestListInventoriesUseCase:
         use_case = ListInventoriesUseCase(mock_repository)
 
         # When
-        inventories, total = await use_case.execute(
+        inventories, total, next_cursor = await use_case.execute(
             category="medicamentos_especiales"
         )
 
@@ -66,6 +66,8 @@ class TestListInventoriesUseCase:
             sku=None,
             category="medicamentos_especiales",
             name=None,
+            after=None,
+            include_total=True,
         )
 
     async def test_should_list_all_inventories_when_no_category_filter(self):
@@ -117,7 +119,7 @@ class TestListInventoriesUseCase:
         use_case = ListInventoriesUseCase(mock_repository)
 
         # When
-        inventories, total = await use_case.execute()
+        inventories, total, next_cursor = await use_case.execute()
 
         # Then
         assert total == 2
@@ -133,6 +135,8 @@ class TestListInventoriesUseCase:
             sku=None,
             category=None,
             name=None,
+            after=None,
+            include_total=True,
         )
 
     async def test_should_return_empty_list_when_no_inventories_match_category(self):
@@ -144,7 +148,7 @@ class TestListInventoriesUseCase:
         use_case = ListInventoriesUseCase(mock_repository)
 
         # When
-        inventories, total = await use_case.execute(
+        inventories, total, next_cursor = await use_case.execute(
             category="equipos_biomedicos"
         )
 
@@ -186,7 +190,7 @@ class TestListInventoriesUseCase:
         use_case = ListInventoriesUseCase(mock_repository)
 
         # When
-        result_inventories, total = await use_case.execute(
+        result_inventories, total, next_cursor = await use_case.execute(
             limit=5,
             offset=10,
             category="medicamentos_especiales"
@@ -203,6 +207,8 @@ class TestListInventoriesUseCase:
             sku=None,
             category="medicamentos_especiales",
             name=None,
+            after=None,
+            include_total=True,
         )
 
     async def test_should_combine_category_filter_with_other_filters(self):
@@ -237,7 +243,7 @@ class TestListInventoriesUseCase:
         use_case = ListInventoriesUseCase(mock_repository)
 
         # When
-        inventories, total = await use_case.execute(
+        inventories, total, next_cursor = await use_case.execute(
             product_id=product_id,
             warehouse_id=warehouse_id,
             category="medicamentos_especiales"
@@ -254,6 +260,8 @@ class TestListInventoriesUseCase:
             sku=None,
             category="medicamentos_especiales",
             name=None,
+            after=None,
+            include_total=True,
         )
 
     async def test_should_filter_by_sku_and_category_together(self):
@@ -286,7 +294,7 @@ class TestListInventoriesUseCase:
         use_case = ListInventoriesUseCase(mock_repository)
 
         # When
-        inventories, total = await use_case.execute(
+        inventories, total, next_cursor = await use_case.execute(
             sku="MED-001",
             category="medicamentos_especiales"
         )
@@ -304,6 +312,8 @@ class TestListInventoriesUseCase:
             sku="MED-001",
             category="medicamentos_especiales",
             name=None,
+            after=None,
+            include_total=True,
         )
 
     async def test_should_use_default_pagination_when_not_specified(self):
@@ -326,6 +336,8 @@ class TestListInventoriesUseCase:
             sku=None,
             category=None,
             name=None,
+            after=None,
+            include_total=True,
         )
 
     async def test_should_handle_large_result_sets_with_category_filter(self):
@@ -361,7 +373,7 @@ class TestListInventoriesUseCase:
         use_case = ListInventoriesUseCase(mock_repository)
 
         # When
-        result_inventories, total = await use_case.execute(
+        result_inventories, total, next_cursor = await use_case.execute(
             limit=100,
             category="medicamentos_especiales"
         )
@@ -404,4 +416,6 @@ class TestListInventoriesUseCase:
             sku=sku,
             category=category,
             name=None,
+            after=None,
+            include_total=True,
         )
@@ -238,3 +238,72 @@ async def test_list_reports_custom_limit(db_session: AsyncSession):
     assert len(result.reports) == 5
     assert result.total == 10
     assert result.limit == 5
+
+
+@pytest.mark.asyncio
+async def test_list_reports_cursor_walks_all_reports_once(db_session: AsyncSession):
+    """Test cursor pagination returns every report exactly once, ties included."""
+    report_repository = ReportRepository(db_session)
+
+    user_id = uuid.uuid4()
+
+    # Two pairs share a created_at so the id tie-breaker is exercised
+    for minute in [0, 1, 1, 2, 3, 3, 4]:
+        await report_repository.create({
+            "report_type": ReportType.LOW_STOCK.value,
+            "status": ReportStatus.PENDING.value,
+            "user_id": user_id,
+            "start_date": datetime(2025, 1, 1, tzinfo=timezone.utc),
+            "end_date": datetime(2025, 1, 31, tzinfo=timezone.utc),
+            "filters": {},
+            "created_at": datetime(2025, 2, 1, 10, minute, tzinfo=timezone.utc),
+        })
+
+    use_case = ListReportsUseCase(report_repository)
+    full = await use_case.execute(ListReportsInput(user_id=user_id, limit=100))
+
+    seen = []
+    cursor = None
+    while True:
+        result = await use_case.execute(
+            ListReportsInput(user_id=user_id, limit=3, cursor=cursor)
+        )
+        seen.extend(r.id for r in result.reports)
+        assert result.total == 7
+        if result.next_cursor is None:
+            break
+        cursor = result.next_cursor
+
+    assert seen == [r.id for r in full.reports]
+    assert len(set(seen)) == 7
+    assert full.next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_list_reports_cursor_ignores_offset(db_session: AsyncSession):
+    """Test that an offset sent along with a cursor does not skip reports."""
+    report_repository = ReportRepository(db_session)
+
+    user_id = uuid.uuid4()
+    for minute in range(6):
+        await report_repository.create({
+            "report_type": ReportType.LOW_STOCK.value,
+            "status": ReportStatus.PENDING.value,
+            "user_id": user_id,
+            "start_date": datetime(2025, 1, 1, tzinfo=timezone.utc),
+            "end_date": datetime(2025, 1, 31, tzinfo=timezone.utc),
+            "filters": {},
+            "created_at": datetime(2025, 2, 1, 10, minute, tzinfo=timezone.utc),
+        })
+
+    use_case = ListReportsUseCase(report_repository)
+    first = await use_case.execute(ListReportsInput(user_id=user_id, limit=2))
+    plain = await use_case.execute(
+        ListReportsInput(user_id=user_id, limit=2, cursor=first.next_cursor)
+    )
+    with_offset = await use_case.execute(
+        ListReportsInput(user_id=user_id, limit=2, offset=2, cursor=first.next_cursor)
+    )
+
+    assert [r.id for r in with_offset.reports] == [r.id for r in plain.reports]
+    assert with_offset.offset == 0
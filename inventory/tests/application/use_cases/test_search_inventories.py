@@ -0,0 +1,74 @@
+"""Tests for SearchInventoriesUseCase."""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from src.application.use_cases.search_inventories import (
+    SearchInventoriesUseCase,
+    normalize_search_term,
+)
+from src.domain.entities.inventory import Inventory as DomainInventory
+
+
+def _inventory(product_name):
+    return DomainInventory(
+        id=uuid4(),
+        product_id=uuid4(),
+        warehouse_id=uuid4(),
+        total_quantity=100,
+        reserved_quantity=0,
+        batch_number="BATCH-001",
+        expiration_date=datetime.now(timezone.utc),
+        product_sku="MED-001",
+        product_name=product_name,
+        product_price=Decimal("10.00"),
+        product_category="medicamentos_especiales",
+        warehouse_name="Test Warehouse",
+        warehouse_city="Test City",
+        warehouse_country="Colombia",
+        created_at=datetime.now(timezone.utc),
+        updated_at=datetime.now(timezone.utc),
+    )
+
+
+@pytest.mark.parametrize(
+    "text,expected",
+    [
+        ("Acetaminofén", "acetaminofen"),
+        ("  Algodón   ESTÉRIL ", "algodon esteril"),
+        ("Pañal Niño", "panal nino"),
+        ("MED-001", "med-001"),
+    ],
+)
+def test_normalize_search_term_folds_case_accents_and_spaces(text, expected):
+    assert normalize_search_term(text) == expected
+
+
+@pytest.mark.asyncio
+async def test_search_passes_normalized_term_to_repository():
+    warehouse_id = uuid4()
+    repository = AsyncMock()
+    repository.search_inventories.return_value = [_inventory("Acetaminofén 500mg")]
+
+    result = await SearchInventoriesUseCase(repository).execute(
+        "ACETAMINOFÉN", limit=5, warehouse_id=warehouse_id
+    )
+
+    repository.search_inventories.assert_called_once_with(
+        term="acetaminofen", limit=5, warehouse_id=warehouse_id
+    )
+    assert [i.product_name for i in result] == ["Acetaminofén 500mg"]
+
+
+@pytest.mark.asyncio
+async def test_search_blank_query_skips_repository():
+    repository = AsyncMock()
+
+    result = await SearchInventoriesUseCase(repository).execute("   ")
+
+    assert result == []
+    repository.search_inventories.assert_not_called()
@@ -0,0 +1,74 @@
+"""Unit tests for report fingerprints and deduplication metrics."""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from src.domain.services.report_dedup import (
+    GENERATED,
+    JOINED,
+    REUSED,
+    ReportDedupMetrics,
+    report_fingerprint,
+)
+
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+END = datetime(2025, 1, 31, tzinfo=timezone.utc)
+VERSION = datetime(2025, 1, 30, 17, 5, tzinfo=timezone.utc)
+
+
+def test_fingerprint_normalizes_equivalent_requests():
+    """Test that time zones, key order, ID case and empty filters do not matter."""
+    warehouse_id = uuid.uuid4()
+    bogota = timezone(timedelta(hours=-5))
+
+    a = report_fingerprint(
+        "low_stock",
+        START,
+        END,
+        {"warehouse_id": str(warehouse_id).upper(), "other": None},
+        VERSION,
+    )
+    b = report_fingerprint(
+        "low_stock",
+        START.astimezone(bogota),
+        END.replace(tzinfo=None),
+        {"warehouse_id": str(warehouse_id)},
+        VERSION.replace(tzinfo=None),
+    )
+
+    assert a == b
+    assert len(a) == 64
+
+
+def test_fingerprint_changes_with_request_or_data_version():
+    """Test that any difference in what the report would contain changes it."""
+    base = report_fingerprint("low_stock", START, END, None, VERSION)
+
+    assert base != report_fingerprint("top_products", START, END, None, VERSION)
+    assert base != report_fingerprint(
+        "low_stock", START, END + timedelta(seconds=1), None, VERSION
+    )
+    assert base != report_fingerprint(
+        "low_stock", START, END, {"warehouse_id": str(uuid.uuid4())}, VERSION
+    )
+    assert base != report_fingerprint(
+        "low_stock", START, END, None, VERSION + timedelta(microseconds=1)
+    )
+    assert base != report_fingerprint("low_stock", START, END, None, None)
+
+
+def test_metrics_hit_rate():
+    """Test that reused and joined requests count as hits."""
+    metrics = ReportDedupMetrics()
+    assert metrics.snapshot()["hit_rate"] == 0.0
+
+    for outcome in [REUSED, JOINED, GENERATED, GENERATED]:
+        metrics.record(outcome)
+
+    assert metrics.snapshot() == {
+        "requests": 4,
+        "reused": 1,
+        "joined": 1,
+        "generated": 2,
+        "hit_rate": 0.5,
+    }
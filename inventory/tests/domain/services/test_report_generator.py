@@ -1,4 +1,5 @@
 """Unit tests for LowStockReportGenerator."""
+import json
 import uuid
 from datetime import datetime, timezone
 from decimal import Decimal
@@ -334,3 +335,42 @@ async def test_generate_low_stock_report_total_available_quantity(
     expected_total = sum(item["available_quantity"] for item in report["data"])
     assert report["summary"]["total_available_quantity"] == expected_total
     assert report["summary"]["total_available_quantity"] == 21
+
+
+@pytest.mark.asyncio
+async def test_stream_low_stock_report_in_batches(
+    db_session: AsyncSession, sample_inventory_data, monkeypatch
+):
+    """Test that streamed chunks form the same document as generate."""
+    monkeypatch.setattr("src.domain.services.report_generator.STREAM_BATCH_SIZE", 2)
+    generator = LowStockReportGenerator(db_session)
+
+    start_date = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    end_date = datetime(2025, 1, 31, tzinfo=timezone.utc)
+
+    chunks = [chunk async for chunk in generator.stream(start_date, end_date)]
+    report = json.loads(b"".join(chunks))
+
+    # Header, two row batches (2 + 2) and the summary
+    assert len(chunks) == 4
+    assert len(report["data"]) == 4
+    assert report["summary"]["total_low_stock_items"] == 4
+    assert report["summary"]["critical_items"] == 1
+    assert set(report) == {
+        "report_type", "generated_at", "date_range", "filters", "data", "summary"
+    }
+
+
+@pytest.mark.asyncio
+async def test_stream_low_stock_report_without_rows(db_session: AsyncSession):
+    """Test that an empty stream is still a valid report."""
+    generator = LowStockReportGenerator(db_session)
+
+    start_date = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    end_date = datetime(2025, 1, 31, tzinfo=timezone.utc)
+
+    report = json.loads(b"".join([chunk async for chunk in generator.stream(start_date, end_date)]))
+
+    assert report["data"] == []
+    assert report["summary"]["total_low_stock_items"] == 0
+    assert report["summary"]["warehouses"] == []
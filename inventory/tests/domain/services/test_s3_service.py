@@ -173,3 +173,104 @@ async def test_upload_report_creates_valid_json(s3_service, sample_report_data):
         # Verify the uploaded body is valid JSON
         uploaded_json = json.loads(uploaded_body.decode("utf-8"))
         assert uploaded_json == sample_report_data
+
+
+async def _chunks(*parts: bytes):
+    for part in parts:
+        yield part
+
+
+def _multipart_client():
+    mock_s3_client = AsyncMock()
+    mock_s3_client.create_multipart_upload.return_value = {"UploadId": "upload-1"}
+    mock_s3_client.upload_part.side_effect = [
+        {"ETag": f'"etag-{n}"'} for n in range(1, 10)
+    ]
+    return mock_s3_client
+
+
+@pytest.mark.asyncio
+async def test_upload_report_stream_splits_parts():
+    """Test that chunks are buffered into parts of at least part_size bytes."""
+    s3_service = S3Service(bucket_name="test-bucket", part_size=10)
+    report_id = uuid4()
+    user_id = uuid4()
+    mock_s3_client = _multipart_client()
+
+    with patch.object(s3_service.session, "client") as mock_client:
+        mock_client.return_value.__aenter__.return_value = mock_s3_client
+
+        s3_key = await s3_service.upload_report_stream(
+            report_id=report_id,
+            user_id=user_id,
+            report_type="low_stock",
+            chunks=_chunks(b"123456", b"7890ab", b"cd", b"efghijklmn", b"op"),
+        )
+
+    assert s3_key.startswith(f"low_stock/{user_id}/")
+    assert s3_key.endswith(f"{report_id}.json")
+
+    create_args = mock_s3_client.create_multipart_upload.call_args[1]
+    assert create_args["Key"] == s3_key
+    assert create_args["ContentType"] == "application/json"
+    assert create_args["Metadata"]["report_id"] == str(report_id)
+
+    bodies = [c[1]["Body"] for c in mock_s3_client.upload_part.call_args_list]
+    assert bodies == [b"1234567890ab", b"cdefghijklmn", b"op"]
+    assert [c[1]["PartNumber"] for c in mock_s3_client.upload_part.call_args_list] == [1, 2, 3]
+
+    complete_args = mock_s3_client.complete_multipart_upload.call_args[1]
+    assert complete_args["UploadId"] == "upload-1"
+    assert complete_args["MultipartUpload"]["Parts"] == [
+        {"ETag": '"etag-1"', "PartNumber": 1},
+        {"ETag": '"etag-2"', "PartNumber": 2},
+        {"ETag": '"etag-3"', "PartNumber": 3},
+    ]
+    mock_s3_client.abort_multipart_upload.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_upload_report_stream_small_body_single_part(s3_service):
+    """Test that a body below part_size is sent as one part."""
+    mock_s3_client = _multipart_client()
+
+    with patch.object(s3_service.session, "client") as mock_client:
+        mock_client.return_value.__aenter__.return_value = mock_s3_client
+
+        await s3_service.upload_report_stream(
+            report_id=uuid4(),
+            user_id=uuid4(),
+            report_type="low_stock",
+            chunks=_chunks(b'{"data": [', b"]}"),
+        )
+
+    mock_s3_client.upload_part.assert_called_once()
+    assert mock_s3_client.upload_part.call_args[1]["Body"] == b'{"data": []}'
+    mock_s3_client.complete_multipart_upload.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_upload_report_stream_aborts_on_failure(s3_service):
+    """Test that a failure while producing the body aborts the upload."""
+
+    async def failing_chunks():
+        yield b'{"data": ['
+        raise RuntimeError("database connection lost")
+
+    mock_s3_client = _multipart_client()
+
+    with patch.object(s3_service.session, "client") as mock_client:
+        mock_client.return_value.__aenter__.return_value = mock_s3_client
+
+        with pytest.raises(RuntimeError, match="database connection lost"):
+            await s3_service.upload_report_stream(
+                report_id=uuid4(),
+                user_id=uuid4(),
+                report_type="low_stock",
+                chunks=failing_chunks(),
+            )
+
+    mock_s3_client.complete_multipart_upload.assert_not_called()
+    abort_args = mock_s3_client.abort_multipart_upload.call_args[1]
+    assert abort_args["UploadId"] == "upload-1"
+    assert abort_args["Bucket"] == "test-bucket"
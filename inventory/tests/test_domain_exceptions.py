@@ -1,11 +1,16 @@
 """Tests for domain exceptions."""
 import uuid
+from datetime import datetime, timezone
+
+import pytest
 
 from src.domain.exceptions import (
+    InvalidReportCursorException,
     ProductNotFoundException,
     InventoryNotFoundException,
     ReservedQuantityExceedsTotalException,
 )
+from src.domain.value_objects import ReportCursor
 
 
 def test_product_not_found_exception():
@@ -39,3 +44,21 @@ def test_reserved_quantity_exceeds_total_exception():
     assert f"Reserved quantity ({reserved})" in exc.message
     assert f"total quantity ({total})" in exc.message
     assert exc.error_code == "RESERVED_QUANTITY_EXCEEDS_TOTAL"
+
+
+def test_report_cursor_round_trip():
+    """Test that an encoded report cursor decodes to the same key."""
+    cursor = ReportCursor(
+        created_at=datetime(2025, 2, 1, 10, 30, 15, 123456, tzinfo=timezone.utc),
+        id=uuid.uuid4(),
+    )
+
+    assert ReportCursor.decode(cursor.encode()) == cursor
+
+
+def test_invalid_report_cursor_exception():
+    """Test that a malformed report cursor raises InvalidReportCursorException."""
+    with pytest.raises(InvalidReportCursorException) as exc_info:
+        ReportCursor.decode("not-a-cursor")
+
+    assert exc_info.value.error_code == "INVALID_REPORT_CURSOR"
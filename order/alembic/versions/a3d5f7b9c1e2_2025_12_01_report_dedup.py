@@ -0,0 +1,44 @@
+"""2025_12_01_report_dedup
+
+Revision ID: a3d5f7b9c1e2
+Revises: f2c8a4d6e913
+Create Date: 2025-12-01 08:52:36.118904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3d5f7b9c1e2'
+down_revision: Union[str, Sequence[str], None] = 'f2c8a4d6e913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('order_reports', sa.Column('fingerprint', sa.String(length=64), nullable=True))
+    op.add_column('order_reports', sa.Column('source_report_id', sa.UUID(), nullable=True))
+    op.create_index(
+        'idx_order_reports_fingerprint',
+        'order_reports',
+        ['fingerprint', 'created_at'],
+        unique=False,
+    )
+    op.create_index(
+        'idx_order_reports_source',
+        'order_reports',
+        ['source_report_id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_order_reports_source', table_name='order_reports')
+    op.drop_index('idx_order_reports_fingerprint', table_name='order_reports')
+    op.drop_column('order_reports', 'source_report_id')
+    op.drop_column('order_reports', 'fingerprint')
@@ -0,0 +1,33 @@
+"""2025_11_26_report_keyset_index
+
+Revision ID: d4a7e9b1c2f3
+Revises: c3f1d2a4b5e6
+Create Date: 2025-11-26 10:04:17.318442
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4a7e9b1c2f3'
+down_revision: Union[str, Sequence[str], None] = 'c3f1d2a4b5e6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'idx_order_reports_user_created',
+        'order_reports',
+        ['user_id', 'created_at', 'id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_order_reports_user_created', table_name='order_reports')
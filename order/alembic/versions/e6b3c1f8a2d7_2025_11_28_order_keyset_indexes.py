@@ -0,0 +1,40 @@
+"""2025_11_28_order_keyset_indexes
+
+Revision ID: e6b3c1f8a2d7
+Revises: d4a7e9b1c2f3
+Create Date: 2025-11-28 09:41:52.604113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6b3c1f8a2d7'
+down_revision: Union[str, Sequence[str], None] = 'd4a7e9b1c2f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'idx_orders_fecha_pedido_id',
+        'orders',
+        ['fecha_pedido', 'id'],
+        unique=False,
+    )
+    op.create_index(
+        'idx_orders_customer_fecha_pedido',
+        'orders',
+        ['customer_id', 'fecha_pedido', 'id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_orders_customer_fecha_pedido', table_name='orders')
+    op.drop_index('idx_orders_fecha_pedido_id', table_name='orders')
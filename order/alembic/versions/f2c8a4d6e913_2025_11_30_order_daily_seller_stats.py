@@ -0,0 +1,55 @@
+"""2025_11_30_order_daily_seller_stats
+
+Revision ID: f2c8a4d6e913
+Revises: e6b3c1f8a2d7
+Create Date: 2025-11-30 10:17:08.214736
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2c8a4d6e913'
+down_revision: Union[str, Sequence[str], None] = 'e6b3c1f8a2d7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('order_daily_seller_stats',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('seller_id', sa.UUID(), nullable=False),
+    sa.Column('seller_name', sa.String(length=255), nullable=True),
+    sa.Column('seller_email', sa.String(length=255), nullable=True),
+    sa.Column('order_count', sa.Integer(), nullable=False),
+    sa.Column('revenue', sa.Numeric(precision=14, scale=2), nullable=False),
+    sa.Column('last_order_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('day', 'seller_id')
+    )
+    # Populate from existing orders; `python main.py backfill-daily-stats`
+    # rebuilds any range later on
+    op.execute(
+        """
+        INSERT INTO order_daily_seller_stats
+            (day, seller_id, seller_name, seller_email, order_count, revenue, last_order_at)
+        SELECT DISTINCT ON (day, seller_id)
+            day, seller_id, seller_name, seller_email,
+            count(*) OVER w, sum(monto_total) OVER w, max(fecha_pedido) OVER w
+        FROM (
+            SELECT (fecha_pedido AT TIME ZONE 'UTC')::date AS day, *
+            FROM orders
+            WHERE seller_id IS NOT NULL
+        ) o
+        WINDOW w AS (PARTITION BY day, seller_id)
+        ORDER BY day, seller_id, fecha_pedido DESC
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('order_daily_seller_stats')
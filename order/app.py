@@ -1,14 +1,18 @@
 
+import asyncio
 import logging
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
 from src.adapters.input.controllers.common_controller import router as common_router
 from src.adapters.input.controllers.order_controller import router as order_router
+from src.adapters.input.controllers.outbox_controller import router as outbox_router
 from src.adapters.input.controllers.reports_controller import router as reports_router
 from src.infrastructure.api.exception_handlers import register_exception_handlers
 from src.infrastructure.config.logger import setup_logging
 from src.infrastructure.config.settings import settings
+from src.infrastructure.dependencies import get_outbox_relay
 
 # Setup logging
 setup_logging()
@@ -16,6 +20,27 @@ setup_logging()
 # Get logger for this module
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run the outbox relay for the lifetime of the app."""
+    relay_task = None
+    if settings.outbox_relay_enabled:
+        relay = get_outbox_relay()
+        relay_task = asyncio.create_task(relay.start())
+        logger.info("Outbox relay started")
+
+    yield
+
+    if relay_task is not None:
+        await get_outbox_relay().stop()
+        try:
+            await asyncio.wait_for(relay_task, timeout=10.0)
+        except asyncio.TimeoutError:
+            relay_task.cancel()
+        logger.info("Outbox relay stopped")
+
+
 app = FastAPI(
     title=settings.app_name,
     description=settings.app_description,
@@ -27,6 +52,7 @@ app = FastAPI(
     docs_url=settings.docs_url,
     redoc_url=settings.redoc_url,
     openapi_url=settings.openapi_url,
+    lifespan=lifespan,
 )
 
 logger.info(f"Starting {settings.app_name} v{settings.app_version}")
@@ -37,3 +63,4 @@ register_exception_handlers(app)
 app.include_router(common_router, prefix="/order")
 app.include_router(order_router, prefix="/order")
 app.include_router(reports_router, prefix="/order")
+app.include_router(outbox_router, prefix="/order")
@@ -0,0 +1,141 @@
+"""
+Benchmark: orders_per_seller report from raw orders vs. the daily rollup.
+
+Seeds an in-memory SQLite database with a year of synthetic seller orders,
+builds ``order_daily_seller_stats`` with ``OrderDailyStatsRepository.rebuild``
+(what ``python main.py backfill-daily-stats`` runs) and times the report
+over increasing date ranges. The raw variant is the previous single
+GROUP BY over ``orders``, whose cost grows with the number of orders in the
+range; ``OrdersPerSellerReportGenerator`` reads one row per seller and day
+for whole days and only scans orders for the partial days at the edges.
+
+Usage (from the order directory):
+    python -m benchmarks.daily_rollup_benchmark --orders-per-day 2000 --ranges 7 30 90 365
+"""
+
+import argparse
+import asyncio
+import random
+import time
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from typing import List
+
+from sqlalchemy import and_, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.adapters.output.repositories.order_daily_stats_repository import (
+    OrderDailyStatsRepository,
+)
+from src.domain.services.report_generators import OrdersPerSellerReportGenerator
+from src.infrastructure.database.models import Base
+from src.infrastructure.database.models import Order as OrderModel
+
+YEAR_START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+async def _seed(session: AsyncSession, days: int, orders_per_day: int, sellers: int) -> None:
+    rng = random.Random(42)
+    seller_ids = [uuid.uuid4() for _ in range(sellers)]
+    for day in range(days):
+        midnight = YEAR_START + timedelta(days=day)
+        await session.execute(
+            insert(OrderModel),
+            [
+                {
+                    "id": uuid.uuid4(),
+                    "customer_id": uuid.uuid4(),
+                    "seller_id": seller_ids[i % sellers],
+                    "seller_name": f"Seller {i % sellers}",
+                    "seller_email": f"seller{i % sellers}@example.com",
+                    "fecha_pedido": midnight + timedelta(seconds=rng.randrange(86400)),
+                    "metodo_creacion": "app_vendedor",
+                    "direccion_entrega": "Calle 1",
+                    "ciudad_entrega": "Bogota",
+                    "pais_entrega": "Colombia",
+                    "customer_name": "Cliente",
+                    "monto_total": Decimal(rng.randrange(1000, 100000)) / 100,
+                }
+                for i in range(orders_per_day)
+            ],
+        )
+    await session.commit()
+
+
+async def _raw_report(session: AsyncSession, start_date: datetime, end_date: datetime):
+    """The report query before the rollup: one GROUP BY over the range."""
+    stmt = (
+        select(
+            OrderModel.seller_id,
+            OrderModel.seller_name,
+            OrderModel.seller_email,
+            func.count(OrderModel.id).label("total_orders"),
+            func.sum(OrderModel.monto_total).label("total_revenue"),
+        )
+        .where(
+            and_(
+                OrderModel.fecha_pedido >= start_date,
+                OrderModel.fecha_pedido <= end_date,
+                OrderModel.seller_id.isnot(None),
+            )
+        )
+        .group_by(OrderModel.seller_id, OrderModel.seller_name, OrderModel.seller_email)
+        .order_by(func.sum(OrderModel.monto_total).desc())
+    )
+    return (await session.execute(stmt)).all()
+
+
+async def _time(coro_factory, repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        await coro_factory()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _report(days: int, raw_s: float, rollup_s: float) -> None:
+    print(
+        f"range {days:>4} days   raw {raw_s * 1000:>9.2f} ms   "
+        f"rollup {rollup_s * 1000:>7.2f} ms   x{raw_s / rollup_s:>7.1f}"
+    )
+
+
+async def main(orders_per_day: int, sellers: int, ranges: List[int], repeats: int) -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with session_factory() as session:
+        print(f"Seeding 365 days x {orders_per_day} orders ({sellers} sellers)...")
+        await _seed(session, 365, orders_per_day, sellers)
+
+        start = time.perf_counter()
+        rows = await OrderDailyStatsRepository(session).rebuild(
+            date(2025, 1, 1), date(2025, 12, 31)
+        )
+        print(f"Backfilled {rows} rollup rows in {time.perf_counter() - start:.2f} s")
+        print(f"{365 * orders_per_day} orders, best of {repeats}\n")
+
+        generator = OrdersPerSellerReportGenerator(session)
+        for days in ranges:
+            # End mid-day, as a report "up to now" would
+            end_date = YEAR_START + timedelta(days=days - 1, hours=13, minutes=30)
+            start_date = end_date - timedelta(days=days)
+            raw_s = await _time(lambda: _raw_report(session, start_date, end_date), repeats)
+            rollup_s = await _time(lambda: generator.generate(start_date, end_date), repeats)
+            _report(days, raw_s, rollup_s)
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--orders-per-day", type=int, default=2000)
+    parser.add_argument("--sellers", type=int, default=50)
+    parser.add_argument("--ranges", type=int, nargs="+", default=[7, 30, 90, 365])
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(main(args.orders_per_day, args.sellers, args.ranges, args.repeats))
@@ -1,5 +1,7 @@
+import asyncio
 import subprocess
-from datetime import datetime
+from datetime import date, datetime, timedelta
+from typing import Optional
 
 import typer
 import uvicorn
@@ -54,6 +56,65 @@ def migrate():
         typer.echo(result.stderr)
 
 
+@app.command()
+def backfill_daily_stats(
+    start: Optional[datetime] = typer.Option(
+        None, formats=["%Y-%m-%d"], help="First day to rebuild (default: oldest order)"
+    ),
+    end: Optional[datetime] = typer.Option(
+        None, formats=["%Y-%m-%d"], help="Last day to rebuild (default: newest order)"
+    ),
+    chunk_days: int = typer.Option(31, help="Days rebuilt per transaction"),
+):
+    """Rebuild the order_daily_seller_stats rollup from the orders table."""
+    asyncio.run(
+        _backfill_daily_stats(
+            start.date() if start else None, end.date() if end else None, chunk_days
+        )
+    )
+
+
+async def _backfill_daily_stats(
+    start_day: Optional[date], end_day: Optional[date], chunk_days: int
+):
+    from sqlalchemy import func, select
+
+    from src.adapters.output.repositories.order_daily_stats_repository import (
+        OrderDailyStatsRepository,
+    )
+    from src.domain.value_objects import utc_day
+    from src.infrastructure.database.config import async_session, engine
+    from src.infrastructure.database.models import Order
+
+    async with async_session() as session:
+        if start_day is None or end_day is None:
+            oldest, newest = (
+                await session.execute(
+                    select(func.min(Order.fecha_pedido), func.max(Order.fecha_pedido))
+                )
+            ).one()
+            if oldest is None:
+                typer.echo("No orders to backfill")
+                await engine.dispose()
+                return
+            start_day = start_day or utc_day(oldest)
+            end_day = end_day or utc_day(newest)
+
+        typer.echo(f"Rebuilding daily seller stats for {start_day}..{end_day}")
+        repository = OrderDailyStatsRepository(session)
+        day = start_day
+        total = 0
+        while day <= end_day:
+            chunk_end = min(day + timedelta(days=chunk_days - 1), end_day)
+            rows = await repository.rebuild(day, chunk_end)
+            total += rows
+            typer.echo(f"{day}..{chunk_end}: {rows} rows")
+            day = chunk_end + timedelta(days=1)
+        typer.echo(f"Backfill completed: {total} rows")
+
+    await engine.dispose()
+
+
 @app.command()
 def lint():
     """Run code quality tools: black, isort, and flake8."""
@@ -1,6 +1,7 @@
 """Order controller for HTTP endpoints."""
 
 import logging
+from typing import List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query
@@ -28,6 +29,7 @@ from src.application.use_cases import (
 )
 from src.application.use_cases.list_customer_orders import ListCustomerOrdersUseCase
 from src.domain.entities import Order as OrderEntity
+from src.domain.exceptions import ValidationException
 from src.domain.value_objects import CreationMethod
 from src.infrastructure.database.config import get_db
 from src.infrastructure.dependencies import get_create_order_use_case
@@ -90,6 +92,44 @@ def _entity_to_response(order_entity: OrderEntity) -> OrderResponse:
     )
 
 
+def _paginated_response(
+    orders: List[OrderEntity],
+    total: Optional[int],
+    next_cursor: Optional[str],
+    limit: int,
+    offset: int,
+    cursor: Optional[str],
+) -> PaginatedOrdersResponse:
+    """
+    Build a listing page; without a total, has_next comes from the cursor.
+
+    Args:
+        orders: Orders in the page
+        total: Total count, or None when it was not counted
+        next_cursor: Cursor after this page, if it was full
+        limit: Requested page size
+        offset: Requested offset
+        cursor: Cursor the page was requested with
+
+    Returns:
+        PaginatedOrdersResponse
+    """
+    if total is not None:
+        has_next = (offset + limit) < total
+    else:
+        has_next = next_cursor is not None
+
+    return PaginatedOrdersResponse(
+        items=[_entity_to_response(order) for order in orders],
+        total=total,
+        page=(offset // limit) + 1 if limit > 0 else 1,
+        size=len(orders),
+        has_next=has_next,
+        has_previous=offset > 0 or cursor is not None,
+        next_cursor=next_cursor if has_next else None,
+    )
+
+
 @router.post(
     "/order",
     response_model=OrderCreateResponse,
@@ -174,40 +214,37 @@ async def create_order(
 async def list_orders(
     limit: int = Query(10, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    include_total: bool = Query(True, description="Count all orders (first page only)"),
     db: AsyncSession = Depends(get_db),
 ):
     """
-    List orders with pagination.
+    List orders with pagination, newest first.
 
     Args:
         limit: Maximum number of orders to return (1-100)
         offset: Number of orders to skip
+        cursor: Continue after a previous page by keyset instead of offset
+        include_total: Whether to count all orders
         db: Database session
 
     Returns:
         PaginatedOrdersResponse with orders
     """
-    logger.info(f"Listing orders (limit={limit}, offset={offset})")
+    logger.info(f"Listing orders (limit={limit}, offset={offset}, cursor={cursor})")
 
     try:
         repository = OrderRepository(db)
         use_case = ListOrdersUseCase(order_repository=repository)
 
-        orders, total = await use_case.execute(limit=limit, offset=offset)
-
-        page = (offset // limit) + 1 if limit > 0 else 1
-        has_next = (offset + limit) < total
-        has_previous = offset > 0
-
-        return PaginatedOrdersResponse(
-            items=[_entity_to_response(order) for order in orders],
-            total=total,
-            page=page,
-            size=len(orders),
-            has_next=has_next,
-            has_previous=has_previous,
+        orders, total, next_cursor = await use_case.execute(
+            limit=limit, offset=offset, cursor=cursor, include_total=include_total
         )
 
+        return _paginated_response(orders, total, next_cursor, limit, offset, cursor)
+
+    except ValidationException:
+        raise
     except Exception as e:
         logger.error(f"Error listing orders: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -268,15 +305,19 @@ async def list_customer_orders(
     customer_id: UUID,
     limit: int = Query(10, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    include_total: bool = Query(True, description="Count all orders (first page only)"),
     db: AsyncSession = Depends(get_db),
 ):
     """
-    List orders for a specific customer with pagination.
+    List orders for a specific customer with pagination, newest first.
 
     Args:
         customer_id: Customer UUID
         limit: Maximum number of orders to return (1-100)
         offset: Number of orders to skip
+        cursor: Continue after a previous page by keyset instead of offset
+        include_total: Whether to count the customer's orders
         db: Database session
 
     Returns:
@@ -288,23 +329,18 @@ async def list_customer_orders(
         repository = OrderRepository(db)
         use_case = ListCustomerOrdersUseCase(order_repository=repository)
 
-        orders, total = await use_case.execute(
-            customer_id=customer_id, limit=limit, offset=offset
+        orders, total, next_cursor = await use_case.execute(
+            customer_id=customer_id,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            include_total=include_total,
         )
 
-        page = (offset // limit) + 1 if limit > 0 else 1
-        has_next = (offset + limit) < total
-        has_previous = offset > 0
-
-        return PaginatedOrdersResponse(
-            items=[_entity_to_response(order) for order in orders],
-            total=total,
-            page=page,
-            size=len(orders),
-            has_next=has_next,
-            has_previous=has_previous,
-        )
+        return _paginated_response(orders, total, next_cursor, limit, offset, cursor)
 
+    except ValidationException:
+        raise
     except Exception as e:
         logger.error(f"Error listing orders for customer {customer_id}: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail="Internal server error")
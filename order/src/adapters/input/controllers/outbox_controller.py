@@ -0,0 +1,33 @@
+"""Thin controller exposing outbox relay metrics."""
+from datetime import datetime, timezone
+
+from fastapi import APIRouter, Depends
+
+from src.adapters.input.outbox_relay import OutboxRelay
+from src.adapters.input.schemas import OutboxMetricsResponse
+from src.application.ports import OutboxRepository
+from src.infrastructure.dependencies import get_outbox_relay, get_outbox_repository
+
+router = APIRouter(tags=["outbox"])
+
+
+@router.get("/outbox/metrics", response_model=OutboxMetricsResponse)
+async def get_outbox_metrics(
+    relay: OutboxRelay = Depends(get_outbox_relay),
+    repository: OutboxRepository = Depends(get_outbox_repository),
+) -> OutboxMetricsResponse:
+    """Relay counters plus the age of the oldest unpublished event."""
+    lag = await repository.get_lag()
+    lag_seconds = 0.0
+    if lag.oldest_created_at is not None:
+        oldest = lag.oldest_created_at
+        if oldest.tzinfo is None:
+            oldest = oldest.replace(tzinfo=timezone.utc)
+        lag_seconds = max((datetime.now(timezone.utc) - oldest).total_seconds(), 0.0)
+
+    return OutboxMetricsResponse(
+        **relay.metrics(),
+        pending=lag.pending,
+        oldest_pending_at=lag.oldest_created_at,
+        lag_seconds=round(lag_seconds, 3),
+    )
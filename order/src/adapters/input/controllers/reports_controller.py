@@ -13,6 +13,7 @@ from fastapi.responses import JSONResponse
 from src.adapters.input.schemas import (
     PaginatedReportsResponse,
     ReportCreateInput,
+    ReportDedupMetricsResponse,
     ReportResponse,
 )
 from src.application.use_cases.create_report import CreateReportUseCase
@@ -22,11 +23,14 @@ from src.application.use_cases.list_reports import (
     ListReportsInput,
     ListReportsUseCase,
 )
+from src.domain.services.report_dedup import ReportDedupMetrics
+from src.infrastructure.config.settings import settings
 from src.infrastructure.dependencies import (
     get_create_report_use_case,
     get_generate_report_use_case,
     get_get_report_use_case,
     get_list_reports_use_case,
+    get_report_dedup_metrics,
 )
 
 router = APIRouter(tags=["reports"])
@@ -52,7 +56,7 @@ async def create_report(
     """
     # Create report from use case input
     from src.application.use_cases.create_report import CreateReportInput as UseCaseInput
-    from src.domain.value_objects import ReportType
+    from src.domain.value_objects import ReportStatus, ReportType
 
     use_case_input = UseCaseInput(
         user_id=report_input.user_id,
@@ -64,14 +68,19 @@ async def create_report(
 
     report = await create_use_case.execute(use_case_input)
 
-    # Schedule background generation
+    # Schedule background generation (or notification, for a reused report)
     background_tasks.add_task(generate_use_case.execute, report.id)
 
+    if report.status == ReportStatus.COMPLETED:
+        message = "An identical report is already available."
+    else:
+        message = "Report generation started. You will be notified when ready."
+
     return JSONResponse(
         content={
             "report_id": str(report.id),
             "status": report.status.value,
-            "message": "Report generation started. You will be notified when ready.",
+            "message": message,
         },
         status_code=202,
     )
@@ -91,6 +100,7 @@ async def list_reports(
     offset: int = Query(0, ge=0),
     status: Optional[str] = Query(None),
     report_type: Optional[str] = Query(None),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
     use_case: ListReportsUseCase = Depends(get_list_reports_use_case),
 ):
     """List reports for the authenticated user - THIN controller."""
@@ -101,14 +111,19 @@ async def list_reports(
         offset=offset,
         status=status,
         report_type=report_type,
+        cursor=cursor,
     )
 
     result = await use_case.execute(input_data)
 
-    # Calculate pagination
+    # Calculate pagination (a cursor page's position within total is unknown)
     page = (offset // limit) + 1 if limit > 0 else 1
-    has_next = (offset + limit) < result.total
-    has_previous = offset > 0
+    if cursor:
+        has_next = result.next_cursor is not None
+        has_previous = True
+    else:
+        has_next = (offset + limit) < result.total
+        has_previous = offset > 0
 
     # Convert to response schema
     items = [
@@ -134,6 +149,18 @@ async def list_reports(
         size=len(items),
         has_next=has_next,
         has_previous=has_previous,
+        next_cursor=result.next_cursor,
+    )
+
+
+@router.get("/reports/dedup/metrics", response_model=ReportDedupMetricsResponse)
+async def get_report_dedup_metrics_view(
+    metrics: ReportDedupMetrics = Depends(get_report_dedup_metrics),
+) -> ReportDedupMetricsResponse:
+    """How many report requests reused or joined an existing report."""
+    return ReportDedupMetricsResponse(
+        **metrics.snapshot(),
+        freshness_window_seconds=settings.report_dedup_window_seconds,
     )
 
 
@@ -0,0 +1,113 @@
+"""Background relay that drains the order outbox to SNS."""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.use_cases.relay_outbox import OutboxRelayResult, RelayOutboxUseCase
+
+logger = logging.getLogger(__name__)
+
+UseCaseFactory = Callable[[AsyncSession], RelayOutboxUseCase]
+
+# Window used to compute events/second throughput
+THROUGHPUT_WINDOW_SECONDS = 60.0
+
+
+class OutboxRelay:
+    """
+    Background worker that publishes outbox events in batches.
+
+    Each batch runs on its own session. Full batches are followed immediately
+    by the next one; when the outbox is drained the relay sleeps until the
+    poll interval elapses or ``wake()`` is called after a new order commits.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        use_case_factory: UseCaseFactory,
+        poll_interval_seconds: float = 1.0,
+        error_backoff_seconds: float = 5.0,
+    ):
+        self._session_factory = session_factory
+        self._use_case_factory = use_case_factory
+        self._poll_interval = poll_interval_seconds
+        self._error_backoff = error_backoff_seconds
+        self._running = False
+        self._wake_event = asyncio.Event()
+        self._recent: Deque[Tuple[float, int]] = deque()
+        self._totals: Dict[str, int] = {
+            "batches": 0,
+            "claimed": 0,
+            "published": 0,
+            "failed": 0,
+            "errors": 0,
+        }
+        self._last_batch_ms = 0
+
+    async def start(self) -> None:
+        """Run batches until stopped."""
+        self._running = True
+        logger.info("Starting outbox relay")
+
+        while self._running:
+            try:
+                result = await self.run_batch()
+            except Exception as e:
+                self._totals["errors"] += 1
+                logger.error(f"Error running outbox relay batch: {e}")
+                await self._sleep(self._error_backoff)
+                continue
+
+            # Only events that failed were left behind; wait before retrying them
+            if result.claimed == 0 or result.published == 0:
+                await self._sleep(self._poll_interval)
+
+    async def stop(self) -> None:
+        """Stop after the current batch."""
+        self._running = False
+        self._wake_event.set()
+        logger.info("Stopping outbox relay")
+
+    def wake(self) -> None:
+        """Start the next batch now instead of waiting for the poll interval."""
+        self._wake_event.set()
+
+    async def run_batch(self) -> OutboxRelayResult:
+        """Relay one batch on a fresh session and record its metrics."""
+        async with self._session_factory() as session:
+            result = await self._use_case_factory(session).execute()
+
+        if result.claimed:
+            self._totals["batches"] += 1
+            self._totals["claimed"] += result.claimed
+            self._totals["published"] += result.published
+            self._totals["failed"] += result.failed
+            self._last_batch_ms = result.duration_ms
+            self._recent.append((time.monotonic(), result.published))
+        return result
+
+    def metrics(self) -> Dict[str, Any]:
+        """Return cumulative counts and recent throughput."""
+        cutoff = time.monotonic() - THROUGHPUT_WINDOW_SECONDS
+        while self._recent and self._recent[0][0] < cutoff:
+            self._recent.popleft()
+        recent = sum(count for _, count in self._recent)
+        return {
+            "running": self._running,
+            **self._totals,
+            "last_batch_ms": self._last_batch_ms,
+            "throughput_per_second": round(recent / THROUGHPUT_WINDOW_SECONDS, 3),
+        }
+
+    async def _sleep(self, seconds: float) -> None:
+        try:
+            await asyncio.wait_for(self._wake_event.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
+        self._wake_event.clear()
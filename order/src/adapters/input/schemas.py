@@ -136,11 +136,12 @@ class PaginatedOrdersResponse(BaseModel):
     """Paginated response for listing orders."""
 
     items: List[OrderResponse]
-    total: int
+    total: Optional[int]  # None on cursor pages or when include_total=false
     page: int
     size: int
     has_next: bool
     has_previous: bool
+    next_cursor: Optional[str] = None  # Pass as ``cursor`` to continue after this page
 
 
 # Report Schemas
@@ -188,3 +189,31 @@ class PaginatedReportsResponse(BaseModel):
     size: int
     has_next: bool
     has_previous: bool
+    next_cursor: Optional[str] = None  # Pass as ``cursor`` to continue after this page
+
+
+class ReportDedupMetricsResponse(BaseModel):
+    """Outcomes of report requests since the process started."""
+
+    requests: int
+    reused: int  # Served by a completed report's artifact
+    joined: int  # Waited on a report already being generated
+    generated: int
+    hit_rate: float
+    freshness_window_seconds: int
+
+
+class OutboxMetricsResponse(BaseModel):
+    """Outbox relay counters and publishing lag."""
+
+    running: bool
+    batches: int
+    claimed: int
+    published: int
+    failed: int
+    errors: int
+    last_batch_ms: int
+    throughput_per_second: float
+    pending: int
+    oldest_pending_at: Optional[datetime] = None
+    lag_seconds: float
@@ -3,6 +3,7 @@
 import logging
 from datetime import date, timedelta
 from decimal import Decimal
+from typing import Dict, List, Tuple
 from uuid import UUID, uuid4
 
 from src.application.ports.inventory_port import InventoryInfo, InventoryPort
@@ -72,3 +73,37 @@ class MockInventoryAdapter(InventoryPort):
             "reserved_quantity": quantity,
             "message": "Mock reservation successful",
         }
+
+    async def get_inventories(
+        self, inventory_ids: List[UUID]
+    ) -> Dict[UUID, InventoryInfo]:
+        """
+        Mock implementation of get_inventories.
+
+        Args:
+            inventory_ids: Inventory UUIDs
+
+        Returns:
+            Mock InventoryInfo for every requested ID
+        """
+        return {
+            inventory_id: await self.get_inventory(inventory_id)
+            for inventory_id in inventory_ids
+        }
+
+    async def reserve_inventories(
+        self, reservations: List[Tuple[UUID, int]]
+    ) -> List[dict]:
+        """
+        Mock implementation of reserve_inventories.
+
+        Args:
+            reservations: (inventory_id, quantity) pairs
+
+        Returns:
+            Mock response dict for every line
+        """
+        return [
+            await self.reserve_inventory(inventory_id, quantity)
+            for inventory_id, quantity in reservations
+        ]
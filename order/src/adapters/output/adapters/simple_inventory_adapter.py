@@ -3,6 +3,7 @@
 import logging
 from datetime import date, datetime
 from decimal import Decimal
+from typing import Dict, List, Tuple
 from uuid import UUID
 
 import httpx
@@ -39,8 +40,9 @@ class SimpleInventoryAdapter(InventoryPort):
     """
     Simple HTTP adapter for Inventory Service.
 
-    Calls GET /inventory/{id} endpoint to retrieve inventory information.
-    No FEFO logic, no multi-batch allocation.
+    Calls GET /inventory/{id} endpoint to retrieve inventory information,
+    or the batch endpoints to validate and reserve a whole order in one
+    round trip each. No FEFO logic, no multi-batch allocation.
     """
 
     def __init__(
@@ -126,6 +128,76 @@ class SimpleInventoryAdapter(InventoryPort):
                 status_code=503,
             )
 
+    async def get_inventories(
+        self, inventory_ids: List[UUID]
+    ) -> Dict[UUID, InventoryInfo]:
+        """
+        Get inventory information for several IDs with one request.
+
+        Calls POST /inventory/inventories/batch endpoint.
+
+        Args:
+            inventory_ids: Inventory UUIDs
+
+        Returns:
+            Mapping of inventory ID to InventoryInfo
+
+        Raises:
+            InventoryNotFoundError: If any inventory ID does not exist
+            InventoryServiceError: If inventory service returns other errors (500, timeout)
+        """
+        logger.info(f"Fetching {len(inventory_ids)} inventories from Inventory Service")
+
+        try:
+            response = await self.client.post(
+                f"{self.base_url}/inventory/inventories/batch",
+                json={"ids": [str(inventory_id) for inventory_id in inventory_ids]},
+                timeout=self.timeout,
+            )
+
+            if response.status_code == 200:
+                data = response.json()
+                if data.get("missing_ids"):
+                    missing = ", ".join(data["missing_ids"])
+                    logger.error(f"Inventories not found: {missing}")
+                    raise InventoryNotFoundError(f"Inventory not found: {missing}")
+
+                inventories = [self._parse_inventory_info(item) for item in data["items"]]
+                return {inventory.id: inventory for inventory in inventories}
+
+            elif response.status_code >= 500:
+                error_detail = response.json().get("detail", "Internal server error")
+                logger.error(
+                    f"Inventory Service error (status {response.status_code}): {error_detail}"
+                )
+                raise InventoryServiceError(
+                    f"Inventory Service error: {error_detail}",
+                    status_code=response.status_code,
+                )
+
+            else:
+                logger.error(
+                    f"Unexpected status code {response.status_code} from Inventory Service"
+                )
+                raise InventoryServiceError(
+                    f"Unexpected response from Inventory Service: {response.status_code}",
+                    status_code=response.status_code,
+                )
+
+        except httpx.TimeoutException as e:
+            logger.error(f"Timeout calling Inventory Service for inventory batch: {e}")
+            raise InventoryServiceError(
+                f"Timeout calling Inventory Service (timeout={self.timeout}s)",
+                status_code=504,
+            )
+
+        except httpx.RequestError as e:
+            logger.error(f"Request error calling Inventory Service for inventory batch: {e}")
+            raise InventoryServiceError(
+                f"Failed to connect to Inventory Service: {e}",
+                status_code=503,
+            )
+
     def _parse_inventory_info(self, response_data: dict) -> InventoryInfo:
         """
         Parse inventory response from Inventory Service.
@@ -214,3 +286,44 @@ class SimpleInventoryAdapter(InventoryPort):
         except httpx.RequestError as e:
             logger.error(f"Request error reserving inventory: {e}")
             raise InventoryServiceError(f"Failed to connect to Inventory Service: {e}", status_code=503)
+
+    async def reserve_inventories(
+        self, reservations: List[Tuple[UUID, int]]
+    ) -> List[dict]:
+        """Reserve several inventories in one all-or-nothing HTTP call."""
+        logger.info(f"Reserving {len(reservations)} inventory lines")
+
+        try:
+            response = await self.client.post(
+                f"{self.base_url}/inventory/reservations",
+                json={
+                    "items": [
+                        {"inventory_id": str(inventory_id), "quantity_delta": quantity}
+                        for inventory_id, quantity in reservations
+                    ]
+                },
+                timeout=self.timeout,
+            )
+
+            if response.status_code == 200:
+                return response.json()["items"]
+            elif response.status_code == 409:
+                error_data = response.json()
+                logger.error(f"Insufficient inventory: {error_data}")
+                raise InsufficientInventoryError(error_data.get("message", "Insufficient inventory"))
+            elif response.status_code == 404:
+                error_data = response.json()
+                logger.error(f"Inventory not found: {error_data}")
+                raise InventoryNotFoundError(error_data.get("message", "Inventory not found"))
+            else:
+                logger.error(f"Unexpected status code {response.status_code}")
+                raise InventoryServiceError(
+                    f"Inventory service error: {response.status_code}",
+                    status_code=response.status_code
+                )
+        except httpx.TimeoutException as e:
+            logger.error(f"Timeout reserving inventories: {e}")
+            raise InventoryServiceError("Timeout calling Inventory Service", status_code=504)
+        except httpx.RequestError as e:
+            logger.error(f"Request error reserving inventories: {e}")
+            raise InventoryServiceError(f"Failed to connect to Inventory Service: {e}", status_code=503)
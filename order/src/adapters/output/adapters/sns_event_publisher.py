@@ -3,18 +3,19 @@
 import json
 import logging
 from datetime import datetime
-from typing import Any, Dict, Optional
-from uuid import uuid4
+from typing import Any, Dict, List, Optional
+from uuid import UUID, uuid4
 
 import aioboto3
 from botocore.exceptions import ClientError
 
-from src.application.ports.event_publisher import EventPublisher
+from src.application.ports.event_publisher import BatchEventPublisher, EventPublisher
+from src.domain.entities import OutboxEvent
 
 logger = logging.getLogger(__name__)
 
 
-class SNSEventPublisher(EventPublisher):
+class SNSEventPublisher(EventPublisher, BatchEventPublisher):
     """
     SNS-based implementation of EventPublisher.
 
@@ -28,8 +29,12 @@ class SNSEventPublisher(EventPublisher):
     - Fire-and-forget error handling
     - LocalStack support for development
     - Fanout to multiple consumers via SNS → SQS subscriptions
+    - PublishBatch (10 entries per call) for the outbox relay
     """
 
+    # SNS PublishBatch limit
+    MAX_BATCH_SIZE = 10
+
     def __init__(
         self,
         topic_arn: str,
@@ -89,6 +94,61 @@ class SNSEventPublisher(EventPublisher):
                 exc_info=True,
             )
 
+    async def publish_batch(self, events: List[OutboxEvent]) -> List[UUID]:
+        """
+        Publish outbox events with SNS PublishBatch, 10 entries per call.
+
+        All chunks share one client. A chunk whose call raises is reported as
+        failed as a whole; otherwise only the entries SNS lists under
+        ``Failed`` are.
+
+        Args:
+            events: Outbox events to publish
+
+        Returns:
+            IDs of the events that were not published
+        """
+        if not events:
+            return []
+        if not self.topic_arn:
+            logger.warning("SNS topic ARN not configured - outbox events not published")
+            return [event.id for event in events]
+
+        failed: List[UUID] = []
+        async with self._client() as sns:
+            for start in range(0, len(events), self.MAX_BATCH_SIZE):
+                chunk = events[start:start + self.MAX_BATCH_SIZE]
+                entries = [
+                    {
+                        "Id": str(index),
+                        "Message": json.dumps(event.to_message(), default=str),
+                        "MessageAttributes": self._message_attributes(event.event_type),
+                    }
+                    for index, event in enumerate(chunk)
+                ]
+                try:
+                    response = await sns.publish_batch(
+                        TopicArn=self.topic_arn,
+                        PublishBatchRequestEntries=entries,
+                    )
+                except Exception as e:
+                    logger.error(f"SNS PublishBatch failed for {len(chunk)} events: {e}")
+                    failed.extend(event.id for event in chunk)
+                    continue
+
+                for failure in response.get("Failed", []):
+                    event = chunk[int(failure["Id"])]
+                    logger.warning(
+                        f"SNS rejected event {event.id}: "
+                        f"{failure.get('Code')} {failure.get('Message')}"
+                    )
+                    failed.append(event.id)
+
+        logger.info(
+            f"Published {len(events) - len(failed)}/{len(events)} outbox events to SNS"
+        )
+        return failed
+
     def _enrich_event(self, event_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Add event metadata to payload.
@@ -126,32 +186,41 @@ class SNSEventPublisher(EventPublisher):
         Raises:
             ClientError: If SNS operation fails
         """
-        if not self._session:
-            self._session = aioboto3.Session()
-
-        client_kwargs = {"region_name": self.aws_region}
-        if self.endpoint_url:
-            client_kwargs["endpoint_url"] = self.endpoint_url
-
-        async with self._session.client("sns", **client_kwargs) as sns:
+        async with self._client() as sns:
             message_body = json.dumps(event_data, default=str)
 
             await sns.publish(
                 TopicArn=self.topic_arn,
                 Message=message_body,
-                MessageAttributes={
-                    "event_type": {
-                        "StringValue": "order_created",
-                        "DataType": "String",
-                    },
-                    "microservice": {
-                        "StringValue": "order",
-                        "DataType": "String",
-                    },
-                },
+                MessageAttributes=self._message_attributes("order_created"),
             )
 
             logger.debug(
                 f"SNS message published: topic={self.topic_arn}, "
                 f"event_id={event_data.get('event_id')}"
             )
+
+    def _client(self):
+        """Open an SNS client on the shared aioboto3 session."""
+        if not self._session:
+            self._session = aioboto3.Session()
+
+        client_kwargs = {"region_name": self.aws_region}
+        if self.endpoint_url:
+            client_kwargs["endpoint_url"] = self.endpoint_url
+
+        return self._session.client("sns", **client_kwargs)
+
+    @staticmethod
+    def _message_attributes(event_type: str) -> Dict[str, Dict[str, str]]:
+        """Attributes used by SNS subscription filter policies."""
+        return {
+            "event_type": {
+                "StringValue": event_type,
+                "DataType": "String",
+            },
+            "microservice": {
+                "StringValue": "order",
+                "DataType": "String",
+            },
+        }
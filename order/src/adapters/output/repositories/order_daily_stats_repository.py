@@ -0,0 +1,147 @@
+"""Daily per-seller order rollup repository."""
+
+import logging
+from datetime import date, timedelta
+
+from sqlalchemy import Date, case, cast, delete, func, insert, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.entities import Order as OrderEntity
+from src.domain.value_objects import utc_day, utc_midnight
+from src.infrastructure.database.models import Order as OrderModel
+from src.infrastructure.database.models import OrderDailySellerStats as StatsModel
+
+logger = logging.getLogger(__name__)
+
+
+class OrderDailyStatsRepository:
+    """
+    Maintains ``order_daily_seller_stats``.
+
+    ``record`` never commits: it rides on the order transaction, so an order
+    is counted if and only if it committed. ``rebuild`` recomputes a range of
+    days from the orders table and commits.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def record(self, order: OrderEntity) -> None:
+        """Add one order to its (day, seller) row, creating the row if needed."""
+        if order.seller_id is None:
+            return
+
+        insert_stmt = self._insert().values(
+            day=utc_day(order.fecha_pedido),
+            seller_id=order.seller_id,
+            seller_name=order.seller_name,
+            seller_email=order.seller_email,
+            order_count=1,
+            revenue=order.monto_total,
+            last_order_at=order.fecha_pedido,
+        )
+        excluded = insert_stmt.excluded
+        # Seller data follows the latest order even if orders arrive out of order
+        is_latest = excluded.last_order_at >= StatsModel.last_order_at
+        await self.session.execute(
+            insert_stmt.on_conflict_do_update(
+                index_elements=[StatsModel.day, StatsModel.seller_id],
+                set_={
+                    "order_count": StatsModel.order_count + excluded.order_count,
+                    "revenue": StatsModel.revenue + excluded.revenue,
+                    "seller_name": case(
+                        (is_latest, excluded.seller_name), else_=StatsModel.seller_name
+                    ),
+                    "seller_email": case(
+                        (is_latest, excluded.seller_email), else_=StatsModel.seller_email
+                    ),
+                    "last_order_at": case(
+                        (is_latest, excluded.last_order_at), else_=StatsModel.last_order_at
+                    ),
+                },
+            )
+        )
+
+    async def rebuild(self, start_day: date, end_day: date) -> int:
+        """
+        Recompute the rollup for days ``start_day`` through ``end_day``.
+
+        Returns:
+            Number of (day, seller) rows written
+        """
+        day_expr = self._day_expression()
+        aggregated = (
+            select(
+                day_expr.label("day"),
+                OrderModel.seller_id,
+                func.count(OrderModel.id).label("order_count"),
+                func.sum(OrderModel.monto_total).label("revenue"),
+                func.max(OrderModel.fecha_pedido).label("last_order_at"),
+            )
+            .where(OrderModel.seller_id.isnot(None))
+            .where(OrderModel.fecha_pedido >= utc_midnight(start_day))
+            .where(OrderModel.fecha_pedido < utc_midnight(end_day + timedelta(days=1)))
+            .group_by(day_expr, OrderModel.seller_id)
+            .subquery()
+        )
+
+        def latest(column):
+            # Value recorded on the seller's latest order of the day
+            return (
+                select(column)
+                .where(OrderModel.seller_id == aggregated.c.seller_id)
+                .where(OrderModel.fecha_pedido == aggregated.c.last_order_at)
+                .limit(1)
+                .scalar_subquery()
+            )
+
+        rows = select(
+            aggregated.c.day,
+            aggregated.c.seller_id,
+            latest(OrderModel.seller_name),
+            latest(OrderModel.seller_email),
+            aggregated.c.order_count,
+            aggregated.c.revenue,
+            aggregated.c.last_order_at,
+        )
+
+        await self.session.execute(
+            delete(StatsModel).where(StatsModel.day.between(start_day, end_day))
+        )
+        result = await self.session.execute(
+            insert(StatsModel).from_select(
+                [
+                    "day",
+                    "seller_id",
+                    "seller_name",
+                    "seller_email",
+                    "order_count",
+                    "revenue",
+                    "last_order_at",
+                ],
+                rows,
+            )
+        )
+        await self.session.commit()
+
+        logger.info(
+            f"Rebuilt order_daily_seller_stats for {start_day}..{end_day}: "
+            f"{result.rowcount} rows"
+        )
+        return result.rowcount
+
+    def _dialect_name(self) -> str:
+        return self.session.get_bind().dialect.name
+
+    def _insert(self):
+        # ON CONFLICT upserts are dialect-specific constructs
+        if self._dialect_name() == "sqlite":
+            return sqlite_insert(StatsModel)
+        return postgresql_insert(StatsModel)
+
+    def _day_expression(self):
+        if self._dialect_name() == "sqlite":
+            return func.date(OrderModel.fecha_pedido)
+        return cast(func.timezone("UTC", OrderModel.fecha_pedido), Date)
@@ -1,17 +1,20 @@
 """Order repository implementation."""
 
 import logging
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from src.adapters.output.repositories.order_daily_stats_repository import (
+    OrderDailyStatsRepository,
+)
 from src.application.ports import OrderRepository as OrderRepositoryPort
 from src.domain.entities import Order as OrderEntity
 from src.domain.entities import OrderItem as OrderItemEntity
-from src.domain.value_objects import CreationMethod
+from src.domain.value_objects import CreationMethod, OrderCursor
 from src.infrastructure.database.models import Order as OrderModel
 from src.infrastructure.database.models import OrderItem as OrderItemModel
 
@@ -29,11 +32,14 @@ class OrderRepository(OrderRepositoryPort):
 
     def __init__(self, session: AsyncSession):
         self.session = session
+        self.daily_stats = OrderDailyStatsRepository(session)
 
     async def save(self, order: OrderEntity) -> OrderEntity:
         """
         Save an order entity (converts to ORM models).
 
+        Also adds the order to ``order_daily_seller_stats`` before committing.
+
         Args:
             order: Domain order entity
 
@@ -86,6 +92,9 @@ class OrderRepository(OrderRepositoryPort):
             )
             self.session.add(item_model)
 
+        # Keep the orders_per_seller rollup in step, in the same transaction
+        await self.daily_stats.record(order)
+
         await self.session.commit()
 
         # Reload from database with items
@@ -124,77 +133,103 @@ class OrderRepository(OrderRepositoryPort):
         return self._to_entity(order_model)
 
     async def find_all(
-        self, limit: int = 10, offset: int = 0
-    ) -> Tuple[List[OrderEntity], int]:
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        after: Optional[OrderCursor] = None,
+        include_total: bool = True,
+    ) -> Tuple[List[OrderEntity], Optional[int]]:
         """
-        Find all orders with pagination.
+        Find all orders with pagination, newest first by (fecha_pedido, id).
 
         Args:
             limit: Maximum number of orders
             offset: Number of orders to skip
+            after: Only return orders past this cursor in listing order
+            include_total: Whether to run the count query
 
         Returns:
-            Tuple of (list of order entities, total count)
+            Tuple of (list of order entities, total count or None)
         """
-        # Get total count
-        count_stmt = select(func.count()).select_from(OrderModel)
-        count_result = await self.session.execute(count_stmt)
-        total = count_result.scalar()
-
-        # Get paginated data with items loaded
-        stmt = (
-            select(OrderModel)
-            .options(selectinload(OrderModel.items))
-            .limit(limit)
-            .offset(offset)
-        )
-        result = await self.session.execute(stmt)
-        order_models = result.scalars().all()
-
-        # Convert to domain entities
-        orders = [self._to_entity(model) for model in order_models]
+        total = None
+        if include_total:
+            count_stmt = select(func.count()).select_from(OrderModel)
+            count_result = await self.session.execute(count_stmt)
+            total = count_result.scalar()
 
+        orders = await self._find_page([], limit, offset, after)
         return orders, total
 
     async def find_by_customer(
-        self, customer_id: UUID, limit: int = 10, offset: int = 0
-    ) -> Tuple[List[OrderEntity], int]:
+        self,
+        customer_id: UUID,
+        limit: int = 10,
+        offset: int = 0,
+        after: Optional[OrderCursor] = None,
+        include_total: bool = True,
+    ) -> Tuple[List[OrderEntity], Optional[int]]:
         """
-        Find all orders for a specific customer with pagination.
+        Find all orders for a specific customer with pagination, newest first.
 
         Args:
             customer_id: Customer UUID
             limit: Maximum number of orders
             offset: Number of orders to skip
+            after: Only return orders past this cursor in listing order
+            include_total: Whether to run the count query
 
         Returns:
-            Tuple of (list of order entities, total count)
+            Tuple of (list of order entities, total count or None)
         """
         logger.debug(f"Finding orders for customer {customer_id}")
 
-        # Get total count for this customer
-        count_stmt = select(func.count()).select_from(OrderModel).where(
-            OrderModel.customer_id == customer_id
-        )
-        count_result = await self.session.execute(count_stmt)
-        total = count_result.scalar()
+        filters = [OrderModel.customer_id == customer_id]
+
+        total = None
+        if include_total:
+            count_stmt = select(func.count()).select_from(OrderModel).where(*filters)
+            count_result = await self.session.execute(count_stmt)
+            total = count_result.scalar()
 
-        # Get paginated data with items loaded
+        orders = await self._find_page(filters, limit, offset, after)
+
+        logger.debug(f"Found {len(orders)} orders for customer {customer_id} (total: {total})")
+        return orders, total
+
+    async def _find_page(
+        self,
+        filters: list,
+        limit: int,
+        offset: int,
+        after: Optional[OrderCursor],
+    ) -> List[OrderEntity]:
+        """
+        Load one page of orders (with items) in (fecha_pedido, id) DESC order.
+
+        With a cursor the page seeks past it on the listing index instead of
+        skipping rows, so deep pages cost the same as the first one.
+        """
+        if after:
+            # The leading range bound lets the index seek; the OR only
+            # breaks ties on fecha_pedido
+            filters = filters + [
+                OrderModel.fecha_pedido <= after.fecha_pedido,
+                or_(
+                    OrderModel.fecha_pedido < after.fecha_pedido,
+                    OrderModel.id < after.id,
+                ),
+            ]
         stmt = (
             select(OrderModel)
             .options(selectinload(OrderModel.items))
-            .where(OrderModel.customer_id == customer_id)
+            .where(*filters)
+            .order_by(OrderModel.fecha_pedido.desc(), OrderModel.id.desc())
             .limit(limit)
-            .offset(offset)
         )
+        if not after:
+            stmt = stmt.offset(offset)
         result = await self.session.execute(stmt)
-        order_models = result.scalars().all()
-
-        # Convert to domain entities
-        orders = [self._to_entity(model) for model in order_models]
-
-        logger.debug(f"Found {len(orders)} orders for customer {customer_id} (total: {total})")
-        return orders, total
+        return [self._to_entity(model) for model in result.scalars().all()]
 
     def _to_entity(self, model: OrderModel) -> OrderEntity:
         """
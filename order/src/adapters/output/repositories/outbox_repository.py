@@ -0,0 +1,115 @@
+"""Outbox repository implementation."""
+
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.ports.outbox_repository import (
+    OutboxLag,
+    OutboxRepository as OutboxRepositoryPort,
+)
+from src.domain.entities import OutboxEvent as OutboxEventEntity
+from src.infrastructure.database.models import OutboxEvent as OutboxEventModel
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxRepository(OutboxRepositoryPort):
+    """
+    SQLAlchemy implementation of OutboxRepository port.
+
+    Never commits: ``add`` rides on the order transaction and the relay
+    commits claims and results itself.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def add(self, event: OutboxEventEntity) -> None:
+        """Stage an event; it is flushed and committed together with the order."""
+        self.session.add(
+            OutboxEventModel(
+                id=event.id,
+                event_type=event.event_type,
+                payload=event.payload,
+                created_at=event.created_at,
+                attempts=event.attempts,
+                next_attempt_at=event.next_attempt_at,
+            )
+        )
+
+    async def claim_due(self, limit: int, lease: timedelta) -> List[OutboxEventEntity]:
+        """
+        Claim due events with UPDATE ... WHERE id IN (SELECT ... FOR UPDATE
+        SKIP LOCKED) RETURNING, so concurrent relays never claim the same row.
+        """
+        now = datetime.now(timezone.utc)
+        due = (
+            select(OutboxEventModel.id)
+            .where(OutboxEventModel.published_at.is_(None))
+            .where(OutboxEventModel.next_attempt_at <= now)
+            .order_by(OutboxEventModel.next_attempt_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self.session.execute(
+            update(OutboxEventModel)
+            .where(OutboxEventModel.id.in_(due.scalar_subquery()))
+            .values(next_attempt_at=now + lease)
+            .returning(OutboxEventModel)
+            .execution_options(synchronize_session=False)
+        )
+        models = sorted(result.scalars().all(), key=lambda m: m.created_at or now)
+        return [self._to_entity(m) for m in models]
+
+    async def mark_published(self, events: List[OutboxEventEntity]) -> None:
+        """Mark delivered events with a single UPDATE ... WHERE id IN (...)."""
+        if not events:
+            return
+        published_at = events[0].published_at or datetime.now(timezone.utc)
+        await self.session.execute(
+            update(OutboxEventModel)
+            .where(OutboxEventModel.id.in_([e.id for e in events]))
+            .values(published_at=published_at, next_attempt_at=None, last_error=None)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def save_retries(self, events: List[OutboxEventEntity]) -> None:
+        """Persist retry state; failures are rare so one UPDATE per event is fine."""
+        for event in events:
+            await self.session.execute(
+                update(OutboxEventModel)
+                .where(OutboxEventModel.id == event.id)
+                .values(
+                    attempts=event.attempts,
+                    next_attempt_at=event.next_attempt_at,
+                    last_error=event.last_error,
+                )
+                .execution_options(synchronize_session=False)
+            )
+
+    async def get_lag(self) -> OutboxLag:
+        """Count unpublished events and find the oldest one."""
+        result = await self.session.execute(
+            select(func.count(), func.min(OutboxEventModel.created_at)).where(
+                OutboxEventModel.published_at.is_(None)
+            )
+        )
+        pending, oldest = result.one()
+        return OutboxLag(pending=pending, oldest_created_at=oldest)
+
+    def _to_entity(self, model: OutboxEventModel) -> OutboxEventEntity:
+        """Convert database model to domain entity."""
+        return OutboxEventEntity(
+            id=model.id,
+            event_type=model.event_type,
+            payload=model.payload,
+            created_at=model.created_at,
+            attempts=model.attempts,
+            next_attempt_at=model.next_attempt_at,
+            published_at=model.published_at,
+            last_error=model.last_error,
+        )
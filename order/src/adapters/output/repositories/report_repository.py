@@ -5,12 +5,13 @@ from datetime import datetime
 from typing import List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import and_, case, func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.ports.report_repository import ReportRepository as ReportRepositoryPort
 from src.domain.entities import Report as ReportEntity
-from src.domain.value_objects import ReportStatus, ReportType
+from src.domain.value_objects import ReportCursor, ReportStatus, ReportType
+from src.infrastructure.database.models import Order as OrderModel
 from src.infrastructure.database.models import Report as ReportModel
 
 logger = logging.getLogger(__name__)
@@ -81,6 +82,8 @@ class ReportRepository(ReportRepositoryPort):
             error_message=report.error_message,
             created_at=report.created_at,
             completed_at=report.completed_at,
+            fingerprint=report.fingerprint,
+            source_report_id=report.source_report_id,
         )
 
         self.session.add(report_model)
@@ -123,6 +126,7 @@ class ReportRepository(ReportRepositoryPort):
         offset: int = 0,
         status: Optional[ReportStatus] = None,
         report_type: Optional[ReportType] = None,
+        before: Optional[ReportCursor] = None,
     ) -> Tuple[List[ReportEntity], int]:
         """
         Find reports for a specific user with pagination and filters.
@@ -130,9 +134,11 @@ class ReportRepository(ReportRepositoryPort):
         Args:
             user_id: The user UUID
             limit: Maximum number of reports to return
-            offset: Number of reports to skip
+            offset: Number of reports to skip (ignored when before is given)
             status: Optional status filter
             report_type: Optional report type filter
+            before: Only return reports strictly after this cursor in listing
+                order; the total count ignores it
 
         Returns:
             Tuple of (list of reports, total count)
@@ -156,11 +162,24 @@ class ReportRepository(ReportRepositoryPort):
         count_result = await self.session.execute(count_stmt)
         total = count_result.scalar()
 
-        # Data query (ordered by created_at DESC)
+        # Data query (ordered by created_at, id DESC), seeking past the cursor;
+        # the cursor already marks the position, so offset does not apply
+        data_filters = list(filters)
+        if before:
+            offset = 0
+            data_filters.append(
+                or_(
+                    ReportModel.created_at < before.created_at,
+                    and_(
+                        ReportModel.created_at == before.created_at,
+                        ReportModel.id < before.id,
+                    ),
+                )
+            )
         data_stmt = (
             select(ReportModel)
-            .where(and_(*filters))
-            .order_by(ReportModel.created_at.desc())
+            .where(and_(*data_filters))
+            .order_by(ReportModel.created_at.desc(), ReportModel.id.desc())
             .limit(limit)
             .offset(offset)
         )
@@ -213,6 +232,134 @@ class ReportRepository(ReportRepositoryPort):
 
         logger.info(f"Report {report_id} status updated to {status}")
 
+    async def find_reusable(
+        self, fingerprint: str, created_after: datetime
+    ) -> Optional[ReportEntity]:
+        """
+        Find a report another request with this fingerprint can share.
+
+        Args:
+            fingerprint: Request fingerprint
+            created_after: Ignore reports created before this (freshness window)
+
+        Returns:
+            The newest completed match, else the newest in-flight one, or None
+        """
+        stmt = (
+            select(ReportModel)
+            .where(ReportModel.fingerprint == fingerprint)
+            .where(ReportModel.created_at >= created_after)
+            .where(ReportModel.source_report_id.is_(None))
+            .where(
+                ReportModel.status.in_(
+                    [
+                        ReportStatus.PENDING.value,
+                        ReportStatus.PROCESSING.value,
+                        ReportStatus.COMPLETED.value,
+                    ]
+                )
+            )
+            .order_by(
+                case((ReportModel.status == ReportStatus.COMPLETED.value, 0), else_=1),
+                ReportModel.created_at.desc(),
+            )
+            .limit(1)
+        )
+        result = await self.session.execute(stmt)
+        report_model = result.scalar_one_or_none()
+        return self._model_to_entity(report_model) if report_model else None
+
+    async def resolve_followers(
+        self,
+        source_report_id: UUID,
+        status: ReportStatus,
+        s3_bucket: Optional[str] = None,
+        s3_key: Optional[str] = None,
+        error_message: Optional[str] = None,
+    ) -> List[ReportEntity]:
+        """
+        Finish the still-pending reports waiting on a source report.
+
+        Args:
+            source_report_id: The report that produced the artifact
+            status: COMPLETED or FAILED, as the source ended
+            s3_bucket: S3 bucket (for completed reports)
+            s3_key: S3 key (for completed reports)
+            error_message: Error message (for failed reports)
+
+        Returns:
+            The reports resolved by this call
+        """
+        values = {"status": status.value, "completed_at": datetime.utcnow()}
+        if status == ReportStatus.COMPLETED:
+            values.update(s3_bucket=s3_bucket, s3_key=s3_key)
+        else:
+            values.update(error_message=error_message)
+
+        stmt = (
+            update(ReportModel)
+            .where(ReportModel.source_report_id == source_report_id)
+            .where(
+                ReportModel.status.in_(
+                    [ReportStatus.PENDING.value, ReportStatus.PROCESSING.value]
+                )
+            )
+            .values(**values)
+            .returning(ReportModel)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
+        followers = [self._model_to_entity(model) for model in result.scalars().all()]
+        await self.session.flush()
+
+        logger.info(
+            f"Resolved {len(followers)} report(s) waiting on {source_report_id} as {status}"
+        )
+        return followers
+
+    async def adopt_followers(self, stale_report_id: UUID, new_source_id: UUID) -> int:
+        """
+        Move a stale report and the reports waiting on it onto a new source.
+
+        Args:
+            stale_report_id: Unfinished source presumed dead
+            new_source_id: Report generated in its place
+
+        Returns:
+            Number of reports that now wait on ``new_source_id``
+        """
+        stmt = (
+            update(ReportModel)
+            .where(
+                or_(
+                    ReportModel.id == stale_report_id,
+                    ReportModel.source_report_id == stale_report_id,
+                )
+            )
+            .where(
+                ReportModel.status.in_(
+                    [ReportStatus.PENDING.value, ReportStatus.PROCESSING.value]
+                )
+            )
+            .values(source_report_id=new_source_id)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
+        await self.session.flush()
+
+        logger.info(
+            f"Moved {result.rowcount} report(s) from {stale_report_id} to {new_source_id}"
+        )
+        return result.rowcount
+
+    async def get_data_version(self, end_date: datetime) -> Optional[datetime]:
+        """Latest order date at or before ``end_date`` (an index seek)."""
+        stmt = select(func.max(OrderModel.fecha_pedido)).where(
+            OrderModel.fecha_pedido <= end_date
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar()
+
     def _model_to_entity(self, model: ReportModel) -> ReportEntity:
         """
         Convert ORM model to domain entity.
@@ -236,4 +383,6 @@ class ReportRepository(ReportRepositoryPort):
             error_message=model.error_message,
             created_at=model.created_at,
             completed_at=model.completed_at,
+            fingerprint=model.fingerprint,
+            source_report_id=model.source_report_id,
         )
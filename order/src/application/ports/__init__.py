@@ -1,9 +1,10 @@
 """Application ports (interfaces) for the Order service."""
 
 from .customer_port import CustomerPort
-from .event_publisher import EventPublisher
+from .event_publisher import BatchEventPublisher, EventPublisher
 from .inventory_port import InventoryInfo, InventoryPort
 from .order_repository import OrderRepository
+from .outbox_repository import OutboxLag, OutboxRepository
 
 __all__ = [
     "OrderRepository",
@@ -11,4 +12,7 @@ __all__ = [
     "InventoryPort",
     "InventoryInfo",
     "EventPublisher",
+    "BatchEventPublisher",
+    "OutboxRepository",
+    "OutboxLag",
 ]
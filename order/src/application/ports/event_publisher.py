@@ -1,7 +1,10 @@
 """Event publisher port for async messaging."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, Dict, List
+from uuid import UUID
+
+from src.domain.entities import OutboxEvent
 
 
 class EventPublisher(ABC):
@@ -10,7 +13,6 @@ class EventPublisher(ABC):
 
     # TODO: Implement SQS client in infrastructure layer (next sprint)
     # TODO: Implement DLQ for failed messages (next sprint)
-    # TODO: Implement outbox pattern for guaranteed delivery (future sprint)
     """
 
     @abstractmethod
@@ -57,3 +59,25 @@ class EventPublisher(ABC):
             - Eventual consistency is acceptable
         """
         pass
+
+
+class BatchEventPublisher(ABC):
+    """
+    Abstract port for publishing outbox events in bulk.
+
+    Used by the outbox relay. Unlike ``EventPublisher`` this reports failures
+    back to the caller so they can be retried.
+    """
+
+    @abstractmethod
+    async def publish_batch(self, events: List[OutboxEvent]) -> List[UUID]:
+        """
+        Publish events, batching as many per broker call as it allows.
+
+        Args:
+            events: Events to publish
+
+        Returns:
+            IDs of the events that were NOT published
+        """
+        pass
@@ -4,6 +4,7 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import date
 from decimal import Decimal
+from typing import Dict, List, Tuple
 from uuid import UUID
 
 
@@ -80,3 +81,41 @@ class InventoryPort(ABC):
             InventoryNotFoundError: Inventory doesn't exist
         """
         ...  # pragma: no cover
+
+    @abstractmethod
+    async def get_inventories(
+        self, inventory_ids: List[UUID]
+    ) -> Dict[UUID, InventoryInfo]:
+        """
+        Get inventory information for several IDs in one call.
+
+        Args:
+            inventory_ids: Inventory UUIDs
+
+        Returns:
+            Mapping of inventory ID to InventoryInfo
+
+        Raises:
+            InventoryNotFoundError: If any inventory ID does not exist
+            ServiceConnectionError: If unable to reach Inventory Service
+        """
+        ...  # pragma: no cover
+
+    @abstractmethod
+    async def reserve_inventories(
+        self, reservations: List[Tuple[UUID, int]]
+    ) -> List[dict]:
+        """
+        Reserve units on several inventories, all-or-nothing.
+
+        Args:
+            reservations: (inventory_id, quantity) pairs
+
+        Returns:
+            Updated inventory data for every reserved inventory
+
+        Raises:
+            InsufficientInventoryError: Not enough stock on any line
+            InventoryNotFoundError: Any inventory doesn't exist
+        """
+        ...  # pragma: no cover
@@ -1,10 +1,11 @@
 """Order repository port (abstract interface)."""
 
 from abc import ABC, abstractmethod
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 from uuid import UUID
 
 from src.domain.entities import Order
+from src.domain.value_objects import OrderCursor
 
 
 class OrderRepository(ABC):
@@ -48,17 +49,23 @@ class OrderRepository(ABC):
 
     @abstractmethod
     async def find_all(
-        self, limit: int = 10, offset: int = 0
-    ) -> Tuple[List[Order], int]:
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        after: Optional[OrderCursor] = None,
+        include_total: bool = True,
+    ) -> Tuple[List[Order], Optional[int]]:
         """
-        Find all orders with pagination.
+        Find all orders with pagination, newest first by (fecha_pedido, id).
 
         Args:
             limit: Maximum number of orders to return
             offset: Number of orders to skip
+            after: Only return orders past this cursor in listing order
+            include_total: Whether to run the count query
 
         Returns:
-            Tuple of (list of orders, total count)
+            Tuple of (list of orders, total count or None if not requested)
 
         Raises:
             RepositoryError: If query fails
@@ -67,18 +74,25 @@ class OrderRepository(ABC):
 
     @abstractmethod
     async def find_by_customer(
-        self, customer_id: UUID, limit: int = 10, offset: int = 0
-    ) -> Tuple[List[Order], int]:
+        self,
+        customer_id: UUID,
+        limit: int = 10,
+        offset: int = 0,
+        after: Optional[OrderCursor] = None,
+        include_total: bool = True,
+    ) -> Tuple[List[Order], Optional[int]]:
         """
-        Find all orders for a specific customer with pagination.
+        Find all orders for a specific customer with pagination, newest first.
 
         Args:
             customer_id: The customer UUID
             limit: Maximum number of orders to return
             offset: Number of orders to skip
+            after: Only return orders past this cursor in listing order
+            include_total: Whether to run the count query
 
         Returns:
-            Tuple of (list of orders, total count)
+            Tuple of (list of orders, total count or None if not requested)
 
         Raises:
             RepositoryError: If query fails
@@ -0,0 +1,55 @@
+"""Outbox repository port."""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from src.domain.entities import OutboxEvent
+
+
+@dataclass
+class OutboxLag:
+    """Backlog of unpublished events."""
+
+    pending: int
+    oldest_created_at: Optional[datetime] = None
+
+
+class OutboxRepository(ABC):
+    """
+    Abstract port for the transactional outbox.
+
+    None of these methods commit; the caller owns the transaction so that
+    ``add`` lands atomically with the order it belongs to.
+    """
+
+    @abstractmethod
+    async def add(self, event: OutboxEvent) -> None:
+        """Stage an event in the current transaction."""
+        pass
+
+    @abstractmethod
+    async def claim_due(self, limit: int, lease: timedelta) -> List[OutboxEvent]:
+        """
+        Claim up to ``limit`` unpublished events whose next attempt is due.
+
+        Claimed events have ``next_attempt_at`` pushed forward by ``lease`` so
+        concurrent relays skip them until the lease expires.
+        """
+        pass
+
+    @abstractmethod
+    async def mark_published(self, events: List[OutboxEvent]) -> None:
+        """Persist ``published_at`` for delivered events in one statement."""
+        pass
+
+    @abstractmethod
+    async def save_retries(self, events: List[OutboxEvent]) -> None:
+        """Persist attempt counts and next attempt times for failed events."""
+        pass
+
+    @abstractmethod
+    async def get_lag(self) -> OutboxLag:
+        """Return the number of unpublished events and the oldest one's age."""
+        pass
@@ -1,11 +1,12 @@
 """Report repository port (abstract interface)."""
 
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
 from src.domain.entities import Report
-from src.domain.value_objects import ReportStatus, ReportType
+from src.domain.value_objects import ReportCursor, ReportStatus, ReportType
 
 
 class ReportRepository(ABC):
@@ -55,16 +56,22 @@ class ReportRepository(ABC):
         offset: int = 0,
         status: Optional[ReportStatus] = None,
         report_type: Optional[ReportType] = None,
+        before: Optional[ReportCursor] = None,
     ) -> Tuple[List[Report], int]:
         """
         Find reports for a specific user with pagination and filters.
 
+        Reports are ordered by (created_at, id) DESC so listings can be
+        continued from a cursor and merged with other services' reports.
+
         Args:
             user_id: The user UUID
             limit: Maximum number of reports to return
             offset: Number of reports to skip
             status: Optional status filter
             report_type: Optional report type filter
+            before: Only return reports strictly after this cursor in listing
+                order; the total count ignores it
 
         Returns:
             Tuple of (list of reports, total count)
@@ -97,3 +104,91 @@ class ReportRepository(ABC):
             RepositoryError: If update fails
         """
         pass
+
+    @abstractmethod
+    async def find_reusable(
+        self, fingerprint: str, created_after: datetime
+    ) -> Optional[Report]:
+        """
+        Find a report another request with this fingerprint can share.
+
+        Only reports that generate their own artifact are considered. A
+        completed one is preferred over one still pending or processing.
+
+        Args:
+            fingerprint: Request fingerprint
+            created_after: Ignore reports created before this (freshness window)
+
+        Returns:
+            The newest matching report, or None
+
+        Raises:
+            RepositoryError: If query fails
+        """
+        pass
+
+    @abstractmethod
+    async def resolve_followers(
+        self,
+        source_report_id: UUID,
+        status: ReportStatus,
+        s3_bucket: Optional[str] = None,
+        s3_key: Optional[str] = None,
+        error_message: Optional[str] = None,
+    ) -> List[Report]:
+        """
+        Finish the still-pending reports waiting on a source report.
+
+        The update is conditional, so each follower is resolved exactly once
+        even if the source job and the follower's own task race.
+
+        Args:
+            source_report_id: The report that produced the artifact
+            status: COMPLETED or FAILED, as the source ended
+            s3_bucket: S3 bucket (for completed reports)
+            s3_key: S3 key (for completed reports)
+            error_message: Error message (for failed reports)
+
+        Returns:
+            The reports resolved by this call
+
+        Raises:
+            RepositoryError: If update fails
+        """
+        pass
+
+    @abstractmethod
+    async def adopt_followers(self, stale_report_id: UUID, new_source_id: UUID) -> int:
+        """
+        Move a stale report and the reports waiting on it onto a new source.
+
+        A pending or processing source older than the staleness timeout is
+        presumed dead. The report generated in its place takes over the
+        stale report and its followers, so its step 7 resolves them all.
+        Only unfinished reports move; a stale worker that still finishes
+        keeps its own result.
+
+        Args:
+            stale_report_id: Unfinished source presumed dead
+            new_source_id: Report generated in its place
+
+        Returns:
+            Number of reports moved
+
+        Raises:
+            RepositoryError: If update fails
+        """
+        pass
+
+    @abstractmethod
+    async def get_data_version(self, end_date: datetime) -> Optional[datetime]:
+        """
+        Watermark of the order data a report up to ``end_date`` reads.
+
+        Orders are immutable and dated when placed, so the latest order date
+        at or before ``end_date`` only changes when such a report would.
+
+        Raises:
+            RepositoryError: If query fails
+        """
+        pass
@@ -4,16 +4,16 @@ import logging
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
 from decimal import Decimal
-from typing import List, Optional
+from typing import Any, Callable, Dict, List, Optional
 from uuid import UUID, uuid4
 
 from src.application.ports import (
     CustomerPort,
-    EventPublisher,
     InventoryPort,
     OrderRepository,
+    OutboxRepository,
 )
-from src.domain.entities import Order, OrderItem
+from src.domain.entities import Order, OrderItem, OutboxEvent
 from src.domain.value_objects import CreationMethod
 
 logger = logging.getLogger(__name__)
@@ -50,7 +50,8 @@ class CreateOrderUseCase:
     - Validates inventory has sufficient stock (client provides inventario_id)
     - Applies 30% markup to product prices
     - Creates order with denormalized seller data from BFF
-    - Publishes order_created event (fire-and-forget)
+    - Stores order_created event in the outbox, in the same transaction as
+      the order; the outbox relay publishes it to SNS
 
     Note: Seller validation and data is handled by BFF layer
     Note: fecha_entrega_estimada will be set later by Delivery Service
@@ -63,12 +64,14 @@ class CreateOrderUseCase:
         order_repository: OrderRepository,
         customer_port: CustomerPort,
         inventory_port: InventoryPort,
-        event_publisher: EventPublisher,
+        outbox_repository: OutboxRepository,
+        on_event_stored: Optional[Callable[[], None]] = None,
     ):
         self.order_repository = order_repository
         self.customer_port = customer_port
         self.inventory_port = inventory_port
-        self.event_publisher = event_publisher
+        self.outbox_repository = outbox_repository
+        self.on_event_stored = on_event_stored
 
     async def execute(self, input_data: CreateOrderInput) -> Order:
         """
@@ -115,14 +118,19 @@ class CreateOrderUseCase:
         )
 
         # Step 6: Validate inventory and create order items
+        # One batch lookup for every line instead of one request per item
+        inventory_ids = list(
+            dict.fromkeys(item.inventario_id for item in input_data.items)
+        )
+        inventories = await self.inventory_port.get_inventories(inventory_ids)
+
         for item_input in input_data.items:
             logger.debug(
                 f"Validating inventory {item_input.inventario_id}, "
                 f"quantity {item_input.cantidad}"
             )
 
-            # Get inventory information
-            inventory = await self.inventory_port.get_inventory(item_input.inventario_id)
+            inventory = inventories[item_input.inventario_id]
 
             # Validate sufficient stock
             if inventory.available_quantity < item_input.cantidad:
@@ -161,9 +169,14 @@ class CreateOrderUseCase:
             f"total: {order.monto_total}"
         )
 
-        # Step 7: Save order (COMMIT POINT)
+        # Step 7: Stage order_created event, then save order (COMMIT POINT)
+        # Both rows commit together, so the event exists iff the order does
+        await self.outbox_repository.add(
+            OutboxEvent.create("order_created", self._build_order_created_event(order))
+        )
         saved_order = await self.order_repository.save(order)
         logger.info(f"Order {order.id} saved to database")
+        self._notify_event_stored()
 
         # Step 8: Reserve inventory (NEW)
         try:
@@ -176,50 +189,44 @@ class CreateOrderUseCase:
             # Order is already created - log error and continue
             # The order_created event will trigger retry if needed
 
-        # Step 9: Publish event (fire-and-forget)
+        return saved_order
+
+    def _notify_event_stored(self) -> None:
+        """Wake the outbox relay; the event is already durable, so never fail here."""
+        if self.on_event_stored is None:
+            return
         try:
-            await self._publish_order_created_event(saved_order)
+            self.on_event_stored()
         except Exception as e:
-            # Log error but don't fail request - order is already created
-            logger.error(
-                f"Failed to publish order_created event for order {order.id}: {e}",
-                exc_info=True,
-            )
-
-        return saved_order
+            logger.warning(f"Failed to wake outbox relay: {e}")
 
     async def _reserve_inventory(self, order: Order) -> None:
-        """Reserve inventory for all order items."""
+        """Reserve inventory for all order items in one all-or-nothing call."""
         logger.info(f"Reserving inventory for order {order.id}")
 
-        for item in order.items:
-            try:
-                await self.inventory_port.reserve_inventory(
-                    inventory_id=item.inventario_id,
-                    quantity=item.cantidad
-                )
-                logger.info(
-                    f"Reserved {item.cantidad} units from inventory {item.inventario_id}"
-                )
-            except Exception as e:
-                logger.error(
-                    f"Failed to reserve inventory {item.inventario_id}: {e}",
-                    exc_info=True
-                )
-                # Re-raise to fail the reservation process
-                raise
+        try:
+            await self.inventory_port.reserve_inventories(
+                [(item.inventario_id, item.cantidad) for item in order.items]
+            )
+        except Exception as e:
+            logger.error(
+                f"Failed to reserve inventory for order {order.id}: {e}",
+                exc_info=True
+            )
+            # Re-raise to fail the reservation process
+            raise
 
         logger.info(f"Successfully reserved inventory for all items in order {order.id}")
 
-    async def _publish_order_created_event(self, order: Order) -> None:
+    def _build_order_created_event(self, order: Order) -> Dict[str, Any]:
         """
-        Publish OrderCreated event.
+        Build the OrderCreated event payload.
 
         This event will be consumed by:
         1. Delivery Service - Assign to route and set fecha_entrega_estimada
         2. Inventory Service - Reserve stock
         """
-        event_data = {
+        return {
             "order_id": str(order.id),
             "customer_id": str(order.customer_id),
             "seller_id": str(order.seller_id) if order.seller_id else None,
@@ -247,6 +254,3 @@ class CreateOrderUseCase:
                 for item in order.items
             ],
         }
-
-        await self.event_publisher.publish_order_created(event_data)
-        logger.info(f"Published order_created event for order {order.id}")
@@ -2,12 +2,19 @@
 
 import logging
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, Optional
 from uuid import UUID, uuid4
 
 from src.application.ports.report_repository import ReportRepository
 from src.domain.entities import Report
+from src.domain.services.report_dedup import (
+    GENERATED,
+    JOINED,
+    REUSED,
+    ReportDedupMetrics,
+    report_fingerprint,
+)
 from src.domain.value_objects import ReportStatus, ReportType
 
 logger = logging.getLogger(__name__)
@@ -30,10 +37,28 @@ class CreateReportUseCase:
 
     This creates a pending report record in the database.
     The actual report generation happens asynchronously in GenerateReportUseCase.
+
+    With a freshness window, a request matching a report created within the
+    window (same fingerprint) does not start a new job: it reuses that
+    report's artifact if it is completed, or waits on it if it is still
+    being generated.
+
+    A match still unfinished ``stale_after`` after it was created is presumed
+    dead: the new report is generated instead and takes over the stale one
+    and the reports waiting on it.
     """
 
-    def __init__(self, report_repository: ReportRepository):
+    def __init__(
+        self,
+        report_repository: ReportRepository,
+        freshness_window: timedelta = timedelta(0),
+        metrics: Optional[ReportDedupMetrics] = None,
+        stale_after: timedelta = timedelta(minutes=15),
+    ):
         self.report_repository = report_repository
+        self.freshness_window = freshness_window
+        self.metrics = metrics
+        self.stale_after = stale_after
 
     async def execute(self, input_data: CreateReportInput) -> Report:
         """
@@ -43,7 +68,8 @@ class CreateReportUseCase:
             input_data: Report creation input
 
         Returns:
-            Created report entity
+            Created report entity; COMPLETED right away when an existing
+            artifact is reused
 
         Raises:
             ValueError: If input validation fails
@@ -57,6 +83,8 @@ class CreateReportUseCase:
         if input_data.end_date < input_data.start_date:
             raise ValueError("end_date must be after start_date")
 
+        now = datetime.utcnow()
+
         # Create report entity
         report = Report(
             id=uuid4(),
@@ -66,11 +94,59 @@ class CreateReportUseCase:
             start_date=input_data.start_date,
             end_date=input_data.end_date,
             filters=input_data.filters,
-            created_at=datetime.utcnow(),
+            created_at=now,
         )
 
+        outcome = GENERATED
+        stale_source: Optional[Report] = None
+        if self.freshness_window > timedelta(0):
+            report.fingerprint = report_fingerprint(
+                report_type=input_data.report_type.value,
+                start_date=input_data.start_date,
+                end_date=input_data.end_date,
+                filters=input_data.filters,
+                data_version=await self.report_repository.get_data_version(
+                    input_data.end_date
+                ),
+            )
+            source = await self.report_repository.find_reusable(
+                report.fingerprint, created_after=now - self.freshness_window
+            )
+            if source is not None and self._is_stale(source, now):
+                logger.warning(
+                    f"Report {source.id} is {source.status.value} since "
+                    f"{source.created_at}; generating instead of joining it"
+                )
+                stale_source, source = source, None
+            if source is not None:
+                report.source_report_id = source.id
+                if source.status == ReportStatus.COMPLETED:
+                    report.mark_completed(source.s3_bucket, source.s3_key)
+                    outcome = REUSED
+                else:
+                    outcome = JOINED
+                logger.info(
+                    f"Report request matches report {source.id} ({source.status.value}): {outcome}"
+                )
+
+        if self.metrics:
+            self.metrics.record(outcome)
+
         # Save to database
         saved_report = await self.report_repository.save(report)
+        if stale_source is not None:
+            await self.report_repository.adopt_followers(
+                stale_source.id, saved_report.id
+            )
 
         logger.info(f"Report {saved_report.id} created successfully")
         return saved_report
+
+    def _is_stale(self, source: Report, now: datetime) -> bool:
+        """Whether an unfinished match has outlived ``stale_after``."""
+        if source.status not in (ReportStatus.PENDING, ReportStatus.PROCESSING):
+            return False
+        created_at = source.created_at
+        if created_at.tzinfo is not None:
+            created_at = created_at.astimezone(timezone.utc).replace(tzinfo=None)
+        return now - created_at >= self.stale_after
@@ -1,11 +1,13 @@
 """Generate report use case (async background task)."""
 
 import logging
+from typing import Optional
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.ports.report_repository import ReportRepository
+from src.domain.entities import Report
 from src.domain.services.report_generators import (
     OrdersPerSellerReportGenerator,
     OrdersPerStatusReportGenerator,
@@ -51,9 +53,16 @@ class GenerateReportUseCase:
         4. Uploads to S3
         5. Updates status to COMPLETED
         6. Publishes SQS event to BFF
+        7. Resolves the reports that joined this one while it was generated
+
+        A report that shares another report's artifact skips steps 2-6; it is
+        resolved by the source's step 7, or here once its source finished.
+        Step 7 runs after the report itself is settled, so a failure there
+        never turns a completed report into a failed one.
         """
         logger.info(f"Starting async report generation for {report_id}")
 
+        finished: Optional[Report] = None
         try:
             # Load report
             report = await self.report_repository.find_by_id(report_id)
@@ -61,6 +70,9 @@ class GenerateReportUseCase:
                 logger.error(f"Report {report_id} not found")
                 return
 
+            if report.source_report_id and await self._follow(report):
+                return
+
             # Update status to PROCESSING
             await self.report_repository.update_status(
                 report_id=report_id, status=ReportStatus.PROCESSING
@@ -110,6 +122,9 @@ class GenerateReportUseCase:
 
             logger.info(f"Report {report_id} generated successfully")
 
+            report.mark_completed(self.s3_service.bucket_name, s3_key)
+            finished = report
+
         except Exception as e:
             logger.error(
                 f"Failed to generate report {report_id}: {e}", exc_info=True
@@ -133,9 +148,90 @@ class GenerateReportUseCase:
                         report_type=report.report_type.value,
                         error_message=str(e),
                     )
+                    finished = report
 
             except Exception as update_error:
                 logger.error(
                     f"Failed to update report status to FAILED: {update_error}",
                     exc_info=True,
                 )
+
+        if finished is not None:
+            try:
+                await self._resolve_followers(finished)
+            except Exception as e:
+                logger.error(
+                    f"Failed to resolve reports waiting on {report_id}: {e}",
+                    exc_info=True,
+                )
+
+    async def _follow(self, report: Report) -> bool:
+        """
+        Handle a report that shares another report's artifact.
+
+        Returns:
+            False if the source report is gone and this one must be generated
+        """
+        # Make the new report visible before looking at its source, so a
+        # source finishing concurrently is guaranteed to resolve it
+        await self.db_session.commit()
+
+        if report.status == ReportStatus.COMPLETED:
+            await self.sqs_publisher.publish_report_generated(
+                report_id=report.id,
+                user_id=report.user_id,
+                report_type=report.report_type.value,
+                status="completed",
+                s3_bucket=report.s3_bucket,
+                s3_key=report.s3_key,
+            )
+            logger.info(f"Report {report.id} reuses the artifact of {report.source_report_id}")
+            return True
+
+        source = await self.report_repository.find_by_id(report.source_report_id)
+        if source is None:
+            logger.warning(
+                f"Source report {report.source_report_id} of {report.id} not found, generating"
+            )
+            return False
+
+        if source.status in (ReportStatus.COMPLETED, ReportStatus.FAILED):
+            await self._resolve_followers(source)
+        else:
+            logger.info(f"Report {report.id} waits on report {source.id}")
+        return True
+
+    async def _resolve_followers(self, source: Report) -> None:
+        """Complete or fail the reports waiting on ``source`` and notify their users."""
+        if source.status == ReportStatus.COMPLETED:
+            followers = await self.report_repository.resolve_followers(
+                source.id,
+                ReportStatus.COMPLETED,
+                s3_bucket=source.s3_bucket,
+                s3_key=source.s3_key,
+            )
+        else:
+            followers = await self.report_repository.resolve_followers(
+                source.id, ReportStatus.FAILED, error_message=source.error_message
+            )
+        if not followers:
+            return
+        await self.db_session.commit()
+
+        for follower in followers:
+            if source.status == ReportStatus.COMPLETED:
+                await self.sqs_publisher.publish_report_generated(
+                    report_id=follower.id,
+                    user_id=follower.user_id,
+                    report_type=follower.report_type.value,
+                    status="completed",
+                    s3_bucket=source.s3_bucket,
+                    s3_key=source.s3_key,
+                )
+            else:
+                await self.sqs_publisher.publish_report_failed(
+                    report_id=follower.id,
+                    user_id=follower.user_id,
+                    report_type=follower.report_type.value,
+                    error_message=source.error_message,
+                )
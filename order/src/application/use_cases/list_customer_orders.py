@@ -1,11 +1,13 @@
 """List customer orders use case."""
 
 import logging
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 from uuid import UUID
 
 from src.application.ports import OrderRepository
+from src.application.use_cases.list_orders import next_order_cursor
 from src.domain.entities import Order
+from src.domain.value_objects import OrderCursor
 
 logger = logging.getLogger(__name__)
 
@@ -13,14 +15,21 @@ logger = logging.getLogger(__name__)
 class ListCustomerOrdersUseCase:
     """
     Use case for listing orders for a specific customer with pagination.
+
+    Same ordering and cursor semantics as ListOrdersUseCase.
     """
 
     def __init__(self, order_repository: OrderRepository):
         self.order_repository = order_repository
 
     async def execute(
-        self, customer_id: UUID, limit: int = 10, offset: int = 0
-    ) -> Tuple[List[Order], int]:
+        self,
+        customer_id: UUID,
+        limit: int = 10,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+    ) -> Tuple[List[Order], Optional[int], Optional[str]]:
         """
         List orders for a specific customer with pagination.
 
@@ -28,18 +37,26 @@ class ListCustomerOrdersUseCase:
             customer_id: UUID of the customer
             limit: Maximum number of orders to return (default 10)
             offset: Number of orders to skip (default 0)
+            cursor: next_cursor of the previous page
+            include_total: Count the customer's orders (skipped on cursor pages)
 
         Returns:
-            Tuple of (list of orders, total count)
+            Tuple of (list of orders, total count or None, next cursor)
 
         Raises:
+            InvalidOrderCursorException: If the cursor is malformed
             RepositoryError: If query fails
         """
         logger.info(f"Listing orders for customer {customer_id} (limit={limit}, offset={offset})")
 
+        after = OrderCursor.decode(cursor) if cursor else None
         orders, total = await self.order_repository.find_by_customer(
-            customer_id=customer_id, limit=limit, offset=offset
+            customer_id=customer_id,
+            limit=limit,
+            offset=offset,
+            after=after,
+            include_total=include_total and after is None,
         )
 
         logger.debug(f"Found {len(orders)} orders for customer {customer_id} (total: {total})")
-        return orders, total
+        return orders, total, next_order_cursor(orders, limit)
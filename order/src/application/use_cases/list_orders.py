@@ -1,41 +1,67 @@
 """List orders use case."""
 
 import logging
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from src.application.ports import OrderRepository
 from src.domain.entities import Order
+from src.domain.value_objects import OrderCursor
 
 logger = logging.getLogger(__name__)
 
 
+def next_order_cursor(orders: List[Order], limit: int) -> Optional[str]:
+    """Cursor after the last order of a full page; a short page is the last one."""
+    if not orders or len(orders) < limit:
+        return None
+    last = orders[-1]
+    return OrderCursor(fecha_pedido=last.fecha_pedido, id=last.id).encode()
+
+
 class ListOrdersUseCase:
     """
     Use case for listing orders with pagination.
+
+    Orders are listed newest first by (fecha_pedido, id). A cursor from a
+    previous page continues the listing by keyset instead of offset, and the
+    total is only counted for the first page.
     """
 
     def __init__(self, order_repository: OrderRepository):
         self.order_repository = order_repository
 
     async def execute(
-        self, limit: int = 10, offset: int = 0
-    ) -> Tuple[List[Order], int]:
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+    ) -> Tuple[List[Order], Optional[int], Optional[str]]:
         """
         List orders with pagination.
 
         Args:
             limit: Maximum number of orders to return (default 10)
             offset: Number of orders to skip (default 0)
+            cursor: next_cursor of the previous page
+            include_total: Count all orders (skipped on cursor pages)
 
         Returns:
-            Tuple of (list of orders, total count)
+            Tuple of (list of orders, total count or None, next cursor)
 
         Raises:
+            InvalidOrderCursorException: If the cursor is malformed
             RepositoryError: If query fails
         """
-        logger.info(f"Listing orders (limit={limit}, offset={offset})")
+        logger.info(f"Listing orders (limit={limit}, offset={offset}, cursor={cursor})")
 
-        orders, total = await self.order_repository.find_all(limit=limit, offset=offset)
+        after = OrderCursor.decode(cursor) if cursor else None
+        orders, total = await self.order_repository.find_all(
+            limit=limit,
+            offset=offset,
+            after=after,
+            include_total=include_total and after is None,
+        )
 
         logger.debug(f"Found {len(orders)} orders (total: {total})")
-        return orders, total
+        return orders, total, next_order_cursor(orders, limit)
@@ -20,6 +20,7 @@ class ListReportsInput:
     offset: int = 0
     status: Optional[str] = None
     report_type: Optional[str] = None
+    cursor: Optional[str] = None
 
 
 @dataclass
@@ -30,13 +31,16 @@ class ListReportsOutput:
     total: int
     limit: int
     offset: int
+    next_cursor: Optional[str] = None
 
 
 class ListReportsUseCase:
     """
     Use case for listing user's reports with pagination.
 
-    Returns reports ordered by created_at DESC (newest first).
+    Returns reports ordered by (created_at, id) DESC (newest first). A
+    cursor from a previous page continues the listing by keyset instead of
+    offset, which stays cheap on deep pages.
     """
 
     def __init__(self, report_repository: ReportRepository):
@@ -58,27 +62,38 @@ class ListReportsUseCase:
             f"status={input_data.status}, type={input_data.report_type})"
         )
 
-        # Parse status and report_type filters
-        from src.domain.value_objects import ReportStatus, ReportType
+        # Parse status, report_type and cursor
+        from src.domain.value_objects import ReportCursor, ReportStatus, ReportType
 
         status_filter = ReportStatus(input_data.status) if input_data.status else None
         type_filter = ReportType(input_data.report_type) if input_data.report_type else None
+        before = ReportCursor.decode(input_data.cursor) if input_data.cursor else None
+        # The cursor marks the position; an offset on top would skip reports
+        offset = 0 if before else input_data.offset
 
         reports, total = await self.report_repository.find_by_user(
             user_id=input_data.user_id,
             limit=input_data.limit,
-            offset=input_data.offset,
+            offset=offset,
             status=status_filter,
             report_type=type_filter,
+            before=before,
         )
 
         logger.info(
             f"Found {len(reports)} reports for user {input_data.user_id} (total: {total})"
         )
 
+        # A full page may have more after it; a short page is the last one
+        next_cursor = None
+        if reports and len(reports) == input_data.limit:
+            last = reports[-1]
+            next_cursor = ReportCursor(created_at=last.created_at, id=last.id).encode()
+
         return ListReportsOutput(
             reports=reports,
             total=total,
             limit=input_data.limit,
-            offset=input_data.offset,
+            offset=offset,
+            next_cursor=next_cursor,
         )
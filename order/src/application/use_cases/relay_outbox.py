@@ -0,0 +1,100 @@
+"""Relay outbox use case."""
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.ports import BatchEventPublisher, OutboxRepository
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class OutboxRelayResult:
+    """Outcome of one relay batch."""
+
+    claimed: int = 0
+    published: int = 0
+    failed: int = 0
+    duration_ms: int = 0
+
+
+class RelayOutboxUseCase:
+    """
+    Use case for publishing one batch of outbox events.
+
+    Events are claimed and their results written back in two short
+    transactions on the given session; the broker calls in between are
+    batched by the publisher. Failed events are retried with exponential
+    backoff and never dropped.
+    """
+
+    def __init__(
+        self,
+        outbox_repository: OutboxRepository,
+        publisher: BatchEventPublisher,
+        session: AsyncSession,
+        batch_size: int = 100,
+        lease: timedelta = timedelta(seconds=60),
+        retry_base_delay: timedelta = timedelta(seconds=1),
+        retry_max_delay: timedelta = timedelta(minutes=5),
+    ):
+        self.outbox_repository = outbox_repository
+        self.publisher = publisher
+        self.session = session
+        self.batch_size = batch_size
+        self.lease = lease
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
+
+    async def execute(self) -> OutboxRelayResult:
+        """
+        Claim, publish and record one batch.
+
+        Returns:
+            Batch counts; ``claimed == 0`` means nothing was due
+        """
+        started = datetime.now(timezone.utc)
+        result = OutboxRelayResult()
+
+        events = await self.outbox_repository.claim_due(self.batch_size, self.lease)
+        await self.session.commit()
+        result.claimed = len(events)
+        if not events:
+            return result
+
+        try:
+            failed_ids = set(await self.publisher.publish_batch(events))
+            error = "Rejected by broker"
+        except Exception as e:
+            logger.error(f"Outbox publish failed for {len(events)} events: {e}", exc_info=True)
+            failed_ids = {event.id for event in events}
+            error = str(e)
+
+        now = datetime.now(timezone.utc)
+        published = []
+        retries = []
+        for event in events:
+            if event.id in failed_ids:
+                event.schedule_retry(error, self.retry_base_delay, self.retry_max_delay, now)
+                retries.append(event)
+            else:
+                event.mark_published(now)
+                published.append(event)
+
+        await self.outbox_repository.mark_published(published)
+        await self.outbox_repository.save_retries(retries)
+        await self.session.commit()
+
+        result.published = len(published)
+        result.failed = len(retries)
+        result.duration_ms = int((datetime.now(timezone.utc) - started).total_seconds() * 1000)
+
+        logger.info(
+            f"Relayed outbox batch of {result.claimed} events: "
+            f"{result.published} published, {result.failed} retrying "
+            f"in {result.duration_ms}ms"
+        )
+        return result
@@ -2,6 +2,7 @@
 
 from .order import Order
 from .order_item import OrderItem
+from .outbox_event import OutboxEvent
 from .report import Report
 
-__all__ = ["Order", "OrderItem", "Report"]
+__all__ = ["Order", "OrderItem", "OutboxEvent", "Report"]
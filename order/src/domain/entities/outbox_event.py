@@ -0,0 +1,86 @@
+"""Outbox event entity for transactional event publishing."""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+from uuid import UUID, uuid4
+
+MICROSERVICE_NAME = "order"
+
+# 2**30 seconds is decades; any realistic max_delay caps well before this
+MAX_BACKOFF_EXPONENT = 30
+
+
+@dataclass
+class OutboxEvent:
+    """
+    Domain event waiting to be published.
+
+    Written in the same transaction as the order it describes and drained by
+    the outbox relay, so an event exists if and only if its order does.
+    """
+
+    # Required fields
+    id: UUID
+    event_type: str
+    payload: Dict[str, Any]
+    created_at: datetime
+
+    # Delivery state
+    attempts: int = 0
+    next_attempt_at: Optional[datetime] = None
+    published_at: Optional[datetime] = None
+    last_error: Optional[str] = None
+
+    @classmethod
+    def create(cls, event_type: str, payload: Dict[str, Any]) -> "OutboxEvent":
+        """Create a new event that is due for publishing immediately."""
+        now = datetime.now(timezone.utc)
+        return cls(
+            id=uuid4(),
+            event_type=event_type,
+            payload=payload,
+            created_at=now,
+            next_attempt_at=now,
+        )
+
+    @property
+    def is_published(self) -> bool:
+        return self.published_at is not None
+
+    def to_message(self) -> Dict[str, Any]:
+        """
+        Build the message body sent to consumers.
+
+        The outbox id doubles as ``event_id`` so redeliveries after a retry
+        carry the same id and are dropped by consumer idempotency checks.
+        """
+        created_at = self.created_at.astimezone(timezone.utc).replace(tzinfo=None)
+        return {
+            "event_type": self.event_type,
+            "microservice": MICROSERVICE_NAME,
+            "timestamp": created_at.isoformat() + "Z",
+            "event_id": str(self.id),
+            **self.payload,
+        }
+
+    def mark_published(self, published_at: datetime) -> None:
+        """Mark event as delivered to the broker."""
+        self.published_at = published_at
+        self.next_attempt_at = None
+        self.last_error = None
+
+    def schedule_retry(
+        self,
+        error: str,
+        base_delay: timedelta,
+        max_delay: timedelta,
+        now: datetime,
+    ) -> None:
+        """Record a failed attempt and back off exponentially before the next one."""
+        self.attempts += 1
+        # Cap the exponent: timedelta overflows long before attempts stop growing
+        exponent = min(self.attempts - 1, MAX_BACKOFF_EXPONENT)
+        delay = min(base_delay * (2 ** exponent), max_delay)
+        self.next_attempt_at = now + delay
+        self.last_error = error[:1000]
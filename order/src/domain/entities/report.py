@@ -32,6 +32,11 @@ class Report:
     error_message: Optional[str] = None
     completed_at: Optional[datetime] = None
 
+    # Deduplication: identical requests share a fingerprint; a report that
+    # reuses or waits on another report's artifact points at it
+    fingerprint: Optional[str] = None
+    source_report_id: Optional[UUID] = None
+
     def __post_init__(self):
         """Validate report invariants after initialization."""
         self.validate()
@@ -104,3 +104,25 @@ class ReportNotFoundException(NotFoundException):
             message=f"Report {report_id} not found",
             error_code="REPORT_NOT_FOUND"
         )
+
+
+class InvalidReportCursorException(ValidationException):
+    """Report listing cursor could not be parsed."""
+
+    def __init__(self, cursor: str):
+        self.cursor = cursor
+        super().__init__(
+            message="Invalid report cursor",
+            error_code="INVALID_REPORT_CURSOR"
+        )
+
+
+class InvalidOrderCursorException(ValidationException):
+    """Order listing cursor could not be parsed."""
+
+    def __init__(self, cursor: str):
+        self.cursor = cursor
+        super().__init__(
+            message="Invalid order cursor",
+            error_code="INVALID_ORDER_CURSOR"
+        )
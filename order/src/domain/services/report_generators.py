@@ -1,19 +1,35 @@
 """Report generators for different report types."""
 
 import logging
-from datetime import datetime
+from datetime import date, datetime, timedelta, timezone
 from decimal import Decimal
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import and_, func, or_, select, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.domain.value_objects import utc_day, utc_midnight
 from src.infrastructure.database.models import Order as OrderModel
+from src.infrastructure.database.models import OrderDailySellerStats as StatsModel
 
 logger = logging.getLogger(__name__)
 
 
+def _whole_days(start_date: datetime, end_date: datetime) -> Tuple[date, date]:
+    """
+    UTC days lying entirely inside [start_date, end_date].
+
+    Returns (first_day, end_day) covering first_day <= day < end_day; the
+    range is empty when first_day >= end_day.
+    """
+    first_day = utc_day(start_date)
+    start_utc = start_date if start_date.tzinfo else start_date.replace(tzinfo=timezone.utc)
+    if utc_midnight(first_day) < start_utc:
+        first_day += timedelta(days=1)
+    return first_day, utc_day(end_date)
+
+
 class OrdersPerSellerReportGenerator:
     """Generate orders per seller report with revenue aggregation."""
 
@@ -41,53 +57,74 @@ class OrdersPerSellerReportGenerator:
             f"Generating orders_per_seller report from {start_date} to {end_date}"
         )
 
-        # Build query filters
-        query_filters = [
-            OrderModel.fecha_pedido >= start_date,
-            OrderModel.fecha_pedido <= end_date,
-            OrderModel.seller_id.isnot(None),  # Only orders with sellers
-        ]
-
-        # Apply optional filters
-        if filters and "seller_id" in filters:
-            query_filters.append(OrderModel.seller_id == UUID(filters["seller_id"]))
+        seller_filter = (
+            UUID(filters["seller_id"]) if filters and "seller_id" in filters else None
+        )
 
-        # Aggregation query
-        stmt = (
-            select(
-                OrderModel.seller_id,
-                OrderModel.seller_name,
-                OrderModel.seller_email,
-                func.count(OrderModel.id).label("total_orders"),
-                func.sum(OrderModel.monto_total).label("total_revenue"),
+        # Whole UTC days inside the range come from the daily rollup; only the
+        # partial days at either edge (typically today) scan the orders table
+        first_day, end_day = _whole_days(start_date, end_date)
+        if first_day < end_day:
+            raw_window = or_(
+                and_(
+                    OrderModel.fecha_pedido >= start_date,
+                    OrderModel.fecha_pedido < utc_midnight(first_day),
+                ),
+                and_(
+                    OrderModel.fecha_pedido >= utc_midnight(end_day),
+                    OrderModel.fecha_pedido <= end_date,
+                ),
             )
-            .where(and_(*query_filters))
-            .group_by(
-                OrderModel.seller_id, OrderModel.seller_name, OrderModel.seller_email
+            parts = [
+                self._rollup_totals(first_day, end_day, seller_filter),
+                self._raw_totals(raw_window, seller_filter),
+            ]
+        else:
+            raw_window = and_(
+                OrderModel.fecha_pedido >= start_date,
+                OrderModel.fecha_pedido <= end_date,
             )
-            .order_by(func.sum(OrderModel.monto_total).desc())
-        )
+            parts = [self._raw_totals(raw_window, seller_filter)]
+
+        combined = union_all(*parts).subquery()
+        stmt = select(combined).order_by(combined.c.last_order_at)
 
         result = await self.session.execute(stmt)
         rows = result.all()
 
+        # Merge the per-source totals by seller; rows come oldest first, so
+        # seller name and email end up as on the latest order
+        sellers: Dict[Any, Dict[str, Any]] = {}
+        for row in rows:
+            seller = sellers.setdefault(
+                row.seller_id, {"total_orders": 0, "total_revenue": Decimal("0.00")}
+            )
+            seller["seller_name"] = row.seller_name
+            seller["seller_email"] = row.seller_email
+            seller["total_orders"] += row.total_orders
+            seller["total_revenue"] += row.total_revenue or Decimal("0.00")
+
+        ranked = sorted(
+            sellers.items(), key=lambda entry: entry[1]["total_revenue"], reverse=True
+        )
+
         # Format data
         data = []
         total_orders = 0
         total_revenue = Decimal("0.00")
 
-        for row in rows:
-            seller_orders = row.total_orders
-            seller_revenue = row.total_revenue or Decimal("0.00")
+        for seller_id, seller in ranked:
+            seller_orders = seller["total_orders"]
+            seller_revenue = seller["total_revenue"]
             average_order_value = (
                 seller_revenue / seller_orders if seller_orders > 0 else Decimal("0.00")
             )
 
             data.append(
                 {
-                    "seller_id": str(row.seller_id),
-                    "seller_name": row.seller_name,
-                    "seller_email": row.seller_email,
+                    "seller_id": str(seller_id),
+                    "seller_name": seller["seller_name"],
+                    "seller_email": seller["seller_email"],
                     "total_orders": seller_orders,
                     "total_revenue": float(seller_revenue),
                     "average_order_value": float(average_order_value),
@@ -124,6 +161,62 @@ class OrdersPerSellerReportGenerator:
         )
         return report
 
+    @staticmethod
+    def _rollup_totals(first_day: date, end_day: date, seller_id: Optional[UUID]):
+        """Per-seller totals for days first_day <= day < end_day from the rollup."""
+        query_filters = [StatsModel.day >= first_day, StatsModel.day < end_day]
+        if seller_id:
+            query_filters.append(StatsModel.seller_id == seller_id)
+
+        totals = (
+            select(
+                StatsModel.seller_id,
+                func.sum(StatsModel.order_count).label("total_orders"),
+                func.sum(StatsModel.revenue).label("total_revenue"),
+                func.max(StatsModel.day).label("last_day"),
+            )
+            .where(and_(*query_filters))
+            .group_by(StatsModel.seller_id)
+            .subquery()
+        )
+        # Seller data from the seller's latest day in the range
+        return select(
+            totals.c.seller_id,
+            StatsModel.seller_name,
+            StatsModel.seller_email,
+            totals.c.total_orders,
+            totals.c.total_revenue,
+            StatsModel.last_order_at,
+        ).join(
+            StatsModel,
+            and_(
+                StatsModel.seller_id == totals.c.seller_id,
+                StatsModel.day == totals.c.last_day,
+            ),
+        )
+
+    @staticmethod
+    def _raw_totals(window, seller_id: Optional[UUID]):
+        """Per-seller totals straight from the orders table."""
+        query_filters = [window, OrderModel.seller_id.isnot(None)]
+        if seller_id:
+            query_filters.append(OrderModel.seller_id == seller_id)
+
+        return (
+            select(
+                OrderModel.seller_id,
+                OrderModel.seller_name,
+                OrderModel.seller_email,
+                func.count(OrderModel.id).label("total_orders"),
+                func.sum(OrderModel.monto_total).label("total_revenue"),
+                func.max(OrderModel.fecha_pedido).label("last_order_at"),
+            )
+            .where(and_(*query_filters))
+            .group_by(
+                OrderModel.seller_id, OrderModel.seller_name, OrderModel.seller_email
+            )
+        )
+
 
 class OrdersPerStatusReportGenerator:
     """Generate orders per status report with revenue aggregation."""
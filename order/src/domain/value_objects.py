@@ -1,6 +1,17 @@
 """Value objects for the Order domain."""
 
+import base64
+import binascii
+from dataclasses import dataclass
+from datetime import date, datetime, time, timezone
 from enum import Enum
+from typing import Tuple
+from uuid import UUID
+
+from src.domain.exceptions import (
+    InvalidOrderCursorException,
+    InvalidReportCursorException,
+)
 
 
 class CreationMethod(str, Enum):
@@ -29,3 +40,83 @@ class ReportStatus(str, Enum):
     PROCESSING = "processing"
     COMPLETED = "completed"
     FAILED = "failed"
+
+
+@dataclass(frozen=True)
+class ReportCursor:
+    """Keyset position in a report listing ordered by (created_at, id) DESC.
+
+    Encoded as an opaque URL-safe token. The BFF merges report pages from
+    several services by this same key, so the format must stay in sync with
+    the inventory service and the BFF.
+    """
+
+    created_at: datetime
+    id: UUID
+
+    def encode(self) -> str:
+        return _encode_keyset(self.created_at, self.id)
+
+    @classmethod
+    def decode(cls, token: str) -> "ReportCursor":
+        """Parse a token produced by ``encode``.
+
+        Raises:
+            InvalidReportCursorException: If the token is malformed
+        """
+        try:
+            created_at, report_id = _decode_keyset(token)
+        except ValueError as e:
+            raise InvalidReportCursorException(token) from e
+        return cls(created_at=created_at, id=report_id)
+
+
+@dataclass(frozen=True)
+class OrderCursor:
+    """Keyset position in an order listing ordered by (fecha_pedido, id) DESC."""
+
+    fecha_pedido: datetime
+    id: UUID
+
+    def encode(self) -> str:
+        return _encode_keyset(self.fecha_pedido, self.id)
+
+    @classmethod
+    def decode(cls, token: str) -> "OrderCursor":
+        """Parse a token produced by ``encode``.
+
+        Raises:
+            InvalidOrderCursorException: If the token is malformed
+        """
+        try:
+            fecha_pedido, order_id = _decode_keyset(token)
+        except ValueError as e:
+            raise InvalidOrderCursorException(token) from e
+        return cls(fecha_pedido=fecha_pedido, id=order_id)
+
+
+def _encode_keyset(timestamp: datetime, id: UUID) -> str:
+    raw = f"{timestamp.isoformat()}|{id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_keyset(token: str) -> Tuple[datetime, UUID]:
+    """Inverse of ``_encode_keyset``; raises ValueError on a malformed token."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        timestamp, id = base64.urlsafe_b64decode(padded).decode().split("|")
+        return datetime.fromisoformat(timestamp), UUID(id)
+    except (binascii.Error, UnicodeDecodeError) as e:
+        raise ValueError(str(e)) from e
+
+
+def utc_day(moment: datetime) -> date:
+    """UTC calendar day of a timestamp; naive timestamps are taken as UTC."""
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc)
+    return moment.date()
+
+
+def utc_midnight(day: date) -> datetime:
+    """Start of a UTC calendar day."""
+    return datetime.combine(day, time.min, tzinfo=timezone.utc)
@@ -46,6 +46,36 @@ class Settings(BaseSettings):
         description="DEPRECATED - Use sns_order_events_topic_arn instead"
     )
 
+    # Transactional outbox relay
+    outbox_relay_enabled: bool = Field(
+        default=True,
+        description="Run the background relay that publishes outbox events to SNS"
+    )
+    outbox_batch_size: int = Field(
+        default=100,
+        description="Outbox events claimed per relay batch (published 10 per SNS call)"
+    )
+    outbox_poll_interval_seconds: float = Field(
+        default=1.0,
+        description="Relay sleep when the outbox is drained; new orders wake it early"
+    )
+    outbox_lease_seconds: int = Field(
+        default=60,
+        description="How long a claimed event is hidden from other relays"
+    )
+    outbox_retry_base_delay_seconds: float = Field(default=1.0)
+    outbox_retry_max_delay_seconds: float = Field(default=300.0)
+
+    # Report deduplication
+    report_dedup_window_seconds: int = Field(
+        default=300,
+        description="Identical report requests within this window share one artifact (0 disables)"
+    )
+    report_dedup_stale_after_seconds: int = Field(
+        default=120,
+        description="An unfinished match older than this is replaced, not joined (keep below the window)"
+    )
+
     aws_access_key_id: str = Field(default="test")
     aws_secret_access_key: str = Field(default="test")
     aws_endpoint_url: str | None = Field(
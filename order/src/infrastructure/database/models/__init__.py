@@ -1,6 +1,8 @@
 from .base import Base
 from .order import Order
+from .order_daily_seller_stats import OrderDailySellerStats
 from .order_item import OrderItem
+from .outbox_event import OutboxEvent
 from .report import Report, ReportStatus, ReportType
 
-__all__ = ["Base", "Order", "OrderItem", "Report", "ReportStatus", "ReportType"]
+__all__ = ["Base", "Order", "OrderDailySellerStats", "OrderItem", "OutboxEvent", "Report", "ReportStatus", "ReportType"]
@@ -3,7 +3,7 @@ from datetime import date, datetime
 from decimal import Decimal
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import UUID, Date, DateTime, Numeric, String, func
+from sqlalchemy import UUID, Date, DateTime, Index, Numeric, String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base
@@ -21,6 +21,11 @@ class Order(Base):
     """
 
     __tablename__ = "orders"
+    __table_args__ = (
+        # Keyset listing (newest first), overall and per customer
+        Index("idx_orders_fecha_pedido_id", "fecha_pedido", "id"),
+        Index("idx_orders_customer_fecha_pedido", "customer_id", "fecha_pedido", "id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
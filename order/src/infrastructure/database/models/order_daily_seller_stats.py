@@ -0,0 +1,33 @@
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Optional
+
+from sqlalchemy import UUID, Date, DateTime, Integer, Numeric, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+
+class OrderDailySellerStats(Base):
+    """
+    Per-seller, per-day order rollup for the orders_per_seller report.
+
+    One row per (UTC day of ``fecha_pedido``, seller). Maintained by
+    ``OrderRepository.save`` in the same transaction as the order and
+    rebuilt by the ``backfill-daily-stats`` command.
+    """
+
+    __tablename__ = "order_daily_seller_stats"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    seller_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+
+    # Seller data as recorded on the latest order of the day
+    seller_name: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    seller_email: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+
+    order_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    revenue: Mapped[Decimal] = mapped_column(Numeric(14, 2), nullable=False, default=0)
+
+    last_order_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
@@ -0,0 +1,52 @@
+import uuid
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from sqlalchemy import JSON, DateTime, Index, Integer, String, Text, UUID, func, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+
+class OutboxEvent(Base):
+    """
+    Transactional outbox for order events.
+
+    Rows are inserted in the same transaction as the order and published to
+    SNS by the outbox relay. Published rows keep ``published_at`` for auditing.
+    """
+
+    __tablename__ = "order_outbox"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+
+    event_type: Mapped[str] = mapped_column(String(100), nullable=False)
+
+    payload: Mapped[Dict[str, Any]] = mapped_column(JSON, nullable=False)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    next_attempt_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+
+    published_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+
+    last_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+    __table_args__ = (
+        # Only unpublished rows are ever scanned by the relay
+        Index(
+            "idx_order_outbox_pending",
+            "next_attempt_at",
+            postgresql_where=text("published_at IS NULL"),
+        ),
+    )
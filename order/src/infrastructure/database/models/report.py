@@ -65,9 +65,20 @@ class Report(Base):
         DateTime(timezone=True), nullable=True
     )
 
+    # Same fingerprint = same type, date range, filters and data version
+    fingerprint: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+
+    # Report whose artifact this one reuses or waits for
+    source_report_id: Mapped[Optional[uuid.UUID]] = mapped_column(
+        UUID(as_uuid=True), nullable=True
+    )
+
     __table_args__ = (
         Index("idx_order_reports_user_id", "user_id"),
         Index("idx_order_reports_status", "status"),
         Index("idx_order_reports_created_at", "created_at"),
         Index("idx_order_reports_user_status", "user_id", "status"),
+        Index("idx_order_reports_user_created", "user_id", "created_at", "id"),  # Keyset listing
+        Index("idx_order_reports_fingerprint", "fingerprint", "created_at"),  # Dedup lookup
+        Index("idx_order_reports_source", "source_report_id"),
     )
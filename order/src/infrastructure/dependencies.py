@@ -1,21 +1,24 @@
 """Dependency injection container for FastAPI."""
 import os
+from datetime import timedelta
 from functools import lru_cache
 
 import httpx
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.adapters.input.outbox_relay import OutboxRelay
 from src.adapters.output.adapters.http_customer_adapter import HttpCustomerAdapter
 from src.adapters.output.adapters.simple_inventory_adapter import SimpleInventoryAdapter
 from src.adapters.output.adapters.sns_event_publisher import SNSEventPublisher
 from src.adapters.output.repositories.order_repository import OrderRepository
+from src.adapters.output.repositories.outbox_repository import OutboxRepository
 from src.adapters.output.repositories.report_repository import ReportRepository
 from src.application.ports import (
     CustomerPort,
-    EventPublisher,
     InventoryPort,
     OrderRepository as OrderRepositoryPort,
+    OutboxRepository as OutboxRepositoryPort,
 )
 from src.application.ports.report_repository import ReportRepository as ReportRepositoryPort
 from src.application.use_cases.create_order import CreateOrderUseCase
@@ -26,10 +29,12 @@ from src.application.use_cases.get_report import GetReportUseCase
 from src.application.use_cases.list_customer_orders import ListCustomerOrdersUseCase
 from src.application.use_cases.list_orders import ListOrdersUseCase
 from src.application.use_cases.list_reports import ListReportsUseCase
+from src.application.use_cases.relay_outbox import RelayOutboxUseCase
+from src.domain.services.report_dedup import ReportDedupMetrics
 from src.domain.services.s3_service import S3Service
 from src.domain.services.sqs_publisher import SQSPublisher
 from src.infrastructure.config.settings import settings
-from src.infrastructure.database.config import get_db
+from src.infrastructure.database.config import async_session, get_db
 
 
 # Repository providers
@@ -55,12 +60,24 @@ def get_sqs_publisher() -> SQSPublisher:
     return SQSPublisher(queue_url=queue_url, region=region)
 
 
+@lru_cache()
+def get_report_dedup_metrics() -> ReportDedupMetrics:
+    """Get the process-wide report deduplication counters."""
+    return ReportDedupMetrics()
+
+
 # Use case providers
 def get_create_report_use_case(
     repo: ReportRepositoryPort = Depends(get_report_repository),
+    metrics: ReportDedupMetrics = Depends(get_report_dedup_metrics),
 ) -> CreateReportUseCase:
     """Get create report use case with injected dependencies."""
-    return CreateReportUseCase(repo)
+    return CreateReportUseCase(
+        repo,
+        freshness_window=timedelta(seconds=settings.report_dedup_window_seconds),
+        metrics=metrics,
+        stale_after=timedelta(seconds=settings.report_dedup_stale_after_seconds),
+    )
 
 
 def get_list_reports_use_case(
@@ -157,7 +174,8 @@ def get_customer_adapter() -> CustomerPort:
     )
 
 
-def get_event_publisher() -> EventPublisher:
+@lru_cache()
+def get_event_publisher() -> SNSEventPublisher:
     """Get event publisher implementation (SNS)."""
     return SNSEventPublisher(
         topic_arn=settings.sns_order_events_topic_arn,
@@ -166,6 +184,34 @@ def get_event_publisher() -> EventPublisher:
     )
 
 
+def get_outbox_repository(db: AsyncSession = Depends(get_db)) -> OutboxRepositoryPort:
+    """Get outbox repository implementation (shares the request session)."""
+    return OutboxRepository(db)
+
+
+def get_relay_outbox_use_case(session: AsyncSession) -> RelayOutboxUseCase:
+    """Build the relay use case for one batch session."""
+    return RelayOutboxUseCase(
+        outbox_repository=OutboxRepository(session),
+        publisher=get_event_publisher(),
+        session=session,
+        batch_size=settings.outbox_batch_size,
+        lease=timedelta(seconds=settings.outbox_lease_seconds),
+        retry_base_delay=timedelta(seconds=settings.outbox_retry_base_delay_seconds),
+        retry_max_delay=timedelta(seconds=settings.outbox_retry_max_delay_seconds),
+    )
+
+
+@lru_cache()
+def get_outbox_relay() -> OutboxRelay:
+    """Get the process-wide outbox relay."""
+    return OutboxRelay(
+        session_factory=async_session,
+        use_case_factory=get_relay_outbox_use_case,
+        poll_interval_seconds=settings.outbox_poll_interval_seconds,
+    )
+
+
 def get_order_repository(db: AsyncSession = Depends(get_db)) -> OrderRepositoryPort:
     """Get order repository implementation."""
     return OrderRepository(db)
@@ -176,14 +222,15 @@ def get_create_order_use_case(
     order_repository: OrderRepositoryPort = Depends(get_order_repository),
     customer_port: CustomerPort = Depends(get_customer_adapter),
     inventory_port: InventoryPort = Depends(get_inventory_adapter),
-    event_publisher: EventPublisher = Depends(get_event_publisher),
+    outbox_repository: OutboxRepositoryPort = Depends(get_outbox_repository),
 ) -> CreateOrderUseCase:
     """Get create order use case with injected dependencies."""
     return CreateOrderUseCase(
         order_repository=order_repository,
         customer_port=customer_port,
         inventory_port=inventory_port,
-        event_publisher=event_publisher,
+        outbox_repository=outbox_repository,
+        on_event_stored=get_outbox_relay().wake if settings.outbox_relay_enabled else None,
     )
 
 
@@ -222,7 +222,7 @@ async def test_list_orders_empty():
         "src.adapters.input.controllers.order_controller.ListOrdersUseCase"
     ) as MockUseCase:
         mock_use_case = MockUseCase.return_value
-        mock_use_case.execute = AsyncMock(return_value=([], 0))
+        mock_use_case.execute = AsyncMock(return_value=([], 0, None))
 
         async with AsyncClient(
             transport=ASGITransport(app=app), base_url="http://test"
@@ -277,7 +277,7 @@ async def test_list_orders_with_data():
         "src.adapters.input.controllers.order_controller.ListOrdersUseCase"
     ) as MockUseCase:
         mock_use_case = MockUseCase.return_value
-        mock_use_case.execute = AsyncMock(return_value=([order1, order2], 2))
+        mock_use_case.execute = AsyncMock(return_value=([order1, order2], 2, None))
 
         async with AsyncClient(
             transport=ASGITransport(app=app), base_url="http://test"
@@ -342,7 +342,7 @@ async def test_list_orders_pagination_calculation():
     ) as MockUseCase:
         mock_use_case = MockUseCase.return_value
         # Return 2 orders but total is 5
-        mock_use_case.execute = AsyncMock(return_value=(mock_orders, 5))
+        mock_use_case.execute = AsyncMock(return_value=(mock_orders, 5, None))
 
         async with AsyncClient(
             transport=ASGITransport(app=app), base_url="http://test"
@@ -358,6 +358,50 @@ async def test_list_orders_pagination_calculation():
         assert data["has_previous"] is False  # offset = 0
 
 
+@pytest.mark.asyncio
+async def test_list_orders_cursor_page():
+    """Test a cursor page without a total derives has_next from next_cursor."""
+    app = FastAPI()
+    app.include_router(router)
+
+    mock_orders = [
+        Order(
+            id=uuid.uuid4(),
+            customer_id=uuid.uuid4(),
+            fecha_pedido=datetime.now(),
+            fecha_entrega_estimada=date.today() + timedelta(days=2),
+            metodo_creacion=CreationMethod.APP_CLIENTE,
+            direccion_entrega=f"{i} Test St",
+            ciudad_entrega="Test City",
+            pais_entrega="Test Country",
+            customer_name=f"Customer {i}",
+            monto_total=Decimal("100.00"),
+        )
+        for i in range(2)
+    ]
+
+    with patch(
+        "src.adapters.input.controllers.order_controller.ListOrdersUseCase"
+    ) as MockUseCase:
+        mock_use_case = MockUseCase.return_value
+        mock_use_case.execute = AsyncMock(return_value=(mock_orders, None, "next-token"))
+
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.get("/orders?limit=2&cursor=prev-token")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] is None
+        assert data["has_next"] is True
+        assert data["has_previous"] is True
+        assert data["next_cursor"] == "next-token"
+        mock_use_case.execute.assert_called_once_with(
+            limit=2, offset=0, cursor="prev-token", include_total=True
+        )
+
+
 @pytest.mark.asyncio
 async def test_get_order_by_id():
     """Test getting an order by ID."""
@@ -486,7 +530,7 @@ async def test_list_customer_orders_success():
         "src.adapters.input.controllers.order_controller.ListCustomerOrdersUseCase"
     ) as MockUseCase:
         mock_use_case = MockUseCase.return_value
-        mock_use_case.execute = AsyncMock(return_value=([order1, order2], 2))
+        mock_use_case.execute = AsyncMock(return_value=([order1, order2], 2, None))
 
         async with AsyncClient(
             transport=ASGITransport(app=app), base_url="http://test"
@@ -515,7 +559,7 @@ async def test_list_customer_orders_empty():
         "src.adapters.input.controllers.order_controller.ListCustomerOrdersUseCase"
     ) as MockUseCase:
         mock_use_case = MockUseCase.return_value
-        mock_use_case.execute = AsyncMock(return_value=([], 0))
+        mock_use_case.execute = AsyncMock(return_value=([], 0, None))
 
         async with AsyncClient(
             transport=ASGITransport(app=app), base_url="http://test"
@@ -555,7 +599,7 @@ async def test_list_customer_orders_with_pagination():
         "src.adapters.input.controllers.order_controller.ListCustomerOrdersUseCase"
     ) as MockUseCase:
         mock_use_case = MockUseCase.return_value
-        mock_use_case.execute = AsyncMock(return_value=([order1], 5))
+        mock_use_case.execute = AsyncMock(return_value=([order1], 5, None))
 
         async with AsyncClient(
             transport=ASGITransport(app=app), base_url="http://test"
@@ -0,0 +1,81 @@
+"""Tests for outbox controller endpoints."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from src.adapters.input.controllers.outbox_controller import router
+from src.application.ports import OutboxLag
+from src.infrastructure.dependencies import get_outbox_relay, get_outbox_repository
+
+
+@pytest.mark.asyncio
+async def test_outbox_metrics_reports_relay_counters_and_lag():
+    """Test that metrics combine relay counters with the pending backlog."""
+    relay = MagicMock()
+    relay.metrics.return_value = {
+        "running": True,
+        "batches": 2,
+        "claimed": 15,
+        "published": 14,
+        "failed": 1,
+        "errors": 0,
+        "last_batch_ms": 40,
+        "throughput_per_second": 0.233,
+    }
+    repository = AsyncMock()
+    repository.get_lag.return_value = OutboxLag(
+        pending=3,
+        oldest_created_at=datetime.now(timezone.utc) - timedelta(seconds=30),
+    )
+
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_outbox_relay] = lambda: relay
+    app.dependency_overrides[get_outbox_repository] = lambda: repository
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.get("/outbox/metrics")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["published"] == 14
+    assert data["pending"] == 3
+    assert 29 <= data["lag_seconds"] < 60
+
+
+@pytest.mark.asyncio
+async def test_outbox_metrics_without_backlog():
+    """Test that lag is zero when every event has been published."""
+    relay = MagicMock()
+    relay.metrics.return_value = {
+        "running": False,
+        "batches": 0,
+        "claimed": 0,
+        "published": 0,
+        "failed": 0,
+        "errors": 0,
+        "last_batch_ms": 0,
+        "throughput_per_second": 0.0,
+    }
+    repository = AsyncMock()
+    repository.get_lag.return_value = OutboxLag(pending=0)
+
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_outbox_relay] = lambda: relay
+    app.dependency_overrides[get_outbox_repository] = lambda: repository
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.get("/outbox/metrics")
+
+    assert response.status_code == 200
+    assert response.json()["lag_seconds"] == 0.0
+    assert response.json()["oldest_pending_at"] is None
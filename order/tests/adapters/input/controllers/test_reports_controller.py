@@ -237,6 +237,40 @@ async def test_list_reports_pagination():
     assert data["has_previous"] is True
 
 
+@pytest.mark.asyncio
+async def test_list_reports_with_cursor():
+    """Test cursor pagination passes the cursor through and returns the next one."""
+    from src.application.use_cases.list_reports import ListReportsOutput
+    from src.infrastructure.dependencies import get_list_reports_use_case
+
+    app = FastAPI()
+    app.include_router(router)
+
+    user_id = uuid.uuid4()
+
+    mock_output = ListReportsOutput(
+        reports=[], total=15, limit=5, offset=0, next_cursor="next-token"
+    )
+    mock_use_case = AsyncMock()
+    mock_use_case.execute = AsyncMock(return_value=mock_output)
+
+    app.dependency_overrides[get_list_reports_use_case] = lambda: mock_use_case
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.get(
+            f"/reports?user_id={str(user_id)}&limit=5&cursor=page-token"
+        )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["next_cursor"] == "next-token"
+    assert data["has_next"] is True
+    assert data["has_previous"] is True
+    assert mock_use_case.execute.call_args[0][0].cursor == "page-token"
+
+
 @pytest.mark.asyncio
 async def test_get_report_success():
     """Test getting a single report by ID."""
@@ -415,3 +449,30 @@ async def test_get_report_failed_with_error_message():
     assert data["status"] == ReportStatus.FAILED.value
     assert data["error_message"] == "S3 upload failed"
     assert data["download_url"] is None
+
+
+@pytest.mark.asyncio
+async def test_get_report_dedup_metrics():
+    """Test the report deduplication counters endpoint."""
+    from src.domain.services.report_dedup import JOINED, REUSED, ReportDedupMetrics
+    from src.infrastructure.dependencies import get_report_dedup_metrics
+
+    metrics = ReportDedupMetrics()
+    metrics.record(REUSED)
+    metrics.record(JOINED)
+
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_report_dedup_metrics] = lambda: metrics
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/reports/dedup/metrics")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["requests"] == 2
+    assert body["reused"] == 1
+    assert body["joined"] == 1
+    assert body["hit_rate"] == 1.0
+    assert "freshness_window_seconds" in body
+
@@ -0,0 +1,97 @@
+"""Tests for the outbox relay worker."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.adapters.input.outbox_relay import OutboxRelay
+from src.application.use_cases.relay_outbox import OutboxRelayResult
+
+
+class FakeSession:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+def _relay(results, **kwargs):
+    use_case = MagicMock()
+    use_case.execute = AsyncMock(side_effect=results)
+    kwargs.setdefault("poll_interval_seconds", 5.0)
+    relay = OutboxRelay(
+        session_factory=FakeSession,
+        use_case_factory=lambda session: use_case,
+        **kwargs,
+    )
+    return relay, use_case
+
+
+@pytest.mark.asyncio
+async def test_run_batch_records_metrics():
+    """Test that batch counts feed the relay metrics."""
+    relay, _ = _relay([OutboxRelayResult(claimed=4, published=3, failed=1, duration_ms=12)])
+
+    await relay.run_batch()
+
+    metrics = relay.metrics()
+    assert metrics["batches"] == 1
+    assert metrics["published"] == 3
+    assert metrics["failed"] == 1
+    assert metrics["last_batch_ms"] == 12
+    assert metrics["throughput_per_second"] > 0
+
+
+@pytest.mark.asyncio
+async def test_drains_until_empty_then_waits():
+    """Test that the relay keeps going while batches publish and sleeps once drained."""
+    relay, use_case = _relay(
+        [
+            OutboxRelayResult(claimed=10, published=10),
+            OutboxRelayResult(claimed=2, published=2),
+            OutboxRelayResult(),
+        ]
+        + [OutboxRelayResult()] * 10
+    )
+
+    task = asyncio.create_task(relay.start())
+    await asyncio.sleep(0.05)
+
+    # Two non-empty batches back to back, then one empty batch and a long sleep
+    assert use_case.execute.await_count == 3
+    await relay.stop()
+    await asyncio.wait_for(task, timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_wake_starts_next_batch_early():
+    """Test that wake() cuts the poll sleep short."""
+    relay, use_case = _relay([OutboxRelayResult()] * 5)
+
+    task = asyncio.create_task(relay.start())
+    await asyncio.sleep(0.01)
+    relay.wake()
+    await asyncio.sleep(0.01)
+
+    assert use_case.execute.await_count == 2
+    await relay.stop()
+    await asyncio.wait_for(task, timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_errors_are_counted_and_backed_off():
+    """Test that batch errors are counted and followed by a backoff."""
+    relay, use_case = _relay(
+        [Exception("db down")] + [OutboxRelayResult()] * 5,
+        error_backoff_seconds=5.0,
+    )
+
+    task = asyncio.create_task(relay.start())
+    await asyncio.sleep(0.02)
+
+    assert relay.metrics()["errors"] == 1
+    assert use_case.execute.await_count == 1
+    await relay.stop()
+    await asyncio.wait_for(task, timeout=1)
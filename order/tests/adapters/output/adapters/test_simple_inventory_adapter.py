@@ -734,3 +734,178 @@ async def test_reserve_inventory_connection_error(mock_http_client):
 
     assert exc_info.value.status_code == 503
     assert "Failed to connect" in str(exc_info.value)
+
+
+@pytest.mark.asyncio
+async def test_get_inventories_success(mock_http_client, sample_inventory_response):
+    """Test fetching several inventories with one batch request."""
+    inventory_id = sample_inventory_response["id"]
+
+    mock_response = AsyncMock()
+    mock_response.status_code = 200
+    mock_response.json = lambda: {"items": [sample_inventory_response], "missing_ids": []}
+    mock_http_client.post.return_value = mock_response
+
+    adapter = SimpleInventoryAdapter(
+        base_url="http://inventory:8004",
+        http_client=mock_http_client,
+    )
+
+    result = await adapter.get_inventories([inventory_id])
+
+    mock_http_client.post.assert_called_once_with(
+        "http://inventory:8004/inventory/inventories/batch",
+        json={"ids": [str(inventory_id)]},
+        timeout=10.0,
+    )
+    info = next(iter(result.values()))
+    assert str(info.id) == inventory_id
+    assert info.product_price == Decimal("10.50")
+
+
+@pytest.mark.asyncio
+async def test_get_inventories_missing_ids_raise_not_found(
+    mock_http_client, sample_inventory_response
+):
+    """Test that any missing inventory fails the whole lookup."""
+    missing_id = str(uuid4())
+
+    mock_response = AsyncMock()
+    mock_response.status_code = 200
+    mock_response.json = lambda: {
+        "items": [sample_inventory_response],
+        "missing_ids": [missing_id],
+    }
+    mock_http_client.post.return_value = mock_response
+
+    adapter = SimpleInventoryAdapter(
+        base_url="http://inventory:8004",
+        http_client=mock_http_client,
+    )
+
+    with pytest.raises(InventoryNotFoundError) as exc_info:
+        await adapter.get_inventories([uuid4(), missing_id])
+
+    assert missing_id in str(exc_info.value)
+
+
+@pytest.mark.asyncio
+async def test_get_inventories_server_error(mock_http_client):
+    """Test batch lookup maps 5xx to InventoryServiceError."""
+    mock_response = AsyncMock()
+    mock_response.status_code = 500
+    mock_response.json = lambda: {"detail": "Database error"}
+    mock_http_client.post.return_value = mock_response
+
+    adapter = SimpleInventoryAdapter(
+        base_url="http://inventory:8004",
+        http_client=mock_http_client,
+    )
+
+    with pytest.raises(InventoryServiceError) as exc_info:
+        await adapter.get_inventories([uuid4()])
+
+    assert exc_info.value.status_code == 500
+
+
+@pytest.mark.asyncio
+async def test_get_inventories_timeout(mock_http_client):
+    """Test batch lookup maps timeouts to 504."""
+    mock_http_client.post.side_effect = httpx.TimeoutException("timed out")
+
+    adapter = SimpleInventoryAdapter(
+        base_url="http://inventory:8004",
+        http_client=mock_http_client,
+    )
+
+    with pytest.raises(InventoryServiceError) as exc_info:
+        await adapter.get_inventories([uuid4()])
+
+    assert exc_info.value.status_code == 504
+
+
+@pytest.mark.asyncio
+async def test_reserve_inventories_success(mock_http_client):
+    """Test reserving every order line with one request."""
+    first, second = uuid4(), uuid4()
+
+    mock_response = AsyncMock()
+    mock_response.status_code = 200
+    mock_response.json = lambda: {
+        "items": [
+            {"id": str(first), "reserved_quantity": 5},
+            {"id": str(second), "reserved_quantity": 2},
+        ]
+    }
+    mock_http_client.post.return_value = mock_response
+
+    adapter = SimpleInventoryAdapter(
+        base_url="http://inventory:8004",
+        http_client=mock_http_client,
+    )
+
+    result = await adapter.reserve_inventories([(first, 5), (second, 2)])
+
+    mock_http_client.post.assert_called_once_with(
+        "http://inventory:8004/inventory/reservations",
+        json={
+            "items": [
+                {"inventory_id": str(first), "quantity_delta": 5},
+                {"inventory_id": str(second), "quantity_delta": 2},
+            ]
+        },
+        timeout=10.0,
+    )
+    assert [item["reserved_quantity"] for item in result] == [5, 2]
+
+
+@pytest.mark.asyncio
+async def test_reserve_inventories_insufficient_stock(mock_http_client):
+    """Test batch reservation maps 409 to InsufficientInventoryError."""
+    from src.adapters.output.adapters.simple_inventory_adapter import InsufficientInventoryError
+
+    mock_response = AsyncMock()
+    mock_response.status_code = 409
+    mock_response.json = lambda: {"message": "Insufficient inventory available"}
+    mock_http_client.post.return_value = mock_response
+
+    adapter = SimpleInventoryAdapter(
+        base_url="http://inventory:8004",
+        http_client=mock_http_client,
+    )
+
+    with pytest.raises(InsufficientInventoryError):
+        await adapter.reserve_inventories([(uuid4(), 5)])
+
+
+@pytest.mark.asyncio
+async def test_reserve_inventories_not_found(mock_http_client):
+    """Test batch reservation maps 404 to InventoryNotFoundError."""
+    mock_response = AsyncMock()
+    mock_response.status_code = 404
+    mock_response.json = lambda: {"message": "Inventory not found"}
+    mock_http_client.post.return_value = mock_response
+
+    adapter = SimpleInventoryAdapter(
+        base_url="http://inventory:8004",
+        http_client=mock_http_client,
+    )
+
+    with pytest.raises(InventoryNotFoundError):
+        await adapter.reserve_inventories([(uuid4(), 5)])
+
+
+@pytest.mark.asyncio
+async def test_reserve_inventories_connection_error(mock_http_client):
+    """Test batch reservation maps connection errors to 503."""
+    mock_http_client.post.side_effect = httpx.ConnectError("refused")
+
+    adapter = SimpleInventoryAdapter(
+        base_url="http://inventory:8004",
+        http_client=mock_http_client,
+    )
+
+    with pytest.raises(InventoryServiceError) as exc_info:
+        await adapter.reserve_inventories([(uuid4(), 5)])
+
+    assert exc_info.value.status_code == 503
@@ -0,0 +1,134 @@
+"""Tests for OrderDailyStatsRepository."""
+
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from src.adapters.output.repositories.order_daily_stats_repository import (
+    OrderDailyStatsRepository,
+)
+from src.adapters.output.repositories.order_repository import OrderRepository
+from src.domain.entities import Order as OrderEntity
+from src.domain.value_objects import CreationMethod
+from src.infrastructure.database.models import OrderDailySellerStats as StatsModel
+
+
+def _order(fecha_pedido, seller_id=None, monto="100.00", seller_name="Seller"):
+    return OrderEntity(
+        id=uuid.uuid4(),
+        customer_id=uuid.uuid4(),
+        fecha_pedido=fecha_pedido,
+        metodo_creacion=(
+            CreationMethod.APP_VENDEDOR if seller_id else CreationMethod.APP_CLIENTE
+        ),
+        direccion_entrega="123 Test St",
+        ciudad_entrega="Test City",
+        pais_entrega="Test Country",
+        customer_name="Test Customer",
+        seller_id=seller_id,
+        seller_name=seller_name if seller_id else None,
+        seller_email="seller@example.com" if seller_id else None,
+        monto_total=Decimal(monto),
+    )
+
+
+async def _stats(db_session):
+    result = await db_session.execute(
+        select(StatsModel).order_by(StatsModel.day, StatsModel.seller_id)
+    )
+    return [
+        (row.day, row.seller_id, row.seller_name, row.order_count, row.revenue)
+        for row in result.scalars().all()
+    ]
+
+
+@pytest.mark.asyncio
+async def test_save_maintains_daily_rollup(db_session):
+    """Test that saved orders are added to their (day, seller) row."""
+    repository = OrderRepository(db_session)
+    seller_id = uuid.uuid4()
+
+    await repository.save(_order(datetime(2025, 3, 1, 9, 0), seller_id, "100.00"))
+    await repository.save(_order(datetime(2025, 3, 1, 18, 0), seller_id, "50.50"))
+    await repository.save(_order(datetime(2025, 3, 2, 8, 0), seller_id, "10.00"))
+    # Orders without a seller are not part of the rollup
+    await repository.save(_order(datetime(2025, 3, 1, 12, 0)))
+
+    assert await _stats(db_session) == [
+        (date(2025, 3, 1), seller_id, "Seller", 2, Decimal("150.50")),
+        (date(2025, 3, 2), seller_id, "Seller", 1, Decimal("10.00")),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_record_keeps_seller_data_of_latest_order(db_session):
+    """Test that a late-arriving older order does not overwrite seller data."""
+    repository = OrderRepository(db_session)
+    seller_id = uuid.uuid4()
+
+    await repository.save(_order(datetime(2025, 3, 1, 9, 0), seller_id, seller_name="Old"))
+    await repository.save(_order(datetime(2025, 3, 1, 18, 0), seller_id, seller_name="New"))
+    await repository.save(_order(datetime(2025, 3, 1, 12, 0), seller_id, seller_name="Old"))
+
+    [(_, _, seller_name, order_count, _)] = await _stats(db_session)
+    assert seller_name == "New"
+    assert order_count == 3
+
+
+@pytest.mark.asyncio
+async def test_rebuild_matches_incremental_rollup(db_session):
+    """Test that rebuilding from orders reproduces the maintained rollup."""
+    repository = OrderRepository(db_session)
+    sellers = [uuid.uuid4(), uuid.uuid4()]
+
+    for day in range(1, 5):
+        for hour, seller_id in [(9, sellers[0]), (15, sellers[1]), (20, sellers[0])]:
+            await repository.save(
+                _order(datetime(2025, 3, day, hour), seller_id, f"{day * hour}.25")
+            )
+    maintained = await _stats(db_session)
+
+    written = await OrderDailyStatsRepository(db_session).rebuild(
+        date(2025, 3, 1), date(2025, 3, 4)
+    )
+
+    assert written == 8
+    assert await _stats(db_session) == maintained
+
+
+@pytest.mark.asyncio
+async def test_rebuild_only_touches_requested_days(db_session):
+    """Test that rows outside the rebuilt range are left alone."""
+    repository = OrderRepository(db_session)
+    seller_id = uuid.uuid4()
+    await repository.save(_order(datetime(2025, 3, 1, 9), seller_id))
+    await repository.save(_order(datetime(2025, 3, 2, 9), seller_id))
+
+    written = await OrderDailyStatsRepository(db_session).rebuild(
+        date(2025, 3, 2), date(2025, 3, 2)
+    )
+
+    assert written == 1
+    assert [row[0] for row in await _stats(db_session)] == [date(2025, 3, 1), date(2025, 3, 2)]
+
+
+@pytest.mark.asyncio
+async def test_record_uses_postgresql_upsert():
+    """Test the statement issued against PostgreSQL."""
+    session = MagicMock()
+    session.get_bind.return_value.dialect.name = "postgresql"
+    session.execute = AsyncMock()
+
+    await OrderDailyStatsRepository(session).record(
+        _order(datetime(2025, 3, 1, 9, 0), uuid.uuid4())
+    )
+
+    stmt = session.execute.call_args[0][0]
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT (day, seller_id) DO UPDATE" in sql
+    assert "order_count = (order_daily_seller_stats.order_count + excluded.order_count)" in sql
@@ -0,0 +1,127 @@
+"""Tests for OutboxRepository."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select, text
+from sqlalchemy.dialects import postgresql
+
+from src.adapters.output.repositories.outbox_repository import OutboxRepository
+from src.domain.entities import OutboxEvent
+from src.infrastructure.database.models import OutboxEvent as OutboxEventModel
+
+
+@pytest_asyncio.fixture
+async def outbox_repository(db_session):
+    await db_session.execute(text("DELETE FROM order_outbox"))
+    await db_session.commit()
+    return OutboxRepository(db_session)
+
+
+async def _stage(repository, count, **overrides):
+    events = []
+    for i in range(count):
+        event = OutboxEvent.create("order_created", {"n": i})
+        for key, value in overrides.items():
+            setattr(event, key, value)
+        await repository.add(event)
+        events.append(event)
+    await repository.session.commit()
+    return events
+
+
+@pytest.mark.asyncio
+async def test_add_does_not_commit(outbox_repository, db_session):
+    """Test that add only stages the row in the caller's transaction."""
+    await outbox_repository.add(OutboxEvent.create("order_created", {}))
+    await db_session.rollback()
+
+    result = await db_session.execute(select(OutboxEventModel))
+    assert result.scalars().all() == []
+
+
+@pytest.mark.asyncio
+async def test_claim_due_leases_events(outbox_repository):
+    """Test that claimed events are pushed out of reach of other relays."""
+    staged = await _stage(outbox_repository, 3)
+
+    claimed = await outbox_repository.claim_due(limit=2, lease=timedelta(minutes=1))
+    await outbox_repository.session.commit()
+    claimed_again = await outbox_repository.claim_due(limit=10, lease=timedelta(minutes=1))
+
+    assert len(claimed) == 2
+    assert {e.id for e in claimed + claimed_again} == {e.id for e in staged}
+    assert all(e.event_type == "order_created" for e in claimed)
+
+
+@pytest.mark.asyncio
+async def test_claim_due_skips_published_and_future_events(outbox_repository):
+    """Test that published and backed-off events are not claimed."""
+    future = datetime.now(timezone.utc) + timedelta(hours=1)
+    await _stage(outbox_repository, 1, next_attempt_at=future)
+    published = await _stage(outbox_repository, 1)
+    published[0].mark_published(datetime.now(timezone.utc))
+    await outbox_repository.mark_published(published)
+    await outbox_repository.session.commit()
+
+    claimed = await outbox_repository.claim_due(limit=10, lease=timedelta(minutes=1))
+
+    assert claimed == []
+
+
+@pytest.mark.asyncio
+async def test_save_retries_and_get_lag(outbox_repository):
+    """Test that failed events stay pending with their retry state."""
+    events = await _stage(outbox_repository, 2)
+    now = datetime.now(timezone.utc)
+    events[0].mark_published(now)
+    events[1].schedule_retry("throttled", timedelta(seconds=1), timedelta(seconds=10), now)
+
+    await outbox_repository.mark_published(events[:1])
+    await outbox_repository.save_retries(events[1:])
+    await outbox_repository.session.commit()
+
+    lag = await outbox_repository.get_lag()
+    model = await outbox_repository.session.get(OutboxEventModel, events[1].id)
+    assert lag.pending == 1
+    assert lag.oldest_created_at is not None
+    assert model.attempts == 1
+    assert model.last_error == "throttled"
+
+
+@pytest.mark.asyncio
+async def test_get_lag_empty(outbox_repository):
+    """Test lag when nothing is pending."""
+    lag = await outbox_repository.get_lag()
+
+    assert lag.pending == 0
+    assert lag.oldest_created_at is None
+
+
+@pytest.mark.asyncio
+async def test_claim_due_uses_skip_locked_on_postgres():
+    """Test that the claim compiles to UPDATE ... FOR UPDATE SKIP LOCKED RETURNING."""
+    captured = {}
+
+    class CaptureSession:
+        async def execute(self, statement):
+            captured["sql"] = str(
+                statement.compile(dialect=postgresql.asyncpg.dialect())
+            )
+
+            class Result:
+                def scalars(self):
+                    return self
+
+                def all(self):
+                    return []
+
+            return Result()
+
+    await OutboxRepository(CaptureSession()).claim_due(10, timedelta(minutes=1))
+
+    sql = captured["sql"]
+    assert sql.startswith("UPDATE order_outbox")
+    assert "FOR UPDATE SKIP LOCKED" in sql
+    assert "RETURNING" in sql
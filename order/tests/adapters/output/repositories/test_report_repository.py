@@ -454,3 +454,98 @@ class TestReportRepositoryUpdateStatus:
                 report_id=non_existent_id,
                 status=ReportStatus.COMPLETED,
             )
+
+
+def _report(fingerprint, status=ReportStatus.PENDING, source_report_id=None, age=0):
+    return ReportEntity(
+        id=uuid.uuid4(),
+        report_type=ReportType.ORDERS_PER_SELLER,
+        status=status,
+        user_id=uuid.uuid4(),
+        start_date=datetime(2025, 1, 1),
+        end_date=datetime(2025, 1, 31),
+        created_at=datetime.utcnow() - timedelta(minutes=age),
+        s3_key="key.json" if status == ReportStatus.COMPLETED else None,
+        error_message="boom" if status == ReportStatus.FAILED else None,
+        fingerprint=fingerprint,
+        source_report_id=source_report_id,
+    )
+
+
+class TestReportDedup:
+    """Fingerprint lookups and follower resolution against SQLite."""
+
+    @pytest.mark.asyncio
+    async def test_find_reusable_prefers_completed(self, db_session):
+        repository = ReportRepository(db_session)
+        fingerprint = uuid.uuid4().hex
+        in_flight = _report(fingerprint, ReportStatus.PROCESSING, age=1)
+        completed = _report(fingerprint, ReportStatus.COMPLETED, age=2)
+        for report in [
+            in_flight,
+            completed,
+            _report(fingerprint, ReportStatus.COMPLETED, source_report_id=completed.id),
+            _report(fingerprint, ReportStatus.FAILED),
+            _report(uuid.uuid4().hex, ReportStatus.COMPLETED),
+        ]:
+            await repository.save(report)
+
+        found = await repository.find_reusable(
+            fingerprint, created_after=datetime.utcnow() - timedelta(minutes=5)
+        )
+
+        assert found.id == completed.id
+
+    @pytest.mark.asyncio
+    async def test_find_reusable_respects_freshness_window(self, db_session):
+        repository = ReportRepository(db_session)
+        fingerprint = uuid.uuid4().hex
+        await repository.save(_report(fingerprint, ReportStatus.COMPLETED, age=10))
+
+        found = await repository.find_reusable(
+            fingerprint, created_after=datetime.utcnow() - timedelta(minutes=5)
+        )
+
+        assert found is None
+
+    @pytest.mark.asyncio
+    async def test_resolve_followers_resolves_each_once(self, db_session):
+        repository = ReportRepository(db_session)
+        source = _report(uuid.uuid4().hex, ReportStatus.COMPLETED)
+        followers = [_report(source.fingerprint, source_report_id=source.id) for _ in range(2)]
+        for report in [source, *followers]:
+            await repository.save(report)
+
+        resolved = await repository.resolve_followers(
+            source.id, ReportStatus.COMPLETED, s3_bucket="bucket", s3_key="key.json"
+        )
+        again = await repository.resolve_followers(
+            source.id, ReportStatus.COMPLETED, s3_bucket="bucket", s3_key="key.json"
+        )
+
+        assert {r.id for r in resolved} == {f.id for f in followers}
+        assert all(r.status == ReportStatus.COMPLETED and r.s3_key == "key.json" for r in resolved)
+        assert again == []
+
+    @pytest.mark.asyncio
+    async def test_adopt_followers_moves_unfinished_reports(self, db_session):
+        repository = ReportRepository(db_session)
+        stale = _report(uuid.uuid4().hex, ReportStatus.PROCESSING)
+        waiting, failed = (
+            _report(stale.fingerprint, source_report_id=stale.id) for _ in range(2)
+        )
+        replacement = _report(stale.fingerprint)
+        for report in [stale, waiting, failed, replacement]:
+            await repository.save(report)
+        await repository.update_status(
+            failed.id, ReportStatus.FAILED, error_message="boom"
+        )
+
+        moved = await repository.adopt_followers(stale.id, replacement.id)
+
+        assert moved == 2
+        resolved = await repository.resolve_followers(
+            replacement.id, ReportStatus.COMPLETED, s3_bucket="bucket", s3_key="key.json"
+        )
+        assert {r.id for r in resolved} == {stale.id, waiting.id}
+        assert (await repository.find_by_id(failed.id)).source_report_id == stale.id
@@ -9,6 +9,7 @@ from uuid import uuid4
 import pytest
 
 from src.adapters.output.adapters.sns_event_publisher import SNSEventPublisher
+from src.domain.entities import OutboxEvent
 
 
 @pytest.fixture
@@ -748,3 +749,63 @@ class TestFanoutBehavior:
 
             # SNS should be called twice
             assert mock_sns.publish.call_count == 2
+
+
+class TestSNSEventPublisherBatch:
+    """Tests for PublishBatch used by the outbox relay."""
+
+    @staticmethod
+    def _with_mock_sns(publisher, mock_sns):
+        mock_session = MagicMock()
+        mock_session.client.return_value.__aenter__.return_value = mock_sns
+        publisher._session = mock_session
+        return mock_session
+
+    @pytest.mark.asyncio
+    async def test_publish_batch_chunks_by_ten_on_one_client(self, sns_publisher):
+        """Test that 23 events go out in 3 PublishBatch calls on one client."""
+        events = [OutboxEvent.create("order_created", {"n": i}) for i in range(23)]
+        mock_sns = AsyncMock()
+        mock_sns.publish_batch = AsyncMock(return_value={"Successful": [], "Failed": []})
+        mock_session = self._with_mock_sns(sns_publisher, mock_sns)
+
+        failed = await sns_publisher.publish_batch(events)
+
+        assert failed == []
+        assert mock_session.client.call_count == 1
+        sizes = [
+            len(call.kwargs["PublishBatchRequestEntries"])
+            for call in mock_sns.publish_batch.call_args_list
+        ]
+        assert sizes == [10, 10, 3]
+
+        entry = mock_sns.publish_batch.call_args_list[0].kwargs["PublishBatchRequestEntries"][0]
+        body = json.loads(entry["Message"])
+        assert body["event_id"] == str(events[0].id)
+        assert body["n"] == 0
+        assert entry["MessageAttributes"]["event_type"]["StringValue"] == "order_created"
+
+    @pytest.mark.asyncio
+    async def test_publish_batch_reports_failed_entries(self, sns_publisher):
+        """Test that entries SNS rejects and chunks that raise are returned as failed."""
+        events = [OutboxEvent.create("order_created", {"n": i}) for i in range(12)]
+        mock_sns = AsyncMock()
+        mock_sns.publish_batch = AsyncMock(
+            side_effect=[
+                {"Failed": [{"Id": "3", "Code": "Throttled", "Message": "slow down"}]},
+                Exception("connection reset"),
+            ]
+        )
+        self._with_mock_sns(sns_publisher, mock_sns)
+
+        failed = await sns_publisher.publish_batch(events)
+
+        assert failed == [events[3].id, events[10].id, events[11].id]
+
+    @pytest.mark.asyncio
+    async def test_publish_batch_without_topic_fails_all(self):
+        """Test that nothing is marked published when no topic is configured."""
+        publisher = SNSEventPublisher(topic_arn="")
+        events = [OutboxEvent.create("order_created", {})]
+
+        assert await publisher.publish_batch(events) == [events[0].id]
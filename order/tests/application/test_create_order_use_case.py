@@ -20,7 +20,7 @@ def mock_dependencies():
         "order_repository": AsyncMock(),
         "customer_port": AsyncMock(),
         "inventory_port": AsyncMock(),
-        "event_publisher": AsyncMock(),
+        "outbox_repository": AsyncMock(),
     }
 
 
@@ -70,7 +70,7 @@ async def test_create_order_app_cliente_success(
     inventario_id = sample_inventory_info.id
 
     mock_dependencies["customer_port"].get_customer.return_value = sample_customer
-    mock_dependencies["inventory_port"].get_inventory.return_value = sample_inventory_info
+    mock_dependencies["inventory_port"].get_inventories.return_value = {sample_inventory_info.id: sample_inventory_info}
 
     # Mock repository save to return the order
     async def mock_save(order):
@@ -100,9 +100,9 @@ async def test_create_order_app_cliente_success(
 
     # Verify mocks were called
     mock_dependencies["customer_port"].get_customer.assert_called_once_with(customer_id)
-    mock_dependencies["inventory_port"].get_inventory.assert_called_once_with(inventario_id)
+    mock_dependencies["inventory_port"].get_inventories.assert_called_once_with([inventario_id])
     mock_dependencies["order_repository"].save.assert_called_once()
-    mock_dependencies["event_publisher"].publish_order_created.assert_called_once()
+    mock_dependencies["outbox_repository"].add.assert_called_once()
 
 
 @pytest.mark.asyncio
@@ -132,7 +132,7 @@ async def test_create_order_app_vendedor_success(
     )
 
     mock_dependencies["customer_port"].get_customer.return_value = sample_customer
-    mock_dependencies["inventory_port"].get_inventory.return_value = inventory_info
+    mock_dependencies["inventory_port"].get_inventories.return_value = {inventory_info.id: inventory_info}
 
     async def mock_save(order):
         return order
@@ -187,7 +187,7 @@ async def test_create_order_applies_30_percent_markup(
         expiration_date=date.today() + timedelta(days=30),
     )
 
-    mock_dependencies["inventory_port"].get_inventory.return_value = inventory_info
+    mock_dependencies["inventory_port"].get_inventories.return_value = {inventory_info.id: inventory_info}
 
     async def mock_save(order):
         return order
@@ -214,24 +214,22 @@ async def test_create_order_applies_30_percent_markup(
 
 
 @pytest.mark.asyncio
-async def test_create_order_handles_event_publish_failure_gracefully(
+async def test_create_order_handles_relay_wake_failure_gracefully(
     mock_dependencies, sample_customer, sample_inventory_info
 ):
-    """Test that event publish failure doesn't fail the order creation."""
+    """Test that failing to wake the outbox relay doesn't fail the order creation."""
     mock_dependencies["customer_port"].get_customer.return_value = sample_customer
-    mock_dependencies["inventory_port"].get_inventory.return_value = sample_inventory_info
+    mock_dependencies["inventory_port"].get_inventories.return_value = {sample_inventory_info.id: sample_inventory_info}
 
     async def mock_save(order):
         return order
 
     mock_dependencies["order_repository"].save.side_effect = mock_save
 
-    # Make event publisher fail
-    mock_dependencies["event_publisher"].publish_order_created.side_effect = Exception(
-        "Event publish failed"
-    )
+    # Make the relay wake-up fail
+    on_event_stored = MagicMock(side_effect=Exception("Relay unavailable"))
 
-    use_case = CreateOrderUseCase(**mock_dependencies)
+    use_case = CreateOrderUseCase(**mock_dependencies, on_event_stored=on_event_stored)
 
     inventario_id = sample_inventory_info.id
 
@@ -244,9 +242,66 @@ async def test_create_order_handles_event_publish_failure_gracefully(
     # Should not raise exception
     order = await use_case.execute(input_data)
 
-    # Order should be created successfully despite event failure
+    # Order should be created successfully despite the wake-up failure
     assert order.id is not None
     assert order.customer_id == sample_customer.id
+    on_event_stored.assert_called_once()
+    mock_dependencies["outbox_repository"].add.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_create_order_stages_outbox_event_before_commit(
+    mock_dependencies, sample_customer, sample_inventory_info
+):
+    """Test that the event is staged before the order commit and the relay woken after."""
+    calls = []
+    mock_dependencies["customer_port"].get_customer.return_value = sample_customer
+    mock_dependencies["inventory_port"].get_inventories.return_value = {sample_inventory_info.id: sample_inventory_info}
+    mock_dependencies["outbox_repository"].add.side_effect = lambda event: calls.append("add")
+
+    async def mock_save(order):
+        calls.append("save")
+        return order
+
+    mock_dependencies["order_repository"].save.side_effect = mock_save
+
+    use_case = CreateOrderUseCase(
+        **mock_dependencies, on_event_stored=lambda: calls.append("wake")
+    )
+
+    input_data = CreateOrderInput(
+        customer_id=sample_customer.id,
+        metodo_creacion=CreationMethod.APP_CLIENTE,
+        items=[OrderItemInput(inventario_id=sample_inventory_info.id, cantidad=1)],
+    )
+
+    await use_case.execute(input_data)
+
+    assert calls == ["add", "save", "wake"]
+
+
+@pytest.mark.asyncio
+async def test_create_order_does_not_wake_relay_when_save_fails(
+    mock_dependencies, sample_customer, sample_inventory_info
+):
+    """Test that a failed commit neither wakes the relay nor swallows the error."""
+    mock_dependencies["customer_port"].get_customer.return_value = sample_customer
+    mock_dependencies["inventory_port"].get_inventories.return_value = {sample_inventory_info.id: sample_inventory_info}
+    mock_dependencies["order_repository"].save.side_effect = Exception("DB down")
+    on_event_stored = MagicMock()
+
+    use_case = CreateOrderUseCase(**mock_dependencies, on_event_stored=on_event_stored)
+
+    input_data = CreateOrderInput(
+        customer_id=sample_customer.id,
+        metodo_creacion=CreationMethod.APP_CLIENTE,
+        items=[OrderItemInput(inventario_id=sample_inventory_info.id, cantidad=1)],
+    )
+
+    with pytest.raises(Exception, match="DB down"):
+        await use_case.execute(input_data)
+
+    on_event_stored.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -289,11 +344,11 @@ async def test_create_order_with_multiple_items(
         expiration_date=date.today() + timedelta(days=30),
     )
 
-    # Mock returns different inventory info based on inventory_id
-    mock_dependencies["inventory_port"].get_inventory.side_effect = [
-        inventory_info_1,
-        inventory_info_2,
-    ]
+    # Batch lookup returns inventory info keyed by inventory_id
+    mock_dependencies["inventory_port"].get_inventories.return_value = {
+        inventario_id_1: inventory_info_1,
+        inventario_id_2: inventory_info_2,
+    }
 
     async def mock_save(order):
         return order
@@ -345,7 +400,7 @@ async def test_create_order_insufficient_inventory(
         expiration_date=date.today() + timedelta(days=30),
     )
 
-    mock_dependencies["inventory_port"].get_inventory.return_value = inventory_info
+    mock_dependencies["inventory_port"].get_inventories.return_value = {inventory_info.id: inventory_info}
 
     use_case = CreateOrderUseCase(**mock_dependencies)
 
@@ -385,7 +440,7 @@ async def test_create_order_exact_available_quantity(
         expiration_date=date.today() + timedelta(days=30),
     )
 
-    mock_dependencies["inventory_port"].get_inventory.return_value = inventory_info
+    mock_dependencies["inventory_port"].get_inventories.return_value = {inventory_info.id: inventory_info}
 
     async def mock_save(order):
         return order
@@ -416,7 +471,7 @@ async def test_create_order_handles_inventory_reservation_failure_gracefully(
 ):
     """Test that inventory reservation failure doesn't fail the order creation."""
     mock_dependencies["customer_port"].get_customer.return_value = sample_customer
-    mock_dependencies["inventory_port"].get_inventory.return_value = sample_inventory_info
+    mock_dependencies["inventory_port"].get_inventories.return_value = {sample_inventory_info.id: sample_inventory_info}
 
     async def mock_save(order):
         return order
@@ -424,7 +479,7 @@ async def test_create_order_handles_inventory_reservation_failure_gracefully(
     mock_dependencies["order_repository"].save.side_effect = mock_save
 
     # Make inventory reservation fail
-    mock_dependencies["inventory_port"].reserve_inventory.side_effect = Exception(
+    mock_dependencies["inventory_port"].reserve_inventories.side_effect = Exception(
         "Inventory reservation failed"
     )
 
@@ -452,7 +507,7 @@ async def test_create_order_with_seller_data(
 ):
     """Test creating order with seller data (seller app scenario)."""
     mock_dependencies["customer_port"].get_customer.return_value = sample_customer
-    mock_dependencies["inventory_port"].get_inventory.return_value = sample_inventory_info
+    mock_dependencies["inventory_port"].get_inventories.return_value = {sample_inventory_info.id: sample_inventory_info}
 
     async def mock_save(order):
         return order
@@ -487,7 +542,7 @@ async def test_create_order_publishes_event_with_correct_data(
 ):
     """Test that published event contains correct order data."""
     mock_dependencies["customer_port"].get_customer.return_value = sample_customer
-    mock_dependencies["inventory_port"].get_inventory.return_value = sample_inventory_info
+    mock_dependencies["inventory_port"].get_inventories.return_value = {sample_inventory_info.id: sample_inventory_info}
 
     async def mock_save(order):
         return order
@@ -506,9 +561,11 @@ async def test_create_order_publishes_event_with_correct_data(
 
     order = await use_case.execute(input_data)
 
-    # Verify event was published with correct data
-    mock_dependencies["event_publisher"].publish_order_created.assert_called_once()
-    event_data = mock_dependencies["event_publisher"].publish_order_created.call_args[0][0]
+    # Verify event was stored in the outbox with correct data
+    mock_dependencies["outbox_repository"].add.assert_called_once()
+    outbox_event = mock_dependencies["outbox_repository"].add.call_args[0][0]
+    assert outbox_event.event_type == "order_created"
+    event_data = outbox_event.payload
 
     assert event_data["order_id"] == str(order.id)
     assert event_data["customer_id"] == str(sample_customer.id)
@@ -541,7 +598,7 @@ async def test_create_order_with_zero_quantity_inventory(
         expiration_date=date.today() + timedelta(days=30),
     )
 
-    mock_dependencies["inventory_port"].get_inventory.return_value = inventory_info
+    mock_dependencies["inventory_port"].get_inventories.return_value = {inventory_info.id: inventory_info}
 
     use_case = CreateOrderUseCase(**mock_dependencies)
 
@@ -554,3 +611,56 @@ async def test_create_order_with_zero_quantity_inventory(
 
     with pytest.raises(ValueError, match="Insufficient inventory"):
         await use_case.execute(input_data)
+
+
+@pytest.mark.asyncio
+async def test_create_order_uses_one_batch_call_for_lookup_and_reservation(
+    mock_dependencies, sample_customer
+):
+    """Test that inventory lookup and reservation do not scale with line count."""
+    mock_dependencies["customer_port"].get_customer.return_value = sample_customer
+
+    inventories = {}
+    for i in range(30):
+        info = InventoryInfo(
+            id=uuid4(),
+            warehouse_id=uuid4(),
+            available_quantity=100,
+            product_name=f"Product {i}",
+            product_sku=f"SKU-{i:03d}",
+            product_price=Decimal("10.00"),
+            product_category="medicamentos_basicos",
+            warehouse_name="Warehouse",
+            warehouse_city="City",
+            warehouse_country="Country",
+            batch_number=f"BATCH-{i:03d}",
+            expiration_date=date.today() + timedelta(days=30),
+        )
+        inventories[info.id] = info
+
+    mock_dependencies["inventory_port"].get_inventories.return_value = inventories
+
+    async def mock_save(order):
+        return order
+
+    mock_dependencies["order_repository"].save.side_effect = mock_save
+
+    use_case = CreateOrderUseCase(**mock_dependencies)
+
+    input_data = CreateOrderInput(
+        customer_id=sample_customer.id,
+        metodo_creacion=CreationMethod.APP_CLIENTE,
+        items=[OrderItemInput(inventario_id=i, cantidad=2) for i in inventories],
+    )
+
+    order = await use_case.execute(input_data)
+
+    assert order.item_count == 30
+    mock_dependencies["inventory_port"].get_inventories.assert_called_once_with(
+        list(inventories)
+    )
+    mock_dependencies["inventory_port"].reserve_inventories.assert_called_once_with(
+        [(i, 2) for i in inventories]
+    )
+    mock_dependencies["inventory_port"].get_inventory.assert_not_called()
+    mock_dependencies["inventory_port"].reserve_inventory.assert_not_called()
@@ -422,3 +422,159 @@ async def test_generate_report_handles_report_deleted_during_failure(mock_depend
 
     # Verify publish_report_failed was NOT called (because report was None)
     mock_dependencies["sqs_publisher"].publish_report_failed.assert_not_called()
+
+
+def _follower(source_id, status=ReportStatus.PENDING):
+    return Report(
+        id=uuid4(),
+        user_id=uuid4(),
+        report_type=ReportType.ORDERS_PER_SELLER,
+        status=status,
+        start_date=datetime(2025, 1, 1),
+        end_date=datetime(2025, 1, 31),
+        created_at=datetime.now(),
+        s3_bucket="bucket" if status == ReportStatus.COMPLETED else None,
+        s3_key="shared.json" if status == ReportStatus.COMPLETED else None,
+        source_report_id=source_id,
+    )
+
+
+@pytest.mark.asyncio
+async def test_generate_report_resolves_followers_after_completion(
+    mock_dependencies, sample_report
+):
+    """Test that reports waiting on this one complete with its artifact."""
+    follower = _follower(sample_report.id)
+    repo = mock_dependencies["report_repository"]
+    repo.find_by_id.return_value = sample_report
+    repo.resolve_followers.return_value = [follower]
+    mock_dependencies["s3_service"].upload_report.return_value = "path/to/report.json"
+    mock_dependencies["s3_service"].bucket_name = "bucket"
+
+    use_case = GenerateReportUseCase(**mock_dependencies)
+
+    with patch(
+        "src.application.use_cases.generate_report.OrdersPerSellerReportGenerator"
+    ) as MockGenerator:
+        MockGenerator.return_value.generate = AsyncMock(return_value={"data": []})
+        await use_case.execute(sample_report.id)
+
+    repo.resolve_followers.assert_called_once_with(
+        sample_report.id,
+        ReportStatus.COMPLETED,
+        s3_bucket="bucket",
+        s3_key="path/to/report.json",
+    )
+    published = mock_dependencies["sqs_publisher"].publish_report_generated.call_args_list
+    assert [call.kwargs["report_id"] for call in published] == [sample_report.id, follower.id]
+    assert published[1].kwargs["user_id"] == follower.user_id
+    assert published[1].kwargs["s3_key"] == "path/to/report.json"
+
+
+@pytest.mark.asyncio
+async def test_generate_report_fails_followers_on_error(mock_dependencies, sample_report):
+    """Test that reports waiting on a failed report fail with the same error."""
+    follower = _follower(sample_report.id)
+    failed = Report(
+        **{**sample_report.__dict__, "status": ReportStatus.FAILED, "error_message": "boom"}
+    )
+    repo = mock_dependencies["report_repository"]
+    repo.find_by_id.side_effect = [sample_report, failed]
+    repo.resolve_followers.return_value = [follower]
+
+    use_case = GenerateReportUseCase(**mock_dependencies)
+
+    with patch(
+        "src.application.use_cases.generate_report.OrdersPerSellerReportGenerator"
+    ) as MockGenerator:
+        MockGenerator.return_value.generate = AsyncMock(side_effect=Exception("boom"))
+        await use_case.execute(sample_report.id)
+
+    repo.resolve_followers.assert_called_once_with(
+        sample_report.id, ReportStatus.FAILED, error_message="boom"
+    )
+    published = mock_dependencies["sqs_publisher"].publish_report_failed.call_args_list
+    assert [call.kwargs["report_id"] for call in published] == [sample_report.id, follower.id]
+
+
+@pytest.mark.asyncio
+async def test_generate_report_reused_artifact_only_notifies(mock_dependencies):
+    """Test that a report created from a completed one is not generated again."""
+    report = _follower(uuid4(), status=ReportStatus.COMPLETED)
+    mock_dependencies["report_repository"].find_by_id.return_value = report
+
+    use_case = GenerateReportUseCase(**mock_dependencies)
+    await use_case.execute(report.id)
+
+    mock_dependencies["report_repository"].update_status.assert_not_called()
+    mock_dependencies["s3_service"].upload_report.assert_not_called()
+    mock_dependencies["sqs_publisher"].publish_report_generated.assert_called_once()
+    assert (
+        mock_dependencies["sqs_publisher"].publish_report_generated.call_args.kwargs["s3_key"]
+        == "shared.json"
+    )
+
+
+@pytest.mark.asyncio
+async def test_generate_report_follower_waits_on_running_source(
+    mock_dependencies, sample_report
+):
+    """Test that a follower of a running report leaves resolution to the source job."""
+    follower = _follower(sample_report.id)
+    sample_report.status = ReportStatus.PROCESSING
+    repo = mock_dependencies["report_repository"]
+    repo.find_by_id.side_effect = [follower, sample_report]
+
+    use_case = GenerateReportUseCase(**mock_dependencies)
+    await use_case.execute(follower.id)
+
+    mock_dependencies["db_session"].commit.assert_called_once()
+    repo.update_status.assert_not_called()
+    repo.resolve_followers.assert_not_called()
+    mock_dependencies["s3_service"].upload_report.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_generate_report_follower_resolution_error_keeps_report_completed(
+    mock_dependencies, sample_report
+):
+    """Test that failing to resolve followers does not fail the finished report."""
+    repo = mock_dependencies["report_repository"]
+    repo.find_by_id.return_value = sample_report
+    repo.resolve_followers.side_effect = Exception("db down")
+    mock_dependencies["s3_service"].upload_report.return_value = "path/to/report.json"
+
+    use_case = GenerateReportUseCase(**mock_dependencies)
+
+    with patch(
+        "src.application.use_cases.generate_report.OrdersPerSellerReportGenerator"
+    ) as MockGenerator:
+        MockGenerator.return_value.generate = AsyncMock(return_value={"data": []})
+        await use_case.execute(sample_report.id)
+
+    statuses = [call.kwargs["status"] for call in repo.update_status.call_args_list]
+    assert statuses == [ReportStatus.PROCESSING, ReportStatus.COMPLETED]
+    mock_dependencies["sqs_publisher"].publish_report_failed.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_generate_report_follower_of_finished_source_resolves_itself(
+    mock_dependencies, sample_report
+):
+    """Test that a follower whose source already finished is resolved right away."""
+    follower = _follower(sample_report.id)
+    sample_report.status = ReportStatus.COMPLETED
+    sample_report.s3_bucket = "bucket"
+    sample_report.s3_key = "done.json"
+    repo = mock_dependencies["report_repository"]
+    repo.find_by_id.side_effect = [follower, sample_report]
+    repo.resolve_followers.return_value = [follower]
+
+    use_case = GenerateReportUseCase(**mock_dependencies)
+    await use_case.execute(follower.id)
+
+    repo.resolve_followers.assert_called_once_with(
+        sample_report.id, ReportStatus.COMPLETED, s3_bucket="bucket", s3_key="done.json"
+    )
+    mock_dependencies["sqs_publisher"].publish_report_generated.assert_called_once()
+    mock_dependencies["s3_service"].upload_report.assert_not_called()
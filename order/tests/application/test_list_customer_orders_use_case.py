@@ -27,13 +27,13 @@ async def test_list_customer_orders_empty(mock_repository):
 
     # Execute use case
     use_case = ListCustomerOrdersUseCase(order_repository=mock_repository)
-    orders, total = await use_case.execute(customer_id=customer_id, limit=10, offset=0)
+    orders, total, next_cursor = await use_case.execute(customer_id=customer_id, limit=10, offset=0)
 
     # Assertions
     assert orders == []
     assert total == 0
     mock_repository.find_by_customer.assert_called_once_with(
-        customer_id=customer_id, limit=10, offset=0
+        customer_id=customer_id, limit=10, offset=0, after=None, include_total=True
     )
 
 
@@ -74,7 +74,7 @@ async def test_list_customer_orders_with_data(mock_repository):
 
     # Execute use case
     use_case = ListCustomerOrdersUseCase(order_repository=mock_repository)
-    orders, total = await use_case.execute(customer_id=customer_id, limit=10, offset=0)
+    orders, total, next_cursor = await use_case.execute(customer_id=customer_id, limit=10, offset=0)
 
     # Assertions
     assert len(orders) == 2
@@ -83,7 +83,7 @@ async def test_list_customer_orders_with_data(mock_repository):
     assert orders[0].monto_total == Decimal("100.00")
     assert orders[1].monto_total == Decimal("200.00")
     mock_repository.find_by_customer.assert_called_once_with(
-        customer_id=customer_id, limit=10, offset=0
+        customer_id=customer_id, limit=10, offset=0, after=None, include_total=True
     )
 
 
@@ -111,14 +111,14 @@ async def test_list_customer_orders_with_pagination(mock_repository):
 
     # Execute use case with custom limit and offset
     use_case = ListCustomerOrdersUseCase(order_repository=mock_repository)
-    orders, total = await use_case.execute(customer_id=customer_id, limit=1, offset=2)
+    orders, total, next_cursor = await use_case.execute(customer_id=customer_id, limit=1, offset=2)
 
     # Assertions
     assert len(orders) == 1
     assert total == 5
     assert orders[0].customer_id == customer_id
     mock_repository.find_by_customer.assert_called_once_with(
-        customer_id=customer_id, limit=1, offset=2
+        customer_id=customer_id, limit=1, offset=2, after=None, include_total=True
     )
 
 
@@ -132,13 +132,13 @@ async def test_list_customer_orders_default_pagination(mock_repository):
 
     # Execute use case with defaults
     use_case = ListCustomerOrdersUseCase(order_repository=mock_repository)
-    orders, total = await use_case.execute(customer_id=customer_id)
+    orders, total, next_cursor = await use_case.execute(customer_id=customer_id)
 
     # Assertions - should use defaults (limit=10, offset=0)
     assert orders == []
     assert total == 0
     mock_repository.find_by_customer.assert_called_once_with(
-        customer_id=customer_id, limit=10, offset=0
+        customer_id=customer_id, limit=10, offset=0, after=None, include_total=True
     )
 
 
@@ -167,12 +167,97 @@ async def test_list_customer_orders_filters_correctly(mock_repository):
 
     # Execute use case
     use_case = ListCustomerOrdersUseCase(order_repository=mock_repository)
-    orders, total = await use_case.execute(customer_id=customer_id)
+    orders, total, next_cursor = await use_case.execute(customer_id=customer_id)
 
     # Assertions - should not include orders from other customers
     assert len(orders) == 1
     assert orders[0].customer_id == customer_id
     assert orders[0].customer_id != other_customer_id
     mock_repository.find_by_customer.assert_called_once_with(
-        customer_id=customer_id, limit=10, offset=0
+        customer_id=customer_id, limit=10, offset=0, after=None, include_total=True
     )
+
+
+@pytest.mark.asyncio
+async def test_list_customer_orders_cursor_walks_all_orders_once(db_session):
+    """Test cursor pagination over SQLite returns every order once, ties included."""
+    from src.adapters.output.repositories.order_repository import OrderRepository
+
+    repository = OrderRepository(db_session)
+    customer_id = uuid4()
+
+    # Two pairs share a fecha_pedido so the id tie-breaker is exercised
+    for minute in [0, 1, 1, 2, 3, 3, 4]:
+        await repository.save(
+            Order(
+                id=uuid4(),
+                customer_id=customer_id,
+                fecha_pedido=datetime(2025, 2, 1, 10, minute),
+                fecha_entrega_estimada=date(2025, 2, 3),
+                metodo_creacion=CreationMethod.APP_CLIENTE,
+                direccion_entrega="123 Test St",
+                ciudad_entrega="Test City",
+                pais_entrega="Test Country",
+                customer_name="Test Customer",
+            )
+        )
+
+    use_case = ListCustomerOrdersUseCase(order_repository=repository)
+    everything, total, last_cursor = await use_case.execute(customer_id=customer_id, limit=100)
+
+    seen = []
+    cursor = None
+    pages = 0
+    while True:
+        orders, page_total, cursor = await use_case.execute(
+            customer_id=customer_id, limit=3, cursor=cursor
+        )
+        pages += 1
+        seen.extend(order.id for order in orders)
+        # Only the first page pays for the count
+        assert page_total == (7 if pages == 1 else None)
+        if cursor is None:
+            break
+
+    assert total == 7
+    assert last_cursor is None
+    assert seen == [order.id for order in everything]
+    assert len(set(seen)) == 7
+    assert [o.fecha_pedido for o in everything] == sorted(
+        (o.fecha_pedido for o in everything), reverse=True
+    )
+
+
+@pytest.mark.asyncio
+async def test_find_by_customer_cursor_ignores_offset(db_session):
+    """Test that an offset given with a cursor does not skip orders past it."""
+    from src.adapters.output.repositories.order_repository import OrderRepository
+    from src.domain.value_objects import OrderCursor
+
+    repository = OrderRepository(db_session)
+    customer_id = uuid4()
+
+    for minute in range(6):
+        await repository.save(
+            Order(
+                id=uuid4(),
+                customer_id=customer_id,
+                fecha_pedido=datetime(2025, 2, 1, 10, minute),
+                fecha_entrega_estimada=date(2025, 2, 3),
+                metodo_creacion=CreationMethod.APP_CLIENTE,
+                direccion_entrega="123 Test St",
+                ciudad_entrega="Test City",
+                pais_entrega="Test Country",
+                customer_name="Test Customer",
+            )
+        )
+
+    first, _ = await repository.find_by_customer(customer_id, limit=2)
+    after = OrderCursor(fecha_pedido=first[-1].fecha_pedido, id=first[-1].id)
+    plain, _ = await repository.find_by_customer(customer_id, limit=2, after=after)
+    with_offset, _ = await repository.find_by_customer(
+        customer_id, limit=2, offset=2, after=after
+    )
+
+    assert [o.fecha_pedido.minute for o in with_offset] == [3, 2]
+    assert [o.id for o in with_offset] == [o.id for o in plain]
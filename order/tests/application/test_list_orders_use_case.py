@@ -25,12 +25,14 @@ async def test_list_orders_empty(mock_repository):
 
     # Execute use case
     use_case = ListOrdersUseCase(order_repository=mock_repository)
-    orders, total = await use_case.execute(limit=10, offset=0)
+    orders, total, next_cursor = await use_case.execute(limit=10, offset=0)
 
     # Assertions
     assert orders == []
     assert total == 0
-    mock_repository.find_all.assert_called_once_with(limit=10, offset=0)
+    mock_repository.find_all.assert_called_once_with(
+        limit=10, offset=0, after=None, include_total=True
+    )
 
 
 @pytest.mark.asyncio
@@ -70,14 +72,16 @@ async def test_list_orders_with_data(mock_repository):
 
     # Execute use case
     use_case = ListOrdersUseCase(order_repository=mock_repository)
-    orders, total = await use_case.execute(limit=10, offset=0)
+    orders, total, next_cursor = await use_case.execute(limit=10, offset=0)
 
     # Assertions
     assert len(orders) == 2
     assert total == 2
     assert orders[0].customer_name == "Customer 1"
     assert orders[1].customer_name == "Customer 2"
-    mock_repository.find_all.assert_called_once_with(limit=10, offset=0)
+    mock_repository.find_all.assert_called_once_with(
+        limit=10, offset=0, after=None, include_total=True
+    )
 
 
 @pytest.mark.asyncio
@@ -102,12 +106,14 @@ async def test_list_orders_with_pagination(mock_repository):
 
     # Execute use case with custom limit and offset
     use_case = ListOrdersUseCase(order_repository=mock_repository)
-    orders, total = await use_case.execute(limit=1, offset=2)
+    orders, total, next_cursor = await use_case.execute(limit=1, offset=2)
 
     # Assertions
     assert len(orders) == 1
     assert total == 5
-    mock_repository.find_all.assert_called_once_with(limit=1, offset=2)
+    mock_repository.find_all.assert_called_once_with(
+        limit=1, offset=2, after=None, include_total=True
+    )
 
 
 @pytest.mark.asyncio
@@ -118,9 +124,59 @@ async def test_list_orders_default_pagination(mock_repository):
 
     # Execute use case with defaults
     use_case = ListOrdersUseCase(order_repository=mock_repository)
-    orders, total = await use_case.execute()
+    orders, total, next_cursor = await use_case.execute()
 
     # Assertions - should use defaults (limit=10, offset=0)
     assert orders == []
     assert total == 0
-    mock_repository.find_all.assert_called_once_with(limit=10, offset=0)
+    mock_repository.find_all.assert_called_once_with(
+        limit=10, offset=0, after=None, include_total=True
+    )
+
+
+@pytest.mark.asyncio
+async def test_list_orders_with_cursor(mock_repository):
+    """Test a cursor page seeks by keyset, skips the count and returns the next cursor."""
+    from src.domain.value_objects import OrderCursor
+
+    orders = [
+        Order(
+            id=uuid4(),
+            customer_id=uuid4(),
+            fecha_pedido=datetime(2025, 2, 1, 10, minute),
+            fecha_entrega_estimada=date(2025, 2, 3),
+            metodo_creacion=CreationMethod.APP_CLIENTE,
+            direccion_entrega="123 Test St",
+            ciudad_entrega="Test City",
+            pais_entrega="Test Country",
+            customer_name=f"Customer {minute}",
+        )
+        for minute in (5, 4)
+    ]
+    mock_repository.find_all.return_value = (orders, None)
+    cursor = OrderCursor(fecha_pedido=datetime(2025, 2, 1, 10, 6), id=uuid4())
+
+    use_case = ListOrdersUseCase(order_repository=mock_repository)
+    result, total, next_cursor = await use_case.execute(limit=2, cursor=cursor.encode())
+
+    assert result == orders
+    assert total is None
+    assert OrderCursor.decode(next_cursor) == OrderCursor(
+        fecha_pedido=orders[-1].fecha_pedido, id=orders[-1].id
+    )
+    mock_repository.find_all.assert_called_once_with(
+        limit=2, offset=0, after=cursor, include_total=False
+    )
+
+
+@pytest.mark.asyncio
+async def test_list_orders_invalid_cursor(mock_repository):
+    """Test a malformed cursor is rejected before querying."""
+    from src.domain.exceptions import InvalidOrderCursorException
+
+    use_case = ListOrdersUseCase(order_repository=mock_repository)
+
+    with pytest.raises(InvalidOrderCursorException):
+        await use_case.execute(cursor="not-a-cursor")
+
+    mock_repository.find_all.assert_not_called()
@@ -155,3 +155,117 @@ async def test_create_report_orders_per_status_type(db_session: AsyncSession):
 
     assert report.report_type == ReportType.ORDERS_PER_STATUS
     assert report.status == ReportStatus.PENDING
+
+
+@pytest.mark.asyncio
+async def test_create_report_dedup_joins_then_reuses(db_session: AsyncSession):
+    """Test that identical requests join an in-flight report, then reuse its artifact."""
+    from datetime import timedelta
+
+    from src.domain.services.report_dedup import ReportDedupMetrics
+
+    repository = ReportRepository(db_session)
+    metrics = ReportDedupMetrics()
+    use_case = CreateReportUseCase(
+        repository, freshness_window=timedelta(minutes=5), metrics=metrics
+    )
+
+    seller_id = str(uuid.uuid4())
+
+    def request(user_id):
+        return CreateReportInput(
+            user_id=user_id,
+            report_type=ReportType.ORDERS_PER_SELLER,
+            start_date=datetime(2025, 1, 1, tzinfo=timezone.utc),
+            end_date=datetime(2025, 1, 31, tzinfo=timezone.utc),
+            filters={"seller_id": seller_id},
+        )
+
+    leader = await use_case.execute(request(uuid.uuid4()))
+    joined = await use_case.execute(request(uuid.uuid4()))
+
+    assert leader.source_report_id is None
+    assert leader.fingerprint == joined.fingerprint
+    assert joined.source_report_id == leader.id
+    assert joined.status == ReportStatus.PENDING
+
+    await repository.update_status(
+        leader.id, ReportStatus.COMPLETED, s3_bucket="bucket", s3_key="key.json"
+    )
+    reused = await use_case.execute(request(uuid.uuid4()))
+
+    assert reused.source_report_id == leader.id
+    assert reused.status == ReportStatus.COMPLETED
+    assert (reused.s3_bucket, reused.s3_key) == ("bucket", "key.json")
+    assert metrics.snapshot()["hit_rate"] == round(2 / 3, 4)
+
+
+@pytest.mark.asyncio
+async def test_create_report_dedup_misses_on_new_orders(db_session: AsyncSession):
+    """Test that an order placed inside the range starts a new report."""
+    from datetime import timedelta
+    from decimal import Decimal
+
+    from src.adapters.output.repositories.order_repository import OrderRepository
+    from src.domain.entities import Order
+    from src.domain.value_objects import CreationMethod
+
+    repository = ReportRepository(db_session)
+    use_case = CreateReportUseCase(repository, freshness_window=timedelta(minutes=5))
+    input_data = CreateReportInput(
+        user_id=uuid.uuid4(),
+        report_type=ReportType.ORDERS_PER_STATUS,
+        start_date=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        end_date=datetime(2025, 1, 31, tzinfo=timezone.utc),
+        filters={"marker": str(uuid.uuid4())},
+    )
+
+    first = await use_case.execute(input_data)
+    await OrderRepository(db_session).save(
+        Order(
+            id=uuid.uuid4(),
+            customer_id=uuid.uuid4(),
+            fecha_pedido=datetime(2025, 1, 15, 12, 0),
+            metodo_creacion=CreationMethod.APP_CLIENTE,
+            direccion_entrega="123 Test St",
+            ciudad_entrega="Test City",
+            pais_entrega="Test Country",
+            customer_name="Test Customer",
+            monto_total=Decimal("10.00"),
+        )
+    )
+    second = await use_case.execute(input_data)
+
+    assert second.fingerprint != first.fingerprint
+    assert second.source_report_id is None
+
+
+@pytest.mark.asyncio
+async def test_create_report_dedup_replaces_stale_source(db_session: AsyncSession):
+    """Test that a match unfinished past stale_after is replaced, not joined."""
+    from datetime import timedelta
+
+    repository = ReportRepository(db_session)
+    window = timedelta(minutes=5)
+    input_data = CreateReportInput(
+        user_id=uuid.uuid4(),
+        report_type=ReportType.ORDERS_PER_STATUS,
+        start_date=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        end_date=datetime(2025, 1, 31, tzinfo=timezone.utc),
+        filters={"marker": str(uuid.uuid4())},
+    )
+    use_case = CreateReportUseCase(repository, freshness_window=window)
+    stale = await use_case.execute(input_data)
+    joined = await use_case.execute(input_data)
+
+    replacing = CreateReportUseCase(
+        repository, freshness_window=window, stale_after=timedelta(0)
+    )
+    replacement = await replacing.execute(input_data)
+
+    assert replacement.source_report_id is None
+    assert replacement.status == ReportStatus.PENDING
+    resolved = await repository.resolve_followers(
+        replacement.id, ReportStatus.COMPLETED, s3_bucket="bucket", s3_key="key.json"
+    )
+    assert {r.id for r in resolved} == {stale.id, joined.id}
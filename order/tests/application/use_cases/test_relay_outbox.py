@@ -0,0 +1,102 @@
+"""Tests for RelayOutboxUseCase."""
+
+from datetime import timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.application.use_cases.relay_outbox import RelayOutboxUseCase
+from src.domain.entities import OutboxEvent
+
+
+@pytest.fixture
+def outbox_repository():
+    return AsyncMock()
+
+
+@pytest.fixture
+def publisher():
+    return AsyncMock()
+
+
+@pytest.fixture
+def session():
+    return AsyncMock()
+
+
+@pytest.fixture
+def use_case(outbox_repository, publisher, session):
+    return RelayOutboxUseCase(
+        outbox_repository=outbox_repository,
+        publisher=publisher,
+        session=session,
+        batch_size=50,
+        lease=timedelta(seconds=30),
+        retry_base_delay=timedelta(seconds=2),
+        retry_max_delay=timedelta(seconds=60),
+    )
+
+
+def _events(count):
+    return [OutboxEvent.create("order_created", {"n": i}) for i in range(count)]
+
+
+@pytest.mark.asyncio
+async def test_empty_outbox(use_case, outbox_repository, publisher, session):
+    """Test that nothing is published when no events are due."""
+    outbox_repository.claim_due.return_value = []
+
+    result = await use_case.execute()
+
+    assert result.claimed == 0
+    outbox_repository.claim_due.assert_awaited_once_with(50, timedelta(seconds=30))
+    publisher.publish_batch.assert_not_called()
+    session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_publishes_claimed_batch(use_case, outbox_repository, publisher, session):
+    """Test that the whole batch goes to the publisher in one call."""
+    events = _events(3)
+    outbox_repository.claim_due.return_value = events
+    publisher.publish_batch.return_value = []
+
+    result = await use_case.execute()
+
+    assert (result.claimed, result.published, result.failed) == (3, 3, 0)
+    publisher.publish_batch.assert_awaited_once_with(events)
+    outbox_repository.mark_published.assert_awaited_once_with(events)
+    outbox_repository.save_retries.assert_awaited_once_with([])
+    assert all(e.is_published for e in events)
+    assert session.commit.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_rejected_events_are_rescheduled(use_case, outbox_repository, publisher):
+    """Test that events the broker rejected back off and stay pending."""
+    events = _events(3)
+    outbox_repository.claim_due.return_value = events
+    publisher.publish_batch.return_value = [events[1].id]
+
+    result = await use_case.execute()
+
+    assert (result.published, result.failed) == (2, 1)
+    outbox_repository.mark_published.assert_awaited_once_with([events[0], events[2]])
+    outbox_repository.save_retries.assert_awaited_once_with([events[1]])
+    assert events[1].attempts == 1
+    assert not events[1].is_published
+    assert events[1].next_attempt_at is not None
+
+
+@pytest.mark.asyncio
+async def test_publisher_error_retries_whole_batch(use_case, outbox_repository, publisher):
+    """Test that a publisher exception schedules every claimed event for retry."""
+    events = _events(2)
+    outbox_repository.claim_due.return_value = events
+    publisher.publish_batch.side_effect = Exception("SNS unavailable")
+
+    result = await use_case.execute()
+
+    assert (result.published, result.failed) == (0, 2)
+    outbox_repository.save_retries.assert_awaited_once_with(events)
+    assert all(e.last_error == "SNS unavailable" for e in events)
@@ -40,6 +40,7 @@ async def clear_tables(test_engine):
     async with test_engine.begin() as conn:
         await conn.execute(text("DELETE FROM order_items"))
         await conn.execute(text("DELETE FROM orders"))
+        await conn.execute(text("DELETE FROM order_daily_seller_stats"))
 
 
 @pytest_asyncio.fixture
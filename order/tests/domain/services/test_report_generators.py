@@ -240,3 +240,62 @@ async def test_orders_per_seller_zero_division_handling(db_session: AsyncSession
 
     # Verify average_order_value is 0.0 (not division by zero error)
     assert report_data["data"][0]["average_order_value"] == 0.0
+
+
+@pytest.mark.asyncio
+async def test_orders_per_seller_rollup_matches_raw_orders(db_session: AsyncSession):
+    """Test that rollup plus partial edge days equals aggregating raw orders."""
+    from src.adapters.output.repositories.order_repository import OrderRepository
+    from src.domain.entities import Order as OrderEntity
+    from src.domain.value_objects import CreationMethod
+
+    repository = OrderRepository(db_session)
+    sellers = [(uuid.uuid4(), f"Seller {n}") for n in range(3)]
+    saved = []
+    for day in range(1, 11):
+        for hour in (1, 11, 23):
+            seller_id, seller_name = sellers[(day + hour) % 3]
+            order = OrderEntity(
+                id=uuid.uuid4(),
+                customer_id=uuid.uuid4(),
+                fecha_pedido=datetime(2025, 4, day, hour, 30),
+                metodo_creacion=CreationMethod.APP_VENDEDOR,
+                direccion_entrega="123 Test St",
+                ciudad_entrega="Test City",
+                pais_entrega="Test Country",
+                customer_name="Test Customer",
+                seller_id=seller_id,
+                seller_name=seller_name,
+                seller_email=f"{seller_id}@example.com",
+                monto_total=Decimal(f"{day}{hour}.10"),
+            )
+            saved.append(await repository.save(order))
+
+    # Partial first and last days, whole days in between
+    start_date = datetime(2025, 4, 2, 10, 0, tzinfo=timezone.utc)
+    end_date = datetime(2025, 4, 9, 12, 0, tzinfo=timezone.utc)
+    report = await OrdersPerSellerReportGenerator(db_session).generate(start_date, end_date)
+
+    expected = {}
+    for order in saved:
+        if start_date <= order.fecha_pedido.replace(tzinfo=timezone.utc) <= end_date:
+            orders, revenue = expected.get(str(order.seller_id), (0, Decimal("0")))
+            expected[str(order.seller_id)] = (orders + 1, revenue + order.monto_total)
+
+    assert {
+        row["seller_id"]: (row["total_orders"], Decimal(str(row["total_revenue"])))
+        for row in report["data"]
+    } == expected
+    assert [row["total_revenue"] for row in report["data"]] == sorted(
+        (row["total_revenue"] for row in report["data"]), reverse=True
+    )
+    assert report["summary"]["total_orders"] == sum(n for n, _ in expected.values())
+    names = {str(seller_id): name for seller_id, name in sellers}
+    assert all(row["seller_name"] == names[row["seller_id"]] for row in report["data"])
+
+    # Within a single day only the raw orders are read
+    same_day = await OrdersPerSellerReportGenerator(db_session).generate(
+        datetime(2025, 4, 5, 0, 0, tzinfo=timezone.utc),
+        datetime(2025, 4, 5, 12, 0, tzinfo=timezone.utc),
+    )
+    assert same_day["summary"]["total_orders"] == 2
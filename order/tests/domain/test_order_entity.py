@@ -361,3 +361,26 @@ class TestOrderEntityItems:
                 pais_entrega="",  # Empty
                 customer_name="John Doe",
             )
+
+
+def test_order_cursor_round_trip():
+    """Test that an encoded order cursor decodes to the same key."""
+    from src.domain.value_objects import OrderCursor
+
+    cursor = OrderCursor(
+        fecha_pedido=datetime(2025, 2, 1, 10, 30, 15),
+        id=uuid4(),
+    )
+
+    assert OrderCursor.decode(cursor.encode()) == cursor
+
+
+def test_order_cursor_invalid_token():
+    """Test that a malformed order cursor raises a validation error."""
+    from src.domain.exceptions import InvalidOrderCursorException
+    from src.domain.value_objects import OrderCursor
+
+    with pytest.raises(InvalidOrderCursorException) as exc_info:
+        OrderCursor.decode("bm90LWEtY3Vyc29y")
+
+    assert exc_info.value.error_code == "INVALID_ORDER_CURSOR"
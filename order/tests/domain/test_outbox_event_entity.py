@@ -0,0 +1,79 @@
+"""Unit tests for OutboxEvent entity."""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from src.domain.entities import OutboxEvent
+
+
+def test_create_is_due_immediately():
+    """Test that a new event is unpublished and due right away."""
+    event = OutboxEvent.create("order_created", {"order_id": "abc"})
+
+    assert isinstance(event.id, uuid.UUID)
+    assert event.attempts == 0
+    assert event.next_attempt_at == event.created_at
+    assert not event.is_published
+
+
+def test_to_message_uses_outbox_id_as_event_id():
+    """Test that the message carries stable metadata and the payload."""
+    event = OutboxEvent(
+        id=uuid.uuid4(),
+        event_type="order_created",
+        payload={"order_id": "abc"},
+        created_at=datetime(2025, 11, 24, 10, 30, tzinfo=timezone.utc),
+    )
+
+    message = event.to_message()
+
+    assert message == {
+        "event_type": "order_created",
+        "microservice": "order",
+        "timestamp": "2025-11-24T10:30:00Z",
+        "event_id": str(event.id),
+        "order_id": "abc",
+    }
+    assert event.to_message()["event_id"] == message["event_id"]
+
+
+def test_schedule_retry_backs_off_exponentially_up_to_max():
+    """Test retry delays double per attempt and are capped."""
+    event = OutboxEvent.create("order_created", {})
+    now = datetime(2025, 11, 24, tzinfo=timezone.utc)
+    base, cap = timedelta(seconds=1), timedelta(seconds=5)
+
+    delays = []
+    for _ in range(5):
+        event.schedule_retry("boom", base, cap, now)
+        delays.append((event.next_attempt_at - now).total_seconds())
+
+    assert delays == [1, 2, 4, 5, 5]
+    assert event.attempts == 5
+    assert event.last_error == "boom"
+
+
+def test_schedule_retry_does_not_overflow_after_many_attempts():
+    """Test that a long outage keeps backing off at the cap instead of overflowing."""
+    event = OutboxEvent.create("order_created", {})
+    event.attempts = 1000
+    now = datetime(2025, 11, 24, tzinfo=timezone.utc)
+
+    event.schedule_retry("boom", timedelta(seconds=1), timedelta(minutes=5), now)
+
+    assert event.attempts == 1001
+    assert event.next_attempt_at == now + timedelta(minutes=5)
+
+
+def test_mark_published_clears_retry_state():
+    """Test that publishing clears the retry schedule and last error."""
+    event = OutboxEvent.create("order_created", {})
+    now = datetime.now(timezone.utc)
+    event.schedule_retry("boom", timedelta(seconds=1), timedelta(seconds=5), now)
+
+    event.mark_published(now)
+
+    assert event.is_published
+    assert event.published_at == now
+    assert event.next_attempt_at is None
+    assert event.last_error is None
@@ -139,3 +139,28 @@ def test_report_mark_failed():
     assert report.status == ReportStatus.FAILED
     assert report.error_message == error_message
     assert report.completed_at is not None
+
+
+
+def test_report_cursor_round_trip():
+    """Test that an encoded cursor decodes to the same key."""
+    from src.domain.value_objects import ReportCursor
+
+    cursor = ReportCursor(
+        created_at=datetime(2025, 2, 1, 10, 30, 15, 123456, tzinfo=timezone.utc),
+        id=uuid.uuid4(),
+    )
+
+    assert ReportCursor.decode(cursor.encode()) == cursor
+
+
+def test_report_cursor_invalid_token():
+    """Test that a malformed cursor raises a validation error."""
+    from src.domain.exceptions import InvalidReportCursorException, ValidationException
+    from src.domain.value_objects import ReportCursor
+
+    with pytest.raises(InvalidReportCursorException) as exc_info:
+        ReportCursor.decode("not-a-cursor")
+
+    assert isinstance(exc_info.value, ValidationException)
+    assert exc_info.value.error_code == "INVALID_REPORT_CURSOR"
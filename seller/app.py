@@ -4,7 +4,9 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
+from src.adapters.input.consumers.concurrent_sqs_consumer import ConcurrentSQSConsumer
 from src.adapters.input.consumers.event_handlers import EventHandlers
+from src.adapters.input.consumers.recent_event_filter import RecentEventFilter
 from src.adapters.input.consumers.sqs_consumer import SQSConsumer
 from src.adapters.input.controllers.common_controller import router as common_router
 from src.adapters.input.controllers.sales_plan_controller import (
@@ -37,19 +39,42 @@ async def lifespan(app: FastAPI):
     logger.info("Starting application lifespan...")
 
     # Initialize SQS consumer
-    consumer = SQSConsumer(
-        queue_url=settings.sqs_order_events_queue_url,
-        aws_region=settings.aws_region,
-        endpoint_url=settings.aws_endpoint_url,
-        max_messages=10,
-        wait_time_seconds=20,
-    )
+    if settings.sqs_consumer_mode == "concurrent":
+        consumer = ConcurrentSQSConsumer(
+            queue_url=settings.sqs_order_events_queue_url,
+            aws_region=settings.aws_region,
+            endpoint_url=settings.aws_endpoint_url,
+            max_messages=10,
+            wait_time_seconds=20,
+            max_workers=settings.sqs_max_workers,
+            event_concurrency=settings.sqs_event_concurrency,
+            ordering_keys=settings.sqs_ordering_keys,
+            visibility_timeout_seconds=settings.sqs_visibility_timeout_seconds,
+        )
+    else:
+        consumer = SQSConsumer(
+            queue_url=settings.sqs_order_events_queue_url,
+            aws_region=settings.aws_region,
+            endpoint_url=settings.aws_endpoint_url,
+            max_messages=10,
+            wait_time_seconds=20,
+        )
 
     # Initialize event handlers with DB session factory
-    handlers = EventHandlers(db_session_factory=async_session)
+    recent_events = None
+    if settings.recent_event_ids_size > 0:
+        recent_events = RecentEventFilter(
+            max_size=settings.recent_event_ids_size,
+            ttl_seconds=settings.recent_event_ids_ttl_seconds,
+        )
+    handlers = EventHandlers(db_session_factory=async_session, recent_events=recent_events)
 
     # Register event handlers
     consumer.register_handler("order_created", handlers.handle_order_created)
+    if settings.sales_plan_batch_updates:
+        consumer.register_batch_handler(
+            "order_created", handlers.handle_order_created_batch
+        )
 
     # Start consumer in background task
     consumer_task = asyncio.create_task(consumer.start())
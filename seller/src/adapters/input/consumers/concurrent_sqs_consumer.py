@@ -0,0 +1,470 @@
+"""
+SQS consumer mode that processes messages concurrently.
+
+``SQSConsumer`` awaits every handler in turn, so one slow sales-plan
+update stalls the whole queue. ``ConcurrentSQSConsumer`` keeps polling
+while handlers run, bounded by a worker pool and optional per-event-type
+limits. Messages that share an ordering key (e.g. ``seller_id``) are still
+handled one at a time in arrival order. Successful messages are
+acknowledged with ``DeleteMessageBatch`` and long-running handlers get
+their visibility timeout extended so SQS does not redeliver them.
+
+Event types with a batch handler are handled a received batch at a time.
+Batches of the same type run one after another so their multi-row updates
+never wait on each other's row locks.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from botocore.exceptions import ClientError
+
+from src.adapters.input.consumers.sqs_consumer import SQSConsumer
+
+logger = logging.getLogger(__name__)
+
+# SQS limit for DeleteMessageBatch / ReceiveMessage
+SQS_BATCH_LIMIT = 10
+
+
+@dataclass
+class ConsumerStats:
+    """Usage counters for a concurrent consumer."""
+
+    received_total: int = 0
+    succeeded_total: int = 0
+    failed_total: int = 0
+    acked_total: int = 0
+    ack_errors_total: int = 0
+    visibility_extensions_total: int = 0
+    in_flight: int = 0
+    peak_in_flight: int = 0
+    started_at: float = field(default_factory=time.monotonic)
+
+
+class ConcurrentSQSConsumer(SQSConsumer):
+    """SQS consumer with a bounded worker pool, per-key ordering and batched acks."""
+
+    def __init__(
+        self,
+        queue_url: str,
+        aws_region: str = "us-east-1",
+        max_messages: int = 10,
+        wait_time_seconds: int = 20,
+        endpoint_url: Optional[str] = None,
+        max_workers: int = 20,
+        event_concurrency: Optional[Dict[str, int]] = None,
+        ordering_keys: Optional[Dict[str, str]] = None,
+        visibility_timeout_seconds: Optional[float] = 30,
+        ack_flush_interval_seconds: float = 0.5,
+        shutdown_timeout_seconds: float = 30.0,
+    ):
+        """
+        Initialize concurrent SQS consumer.
+
+        Args:
+            queue_url: SQS queue URL
+            aws_region: AWS region
+            max_messages: Max messages to retrieve per poll (1-10)
+            wait_time_seconds: Long polling wait time (0-20)
+            endpoint_url: Optional endpoint URL for LocalStack/testing
+            max_workers: Maximum messages being handled at once
+            event_concurrency: Optional per-event-type limits, e.g.
+                ``{"order_created": 5}``
+            ordering_keys: Event field whose value serializes handling per
+                event type, e.g. ``{"order_created": "seller_id"}``
+            visibility_timeout_seconds: Visibility window kept alive for
+                in-flight messages (None disables extension)
+            ack_flush_interval_seconds: Max delay before a partial ack batch
+                is sent
+            shutdown_timeout_seconds: Time allowed for in-flight handlers
+                to finish on stop
+        """
+        super().__init__(
+            queue_url=queue_url,
+            aws_region=aws_region,
+            max_messages=max_messages,
+            wait_time_seconds=wait_time_seconds,
+            endpoint_url=endpoint_url,
+        )
+        self.max_workers = max_workers
+        self.event_concurrency = dict(event_concurrency or {})
+        self.ordering_keys = dict(ordering_keys or {})
+        self.visibility_timeout_seconds = visibility_timeout_seconds
+        self.ack_flush_interval_seconds = ack_flush_interval_seconds
+        self.shutdown_timeout_seconds = shutdown_timeout_seconds
+        self.stats = ConsumerStats()
+
+        self._slots = asyncio.Semaphore(max_workers)
+        self._event_limits: Dict[str, asyncio.Semaphore] = {
+            event_type: asyncio.Semaphore(limit)
+            for event_type, limit in self.event_concurrency.items()
+        }
+        # Ordering key -> [lock, number of tasks holding or waiting on it]
+        self._key_locks: Dict[str, List[Any]] = {}
+        self._batch_locks: Dict[str, asyncio.Lock] = {}
+        self._tasks: set = set()
+        self._ack_buffer: List[Tuple[str, str]] = []
+        self._ack_ready = asyncio.Event()
+
+    async def _poll_messages(self) -> None:
+        """
+        Poll SQS continuously, handing messages to workers as slots free up.
+
+        On stop, waits for in-flight handlers and flushes pending acks
+        before the client is closed.
+        """
+        client_kwargs = {"region_name": self.aws_region}
+        if self.endpoint_url:
+            client_kwargs["endpoint_url"] = self.endpoint_url
+            logger.info(f"Using SQS endpoint: {self.endpoint_url}")
+
+        async with self._session.client("sqs", **client_kwargs) as sqs:
+            acker = asyncio.create_task(self._ack_loop(sqs))
+            try:
+                await self._receive_loop(sqs)
+            finally:
+                await self._drain()
+                acker.cancel()
+                try:
+                    await acker
+                except asyncio.CancelledError:
+                    pass
+                await self._flush_acks(sqs)
+
+    async def _receive_loop(self, sqs) -> None:
+        while self._running:
+            # Only ask for as many messages as there are free workers
+            await self._slots.acquire()
+            free = 1
+            while free < self.max_messages and not self._slots.locked():
+                await self._slots.acquire()
+                free += 1
+
+            try:
+                response = await sqs.receive_message(
+                    QueueUrl=self.queue_url,
+                    MaxNumberOfMessages=min(free, self.max_messages, SQS_BATCH_LIMIT),
+                    WaitTimeSeconds=self.wait_time_seconds,
+                    MessageAttributeNames=["All"],
+                )
+            except Exception as e:
+                self._release_slots(free)
+                if isinstance(e, ClientError):
+                    logger.error(f"SQS client error: {e}", exc_info=True)
+                else:
+                    logger.error(f"Error polling SQS: {e}", exc_info=True)
+                await asyncio.sleep(5)
+                continue
+
+            messages = response.get("Messages", [])
+            self._release_slots(free - len(messages))
+            if messages:
+                logger.info(f"Received {len(messages)} messages from SQS")
+            single, batches = self._split_batches(messages)
+            for event_type, items in batches.items():
+                self._spawn_batch(sqs, event_type, items)
+            for message in single:
+                self._spawn(sqs, message)
+
+    def _release_slots(self, count: int) -> None:
+        for _ in range(count):
+            self._slots.release()
+
+    def _spawn(self, sqs, message: Dict[str, Any]) -> None:
+        self.stats.received_total += 1
+        self.stats.in_flight += 1
+        self.stats.peak_in_flight = max(self.stats.peak_in_flight, self.stats.in_flight)
+
+        task = asyncio.create_task(self._run_message(sqs, message))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _spawn_batch(
+        self,
+        sqs,
+        event_type: str,
+        items: List[Tuple[Dict[str, Any], Dict[str, Any]]],
+    ) -> None:
+        self.stats.received_total += len(items)
+        self.stats.in_flight += len(items)
+        self.stats.peak_in_flight = max(self.stats.peak_in_flight, self.stats.in_flight)
+
+        task = asyncio.create_task(self._run_batch(sqs, event_type, items))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(
+        self,
+        sqs,
+        event_type: str,
+        items: List[Tuple[Dict[str, Any], Dict[str, Any]]],
+    ) -> None:
+        """
+        Handle a group of messages with the event type's batch handler.
+
+        On failure each message is handed, with its worker slot, to a
+        regular single-message task.
+
+        Args:
+            sqs: SQS client
+            event_type: Event type of the batch
+            items: (message, body) pairs
+        """
+        handed_off = False
+        heartbeats = []
+        try:
+            if self.visibility_timeout_seconds:
+                heartbeats = [
+                    asyncio.create_task(self._keep_visible(sqs, message))
+                    for message, _ in items
+                ]
+            lock = self._batch_locks.setdefault(event_type, asyncio.Lock())
+            limit = self._event_limits.get(event_type)
+            try:
+                async with lock:
+                    logger.info(f"Processing batch of {len(items)} {event_type} events")
+                    if limit is not None:
+                        async with limit:
+                            await self._batch_handlers[event_type]([b for _, b in items])
+                    else:
+                        await self._batch_handlers[event_type]([b for _, b in items])
+            except Exception as e:
+                logger.warning(
+                    f"Batch handler failed for {len(items)} {event_type} events, "
+                    f"retrying one by one: {e}"
+                )
+                if event_type in self._handlers:
+                    handed_off = True
+                    for message, _ in items:
+                        task = asyncio.create_task(self._run_message(sqs, message))
+                        self._tasks.add(task)
+                        task.add_done_callback(self._tasks.discard)
+                else:
+                    self.stats.failed_total += len(items)
+                return
+
+            self.stats.succeeded_total += len(items)
+            for message, _ in items:
+                self._ack(message)
+        finally:
+            for heartbeat in heartbeats:
+                heartbeat.cancel()
+            if not handed_off:
+                self.stats.in_flight -= len(items)
+                self._release_slots(len(items))
+
+    async def _run_message(self, sqs, message: Dict[str, Any]) -> None:
+        """
+        Handle one message under its ordering-key and event-type limits.
+
+        Args:
+            sqs: SQS client
+            message: SQS message
+        """
+        heartbeat = None
+        try:
+            body = self._parse(message)
+            event_type = body.get("event_type") if body else None
+            ordering_key = self._ordering_key(event_type, body)
+
+            # Keep the message hidden while it queues behind its key or
+            # event-type limit too, not only while its handler runs
+            if self.visibility_timeout_seconds and event_type in self._handlers:
+                heartbeat = asyncio.create_task(self._keep_visible(sqs, message))
+
+            lock = self._acquire_key(ordering_key) if ordering_key else None
+            locked = False
+            try:
+                if lock is not None:
+                    await lock.acquire()
+                    locked = True
+                limit = self._event_limits.get(event_type)
+                if limit is not None:
+                    async with limit:
+                        ack = await self._handle(message, body)
+                else:
+                    ack = await self._handle(message, body)
+            finally:
+                if lock is not None:
+                    if locked:
+                        lock.release()
+                    self._release_key(ordering_key)
+
+            if ack:
+                self._ack(message)
+        finally:
+            if heartbeat is not None:
+                heartbeat.cancel()
+            self.stats.in_flight -= 1
+            self._slots.release()
+
+    def _parse(self, message: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        try:
+            body = json.loads(message.get("Body", "{}"))
+        except json.JSONDecodeError as e:
+            logger.error(f"Invalid JSON in message {message.get('MessageId')}: {e}")
+            return None
+        return body if isinstance(body, dict) else None
+
+    def _ordering_key(
+        self, event_type: Optional[str], body: Optional[Dict[str, Any]]
+    ) -> Optional[str]:
+        field_name = self.ordering_keys.get(event_type) if event_type else None
+        if not field_name or body is None:
+            return None
+        value = body.get(field_name)
+        return f"{event_type}:{value}" if value is not None else None
+
+    def _acquire_key(self, key: str) -> asyncio.Lock:
+        entry = self._key_locks.setdefault(key, [asyncio.Lock(), 0])
+        entry[1] += 1
+        return entry[0]
+
+    def _release_key(self, key: str) -> None:
+        entry = self._key_locks.get(key)
+        if entry is None:
+            return
+        entry[1] -= 1
+        if entry[1] <= 0:
+            del self._key_locks[key]
+
+    async def _handle(
+        self, message: Dict[str, Any], body: Optional[Dict[str, Any]]
+    ) -> bool:
+        """
+        Route a parsed message to its handler.
+
+        Returns:
+            True if the message should be deleted from the queue
+        """
+        message_id = message.get("MessageId")
+        if body is None:
+            return True
+
+        event_type = body.get("event_type")
+        if not event_type:
+            logger.warning(f"Message {message_id} missing event_type")
+            return True
+
+        handler = self._handlers.get(event_type)
+        if not handler:
+            logger.warning(f"No handler for event type: {event_type}")
+            return True
+
+        try:
+            logger.info(f"Processing event: {event_type} (message: {message_id})")
+            await handler(body)
+            self.stats.succeeded_total += 1
+            return True
+        except Exception as e:
+            self.stats.failed_total += 1
+            logger.error(f"Handler error for message {message_id}: {e}", exc_info=True)
+            # Don't delete - message will return to queue for retry
+            return False
+
+    async def _keep_visible(self, sqs, message: Dict[str, Any]) -> None:
+        """Extend the message's visibility every half timeout while it is handled."""
+        interval = self.visibility_timeout_seconds / 2
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await sqs.change_message_visibility(
+                    QueueUrl=self.queue_url,
+                    ReceiptHandle=message["ReceiptHandle"],
+                    VisibilityTimeout=max(int(self.visibility_timeout_seconds), 1),
+                )
+                self.stats.visibility_extensions_total += 1
+            except Exception as e:
+                logger.warning(
+                    f"Could not extend visibility for message {message.get('MessageId')}: {e}"
+                )
+
+    def _ack(self, message: Dict[str, Any]) -> None:
+        self._ack_buffer.append((message.get("MessageId"), message.get("ReceiptHandle")))
+        if len(self._ack_buffer) >= SQS_BATCH_LIMIT:
+            self._ack_ready.set()
+
+    async def _ack_loop(self, sqs) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(
+                    self._ack_ready.wait(), timeout=self.ack_flush_interval_seconds
+                )
+            except asyncio.TimeoutError:
+                pass
+            self._ack_ready.clear()
+            await self._flush_acks(sqs)
+
+    async def _flush_acks(self, sqs) -> None:
+        """
+        Delete buffered messages in DeleteMessageBatch calls of up to 10.
+
+        Args:
+            sqs: SQS client
+        """
+        while self._ack_buffer:
+            batch = self._ack_buffer[:SQS_BATCH_LIMIT]
+            del self._ack_buffer[:SQS_BATCH_LIMIT]
+            entries = [
+                {"Id": str(i), "ReceiptHandle": receipt_handle}
+                for i, (_, receipt_handle) in enumerate(batch)
+            ]
+            try:
+                response = await sqs.delete_message_batch(
+                    QueueUrl=self.queue_url, Entries=entries
+                )
+            except Exception as e:
+                self.stats.ack_errors_total += len(batch)
+                logger.error(f"Error deleting message batch: {e}")
+                continue
+
+            failed = response.get("Failed", [])
+            self.stats.acked_total += len(batch) - len(failed)
+            self.stats.ack_errors_total += len(failed)
+            for failure in failed:
+                message_id = batch[int(failure["Id"])][0]
+                logger.error(
+                    f"Error deleting message {message_id}: {failure.get('Message')}"
+                )
+
+    async def _drain(self) -> None:
+        """Wait for in-flight handlers, cancelling them after the shutdown timeout."""
+        if not self._tasks:
+            return
+        logger.info(f"Waiting for {len(self._tasks)} in-flight SQS messages...")
+        # Failed batches hand their messages to new tasks, so re-check the set
+        deadline = time.monotonic() + self.shutdown_timeout_seconds
+        pending: set = set()
+        while self._tasks:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                pending = set(self._tasks)
+                break
+            await asyncio.wait(set(self._tasks), timeout=remaining)
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+            logger.warning(f"Cancelled {len(pending)} SQS handlers still running at shutdown")
+
+    def metrics(self) -> Dict[str, Any]:
+        """Return consumer counters and average throughput."""
+        elapsed = time.monotonic() - self.stats.started_at
+        return {
+            "received_total": self.stats.received_total,
+            "succeeded_total": self.stats.succeeded_total,
+            "failed_total": self.stats.failed_total,
+            "acked_total": self.stats.acked_total,
+            "ack_errors_total": self.stats.ack_errors_total,
+            "visibility_extensions_total": self.stats.visibility_extensions_total,
+            "in_flight": self.stats.in_flight,
+            "peak_in_flight": self.stats.peak_in_flight,
+            "messages_per_second": round(
+                self.stats.succeeded_total / elapsed if elapsed > 0 else 0.0, 3
+            ),
+        }
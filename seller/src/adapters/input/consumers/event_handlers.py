@@ -1,10 +1,11 @@
 """Event handlers for SQS messages."""
 
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.adapters.input.consumers.recent_event_filter import RecentEventFilter
 from src.adapters.output.repositories.processed_event_repository import (
     ProcessedEventRepository,
 )
@@ -26,14 +27,21 @@ class EventHandlers:
     4. Handling errors gracefully
     """
 
-    def __init__(self, db_session_factory):
+    def __init__(
+        self,
+        db_session_factory,
+        recent_events: Optional[RecentEventFilter] = None,
+    ):
         """
         Initialize event handlers.
 
         Args:
             db_session_factory: Callable that returns AsyncSession
+            recent_events: Optional in-memory filter; events handled
+                recently are skipped without opening a DB session
         """
         self.db_session_factory = db_session_factory
+        self.recent_events = recent_events
 
     async def handle_order_created(self, event_data: Dict[str, Any]) -> None:
         """
@@ -58,6 +66,11 @@ class EventHandlers:
             f"seller_id={seller_id}"
         )
 
+        # Redelivered within seconds - skip without touching the database
+        if self.recent_events is not None and self.recent_events.seen(event_id):
+            logger.info(f"Event handled recently, skipping: event_id={event_id}")
+            return
+
         # Create new DB session for this event
         async with self.db_session_factory() as session:
             # Initialize repositories
@@ -71,6 +84,8 @@ class EventHandlers:
 
             try:
                 await use_case.execute(event_data)
+                if self.recent_events is not None:
+                    self.recent_events.add(event_id)
                 logger.info(
                     f"Successfully processed order_created event: "
                     f"event_id={event_id}, "
@@ -87,3 +102,39 @@ class EventHandlers:
                 )
                 # Re-raise to let consumer handle (message will return to queue)
                 raise
+
+    async def handle_order_created_batch(self, events: List[Dict[str, Any]]) -> None:
+        """
+        Handle all order_created events received in one poll.
+
+        Applies the batch in a single transaction with one aggregated
+        sales plan update.
+
+        Args:
+            events: Event payloads from SQS
+
+        Raises:
+            Exception: If processing fails (consumer retries one by one)
+        """
+        if self.recent_events is not None:
+            events = [
+                event for event in events
+                if not self.recent_events.seen(event.get("event_id"))
+            ]
+        if not events:
+            return
+
+        logger.info(f"Handling order_created batch: events={len(events)}")
+
+        async with self.db_session_factory() as session:
+            processed_event_repo = ProcessedEventRepository(session)
+            use_case = UpdateSalesPlanFromOrderUseCase(
+                db_session=session,
+                processed_event_repository=processed_event_repo,
+            )
+
+            await use_case.execute_batch(events)
+
+        if self.recent_events is not None:
+            for event in events:
+                self.recent_events.add(event.get("event_id"))
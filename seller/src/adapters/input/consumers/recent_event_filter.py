@@ -0,0 +1,74 @@
+"""In-memory filter for events handled in the last few minutes."""
+
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+
+class RecentEventFilter:
+    """
+    Bounded, time-limited set of recently handled event IDs.
+
+    SQS and SNS are at-least-once: the same event is often delivered again
+    within seconds. Checking this filter first lets those duplicates be
+    acknowledged without a database round trip. It is only an optimization;
+    the processed-events table remains the source of truth.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 10000,
+        ttl_seconds: float = 300.0,
+        clock: Optional[Callable[[], float]] = None,
+    ):
+        """
+        Initialize the filter.
+
+        Args:
+            max_size: Maximum number of event IDs kept (oldest are evicted)
+            ttl_seconds: How long an event ID is remembered
+            clock: Monotonic clock, injectable for tests
+        """
+        self._max_size = max_size
+        self._ttl = ttl_seconds
+        self._clock = clock or time.monotonic
+        self._entries: "OrderedDict[str, float]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def seen(self, event_id: Optional[str]) -> bool:
+        """
+        Check whether an event was handled recently.
+
+        Args:
+            event_id: Event identifier
+
+        Returns:
+            True if the event ID was added within the TTL
+        """
+        if not event_id:
+            return False
+
+        expires_at = self._entries.get(event_id)
+        if expires_at is None:
+            return False
+        if expires_at <= self._clock():
+            del self._entries[event_id]
+            return False
+        return True
+
+    def add(self, event_id: Optional[str]) -> None:
+        """
+        Remember an event as handled.
+
+        Args:
+            event_id: Event identifier
+        """
+        if not event_id:
+            return
+
+        self._entries[event_id] = self._clock() + self._ttl
+        self._entries.move_to_end(event_id)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
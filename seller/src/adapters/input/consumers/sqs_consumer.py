@@ -4,7 +4,7 @@ import asyncio
 import json
 import logging
 import os
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import aioboto3
 from botocore.exceptions import ClientError
@@ -20,6 +20,7 @@ class SQSConsumer:
     - Long polling for efficient message retrieval
     - Automatic message deletion after successful processing
     - Handler-based routing by event_type
+    - Optional batch handlers that receive all events of a type in a poll
     - Graceful shutdown support
     - LocalStack support for development
     """
@@ -48,6 +49,7 @@ class SQSConsumer:
         self.wait_time_seconds = wait_time_seconds
         self.endpoint_url = endpoint_url or os.getenv("AWS_SQS_ENDPOINT_URL")
         self._handlers: Dict[str, Callable] = {}
+        self._batch_handlers: Dict[str, Callable] = {}
         self._running = False
         self._session: Optional[aioboto3.Session] = None
 
@@ -62,6 +64,22 @@ class SQSConsumer:
         self._handlers[event_type] = handler
         logger.info(f"Registered handler for event type: {event_type}")
 
+    def register_batch_handler(self, event_type: str, handler: Callable) -> None:
+        """
+        Register a handler that receives every event of a type in one poll.
+
+        The handler gets the list of event payloads. If it fails, the
+        messages are retried one by one with the handler registered via
+        register_handler (if any), so one bad event does not hold back the
+        rest of the batch.
+
+        Args:
+            event_type: Event type string (e.g., "order_created")
+            handler: Async handler taking a list of event payloads
+        """
+        self._batch_handlers[event_type] = handler
+        logger.info(f"Registered batch handler for event type: {event_type}")
+
     async def start(self) -> None:
         """
         Start consuming messages from SQS.
@@ -134,7 +152,15 @@ class SQSConsumer:
             sqs: SQS client
             messages: List of SQS messages
         """
-        for message in messages:
+        single, batches = self._split_batches(messages)
+
+        for event_type, items in batches.items():
+            try:
+                await self._process_batch(sqs, event_type, items)
+            except Exception as e:
+                logger.error(f"Error processing {event_type} batch: {e}", exc_info=True)
+
+        for message in single:
             try:
                 await self._process_message(sqs, message)
             except Exception as e:
@@ -143,6 +169,72 @@ class SQSConsumer:
                     exc_info=True,
                 )
 
+    def _split_batches(
+        self, messages: list
+    ) -> Tuple[list, Dict[str, List[Tuple[Dict[str, Any], Dict[str, Any]]]]]:
+        """
+        Group messages whose event type has a batch handler.
+
+        Args:
+            messages: List of SQS messages
+
+        Returns:
+            Messages to process one by one, and (message, body) pairs
+            grouped by event type for the batch handlers
+        """
+        if not self._batch_handlers:
+            return messages, {}
+
+        single = []
+        batches: Dict[str, List[Tuple[Dict[str, Any], Dict[str, Any]]]] = {}
+        for message in messages:
+            try:
+                body = json.loads(message.get("Body", "{}"))
+            except json.JSONDecodeError:
+                single.append(message)
+                continue
+            event_type = body.get("event_type") if isinstance(body, dict) else None
+            if event_type in self._batch_handlers:
+                batches.setdefault(event_type, []).append((message, body))
+            else:
+                single.append(message)
+        return single, batches
+
+    async def _process_batch(
+        self,
+        sqs,
+        event_type: str,
+        items: List[Tuple[Dict[str, Any], Dict[str, Any]]],
+    ) -> None:
+        """
+        Handle all events of one type with its batch handler.
+
+        Falls back to handling the messages one by one if the batch fails.
+
+        Args:
+            sqs: SQS client
+            event_type: Event type of the batch
+            items: (message, body) pairs
+        """
+        handler = self._batch_handlers[event_type]
+        try:
+            logger.info(f"Processing batch of {len(items)} {event_type} events")
+            await handler([body for _, body in items])
+        except Exception as e:
+            logger.warning(
+                f"Batch handler failed for {len(items)} {event_type} events, "
+                f"retrying one by one: {e}"
+            )
+            if event_type not in self._handlers:
+                # Nothing to fall back to - leave them for redelivery
+                return
+            for message, _ in items:
+                await self._process_message(sqs, message)
+            return
+
+        for message, _ in items:
+            await self._delete_message(sqs, message.get("ReceiptHandle"))
+
     async def _process_message(self, sqs, message: Dict[str, Any]) -> None:
         """
         Process single message and route to handler.
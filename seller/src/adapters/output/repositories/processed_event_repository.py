@@ -1,9 +1,10 @@
 """Repository implementation for processed events."""
 
 import logging
-from typing import Optional
+from typing import List, Optional
 
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -52,6 +53,87 @@ class ProcessedEventRepository(ProcessedEventRepositoryPort):
             )
             raise
 
+    async def filter_unprocessed(self, event_ids: List[str]) -> List[str]:
+        """
+        Return the event IDs that have not been processed yet.
+
+        Args:
+            event_ids: Event identifiers to check in a single query
+
+        Returns:
+            Unprocessed event IDs, in the order given
+        """
+        if not event_ids:
+            return []
+
+        logger.debug(f"DB: Filtering processed events: count={len(event_ids)}")
+
+        try:
+            stmt = select(ORMProcessedEvent.event_id).where(
+                ORMProcessedEvent.event_id.in_(set(event_ids))
+            )
+            result = await self.session.execute(stmt)
+            processed = set(result.scalars().all())
+
+            return [event_id for event_id in event_ids if event_id not in processed]
+
+        except Exception as e:
+            logger.error(
+                f"DB: Error filtering processed events: count={len(event_ids)}, error={e}"
+            )
+            raise
+
+    async def mark_as_processed_if_new(
+        self, processed_events: List[DomainProcessedEvent]
+    ) -> List[str]:
+        """
+        Record events that have not been recorded yet, in one statement.
+
+        Uses INSERT ... ON CONFLICT (event_id) DO NOTHING RETURNING, so the
+        duplicate check and the insert are a single round trip. Does not
+        commit; the caller commits together with the guarded work.
+
+        Args:
+            processed_events: ProcessedEvent domain entities
+
+        Returns:
+            Event IDs that were newly recorded
+        """
+        if not processed_events:
+            return []
+
+        try:
+            stmt = (
+                insert(ORMProcessedEvent)
+                .values(
+                    [
+                        {
+                            "id": event.id,
+                            "event_id": event.event_id,
+                            "event_type": event.event_type,
+                            "microservice": event.microservice,
+                            "payload_snapshot": event.payload_snapshot,
+                            "processed_at": event.processed_at,
+                        }
+                        for event in processed_events
+                    ]
+                )
+                .on_conflict_do_nothing(index_elements=[ORMProcessedEvent.event_id])
+                .returning(ORMProcessedEvent.event_id)
+            )
+            result = await self.session.execute(stmt)
+            inserted = list(result.scalars().all())
+
+            logger.debug(
+                f"DB: Recorded processed events: "
+                f"new={len(inserted)}, duplicates={len(processed_events) - len(inserted)}"
+            )
+            return inserted
+
+        except Exception as e:
+            logger.error(f"DB: Error recording processed events: error={e}")
+            raise
+
     async def mark_as_processed(
         self, processed_event: DomainProcessedEvent
     ) -> DomainProcessedEvent:
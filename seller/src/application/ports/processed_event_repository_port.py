@@ -1,7 +1,7 @@
 """Port (interface) for processed event repository."""
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional
 
 from src.domain.entities.processed_event import ProcessedEvent
 
@@ -27,6 +27,38 @@ class ProcessedEventRepositoryPort(ABC):
         """
         pass
 
+    @abstractmethod
+    async def filter_unprocessed(self, event_ids: List[str]) -> List[str]:
+        """
+        Return the event IDs that have not been processed yet.
+
+        Args:
+            event_ids: Event identifiers to check in a single query
+
+        Returns:
+            Unprocessed event IDs, in the order given
+        """
+        pass
+
+    @abstractmethod
+    async def mark_as_processed_if_new(
+        self, processed_events: List[ProcessedEvent]
+    ) -> List[str]:
+        """
+        Record events that have not been recorded yet, in one statement.
+
+        Does not commit, so the caller can record the events in the same
+        transaction as the work they guard.
+
+        Args:
+            processed_events: ProcessedEvent domain entities
+
+        Returns:
+            Event IDs that were newly recorded; IDs missing from the result
+            were already processed
+        """
+        pass
+
     @abstractmethod
     async def mark_as_processed(self, processed_event: ProcessedEvent) -> ProcessedEvent:
         """
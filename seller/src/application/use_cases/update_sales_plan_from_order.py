@@ -5,10 +5,10 @@ import logging
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import select, update
+from sqlalchemy import column, select, update, values
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.ports.processed_event_repository_port import (
@@ -43,7 +43,8 @@ class UpdateSalesPlanFromOrderUseCase:
     - Updates sales plan accumulate by adding monto_total
     - Finds active sales plan for current quarter
     - Implements idempotency using processed_events table
-    - Skips if event already processed
+    - Skips if event already processed (checked and recorded in one
+      statement, committed with the sales plan update)
 
     Event Schema:
     {
@@ -91,11 +92,13 @@ class UpdateSalesPlanFromOrderUseCase:
             f"seller_id={event.seller_id}"
         )
 
-        # Check idempotency - skip if already processed
-        if await self.processed_event_repository.has_been_processed(event.event_id):
+        # Record the event first: a single INSERT ... ON CONFLICT DO NOTHING
+        # both checks and claims it, in the same transaction as the update
+        if not await self._mark_event_processed(event_data):
             logger.info(
                 f"Event already processed, skipping: event_id={event.event_id}"
             )
+            await self.db_session.rollback()
             return
 
         # Business rule: only process orders with seller_id
@@ -104,8 +107,8 @@ class UpdateSalesPlanFromOrderUseCase:
                 f"Order has no seller_id, skipping sales plan update: "
                 f"order_id={event.order_id}"
             )
-            # Mark as processed even though we skipped it
-            await self._mark_event_processed(event_data)
+            # Still committed as processed (for idempotency)
+            await self.db_session.commit()
             return
 
         # Get current quarter period (e.g., "Q4-2025")
@@ -119,8 +122,8 @@ class UpdateSalesPlanFromOrderUseCase:
             amount_to_add=event.monto_total,
         )
 
-        # Mark event as processed
-        await self._mark_event_processed(event_data)
+        # Commit the processed event and the update together
+        await self.db_session.commit()
 
         logger.info(
             f"Successfully updated sales plan for order: "
@@ -129,6 +132,65 @@ class UpdateSalesPlanFromOrderUseCase:
             f"amount={event.monto_total}"
         )
 
+    async def execute_batch(self, events_data: List[Dict[str, Any]]) -> None:
+        """
+        Apply a batch of order_created events in one transaction.
+
+        Amounts are summed per (seller_id, sales_period) and applied with a
+        single UPDATE ... FROM (VALUES ...), and every event ID is recorded
+        in the same transaction, so each event is counted exactly once and
+        each hot sales plan row is locked once per batch instead of once per
+        order.
+
+        Args:
+            events_data: Raw event payloads from SQS
+
+        Raises:
+            ValueError: If a seller in the batch has no sales plan for the
+                current quarter (nothing is applied; the events should be
+                retried individually)
+        """
+        events: Dict[str, OrderCreatedEvent] = {}
+        payloads: Dict[str, Dict[str, Any]] = {}
+        for event_data in events_data:
+            event = self._parse_event(event_data)
+            # Same event delivered twice in one batch
+            if event.event_id not in events:
+                events[event.event_id] = event
+                payloads[event.event_id] = event_data
+
+        processed_events = [
+            self._build_processed_event(payloads[event_id]) for event_id in events
+        ]
+        new_event_ids = set(
+            await self.processed_event_repository.mark_as_processed_if_new(
+                processed_events
+            )
+        )
+
+        current_period = self._get_current_quarter()
+        increments: Dict[Tuple[UUID, str], Decimal] = {}
+        for event_id in new_event_ids:
+            event = events[event_id]
+            if event.seller_id is None:
+                continue
+            key = (event.seller_id, current_period)
+            increments[key] = increments.get(key, Decimal("0")) + event.monto_total
+
+        if increments:
+            await self._apply_increments(increments)
+
+        # Commit processed events and the aggregated update together
+        await self.db_session.commit()
+
+        logger.info(
+            f"Processed order_created batch: "
+            f"events={len(events_data)}, "
+            f"new={len(new_event_ids)}, "
+            f"duplicates={len(events) - len(new_event_ids)}, "
+            f"sales_plans_updated={len(increments)}"
+        )
+
     def _parse_event(self, event_data: Dict[str, Any]) -> OrderCreatedEvent:
         """
         Parse and validate event data.
@@ -170,7 +232,8 @@ class UpdateSalesPlanFromOrderUseCase:
         """
         Update sales plan accumulate for seller and period.
 
-        Uses direct SQL update for performance and atomicity.
+        Uses direct SQL update for performance and atomicity. Does not
+        commit; the caller commits together with the processed event.
 
         Args:
             seller_id: Seller UUID
@@ -198,7 +261,6 @@ class UpdateSalesPlanFromOrderUseCase:
         )
 
         result = await self.db_session.execute(stmt)
-        await self.db_session.commit()
 
         if result.rowcount == 0:
             error_msg = (
@@ -206,6 +268,8 @@ class UpdateSalesPlanFromOrderUseCase:
                 f"and period {sales_period}"
             )
             logger.error(error_msg)
+            # Release the processed-event claim so the event is retried
+            await self.db_session.rollback()
             raise ValueError(error_msg)
 
         logger.debug(
@@ -214,19 +278,92 @@ class UpdateSalesPlanFromOrderUseCase:
             f"period={sales_period}"
         )
 
-    async def _mark_event_processed(self, event_data: Dict[str, Any]) -> None:
+    async def _apply_increments(
+        self, increments: Dict[Tuple[UUID, str], Decimal]
+    ) -> None:
+        """
+        Add summed amounts to several sales plans in one statement.
+
+        Does not commit; the caller commits together with the processed
+        events.
+
+        Args:
+            increments: Amount to add per (seller_id, sales_period)
+
+        Raises:
+            ValueError: If any (seller_id, sales_period) has no sales plan
+        """
+        amounts = values(
+            column("seller_id", ORMSalesPlan.seller_id.type),
+            column("sales_period", ORMSalesPlan.sales_period.type),
+            column("amount", ORMSalesPlan.accumulate.type),
+            name="increments",
+        ).data(
+            [
+                (seller_id, sales_period, amount)
+                for (seller_id, sales_period), amount in increments.items()
+            ]
+        )
+        stmt = (
+            update(ORMSalesPlan)
+            .where(
+                ORMSalesPlan.seller_id == amounts.c.seller_id,
+                ORMSalesPlan.sales_period == amounts.c.sales_period,
+            )
+            .values(accumulate=ORMSalesPlan.accumulate + amounts.c.amount)
+            .returning(ORMSalesPlan.seller_id, ORMSalesPlan.sales_period)
+        )
+
+        result = await self.db_session.execute(stmt)
+
+        # Compare keys rather than rowcount: sales_plans has no unique
+        # (seller_id, sales_period), so duplicates could hide a missing plan
+        updated = {tuple(row) for row in result.all()}
+        missing = increments.keys() - updated
+        if missing:
+            error_msg = (
+                f"No sales plan found for {len(missing)} "
+                f"of {len(increments)} sellers in batch"
+            )
+            logger.error(error_msg)
+            await self.db_session.rollback()
+            raise ValueError(error_msg)
+
+        logger.debug(f"Sales plans updated in batch: count={len(increments)}")
+
+    async def _mark_event_processed(self, event_data: Dict[str, Any]) -> bool:
         """
         Mark event as processed for idempotency.
 
         Args:
             event_data: Raw event payload
+
+        Returns:
+            True if the event was newly recorded, False if it was a duplicate
         """
-        processed_event = ProcessedEvent.create_new(
+        processed_event = self._build_processed_event(event_data)
+
+        inserted = await self.processed_event_repository.mark_as_processed_if_new(
+            [processed_event]
+        )
+        if inserted:
+            logger.debug(f"Event marked as processed: event_id={event_data['event_id']}")
+        return bool(inserted)
+
+    @staticmethod
+    def _build_processed_event(event_data: Dict[str, Any]) -> ProcessedEvent:
+        """
+        Build the processed event record for a raw payload.
+
+        Args:
+            event_data: Raw event payload
+
+        Returns:
+            ProcessedEvent domain entity
+        """
+        return ProcessedEvent.create_new(
             event_id=event_data["event_id"],
             event_type=event_data["event_type"],
             microservice=event_data["microservice"],
             payload_snapshot=json.dumps(event_data, default=str),
         )
-
-        await self.processed_event_repository.mark_as_processed(processed_event)
-        logger.debug(f"Event marked as processed: event_id={event_data['event_id']}")
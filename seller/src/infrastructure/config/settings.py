@@ -1,3 +1,5 @@
+from typing import Dict
+
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -45,6 +47,39 @@ class Settings(BaseSettings):
         description="SQS queue URL for consuming order events (Seller-specific queue)"
     )
 
+    sqs_consumer_mode: str = Field(
+        default="concurrent",
+        description="SQS consumer mode: sequential | concurrent"
+    )
+    sqs_max_workers: int = Field(
+        default=10,
+        description="Maximum SQS messages handled at once in concurrent mode"
+    )
+    sqs_event_concurrency: Dict[str, int] = Field(
+        default={},
+        description="Per-event-type concurrency limits in concurrent mode"
+    )
+    sqs_ordering_keys: Dict[str, str] = Field(
+        default={"order_created": "seller_id"},
+        description="Event field whose value is handled one message at a time, in order"
+    )
+    sqs_visibility_timeout_seconds: int = Field(
+        default=30,
+        description="Visibility window kept alive while a handler runs"
+    )
+    sales_plan_batch_updates: bool = Field(
+        default=True,
+        description="Apply order_created events per received batch with one aggregated update"
+    )
+    recent_event_ids_size: int = Field(
+        default=10000,
+        description="Event IDs remembered in memory to skip quick redeliveries (0 disables)"
+    )
+    recent_event_ids_ttl_seconds: int = Field(
+        default=300,
+        description="How long a handled event ID is remembered in memory"
+    )
+
     aws_region: str = Field(
         default="us-east-1",
         description="AWS region for S3 and other AWS services"
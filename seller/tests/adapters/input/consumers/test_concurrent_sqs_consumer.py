@@ -0,0 +1,304 @@
+"""Unit tests for the concurrent SQS consumer mode."""
+
+import asyncio
+import json
+from typing import Any, Dict, List
+
+import pytest
+
+from src.adapters.input.consumers.concurrent_sqs_consumer import ConcurrentSQSConsumer
+
+
+class FakeSQS:
+    """In-memory stand-in for the aioboto3 SQS client."""
+
+    def __init__(self, bodies: List[Dict[str, Any]]):
+        self.queue = [
+            {
+                "MessageId": f"msg-{i}",
+                "ReceiptHandle": f"rh-{i}",
+                "Body": body if isinstance(body, str) else json.dumps(body),
+            }
+            for i, body in enumerate(bodies)
+        ]
+        self.receive_sizes: List[int] = []
+        self.deleted: List[str] = []
+        self.delete_calls = 0
+        self.visibility_changes: List[str] = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def receive_message(self, QueueUrl, MaxNumberOfMessages, WaitTimeSeconds, **kwargs):
+        self.receive_sizes.append(MaxNumberOfMessages)
+        batch = self.queue[:MaxNumberOfMessages]
+        del self.queue[:MaxNumberOfMessages]
+        if not batch:
+            await asyncio.sleep(0.01)
+        return {"Messages": batch}
+
+    async def delete_message_batch(self, QueueUrl, Entries):
+        self.delete_calls += 1
+        self.deleted.extend(entry["ReceiptHandle"] for entry in Entries)
+        return {"Successful": [{"Id": entry["Id"]} for entry in Entries]}
+
+    async def change_message_visibility(self, QueueUrl, ReceiptHandle, VisibilityTimeout):
+        self.visibility_changes.append(ReceiptHandle)
+
+
+class FakeSession:
+    def __init__(self, sqs: FakeSQS):
+        self.sqs = sqs
+
+    def client(self, service_name, **kwargs):
+        return self.sqs
+
+
+async def _consume(consumer: ConcurrentSQSConsumer, sqs: FakeSQS, expected: int) -> None:
+    """Run the consumer until ``expected`` messages were handled, then stop it."""
+    consumer._session = FakeSession(sqs)
+    consumer._running = True
+    task = asyncio.create_task(consumer._poll_messages())
+    for _ in range(500):
+        stats = consumer.stats
+        if stats.succeeded_total + stats.failed_total >= expected:
+            break
+        await asyncio.sleep(0.01)
+    consumer._running = False
+    await asyncio.wait_for(task, timeout=5)
+
+
+def _consumer(**kwargs) -> ConcurrentSQSConsumer:
+    kwargs.setdefault("ack_flush_interval_seconds", 0.01)
+    return ConcurrentSQSConsumer(queue_url="https://test", wait_time_seconds=0, **kwargs)
+
+
+class TestConcurrentSQSConsumer:
+    @pytest.mark.asyncio
+    async def test_handlers_run_concurrently(self):
+        running = 0
+        peak = 0
+
+        async def handler(event):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.05)
+            running -= 1
+
+        consumer = _consumer(max_workers=5)
+        consumer.register_handler("order_created", handler)
+        sqs = FakeSQS([{"event_type": "order_created", "order_id": i} for i in range(10)])
+
+        await _consume(consumer, sqs, expected=10)
+
+        assert peak == 5
+        assert consumer.stats.peak_in_flight == 5
+        assert max(sqs.receive_sizes) <= 5
+
+    @pytest.mark.asyncio
+    async def test_successes_acked_with_delete_message_batch(self):
+        consumer = _consumer(max_workers=20)
+        consumer.register_handler("order_created", lambda event: asyncio.sleep(0))
+        sqs = FakeSQS([{"event_type": "order_created"} for _ in range(25)])
+
+        await _consume(consumer, sqs, expected=25)
+
+        assert sorted(sqs.deleted) == sorted(f"rh-{i}" for i in range(25))
+        assert sqs.delete_calls <= 5
+        assert consumer.stats.acked_total == 25
+
+    @pytest.mark.asyncio
+    async def test_failed_handler_is_not_acked(self):
+        async def handler(event):
+            if event["n"] == 1:
+                raise RuntimeError("boom")
+
+        consumer = _consumer()
+        consumer.register_handler("order_created", handler)
+        sqs = FakeSQS([{"event_type": "order_created", "n": n} for n in range(3)])
+
+        await _consume(consumer, sqs, expected=3)
+
+        assert sorted(sqs.deleted) == ["rh-0", "rh-2"]
+        assert consumer.stats.failed_total == 1
+
+    @pytest.mark.asyncio
+    async def test_invalid_and_unhandled_messages_are_acked(self):
+        handled = []
+
+        async def handler(event):
+            handled.append(event)
+
+        consumer = _consumer()
+        consumer.register_handler("order_created", handler)
+        sqs = FakeSQS([
+            "not json",
+            {"no_event_type": True},
+            {"event_type": "unknown"},
+            {"event_type": "order_created"},
+        ])
+
+        await _consume(consumer, sqs, expected=1)
+        await asyncio.sleep(0)
+
+        assert len(handled) == 1
+        assert sorted(sqs.deleted) == ["rh-0", "rh-1", "rh-2", "rh-3"]
+
+    @pytest.mark.asyncio
+    async def test_same_ordering_key_is_serialized_in_arrival_order(self):
+        order: List[Any] = []
+        running_per_seller: Dict[str, int] = {}
+
+        async def handler(event):
+            seller = event["seller_id"]
+            running_per_seller[seller] = running_per_seller.get(seller, 0) + 1
+            assert running_per_seller[seller] == 1
+            await asyncio.sleep(0.01)
+            order.append((seller, event["n"]))
+            running_per_seller[seller] -= 1
+
+        consumer = _consumer(max_workers=10, ordering_keys={"order_created": "seller_id"})
+        consumer.register_handler("order_created", handler)
+        sqs = FakeSQS([
+            {"event_type": "order_created", "seller_id": seller, "n": n}
+            for n in range(4)
+            for seller in ("a", "b")
+        ])
+
+        await _consume(consumer, sqs, expected=8)
+
+        assert [n for seller, n in order if seller == "a"] == [0, 1, 2, 3]
+        assert [n for seller, n in order if seller == "b"] == [0, 1, 2, 3]
+        assert consumer._key_locks == {}
+
+    @pytest.mark.asyncio
+    async def test_per_event_type_limit(self):
+        running = {"cancelled": 0, "order": 0}
+        peak = {"cancelled": 0, "order": 0}
+
+        def make_handler(kind):
+            async def handler(event):
+                running[kind] += 1
+                peak[kind] = max(peak[kind], running[kind])
+                await asyncio.sleep(0.03)
+                running[kind] -= 1
+
+            return handler
+
+        consumer = _consumer(max_workers=10, event_concurrency={"order_cancelled": 1})
+        consumer.register_handler("order_cancelled", make_handler("cancelled"))
+        consumer.register_handler("order_created", make_handler("order"))
+        sqs = FakeSQS(
+            [{"event_type": "order_cancelled"}] * 3 + [{"event_type": "order_created"}] * 3
+        )
+
+        await _consume(consumer, sqs, expected=6)
+
+        assert peak["cancelled"] == 1
+        assert peak["order"] == 3
+
+    @pytest.mark.asyncio
+    async def test_long_handler_visibility_is_extended(self):
+        consumer = _consumer(visibility_timeout_seconds=0.04)
+        consumer.register_handler("order_created", lambda event: asyncio.sleep(0.1))
+        sqs = FakeSQS([{"event_type": "order_created"}])
+
+        await _consume(consumer, sqs, expected=1)
+
+        assert len(sqs.visibility_changes) >= 2
+        assert set(sqs.visibility_changes) == {"rh-0"}
+
+    @pytest.mark.asyncio
+    async def test_visibility_is_extended_while_waiting_on_ordering_key(self):
+        consumer = _consumer(
+            visibility_timeout_seconds=0.04, ordering_keys={"order_created": "seller_id"}
+        )
+        # The first message holds the seller's key; the second is quick once it runs
+        consumer.register_handler(
+            "order_created", lambda event: asyncio.sleep(0.1 if event["n"] == 0 else 0)
+        )
+        sqs = FakeSQS(
+            [{"event_type": "order_created", "seller_id": "s-1", "n": n} for n in range(2)]
+        )
+
+        await _consume(consumer, sqs, expected=2)
+
+        assert sqs.visibility_changes.count("rh-1") >= 2
+
+    @pytest.mark.asyncio
+    async def test_stop_waits_for_in_flight_handlers(self):
+        finished = []
+
+        async def handler(event):
+            await asyncio.sleep(0.05)
+            finished.append(event["n"])
+
+        consumer = _consumer(max_workers=3)
+        consumer.register_handler("order_created", handler)
+        sqs = FakeSQS([{"event_type": "order_created", "n": n} for n in range(3)])
+        consumer._session = FakeSession(sqs)
+        consumer._running = True
+
+        task = asyncio.create_task(consumer._poll_messages())
+        await asyncio.sleep(0.01)
+        consumer._running = False
+        await asyncio.wait_for(task, timeout=5)
+
+        assert sorted(finished) == [0, 1, 2]
+        assert len(sqs.deleted) == 3
+
+    @pytest.mark.asyncio
+    async def test_batch_handler_handles_received_batch(self):
+        batches = []
+
+        async def batch_handler(events):
+            batches.append([event["n"] for event in events])
+
+        consumer = _consumer(max_workers=10)
+        consumer.register_handler("order_created", lambda event: asyncio.sleep(0))
+        consumer.register_batch_handler("order_created", batch_handler)
+        sqs = FakeSQS([{"event_type": "order_created", "n": n} for n in range(5)])
+
+        await _consume(consumer, sqs, expected=5)
+
+        assert batches == [[0, 1, 2, 3, 4]]
+        assert sorted(sqs.deleted) == [f"rh-{n}" for n in range(5)]
+        assert consumer.stats.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_is_retried_per_message(self):
+        handled = []
+
+        async def handler(event):
+            if event["n"] == 1:
+                raise ValueError("No sales plan found")
+            handled.append(event["n"])
+
+        async def batch_handler(events):
+            raise ValueError("No sales plan found")
+
+        consumer = _consumer(max_workers=10)
+        consumer.register_handler("order_created", handler)
+        consumer.register_batch_handler("order_created", batch_handler)
+        sqs = FakeSQS([{"event_type": "order_created", "n": n} for n in range(3)])
+
+        await _consume(consumer, sqs, expected=3)
+
+        assert sorted(handled) == [0, 2]
+        assert sorted(sqs.deleted) == ["rh-0", "rh-2"]
+        assert consumer.stats.failed_total == 1
+        assert consumer.stats.in_flight == 0
+
+    def test_metrics(self):
+        consumer = _consumer()
+        consumer.stats.succeeded_total = 4
+
+        metrics = consumer.metrics()
+
+        assert metrics["succeeded_total"] == 4
+        assert metrics["in_flight"] == 0
+        assert metrics["messages_per_second"] >= 0
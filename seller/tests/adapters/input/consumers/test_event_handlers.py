@@ -9,6 +9,7 @@ from uuid import uuid4
 import pytest
 
 from src.adapters.input.consumers.event_handlers import EventHandlers
+from src.adapters.input.consumers.recent_event_filter import RecentEventFilter
 
 
 @pytest.fixture
@@ -270,6 +271,91 @@ class TestEventHandlersSessionManagement:
             mock_context_manager.__aexit__.assert_called_once()
 
 
+class TestRecentEventFilter:
+    """Tests for skipping recently handled events."""
+
+    @pytest.mark.asyncio
+    async def test_recent_duplicate_skips_db_session(
+        self, mock_db_session_factory, sample_order_created_event
+    ):
+        """Test that a redelivered event does not open a DB session."""
+        mock_factory, _ = mock_db_session_factory
+        handlers = EventHandlers(
+            db_session_factory=mock_factory, recent_events=RecentEventFilter()
+        )
+
+        with patch(
+            "src.adapters.input.consumers.event_handlers.UpdateSalesPlanFromOrderUseCase"
+        ) as mock_use_case_class:
+            mock_use_case_class.return_value = AsyncMock()
+
+            await handlers.handle_order_created(sample_order_created_event)
+            await handlers.handle_order_created(sample_order_created_event)
+
+        mock_factory.assert_called_once()
+        mock_use_case_class.return_value.execute.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_event_is_not_remembered(
+        self, mock_db_session_factory, sample_order_created_event
+    ):
+        """Test that a failed event is retried on redelivery."""
+        mock_factory, _ = mock_db_session_factory
+        recent_events = RecentEventFilter()
+        handlers = EventHandlers(db_session_factory=mock_factory, recent_events=recent_events)
+
+        with patch(
+            "src.adapters.input.consumers.event_handlers.UpdateSalesPlanFromOrderUseCase"
+        ) as mock_use_case_class:
+            mock_use_case = AsyncMock()
+            mock_use_case.execute.side_effect = ValueError("No sales plan found")
+            mock_use_case_class.return_value = mock_use_case
+
+            with pytest.raises(ValueError):
+                await handlers.handle_order_created(sample_order_created_event)
+
+        assert not recent_events.seen(sample_order_created_event["event_id"])
+
+
+class TestHandleOrderCreatedBatch:
+    """Tests for handle_order_created_batch method."""
+
+    @pytest.mark.asyncio
+    async def test_batch_runs_in_one_session(
+        self, mock_db_session_factory, sample_order_created_event
+    ):
+        """Test that a batch uses one session and one use case call."""
+        mock_factory, _ = mock_db_session_factory
+        handlers = EventHandlers(db_session_factory=mock_factory)
+        second = dict(sample_order_created_event, event_id="evt-order-456")
+
+        with patch(
+            "src.adapters.input.consumers.event_handlers.UpdateSalesPlanFromOrderUseCase"
+        ) as mock_use_case_class:
+            mock_use_case_class.return_value = AsyncMock()
+
+            await handlers.handle_order_created_batch([sample_order_created_event, second])
+
+        mock_factory.assert_called_once()
+        mock_use_case_class.return_value.execute_batch.assert_awaited_once_with(
+            [sample_order_created_event, second]
+        )
+
+    @pytest.mark.asyncio
+    async def test_batch_skips_recent_events(
+        self, mock_db_session_factory, sample_order_created_event
+    ):
+        """Test that recently handled events are dropped before the DB."""
+        mock_factory, _ = mock_db_session_factory
+        recent_events = RecentEventFilter()
+        recent_events.add(sample_order_created_event["event_id"])
+        handlers = EventHandlers(db_session_factory=mock_factory, recent_events=recent_events)
+
+        await handlers.handle_order_created_batch([sample_order_created_event])
+
+        mock_factory.assert_not_called()
+
+
 class TestMultipleEventTypes:
     """Tests for handling multiple event types (future extensibility)."""
 
@@ -0,0 +1,51 @@
+"""Unit tests for RecentEventFilter."""
+
+from src.adapters.input.consumers.recent_event_filter import RecentEventFilter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestRecentEventFilter:
+    """Tests for the in-memory recent event filter."""
+
+    def test_added_event_is_seen(self):
+        recent = RecentEventFilter()
+        recent.add("evt-1")
+
+        assert recent.seen("evt-1") is True
+        assert recent.seen("evt-2") is False
+
+    def test_event_expires_after_ttl(self):
+        clock = FakeClock()
+        recent = RecentEventFilter(ttl_seconds=10, clock=clock)
+        recent.add("evt-1")
+
+        clock.now = 9.9
+        assert recent.seen("evt-1") is True
+
+        clock.now = 10.0
+        assert recent.seen("evt-1") is False
+        assert len(recent) == 0
+
+    def test_oldest_event_is_evicted_when_full(self):
+        recent = RecentEventFilter(max_size=2)
+        recent.add("evt-1")
+        recent.add("evt-2")
+        recent.add("evt-3")
+
+        assert recent.seen("evt-1") is False
+        assert recent.seen("evt-2") is True
+        assert recent.seen("evt-3") is True
+
+    def test_missing_event_id_is_ignored(self):
+        recent = RecentEventFilter()
+        recent.add(None)
+
+        assert recent.seen(None) is False
+        assert len(recent) == 0
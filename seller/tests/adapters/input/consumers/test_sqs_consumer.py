@@ -413,6 +413,73 @@ class TestProcessMessages:
             assert "Error processing message msg-1" in caplog.text
 
 
+class TestBatchHandlers:
+    """Tests for batch handler routing."""
+
+    @staticmethod
+    def _message(n, event_type="order_created"):
+        return {
+            "MessageId": f"msg-{n}",
+            "ReceiptHandle": f"rh-{n}",
+            "Body": json.dumps({"event_type": event_type, "event_id": f"evt-{n}"}),
+        }
+
+    @pytest.mark.asyncio
+    async def test_batch_handler_receives_all_events_of_type(self, sqs_consumer):
+        """Test that events with a batch handler are handled in one call."""
+        batch_handler = AsyncMock()
+        single_handler = AsyncMock()
+        other_handler = AsyncMock()
+        sqs_consumer.register_handler("order_created", single_handler)
+        sqs_consumer.register_batch_handler("order_created", batch_handler)
+        sqs_consumer.register_handler("order_cancelled", other_handler)
+        mock_sqs = AsyncMock()
+
+        await sqs_consumer._process_messages(mock_sqs, [
+            self._message(1),
+            self._message(2, "order_cancelled"),
+            self._message(3),
+        ])
+
+        batch_handler.assert_awaited_once()
+        assert [e["event_id"] for e in batch_handler.call_args[0][0]] == ["evt-1", "evt-3"]
+        single_handler.assert_not_called()
+        other_handler.assert_awaited_once()
+        assert mock_sqs.delete_message.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_falls_back_to_single_handler(self, sqs_consumer):
+        """Test that a failed batch is retried one message at a time."""
+        async def single_handler(event):
+            if event["event_id"] == "evt-2":
+                raise ValueError("No sales plan found")
+
+        sqs_consumer.register_handler("order_created", single_handler)
+        sqs_consumer.register_batch_handler(
+            "order_created", AsyncMock(side_effect=ValueError("No sales plan found"))
+        )
+        mock_sqs = AsyncMock()
+
+        await sqs_consumer._process_messages(
+            mock_sqs, [self._message(1), self._message(2), self._message(3)]
+        )
+
+        deleted = [c.kwargs["ReceiptHandle"] for c in mock_sqs.delete_message.call_args_list]
+        assert deleted == ["rh-1", "rh-3"]
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_without_single_handler_is_not_deleted(self, sqs_consumer):
+        """Test that events are left for redelivery when there is no fallback."""
+        sqs_consumer.register_batch_handler(
+            "order_created", AsyncMock(side_effect=RuntimeError("db down"))
+        )
+        mock_sqs = AsyncMock()
+
+        await sqs_consumer._process_messages(mock_sqs, [self._message(1)])
+
+        mock_sqs.delete_message.assert_not_called()
+
+
 class TestProcessMessage:
     """Tests for individual message processing."""
 
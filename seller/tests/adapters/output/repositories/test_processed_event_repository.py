@@ -181,6 +181,81 @@ class TestMarkAsProcessed:
         assert result.processed_at == sample_processed_event.processed_at
 
 
+class TestFilterUnprocessed:
+    """Tests for filter_unprocessed() method."""
+
+    @pytest.mark.asyncio
+    async def test_returns_only_unprocessed_ids_in_order(
+        self, processed_event_repository, sample_processed_event
+    ):
+        """Test that already processed IDs are dropped and order is kept."""
+        await processed_event_repository.mark_as_processed(sample_processed_event)
+
+        result = await processed_event_repository.filter_unprocessed(
+            ["evt-new-2", sample_processed_event.event_id, "evt-new-1"]
+        )
+
+        assert result == ["evt-new-2", "evt-new-1"]
+
+    @pytest.mark.asyncio
+    async def test_empty_input_returns_empty_list(self, processed_event_repository):
+        """Test that an empty list does not hit the database."""
+        assert await processed_event_repository.filter_unprocessed([]) == []
+
+
+class TestMarkAsProcessedIfNew:
+    """Tests for mark_as_processed_if_new() method."""
+
+    @pytest.mark.asyncio
+    async def test_returns_newly_recorded_ids(
+        self, processed_event_repository, sample_processed_event, db_session
+    ):
+        """Test that new events are inserted and their IDs returned."""
+        other = ProcessedEvent.create_new(
+            event_id="evt-456-def",
+            event_type="order_created",
+            microservice="order",
+            payload_snapshot="{}",
+        )
+
+        inserted = await processed_event_repository.mark_as_processed_if_new(
+            [sample_processed_event, other]
+        )
+        await db_session.commit()
+
+        assert sorted(inserted) == ["evt-123-abc", "evt-456-def"]
+        assert await processed_event_repository.has_been_processed("evt-456-def")
+
+    @pytest.mark.asyncio
+    async def test_skips_duplicates_without_error(
+        self, processed_event_repository, sample_processed_event, db_session
+    ):
+        """Test that an already recorded event is skipped, not raised."""
+        await processed_event_repository.mark_as_processed(sample_processed_event)
+        duplicate = ProcessedEvent.create_new(
+            event_id=sample_processed_event.event_id,
+            event_type="order_created",
+            microservice="order",
+            payload_snapshot="{}",
+        )
+
+        inserted = await processed_event_repository.mark_as_processed_if_new([duplicate])
+
+        assert inserted == []
+
+    @pytest.mark.asyncio
+    async def test_does_not_commit(
+        self, processed_event_repository, sample_processed_event, db_session
+    ):
+        """Test that the insert is rolled back with the caller's transaction."""
+        await processed_event_repository.mark_as_processed_if_new([sample_processed_event])
+        await db_session.rollback()
+
+        assert not await processed_event_repository.has_been_processed(
+            sample_processed_event.event_id
+        )
+
+
 class TestGetByEventId:
     """Tests for get_by_event_id() method."""
 
@@ -21,8 +21,9 @@ from src.infrastructure.database.models import SalesPlan as ORMSalesPlan
 def mock_processed_event_repository():
     """Create mock ProcessedEventRepository."""
     mock = AsyncMock()
-    mock.has_been_processed = AsyncMock(return_value=False)
-    mock.mark_as_processed = AsyncMock()
+    mock.mark_as_processed_if_new = AsyncMock(
+        side_effect=lambda events: [event.event_id for event in events]
+    )
     return mock
 
 
@@ -317,12 +318,13 @@ class TestMarkEventProcessed:
             processed_event_repository=mock_processed_event_repository,
         )
 
-        await use_case._mark_event_processed(sample_order_created_event)
+        inserted = await use_case._mark_event_processed(sample_order_created_event)
 
         # Verify repository was called
-        mock_processed_event_repository.mark_as_processed.assert_called_once()
+        assert inserted is True
+        mock_processed_event_repository.mark_as_processed_if_new.assert_called_once()
 
-        call_args = mock_processed_event_repository.mark_as_processed.call_args[0][0]
+        call_args = mock_processed_event_repository.mark_as_processed_if_new.call_args[0][0][0]
         assert call_args.event_id == sample_order_created_event["event_id"]
         assert call_args.event_type == sample_order_created_event["event_type"]
 
@@ -338,7 +340,7 @@ class TestMarkEventProcessed:
 
         await use_case._mark_event_processed(sample_order_created_event)
 
-        call_args = mock_processed_event_repository.mark_as_processed.call_args[0][0]
+        call_args = mock_processed_event_repository.mark_as_processed_if_new.call_args[0][0][0]
         payload = json.loads(call_args.payload_snapshot)
 
         assert payload["event_id"] == sample_order_created_event["event_id"]
@@ -375,10 +377,13 @@ class TestExecuteOrderCreatedEvent:
 
     @pytest.mark.asyncio
     async def test_execute_skips_when_event_already_processed(
-        self, db_session, mock_processed_event_repository, sample_order_created_event
+        self, db_session, mock_processed_event_repository, sample_seller_with_sales_plan, sample_order_created_event
     ):
         """Test that duplicate events are skipped (idempotency)."""
-        mock_processed_event_repository.has_been_processed.return_value = True
+        seller_id, period = sample_seller_with_sales_plan
+        sample_order_created_event["seller_id"] = str(seller_id)
+        mock_processed_event_repository.mark_as_processed_if_new.side_effect = None
+        mock_processed_event_repository.mark_as_processed_if_new.return_value = []
 
         use_case = UpdateSalesPlanFromOrderUseCase(
             db_session=db_session,
@@ -387,8 +392,13 @@ class TestExecuteOrderCreatedEvent:
 
         await use_case.execute(sample_order_created_event)
 
-        # Mark_as_processed should NOT be called
-        mock_processed_event_repository.mark_as_processed.assert_not_called()
+        # Sales plan should NOT be updated
+        stmt = select(ORMSalesPlan).where(
+            ORMSalesPlan.seller_id == seller_id,
+            ORMSalesPlan.sales_period == period,
+        )
+        result = await db_session.execute(stmt)
+        assert result.scalars().first().accumulate == Decimal("0.00")
 
     @pytest.mark.asyncio
     async def test_execute_skips_when_seller_id_null(
@@ -405,7 +415,7 @@ class TestExecuteOrderCreatedEvent:
         await use_case.execute(sample_order_created_event)
 
         # Should still mark as processed (for idempotency)
-        mock_processed_event_repository.mark_as_processed.assert_called_once()
+        mock_processed_event_repository.mark_as_processed_if_new.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_execute_processes_multiple_orders_for_same_seller(
@@ -413,7 +423,6 @@ class TestExecuteOrderCreatedEvent:
     ):
         """Test accumulating multiple orders for same seller."""
         seller_id, period = sample_seller_with_sales_plan
-        mock_processed_event_repository.has_been_processed.return_value = False
 
         use_case = UpdateSalesPlanFromOrderUseCase(
             db_session=db_session,
@@ -462,7 +471,6 @@ class TestExecuteOrderCreatedEvent:
     ):
         """Test that Decimal precision is preserved."""
         seller_id, period = sample_seller_with_sales_plan
-        mock_processed_event_repository.has_been_processed.return_value = False
 
         use_case = UpdateSalesPlanFromOrderUseCase(
             db_session=db_session,
@@ -551,3 +559,205 @@ class TestQuarterCalculation:
         with patch("src.application.use_cases.update_sales_plan_from_order.datetime") as mock_datetime:
             mock_datetime.utcnow.return_value = datetime(2025, 12, 15)
             assert use_case._get_current_quarter() == "Q4-2025"
+
+
+class TestExecuteWithRepository:
+    """Tests for execute with the real processed event repository."""
+
+    @pytest.mark.asyncio
+    async def test_duplicate_event_is_applied_once(
+        self, db_session, sample_seller_with_sales_plan, sample_order_created_event
+    ):
+        """Test that a redelivered event does not add to the accumulate twice."""
+        from src.adapters.output.repositories.processed_event_repository import (
+            ProcessedEventRepository,
+        )
+
+        seller_id, period = sample_seller_with_sales_plan
+        sample_order_created_event["seller_id"] = str(seller_id)
+        use_case = UpdateSalesPlanFromOrderUseCase(
+            db_session=db_session,
+            processed_event_repository=ProcessedEventRepository(db_session),
+        )
+
+        await use_case.execute(sample_order_created_event)
+        await use_case.execute(sample_order_created_event)
+
+        stmt = select(ORMSalesPlan).where(
+            ORMSalesPlan.seller_id == seller_id,
+            ORMSalesPlan.sales_period == period,
+        )
+        result = await db_session.execute(stmt)
+        plan = result.scalars().first()
+
+        assert plan.accumulate == Decimal(str(sample_order_created_event["monto_total"]))
+
+    @pytest.mark.asyncio
+    async def test_missing_sales_plan_releases_event(
+        self, db_session, sample_order_created_event
+    ):
+        """Test that a failed update does not leave the event marked as processed."""
+        from src.adapters.output.repositories.processed_event_repository import (
+            ProcessedEventRepository,
+        )
+
+        repository = ProcessedEventRepository(db_session)
+        use_case = UpdateSalesPlanFromOrderUseCase(
+            db_session=db_session,
+            processed_event_repository=repository,
+        )
+
+        with pytest.raises(ValueError, match="No sales plan found"):
+            await use_case.execute(sample_order_created_event)
+
+        assert await repository.has_been_processed(
+            sample_order_created_event["event_id"]
+        ) is False
+
+
+def _batch_event(event_id, seller_id, amount):
+    return {
+        "event_id": event_id,
+        "event_type": "order_created",
+        "microservice": "order",
+        "timestamp": "2025-11-09T12:00:00Z",
+        "order_id": str(uuid4()),
+        "customer_id": str(uuid4()),
+        "seller_id": str(seller_id) if seller_id else None,
+        "monto_total": amount,
+    }
+
+
+class TestExecuteBatch:
+    """Tests for execute_batch (aggregated updates)."""
+
+    @pytest.fixture
+    def mock_session(self):
+        session = AsyncMock()
+        session.execute = AsyncMock(return_value=MagicMock(rowcount=2))
+        return session
+
+    @pytest.mark.asyncio
+    async def test_amounts_are_summed_per_seller_and_period(
+        self, mock_session, mock_processed_event_repository
+    ):
+        """Test that events are grouped into one increment per seller."""
+        seller_a, seller_b = uuid4(), uuid4()
+        use_case = UpdateSalesPlanFromOrderUseCase(
+            db_session=mock_session,
+            processed_event_repository=mock_processed_event_repository,
+        )
+        use_case._get_current_quarter = MagicMock(return_value="Q4-2025")
+        use_case._apply_increments = AsyncMock()
+
+        await use_case.execute_batch([
+            _batch_event("evt-1", seller_a, 100.00),
+            _batch_event("evt-2", seller_a, 50.25),
+            _batch_event("evt-3", seller_b, 10.00),
+            _batch_event("evt-4", None, 999.00),
+        ])
+
+        use_case._apply_increments.assert_awaited_once_with({
+            (seller_a, "Q4-2025"): Decimal("150.25"),
+            (seller_b, "Q4-2025"): Decimal("10.0"),
+        })
+        recorded = mock_processed_event_repository.mark_as_processed_if_new.call_args[0][0]
+        assert [event.event_id for event in recorded] == ["evt-1", "evt-2", "evt-3", "evt-4"]
+        mock_session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_duplicates_are_not_counted(
+        self, mock_session, mock_processed_event_repository
+    ):
+        """Test that already processed and repeated events add nothing."""
+        seller_id = uuid4()
+        mock_processed_event_repository.mark_as_processed_if_new.side_effect = None
+        mock_processed_event_repository.mark_as_processed_if_new.return_value = ["evt-2"]
+        use_case = UpdateSalesPlanFromOrderUseCase(
+            db_session=mock_session,
+            processed_event_repository=mock_processed_event_repository,
+        )
+        use_case._get_current_quarter = MagicMock(return_value="Q4-2025")
+        use_case._apply_increments = AsyncMock()
+
+        await use_case.execute_batch([
+            _batch_event("evt-1", seller_id, 100.00),
+            _batch_event("evt-2", seller_id, 20.00),
+            _batch_event("evt-2", seller_id, 20.00),
+        ])
+
+        use_case._apply_increments.assert_awaited_once_with(
+            {(seller_id, "Q4-2025"): Decimal("20.0")}
+        )
+        recorded = mock_processed_event_repository.mark_as_processed_if_new.call_args[0][0]
+        assert len(recorded) == 2
+
+    @pytest.mark.asyncio
+    async def test_all_duplicates_skip_update(
+        self, mock_session, mock_processed_event_repository
+    ):
+        """Test that a batch of duplicates issues no update."""
+        mock_processed_event_repository.mark_as_processed_if_new.side_effect = None
+        mock_processed_event_repository.mark_as_processed_if_new.return_value = []
+        use_case = UpdateSalesPlanFromOrderUseCase(
+            db_session=mock_session,
+            processed_event_repository=mock_processed_event_repository,
+        )
+
+        await use_case.execute_batch([_batch_event("evt-1", uuid4(), 10.00)])
+
+        mock_session.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_apply_increments_uses_single_update_from_values(
+        self, mock_session, mock_processed_event_repository
+    ):
+        """Test that all increments go out in one UPDATE ... FROM (VALUES ...)."""
+        from sqlalchemy.dialects.postgresql import asyncpg
+
+        increments = {
+            (uuid4(), "Q4-2025"): Decimal("10"),
+            (uuid4(), "Q4-2025"): Decimal("20"),
+        }
+        mock_session.execute.return_value.all.return_value = list(increments)
+        use_case = UpdateSalesPlanFromOrderUseCase(
+            db_session=mock_session,
+            processed_event_repository=mock_processed_event_repository,
+        )
+
+        await use_case._apply_increments(increments)
+
+        mock_session.execute.assert_awaited_once()
+        statement = mock_session.execute.call_args[0][0]
+        sql = str(statement.compile(dialect=asyncpg.dialect()))
+        assert sql.startswith("UPDATE sales_plans SET accumulate=")
+        assert "FROM (VALUES" in sql
+        assert "sales_plans.seller_id = increments.seller_id" in sql
+        assert sql.endswith("RETURNING sales_plans.seller_id, sales_plans.sales_period")
+
+    @pytest.mark.asyncio
+    async def test_missing_sales_plan_rolls_back_batch(
+        self, mock_session, mock_processed_event_repository
+    ):
+        """Test that a missing plan rolls back the processed events too."""
+        seller_a, seller_b = uuid4(), uuid4()
+        # Two plans for seller_a match as many rows as there are increments
+        mock_session.execute.return_value = MagicMock(rowcount=2)
+        mock_session.execute.return_value.all.return_value = [
+            (seller_a, "Q4-2025"),
+            (seller_a, "Q4-2025"),
+        ]
+        use_case = UpdateSalesPlanFromOrderUseCase(
+            db_session=mock_session,
+            processed_event_repository=mock_processed_event_repository,
+        )
+        use_case._get_current_quarter = MagicMock(return_value="Q4-2025")
+
+        with pytest.raises(ValueError, match="No sales plan found for 1 of 2"):
+            await use_case.execute_batch([
+                _batch_event("evt-1", seller_a, 10.00),
+                _batch_event("evt-2", seller_b, 20.00),
+            ])
+
+        mock_session.rollback.assert_awaited_once()
+        mock_session.commit.assert_not_called()